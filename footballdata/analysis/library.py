@@ -1,11 +1,19 @@
 ﻿# Helper functions for creating specific data frames
 # that will be used in plots
 
+from pathlib import Path
+from typing import TYPE_CHECKING
+
 import pandas as pd
 
 from footballdata.library import get_season_years, year_at_season_start_list
 
+if TYPE_CHECKING:
+    from footballdata.storage import StorageBackend
+
 frames_dir = "../frames/{}/{}/{}/{}"
+# The frames the notebooks of this directory read
+frames_root = Path("../frames")
 
 
 def season_df_pairs(year_range: str, df_name: str) -> dict:
@@ -16,19 +24,7 @@ def season_df_pairs(year_range: str, df_name: str) -> dict:
         :tier: The level of the league
         :year_range: The first year of the first season the last year of the last season
                         splitted by a "_"
-        :df_name: Name of the table in the DB select one of those:
-                "standings_table",
-                "home_away",
-                "standard_data",
-                "gk_overall",
-                "gk_advanced",
-                "shooting",
-                "passing",
-                "pass_types",
-                "gca",
-                "defensive_actions",
-                "possession",
-                "other"
+        :df_name: Name of the table in the DB, one of footballdata.library.TABLES
 
         Returns a dict: dict {"year_0-year_1": "df_name.xlsx", "year_1-year_2": "df_name.xlsx"}
     """
@@ -42,18 +38,31 @@ def season_df_pairs(year_range: str, df_name: str) -> dict:
 
 
 def n_season_standings(
-    country: str, tier: int, year_range: str, save_df: bool = False
+    country: str,
+    tier: int,
+    year_range: str,
+    save_df: bool = False,
+    backend: "StorageBackend" = None,
+    columns: list = None,
+    filters: list = None,
 ) -> dict:
-    """Returns a dictionary with the each season's standings table."""
+    """Returns a dictionary with the each season's standings table.
 
-    seasons = season_df_pairs(year_range=year_range, df_name="standings_table")
-    dfs = {}
+    With a backend (e.g. ParquetBackend("../frames")) only the requested
+    columns and the rows that match the filters, e.g. [("Rk", "<=", 5)],
+    are loaded. Without one they're read from the .xlsx files of frames_root.
+    """
+    if backend is None:
+        from footballdata.storage import ExcelBackend
 
-    # TODO: if file is not found create it !
-    for season, file_name in seasons.items():
-        full_path = frames_dir.format(country, tier, season, file_name)
-        dfs[season] = pd.read_excel(full_path)
-        dfs[season].drop(columns="Unnamed: 0", inplace=True)
+        backend = ExcelBackend(frames_root)
+
+    dfs = {}
+    for year in year_at_season_start_list(year_range=year_range):
+        season = get_season_years(year)
+        dfs[season] = backend.read(
+            country, tier, season, "standings_table", columns, filters
+        )
         dfs[season]["Season"] = season
 
     return dfs
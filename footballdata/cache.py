@@ -0,0 +1,239 @@
+# On disk cache of the fetched HTML pages
+import gzip
+import hashlib
+import logging
+import os
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+CACHE_DIR = Path(os.environ.get("FOOTBALLDATA_CACHE_DIR", "./.html_cache"))
+MAX_CACHE_BYTES = 2 * 1024**3
+# Pages of a season that is still being played
+CURRENT_SEASON_TTL = 60 * 60
+# Month by which every european season has finished
+SEASON_END_MONTH = 7
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    url TEXT PRIMARY KEY,
+    digest TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    etag TEXT,
+    last_modified TEXT,
+    fetched_at REAL NOT NULL,
+    expires_at REAL,
+    last_access REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS entries_last_access ON entries(last_access);
+CREATE INDEX IF NOT EXISTS entries_digest ON entries(digest);
+"""
+
+
+@dataclass
+class CacheEntry:
+    url: str
+    digest: str
+    size: int
+    etag: str
+    last_modified: str
+    fetched_at: float
+    expires_at: float
+
+    @property
+    def fresh(self) -> bool:
+        return self.expires_at is None or self.expires_at > time.time()
+
+    def revalidation_headers(self) -> dict:
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+def season_ttl(year: int, now: datetime = None) -> float:
+    """Seconds a page of the season starting at year stays fresh.
+
+    Closed seasons don't change anymore so they never expire (None).
+    """
+    now = now or datetime.now()
+    if now >= datetime(int(year) + 1, SEASON_END_MONTH, 1):
+        return None
+    return CURRENT_SEASON_TTL
+
+
+class HTMLCache:
+    """Content addressed cache of pages.
+
+    The bodies are stored gzipped under {root}/objects/ named by their sha256,
+    so identical pages are stored once, and an SQLite index maps each url to
+    its body, validators (ETag, Last-Modified) and expiry. When the bodies
+    take more than max_bytes the least recently used urls are evicted.
+    """
+
+    def __init__(self, root: Path = CACHE_DIR, max_bytes: int = MAX_CACHE_BYTES):
+        self.root = Path(root)
+        self.max_bytes = max_bytes
+        self._connection = None
+        self._lock = threading.RLock()
+
+    @property
+    def connection(self) -> sqlite3.Connection:
+        if self._connection is None:
+            with self._lock:
+                if self._connection is None:
+                    os.makedirs(self.root / "objects", exist_ok=True)
+                    connection = sqlite3.connect(
+                        self.root / "index.sqlite", check_same_thread=False
+                    )
+                    connection.executescript(SCHEMA)
+                    self._connection = connection
+        return self._connection
+
+    def _object_path(self, digest: str) -> Path:
+        return self.root / "objects" / digest[:2] / f"{digest}.html.gz"
+
+    def lookup(self, url: str) -> CacheEntry:
+        """The url's entry, stale or not, None if the url isn't cached."""
+        with self._lock:
+            row = self.connection.execute(
+                "SELECT url, digest, size, etag, last_modified, fetched_at, expires_at "
+                "FROM entries WHERE url = ?",
+                (url,),
+            ).fetchone()
+        if row is None:
+            return None
+        entry = CacheEntry(*row)
+        if not self._object_path(entry.digest).exists():
+            self.delete(url)
+            return None
+        return entry
+
+    def read(self, entry: CacheEntry) -> str:
+        with self._lock:
+            with self.connection:
+                self.connection.execute(
+                    "UPDATE entries SET last_access = ? WHERE url = ?",
+                    (time.time(), entry.url),
+                )
+        with gzip.open(self._object_path(entry.digest), "rt", encoding="utf-8") as f:
+            return f.read()
+
+    def store(
+        self,
+        url: str,
+        text: str,
+        etag: str = None,
+        last_modified: str = None,
+        ttl: float = None,
+    ) -> CacheEntry:
+        """Cache the body of url, ttl in seconds or None to never expire."""
+        body = text.encode("utf-8")
+        digest = hashlib.sha256(body).hexdigest()
+        path = self._object_path(digest)
+        if not path.exists():
+            os.makedirs(path.parent, exist_ok=True)
+            tmp_path = path.with_suffix(f".{threading.get_ident()}.tmp")
+            with gzip.open(tmp_path, "wb") as f:
+                f.write(body)
+            os.replace(tmp_path, path)
+        now = time.time()
+        entry = CacheEntry(
+            url=url,
+            digest=digest,
+            size=path.stat().st_size,
+            etag=etag,
+            last_modified=last_modified,
+            fetched_at=now,
+            expires_at=None if ttl is None else now + ttl,
+        )
+        with self._lock:
+            previous = self.connection.execute(
+                "SELECT digest FROM entries WHERE url = ?", (url,)
+            ).fetchone()
+            with self.connection:
+                self.connection.execute(
+                    "INSERT OR REPLACE INTO entries VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                    (
+                        entry.url,
+                        entry.digest,
+                        entry.size,
+                        entry.etag,
+                        entry.last_modified,
+                        entry.fetched_at,
+                        entry.expires_at,
+                        now,
+                    ),
+                )
+            if previous is not None and previous[0] != digest:
+                self._remove_object_if_unused(previous[0])
+            self.evict(keep=url)
+
+        return entry
+
+    def refresh(self, url: str, ttl: float = None) -> None:
+        """The server answered 304, the cached body is fresh again."""
+        now = time.time()
+        with self._lock:
+            with self.connection:
+                self.connection.execute(
+                    "UPDATE entries SET fetched_at = ?, expires_at = ? WHERE url = ?",
+                    (now, None if ttl is None else now + ttl, url),
+                )
+
+    def delete(self, url: str) -> None:
+        with self._lock:
+            row = self.connection.execute(
+                "SELECT digest FROM entries WHERE url = ?", (url,)
+            ).fetchone()
+            with self.connection:
+                self.connection.execute("DELETE FROM entries WHERE url = ?", (url,))
+            if row is not None:
+                self._remove_object_if_unused(row[0])
+
+    def total_bytes(self) -> int:
+        with self._lock:
+            return self.connection.execute(
+                "SELECT COALESCE(SUM(size), 0) FROM "
+                "(SELECT DISTINCT digest, size FROM entries)"
+            ).fetchone()[0]
+
+    def evict(self, keep: str = None) -> None:
+        """Drop the least recently used urls until the cache fits in max_bytes."""
+        with self._lock:
+            total = self.total_bytes()
+            if total <= self.max_bytes:
+                return
+            urls = self.connection.execute(
+                "SELECT url FROM entries ORDER BY last_access"
+            ).fetchall()
+            for (url,) in urls:
+                if total <= self.max_bytes:
+                    break
+                if url == keep:
+                    continue
+                logger.debug("Evicting %s from the HTML cache", url)
+                self.delete(url)
+                total = self.total_bytes()
+
+    def _remove_object_if_unused(self, digest: str) -> None:
+        used = self.connection.execute(
+            "SELECT 1 FROM entries WHERE digest = ?", (digest,)
+        ).fetchone()
+        if used is None:
+            self._object_path(digest).unlink(missing_ok=True)
+
+    def close(self) -> None:
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
+
+
+html_cache = HTMLCache()
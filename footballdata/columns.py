@@ -0,0 +1,145 @@
+# Flat canonical column keys of the season tables and a view grouping them back
+#   ("Advanced_Passing", "KP_Opp") -> "advanced_passing.kp_opp"
+#   in the passing table -> "passing.advanced_passing.kp_opp"
+import re
+
+import pandas as pd
+
+KEY_SEP = "."
+# Characters of the stat names spelled out in the keys, in this order
+KEY_WORDS = [
+    ("+/-", "_plus_minus_"),
+    ("%", "_pct_"),
+    ("+", "_plus_"),
+    ("-", "_minus_"),
+    ("/", "_per_"),
+    ("#", "_num_"),
+]
+NOT_KEY_CHARS = re.compile(r"[^0-9a-z]+")
+METADATA_COLUMNS = ["table", "group", "stat"]
+
+
+def _slug(name) -> str:
+    """Cmp% -> cmp_pct, #OPA/90 -> num_opa_per_90"""
+    name = str(name)
+    for chars, word in KEY_WORDS:
+        name = name.replace(chars, word)
+    return NOT_KEY_CHARS.sub("_", name.lower()).strip("_")
+
+
+def split_column(col) -> tuple:
+    """(group, stat) of a column, group is None for single level columns.
+
+    Empty levels, like the ones reset_index adds to two level headers, are
+    ignored.
+    """
+    if isinstance(col, tuple):
+        names = [name for name in col if name != ""]
+        if len(names) > 1:
+            return names[0], names[-1]
+        col = names[0]
+    return None, col
+
+
+def column_key(col) -> str:
+    """The flat key of a column within its table."""
+    group, stat = split_column(col)
+    if group is None:
+        return _slug(stat)
+    return f"{_slug(group)}{KEY_SEP}{_slug(stat)}"
+
+
+def canonical_key(table: str, col) -> str:
+    """The key of a column among every table's, "passing.advanced_passing.kp_opp"."""
+    return f"{table}{KEY_SEP}{column_key(col)}"
+
+
+def column_metadata(columns, table: str = None, keys: list = None) -> pd.DataFrame:
+    """The metadata table of columns, their table, group and stat by key.
+
+    :keys: The columns' keys, column_key of each by default
+    """
+    columns = list(columns)
+    keys = [column_key(col) for col in columns] if keys is None else list(keys)
+    metadata = pd.DataFrame(
+        [(table, *split_column(col)) for col in columns],
+        index=pd.Index(keys, name="key"),
+        columns=METADATA_COLUMNS,
+    )
+    duplicated = metadata.index[metadata.index.duplicated()]
+    if len(duplicated):
+        raise ValueError(f"Columns sharing the keys {list(duplicated)}")
+
+    return metadata
+
+
+class TableView:
+    """A table with flat keys as columns and the metadata to group them.
+
+    view["advanced_passing.kp_opp"] is a plain column, view.group(
+    "Advanced_Passing") the columns of a group and view.to_frame() the table
+    with its two level header back.
+    """
+
+    def __init__(self, df: pd.DataFrame, metadata: pd.DataFrame):
+        self.df = df
+        self.metadata = metadata
+
+    @classmethod
+    def from_frame(cls, df: pd.DataFrame, table: str = None) -> "TableView":
+        """The view of a table with two level, or plain, columns."""
+        metadata = column_metadata(df.columns, table)
+        return cls(df.set_axis(metadata.index, axis=1, copy=False), metadata)
+
+    @property
+    def columns(self) -> list:
+        return list(self.df.columns)
+
+    @property
+    def groups(self) -> list:
+        """The groups, in the order of their first column."""
+        return list(self.metadata["group"].dropna().unique())
+
+    def key(self, col) -> str:
+        """The key of a column of the original table, e.g. ("Total", "Cmp")."""
+        key = column_key(col)
+        if key not in self.metadata.index:
+            raise KeyError(f"No {col} column")
+        return key
+
+    def keys(self, group: str) -> list:
+        """The keys of a group's columns."""
+        keys = self.metadata.index[self.metadata["group"] == group]
+        if not len(keys):
+            raise KeyError(f"No {group} group")
+        return list(keys)
+
+    def group(self, group: str) -> pd.DataFrame:
+        """The columns of a group, with their keys."""
+        return self.df[self.keys(group)]
+
+    def to_frame(self) -> pd.DataFrame:
+        """The table with its original columns, two level when it had groups."""
+        metadata = self.metadata.loc[self.df.columns]
+        if metadata["group"].isna().all():
+            columns = pd.Index(metadata["stat"].tolist())
+        else:
+            # Columns without a group are (stat, ""), as reset_index has them
+            ungrouped = metadata["group"].isna()
+            columns = pd.MultiIndex.from_arrays(
+                [
+                    metadata["group"].fillna(metadata["stat"]).tolist(),
+                    metadata["stat"].mask(ungrouped, "").tolist(),
+                ]
+            )
+        return self.df.set_axis(columns, axis=1, copy=False)
+
+    def __getitem__(self, key):
+        return self.df[key]
+
+    def __len__(self) -> int:
+        return len(self.df)
+
+    def __repr__(self) -> str:
+        table = self.metadata["table"].iloc[0] if len(self.metadata) else None
+        return f"TableView({table}, {len(self.df)} rows, {len(self.columns)} columns)"
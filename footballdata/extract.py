@@ -0,0 +1,178 @@
+# Extraction of the fbref tables straight from the page's HTML
+import re
+from fnmatch import fnmatchcase
+from io import BytesIO
+
+import numpy as np
+import pandas as pd
+from lxml import etree
+
+INT_RE = re.compile(r"^[+-]?\d+$")
+FLOAT_RE = re.compile(r"^[+-]?(\d+\.?\d*|\.\d+)([eE][+-]?\d+)?$")
+# Rows of the body that aren't data e.g. the repeated headers of long tables
+SKIPPED_ROW_CLASSES = {"thead", "over_header", "spacer"}
+
+INT, FLOAT, TEXT = 0, 1, 2
+
+
+def _text(cell: etree._Element) -> str:
+    return " ".join("".join(cell.itertext()).split())
+
+
+def _classes(element: etree._Element) -> set:
+    return set((element.get("class") or "").split())
+
+
+def _header(table: etree._Element) -> list:
+    """Column names in the format pd.read_html gives them.
+
+    Two header rows give (group, stat) tuples, a blank group is named
+    "Unnamed: {position}_level_0".
+    """
+    rows = table.findall("thead/tr")
+    if not rows:
+        return []
+    levels = []
+    for row in rows:
+        names = []
+        for cell in row:
+            if cell.tag not in ("th", "td"):
+                continue
+            names.extend([_text(cell)] * int(cell.get("colspan") or 1))
+        levels.append(names)
+
+    if len(levels) == 1:
+        columns = []
+        seen = {}
+        for position, name in enumerate(levels[0]):
+            name = name or f"Unnamed: {position}"
+            if name in seen:
+                seen[name] += 1
+                name = f"{name}.{seen[name]}"
+            else:
+                seen[name] = 0
+            columns.append(name)
+        return columns
+
+    width = len(levels[-1])
+    return [
+        tuple(
+            (level[position] if position < len(level) else "")
+            or f"Unnamed: {position}_level_{depth}"
+            for depth, level in enumerate(levels)
+        )
+        for position in range(width)
+    ]
+
+
+def _column(values: list, kind: int) -> np.ndarray:
+    if kind == INT:
+        if all(values):
+            return np.array(
+                [int(value.replace(",", "")) for value in values], dtype=np.int64
+            )
+        kind = FLOAT
+    if kind == FLOAT:
+        return np.array(
+            [float(value.replace(",", "")) if value else np.nan for value in values],
+            dtype=np.float64,
+        )
+    return np.array([value if value else np.nan for value in values], dtype=object)
+
+
+def table_to_df(table: etree._Element) -> pd.DataFrame:
+    """Build a df from a <table>, deciding each column's dtype while reading it.
+
+    Thousands separators are dropped, columns of whole numbers become int64
+    (float64 when some are blank), other numeric columns float64 and the rest
+    object with NaN for the blanks, the same as pd.read_html.
+    """
+    columns = _header(table)
+    width = len(columns)
+    values = [[] for _ in range(width)]
+    kinds = [INT] * width
+
+    for row in table.findall("tbody/tr") or table.findall("tr"):
+        if _classes(row) & SKIPPED_ROW_CLASSES:
+            continue
+        cells = [cell for cell in row if cell.tag in ("th", "td")]
+        if not cells:
+            continue
+        for position in range(width):
+            text = _text(cells[position]) if position < len(cells) else ""
+            kind = kinds[position]
+            if text and kind != TEXT:
+                number = text.replace(",", "")
+                if kind == INT and INT_RE.match(number):
+                    pass
+                elif FLOAT_RE.match(number):
+                    kinds[position] = FLOAT
+                else:
+                    kinds[position] = TEXT
+            values[position].append(text)
+
+    df = pd.DataFrame(
+        {
+            position: _column(values[position], kinds[position])
+            for position in range(width)
+        }
+    )
+    if columns and isinstance(columns[0], tuple):
+        df.columns = pd.MultiIndex.from_tuples(columns)
+    else:
+        df.columns = pd.Index(columns)
+
+    return df
+
+
+def _match(table_id: str, patterns: dict) -> str:
+    """The name of the first pattern (fnmatch style) the table's id matches."""
+    if not table_id:
+        return None
+    for name, pattern in patterns.items():
+        if fnmatchcase(table_id, pattern):
+            return name
+    return None
+
+
+def extract_tables(html, table_ids: dict) -> dict[str, pd.DataFrame]:
+    """Read only the wanted tables of a page in a single streaming pass.
+
+    :html: The page as str or bytes
+    :table_ids: {name: id of the <table>}, ids can have wildcards e.g.
+        {"standings": "results*_overall"}
+    Tables fbref hides inside HTML comments are found as well.
+
+    Returns {name: df}, tables not found in the page are missing.
+    """
+    if isinstance(html, str):
+        html = html.encode("utf-8")
+    remaining = dict(table_ids)
+    tables = {}
+
+    events = etree.iterparse(
+        BytesIO(html), events=("end", "comment"), html=True, encoding="utf-8"
+    )
+    for event, element in events:
+        if not remaining:
+            break
+        if event == "comment":
+            text = element.text or ""
+            if "<table" in text:
+                fragment = etree.HTML(f"<div>{text}</div>")
+                for table in fragment.iter("table"):
+                    name = _match(table.get("id"), remaining)
+                    if name is not None:
+                        tables[name] = table_to_df(table)
+                        del remaining[name]
+            continue
+        if element.tag == "table":
+            name = _match(element.get("id"), remaining)
+            if name is not None:
+                tables[name] = table_to_df(element)
+                del remaining[name]
+            element.clear(keep_tail=True)
+        elif element.tag == "div":
+            element.clear(keep_tail=True)
+
+    return tables
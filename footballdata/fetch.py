@@ -0,0 +1,377 @@
+# Fetching pages from fbref
+import logging
+import random
+import sqlite3
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from email.utils import parsedate_to_datetime
+from pathlib import Path
+from urllib.parse import urlparse
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from footballdata.cache import HTMLCache
+
+try:  # urllib3 decodes brotli answers when one of them is installed
+    import brotli  # noqa: F401
+
+    BROTLI = True
+except ImportError:
+    try:
+        import brotlicffi  # noqa: F401
+
+        BROTLI = True
+    except ImportError:
+        BROTLI = False
+
+logger = logging.getLogger(__name__)
+
+# fbref allows ~20 requests per minute before answering with 429s
+MIN_REQUEST_INTERVAL = 3.0
+REQUESTS_PER_MINUTE = 20
+MAX_CONCURRENT_PER_HOST = 2
+DEFAULT_BACKOFF = 60.0
+# Backoff of the n-th retry of a failed request, BACKOFF_BASE * 2**n seconds
+# at most BACKOFF_CAP, half of it random
+BACKOFF_BASE = 2.0
+BACKOFF_CAP = 300.0
+MAX_RETRIES = 3
+TIMEOUT = 30
+# Connections kept alive per host, at least as many as the fetching threads
+POOL_SIZE = 10
+# Answers worth retrying, the others fail at once
+RETRY_STATUSES = {500, 502, 503, 504}
+FAILED_REQUESTS_DB = Path("./.failed_requests.sqlite")
+
+FAILED_SCHEMA = """
+CREATE TABLE IF NOT EXISTS failed (
+    url TEXT PRIMARY KEY,
+    attempts INTEGER NOT NULL DEFAULT 1,
+    error TEXT,
+    failed_at REAL NOT NULL
+);
+"""
+
+
+class HostRateLimiter:
+    """Spaces out the requests to each host and pauses a host after a 429.
+
+    Thread safe, so one limiter can be shared by all the fetching threads.
+    """
+
+    def __init__(
+        self,
+        min_interval: float = MIN_REQUEST_INTERVAL,
+        default_backoff: float = DEFAULT_BACKOFF,
+    ):
+        self.min_interval = min_interval
+        self.default_backoff = default_backoff
+        self._next_slot = {}
+        self._lock = threading.Lock()
+
+    def wait(self, url: str) -> None:
+        """Block until a request to the url's host is allowed."""
+        host = urlparse(url).netloc
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot.get(host, now))
+            self._next_slot[host] = slot + self.min_interval
+        delay = slot - now
+        if delay > 0:
+            time.sleep(delay)
+
+    def penalize(self, url: str, retry_after: float = None) -> float:
+        """Pause the url's host after a 429 and return the pause in seconds."""
+        host = urlparse(url).netloc
+        backoff = self.default_backoff if retry_after is None else retry_after
+        with self._lock:
+            self._next_slot[host] = max(
+                self._next_slot.get(host, 0), time.monotonic() + backoff
+            )
+        logger.warning("%s answered 429, pausing it for %.0f seconds", host, backoff)
+
+        return backoff
+
+
+class FailedRequests:
+    """The urls that failed, kept in an SQLite file so a later run retries them.
+
+    A url is removed once a request to it succeeds.
+    """
+
+    def __init__(self, path: Path = FAILED_REQUESTS_DB):
+        self.path = Path(path)
+        self._connection = None
+        self._lock = threading.RLock()
+
+    @property
+    def connection(self) -> sqlite3.Connection:
+        # Opened on first use, a run without failures leaves no file behind
+        if self._connection is None:
+            with self._lock:
+                if self._connection is None:
+                    connection = sqlite3.connect(self.path, check_same_thread=False)
+                    connection.executescript(FAILED_SCHEMA)
+                    self._connection = connection
+        return self._connection
+
+    def add(self, url: str, error: str = None) -> None:
+        with self._lock:
+            with self.connection:
+                self.connection.execute(
+                    "INSERT INTO failed (url, error, failed_at) VALUES (?, ?, ?) "
+                    "ON CONFLICT(url) DO UPDATE SET attempts = attempts + 1, "
+                    "error = excluded.error, failed_at = excluded.failed_at",
+                    (url, error, time.time()),
+                )
+
+    def remove(self, url: str) -> None:
+        if self._connection is None and not self.path.exists():
+            return
+        with self._lock:
+            with self.connection:
+                self.connection.execute("DELETE FROM failed WHERE url = ?", (url,))
+
+    def urls(self) -> list:
+        """The failed urls, the oldest failure first."""
+        if self._connection is None and not self.path.exists():
+            return []
+        with self._lock:
+            rows = self.connection.execute(
+                "SELECT url FROM failed ORDER BY failed_at"
+            ).fetchall()
+        return [row[0] for row in rows]
+
+    def __contains__(self, url: str) -> bool:
+        return url in self.urls()
+
+    def close(self) -> None:
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
+
+
+class RequestScheduler:
+    """Decides when every request is sent, shared by all the fetching threads.
+
+    - min_interval between two requests to a host and a pause after a 429,
+        by its HostRateLimiter
+    - at most max_per_host requests in flight per host
+    - at most requests_per_minute requests in a minute, to any host
+    - exponential backoff with jitter between the retries of a request
+    - failures, when given, records the urls that failed for a later run
+    """
+
+    def __init__(
+        self,
+        min_interval: float = MIN_REQUEST_INTERVAL,
+        default_backoff: float = DEFAULT_BACKOFF,
+        max_per_host: int = MAX_CONCURRENT_PER_HOST,
+        requests_per_minute: int = REQUESTS_PER_MINUTE,
+        backoff_base: float = BACKOFF_BASE,
+        backoff_cap: float = BACKOFF_CAP,
+        failures: FailedRequests = None,
+    ):
+        self.limiter = HostRateLimiter(min_interval, default_backoff)
+        self.max_per_host = max_per_host
+        self.requests_per_minute = requests_per_minute
+        self.backoff_base = backoff_base
+        self.backoff_cap = backoff_cap
+        self.failures = failures
+        self._in_flight = {}
+        self._sent = deque()
+        self._lock = threading.Lock()
+
+    def _host_slots(self, url: str) -> threading.BoundedSemaphore:
+        host = urlparse(url).netloc
+        with self._lock:
+            if host not in self._in_flight:
+                self._in_flight[host] = threading.BoundedSemaphore(self.max_per_host)
+            return self._in_flight[host]
+
+    def _wait_for_budget(self) -> None:
+        """Block until a request fits in the requests per minute."""
+        if self.requests_per_minute is None:
+            return
+        with self._lock:
+            now = time.monotonic()
+            while self._sent and self._sent[0] <= now - 60:
+                self._sent.popleft()
+            slot = now
+            if len(self._sent) >= self.requests_per_minute:
+                # When the request requests_per_minute back leaves the window
+                slot = max(now, self._sent[-self.requests_per_minute] + 60)
+            self._sent.append(slot)
+        if slot > now:
+            time.sleep(slot - now)
+
+    @contextmanager
+    def slot(self, url: str):
+        """Hold a request slot for the url, blocking until one is free."""
+        host_slots = self._host_slots(url)
+        with host_slots:
+            self._wait_for_budget()
+            self.limiter.wait(url)
+            yield
+
+    def backoff(self, attempt: int, base: float = None) -> float:
+        """Seconds to wait before the attempt-th retry, half of it random."""
+        base = self.backoff_base if base is None else base
+        delay = min(self.backoff_cap, base * 2**attempt)
+        return delay / 2 + random.uniform(0, delay / 2)
+
+    def penalize(self, url: str, retry_after: float = None, attempt: int = 0) -> float:
+        """Pause the url's host for retry_after seconds, when it's given, or a
+        backoff growing with the attempts. Returns the pause in seconds.
+        """
+        if retry_after is None:
+            retry_after = self.backoff(attempt, self.limiter.default_backoff)
+        return self.limiter.penalize(url, retry_after)
+
+    def succeeded(self, url: str) -> None:
+        if self.failures is not None:
+            self.failures.remove(url)
+
+    def failed(self, url: str, error: Exception) -> None:
+        logger.error("Giving up on %s: %s", url, error)
+        if self.failures is not None:
+            self.failures.add(url, str(error))
+
+    def failed_urls(self) -> list:
+        """The urls that failed in this or an earlier run."""
+        return [] if self.failures is None else self.failures.urls()
+
+
+request_scheduler = RequestScheduler(failures=FailedRequests())
+
+
+class TooManyRequests(requests.HTTPError):
+    """The host kept answering 429."""
+
+
+def accept_encoding() -> str:
+    return "gzip, deflate, br" if BROTLI else "gzip, deflate"
+
+
+def new_session(pool_size: int = POOL_SIZE) -> requests.Session:
+    """A session keeping up to pool_size connections alive per host.
+
+    Thread safe for GETs, one session is shared by all the fetching threads
+    so they reuse the connections and their TLS sessions. Compressed answers
+    are accepted, brotli when it's installed. Retries are get_html's job.
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    session.headers["Accept-Encoding"] = accept_encoding()
+
+    return session
+
+
+http_session = new_session()
+
+
+def parse_retry_after(value: str) -> float:
+    """Seconds from a Retry-After header, in seconds or an HTTP date.
+
+    None if it's missing or can't be read.
+    """
+    if value is None:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, retry_at.timestamp() - time.time())
+
+
+def get_html(
+    url: str,
+    scheduler: RequestScheduler = None,
+    max_retries: int = MAX_RETRIES,
+    cache: HTMLCache = None,
+    ttl: float = None,
+    session: requests.Session = None,
+) -> str:
+    """GET the url when the scheduler allows it, retrying what's worth retrying.
+
+    429s pause the host for the Retry-After seconds, connection errors and
+    5xx answers are retried after an exponential backoff. A url that still
+    fails is recorded by the scheduler and raises requests.HTTPError, or the
+    connection error.
+
+    With a cache a fresh cached page is returned without a request and a
+    stale one is revalidated with its ETag / Last-Modified. Fetched pages
+    are cached for ttl seconds, None to never expire.
+
+    Requests go through the session, http_session by default, reusing its
+    kept alive connections.
+    """
+    entry = None
+    headers = {}
+    if cache is not None:
+        entry = cache.lookup(url)
+        if entry is not None:
+            if entry.fresh:
+                return cache.read(entry)
+            headers = entry.revalidation_headers()
+
+    scheduler = scheduler or request_scheduler
+    session = session or http_session
+    error = None
+    # Seconds to wait before the next attempt, a paused host waits on its own
+    delay = 0
+    for attempt in range(max_retries + 1):
+        time.sleep(delay)
+        delay = scheduler.backoff(attempt)
+        with scheduler.slot(url):
+            try:
+                response = session.get(url, headers=headers, timeout=TIMEOUT)
+            except (requests.ConnectionError, requests.Timeout) as exc:
+                logger.warning("%s: %s, retrying", url, exc)
+                error = exc
+                continue
+        retry_after = parse_retry_after(response.headers.get("Retry-After"))
+        if response.status_code == 429:
+            scheduler.penalize(url, retry_after, attempt)
+            delay = 0
+            error = TooManyRequests(f"Too many requests for {url}, giving up.")
+            continue
+        if response.status_code in RETRY_STATUSES:
+            logger.warning("%s answered %s, retrying", url, response.status_code)
+            if retry_after is not None:
+                scheduler.penalize(url, retry_after)
+                delay = 0
+            error = requests.HTTPError(f"{url} answered {response.status_code}")
+            continue
+        if response.status_code == 304 and entry is not None:
+            cache.refresh(url, ttl=ttl)
+            scheduler.succeeded(url)
+            return cache.read(entry)
+        try:
+            response.raise_for_status()
+        except requests.HTTPError as exc:
+            scheduler.failed(url, exc)
+            raise
+
+        if cache is not None:
+            cache.store(
+                url,
+                response.text,
+                etag=response.headers.get("ETag"),
+                last_modified=response.headers.get("Last-Modified"),
+                ttl=ttl,
+            )
+        scheduler.succeeded(url)
+        return response.text
+
+    scheduler.failed(url, error)
+    raise error
@@ -0,0 +1,332 @@
+# Concurrent ingestion of many seasons
+import logging
+import multiprocessing
+import tempfile
+import time
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    wait,
+)
+from pathlib import Path
+from typing import NamedTuple
+
+from footballdata.fetch import RequestScheduler, request_scheduler
+from footballdata.leagues import league_registry
+from footballdata.library import (
+    frames_registry,
+    get_season_html,
+    get_season_years,
+    mark_fetched,
+    parse_season_to_ipc,
+    read_ipc_tables,
+    save_season_tables,
+    season_is_stored,
+    season_url,
+    source_changed,
+    year_at_season_start_list,
+)
+from footballdata.manifest import source_hash
+from footballdata.storage import StorageBackend
+
+logger = logging.getLogger(__name__)
+
+FETCH_WORKERS = 4
+# How the parse processes are started. Forking once the fetch threads run can
+# copy a lock one of them holds into the child, which then never gets it.
+PARSE_START_METHOD = (
+    "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+)
+# Seconds between two progress reports
+REPORT_INTERVAL = 30
+
+
+class Job(NamedTuple):
+    """A season of a league to ingest."""
+
+    country: str
+    tier: int
+    year: int  # first calendar year of the season
+
+    @property
+    def season(self) -> str:
+        return get_season_years(self.year)
+
+    @property
+    def url(self) -> str:
+        return season_url(self.country, self.tier, self.year)
+
+    def __str__(self) -> str:
+        return f"{self.country} {self.tier} {self.season}"
+
+
+class Progress:
+    """Counts the seasons ingested and reports the progress and throughput."""
+
+    def __init__(self, total: int, report_interval: float = REPORT_INTERVAL):
+        self.total = total
+        self.report_interval = report_interval
+        self.stored = 0
+        self.unchanged = 0
+        self.failed = 0
+        self.started = time.monotonic()
+        self._last_report = self.started
+
+    @property
+    def finished(self) -> int:
+        return self.stored + self.unchanged + self.failed
+
+    def elapsed(self) -> float:
+        return time.monotonic() - self.started
+
+    def throughput(self) -> float:
+        """Seasons finished per second."""
+        elapsed = self.elapsed()
+        return self.finished / elapsed if elapsed else 0.0
+
+    def update(self, status: str) -> None:
+        """A season finished, status is stored, unchanged or failed."""
+        setattr(self, status, getattr(self, status) + 1)
+        now = time.monotonic()
+        if self.finished == self.total or (
+            now - self._last_report >= self.report_interval
+        ):
+            self._last_report = now
+            logger.info("%s", self)
+
+    def __str__(self) -> str:
+        rate = self.throughput()
+        report = (
+            f"{self.finished}/{self.total} seasons ({self.stored} stored, "
+            f"{self.unchanged} unchanged, {self.failed} failed), "
+            f"{rate * 60:.1f} seasons/min"
+        )
+        if not rate:
+            return report
+        return f"{report}, {(self.total - self.finished) / rate:.0f}s left"
+
+
+def save_ipc_tables(
+    country: str,
+    tier: int,
+    season: str,
+    paths: dict,
+    backend: StorageBackend = None,
+    page_hash: str = None,
+) -> list:
+    """save_season_tables of the IPC files of parse_season_to_ipc, which are
+    removed once they're stored.
+    """
+    try:
+        return save_season_tables(
+            country, tier, season, read_ipc_tables(paths), backend, page_hash
+        )
+    finally:
+        for path in paths.values():
+            Path(path).unlink(missing_ok=True)
+
+
+def ingest_jobs(
+    jobs: list,
+    backend: StorageBackend = None,
+    fetch_workers: int = FETCH_WORKERS,
+    parse_workers: int = None,
+    scheduler: RequestScheduler = None,
+    tables: list = None,
+    progress: Progress = None,
+) -> list:
+    """Fetch, edit and store the seasons of each of the jobs.
+
+    The three stages overlap, a season is parsed as soon as its page arrives
+    and written as soon as it's parsed.
+    - fetch: a pool of fetch_workers threads, sending the requests when the
+        scheduler allows them
+    - parse: read_html and the edit_* functions in a pool of parse_workers
+        processes (defaults to the number of cpus). Idle processes take the
+        next parsed page off the pool's shared queue, so a slow season never
+        holds up the others. The tables come back as Arrow IPC files in a
+        temp directory, only their paths are pickled. The processes are
+        started by a forkserver, not forked from this process whose fetch
+        threads may hold locks (the session's, logging's) at the time.
+    - write: a single writer thread memory mapping the files, only the
+        tables that changed are stored
+    Seasons whose page hasn't changed since they were stored aren't parsed.
+    Only the tables given are built and stored, all of TABLES by default.
+
+    Returns the jobs that failed.
+    """
+    failed = []
+    page_hashes = {}
+    progress = progress or Progress(len(jobs))
+    with tempfile.TemporaryDirectory(prefix="footballdata-") as ipc_dir:
+        with ThreadPoolExecutor(fetch_workers) as fetch_pool, ProcessPoolExecutor(
+            parse_workers, mp_context=multiprocessing.get_context(PARSE_START_METHOD)
+        ) as parse_pool, ThreadPoolExecutor(1) as write_pool:
+            pending = {
+                fetch_pool.submit(
+                    get_season_html, job.country, job.tier, job.year, scheduler
+                ): ("fetch", job)
+                for job in jobs
+            }
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    stage, job = pending.pop(future)
+                    country, tier, season = job.country, job.tier, job.season
+                    try:
+                        result = future.result()
+                    except Exception as exc:  # pylint: disable=broad-except
+                        logger.error("%s of %s failed: %s", stage, job, exc)
+                        failed.append(job)
+                        progress.update("failed")
+                        continue
+
+                    if stage == "fetch":
+                        logger.info("Fetched %s", job)
+                        if not source_changed(
+                            country, tier, season, result, backend, tables
+                        ):
+                            logger.info("%s is unchanged", job)
+                            mark_fetched(country, tier, season, backend)
+                            progress.update("unchanged")
+                            continue
+                        page_hashes[job] = source_hash(result)
+                        next_future = parse_pool.submit(
+                            parse_season_to_ipc,
+                            result,
+                            Path(ipc_dir, f"{country}-{tier}-{season}"),
+                            tables,
+                            frames_registry(backend),
+                        )
+                        pending[next_future] = ("parse", job)
+                    elif stage == "parse":
+                        next_future = write_pool.submit(
+                            save_ipc_tables,
+                            country,
+                            tier,
+                            season,
+                            result,
+                            backend,
+                            page_hashes.pop(job),
+                        )
+                        pending[next_future] = ("write", job)
+                    else:
+                        logger.info("Stored %s", job)
+                        progress.update("stored")
+
+    return sorted(failed)
+
+
+def ingest_seasons(
+    country: str,
+    tier: int,
+    years: list,
+    backend: StorageBackend = None,
+    fetch_workers: int = FETCH_WORKERS,
+    parse_workers: int = None,
+    scheduler: RequestScheduler = None,
+    tables: list = None,
+) -> list:
+    """Fetch, edit and store the seasons of a league starting at each of the
+    years, see ingest_jobs.
+
+    Returns the years that failed.
+    """
+    failed = ingest_jobs(
+        [Job(country, tier, year) for year in years],
+        backend=backend,
+        fetch_workers=fetch_workers,
+        parse_workers=parse_workers,
+        scheduler=scheduler,
+        tables=tables,
+    )
+    return [job.year for job in failed]
+
+
+def league_pairs(leagues: list = None) -> list:
+    """(country, tier) of the leagues, countries or (country, tier) pairs.
+
+    Every league of settings.leagues by default, a country is all its tiers.
+    """
+    if leagues is None:
+        leagues = league_registry.countries()
+    pairs = []
+    for league in leagues:
+        if isinstance(league, str):
+            pairs.extend(
+                (country_league.country, country_league.tier)
+                for country_league in league_registry.country(league)
+            )
+        else:
+            league = league_registry.get(*league)
+            pairs.append((league.country, league.tier))
+    return pairs
+
+
+def season_jobs(
+    year_range: str,
+    leagues: list = None,
+    backend: StorageBackend = None,
+    tables: list = None,
+    failed_urls: list = (),
+) -> list:
+    """Every season of every league in the year range that isn't stored yet.
+
+    The seasons whose url is one of the failed_urls come first, then the
+    seasons of a year come together so the leagues are filled in together.
+    """
+    years = year_at_season_start_list(year_range)
+    jobs = [
+        Job(country, tier, year)
+        for year in years
+        for country, tier in league_pairs(leagues)
+        if not season_is_stored(country, tier, get_season_years(year), backend, tables)
+    ]
+    failed_urls = set(failed_urls)
+    return sorted(jobs, key=lambda job: job.url not in failed_urls)
+
+
+def ingest_all(
+    year_range: str,
+    leagues: list = None,
+    backend: StorageBackend = None,
+    fetch_workers: int = FETCH_WORKERS,
+    parse_workers: int = None,
+    tables: list = None,
+    scheduler: RequestScheduler = None,
+) -> list:
+    """Fetch and store every season of the leagues in the year range.
+
+    :year_range: The first year of the first season and the last year of
+        the last season, e.g. "2017-2023"
+    :leagues: Countries (all their tiers) or (country, tier) pairs, every
+        league of settings.leagues by default
+    :tables: The tables to build and store, all of TABLES by default
+
+    Seasons that are already stored are skipped, the rest are ingested by
+    ingest_jobs, all the fetching threads share the scheduler,
+    fetch.request_scheduler by default. The seasons whose page failed in an
+    earlier run go first.
+    The progress and the throughput are logged along the way.
+
+    Returns the jobs that failed.
+    """
+    scheduler = scheduler or request_scheduler
+    jobs = season_jobs(
+        year_range, leagues, backend, tables, failed_urls=scheduler.failed_urls()
+    )
+    logger.info("Ingesting %d seasons", len(jobs))
+    progress = Progress(len(jobs))
+    failed = ingest_jobs(
+        jobs,
+        backend=backend,
+        fetch_workers=fetch_workers,
+        parse_workers=parse_workers,
+        scheduler=scheduler,
+        tables=tables,
+        progress=progress,
+    )
+    logger.info("Done in %.0fs, %s", progress.elapsed(), progress)
+
+    return failed
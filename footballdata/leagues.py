@@ -0,0 +1,84 @@
+# The leagues of settings.leagues, indexed once for lookups by any key
+from typing import NamedTuple
+
+from footballdata.settings import leagues
+
+
+class League(NamedTuple):
+    country: str
+    tier: int
+    id: int  # fbref's id of the competition
+    name: str
+    abbrv: str
+    gender: str
+
+
+class LeagueRegistry:
+    """Every league, looked up by (country, tier), fbref id, name or abbreviation.
+
+    The indexes are built once, every lookup is a dict lookup.
+    """
+
+    def __init__(self, leagues_by_country: dict = leagues):
+        self._leagues = {
+            (country, tier): League(
+                country,
+                tier,
+                league["id"],
+                league["name"],
+                league.get("abbrv"),
+                league.get("gender"),
+            )
+            for country, tiers in leagues_by_country.items()
+            for tier, league in tiers.items()
+        }
+        self._by_id = {league.id: league for league in self._leagues.values()}
+        self._by_name = {
+            league.name.lower(): league for league in self._leagues.values()
+        }
+        self._by_abbrv = {
+            league.abbrv.lower(): league
+            for league in self._leagues.values()
+            if league.abbrv is not None
+        }
+        self._countries = {}
+        for league in self._leagues.values():
+            self._countries.setdefault(league.country, []).append(league)
+
+    def get(self, country: str, tier: int) -> League:
+        try:
+            return self._leagues[country, tier]
+        except KeyError as exc:
+            raise KeyError(f"No {country} tier {tier} in settings.leagues") from exc
+
+    def by_id(self, league_id: int) -> League:
+        return self._by_id[league_id]
+
+    def by_name(self, name: str) -> League:
+        """The league named name, or abbreviated name, in any case."""
+        key = name.lower()
+        if key in self._by_abbrv:
+            return self._by_abbrv[key]
+        return self._by_name[key]
+
+    def country(self, country: str) -> list[League]:
+        """The leagues of a country, by tier."""
+        try:
+            return self._countries[country]
+        except KeyError as exc:
+            raise KeyError(f"No leagues of {country} in settings.leagues") from exc
+
+    def countries(self) -> list:
+        return list(self._countries)
+
+    def __iter__(self):
+        return iter(self._leagues.values())
+
+    def __len__(self) -> int:
+        return len(self._leagues)
+
+    def __contains__(self, key: tuple) -> bool:
+        return key in self._leagues
+
+
+league_registry = LeagueRegistry()
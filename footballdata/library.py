@@ -1,13 +1,50 @@
 # Helper functions
 import logging
+import operator
 import os
-from datetime import datetime
+from collections.abc import Mapping
+from functools import lru_cache
 from pathlib import Path
+from typing import TYPE_CHECKING, Callable, NamedTuple
 
 import numpy as np
 import pandas as pd
 
-from footballdata.settings import LEAGUE_URL, leagues
+from footballdata.cache import HTMLCache, html_cache, season_ttl
+from footballdata.leagues import league_registry
+from footballdata.manifest import (
+    SeasonManifest,
+    load_manifest,
+    manifest_path,
+    now,
+    save_manifest,
+    source_hash,
+    table_checksum,
+)
+from footballdata.schema import SCHEMAS, TableSchema
+from footballdata.seasons import season, season_years
+from footballdata.settings import (
+    FRAMES_DIR,
+    LEAGUE_URL,
+    SEASON_TABLE_IDS,
+    SEASON_WORKBOOK,
+)
+from footballdata.teams import (
+    TEAM_ID,
+    TeamIndex,
+    TeamRegistry,
+    parse_squads,
+    registry_at,
+    team_ids,
+    team_registry,
+)
+
+# The storage backends (pyarrow, xlsxwriter), the HTTP stack (requests) and
+# lxml are imported by the functions using them, importing this module
+# doesn't load them
+if TYPE_CHECKING:
+    from footballdata.fetch import RequestScheduler
+    from footballdata.storage import StorageBackend
 
 # Create a logger object
 logger = logging.getLogger(__name__)
@@ -21,37 +58,130 @@ console_handler.setFormatter(console_formatter)
 logger.addHandler(console_handler)
 
 
+SQUAD_COLUMNS = [("Unnamed: 0_level_0", "Squad"), ("Unnamed: 1_level_0", "Squad")]
+# The first groups of the squad tables (Squad, # Pl, Age, Poss, 90s...)
+LEADING_UNNAMED_GROUPS = {
+    "Unnamed: 0_level_0",
+    "Unnamed: 1_level_0",
+    "Unnamed: 2_level_0",
+    "Unnamed: 3_level_0",
+}
+# Opposition stats keeping their name
+NOT_OPP_STATS = {"Squad", "# Pl"}
+# The venues of the home away table, in the order of its groups
+VENUES = ("Home", "Away")
+# The standard stats table keeps every group but these, Standard is made of
+# STANDARD_STATS
+DROPPED_STANDARD_GROUPS = ("Playing_Time",)
+STANDARD_STATS = ("# Pl", "Age", "Poss")
+
+
+class ColumnPlan(NamedTuple):
+    """How to turn the raw columns of a squad table into the cleaned ones."""
+
+    squad: int  # position of the squad column
+    keep: list  # positions of the columns kept, in their new order
+    columns: pd.MultiIndex  # the new names of the kept columns
+
+
+def _squad_position(columns: tuple) -> int:
+    for squad_col in SQUAD_COLUMNS:
+        if squad_col in columns:
+            return columns.index(squad_col)
+    raise KeyError("NO SQUAD INFO")
+
+
+@lru_cache(maxsize=None)
+def column_plan(columns: tuple, opp: bool = False) -> ColumnPlan:
+    """Computed once per header, tables with the same header share the plan.
+
+    - Opposition stats get the "_Opp" suffix, in any level of the header
+    - The leading Unnamed groups are removed
+    - The rest of the Unnamed groups are renamed to "Details"
+    - Spaces in the names become underscores
+    """
+    if opp:
+        suffixed = {
+            stat: f"{stat}_Opp" for _, stat in columns if stat not in NOT_OPP_STATS
+        }
+        columns = tuple(
+            tuple(suffixed.get(name, name) for name in col) for col in columns
+        )
+    squad = _squad_position(columns)
+
+    group_order = {}
+    for group, _ in columns:
+        group_order.setdefault(group, len(group_order))
+    keep = sorted(
+        (
+            position
+            for position, (group, _) in enumerate(columns)
+            if group not in LEADING_UNNAMED_GROUPS
+        ),
+        key=lambda position: (group_order[columns[position][0]], position),
+    )
+
+    details = {
+        columns[position][0]
+        for position in keep
+        if columns[position][0].startswith("Unnamed:")
+    }
+    with_spaces = {name for col in columns for name in col if " " in name}
+
+    def rename(name: str) -> str:
+        if name in details:
+            return "Details"
+        if name in with_spaces:
+            return name.replace(" ", "_")
+        return name
+
+    new_columns = pd.MultiIndex.from_tuples(
+        [tuple(rename(name) for name in columns[position]) for position in keep]
+    )
+
+    return ColumnPlan(squad=squad, keep=keep, columns=new_columns)
+
+
+@lru_cache(maxsize=None)
+def standard_plan(columns: tuple, opp: bool = False) -> ColumnPlan:
+    """column_plan of a standard stats table, keeping the STANDARD_STATS of
+    its leading groups as the Standard group and dropping the
+    DROPPED_STANDARD_GROUPS.
+    """
+    plan = column_plan(columns, opp)
+    standard = [
+        position
+        for position, (group, stat) in enumerate(columns)
+        if group in LEADING_UNNAMED_GROUPS
+        and stat in STANDARD_STATS
+        and not (opp and stat in NOT_OPP_STATS)
+    ]
+    kept = [
+        (position, col)
+        for position, col in zip(plan.keep, plan.columns)
+        if col[0] not in DROPPED_STANDARD_GROUPS
+    ]
+    names = [
+        ("Standard", f"{columns[position][1]}_Opp" if opp else columns[position][1])
+        for position in standard
+    ]
+    return ColumnPlan(
+        squad=plan.squad,
+        keep=standard + [position for position, _ in kept],
+        columns=pd.MultiIndex.from_tuples(names + [col for _, col in kept]),
+    )
+
+
 def get_squad_as_index(df: pd.DataFrame) -> pd.DataFrame:
-    try:
-        index = np.array(df["Unnamed: 0_level_0", "Squad"])
-    except KeyError:
-        try:
-            index = np.array(df["Unnamed: 1_level_0", "Squad"])
-        except KeyError as exc:
-            raise KeyError("NO SQUAD INFO") from exc
-    df.index = index
+    squad = _squad_position(tuple(df.columns))
+    df.index = df.iloc[:, squad].to_numpy()
 
     return df
 
 
 def get_season_years(year: int) -> str:
-    if not isinstance(year, int):
-        try:
-            year = int(year)
-        except TypeError as exc:
-            raise TypeError(
-                f"Year value should be an int, or str you entered {year} which is {type(year)}."
-            ) from exc
-    if len(str(year)) != 4:
-        raise KeyError("The value of year should be a 4 digit number")
-
-    current_year = datetime.now().year
-    first_data_year = 1888
-    if year < first_data_year or year > current_year:
-        raise KeyError(f"No football data for {year}")
-
-    n_year = year + 1
-    return f"{year}-{n_year}"
+    """The name of the season starting in year, 2010 -> "2010-2011"."""
+    return season(year).name
 
 
 def edit_regular_season_table(regular_season_table: pd.DataFrame) -> pd.DataFrame:
@@ -74,22 +204,25 @@ def edit_regular_season_table(regular_season_table: pd.DataFrame) -> pd.DataFram
         :Attendance: Average Home attendance
         :M_G_Indv: Most Goals Scored by one player.
     """
-    regular_season_table = regular_season_table.copy()
     # Top Team Scorer --> Most Goals (scored by a player)
-    regular_season_table["M_G_Indv"] = regular_season_table["Top Team Scorer"].apply(
+    most_goals = regular_season_table["Top Team Scorer"].apply(
         lambda val: val.split("-")[-1]
     )
 
     cols_to_drop = ["Top Team Scorer", "Goalkeeper", "Notes"]
-    regular_season_table.drop(cols_to_drop, axis=1, inplace=True)
+    # drop returns a new df, the parsed table is left as it is
+    regular_season_table = regular_season_table.drop(cols_to_drop, axis=1)
+    regular_season_table["M_G_Indv"] = most_goals
 
     return regular_season_table
 
 
-def edit_home_away_table(home_away_table: pd.DataFrame) -> dict:
+def edit_home_away_table(home_away_table: pd.DataFrame) -> pd.DataFrame:
     """
-    Home Away data are 4 different dfs with the same columns
-    - Home, Away, H-A, H/A -->
+    Home Away table in long form, a row per squad and venue
+        :Rk: Ranking
+        :Squad: Team's Name
+        :Venue: Home or Away
         :MP: Matched Played
         :W: Wins
         :D: Draws
@@ -102,89 +235,117 @@ def edit_home_away_table(home_away_table: pd.DataFrame) -> dict:
         :xG: Expected Goals
         :XGA: Expected Assists
         :XGD: Expected Goals Difference
+    The home, away, h-a and h_div_a tables are derived from it, see
+    DERIVED_TABLES.
     """
-    home_away_table = home_away_table.copy()
-    squads = home_away_table["Unnamed: 1_level_0", "Squad"]
+    columns = tuple(home_away_table.columns)
+    squads = home_away_table.iloc[:, _squad_position(columns)].to_numpy()
+    ranks = [position for position, (_, stat) in enumerate(columns) if stat == "Rk"]
+    if ranks:
+        ranks = home_away_table.iloc[:, ranks[0]].to_numpy()
+    else:
+        ranks = np.arange(1, len(squads) + 1)
+
+    home_away = pd.concat(
+        [home_away_table[venue] for venue in VENUES], ignore_index=True
+    )
+    home_away.insert(0, "Venue", np.repeat(VENUES, len(squads)))
+    home_away.insert(0, "Squad", np.tile(squads, len(VENUES)))
+    home_away.insert(0, "Rk", np.tile(ranks, len(VENUES)))
+
+    return home_away
+
+
+def venue_stats(home_away: pd.DataFrame, venue: str) -> pd.DataFrame:
+    """The stats of a venue of the home_away table, indexed by Rk and Squads."""
+    rows = home_away[home_away["Venue"] == venue]
     index = pd.MultiIndex.from_arrays(
-        [np.arange(1, 21), np.array(squads)], names=["Rk", "Squads"]
+        [rows["Rk"].to_numpy(), np.asarray(rows["Squad"], dtype=object)],
+        names=["Rk", "Squads"],
     )
 
-    home_stats = home_away_table["Home"]
-    home_stats.index = index
-    away_stats = home_away_table["Away"]
-    away_stats.index = index
-    h_a_diff_stats = home_stats - away_stats
-    h_a_diff_stats.index = index
-    h_a_prop_stats = home_stats / away_stats
-    h_a_prop_stats.index = index
-
-    home_away_stats = {
-        "home": home_stats,
-        "away": away_stats,
-        "h-a": h_a_diff_stats,
-        "h/a": h_a_prop_stats,
-    }
-    return home_away_stats
+    return rows.drop(columns=["Rk", "Squad", "Venue"]).set_axis(index, copy=False)
 
 
-def remove_unnamed_cols(df: pd.DataFrame) -> pd.DataFrame:  # TODO: rename the function
-    to_be_removed = [
-        "Unnamed: 0_level_0",
-        "Unnamed: 1_level_0",
-        "Unnamed: 2_level_0",
-        "Unnamed: 3_level_0",
-    ]
-    cols_to_rename = [col for col in df.columns.get_level_values(1) if " " in col]
-    cols_to_rename.extend([col for col in df.columns.get_level_values(0) if " " in col])
-    # Removing first Unnamed cols
-    cols = [
-        col
-        for col in df.columns.get_level_values(0).unique()
-        if col not in to_be_removed
-    ]
-    df = df[cols]
+def home_table(home_away: pd.DataFrame) -> pd.DataFrame:
+    return venue_stats(home_away, "Home")
+
+
+def away_table(home_away: pd.DataFrame) -> pd.DataFrame:
+    return venue_stats(home_away, "Away")
+
+
+def compare_venues(home_away: pd.DataFrame, compare: Callable) -> pd.DataFrame:
+    """compare(home stats, away stats), the squads' team_id kept as it is."""
+    home = home_table(home_away)
+    away = away_table(home_away)
+    if TEAM_ID not in home.columns:
+        return compare(home, away)
+    stats = compare(home.drop(columns=TEAM_ID), away.drop(columns=TEAM_ID))
+    stats.insert(0, TEAM_ID, home[TEAM_ID])
+
+    return stats
+
+
+def h_a_table(home_away: pd.DataFrame) -> pd.DataFrame:
+    """Home - Away stats"""
+    return compare_venues(home_away, operator.sub)
 
-    unnamed_to_rename = [
-        col
-        for col in df.columns.get_level_values(0).unique()
-        if col.startswith("Unnamed:")
-    ]
 
-    # Rename the columns
-    df = df.rename(columns={col: "Details" for col in unnamed_to_rename})
-    df = df.rename(columns={col: col.replace(" ", "_") for col in cols_to_rename})
+def h_div_a_table(home_away: pd.DataFrame) -> pd.DataFrame:
+    """Home / Away stats"""
+    return compare_venues(home_away, operator.truediv)
+
+
+# The seasons stored before home_away have a table per venue instead
+LEGACY_VENUE_TABLES = dict(zip(VENUES, ("home", "away")))
+
+
+def legacy_home_away(venue_tables: dict[str, pd.DataFrame]) -> pd.DataFrame:
+    """The home_away table in long form from the {venue: table} of
+    LEGACY_VENUE_TABLES, their Rk, Squads and stats columns.
+    """
+    home_away = []
+    for venue, df in venue_tables.items():
+        df = df.rename(columns={"Squads": "Squad"})
+        df.insert(df.columns.get_loc("Squad") + 1, "Venue", venue)
+        home_away.append(df)
+
+    return pd.concat(home_away, ignore_index=True)
+
+
+def remove_unnamed_cols(df: pd.DataFrame) -> pd.DataFrame:  # TODO: rename the function
+    plan = column_plan(tuple(df.columns))
+    df = df.iloc[:, plan.keep]
+    df.columns = plan.columns
 
     return df
 
 
-def clean_opp_df(df_opp: pd.DataFrame) -> pd.DataFrame:
+def clean_opp_df(df_opp: pd.DataFrame, plan: ColumnPlan = None) -> pd.DataFrame:
+    plan = plan or column_plan(tuple(df_opp.columns), opp=True)
     # Removing the "vs " from the Opposition squad col
-    df_opp["Unnamed: 0_level_0", "Squad"] = df_opp["Unnamed: 0_level_0", "Squad"].apply(
-        lambda x: x.strip("vs ")
-    )
-    # Changing the col names of the opp df to have the "_Opp" suffix
-    column_dict = {
-        col_name: f"{col_name}_Opp" for col_name in df_opp.columns.get_level_values(1)
-    }
-    del column_dict["Squad"]
-    del column_dict["# Pl"]
-    df_opp = df_opp.rename(columns=column_dict)
-
-    df_opp = get_squad_as_index(df_opp)
-    df_opp = remove_unnamed_cols(df_opp)
+    index = df_opp.iloc[:, plan.squad].str.removeprefix("vs ").to_numpy()
+    # One copy with the "_Opp" suffixed, cleaned columns
+    df_opp = df_opp.iloc[:, plan.keep]
+    df_opp.columns = plan.columns
+    df_opp.index = index
 
     return df_opp
 
 
-def clean_main_df(df: pd.DataFrame) -> pd.DataFrame:
-    df = get_squad_as_index(df)
-    df = remove_unnamed_cols(df)
+def clean_main_df(df: pd.DataFrame, plan: ColumnPlan = None) -> pd.DataFrame:
+    plan = plan or column_plan(tuple(df.columns))
+    index = df.iloc[:, plan.squad].to_numpy()
+    df = df.iloc[:, plan.keep]
+    df.columns = plan.columns
+    df.index = index
 
     return df
 
 
 def merge_dfs(df: pd.DataFrame, df_opp: pd.DataFrame) -> pd.DataFrame:
-    return clean_main_df(df.copy()).join(clean_opp_df(df_opp.copy()))
+    return clean_main_df(df).join(clean_opp_df(df_opp))
 
 
 def edit_squad_stats(
@@ -206,13 +367,13 @@ def edit_squad_stats(
 
 def edit_standard_stats_table(
     squad_std_stats: pd.DataFrame, squad_opp_std_stats: pd.DataFrame
-) -> dict:
+) -> pd.DataFrame:
     """Taking as an input the Team's and their opposition team's stats and create
-    5 tables.
+    one table with these groups of columns, and any other group of the page but
+    Playing_Time, standard_stats_groups splits it.
 
     - Standard
-        Df standard stats
-        :#Pl: Number of Players used in games
+        :# Pl: Number of Players used in games
         :Age: Age is weighted by minutes played
         :Age_Opp: Age of the opposition teams
         :Poss: Possession, calculated as the % of passes attempted
@@ -233,7 +394,7 @@ def edit_standard_stats_table(
         :PKatt: Penalty kicks attempted
         :CrdY: Yellow Cards
         :CrdR: Red Cards
-    - Per 90 Minutes'
+    - Per_90_Minutes
         :Gls_Opp: Goals allowed per 90'
         :Ast_Opp: Assists allowed per 90'
         :G+A_Opp: Goals and Assists allowed per 90'
@@ -264,43 +425,33 @@ def edit_standard_stats_table(
         :xAG: Expected Assists
         :npxG+xAG: Expected Non Penalty Goals and Expected Assists
     """
-    squad_std_stats = squad_std_stats.copy()
-    squad_opp_std_stats = squad_opp_std_stats.copy()
-    squad_seasonal_stats = {}
-    # Removing the "vs " from the Opposition squad col
-    squad_opp_std_stats["Unnamed: 0_level_0", "Squad"] = squad_opp_std_stats[
-        "Unnamed: 0_level_0", "Squad"
-    ].apply(lambda x: x.strip("vs "))
-    # Changing the col names of the opp df to have the "_Opp" suffix
-    column_dict = {
-        col_name: f"{col_name}_Opp"
-        for col_name in squad_opp_std_stats.columns.get_level_values(1)
-    }
-    del column_dict["Squad"]
-    del column_dict["# Pl"]
-    squad_opp_std_stats = squad_opp_std_stats.rename(columns=column_dict)
+    main = clean_main_df(squad_std_stats, standard_plan(tuple(squad_std_stats.columns)))
+    opp = clean_opp_df(
+        squad_opp_std_stats,
+        standard_plan(tuple(squad_opp_std_stats.columns), opp=True),
+    )
 
-    squad_opp_std_stats = get_squad_as_index(squad_opp_std_stats)
+    return main.join(opp)
 
-    index = np.array(squad_std_stats["Unnamed: 0_level_0", "Squad"])
-    unnamed_cols = [
-        col
-        for col in squad_std_stats.columns.get_level_values(0).unique()
-        if col.startswith("Unnamed:")
-    ]
-    squad_opp_std_stats.index = index
-    squad_std_stats.index = index
 
-    df_std = squad_std_stats[unnamed_cols].droplevel(0, axis=1)
-    df_std_opp = squad_opp_std_stats[unnamed_cols].droplevel(0, axis=1)
-    df_std_squads = pd.merge(df_std, df_std_opp, on=["Squad", "# Pl"])
+def column_group(df: pd.DataFrame, group: str) -> pd.DataFrame:
+    """The columns of a group of a two level header, views of df's columns.
 
-    squad_seasonal_stats["Standard"] = df_std_squads
+    Nothing is copied, unlike df[group] which copies the group out of the
+    blocks of its dtypes.
+    """
+    positions = np.flatnonzero(df.columns.get_level_values(0) == group)
+    return pd.DataFrame(
+        {df.columns[position]: df.iloc[:, position] for position in positions},
+        copy=False,
+    )
 
-    squad_seasonal_stats = merge_dfs(squad_std_stats, squad_opp_std_stats)
-    squad_seasonal_stats.drop(columns="Playing_Time", axis=1, level=0, inplace=True)
 
-    return squad_seasonal_stats
+def standard_stats_groups(standard_data: pd.DataFrame) -> dict[str, pd.DataFrame]:
+    """{group: its columns} of edit_standard_stats_table's table, views of it."""
+    groups = dict.fromkeys(standard_data.columns.get_level_values(0))
+    groups.pop(TEAM_ID, None)
+    return {group: column_group(standard_data, group) for group in groups}
 
 
 def edit_gk_tables(gk_df: pd.DataFrame, gk_opp_df: pd.DataFrame) -> pd.DataFrame:
@@ -326,10 +477,8 @@ def edit_gk_tables(gk_df: pd.DataFrame, gk_opp_df: pd.DataFrame) -> pd.DataFrame
         :Save%_Opp: Penalty Saved percentage by Opposition Gks
     """
 
-    gk_df = get_squad_as_index(gk_df.copy())
-    gk_opp_df = get_squad_as_index(gk_opp_df.copy())
-    gk_df.drop(["W", "D", "L"], axis=1, level=1, inplace=True)
-    gk_opp_df.drop(["W", "D", "L"], axis=1, level=1, inplace=True)
+    gk_df = gk_df.drop(["W", "D", "L"], axis=1, level=1)
+    gk_opp_df = gk_opp_df.drop(["W", "D", "L"], axis=1, level=1)
 
     gk_overall = merge_dfs(gk_df, gk_opp_df)
     gk_overall.drop("Playing_Time", axis=1, level=0, inplace=True)
@@ -337,58 +486,9 @@ def edit_gk_tables(gk_df: pd.DataFrame, gk_opp_df: pd.DataFrame) -> pd.DataFrame
     return gk_overall
 
 
-def get_year_at_season_st_of_tables(country: str, tier: int, year: int) -> list:
-    league_id = leagues[country][tier]["id"]
-    league_name = leagues[country][tier]["name"]
-    season = get_season_years(year)
-
-    leagues_list = pd.read_html(LEAGUE_URL.format(league_id, season))
-
-    return leagues_list
-
-
-# Make it robust so it can get into account data before the 2017-2018 season
-def get_single_season_league_data(country: str, tier: int, year: int) -> dict:
-    """
-    Takes as arguments the country the tier of the league and the first
-    calendar year of the season and returns a dict with the following dfs
-    * standings_table
-    * home"
-    * "away"
-    * "h-a"
-    * "h%a"
-    * standard_data
-    * gk_overall
-    * gk_advanced
-    * shooting
-    * passing
-    * pass_types
-    * gca
-    * defensive_actions
-    * possession
-    * other
-
-    For each df there are documentation docstrings as per the meaning
-    of each column
-    """
-    leagues_list = get_year_at_season_st_of_tables(
-        country=country, tier=tier, year=year
-    )
-
-    # Edit original tables
-
-    regular_season = edit_regular_season_table(leagues_list[0])
-    # Dictionary of 4 dfs. Home, Away, Home - Away, Home / Away stats
-    # The first two dfs can be configured easily be calling clean_df on them
-    home_away = edit_home_away_table(leagues_list[1])
-    # Dictionary of 4 dfs. Standard, Performance, Per 90' and Expected stats
-    std_squads_stats = edit_standard_stats_table(leagues_list[2], leagues_list[3])
-    # GoalKeeping General Stats
-
-    gk_overall = edit_gk_tables(leagues_list[4], leagues_list[5])
-    # Advanced Gk
-
-    advanced_gk = merge_dfs(leagues_list[6], leagues_list[7])
+def edit_shooting_tables(
+    shooting: pd.DataFrame, shooting_opp: pd.DataFrame
+) -> pd.DataFrame:
     """
     Squad Shooting
     - Standard shooting ->
@@ -409,10 +509,13 @@ def get_single_season_league_data(country: str, tier: int, year: int) -> dict:
         :npxG/Sh: Non Penalty xG per shot
         :G-xG: Goals minus xG
         :np:G-xG:Non Penalty Goals minus Non Penalty xG
-
     """
-    shooting_dfs = merge_dfs(leagues_list[8], leagues_list[9])
-    # Squad Passing
+    return merge_dfs(shooting, shooting_opp)
+
+
+def edit_passing_tables(
+    passing: pd.DataFrame, passing_opp: pd.DataFrame
+) -> pd.DataFrame:
     """
     Squad Passing
     - Total ->
@@ -450,9 +553,15 @@ def get_single_season_league_data(country: str, tier: int, year: int) -> dict:
             six passes, or any completed pass into the penalty area.
             Excludes passes from the defending 40% of the pitch
     """
-    squad_passing_df = merge_dfs(leagues_list[10], leagues_list[11])
+    squad_passing_df = merge_dfs(passing, passing_opp)
     squad_passing_df.rename(columns={"Details": "Advanced_Passing"}, inplace=True)
-    # Squad Passing Type
+
+    return squad_passing_df
+
+
+def edit_pass_types_tables(
+    pass_types: pd.DataFrame, pass_types_opp: pd.DataFrame
+) -> pd.DataFrame:
     """
     Pass Types
     - Total ->
@@ -473,8 +582,10 @@ def get_single_season_league_data(country: str, tier: int, year: int) -> dict:
         :Off: Offsides
         :Blocks: Blocked by the opponent who was standing in the path of the pass
     """
-    squad_pass_type_df = merge_dfs(leagues_list[12], leagues_list[13])
-    # Squad Goal and Shot Creation
+    return merge_dfs(pass_types, pass_types_opp)
+
+
+def edit_gca_tables(gca: pd.DataFrame, gca_opp: pd.DataFrame) -> pd.DataFrame:
     """
     Goal And Shot Creation
     - SCA -->
@@ -505,9 +616,13 @@ def get_single_season_league_data(country: str, tier: int, year: int) -> dict:
         :Sh: Shots that lead to another shot attempt
         :Fld: Fouls Drawn that lead to a goal
         :Def: Defensive actions that lead to a goal
-"""
-    squad_goal_shot_creation_df = merge_dfs(leagues_list[14], leagues_list[15])
-    # Squad Defending
+    """
+    return merge_dfs(gca, gca_opp)
+
+
+def edit_defensive_actions_tables(
+    defense: pd.DataFrame, defense_opp: pd.DataFrame
+) -> pd.DataFrame:
     """
     Defensive Actions
     - Tackles -->
@@ -531,11 +646,17 @@ def get_single_season_league_data(country: str, tier: int, year: int) -> dict:
         :Clr: Clearances
         :Err: Mistakes leading to an opponent's shot
     """
-    squad_defensive_actions_df = merge_dfs(leagues_list[16], leagues_list[17])
+    squad_defensive_actions_df = merge_dfs(defense, defense_opp)
     squad_defensive_actions_df.rename(
         columns={"Details": "Advanced_Defending"}, inplace=True
     )
-    # Squad Possession
+
+    return squad_defensive_actions_df
+
+
+def edit_possession_tables(
+    possession: pd.DataFrame, possession_opp: pd.DataFrame
+) -> pd.DataFrame:
     """
     Squad Possession
     - Touches -->
@@ -561,8 +682,10 @@ def get_single_season_league_data(country: str, tier: int, year: int) -> dict:
             into the penalty area.
             Excludes passes from the defending 40% of the pitch
     """
-    squad_possession_stats = merge_dfs(leagues_list[18], leagues_list[19])
-    # Squad Other Stats
+    return merge_dfs(possession, possession_opp)
+
+
+def edit_other_tables(misc: pd.DataFrame, misc_opp: pd.DataFrame) -> pd.DataFrame:
     """
     Squad Other (Miscellaneous) Stats
     - Performance -->
@@ -584,98 +707,682 @@ def get_single_season_league_data(country: str, tier: int, year: int) -> dict:
         :Lost: Number of Aerial Duels Lost
         :Won%: Percentage of Aerial Duels Won
     """
-    other_stats = merge_dfs(leagues_list[22], leagues_list[23])
-    seasons_data = {
-        "standings_table": regular_season,
-        "home": home_away["home"],
-        "away": home_away["away"],
-        "h-a": home_away["h-a"],
-        "h_div_a": home_away["h/a"],
-        "standard_data": std_squads_stats,
-        "gk_overall": gk_overall,
-        "gk_advanced": advanced_gk,
-        "shooting": shooting_dfs,
-        "passing": squad_passing_df,
-        "pass_types": squad_pass_type_df,
-        "gca": squad_goal_shot_creation_df,
-        "defensive_actions": squad_defensive_actions_df,
-        "possession": squad_possession_stats,
-        "other": other_stats,
+    return merge_dfs(misc, misc_opp)
+
+
+def add_team_ids(
+    df: pd.DataFrame, squads: dict = None, registry: TeamRegistry = team_registry
+) -> pd.DataFrame:
+    """Insert the team_id of the df's squads, after its Squad column or first
+    when the squads are the index.
+
+    :squads: {name: team_id} of the season's page, see TeamRegistry.register
+    """
+    if not isinstance(df.columns, pd.MultiIndex) and "Squad" in df.columns:
+        names = df["Squad"]
+        position = df.columns.get_loc("Squad") + 1
+    else:
+        names = df.index
+        position = 0
+    column = (TEAM_ID, "") if isinstance(df.columns, pd.MultiIndex) else TEAM_ID
+    df.insert(position, column, registry.ids(names, squads))
+
+    return df
+
+
+class TableSpec(NamedTuple):
+    """How a stored table is built from the tables of a season's page."""
+
+    name: str  # name of the stored table
+    # Keys of SEASON_TABLE_IDS, the squads' own table then their opposition's
+    sources: tuple
+    transform: Callable  # the source dfs -> the stored df
+    schema: TableSchema
+    # Bumped when the stored df changes, the seasons stored by an older
+    # version are fetched and built again
+    version: int = 1
+
+    def build(
+        self,
+        season_tables: dict[str, pd.DataFrame],
+        squads: dict = None,
+        registry: TeamRegistry = team_registry,
+    ) -> pd.DataFrame:
+        """The table, with the team_id of its squads, see add_team_ids."""
+        df = self.transform(*(season_tables[source] for source in self.sources))
+        return self.schema.apply(add_team_ids(df, squads, registry))
+
+
+def _spec(
+    name: str, sources: tuple, transform: Callable, version: int = 1
+) -> TableSpec:
+    return TableSpec(name, sources, transform, SCHEMAS[name], version)
+
+
+# Every table stored for a season, in the order they are built and stored
+TABLES = {
+    spec.name: spec
+    for spec in [
+        _spec("standings_table", ("standings",), edit_regular_season_table),
+        _spec("home_away", ("home_away",), edit_home_away_table),
+        _spec(
+            "standard_data",
+            ("standard_for", "standard_against"),
+            edit_standard_stats_table,
+            # 2: the opposition stats are *_Opp, not *_Opp_Opp
+            version=2,
+        ),
+        _spec("gk_overall", ("keeper_for", "keeper_against"), edit_gk_tables),
+        _spec("gk_advanced", ("keeper_adv_for", "keeper_adv_against"), merge_dfs),
+        _spec("shooting", ("shooting_for", "shooting_against"), edit_shooting_tables),
+        _spec("passing", ("passing_for", "passing_against"), edit_passing_tables),
+        _spec(
+            "pass_types",
+            ("passing_types_for", "passing_types_against"),
+            edit_pass_types_tables,
+        ),
+        _spec("gca", ("gca_for", "gca_against"), edit_gca_tables),
+        _spec(
+            "defensive_actions",
+            ("defense_for", "defense_against"),
+            edit_defensive_actions_tables,
+        ),
+        _spec(
+            "possession",
+            ("possession_for", "possession_against"),
+            edit_possession_tables,
+        ),
+        _spec("other", ("misc_for", "misc_against"), edit_other_tables),
+    ]
+}
+
+
+class DerivedTable(NamedTuple):
+    """A table computed from a stored one when it's looked up, never stored."""
+
+    name: str
+    source: str  # the stored table, a key of TABLES
+    derive: Callable  # the source df -> the df
+    schema: TableSchema
+
+    def build(self, source: pd.DataFrame) -> pd.DataFrame:
+        return self.schema.apply(self.derive(source))
+
+
+def _derived(name: str, source: str, derive: Callable) -> DerivedTable:
+    return DerivedTable(name, source, derive, SCHEMAS[name])
+
+
+# Tables that are arithmetic on a stored table
+DERIVED_TABLES = {
+    derived.name: derived
+    for derived in [
+        _derived("home", "home_away", home_table),
+        _derived("away", "home_away", away_table),
+        _derived("h-a", "home_away", h_a_table),
+        _derived("h_div_a", "home_away", h_div_a_table),
+    ]
+}
+SEASON_TABLES = list(TABLES) + list(DERIVED_TABLES)
+
+
+def stored_table(table: str) -> str:
+    """The stored table a table is, or is derived from."""
+    if table in DERIVED_TABLES:
+        return DERIVED_TABLES[table].source
+    if table not in TABLES:
+        raise KeyError(f"No table named {table}, choose from {SEASON_TABLES}")
+    return table
+
+
+def table_specs(tables: list = None) -> list[TableSpec]:
+    """The specs of the stored tables the tables are, or are derived from, all
+    of them by default.
+    """
+    if tables is None:
+        return list(TABLES.values())
+    unknown = [table for table in tables if table not in SEASON_TABLES]
+    if unknown:
+        raise KeyError(
+            f"No tables named {', '.join(unknown)}, choose from {SEASON_TABLES}"
+        )
+    return [TABLES[name] for name in dict.fromkeys(map(stored_table, tables))]
+
+
+def source_table_ids(tables: list = None) -> dict[str, str]:
+    """{source: table id} of the page's tables the tables are built from."""
+    return {
+        source: SEASON_TABLE_IDS[source]
+        for spec in table_specs(tables)
+        for source in spec.sources
+    }
+
+
+class SeasonTables(Mapping):
+    """The tables of a season, each built on first access and then cached.
+
+    A read only dict of {table: df}, the stored tables of TABLES the tables
+    given need, all of them by default, built from the season's page tables
+    (named as in SEASON_TABLE_IDS). Only the tables looked up are ever built.
+    The DERIVED_TABLES of those can be looked up as well, they're computed
+    from the cached stored table.
+    Every table has the team_id of its squads, squads of the season's page
+    ({name: team_id}) first then the registry's.
+    """
+
+    def __init__(
+        self,
+        season_tables: dict[str, pd.DataFrame],
+        tables: list = None,
+        squads: dict = None,
+        registry: TeamRegistry = team_registry,
+    ):
+        self.season_tables = season_tables
+        self.specs = {spec.name: spec for spec in table_specs(tables)}
+        self.squads = squads
+        self.registry = registry
+        self._built = {}
+
+    def __getitem__(self, table: str) -> pd.DataFrame:
+        if table not in self._built:
+            if table in DERIVED_TABLES and DERIVED_TABLES[table].source in self.specs:
+                derived = DERIVED_TABLES[table]
+                self._built[table] = derived.build(self[derived.source])
+            else:
+                self._built[table] = self.specs[table].build(
+                    self.season_tables, self.squads, self.registry
+                )
+        return self._built[table]
+
+    def __iter__(self):
+        return iter(self.specs)
+
+    def __len__(self) -> int:
+        return len(self.specs)
+
+    def built(self) -> list:
+        """The tables built so far."""
+        return list(self._built)
+
+    def __repr__(self) -> str:
+        return f"SeasonTables({list(self.specs)}, built={self.built()})"
+
+
+def season_url(country: str, tier: int, year: int) -> str:
+    """fbref url of the league's season starting in year."""
+    return LEAGUE_URL.format(league_registry.get(country, tier).id, season(year).name)
+
+
+def get_season_html(
+    country: str,
+    tier: int,
+    year: int,
+    scheduler: "RequestScheduler" = None,
+    cache: HTMLCache = html_cache,
+) -> str:
+    """Download the fbref page of a league's season.
+
+    Pages of closed seasons are served from the cache for ever, the current
+    season's page is revalidated once an hour.
+    """
+    from footballdata.fetch import get_html
+
+    return get_html(
+        season_url(country, tier, year),
+        scheduler=scheduler,
+        cache=cache,
+        ttl=season_ttl(year),
+    )
+
+
+def read_season_tables(html: str, tables: list = None) -> dict[str, pd.DataFrame]:
+    """Extract the page's tables the tables are built from, all by default.
+
+    Returns {source: df}, the sources named as in SEASON_TABLE_IDS.
+    """
+    table_ids = source_table_ids(tables)
+    from footballdata.extract import extract_tables
+
+    season_tables = extract_tables(html, table_ids)
+    missing = [name for name in table_ids if name not in season_tables]
+    if missing:
+        raise KeyError(f"The season's page has no {', '.join(missing)} tables")
+
+    return season_tables
+
+
+def get_year_at_season_st_of_tables(
+    country: str, tier: int, year: int, tables: list = None
+) -> dict[str, pd.DataFrame]:
+    html = get_season_html(country=country, tier=tier, year=year)
+
+    return read_season_tables(html, tables)
+
+
+def register_squads(html: str, registry: TeamRegistry = team_registry) -> dict:
+    """Add the squads of a season's page to the registry, {name: team_id}."""
+    return registry.register(parse_squads(html))
+
+
+def parse_season_data(
+    html: str, tables: list = None, registry: TeamRegistry = team_registry
+) -> dict:
+    """HTML of a season's page -> dict of get_single_season_league_data.
+
+    Top level function so it can run in a process pool.
+    :registry: Where the squads get their team_id, frames_registry of the
+        backend the tables are saved to
+    """
+    return edit_season_tables(
+        read_season_tables(html, tables),
+        tables,
+        register_squads(html, registry),
+        registry,
+    )
+
+
+def parse_season_to_ipc(
+    html: str,
+    directory: Path,
+    tables: list = None,
+    registry: TeamRegistry = team_registry,
+) -> dict:
+    """parse_season_data, the tables written to directory as Arrow IPC files.
+
+    Returns {table: path}, for a process pool to hand back instead of
+    pickling the dfs. read_ipc_tables reads them back.
+    """
+    from footballdata.storage import write_ipc
+
+    directory = Path(directory)
+    os.makedirs(directory, exist_ok=True)
+    return {
+        table: write_ipc(directory / f"{table}.arrow", df)
+        for table, df in parse_season_data(html, tables, registry).items()
     }
 
-    return seasons_data
+
+def read_ipc_tables(paths: dict) -> dict[str, pd.DataFrame]:
+    """{table: path} of parse_season_to_ipc -> {table: df}, memory mapped."""
+    from footballdata.storage import read_ipc
+
+    return {table: read_ipc(path) for table, path in paths.items()}
+
+
+# Make it robust so it can get into account data before the 2017-2018 season
+def get_single_season_league_data(
+    country: str, tier: int, year: int, tables: list = None
+) -> SeasonTables:
+    """
+    Takes as arguments the country the tier of the league and the first
+    calendar year of the season and returns a dict with a df for each of
+    the tables, or of the TABLES when tables isn't given
+    * standings_table
+    * home_away, and its DERIVED_TABLES home, away, h-a and h_div_a
+    * standard_data
+    * gk_overall
+    * gk_advanced
+    * shooting
+    * passing
+    * pass_types
+    * gca
+    * defensive_actions
+    * possession
+    * other
+
+    For each df there are documentation docstrings as per the meaning
+    of each column, in the function building it (TABLES[name].transform)
+
+    The dfs are built when they're first looked up, e.g. tables=None and
+    ["standings_table"] only builds the standings.
+    Each df has the team_id of its squads, see footballdata.teams
+    """
+    html = get_season_html(country=country, tier=tier, year=year)
+
+    return SeasonTables(read_season_tables(html, tables), tables, register_squads(html))
+
+
+def edit_season_tables(
+    season_tables: dict[str, pd.DataFrame],
+    tables: list = None,
+    squads: dict = None,
+    registry: TeamRegistry = team_registry,
+) -> dict:
+    """Build the tables, all of TABLES by default, from the tables of a
+    season's page named as in SEASON_TABLE_IDS.
+
+    :squads: {name: team_id} of the page's squads, register_squads
+    """
+    return dict(SeasonTables(season_tables, tables, squads, registry))
+
+
+def load_season_tables(
+    country: str,
+    tier: int,
+    season: str,
+    tables: list = None,
+    backend: "StorageBackend" = None,
+) -> dict[str, pd.DataFrame]:
+    """Read the stored tables of a season back, all of TABLES by default.
+
+    DERIVED_TABLES are computed from their stored table, read once.
+    Without a backend they are read from the .xlsx files under FRAMES_DIR
+    """
+    backend = frames_backend(backend)
+    stored = {
+        spec.name: read_stored_table(backend, country, tier, season, spec.name)
+        for spec in table_specs(tables)
+    }
+    if tables is None:
+        return stored
+
+    return {
+        table: DERIVED_TABLES[table].build(stored[stored_table(table)])
+        if table in DERIVED_TABLES
+        else stored[table]
+        for table in tables
+    }
+
+
+def read_stored_table(
+    backend: "StorageBackend", country: str, tier: int, season: str, table: str
+) -> pd.DataFrame:
+    """Read a stored table, home_away is rebuilt from the LEGACY_VENUE_TABLES
+    of the seasons stored before it.
+    """
+    try:
+        return backend.read(country, tier, season, table)
+    except FileNotFoundError:
+        legacy = LEGACY_VENUE_TABLES.values()
+        if table != "home_away" or not all(
+            backend.exists(country, tier, season, name) for name in legacy
+        ):
+            raise
+
+    return legacy_home_away(
+        {
+            venue: backend.read(country, tier, season, name)
+            for venue, name in LEGACY_VENUE_TABLES.items()
+        }
+    )
 
 
 def create_xlsx_from_dict(
-    country: str, tier: int, season: str, data_dict: dict[str, pd.DataFrame]
+    country: str,
+    tier: int,
+    season: str,
+    data_dict: dict[str, pd.DataFrame],
+    overwrite: bool = False,
+    workbook: bool = False,
 ) -> None:
-    for data, df in data_dict.items():
-        filename = f"{data}.xlsx"
-        directory = Path(f"./frames/{country}/{tier}/{season}/")
-        path = Path(directory, f"{filename}")
-        if not directory.exists():
-            os.makedirs(directory)
-        elif path.exists():
+    """Write each df to FRAMES_DIR/{country}/{tier}/{season}/{table}.xlsx
+
+    :workbook: Write all of them to one SEASON_WORKBOOK instead, a sheet per
+        table
+    """
+    from footballdata.storage import XLSX_SHEET, write_xlsx
+
+    directory = Path(FRAMES_DIR, country, str(tier), season)
+    os.makedirs(directory, exist_ok=True)
+    if workbook:
+        files = {SEASON_WORKBOOK: data_dict}
+    else:
+        files = {f"{data}.xlsx": {XLSX_SHEET: df} for data, df in data_dict.items()}
+    for filename, sheets in files.items():
+        path = Path(directory, filename)
+        if path.exists() and not overwrite:
             logger.warning("%s exists", filename)
             continue
         logger.info("Creating %s", path)
-        header = df.columns
-        df.to_excel(path, header=header, index=False)
+        write_xlsx(path, sheets)
+
+
+def frames_backend(backend: "StorageBackend" = None) -> "StorageBackend":
+    """The backend, the .xlsx files of FRAMES_DIR without one."""
+    if backend is not None:
+        return backend
+    from footballdata.storage import ExcelBackend
+
+    return ExcelBackend(FRAMES_DIR)
+
+
+def table_exists(
+    country: str, tier: int, season: str, table: str, backend: "StorageBackend" = None
+) -> bool:
+    return frames_backend(backend).exists(country, tier, season, table)
+
+
+def season_manifest_path(
+    country: str, tier: int, season: str, backend: "StorageBackend" = None
+) -> Path:
+    root = FRAMES_DIR if backend is None else backend.root
+    return manifest_path(root, country, tier, season)
+
+
+def frames_registry(backend: "StorageBackend" = None) -> TeamRegistry:
+    """The TeamRegistry stored next to the backend's frames."""
+    return registry_at(FRAMES_DIR if backend is None else backend.root)
+
+
+def index_season_teams(
+    country: str,
+    tier: int,
+    season: str,
+    data_dict: dict[str, pd.DataFrame],
+    backend: "StorageBackend" = None,
+) -> None:
+    """Record the season's teams, the team_ids of its tables, in the TeamIndex
+    of the frames.
+    """
+    teams = set()
+    for df in data_dict.values():
+        teams.update(team_ids(df).tolist())
+    if not teams:
+        return
+    index = TeamIndex(FRAMES_DIR if backend is None else backend.root)
+    try:
+        index.update(country, tier, season, sorted(teams))
+    finally:
+        index.close()
+
+
+def season_is_closed(season: str) -> bool:
+    return season_ttl(int(season.split("-")[0])) is None
+
+
+def tables_exist(
+    country: str,
+    tier: int,
+    season: str,
+    backend: "StorageBackend" = None,
+    tables: list = None,
+) -> bool:
+    """Every one of the tables, all of TABLES by default, is stored.
+
+    home_away is when the LEGACY_VENUE_TABLES of a season stored before it are.
+    """
+    stored = frames_backend(backend).stored_tables(country, tier, season)
+    if stored.issuperset(LEGACY_VENUE_TABLES.values()):
+        stored.add("home_away")
+    return all(spec.name in stored for spec in table_specs(tables))
+
+
+def season_is_stored(
+    country: str,
+    tier: int,
+    season: str,
+    backend: "StorageBackend" = None,
+    tables: list = None,
+) -> bool:
+    """Every table of a closed season is stored, it never has to be fetched again.
+
+    Seasons stored before the manifests existed count once the season is closed,
+    the ones with a table stored by an older version of its TableSpec don't.
+    """
+    if not tables_exist(country, tier, season, backend, tables):
+        return False
+    manifest = load_manifest(season_manifest_path(country, tier, season, backend))
+    if manifest is None:
+        return season_is_closed(season)
+
+    return manifest.closed and manifest_is_current(manifest, tables)
+
+
+def manifest_is_current(manifest: SeasonManifest, tables: list = None) -> bool:
+    """The tables, all of TABLES by default, were stored by the current
+    version of their TableSpec.
+    """
+    return all(
+        manifest.versions.get(spec.name, 1) == spec.version
+        for spec in table_specs(tables)
+    )
+
+
+def source_changed(
+    country: str,
+    tier: int,
+    season: str,
+    html: str,
+    backend: "StorageBackend" = None,
+    tables: list = None,
+) -> bool:
+    """The season's page differs from the one its stored tables were built from."""
+    manifest = load_manifest(season_manifest_path(country, tier, season, backend))
+    if manifest is None or manifest.source_hash != source_hash(html):
+        return True
+    if not manifest_is_current(manifest, tables):
+        return True
+
+    return not tables_exist(country, tier, season, backend, tables)
+
+
+def mark_fetched(
+    country: str, tier: int, season: str, backend: "StorageBackend" = None
+) -> None:
+    """Record a fetch that found the season's page unchanged."""
+    path = season_manifest_path(country, tier, season, backend)
+    manifest = load_manifest(path)
+    if manifest is None:
+        return
+    manifest.fetched_at = now()
+    manifest.closed = season_is_closed(season)
+    save_manifest(path, manifest)
+
+
+def save_season_tables(
+    country: str,
+    tier: int,
+    season: str,
+    data_dict: dict[str, pd.DataFrame],
+    backend: "StorageBackend" = None,
+    page_hash: str = None,
+) -> list:
+    """Persist the tables of get_single_season_league_data.
+
+    Only the tables whose checksum differs from the season's manifest, or
+    that are missing, are (over)written. The manifest is updated with the
+    checksums, the fetch time and page_hash, the sha256 of the page, and
+    the TeamIndex with the season's teams.
+    Without a backend the tables are written as .xlsx files under FRAMES_DIR
+
+    Returns the names of the tables written.
+    """
+    backend = frames_backend(backend)
+    path = season_manifest_path(country, tier, season, backend)
+    manifest = load_manifest(path)
+    stored = manifest.tables if manifest is not None else {}
+    checksums = {table: table_checksum(df) for table, df in data_dict.items()}
+    stored_tables = backend.stored_tables(country, tier, season)
+    changed = {
+        table: df
+        for table, df in data_dict.items()
+        if stored.get(table) != checksums[table] or table not in stored_tables
+    }
+
+    backend.write_tables(country, tier, season, changed, overwrite=True)
+    if page_hash is None and manifest is not None:
+        page_hash = manifest.source_hash
+    save_manifest(
+        path,
+        SeasonManifest(
+            fetched_at=now(),
+            source_hash=page_hash or "",
+            tables={**stored, **checksums},
+            closed=season_is_closed(season),
+            versions={
+                **(manifest.versions if manifest is not None else {}),
+                **{table: TABLES[table].version for table in data_dict},
+            },
+        ),
+    )
+    index_season_teams(country, tier, season, data_dict, backend)
+
+    return list(changed)
 
 
 def year_at_season_start_list(year_range: str) -> list:
     """Create list of years to feed the get_single_season_league_data."""
-    if not isinstance(year_range, str):
-        raise TypeError(f"{year_range} is not a string.")
-
-    years = year_range.split("-")
-    if len(years) <= 1:
-        raise KeyError("Year range input should look like this: '2010-2020'")
-    start_year = int(years[0])
-    end_year = int(years[1])
-    if start_year >= end_year:
-        raise KeyError(
-            "First year of a year range can't be greater or equal to the last year"
-        )
-    year_at_season_st_list = list(range(start_year, end_year))
-
-    return year_at_season_st_list
-
-
-def create_multiple_season_dfs(country: str, tier: int, year_range: str) -> None:
-    league_name = leagues[country][tier].get("name")
-    files_to_check = [
-        "standings_table.xlsx",
-        "home_away.xlsx",
-        "standard_data.xlsx",
-        "gk_overall.xlsx",
-        "gk_advanced.xlsx",
-        "shooting.xlsx",
-        "passing.xlsx",
-        "pass_types.xlsx",
-        "gca.xlsx",
-        "defensive_actions.xlsx",
-        "possession.xlsx",
-        "other.xlsx",
-    ]
+    return list(season_years(year_range))
+
+
+def create_multiple_season_dfs(
+    country: str,
+    tier: int,
+    year_range: str,
+    backend: "StorageBackend" = None,
+    max_workers: int = None,
+    tables: list = None,
+) -> None:
+    """Fetch and store every season of the year range that isn't stored yet.
+
+    Incremental, closed seasons that are fully stored are never fetched again.
+    The season in progress is fetched (revalidating the cached page) and only
+    when its page changed it's parsed and only its changed tables rewritten.
 
+    :max_workers: When given the seasons are ingested concurrently, pages are
+        fetched by that many threads, parsed in a process pool and written by
+        a separate writer. Otherwise one season at a time.
+    :tables: The tables to build and store, all of TABLES by default
+    """
+    league_name = league_registry.get(country, tier).name
     years = year_at_season_start_list(year_range)
 
+    missing_years = []
     for year in years:
         season = get_season_years(year)
-        path_of_data = Path(f"./frames/{country}/{tier}/{season}/")
-        all_files_exist = all(
-            [
-                os.path.exists(os.path.join(path_of_data, file))
-                for file in files_to_check
-            ]
-        )
-        if all_files_exist:
+        if season_is_stored(country, tier, season, backend, tables):
             logger.warning(
-                ("All the %s's data from the %s season exist.", league_name, season)
+                "All the %s's data from the %s season exist.", league_name, season
             )
             continue
-        data_dict = get_single_season_league_data(country=country, tier=tier, year=year)
-        create_xlsx_from_dict(
-            country=country, tier=tier, season=season, data_dict=data_dict
+        missing_years.append(year)
+
+    if max_workers:
+        # ingest builds on this module
+        from footballdata.ingest import ingest_seasons
+
+        ingest_seasons(
+            country=country,
+            tier=tier,
+            years=missing_years,
+            backend=backend,
+            fetch_workers=max_workers,
+            tables=tables,
+        )
+        return
+
+    for year in missing_years:
+        season = get_season_years(year)
+        html = get_season_html(country=country, tier=tier, year=year)
+        if not source_changed(country, tier, season, html, backend, tables):
+            logger.info("The %s %s page hasn't changed.", league_name, season)
+            mark_fetched(country, tier, season, backend)
+            continue
+        save_season_tables(
+            country=country,
+            tier=tier,
+            season=season,
+            data_dict=parse_season_data(html, tables, frames_registry(backend)),
+            backend=backend,
+            page_hash=source_hash(html),
         )
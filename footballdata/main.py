@@ -0,0 +1,61 @@
+# Populate the archive from the command line
+#   python -m footballdata.main 2017-2023 --league England --league Germany:2
+import argparse
+import logging
+
+from footballdata.ingest import FETCH_WORKERS, ingest_all
+from footballdata.library import SEASON_TABLES
+from footballdata.storage import FRAMES_DIR, backends, get_backend
+
+
+def league(value: str):
+    """A --league, England is every tier of England, England:2 is ("England", 2)"""
+    country, _, tier = value.partition(":")
+    return (country, int(tier)) if tier else country
+
+
+def parse_args(args: list = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Fetch and store every season of the leagues in the years."
+    )
+    parser.add_argument(
+        "year_range", help="first year of the first season - last year, 2017-2023"
+    )
+    parser.add_argument(
+        "--league",
+        dest="leagues",
+        type=league,
+        action="append",
+        help="country or country:tier, repeat it for more, default every league",
+    )
+    parser.add_argument(
+        "--table", dest="tables", action="append", choices=SEASON_TABLES
+    )
+    parser.add_argument("--backend", choices=list(backends), default="xlsx")
+    parser.add_argument("--root", default=FRAMES_DIR)
+    parser.add_argument("--fetch-workers", type=int, default=FETCH_WORKERS)
+    parser.add_argument(
+        "--parse-workers", type=int, default=None, help="default the number of cpus"
+    )
+    return parser.parse_args(args)
+
+
+def main(args: list = None) -> int:
+    options = parse_args(args)
+    logging.basicConfig(level=logging.INFO)
+    failed = ingest_all(
+        options.year_range,
+        leagues=options.leagues,
+        backend=get_backend(options.backend, options.root),
+        fetch_workers=options.fetch_workers,
+        parse_workers=options.parse_workers,
+        tables=options.tables,
+    )
+    for job in failed:
+        print(f"Failed: {job}")
+
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,69 @@
+# Per season manifest of what is stored and where it came from
+import hashlib
+import json
+import os
+from dataclasses import asdict, dataclass, field
+from datetime import datetime
+from pathlib import Path
+
+import pandas as pd
+
+MANIFEST_NAME = "manifest.json"
+
+
+@dataclass
+class SeasonManifest:
+    """Written next to a season's tables.
+
+    :fetched_at: When the season's page was last fetched (ISO format)
+    :source_hash: sha256 of the page the tables were built from
+    :tables: {table name: checksum of the stored df}
+    :closed: The season had finished when it was fetched, it won't change again
+    :versions: {table name: version of the TableSpec that built it}, 1 when
+        missing
+    """
+
+    fetched_at: str
+    source_hash: str
+    tables: dict[str, str] = field(default_factory=dict)
+    closed: bool = False
+    versions: dict[str, int] = field(default_factory=dict)
+
+
+def source_hash(html: str) -> str:
+    return hashlib.sha256(html.encode("utf-8")).hexdigest()
+
+
+def table_checksum(df: pd.DataFrame) -> str:
+    """Checksum of a df's values, index, columns and dtypes."""
+    digest = hashlib.sha256()
+    digest.update(repr(list(df.columns)).encode("utf-8"))
+    digest.update(repr([str(dtype) for dtype in df.dtypes]).encode("utf-8"))
+    digest.update(pd.util.hash_pandas_object(df, index=True).to_numpy().tobytes())
+
+    return digest.hexdigest()
+
+
+def manifest_path(root: Path, country: str, tier: int, season: str) -> Path:
+    return Path(root, country, str(tier), season, MANIFEST_NAME)
+
+
+def load_manifest(path: Path) -> SeasonManifest:
+    """The manifest at path, None if there isn't one."""
+    try:
+        with open(path, encoding="utf-8") as f:
+            return SeasonManifest(**json.load(f))
+    except FileNotFoundError:
+        return None
+
+
+def save_manifest(path: Path, manifest: SeasonManifest) -> None:
+    os.makedirs(Path(path).parent, exist_ok=True)
+    tmp_path = Path(path).with_suffix(".tmp")
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(asdict(manifest), f, indent=4)
+    os.replace(tmp_path, path)
+
+
+def now() -> str:
+    return datetime.now().isoformat(timespec="seconds")
@@ -0,0 +1,222 @@
+# Player registry stored in an SQLite file
+import os
+import shutil
+import sqlite3
+import threading
+from pathlib import Path
+
+# The players shipped with the package, only ever read
+SHIPPED_PLAYERS_DB = Path(__file__).parent / "assets" / "players.sqlite"
+# Where the crawled players are written, a copy of the shipped registry made on
+# the first write
+PLAYERS_DB = Path(os.environ.get("FOOTBALLDATA_PLAYERS_DB", "./.players.sqlite"))
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS players (
+    key INTEGER PRIMARY KEY,
+    name TEXT NOT NULL UNIQUE,
+    id TEXT NOT NULL,
+    url TEXT,
+    birth_year INTEGER
+);
+CREATE TABLE IF NOT EXISTS nationalities (
+    player INTEGER NOT NULL REFERENCES players(key),
+    rank INTEGER NOT NULL,
+    nationality TEXT NOT NULL,
+    PRIMARY KEY (player, rank)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS positions (
+    player INTEGER NOT NULL REFERENCES players(key),
+    rank INTEGER NOT NULL,
+    position TEXT NOT NULL,
+    PRIMARY KEY (player, rank)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS players_id ON players(id);
+CREATE INDEX IF NOT EXISTS players_birth_year ON players(birth_year);
+CREATE INDEX IF NOT EXISTS nationalities_nationality ON nationalities(nationality);
+CREATE INDEX IF NOT EXISTS positions_position ON positions(position);
+"""
+
+
+class PlayerRegistry:
+    """Indexed lookups of the players scraped from fbref.
+
+    The file is opened on the first lookup. Each player is returned in the
+    format of the old settings.players dict
+    "Player-Name": {
+        "id": "player_id",
+        "url": "player_url",
+        "nationality": ["abbreviation_of_players_nationality"],
+        "position": ["player_pos1", "player_pos2"],
+        "birth_year": int(birth_year),
+    }
+    keys without a value are left out.
+
+    :seed: Read instead of path while path doesn't exist, the first write
+        copies it to path so the seed itself is never written
+    """
+
+    def __init__(self, path: Path = PLAYERS_DB, seed: Path = None):
+        self.path = Path(path)
+        self.seed = None if seed is None else Path(seed)
+        self._connection = None
+        self._seeded = False  # the connection is the seed's, read only
+        self._lock = threading.RLock()
+
+    @property
+    def connection(self) -> sqlite3.Connection:
+        if self._connection is None:
+            with self._lock:
+                if self._connection is None:
+                    if self.seed is not None and not self.path.exists():
+                        self._connection = sqlite3.connect(
+                            f"{self.seed.resolve().as_uri()}?mode=ro",
+                            uri=True,
+                            check_same_thread=False,
+                        )
+                        self._seeded = True
+                    else:
+                        connection = sqlite3.connect(self.path, check_same_thread=False)
+                        connection.executescript(SCHEMA)
+                        self._connection = connection
+        return self._connection
+
+    def _writable(self) -> sqlite3.Connection:
+        """The connection to path, the seed copied there first."""
+        with self._lock:
+            connection = self.connection
+            if self._seeded:
+                if not self.path.exists():
+                    os.makedirs(self.path.parent, exist_ok=True)
+                    shutil.copyfile(self.seed, self.path)
+                self.close()
+                connection = self.connection
+            return connection
+
+    def _query(self, sql: str, params: tuple = ()) -> list:
+        with self._lock:
+            return self.connection.execute(sql, params).fetchall()
+
+    def _players(self, names: list) -> dict[str, dict]:
+        return {name: self.get(name) for name in names}
+
+    def get(self, name: str) -> dict:
+        """The player's entry, None if there is no such player."""
+        rows = self._query(
+            "SELECT key, id, url, birth_year FROM players WHERE name = ?", (name,)
+        )
+        if not rows:
+            return None
+        key, fbref_id, url, birth_year = rows[0]
+        player = {"id": fbref_id}
+        if url is not None:
+            player["url"] = url
+        nationalities = self._query(
+            "SELECT nationality FROM nationalities WHERE player = ? ORDER BY rank",
+            (key,),
+        )
+        if nationalities:
+            player["nationality"] = [row[0] for row in nationalities]
+        positions = self._query(
+            "SELECT position FROM positions WHERE player = ? ORDER BY rank", (key,)
+        )
+        if positions:
+            player["position"] = [row[0] for row in positions]
+        if birth_year is not None:
+            player["birth_year"] = birth_year
+
+        return player
+
+    def by_id(self, fbref_id: str) -> dict[str, dict]:
+        rows = self._query("SELECT name FROM players WHERE id = ?", (fbref_id,))
+        return self._players([row[0] for row in rows])
+
+    def by_nationality(self, nationality: str) -> dict[str, dict]:
+        rows = self._query(
+            "SELECT name FROM players JOIN nationalities ON player = key "
+            "WHERE nationality = ? ORDER BY name",
+            (nationality,),
+        )
+        return self._players([row[0] for row in rows])
+
+    def by_position(self, position: str) -> dict[str, dict]:
+        rows = self._query(
+            "SELECT name FROM players JOIN positions ON player = key "
+            "WHERE position = ? ORDER BY name",
+            (position,),
+        )
+        return self._players([row[0] for row in rows])
+
+    def by_birth_year(self, birth_year: int) -> dict[str, dict]:
+        rows = self._query(
+            "SELECT name FROM players WHERE birth_year = ? ORDER BY name",
+            (birth_year,),
+        )
+        return self._players([row[0] for row in rows])
+
+    def add(self, name: str, player: dict) -> None:
+        """Add or replace a player, player is in the settings.players format."""
+        with self._lock:
+            connection = self._writable()
+            with connection:
+                insert_player(connection, name, player)
+
+    def update(self, players: dict[str, dict]) -> None:
+        with self._lock:
+            connection = self._writable()
+            with connection:
+                for name, player in players.items():
+                    insert_player(connection, name, player)
+
+    def names(self) -> list:
+        return [row[0] for row in self._query("SELECT name FROM players ORDER BY name")]
+
+    def to_dict(self) -> dict[str, dict]:
+        """Every player, as the old settings.players dict."""
+        return self._players(self.names())
+
+    def __getitem__(self, name: str) -> dict:
+        player = self.get(name)
+        if player is None:
+            raise KeyError(name)
+        return player
+
+    def __contains__(self, name: str) -> bool:
+        return bool(self._query("SELECT 1 FROM players WHERE name = ?", (name,)))
+
+    def __iter__(self):
+        return iter(self.names())
+
+    def __len__(self) -> int:
+        return self._query("SELECT COUNT(*) FROM players")[0][0]
+
+    def close(self) -> None:
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
+            self._seeded = False
+
+
+def insert_player(connection: sqlite3.Connection, name: str, player: dict) -> None:
+    connection.execute(
+        "INSERT INTO players (name, id, url, birth_year) VALUES (?, ?, ?, ?) "
+        "ON CONFLICT(name) DO UPDATE SET "
+        "id = excluded.id, url = excluded.url, birth_year = excluded.birth_year",
+        (name, player["id"], player.get("url"), player.get("birth_year")),
+    )
+    key = connection.execute(
+        "SELECT key FROM players WHERE name = ?", (name,)
+    ).fetchone()[0]
+    connection.execute("DELETE FROM nationalities WHERE player = ?", (key,))
+    connection.execute("DELETE FROM positions WHERE player = ?", (key,))
+    connection.executemany(
+        "INSERT INTO nationalities (player, rank, nationality) VALUES (?, ?, ?)",
+        [(key, rank, nat) for rank, nat in enumerate(player.get("nationality") or [])],
+    )
+    connection.executemany(
+        "INSERT INTO positions (player, rank, position) VALUES (?, ?, ?)",
+        [(key, rank, pos) for rank, pos in enumerate(player.get("position") or [])],
+    )
+
+
+player_registry = PlayerRegistry(PLAYERS_DB, seed=SHIPPED_PLAYERS_DB)
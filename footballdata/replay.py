@@ -0,0 +1,262 @@
+# Recording fbref pages and serving them offline
+#   python -m footballdata.replay record 2017-2023 --league England
+#   python -m footballdata.replay serve --latency 0.2 --rate-429 0.05
+#   FOOTBALLDATA_FBREF_URL=http://127.0.0.1:8000 python -m footballdata.main ...
+import argparse
+import gzip
+import logging
+import os
+import random
+import threading
+import time
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import urlparse
+
+from footballdata.cache import HTMLCache, html_cache
+from footballdata.fetch import RequestScheduler, get_html
+from footballdata.ingest import league_pairs
+from footballdata.library import season_url, year_at_season_start_list
+from footballdata.main import league
+
+logger = logging.getLogger(__name__)
+
+ARCHIVE_DIR = Path(os.environ.get("FOOTBALLDATA_ARCHIVE_DIR", "./.fbref_archive"))
+HOST = "127.0.0.1"
+PORT = 8000
+RETRY_AFTER = 1
+
+
+class Archive:
+    """Recorded pages, gzipped under {root}/{the url's path}/index.html.gz
+
+    Pages are keyed by their path so the same archive answers for fbref and
+    for any stand-in address.
+    """
+
+    def __init__(self, root: Path = ARCHIVE_DIR):
+        self.root = Path(root)
+
+    def path(self, url: str) -> Path:
+        parts = [part for part in urlparse(url).path.split("/") if part]
+        if ".." in parts:
+            raise KeyError(f"{url} is outside the archive")
+        return self.root.joinpath(*parts, "index.html.gz")
+
+    def store(self, url: str, html: str) -> None:
+        path = self.path(url)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(".tmp")
+        tmp_path.write_bytes(gzip.compress(html.encode("utf-8")))
+        os.replace(tmp_path, path)
+
+    def read_gzipped(self, url: str) -> bytes:
+        """The gzipped page, None when it isn't recorded."""
+        path = self.path(url)
+        return path.read_bytes() if path.exists() else None
+
+    def read(self, url: str) -> str:
+        page = self.read_gzipped(url)
+        if page is None:
+            raise KeyError(f"{url} isn't recorded")
+        return gzip.decompress(page).decode("utf-8")
+
+    def __contains__(self, url: str) -> bool:
+        return self.path(url).exists()
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self.root.glob("**/index.html.gz"))
+
+
+def record(
+    urls: list,
+    archive: Archive = None,
+    scheduler: RequestScheduler = None,
+    cache: HTMLCache = html_cache,
+) -> list:
+    """Fetch the urls that aren't recorded yet into the archive.
+
+    Returns the urls that failed.
+    """
+    archive = archive or Archive()
+    failed = []
+    for url in urls:
+        if url in archive:
+            continue
+        try:
+            archive.store(url, get_html(url, scheduler=scheduler, cache=cache))
+        except Exception as exc:  # pylint: disable=broad-except
+            logger.error("Recording %s failed: %s", url, exc)
+            failed.append(url)
+    return failed
+
+
+def record_seasons(
+    year_range: str, leagues: list = None, archive: Archive = None
+) -> list:
+    """Record the page of every season of the leagues in the year range.
+
+    Leagues are countries or (country, tier) pairs as in ingest_all.
+    """
+    urls = [
+        season_url(country, tier, year)
+        for year in year_at_season_start_list(year_range)
+        for country, tier in league_pairs(leagues)
+    ]
+    return record(urls, archive)
+
+
+class StandInHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):  # pylint: disable=invalid-name
+        stand_in = self.server.stand_in
+        status = stand_in.answer()
+        if status == 429:
+            self.send_response(429)
+            self.send_header("Retry-After", str(stand_in.retry_after))
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+
+        page = stand_in.archive.read_gzipped(self.path.split("?")[0])
+        if page is None:
+            stand_in.count(404)
+            self.send_error(404)
+            return
+        stand_in.count(200)
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        if "gzip" in self.headers.get("Accept-Encoding", ""):
+            self.send_header("Content-Encoding", "gzip")
+        else:
+            page = gzip.decompress(page)
+        self.send_header("Content-Length", str(len(page)))
+        self.end_headers()
+        self.wfile.write(page)
+
+    def log_message(self, format, *args):  # pylint: disable=redefined-builtin
+        logger.debug(format, *args)
+
+
+class StandInServer:
+    """A local fbref serving the archive's pages, in a background thread.
+
+    :latency: Seconds every answer is delayed
+    :rate_429: Share of the requests answered with a 429, Retry-After
+        retry_after seconds
+    :seed: Seed of the 429s, for reproducible runs
+
+    Point the ingestion at it with FOOTBALLDATA_FBREF_URL set to its url.
+    """
+
+    def __init__(
+        self,
+        archive: Archive = None,
+        host: str = HOST,
+        port: int = 0,
+        latency: float = 0.0,
+        rate_429: float = 0.0,
+        retry_after: int = RETRY_AFTER,
+        seed: int = None,
+    ):
+        self.archive = archive or Archive()
+        self.latency = latency
+        self.rate_429 = rate_429
+        self.retry_after = retry_after
+        self.counts = Counter()
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer((host, port), StandInHandler)
+        self._server.daemon_threads = True
+        self._server.stand_in = self
+        self._thread = None
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def answer(self) -> int:
+        """Wait out the latency, 429 or 200 for the next request."""
+        if self.latency:
+            time.sleep(self.latency)
+        with self._lock:
+            if self._random.random() < self.rate_429:
+                self.counts[429] += 1
+                return 429
+        return 200
+
+    def count(self, status: int) -> None:
+        with self._lock:
+            self.counts[status] += 1
+
+    def start(self) -> "StandInServer":
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        logger.info("Serving %s at %s", self.archive.root, self.url)
+        return self
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+        if self._thread is not None:
+            self._thread.join()
+
+    def __enter__(self) -> "StandInServer":
+        return self.start()
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
+
+
+def parse_args(args: list = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Record fbref and replay it.")
+    parser.add_argument("--archive", default=ARCHIVE_DIR)
+    commands = parser.add_subparsers(dest="command", required=True)
+    record_parser = commands.add_parser("record", help="record seasons' pages")
+    record_parser.add_argument("year_range")
+    record_parser.add_argument(
+        "--league",
+        dest="leagues",
+        type=league,
+        action="append",
+        help="country or country:tier, repeat it for more, default every league",
+    )
+    serve_parser = commands.add_parser("serve", help="serve the archive")
+    serve_parser.add_argument("--host", default=HOST)
+    serve_parser.add_argument("--port", type=int, default=PORT)
+    serve_parser.add_argument("--latency", type=float, default=0.0)
+    serve_parser.add_argument("--rate-429", type=float, default=0.0)
+    serve_parser.add_argument("--seed", type=int, default=None)
+    return parser.parse_args(args)
+
+
+def main(args: list = None) -> int:
+    options = parse_args(args)
+    logging.basicConfig(level=logging.INFO)
+    archive = Archive(options.archive)
+    if options.command == "record":
+        failed = record_seasons(options.year_range, options.leagues, archive)
+        return 1 if failed else 0
+
+    server = StandInServer(
+        archive,
+        host=options.host,
+        port=options.port,
+        latency=options.latency,
+        rate_429=options.rate_429,
+        seed=options.seed,
+    )
+    server.start()
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        server.stop()
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,266 @@
+# dtypes of the season tables
+import logging
+from dataclasses import dataclass, field
+from functools import cached_property
+
+import numpy as np
+import pandas as pd
+
+from footballdata.teams import TEAM_ID
+
+logger = logging.getLogger(__name__)
+
+COUNT, WIDE_COUNT, RATE, CATEGORY, TEXT, KEY = (
+    "count",
+    "wide_count",
+    "rate",
+    "category",
+    "text",
+    "key",
+)
+# Int dtypes of the counts, narrowest first. Counts with missing values get
+# the nullable version of the dtype (int16 -> Int16).
+INT_DTYPES = ["int16", "int32", "int64"]
+RATE_DTYPE = "float32"
+# Surrogate keys of the registries, e.g. teams.TEAM_ID
+KEY_DTYPE = "int32"
+OPP_SUFFIX = "_Opp"
+
+
+def _stat_name(name: str) -> str:
+    while name.endswith(OPP_SUFFIX):
+        name = name[: -len(OPP_SUFFIX)]
+    return name
+
+
+def count_dtype(values: np.ndarray, dtype: str = INT_DTYPES[0], column=None) -> str:
+    """dtype, or a wider one when the (non NaN) values don't fit in it."""
+    if not len(values):
+        return dtype
+    low, high = values.min(), values.max()
+    for candidate in INT_DTYPES[INT_DTYPES.index(dtype) :]:
+        info = np.iinfo(candidate)
+        if info.min <= low and high <= info.max:
+            break
+    if candidate != dtype:
+        logger.warning(
+            "%s doesn't fit in %s, storing it as %s", column, dtype, candidate
+        )
+    return candidate
+
+
+@dataclass(frozen=True)
+class TableSchema:
+    """The kind of each column of a table type.
+
+    Opposition stats share the kind of the stat, "Gls_Opp" is "Gls".
+    Columns that aren't declared are a count when their dtype is int, a rate
+    when it's numeric or kept as they are, unless the schema has a default.
+
+    :counts: Stats stored as int16
+    :wide_counts: Stats stored as int32, e.g. distances in yards
+    :rates: Stats stored as float32
+    :categories: Stats stored as categoricals
+    :texts: Stats kept as str
+    :keys: Integer keys of a registry stored as int32, the team_id of every
+        table
+    :groups: {group: kind} of the two level headers, overrides the kind of
+        their stats e.g. ("Per_90_Minutes", "Gls") is a rate with Gls a count
+    :default: Kind of the columns that aren't declared
+    """
+
+    counts: tuple = ()
+    wide_counts: tuple = ()
+    rates: tuple = ()
+    categories: tuple = ()
+    texts: tuple = ()
+    keys: tuple = (TEAM_ID,)
+    groups: dict = field(default_factory=dict)
+    default: str = None
+
+    @cached_property
+    def kinds(self) -> dict[str, str]:
+        kinds = {}
+        for kind, names in (
+            (COUNT, self.counts),
+            (WIDE_COUNT, self.wide_counts),
+            (RATE, self.rates),
+            (CATEGORY, self.categories),
+            (TEXT, self.texts),
+            (KEY, self.keys),
+        ):
+            kinds.update(dict.fromkeys(names, kind))
+        return kinds
+
+    def kind(self, column, dtype: np.dtype) -> str:
+        if isinstance(column, tuple):
+            kind = self.groups.get(column[0])
+            # ("team_id", "") of the two level headers is team_id
+            column = column[-1] or column[0]
+        else:
+            kind = None
+        kind = kind or self.kinds.get(_stat_name(str(column)))
+        if kind is not None:
+            return kind
+        if self.default is not None:
+            return self.default
+        if pd.api.types.is_integer_dtype(dtype):
+            return COUNT
+        if pd.api.types.is_numeric_dtype(dtype):
+            return RATE
+        return TEXT
+
+    def apply(self, df: pd.DataFrame) -> pd.DataFrame:
+        """A copy of df with the schema's dtypes, the squad index as categorical.
+
+        Columns of the same numpy dtype are stored together in one block.
+        """
+        data = {}
+        for position, values in enumerate(column_arrays(df)):
+            column = df.columns[position]
+            data[position] = cast(values, self.kind(column, values.dtype), column)
+        typed = pd.DataFrame(data, index=df.index)
+        typed.columns = df.columns
+        if not isinstance(typed.index, pd.MultiIndex) and typed.index.dtype == object:
+            typed.index = pd.CategoricalIndex(typed.index, name=typed.index.name)
+
+        return typed
+
+
+def column_arrays(df: pd.DataFrame) -> list[np.ndarray]:
+    """The values of each column of df, as views of one array per dtype."""
+    arrays = [None] * len(df.columns)
+    dtypes = df.dtypes.to_numpy()
+    for dtype in set(dtypes):
+        positions = np.flatnonzero(dtypes == dtype)
+        values = df.iloc[:, positions].to_numpy()
+        for offset, position in enumerate(positions):
+            arrays[position] = values[:, offset]
+    return arrays
+
+
+def cast(values: np.ndarray, kind: str, column=None):
+    """The values as kind, counts with missing values are nullable ints."""
+    if kind == TEXT:
+        return values
+    if kind == CATEGORY:
+        return pd.Categorical(values)
+    if kind == KEY:
+        return values.astype(KEY_DTYPE)
+    if values.dtype == object:
+        values = pd.to_numeric(values, errors="coerce")
+    if kind not in (COUNT, WIDE_COUNT):
+        return values.astype(RATE_DTYPE)
+
+    dtype = INT_DTYPES[0] if kind == COUNT else INT_DTYPES[1]
+    if pd.api.types.is_integer_dtype(values.dtype):
+        return values.astype(count_dtype(values, dtype, column))
+    missing = np.isnan(values)
+    present = values[~missing]
+    if (present != np.floor(present)).any():
+        logger.warning("%s isn't a count, storing it as a rate", column)
+        return values.astype(RATE_DTYPE)
+    dtype = count_dtype(present, dtype, column)
+    if missing.any():
+        return pd.arrays.IntegerArray(
+            np.where(missing, 0, values).astype(dtype), missing
+        )
+    return values.astype(dtype)
+
+
+HOME_AWAY_SCHEMA = TableSchema(
+    counts=("MP", "W", "D", "L", "GF", "GA", "GD", "Pts"),
+    rates=("Pts/MP", "xG", "xGA", "xGD", "xGD/90"),
+)
+
+# Schema of each table of get_single_season_league_data
+SCHEMAS = {
+    "standings_table": TableSchema(
+        counts=("Rk", "MP", "W", "D", "L", "GF", "GA", "GD", "Pts", "M_G_Indv"),
+        wide_counts=("Attendance",),
+        rates=("Pts/MP", "xG", "xGA", "xGD", "xGD/90"),
+        categories=("Squad",),
+        texts=("Last 5",),
+    ),
+    "home_away": TableSchema(
+        counts=("Rk",) + HOME_AWAY_SCHEMA.counts,
+        rates=HOME_AWAY_SCHEMA.rates,
+        categories=("Squad", "Venue"),
+    ),
+    "home": HOME_AWAY_SCHEMA,
+    "away": HOME_AWAY_SCHEMA,
+    "h-a": HOME_AWAY_SCHEMA,
+    # Ratios of the home and away stats
+    "h_div_a": TableSchema(default=RATE),
+    "standard_data": TableSchema(
+        counts=("Gls", "Ast", "G+A", "G-PK", "G+A-PK", "PK", "PKatt", "CrdY", "CrdR"),
+        rates=("xG", "npxG", "xAG", "xG+xAG", "npxG+xAG"),
+        groups={"Per_90_Minutes": RATE, "Expected": RATE},
+    ),
+    "gk_overall": TableSchema(
+        counts=("GA", "SoTA", "Saves", "CS", "PKatt", "PKA", "PKsv", "PKm"),
+        rates=("GA90", "Save%", "CS%"),
+    ),
+    "gk_advanced": TableSchema(
+        counts=("GA", "PKA", "FK", "CK", "OG", "Cmp", "Att", "Thr", "Opp", "Stp"),
+        rates=(
+            "PSxG",
+            "PSxG/SoT",
+            "PSxG+/-",
+            "/90",
+            "Cmp%",
+            "Launch%",
+            "AvgLen",
+            "Stp%",
+            "#OPA/90",
+            "AvgDist",
+        ),
+    ),
+    "shooting": TableSchema(
+        counts=("Gls", "Sh", "SoT", "FK", "PK", "PKatt"),
+        rates=(
+            "SoT%",
+            "Sh/90",
+            "SoT/90",
+            "G/Sh",
+            "G/SoT",
+            "Dist",
+            "xG",
+            "npxG",
+            "npxG/Sh",
+            "G-xG",
+            "np:G-xG",
+        ),
+    ),
+    "passing": TableSchema(
+        counts=("Ast", "KP", "PPA", "CrsPA", "Prog"),
+        wide_counts=("Cmp", "Att", "TotDist", "PrgDist"),
+        rates=("Cmp%", "xAG", "xA", "A-xAG"),
+    ),
+    "pass_types": TableSchema(
+        counts=("Dead", "FK", "TB", "Sw", "Crs", "TI", "CK", "In", "Out", "Str"),
+        wide_counts=("Live", "Cmp"),
+    ),
+    "gca": TableSchema(
+        counts=("SCA", "PassLive", "PassDead", "Drib", "Sh", "Fld", "Def", "GCA"),
+        rates=("SCA90", "GCA90"),
+    ),
+    "defensive_actions": TableSchema(
+        counts=("Tkl", "TklW", "Def_3rd", "Mid_3rd", "Att_3rd", "Att", "Past"),
+        rates=("Tkl%",),
+    ),
+    "possession": TableSchema(
+        counts=("Def_Pen", "Def_3rd", "Mid_3rd", "Att_3rd", "Att_Pen", "Succ", "Att"),
+        wide_counts=("Touches", "Live", "Rec"),
+        rates=("Succ%",),
+    ),
+    "other": TableSchema(
+        counts=("CrdY", "CrdR", "2CrdY", "Fls", "Fld", "Off", "Crs", "PKwon"),
+        rates=("Won%",),
+    ),
+}
+
+
+def apply_schema(table: str, df: pd.DataFrame) -> pd.DataFrame:
+    """df with the dtypes of its table's schema, inferred when it has none."""
+    return SCHEMAS.get(table, TableSchema()).apply(df)
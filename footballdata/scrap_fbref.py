@@ -1,42 +1,284 @@
-import requests
-from bs4 import BeautifulSoup
-
-from footballdata.settings import leagues
-
-
-# function to extract html document from given url
-def getHTMLdocument(url):
-    # request for HTML document of given url
-    response = requests.get(url)
-
-    # response will be provided in JSON format
-    return response.text
-
-
-my_dict = {}
-
-for country in leagues:
-    national_divisions = leagues[country]
-    for tier in national_divisions:
-        year = 1980
-        tier_id = national_divisions[tier]["id"]
-        print(f"Getting player data for {national_divisions[tier]['name']}")
-
-        while year < 2023:
-            url = f"https://fbref.com/en/comps/{tier_id}/{year}-{year+1}/stats/"
-            year += 1
-            html_document = getHTMLdocument(url)
-            soup = BeautifulSoup(html_document, "html.parser")
-            print(f"Season {year}-{year+1}")
-            for tr in soup.find_all("table"):
-                tds = tr.find_all("td")
-                for td in tds:
-                    if td.get("data-append-csv"):
-                        player_url = td.find("a").get("href")
-                        pl_list = player_url.split("/")
-                        player_id = pl_list[3]
-                        player_name = pl_list[4]
-                        if player_name in my_dict.keys():
-                            continue
-                        my_dict[player_name] = {"id": player_id, "url": player_url}
-        print(f"{'='*80}")
+# Crawler of the players of every league's seasons
+import asyncio
+import logging
+import sqlite3
+import time
+from pathlib import Path
+
+from lxml import etree, html as lxml_html
+
+from footballdata.cache import HTMLCache, html_cache, season_ttl
+from footballdata.fetch import (
+    MIN_REQUEST_INTERVAL,
+    RequestScheduler,
+    get_html,
+    request_scheduler,
+)
+from footballdata.leagues import league_registry
+from footballdata.players import PlayerRegistry, player_registry
+from footballdata.seasons import season
+from footballdata.settings import PLAYER_STATS_URL
+
+logger = logging.getLogger(__name__)
+
+FRONTIER_DB = Path("./.crawl_frontier.sqlite")
+FIRST_YEAR = 1980
+LAST_YEAR = 2023
+CONCURRENCY = 4
+# Requests per second, fbref's own limit
+REQUEST_RATE = 1 / MIN_REQUEST_INTERVAL
+MAX_ATTEMPTS = 3
+
+PENDING, IN_PROGRESS, DONE, FAILED = "pending", "in_progress", "done", "failed"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS frontier (
+    url TEXT PRIMARY KEY,
+    year INTEGER NOT NULL,
+    status TEXT NOT NULL DEFAULT 'pending',
+    attempts INTEGER NOT NULL DEFAULT 0,
+    players INTEGER,
+    updated_at REAL
+);
+CREATE INDEX IF NOT EXISTS frontier_status ON frontier(status);
+"""
+
+PLAYER_CELLS = "//td[@data-append-csv] | //th[@data-append-csv]"
+
+
+class Frontier:
+    """The urls left to crawl, kept in an SQLite file so a crawl can resume.
+
+    Urls claimed by a crawl that died, or that failed fewer than max_attempts
+    times in earlier crawls, are pending again when it's reopened. Urls are
+    claimed by their number of failed attempts, so a url that just failed is
+    retried after the ones that haven't. Attempts add up across crawls, a url
+    that failed max_attempts times stays failed.
+    """
+
+    def __init__(self, path: Path = FRONTIER_DB, max_attempts: int = MAX_ATTEMPTS):
+        self.path = Path(path)
+        self.max_attempts = max_attempts
+        self.connection = sqlite3.connect(self.path)
+        self.connection.executescript(SCHEMA)
+        with self.connection:
+            self.connection.execute(
+                "UPDATE frontier SET status = ? WHERE status = ?",
+                (PENDING, IN_PROGRESS),
+            )
+            self.connection.execute(
+                "UPDATE frontier SET status = ? WHERE status = ? AND attempts < ?",
+                (PENDING, FAILED, max_attempts),
+            )
+
+    def add(self, urls: dict[str, int]) -> None:
+        """Add {url: first year of its season}, known urls are left as they are."""
+        with self.connection:
+            self.connection.executemany(
+                "INSERT OR IGNORE INTO frontier (url, year) VALUES (?, ?)",
+                urls.items(),
+            )
+
+    def claim(self) -> tuple:
+        """The next pending (url, year), None when there is none.
+
+        The ones that failed the fewest times first, in the order they were
+        added.
+        """
+        row = self.connection.execute(
+            "SELECT url, year FROM frontier WHERE status = ? "
+            "ORDER BY attempts, rowid LIMIT 1",
+            (PENDING,),
+        ).fetchone()
+        if row is not None:
+            self._set(row[0], IN_PROGRESS)
+        return row
+
+    def done(self, url: str, players: int) -> None:
+        with self.connection:
+            self.connection.execute(
+                "UPDATE frontier SET status = ?, players = ?, updated_at = ? "
+                "WHERE url = ?",
+                (DONE, players, time.time(), url),
+            )
+
+    def failed(self, url: str, max_attempts: int = None) -> None:
+        """Put the url back in the queue until it fails max_attempts times, the
+        frontier's by default.
+        """
+        max_attempts = max_attempts or self.max_attempts
+        with self.connection:
+            self.connection.execute(
+                "UPDATE frontier SET attempts = attempts + 1, updated_at = ?, "
+                "status = CASE WHEN attempts + 1 >= ? THEN ? ELSE ? END "
+                "WHERE url = ?",
+                (time.time(), max_attempts, FAILED, PENDING, url),
+            )
+
+    def _set(self, url: str, status: str) -> None:
+        with self.connection:
+            self.connection.execute(
+                "UPDATE frontier SET status = ?, updated_at = ? WHERE url = ?",
+                (status, time.time(), url),
+            )
+
+    def counts(self) -> dict[str, int]:
+        return dict(
+            self.connection.execute(
+                "SELECT status, COUNT(*) FROM frontier GROUP BY status"
+            ).fetchall()
+        )
+
+    def close(self) -> None:
+        self.connection.close()
+
+
+class TokenBucket:
+    """Allows rate acquisitions per second on average, bursts of up to capacity."""
+
+    def __init__(self, rate: float = REQUEST_RATE, capacity: int = 1):
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(
+                    self.capacity, self._tokens + (now - self._updated) * self.rate
+                )
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+
+
+def season_urls(first_year: int = FIRST_YEAR, last_year: int = LAST_YEAR) -> dict:
+    """{player stats url: year} of every league's seasons in the year range."""
+    return {
+        PLAYER_STATS_URL.format(league.id, season(year).name): year
+        for league in league_registry
+        for year in range(first_year, last_year)
+    }
+
+
+def parse_players(html: str) -> dict[str, dict]:
+    """{player name: {"id", "url"}} of the data-append-csv cells of a page.
+
+    fbref hides most of its tables in HTML comments, those are read as well.
+    """
+    document = lxml_html.fromstring(html)
+    cells = document.xpath(PLAYER_CELLS)
+    for comment in document.iter(etree.Comment):
+        if "data-append-csv" in (comment.text or ""):
+            cells += lxml_html.fromstring(f"<div>{comment.text}</div>").xpath(
+                PLAYER_CELLS
+            )
+
+    players = {}
+    for cell in cells:
+        links = cell.findall("a")
+        if not links:
+            continue
+        player_url = links[0].get("href")
+        pl_list = player_url.split("/")
+        if len(pl_list) < 5:
+            continue
+        player_id = pl_list[3]
+        player_name = pl_list[4]
+        players.setdefault(player_name, {"id": player_id, "url": player_url})
+
+    return players
+
+
+def fetch_players(
+    url: str, ttl: float, scheduler: RequestScheduler, cache: HTMLCache
+) -> dict[str, dict]:
+    return parse_players(get_html(url, scheduler=scheduler, cache=cache, ttl=ttl))
+
+
+async def crawl(
+    frontier: Frontier,
+    registry: PlayerRegistry = player_registry,
+    concurrency: int = CONCURRENCY,
+    bucket: TokenBucket = None,
+    scheduler: RequestScheduler = request_scheduler,
+    cache: HTMLCache = html_cache,
+) -> dict[str, int]:
+    """Crawl the frontier's pending urls, adding the players found to the registry.
+
+    Up to concurrency pages are fetched and parsed at a time, in threads, and
+    the bucket spaces out the requests. They're sent through the scheduler,
+    the one every fetch shares by default. The players of each page are stored
+    before its url is marked done, so a crash loses nothing.
+    Players already in the registry are left as they are.
+
+    Returns the frontier's counts of urls per status.
+    """
+    bucket = bucket or TokenBucket()
+    # The bucket paces the workers, the shared scheduler keeps the crawl within
+    # the requests per minute of every other fetch, backs off after 429s and
+    # records the failures. The frontier keeps the urls that failed.
+
+    async def worker():
+        while True:
+            claimed = frontier.claim()
+            if claimed is None:
+                return
+            url, year = claimed
+            await bucket.acquire()
+            try:
+                players = await asyncio.to_thread(
+                    fetch_players, url, season_ttl(year), scheduler, cache
+                )
+            except Exception as exc:  # pylint: disable=broad-except
+                logger.error("Crawling %s failed: %s", url, exc)
+                frontier.failed(url)
+                continue
+            new_players = {
+                name: player for name, player in players.items() if name not in registry
+            }
+            registry.update(new_players)
+            frontier.done(url, len(players))
+            logger.info("%s: %d players, %d new", url, len(players), len(new_players))
+
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+
+    return frontier.counts()
+
+
+def crawl_players(
+    first_year: int = FIRST_YEAR,
+    last_year: int = LAST_YEAR,
+    frontier_path: Path = FRONTIER_DB,
+    registry: PlayerRegistry = player_registry,
+    concurrency: int = CONCURRENCY,
+    rate: float = REQUEST_RATE,
+) -> dict[str, int]:
+    """Crawl the players of every league's seasons from first_year to last_year.
+
+    Rerunning it resumes an interrupted crawl, the urls already crawled are
+    skipped and the ones that failed fewer than MAX_ATTEMPTS times retried.
+    """
+    frontier = Frontier(frontier_path)
+    try:
+        frontier.add(season_urls(first_year, last_year))
+        return asyncio.run(
+            crawl(
+                frontier,
+                registry=registry,
+                concurrency=concurrency,
+                bucket=TokenBucket(rate),
+            )
+        )
+    finally:
+        frontier.close()
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    print(crawl_players())
@@ -0,0 +1,75 @@
+# Seasons, built once per year and shared
+from datetime import datetime
+from functools import lru_cache
+from typing import NamedTuple
+
+FIRST_DATA_YEAR = 1888
+
+
+class Season(NamedTuple):
+    """A season, by the calendar year it starts in."""
+
+    start: int
+    name: str  # "2022-2023"
+
+    @property
+    def end(self) -> int:
+        return self.start + 1
+
+    def __str__(self) -> str:
+        return self.name
+
+
+@lru_cache(maxsize=None)
+def _season(year: int) -> Season:
+    if len(str(year)) != 4:
+        raise KeyError("The value of year should be a 4 digit number")
+    if year < FIRST_DATA_YEAR or year > datetime.now().year:
+        raise KeyError(f"No football data for {year}")
+
+    return Season(year, f"{year}-{year + 1}")
+
+
+def season(year: int) -> Season:
+    """The season starting in year, an int or its str.
+
+    Validated and built on the first call for a year, then shared.
+    """
+    if not isinstance(year, int):
+        try:
+            year = int(year)
+        except TypeError as exc:
+            raise TypeError(
+                f"Year value should be an int, or str you entered {year} which is {type(year)}."
+            ) from exc
+    return _season(year)
+
+
+@lru_cache(maxsize=256)
+def _season_range(year_range: str) -> tuple:
+    years = year_range.split("-")
+    if len(years) <= 1:
+        raise KeyError("Year range input should look like this: '2010-2020'")
+    start_year = int(years[0])
+    end_year = int(years[1])
+    if start_year >= end_year:
+        raise KeyError(
+            "First year of a year range can't be greater or equal to the last year"
+        )
+    return tuple(range(start_year, end_year))
+
+
+def season_years(year_range: str) -> tuple:
+    """First years of the seasons in a year range, "2010-2013" -> (2010, 2011, 2012)
+
+    Parsed once per year range.
+    """
+    if not isinstance(year_range, str):
+        raise TypeError(f"{year_range} is not a string.")
+    return _season_range(year_range)
+
+
+def season_range(year_range: str):
+    """The Seasons of a year range, "2010-2012" -> 2010-2011, 2011-2012"""
+    for year in season_years(year_range):
+        yield season(year)
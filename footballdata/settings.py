@@ -1,6 +1,49 @@
+import os
+from functools import lru_cache
+from pathlib import Path
+
 #### URLS ####
 
-LEAGUE_URL = "https://fbref.com/en/comps/{}/{}/"
+# fbref, or a stand-in serving recorded pages offline (footballdata.replay)
+# e.g. FOOTBALLDATA_FBREF_URL=http://127.0.0.1:8000
+FBREF_URL = os.environ.get("FOOTBALLDATA_FBREF_URL", "https://fbref.com").rstrip("/")
+LEAGUE_URL = FBREF_URL + "/en/comps/{}/{}/"
+# Player stats of a league's season, every player who played in it
+PLAYER_STATS_URL = FBREF_URL + "/en/comps/{}/{}/stats/"
+
+#### Storage ####
+
+# Root of the stored season tables, {country}/{tier}/{season}/{table}
+FRAMES_DIR = Path("./frames")
+# Every table of a season packed in one workbook, a sheet per table
+SEASON_WORKBOOK = "season.xlsx"
+
+# Ids of the tables of a league's season page, some of them are inside
+# HTML comments. The standings ids include the season and the league id.
+SEASON_TABLE_IDS = {
+    "standings": "results*_overall",
+    "home_away": "results*_home_away",
+    "standard_for": "stats_squads_standard_for",
+    "standard_against": "stats_squads_standard_against",
+    "keeper_for": "stats_squads_keeper_for",
+    "keeper_against": "stats_squads_keeper_against",
+    "keeper_adv_for": "stats_squads_keeper_adv_for",
+    "keeper_adv_against": "stats_squads_keeper_adv_against",
+    "shooting_for": "stats_squads_shooting_for",
+    "shooting_against": "stats_squads_shooting_against",
+    "passing_for": "stats_squads_passing_for",
+    "passing_against": "stats_squads_passing_against",
+    "passing_types_for": "stats_squads_passing_types_for",
+    "passing_types_against": "stats_squads_passing_types_against",
+    "gca_for": "stats_squads_gca_for",
+    "gca_against": "stats_squads_gca_against",
+    "defense_for": "stats_squads_defense_for",
+    "defense_against": "stats_squads_defense_against",
+    "possession_for": "stats_squads_possession_for",
+    "possession_against": "stats_squads_possession_against",
+    "misc_for": "stats_squads_misc_for",
+    "misc_against": "stats_squads_misc_against",
+}
 
 fc_ids = {
     "Manchester Utd": {
@@ -93,7 +136,10 @@ leagues = {
     },
 }
 
-#### Players Dictionary Format ####
+#### Players ####
+# The players are shipped in assets/players.sqlite, look them up with
+# footballdata.players.player_registry. A crawl writes them to a copy of it,
+# ./.players.sqlite or FOOTBALLDATA_PLAYERS_DB. Format of a player:
 # "Player-Name": {
 #     "id": "player_id",
 #     "url": "player_url",
@@ -105,37196 +151,16 @@ leagues = {
 # TODO: Get the URL
 # TODO: Create career dictionary
 
-players = {
-    "Nabil-Abidallah": {
-        "id": "e32b9fc3",
-        "nationality": ["nl"],
-        "position": ["MF"],
-        "birth_year": 1982,
-    },
-    "Clarence-Acu\u00f1a": {
-        "id": "cbf4c181",
-        "nationality": ["cl"],
-        "position": ["MF"],
-        "birth_year": 1975,
-    },
-    "Tony-Adams": {
-        "id": "26b5e727",
-        "nationality": ["eng"],
-        "position": ["DF"],
-        "birth_year": 1966,
-    },
-    "Ade-Akinbiyi": {
-        "id": "6a723914",
-        "nationality": ["ng"],
-        "position": ["FW"],
-        "birth_year": 1974,
-    },
-    "Rati-Aleksidze": {
-        "id": "c4e7060b",
-        "nationality": ["ge"],
-        "position": ["FW"],
-        "birth_year": 1978,
-    },
-    "Niclas-Alexandersson": {
-        "id": "8fce0898",
-        "nationality": ["se"],
-        "position": ["MF"],
-        "birth_year": 1971,
-    },
-    "Danny-Allsopp": {
-        "id": "e8b96a8a",
-        "nationality": ["au"],
-        "position": ["FW"],
-        "birth_year": 1978,
-    },
-    "John-Aloisi": {
-        "id": "747e3a0d",
-        "nationality": ["au"],
-        "position": ["FW"],
-        "birth_year": 1976,
-    },
-    "Shola-Ameobi": {
-        "id": "e79a368b",
-        "nationality": ["ng"],
-        "position": ["FW"],
-        "birth_year": 1981,
-    },
-    "Darren-Anderton": {
-        "id": "09cebe50",
-        "nationality": ["eng"],
-        "position": ["MF"],
-        "birth_year": 1972,
-    },
-    "Tore-Andr\u00e9-Flo": {
-        "id": "83e490ef",
-        "nationality": ["no"],
-        "position": ["FW"],
-        "birth_year": 1973,
-    },
-    "Julio-Arca": {
-        "id": "7ac25aa9",
-        "nationality": ["ar"],
-        "position": ["DF", "MF"],
-        "birth_year": 1981,
-    },
-    "Alun-Armstrong": {
-        "id": "36cbc674",
-        "nationality": ["eng"],
-        "position": ["FW"],
-        "birth_year": 1975,
-    },
-    "Chris-Armstrong": {
-        "id": "effa559a",
-        "nationality": ["eng"],
-        "position": ["FW"],
-        "birth_year": 1971,
-    },
-    "Peter-Atherton": {
-        "id": "1bcd6fc7",
-        "nationality": ["eng"],
-        "position": ["DF", "MF"],
-        "birth_year": 1970,
-    },
-    "Celestine-Babayaro": {
-        "id": "dd4e6b97",
-        "nationality": ["ng"],
-        "position": ["DF", "MF"],
-        "birth_year": 1978,
-    },
-    "Markus-Babbel": {
-        "id": "b59f0646",
-        "nationality": ["de"],
-        "position": ["DF"],
-        "birth_year": 1972,
-    },
-    "Karim-Bagheri": {
-        "id": "a06cda05",
-        "nationality": ["ir"],
-        "position": ["MF"],
-        "birth_year": 1974,
-    },
-    "Eirik-Bakke": {
-        "id": "5a10a72e",
-        "nationality": ["no"],
-        "position": ["MF"],
-        "birth_year": 1977,
-    },
-    "Michael-Ball": {
-        "id": "cde17c0f",
-        "nationality": ["eng"],
-        "position": ["DF"],
-        "birth_year": 1979,
-    },
-    "Nick-Barmby": {
-        "id": "4af0a400",
-        "nationality": ["eng"],
-        "position": ["FW", "MF"],
-        "birth_year": 1974,
-    },
-    "Gareth-Barry": {
-        "id": "7dbbe367",
-        "nationality": ["eng"],
-        "position": ["MF"],
-        "birth_year": 1981,
-    },
-    "Fabien-Barthez": {
-        "id": "321646f0",
-        "nationality": ["fr"],
-        "position": ["GK"],
-        "birth_year": 1971,
-    },
-    "Shaun-Bartlett": {
-        "id": "0bbb893d",
-        "nationality": ["za"],
-        "position": ["FW"],
-        "birth_year": 1972,
-    },
-    "Warren-Barton": {
-        "id": "7e732709",
-        "nationality": ["eng"],
-        "position": ["DF"],
-        "birth_year": 1969,
-    },
-    "Christian-Bassedas": {
-        "id": "09f71b6d",
-        "nationality": ["ar"],
-        "position": ["DF", "MF"],
-        "birth_year": 1973,
-    },
-    "Christian-Bassila": {
-        "id": "72365bf5",
-        "nationality": ["fr"],
-        "position": ["DF", "MF"],
-        "birth_year": 1977,
-    },
-    "David-Batty": {
-        "id": "21b2e37b",
-        "nationality": ["eng"],
-        "position": ["MF"],
-        "birth_year": 1968,
-    },
-    "Peter-Beagrie": {
-        "id": "edcefdc4",
-        "nationality": ["eng"],
-        "position": ["FW"],
-        "birth_year": 1965,
-    },
-    "James-Beattie": {
-        "id": "7c881089",
-        "nationality": ["eng"],
-        "position": ["FW"],
-        "birth_year": 1978,
-    },
-    "David-Beckham": {
-        "id": "53539318",
-        "nationality": ["eng"],
-        "position": ["MF"],
-        "birth_year": 1975,
-    },
-    "Craig-Bellamy": {
-        "id": "b9eae55b",
-        "nationality": ["wls"],
-        "position": ["FW"],
-        "birth_year": 1979,
-    },
-    "Francis-Benali": {
-        "id": "91950851",
-        "nationality": ["eng"],
-        "position": ["DF"],
-        "birth_year": 1968,
-    },
-    "Trevor-Benjamin": {
-        "id": "c5328061",
-        "nationality": ["jm"],
-        "position": ["FW"],
-        "birth_year": 1979,
-    },
-    "Marlon-Beresford": {
-        "id": "d68e864b",
-        "nationality": ["eng"],
-        "position": ["GK"],
-        "birth_year": 1969,
-    },
-    "Henning-Berg": {
-        "id": "ad77f84e",
-        "nationality": ["no"],
-        "position": ["DF"],
-        "birth_year": 1969,
-    },
-    "Patrik-Berger": {
-        "id": "f16325b3",
-        "nationality": ["cz"],
-        "position": ["MF"],
-        "birth_year": 1973,
-    },
-    "Dennis-Bergkamp": {
-        "id": "d8703fda",
-        "nationality": ["nl"],
-        "position": ["FW"],
-        "birth_year": 1969,
-    },
-    "Robert-Betts": {
-        "id": "2e362184",
-        "nationality": ["eng"],
-        "position": ["MF"],
-        "birth_year": 1981,
-    },
-    "Igor-Bi\u0161\u0107an": {
-        "id": "3597a728",
-        "nationality": ["hr"],
-        "position": ["DF", "MF"],
-        "birth_year": 1978,
-    },
-    "Ian-Bishop": {
-        "id": "40198f42",
-        "nationality": ["eng"],
-        "position": ["MF"],
-        "birth_year": 1965,
-    },
-    "Robbie-Blake": {
-        "id": "ddc0a1fd",
-        "nationality": ["eng"],
-        "position": ["FW", "MF"],
-        "birth_year": 1976,
-    },
-    "Con-Blatsis": {
-        "id": "78671ba0",
-        "nationality": ["au"],
-        "position": ["DF"],
-        "birth_year": 1977,
-    },
-    "Imants-Bleidelis": {
-        "id": "def622d5",
-        "nationality": ["lv"],
-        "position": ["MF"],
-        "birth_year": 1975,
-    },
-    "George-Boateng": {
-        "id": "a44a9f65",
-        "nationality": ["nl"],
-        "position": ["MF"],
-        "birth_year": 1975,
-    },
-    "Paul-Boertien": {
-        "id": "cfac040d",
-        "nationality": ["eng"],
-        "position": ["DF"],
-        "birth_year": 1979,
-    },
-    "Winston-Bogarde": {
-        "id": "11ddb4b6",
-        "nationality": ["nl"],
-        "position": ["DF"],
-        "birth_year": 1970,
-    },
-    "Lars-Bohinen": {
-        "id": "bdb7e1b5",
-        "nationality": ["no"],
-        "position": ["MF"],
-        "birth_year": 1969,
-    },
-    "Alen-Bok\u0161i\u0107": {
-        "id": "480438da",
-        "nationality": ["hr"],
-        "position": ["FW"],
-        "birth_year": 1970,
-    },
-    "Adam-Bolder": {
-        "id": "0acd3255",
-        "nationality": ["eng"],
-        "position": ["MF"],
-        "birth_year": 1980,
-    },
-    "Andy-Booth": {
-        "id": "bdf267e7",
-        "nationality": ["eng"],
-        "position": ["FW"],
-        "birth_year": 1973,
-    },
-    "Jay-Bothroyd": {
-        "id": "8cdc5afd",
-        "nationality": ["eng"],
-        "position": ["FW"],
-        "birth_year": 1982,
-    },
-    "Steve-Bould": {
-        "id": "42e0fd3a",
-        "nationality": ["eng"],
-        "position": ["DF"],
-        "birth_year": 1962,
-    },
-    "Lee-Bowyer": {
-        "id": "f4fd57ba",
-        "nationality": ["eng"],
-        "position": ["MF"],
-        "birth_year": 1977,
-    },
-    "Titus-Bramble": {
-        "id": "83ac7c3c",
-        "nationality": ["eng"],
-        "position": ["DF"],
-        "birth_year": 1981,
-    },
-    "Keith-Branagan": {
-        "id": "2415cbc7",
-        "nationality": ["ie"],
-        "position": ["GK"],
-        "birth_year": 1966,
-    },
-    "Gary-Breen": {
-        "id": "9922c8b8",
-        "nationality": ["ie"],
-        "position": ["DF"],
-        "birth_year": 1973,
-    },
-    "Wayne-Bridge": {
-        "id": "86b982bc",
-        "nationality": ["eng"],
-        "position": ["DF"],
-        "birth_year": 1980,
-    },
-    "Michael-Bridges": {
-        "id": "a57b3014",
-        "nationality": ["eng"],
-        "position": ["FW", "MF"],
-        "birth_year": 1978,
-    },
-    "Steve-Brown": {
-        "id": "a889aef3",
-        "nationality": ["eng"],
-        "position": ["DF"],
-        "birth_year": 1972,
-    },
-    "Wayne-Brown": {
-        "id": "07748ae2",
-        "nationality": ["eng"],
-        "position": ["DF"],
-        "birth_year": 1977,
-    },
-    "Wes-Brown": {
-        "id": "659ccc97",
-        "nationality": ["eng"],
-        "position": ["DF"],
-        "birth_year": 1979,
-    },
-    "Mark-Burchill": {
-        "id": "376a3b3c",
-        "nationality": ["sct"],
-        "position": ["FW"],
-        "birth_year": 1980,
-    },
-    "Craig-Burley": {
-        "id": "718a4c38",
-        "nationality": ["sct"],
-        "position": ["MF"],
-        "birth_year": 1971,
-    },
-    "Jacob-Burns": {
-        "id": "400a4f05",
-        "nationality": ["au"],
-        "position": ["MF"],
-        "birth_year": 1978,
-    },
-    "Deon-Burton": {
-        "id": "c0567c0f",
-        "nationality": ["jm"],
-        "position": ["FW"],
-        "birth_year": 1976,
-    },
-    "Paul-Butler": {
-        "id": "8623b652",
-        "nationality": ["ie"],
-        "position": ["DF"],
-        "birth_year": 1972,
-    },
-    "Thomas-Butler": {
-        "id": "d033d76b",
-        "nationality": ["ie"],
-        "position": ["MF"],
-        "birth_year": 1981,
-    },
-    "Nicky-Butt": {
-        "id": "616b3f9a",
-        "nationality": ["eng"],
-        "position": ["DF", "MF"],
-        "birth_year": 1975,
-    },
-    "Stephen-Bywater": {
-        "id": "aaa3d97b",
-        "nationality": ["eng"],
-        "position": ["GK"],
-        "birth_year": 1981,
-    },
-    "Danny-Cadamarteri": {
-        "id": "ade643d3",
-        "nationality": ["eng"],
-        "position": ["FW"],
-        "birth_year": 1979,
-    },
-    "Tony-Caig": {
-        "id": "9d257620",
-        "nationality": ["eng"],
-        "position": ["GK"],
-        "birth_year": 1974,
-    },
-    "Steven-Caldwell": {
-        "id": "6839f68e",
-        "nationality": ["sct"],
-        "position": ["DF"],
-        "birth_year": 1980,
-    },
-    "Titi-Camara": {
-        "id": "9a0eee14",
-        "nationality": ["gn"],
-        "position": ["FW"],
-        "birth_year": 1972,
-    },
-    "Andy-Campbell": {
-        "id": "8dde3e19",
-        "nationality": ["eng"],
-        "position": ["FW"],
-        "birth_year": 1979,
-    },
-    "Kevin-Campbell": {
-        "id": "b209e651",
-        "nationality": ["eng"],
-        "position": ["FW"],
-        "birth_year": 1970,
-    },
-    "Sol-Campbell": {
-        "id": "3e3b2fbd",
-        "nationality": ["eng"],
-        "position": ["DF", "FW"],
-        "birth_year": 1974,
-    },
-    "Horacio-Carbonari": {
-        "id": "97d65d43",
-        "nationality": ["ar"],
-        "position": ["DF"],
-        "birth_year": 1974,
-    },
-    "Benito-Carbone": {
-        "id": "ad76f0c4",
-        "nationality": ["it"],
-        "position": ["FW"],
-        "birth_year": 1971,
-    },
-    "Stephen-Carr": {
-        "id": "eb0ae1e9",
-        "nationality": ["ie"],
-        "position": ["DF"],
-        "birth_year": 1976,
-    },
-    "Jamie-Carragher": {
-        "id": "d0ebce19",
-        "nationality": ["eng"],
-        "position": ["DF", "MF"],
-        "birth_year": 1978,
-    },
-    "Michael-Carrick": {
-        "id": "ab7263c1",
-        "nationality": ["eng"],
-        "position": ["MF"],
-        "birth_year": 1981,
-    },
-    "Lee-Carsley": {
-        "id": "8393a60b",
-        "nationality": ["ie"],
-        "position": ["MF"],
-        "birth_year": 1974,
-    },
-    "Patrice-Carteron": {
-        "id": "84609abe",
-        "nationality": ["fr"],
-        "position": ["DF"],
-        "birth_year": 1970,
-    },
-    "Luke-Chadwick": {
-        "id": "9c35f696",
-        "nationality": ["eng"],
-        "position": ["MF"],
-        "birth_year": 1980,
-    },
-    "Gary-Charles": {
-        "id": "c20cb242",
-        "nationality": ["eng"],
-        "position": ["DF"],
-        "birth_year": 1970,
-    },
-    "Laurent-Charvet": {
-        "id": "c317246f",
-        "nationality": ["fr"],
-        "position": ["DF"],
-        "birth_year": 1973,
-    },
-    "Youssef-Chippo": {
-        "id": "62b8d3c9",
-        "nationality": ["ma"],
-        "position": ["MF"],
-        "birth_year": 1973,
-    },
-    "Malcolm-Christie": {
-        "id": "6f5273d9",
-        "nationality": ["eng"],
-        "position": ["FW"],
-        "birth_year": 1979,
-    },
-    "Jamie-Clapham": {
-        "id": "1df59e7b",
-        "nationality": ["eng"],
-        "position": ["DF"],
-        "birth_year": 1975,
-    },
-    "Matt-Clarke": {
-        "id": "673a6776",
-        "nationality": ["eng"],
-        "position": ["GK"],
-        "birth_year": 1973,
-    },
-    "Peter-Clarke": {
-        "id": "9a7bb136",
-        "nationality": ["eng"],
-        "position": ["DF"],
-        "birth_year": 1982,
-    },
-    "Alec-Cleland": {
-        "id": "a9242652",
-        "nationality": ["sct"],
-        "position": ["DF"],
-        "birth_year": 1970,
-    },
-    "Stephen-Clemence": {
-        "id": "31f20410",
-        "nationality": ["eng"],
-        "position": ["MF"],
-        "birth_year": 1978,
-    },
-    "Andy-Cole": {
-        "id": "b6638a2c",
-        "nationality": ["eng"],
-        "position": ["FW"],
-        "birth_year": 1971,
-    },
-    "Ashley-Cole": {
-        "id": "be091289",
-        "nationality": ["eng"],
-        "position": ["DF"],
-        "birth_year": 1980,
-    },
-    "Joe-Cole": {
-        "id": "2c2f117b",
-        "nationality": ["eng"],
-        "position": ["MF"],
-        "birth_year": 1981,
-    },
-    "Stan-Collymore": {
-        "id": "eed4ff30",
-        "nationality": ["eng"],
-        "position": ["FW"],
-        "birth_year": 1971,
-    },
-    "Colin-Cooper": {
-        "id": "42f93b8f",
-        "nationality": ["eng"],
-        "position": ["DF"],
-        "birth_year": 1967,
-    },
-    "James-Coppinger": {
-        "id": "181152ec",
-        "nationality": ["eng"],
-        "position": ["FW", "MF"],
-        "birth_year": 1981,
-    },
-    "Daniel-Cordone": {
-        "id": "a3414fa6",
-        "nationality": ["ar"],
-        "position": ["FW"],
-        "birth_year": 1974,
-    },
-    "Carl-Cort": {
-        "id": "c07f2109",
-        "nationality": ["gy"],
-        "position": ["FW"],
-        "birth_year": 1977,
-    },
-    "Tony-Cottee": {
-        "id": "111e8515",
-        "nationality": ["eng"],
-        "position": ["FW"],
-        "birth_year": 1965,
-    },
-    "Jody-Craddock": {
-        "id": "573e5dd2",
-        "nationality": ["eng"],
-        "position": ["DF", "MF"],
-        "birth_year": 1975,
-    },
-    "Richard-Cresswell": {
-        "id": "2feffa68",
-        "nationality": ["eng"],
-        "position": ["FW"],
-        "birth_year": 1977,
-    },
-    "Gary-Croft": {
-        "id": "0a7190bb",
-        "nationality": ["eng"],
-        "position": ["DF"],
-        "birth_year": 1974,
-    },
-    "Lee-Crooks": {
-        "id": "810e621b",
-        "nationality": ["eng"],
-        "position": ["DF", "MF"],
-        "birth_year": 1978,
-    },
-    "Mark-Crossley": {
-        "id": "51a772b8",
-        "nationality": ["wls"],
-        "position": ["GK"],
-        "birth_year": 1969,
-    },
-    "Carlo-Cudicini": {
-        "id": "df77463a",
-        "nationality": ["it"],
-        "position": ["GK"],
-        "birth_year": 1973,
-    },
-    "Nikos-Dabizas": {
-        "id": "f8741035",
-        "nationality": ["gr"],
-        "position": ["DF"],
-        "birth_year": 1973,
-    },
-    "Olivier-Dacourt": {
-        "id": "3a114b3c",
-        "nationality": ["fr"],
-        "position": ["MF"],
-        "birth_year": 1974,
-    },
-    "Christian-Dailly": {
-        "id": "0210c453",
-        "nationality": ["sct"],
-        "position": ["DF"],
-        "birth_year": 1973,
-    },
-    "Samuele-Dalla-Bona": {
-        "id": "70a59026",
-        "nationality": ["it"],
-        "position": ["MF"],
-        "birth_year": 1981,
-    },
-    "Tomas-Danilevi\u010dius": {
-        "id": "974a22ea",
-        "nationality": ["lt"],
-        "position": ["FW"],
-        "birth_year": 1978,
-    },
-    "Calum-Davenport": {
-        "id": "8f59901c",
-        "nationality": ["eng"],
-        "position": ["DF"],
-        "birth_year": 1983,
-    },
-    "Callum-Davidson": {
-        "id": "6bcf5daf",
-        "nationality": ["sct"],
-        "position": ["DF"],
-        "birth_year": 1976,
-    },
-    "Kevin-Davies": {
-        "id": "2f726a89",
-        "nationality": ["eng"],
-        "position": ["FW"],
-        "birth_year": 1977,
-    },
-    "Simon-Davies": {
-        "id": "522b6d6c",
-        "nationality": ["wls"],
-        "position": ["MF"],
-        "birth_year": 1979,
-    },
-    "Aidan-Davison": {
-        "id": "adb9d3d3",
-        "nationality": ["nir"],
-        "position": ["GK"],
-        "birth_year": 1968,
-    },
-    "Gilles-De-Bilde": {
-        "id": "a0339c85",
-        "nationality": ["be"],
-        "position": ["FW"],
-        "birth_year": 1971,
-    },
-    "Brian-Deane": {
-        "id": "909a4bb4",
-        "nationality": ["eng"],
-        "position": ["FW"],
-        "birth_year": 1968,
-    },
-    "Jermain-Defoe": {
-        "id": "f1e8372d",
-        "nationality": ["eng"],
-        "position": ["FW"],
-        "birth_year": 1982,
-    },
-    "Damien-Delaney": {
-        "id": "210d9ecb",
-        "nationality": ["ie"],
-        "position": ["DF"],
-        "birth_year": 1981,
-    },
-    "Mark-Delaney": {
-        "id": "882f42b8",
-        "nationality": ["wls"],
-        "position": ["DF"],
-        "birth_year": 1976,
-    },
-    "Rory-Delap": {
-        "id": "9b0dac73",
-        "nationality": ["ie"],
-        "position": ["MF"],
-        "birth_year": 1976,
-    },
-    "Raimond-van-der-Gouw": {
-        "id": "0d2e1195",
-        "nationality": ["nl"],
-        "position": ["GK"],
-        "birth_year": 1963,
-    },
-    "Marcel-Desailly": {
-        "id": "9dfb97aa",
-        "nationality": ["fr"],
-        "position": ["DF", "MF"],
-        "birth_year": 1968,
-    },
-    "Paolo-Di-Canio": {
-        "id": "9bbe0ecf",
-        "nationality": ["it"],
-        "position": ["FW"],
-        "birth_year": 1968,
-    },
-    "Roberto-Di-Matteo": {
-        "id": "5b390f82",
-        "nationality": ["it"],
-        "position": ["MF"],
-        "birth_year": 1970,
-    },
-    "Kaba-Diawara": {
-        "id": "7bafc1d6",
-        "nationality": ["gn"],
-        "position": ["FW"],
-        "birth_year": 1975,
-    },
-    "Danny-Dichio": {
-        "id": "da431eb0",
-        "nationality": ["eng"],
-        "position": ["FW"],
-        "birth_year": 1974,
-    },
-    "Paul-Dickov": {
-        "id": "1ea43e27",
-        "nationality": ["sct"],
-        "position": ["FW"],
-        "birth_year": 1972,
-    },
-    "Bernard-Diom\u00e8de": {
-        "id": "db14c317",
-        "nationality": ["fr"],
-        "position": ["FW", "MF"],
-        "birth_year": 1974,
-    },
-    "Lee-Dixon": {
-        "id": "b6ba1615",
-        "nationality": ["eng"],
-        "position": ["DF"],
-        "birth_year": 1964,
-    },
-    "Bojan-Djordjic": {
-        "id": "3d5616b6",
-        "nationality": ["se"],
-        "position": ["MF"],
-        "birth_year": 1982,
-    },
-    "Jason-Dodd": {
-        "id": "df15c7a1",
-        "nationality": ["eng"],
-        "position": ["DF"],
-        "birth_year": 1970,
-    },
-    "Gary-Doherty": {
-        "id": "db5c50dd",
-        "nationality": ["ie"],
-        "position": ["DF", "FW"],
-        "birth_year": 1980,
-    },
-    "Didier-Domi": {
-        "id": "91736476",
-        "nationality": ["fr"],
-        "position": ["DF"],
-        "birth_year": 1978,
-    },
-    "Jos\u00e9-Dominguez": {
-        "id": "472117c8",
-        "nationality": ["pt"],
-        "position": ["MF"],
-        "birth_year": 1974,
-    },
-    "Mark-Draper": {
-        "id": "bf597500",
-        "nationality": ["eng"],
-        "position": ["MF"],
-        "birth_year": 1970,
-    },
-    "Michael-Duberry": {
-        "id": "db61b520",
-        "nationality": ["eng"],
-        "position": ["DF"],
-        "birth_year": 1975,
-    },
-    "Dion-Dublin": {
-        "id": "a0886d18",
-        "nationality": ["eng"],
-        "position": ["DF", "FW"],
-        "birth_year": 1969,
-    },
-    "Terry-Dunfield": {
-        "id": "a62c5794",
-        "nationality": ["ca"],
-        "position": ["MF"],
-        "birth_year": 1982,
-    },
-    "Richard-Dunne": {
-        "id": "6cbc015d",
-        "nationality": ["ie"],
-        "position": ["DF"],
-        "birth_year": 1979,
-    },
-    "Kieron-Dyer": {
-        "id": "90b5a2f2",
-        "nationality": ["eng"],
-        "position": ["MF"],
-        "birth_year": 1978,
-    },
-    "Darren-Eadie": {
-        "id": "60d2d491",
-        "nationality": ["eng"],
-        "position": ["MF"],
-        "birth_year": 1975,
-    },
-    "Richard-Edghill": {
-        "id": "8f8263f1",
-        "nationality": ["eng"],
-        "position": ["DF"],
-        "birth_year": 1974,
-    },
-    "Marc-Edworthy": {
-        "id": "fc761a49",
-        "nationality": ["eng"],
-        "position": ["DF"],
-        "birth_year": 1972,
-    },
-    "Trond-Egil-Soltvedt": {
-        "id": "6b5cedc7",
-        "nationality": ["no"],
-        "position": ["MF"],
-        "birth_year": 1967,
-    },
-    "Ugo-Ehiogu": {
-        "id": "bd8d3cd5",
-        "nationality": ["eng"],
-        "position": ["DF"],
-        "birth_year": 1972,
-    },
-    "Marcelino-Elena": {
-        "id": "532df36e",
-        "nationality": ["es"],
-        "position": ["DF"],
-        "birth_year": 1971,
-    },
-    "Matt-Elliott": {
-        "id": "c1033941",
-        "nationality": ["sct"],
-        "position": ["DF"],
-        "birth_year": 1968,
-    },
-    "Steve-Elliott": {
-        "id": "2fc040aa",
-        "nationality": ["eng"],
-        "position": ["DF"],
-        "birth_year": 1978,
-    },
-    "Kevin-Ellison": {
-        "id": "5baecff6",
-        "nationality": ["eng"],
-        "position": ["MF"],
-        "birth_year": 1979,
-    },
-    "Stefano-Eranio": {
-        "id": "a16efcb5",
-        "nationality": ["it"],
-        "position": ["MF"],
-        "birth_year": 1966,
-    },
-    "Matthew-Etherington": {
-        "id": "ef616df9",
-        "nationality": ["eng"],
-        "position": ["MF"],
-        "birth_year": 1981,
-    },
-    "John-Eustace": {
-        "id": "019cf2b4",
-        "nationality": ["eng"],
-        "position": ["MF"],
-        "birth_year": 1979,
-    },
-    "Gareth-Evans": {
-        "id": "abcacc4e",
-        "nationality": ["eng"],
-        "position": ["DF"],
-        "birth_year": 1981,
-    },
-    "Ian-Evatt": {
-        "id": "749bcfb8",
-        "nationality": ["eng"],
-        "position": ["DF"],
-        "birth_year": 1981,
-    },
-    "Les-Ferdinand": {
-        "id": "aad47f5a",
-        "nationality": ["eng"],
-        "position": ["FW"],
-        "birth_year": 1966,
-    },
-    "Rio-Ferdinand": {
-        "id": "52465662",
-        "nationality": ["eng"],
-        "position": ["DF"],
-        "birth_year": 1978,
-    },
-    "Duncan-Ferguson": {
-        "id": "9593e964",
-        "nationality": ["sct"],
-        "position": ["FW"],
-        "birth_year": 1971,
-    },
-    "Albert-Ferrer": {
-        "id": "e70c5725",
-        "nationality": ["es"],
-        "position": ["DF"],
-        "birth_year": 1970,
-    },
-    "Gianluca-Festa": {
-        "id": "1cada5ff",
-        "nationality": ["it"],
-        "position": ["DF"],
-        "birth_year": 1969,
-    },
-    "Mark-Fish": {
-        "id": "71e120b7",
-        "nationality": ["za"],
-        "position": ["DF", "FW"],
-        "birth_year": 1974,
-    },
-    "Curtis-Fleming": {
-        "id": "2b507014",
-        "nationality": ["ie"],
-        "position": ["DF"],
-        "birth_year": 1968,
-    },
-    "Tim-Flowers": {
-        "id": "df3b6e40",
-        "nationality": ["eng"],
-        "position": ["GK"],
-        "birth_year": 1967,
-    },
-    "Jimmy-Floyd-Hasselbaink": {
-        "id": "db8a04d1",
-        "nationality": ["nl"],
-        "position": ["FW"],
-        "birth_year": 1972,
-    },
-    "Craig-Forrest": {
-        "id": "b253de9c",
-        "nationality": ["ca"],
-        "position": ["GK"],
-        "birth_year": 1967,
-    },
-    "Quinton-Fortune": {
-        "id": "fa706d7f",
-        "nationality": ["za"],
-        "position": ["MF"],
-        "birth_year": 1977,
-    },
-    "Robbie-Fowler": {
-        "id": "7cd34266",
-        "nationality": ["eng"],
-        "position": ["FW"],
-        "birth_year": 1975,
-    },
-    "Hayden-Foxe": {
-        "id": "fa38e5ea",
-        "nationality": ["au"],
-        "position": ["DF"],
-        "birth_year": 1977,
-    },
-    "Steffen-Freund": {
-        "id": "80439de1",
-        "nationality": ["de"],
-        "position": ["MF"],
-        "birth_year": 1970,
-    },
-    "Kevin-Gallacher": {
-        "id": "dc257810",
-        "nationality": ["sct"],
-        "position": ["FW", "MF"],
-        "birth_year": 1966,
-    },
-    "Anthony-Gardner": {
-        "id": "0f2da318",
-        "nationality": ["eng"],
-        "position": ["DF"],
-        "birth_year": 1980,
-    },
-    "Paul-Gascoigne": {
-        "id": "56c33229",
-        "nationality": ["eng"],
-        "position": ["MF"],
-        "birth_year": 1967,
-    },
-    "Edu-Gaspar": {
-        "id": "0471f2a2",
-        "nationality": ["br"],
-        "position": ["MF"],
-        "birth_year": 1978,
-    },
-    "Diego-Gavil\u00e1n": {
-        "id": "d177ad67",
-        "nationality": ["py"],
-        "position": ["DF", "MF"],
-        "birth_year": 1980,
-    },
-    "Jason-Gavin": {
-        "id": "692450a7",
-        "nationality": ["ie"],
-        "position": ["DF"],
-        "birth_year": 1980,
-    },
-    "Scot-Gemmill": {
-        "id": "27e0c651",
-        "nationality": ["sct"],
-        "position": ["MF"],
-        "birth_year": 1971,
-    },
-    "Paul-Gerrard": {
-        "id": "fb9646e3",
-        "nationality": ["eng"],
-        "position": ["GK"],
-        "birth_year": 1973,
-    },
-    "Steven-Gerrard": {
-        "id": "caeb5442",
-        "nationality": ["eng"],
-        "position": ["MF"],
-        "birth_year": 1980,
-    },
-    "Kevin-Gibbens": {
-        "id": "91a5db9a",
-        "nationality": ["eng"],
-        "position": ["FW", "MF"],
-        "birth_year": 1979,
-    },
-    "Ryan-Giggs": {
-        "id": "561de8d0",
-        "nationality": ["wls"],
-        "position": ["FW", "MF"],
-        "birth_year": 1973,
-    },
-    "Phil-Gilchrist": {
-        "id": "dfff734f",
-        "nationality": ["eng"],
-        "position": ["DF"],
-        "birth_year": 1973,
-    },
-    "David-Ginola": {
-        "id": "189225b3",
-        "nationality": ["fr"],
-        "position": ["FW", "MF"],
-        "birth_year": 1967,
-    },
-    "Shay-Given": {
-        "id": "0db918ff",
-        "nationality": ["ie"],
-        "position": ["GK"],
-        "birth_year": 1976,
-    },
-    "Stephen-Glass": {
-        "id": "56ce2fd5",
-        "nationality": ["sct"],
-        "position": ["MF"],
-        "birth_year": 1976,
-    },
-    "Shaun-Goater": {
-        "id": "1e14a14f",
-        "nationality": ["bm"],
-        "position": ["FW"],
-        "birth_year": 1970,
-    },
-    "Ed-de-Goey": {
-        "id": "5a7b2f65",
-        "nationality": ["nl"],
-        "position": ["GK"],
-        "birth_year": 1966,
-    },
-    "Alain-Goma": {
-        "id": "92ecd444",
-        "nationality": ["fr"],
-        "position": ["DF"],
-        "birth_year": 1972,
-    },
-    "Andy-Goram": {
-        "id": "9ba8be22",
-        "nationality": ["sct"],
-        "position": ["GK"],
-        "birth_year": 1964,
-    },
-    "Dean-Gordon": {
-        "id": "6405b4da",
-        "nationality": ["eng"],
-        "position": ["DF", "MF"],
-        "birth_year": 1973,
-    },
-    "Richard-Gough": {
-        "id": "791e2a3b",
-        "nationality": ["sct"],
-        "position": ["DF"],
-        "birth_year": 1962,
-    },
-    "Gareth-Grant": {
-        "id": "dbbdc263",
-        "nationality": ["eng"],
-        "position": ["FW"],
-        "birth_year": 1980,
-    },
-    "Tony-Grant": {
-        "id": "e982e153",
-        "nationality": ["eng"],
-        "position": ["MF"],
-        "birth_year": 1974,
-    },
-    "Danny-Granville": {
-        "id": "1ba9184d",
-        "nationality": ["eng"],
-        "position": ["DF"],
-        "birth_year": 1975,
-    },
-    "Thomas-Gravesen": {
-        "id": "b769b5bd",
-        "nationality": ["dk"],
-        "position": ["MF"],
-        "birth_year": 1976,
-    },
-    "Michael-Gray": {
-        "id": "fefae709",
-        "nationality": ["eng"],
-        "position": ["DF", "MF"],
-        "birth_year": 1974,
-    },
-    "Jonathan-Greening": {
-        "id": "892c1d7a",
-        "nationality": ["eng"],
-        "position": ["MF"],
-        "birth_year": 1979,
-    },
-    "Andy-Griffin": {
-        "id": "38517dc5",
-        "nationality": ["eng"],
-        "position": ["DF"],
-        "birth_year": 1979,
-    },
-    "Gilles-Grimandi": {
-        "id": "4eae5f8d",
-        "nationality": ["fr"],
-        "position": ["DF"],
-        "birth_year": 1970,
-    },
-    "Jesper-Gr\u00f8nkj\u00e6r": {
-        "id": "afe43b0f",
-        "nationality": ["dk"],
-        "position": ["FW", "MF"],
-        "birth_year": 1977,
-    },
-    "Iv\u00e1n-Guerrero": {
-        "id": "5421d935",
-        "nationality": ["hn"],
-        "position": ["DF"],
-        "birth_year": 1977,
-    },
-    "Ole-Gunnar-Solskj\u00e6r": {
-        "id": "65cb97b8",
-        "nationality": ["no"],
-        "position": ["FW"],
-        "birth_year": 1973,
-    },
-    "Arnar-Gunnlaugsson": {
-        "id": "3a06ea31",
-        "nationality": ["is"],
-        "position": ["FW", "MF"],
-        "birth_year": 1973,
-    },
-    "Steve-Guppy": {
-        "id": "3c05bb47",
-        "nationality": ["eng"],
-        "position": ["MF"],
-        "birth_year": 1969,
-    },
-    "Ei\u00f0ur-Gu\u00f0johnsen": {
-        "id": "32fc9ff2",
-        "nationality": ["is"],
-        "position": ["FW", "MF"],
-        "birth_year": 1978,
-    },
-    "\u00de\u00f3r\u00f0ur-Gu\u00f0j\u00f3nsson": {
-        "id": "5d10a22f",
-        "nationality": ["is"],
-        "position": ["FW", "MF"],
-        "birth_year": 1973,
-    },
-    "Mustapha-Hadji": {
-        "id": "0b1d0491",
-        "nationality": ["ma"],
-        "position": ["MF"],
-        "birth_year": 1971,
-    },
-    "Alf-Inge-H\u00e5land": {
-        "id": "3ae21039",
-        "nationality": ["no"],
-        "position": ["DF", "MF"],
-        "birth_year": 1972,
-    },
-    "Marcus-Hall": {
-        "id": "10a2c499",
-        "nationality": ["eng"],
-        "position": ["DF"],
-        "birth_year": 1976,
-    },
-    "Gunnar-Halle": {
-        "id": "5c1170da",
-        "nationality": ["no"],
-        "position": ["DF"],
-        "birth_year": 1965,
-    },
-    "Dietmar-Hamann": {
-        "id": "01c05efb",
-        "nationality": ["de"],
-        "position": ["MF"],
-        "birth_year": 1973,
-    },
-    "Jon-Harley": {
-        "id": "1c85d7f3",
-        "nationality": ["eng"],
-        "position": ["DF"],
-        "birth_year": 1979,
-    },
-    "Steve-Harper": {
-        "id": "a98f1d52",
-        "nationality": ["eng"],
-        "position": ["GK"],
-        "birth_year": 1975,
-    },
-    "Ian-Harte": {
-        "id": "fd4fa092",
-        "nationality": ["ie"],
-        "position": ["DF"],
-        "birth_year": 1977,
-    },
-    "John-Hartson": {
-        "id": "10d28fb8",
-        "nationality": ["wls"],
-        "position": ["FW"],
-        "birth_year": 1975,
-    },
-    "Danny-Hay": {
-        "id": "9675179d",
-        "nationality": ["nz"],
-        "position": ["DF"],
-        "birth_year": 1975,
-    },
-    "Magnus-Hedman": {
-        "id": "258a16fd",
-        "nationality": ["se"],
-        "position": ["GK"],
-        "birth_year": 1973,
-    },
-    "Vegard-Heggem": {
-        "id": "b7c6e000",
-        "nationality": ["no"],
-        "position": ["DF", "MF"],
-        "birth_year": 1975,
-    },
-    "St\u00e9phane-Henchoz": {
-        "id": "17476497",
-        "nationality": ["ch"],
-        "position": ["DF"],
-        "birth_year": 1974,
-    },
-    "Lee-Hendrie": {
-        "id": "8716663c",
-        "nationality": ["eng"],
-        "position": ["MF"],
-        "birth_year": 1977,
-    },
-    "Colin-Hendry": {
-        "id": "9acd6d0d",
-        "nationality": ["sct"],
-        "position": ["DF"],
-        "birth_year": 1965,
-    },
-    "Thierry-Henry": {
-        "id": "c0c5ee74",
-        "nationality": ["fr"],
-        "position": ["FW"],
-        "birth_year": 1977,
-    },
-    "Emile-Heskey": {
-        "id": "30184789",
-        "nationality": ["eng"],
-        "position": ["FW"],
-        "birth_year": 1978,
-    },
-    "Tony-Hibbert": {
-        "id": "c878c4bf",
-        "nationality": ["eng"],
-        "position": ["DF"],
-        "birth_year": 1981,
-    },
-    "Danny-Higginbotham": {
-        "id": "688135a1",
-        "nationality": ["gi"],
-        "position": ["DF"],
-        "birth_year": 1978,
-    },
-    "Shaka-Hislop": {
-        "id": "7f44f7dd",
-        "nationality": ["tt"],
-        "position": ["GK"],
-        "birth_year": 1969,
-    },
-    "Thomas-Hitzlsperger": {
-        "id": "2757060a",
-        "nationality": ["de"],
-        "position": ["MF"],
-        "birth_year": 1982,
-    },
-    "Matt-Holland": {
-        "id": "87c9a037",
-        "nationality": ["ie"],
-        "position": ["MF"],
-        "birth_year": 1974,
-    },
-    "Darren-Holloway": {
-        "id": "5b1e1fe8",
-        "nationality": ["eng"],
-        "position": ["DF"],
-        "birth_year": 1977,
-    },
-    "David-Hopkin": {
-        "id": "f411e76b",
-        "nationality": ["sct"],
-        "position": ["MF"],
-        "birth_year": 1970,
-    },
-    "Kevin-Horlock": {
-        "id": "2bd566d6",
-        "nationality": ["nir"],
-        "position": ["MF"],
-        "birth_year": 1972,
-    },
-    "Steve-Howey": {
-        "id": "c1dd78cb",
-        "nationality": ["eng"],
-        "position": ["DF"],
-        "birth_year": 1971,
-    },
-    "Hermann-Hrei\u00f0arsson": {
-        "id": "18e3787e",
-        "nationality": ["is"],
-        "position": ["DF"],
-        "birth_year": 1974,
-    },
-    "Darren-Huckerby": {
-        "id": "906c8f78",
-        "nationality": ["eng"],
-        "position": ["FW", "MF"],
-        "birth_year": 1976,
-    },
-    "Mark-Hudson": {
-        "id": "f47eaa63",
-        "nationality": ["eng"],
-        "position": ["MF"],
-        "birth_year": 1980,
-    },
-    "Aaron-Hughes": {
-        "id": "dccccccc",
-        "nationality": ["nir"],
-        "position": ["DF"],
-        "birth_year": 1979,
-    },
-    "Mark-Hughes": {
-        "id": "b01e9032",
-        "nationality": ["wls"],
-        "position": ["FW"],
-        "birth_year": 1963,
-    },
-    "Stephen-Hughes": {
-        "id": "47bf1b63",
-        "nationality": ["sct"],
-        "position": ["MF"],
-        "birth_year": 1982,
-    },
-    "Andy-Hunt": {
-        "id": "f7856d27",
-        "nationality": ["eng"],
-        "position": ["FW"],
-        "birth_year": 1970,
-    },
-    "Don-Hutchison": {
-        "id": "158494ce",
-        "nationality": ["sct"],
-        "position": ["MF"],
-        "birth_year": 1971,
-    },
-    "Sami-Hyypi\u00e4": {
-        "id": "087b932d",
-        "nationality": ["fi"],
-        "position": ["DF"],
-        "birth_year": 1973,
-    },
-    "Sa\u0161a-Ili\u0107": {"id": "233cc632", "position": ["GK"], "birth_year": 1972},
-    "Andy-Impey": {
-        "id": "67cbd956",
-        "nationality": ["eng"],
-        "position": ["DF", "MF"],
-        "birth_year": 1971,
-    },
-    "Paul-Ince": {
-        "id": "3ce58c27",
-        "nationality": ["eng"],
-        "position": ["MF"],
-        "birth_year": 1967,
-    },
-    "Denis-Irwin": {
-        "id": "9d080c30",
-        "nationality": ["ie"],
-        "position": ["DF"],
-        "birth_year": 1965,
-    },
-    "Steffen-Iversen": {
-        "id": "6454b97e",
-        "nationality": ["no"],
-        "position": ["FW"],
-        "birth_year": 1976,
-    },
-    "Muzzy-Izzet": {
-        "id": "aeeddfc4",
-        "nationality": ["tr"],
-        "position": ["MF"],
-        "birth_year": 1974,
-    },
-    "Richard-Jackson": {
-        "id": "352fcc58",
-        "nationality": ["eng"],
-        "position": ["DF"],
-        "birth_year": 1980,
-    },
-    "Wayne-Jacobs": {
-        "id": "8ff638d4",
-        "nationality": ["eng"],
-        "position": ["DF"],
-        "birth_year": 1969,
-    },
-    "David-James": {
-        "id": "86841dfb",
-        "nationality": ["eng"],
-        "position": ["GK"],
-        "birth_year": 1970,
-    },
-    "Francis-Jeffers": {
-        "id": "21b2c885",
-        "nationality": ["eng"],
-        "position": ["FW"],
-        "birth_year": 1981,
-    },
-    "Claus-Jensen": {
-        "id": "b8f8fb0d",
-        "nationality": ["dk"],
-        "position": ["MF"],
-        "birth_year": 1977,
-    },
-    "Eoin-Jess": {
-        "id": "bb640653",
-        "nationality": ["sct"],
-        "position": ["MF"],
-        "birth_year": 1970,
-    },
-    "Phil-Jevons": {
-        "id": "2a920598",
-        "nationality": ["eng"],
-        "position": ["FW"],
-        "birth_year": 1979,
-    },
-    "Julian-Joachim": {
-        "id": "2a0f531a",
-        "nationality": ["eng"],
-        "position": ["FW"],
-        "birth_year": 1974,
-    },
-    "Joseph-D\u00e9sir\u00e9-Job": {
-        "id": "8208d253",
-        "nationality": ["cm"],
-        "position": ["FW", "MF"],
-        "birth_year": 1977,
-    },
-    "Jonatan-Johansson": {
-        "id": "bc8c9864",
-        "nationality": ["fi"],
-        "position": ["FW"],
-        "birth_year": 1975,
-    },
-    "Ronny-Johnsen": {
-        "id": "02f25c21",
-        "nationality": ["no"],
-        "position": ["DF"],
-        "birth_year": 1969,
-    },
-    "David-Johnson": {
-        "id": "bb4093e9",
-        "nationality": ["jm"],
-        "position": ["FW"],
-        "birth_year": 1976,
-    },
-    "Seth-Johnson": {
-        "id": "5915b54c",
-        "nationality": ["eng"],
-        "position": ["FW", "MF"],
-        "birth_year": 1979,
-    },
-    "Slavi\u0161a-Jokanovi\u0107": {
-        "id": "e3fe9ed1",
-        "nationality": ["rs"],
-        "position": ["MF"],
-        "birth_year": 1968,
-    },
-    "Matt-Jones": {
-        "id": "6a025e0a",
-        "nationality": ["wls"],
-        "position": ["MF"],
-        "birth_year": 1980,
-    },
-    "Paul-Jones": {
-        "id": "3bf1ce9d",
-        "nationality": ["wls"],
-        "position": ["GK"],
-        "birth_year": 1967,
-    },
-    "Hassan-Kachloul": {
-        "id": "ea1a36dc",
-        "nationality": ["ma"],
-        "position": ["MF"],
-        "birth_year": 1973,
-    },
-    "Andrei-Kanchelskis": {
-        "id": "82fa1e78",
-        "nationality": ["xc"],
-        "position": ["DF", "MF"],
-        "birth_year": 1969,
-    },
-    "Fr\u00e9d\u00e9ric-Kanout\u00e9": {
-        "id": "1a24d5b6",
-        "nationality": ["ml"],
-        "position": ["FW"],
-        "birth_year": 1977,
-    },
-    "Nwankwo-Kanu": {
-        "id": "12578cde",
-        "nationality": ["ng"],
-        "position": ["FW"],
-        "birth_year": 1976,
-    },
-    "Christian-Karembeu": {
-        "id": "0ddfd24a",
-        "nationality": ["fr"],
-        "position": ["DF", "MF"],
-        "birth_year": 1970,
-    },
-    "Robbie-Keane": {
-        "id": "f45e1bb2",
-        "nationality": ["ie"],
-        "position": ["FW"],
-        "birth_year": 1980,
-    },
-    "Roy-Keane": {
-        "id": "8f218498",
-        "nationality": ["ie"],
-        "position": ["MF"],
-        "birth_year": 1971,
-    },
-    "Gary-Kelly": {
-        "id": "1832e33c",
-        "nationality": ["ie"],
-        "position": ["DF"],
-        "birth_year": 1974,
-    },
-    "Mark-Kennedy": {
-        "id": "9f91768b",
-        "nationality": ["ie"],
-        "position": ["DF", "MF"],
-        "birth_year": 1976,
-    },
-    "Martin-Keown": {
-        "id": "b844a204",
-        "nationality": ["eng"],
-        "position": ["DF", "MF"],
-        "birth_year": 1966,
-    },
-    "Brian-Kerr": {
-        "id": "13911455",
-        "nationality": ["sct"],
-        "position": ["MF"],
-        "birth_year": 1981,
-    },
-    "Scott-Kerr": {
-        "id": "af39b2df",
-        "nationality": ["eng"],
-        "position": ["MF"],
-        "birth_year": 1981,
-    },
-    "Harry-Kewell": {
-        "id": "51ef13b9",
-        "nationality": ["au"],
-        "position": ["FW", "MF"],
-        "birth_year": 1978,
-    },
-    "Tahar-El-Khalej": {
-        "id": "31388b4f",
-        "nationality": ["ma"],
-        "position": ["DF", "MF"],
-        "birth_year": 1968,
-    },
-    "Dean-Kiely": {
-        "id": "0012caa1",
-        "nationality": ["ie"],
-        "position": ["GK"],
-        "birth_year": 1970,
-    },
-    "Kevin-Kilbane": {
-        "id": "56cf4517",
-        "nationality": ["ie"],
-        "position": ["DF", "MF"],
-        "birth_year": 1977,
-    },
-    "Ledley-King": {
-        "id": "83ca192d",
-        "nationality": ["eng"],
-        "position": ["DF", "MF"],
-        "birth_year": 1980,
-    },
-    "Georgi-Kinkladze": {
-        "id": "34d9f4f7",
-        "nationality": ["ge"],
-        "position": ["MF"],
-        "birth_year": 1973,
-    },
-    "Mark-Kinsella": {
-        "id": "3564689a",
-        "nationality": ["ie"],
-        "position": ["MF"],
-        "birth_year": 1972,
-    },
-    "Chris-Kirkland": {
-        "id": "710265d2",
-        "nationality": ["eng"],
-        "position": ["GK"],
-        "birth_year": 1981,
-    },
-    "Radostin-Kishishev": {
-        "id": "d06e83b4",
-        "nationality": ["bg"],
-        "position": ["DF", "MF"],
-        "birth_year": 1974,
-    },
-    "Paul-Kitson": {
-        "id": "86707c0d",
-        "nationality": ["eng"],
-        "position": ["FW"],
-        "birth_year": 1971,
-    },
-    "Paul-Konchesky": {
-        "id": "941bcf75",
-        "nationality": ["eng"],
-        "position": ["DF", "FW"],
-        "birth_year": 1981,
-    },
-    "Muhamed-Konji\u0107": {
-        "id": "d7eeab29",
-        "nationality": ["ba"],
-        "position": ["DF"],
-        "birth_year": 1970,
-    },
-    "Willem-Korsten": {
-        "id": "e7ac53f5",
-        "nationality": ["nl"],
-        "position": ["MF"],
-        "birth_year": 1975,
-    },
-    "Kevin-Kyle": {
-        "id": "b98c1020",
-        "nationality": ["sct"],
-        "position": ["FW"],
-        "birth_year": 1981,
-    },
-    "Bernard-Lambourde": {
-        "id": "595e5d0c",
-        "nationality": ["fr"],
-        "position": ["DF"],
-        "birth_year": 1971,
-    },
-    "Frank-Lampard": {
-        "id": "268df6b1",
-        "nationality": ["eng"],
-        "position": ["MF"],
-        "birth_year": 1978,
-    },
-    "Lauren": {
-        "id": "0c662413",
-        "nationality": ["cm"],
-        "position": ["DF"],
-        "birth_year": 1977,
-    },
-    "Jamie-Lawrence": {
-        "id": "25117d43",
-        "nationality": ["jm"],
-        "position": ["MF"],
-        "birth_year": 1970,
-    },
-    "Graeme-Le-Saux": {
-        "id": "0bd42c09",
-        "nationality": ["eng"],
-        "position": ["DF"],
-        "birth_year": 1968,
-    },
-    "Matt-Le-Tissier": {
-        "id": "d5e78451",
-        "nationality": ["eng"],
-        "position": ["FW", "MF"],
-        "birth_year": 1968,
-    },
-    "Frank-Leboeuf": {
-        "id": "a011a07b",
-        "nationality": ["fr"],
-        "position": ["DF"],
-        "birth_year": 1968,
-    },
-    "Rob-Lee": {
-        "id": "291b2178",
-        "nationality": ["eng"],
-        "position": ["MF"],
-        "birth_year": 1966,
-    },
-    "Neil-Lennon": {
-        "id": "ad2d42ae",
-        "nationality": ["nir"],
-        "position": ["MF"],
-        "birth_year": 1971,
-    },
-    "\u00d8yvind-Leonhardsen": {
-        "id": "490a8799",
-        "nationality": ["no"],
-        "position": ["MF"],
-        "birth_year": 1970,
-    },
-    "Junior-Lewis": {
-        "id": "c9122221",
-        "nationality": ["eng"],
-        "position": ["MF"],
-        "birth_year": 1973,
-    },
-    "Kevin-Lisbie": {
-        "id": "e509ea01",
-        "nationality": ["jm"],
-        "position": ["FW"],
-        "birth_year": 1978,
-    },
-    "Jari-Litmanen": {
-        "id": "ee47d4fd",
-        "nationality": ["fi"],
-        "position": ["FW", "MF"],
-        "birth_year": 1971,
-    },
-    "Freddie-Ljungberg": {
-        "id": "5d9e8825",
-        "nationality": ["se"],
-        "position": ["FW", "MF"],
-        "birth_year": 1977,
-    },
-    "Gary-Locke": {
-        "id": "6bacf8eb",
-        "nationality": ["sct"],
-        "position": ["MF"],
-        "birth_year": 1975,
-    },
-    "Steve-Lomas": {
-        "id": "9e58673a",
-        "nationality": ["nir"],
-        "position": ["MF"],
-        "birth_year": 1974,
-    },
-    "Lomana-LuaLua": {
-        "id": "27bd6d81",
-        "nationality": ["cd"],
-        "position": ["FW", "MF"],
-        "birth_year": 1980,
-    },
-    "John-Lukic": {
-        "id": "99095d88",
-        "nationality": ["eng"],
-        "position": ["GK"],
-        "birth_year": 1960,
-    },
-    "Claus-Lundekvam": {
-        "id": "22de8419",
-        "nationality": ["no"],
-        "position": ["DF"],
-        "birth_year": 1973,
-    },
-    "Oleh-Luzhny": {
-        "id": "d39e96f7",
-        "nationality": ["ua"],
-        "position": ["DF"],
-        "birth_year": 1968,
-    },
-    "Charlie-MacDonald": {
-        "id": "bf812107",
-        "nationality": ["eng"],
-        "position": ["FW"],
-        "birth_year": 1981,
-    },
-    "J\u00fcrgen-Macho": {
-        "id": "ce8143d7",
-        "nationality": ["at"],
-        "position": ["GK"],
-        "birth_year": 1977,
-    },
-    "Jim-Magilton": {
-        "id": "27240fa9",
-        "nationality": ["nir"],
-        "position": ["DF", "MF"],
-        "birth_year": 1969,
-    },
-    "Chris-Makin": {
-        "id": "aecb9ffc",
-        "nationality": ["eng"],
-        "position": ["DF"],
-        "birth_year": 1973,
-    },
-    "Stefan-Malz": {
-        "id": "1632ca04",
-        "nationality": ["de"],
-        "position": ["DF", "MF"],
-        "birth_year": 1972,
-    },
-    "Roberto-Mancini": {
-        "id": "65fd260b",
-        "nationality": ["it"],
-        "position": ["FW"],
-        "birth_year": 1964,
-    },
-    "Alex-Manninger": {
-        "id": "eb55b1bc",
-        "nationality": ["at"],
-        "position": ["GK"],
-        "birth_year": 1977,
-    },
-    "Javier-Margas": {
-        "id": "e3d3254a",
-        "nationality": ["cl"],
-        "position": ["DF"],
-        "birth_year": 1969,
-    },
-    "Carlos-Marinelli": {
-        "id": "3a81b990",
-        "nationality": ["ar"],
-        "position": ["MF"],
-        "birth_year": 1982,
-    },
-    "Chris-Marsden": {
-        "id": "c1f59bed",
-        "nationality": ["eng"],
-        "position": ["MF"],
-        "birth_year": 1969,
-    },
-    "Lee-Marshall": {
-        "id": "40416d99",
-        "nationality": ["eng"],
-        "position": ["DF", "MF"],
-        "birth_year": 1979,
-    },
-    "Lilian-Martin": {
-        "id": "ba8c8889",
-        "nationality": ["fr"],
-        "position": ["DF"],
-        "birth_year": 1971,
-    },
-    "Nigel-Martyn": {
-        "id": "8977904e",
-        "nationality": ["eng"],
-        "position": ["GK"],
-        "birth_year": 1966,
-    },
-    "Dominic-Matteo": {
-        "id": "f6ea8457",
-        "nationality": ["sct"],
-        "position": ["DF", "MF"],
-        "birth_year": 1974,
-    },
-    "Youl-Maw\u00e9n\u00e9": {
-        "id": "30711a1a",
-        "nationality": ["cg"],
-        "position": ["DF"],
-        "birth_year": 1979,
-    },
-    "David-May": {
-        "id": "1c719a79",
-        "nationality": ["eng"],
-        "position": ["DF"],
-        "birth_year": 1970,
-    },
-    "Gary-McAllister": {
-        "id": "19f7edbc",
-        "nationality": ["sct"],
-        "position": ["MF"],
-        "birth_year": 1964,
-    },
-    "Stuart-McCall": {
-        "id": "e935fea0",
-        "nationality": ["sct"],
-        "position": ["MF"],
-        "birth_year": 1964,
-    },
-    "Gavin-McCann": {
-        "id": "d1e78f75",
-        "nationality": ["eng"],
-        "position": ["MF"],
-        "birth_year": 1978,
-    },
-    "Grant-McCann": {
-        "id": "e016d510",
-        "nationality": ["nir"],
-        "position": ["MF"],
-        "birth_year": 1980,
-    },
-    "George-McCartney": {
-        "id": "f6c4946d",
-        "nationality": ["nir"],
-        "position": ["DF"],
-        "birth_year": 1981,
-    },
-    "Dave-McEwen": {"id": "c31535b2", "position": ["FW"], "birth_year": 1977},
-    "John-McGrath": {
-        "id": "f4a5b406",
-        "nationality": ["ie"],
-        "position": ["MF"],
-        "birth_year": 1980,
-    },
-    "John-McGreal": {
-        "id": "b0782688",
-        "nationality": ["eng"],
-        "position": ["DF"],
-        "birth_year": 1972,
-    },
-    "Billy-McKinlay": {
-        "id": "a5e06511",
-        "nationality": ["sct"],
-        "position": ["MF"],
-        "birth_year": 1969,
-    },
-    "Kevin-McLeod": {
-        "id": "50496eb0",
-        "nationality": ["eng"],
-        "position": ["MF"],
-        "birth_year": 1980,
-    },
-    "Stephen-McPhail": {
-        "id": "60c96516",
-        "nationality": ["ie"],
-        "position": ["MF"],
-        "birth_year": 1979,
-    },
-    "Erik-Meijer": {
-        "id": "150df2bb",
-        "nationality": ["nl"],
-        "position": ["FW"],
-        "birth_year": 1969,
-    },
-    "Mario-Melchiot": {
-        "id": "1f5e2ed9",
-        "nationality": ["nl"],
-        "position": ["DF"],
-        "birth_year": 1976,
-    },
-    "Paul-Merson": {
-        "id": "eba7e6fd",
-        "nationality": ["eng"],
-        "position": ["FW", "MF"],
-        "birth_year": 1968,
-    },
-    "Alan-Miller": {
-        "id": "ba82c15d",
-        "nationality": ["eng"],
-        "position": ["GK"],
-        "birth_year": 1970,
-    },
-    "Danny-Mills": {
-        "id": "240e4301",
-        "nationality": ["eng"],
-        "position": ["DF"],
-        "birth_year": 1977,
-    },
-    "Scott-Minto": {
-        "id": "8cd0120b",
-        "nationality": ["eng"],
-        "position": ["DF"],
-        "birth_year": 1971,
-    },
-    "Robert-Molenaar": {
-        "id": "5748f64c",
-        "nationality": ["nl"],
-        "position": ["DF"],
-        "birth_year": 1969,
-    },
-    "John-Moncur": {
-        "id": "e982f824",
-        "nationality": ["eng"],
-        "position": ["MF"],
-        "birth_year": 1966,
-    },
-    "Garry-Monk": {
-        "id": "a70de3a4",
-        "nationality": ["eng"],
-        "position": ["DF"],
-        "birth_year": 1979,
-    },
-    "Joe-Max-Moore": {
-        "id": "5e409c8c",
-        "nationality": ["us"],
-        "position": ["FW"],
-        "birth_year": 1971,
-    },
-    "Jody-Morris": {
-        "id": "c5002fd1",
-        "nationality": ["eng"],
-        "position": ["MF"],
-        "birth_year": 1978,
-    },
-    "Lee-Morris": {
-        "id": "76f7b349",
-        "nationality": ["eng"],
-        "position": ["FW"],
-        "birth_year": 1980,
-    },
-    "Andy-Morrison": {
-        "id": "a6f1c0ce",
-        "nationality": ["sct"],
-        "position": ["DF"],
-        "birth_year": 1970,
-    },
-    "Neil-Moss": {
-        "id": "0a63c6a4",
-        "nationality": ["eng"],
-        "position": ["GK"],
-        "birth_year": 1975,
-    },
-    "Danny-Murphy": {
-        "id": "03a97c40",
-        "nationality": ["eng"],
-        "position": ["MF"],
-        "birth_year": 1977,
-    },
-    "Adam-Murray": {
-        "id": "b0542647",
-        "nationality": ["eng"],
-        "position": ["MF"],
-        "birth_year": 1981,
-    },
-    "Robbie-Mustoe": {
-        "id": "2c02df03",
-        "nationality": ["eng"],
-        "position": ["MF"],
-        "birth_year": 1968,
-    },
-    "Andy-Myers": {
-        "id": "e5b54539",
-        "nationality": ["eng"],
-        "position": ["DF"],
-        "birth_year": 1973,
-    },
-    "Thomas-Myhre": {
-        "id": "dc3fc546",
-        "nationality": ["no"],
-        "position": ["GK"],
-        "birth_year": 1973,
-    },
-    "Carlo-Nash": {
-        "id": "bd9670b3",
-        "nationality": ["eng"],
-        "position": ["GK"],
-        "birth_year": 1973,
-    },
-    "Richard-Naylor": {
-        "id": "2a5b7959",
-        "nationality": ["eng"],
-        "position": ["DF", "FW"],
-        "birth_year": 1977,
-    },
-    "Gary-Naysmith": {
-        "id": "71cbf286",
-        "nationality": ["sct"],
-        "position": ["DF", "MF"],
-        "birth_year": 1978,
-    },
-    "Gary-Neville": {
-        "id": "1b013e33",
-        "nationality": ["eng"],
-        "position": ["DF"],
-        "birth_year": 1975,
-    },
-    "Phil-Neville": {
-        "id": "3db5e0ec",
-        "nationality": ["eng"],
-        "position": ["DF", "MF"],
-        "birth_year": 1977,
-    },
-    "Shaun-Newton": {
-        "id": "75de93be",
-        "nationality": ["eng"],
-        "position": ["MF"],
-        "birth_year": 1975,
-    },
-    "Luc-Nilis": {
-        "id": "f740af43",
-        "nationality": ["be"],
-        "position": ["FW"],
-        "birth_year": 1967,
-    },
-    "Ian-Nolan": {
-        "id": "6587459a",
-        "nationality": ["nir"],
-        "position": ["DF"],
-        "birth_year": 1970,
-    },
-    "Alex-Nyarko": {
-        "id": "52343df1",
-        "nationality": ["gh"],
-        "position": ["MF"],
-        "birth_year": 1973,
-    },
-    "Andy-O'Brien": {
-        "id": "1719f6b2",
-        "nationality": ["ie"],
-        "position": ["DF"],
-        "birth_year": 1979,
-    },
-    "Brian-O'Neil": {
-        "id": "779598dc",
-        "nationality": ["sct"],
-        "position": ["MF"],
-        "birth_year": 1972,
-    },
-    "Keith-O'Neill": {
-        "id": "f3761381",
-        "nationality": ["ie"],
-        "position": ["MF"],
-        "birth_year": 1976,
-    },
-    "Andy-Oakes": {
-        "id": "7df5c540",
-        "nationality": ["eng"],
-        "position": ["GK"],
-        "birth_year": 1977,
-    },
-    "Stefan-Oakes": {
-        "id": "7827fda9",
-        "nationality": ["eng"],
-        "position": ["MF"],
-        "birth_year": 1978,
-    },
-    "Matt-Oakley": {
-        "id": "79974582",
-        "nationality": ["eng"],
-        "position": ["MF"],
-        "birth_year": 1977,
-    },
-    "Paul-Okon": {
-        "id": "61d7a6b1",
-        "nationality": ["au"],
-        "position": ["MF"],
-        "birth_year": 1972,
-    },
-    "John-Oster": {
-        "id": "bbf029eb",
-        "nationality": ["wls"],
-        "position": ["MF"],
-        "birth_year": 1978,
-    },
-    "Bj\u00f8rn-Otto-Bragstad": {
-        "id": "a902e103",
-        "nationality": ["no"],
-        "position": ["DF"],
-        "birth_year": 1971,
-    },
-    "Michael-Owen": {
-        "id": "88b3f52c",
-        "nationality": ["eng"],
-        "position": ["FW"],
-        "birth_year": 1979,
-    },
-    "Alpay-\u00d6zalan": {
-        "id": "e1a59314",
-        "nationality": ["tr"],
-        "position": ["DF"],
-        "birth_year": 1973,
-    },
-    "Juan-Pablo-\u00c1ngel": {
-        "id": "f0848ae1",
-        "nationality": ["co"],
-        "position": ["FW"],
-        "birth_year": 1975,
-    },
-    "Marians-Pahars": {
-        "id": "bc95c25d",
-        "nationality": ["lv"],
-        "position": ["FW", "MF"],
-        "birth_year": 1976,
-    },
-    "Gary-Pallister": {
-        "id": "f99beca9",
-        "nationality": ["eng"],
-        "position": ["DF"],
-        "birth_year": 1965,
-    },
-    "Carlton-Palmer": {
-        "id": "45fdede4",
-        "nationality": ["eng"],
-        "position": ["MF"],
-        "birth_year": 1965,
-    },
-    "Christian-Panucci": {
-        "id": "b0d1a3a8",
-        "nationality": ["it"],
-        "position": ["DF"],
-        "birth_year": 1973,
-    },
-    "Scott-Parker": {
-        "id": "65faf2a1",
-        "nationality": ["eng"],
-        "position": ["MF"],
-        "birth_year": 1980,
-    },
-    "Ray-Parlour": {
-        "id": "d567e937",
-        "nationality": ["eng"],
-        "position": ["MF"],
-        "birth_year": 1973,
-    },
-    "Ian-Pearce": {
-        "id": "3537c18f",
-        "nationality": ["eng"],
-        "position": ["DF"],
-        "birth_year": 1974,
-    },
-    "Stuart-Pearce": {
-        "id": "39243ce6",
-        "nationality": ["eng"],
-        "position": ["DF"],
-        "birth_year": 1962,
-    },
-    "Mark-Pembridge": {
-        "id": "0f9d5dee",
-        "nationality": ["wls"],
-        "position": ["MF"],
-        "birth_year": 1970,
-    },
-    "Chris-Perry": {
-        "id": "2f43aa1c",
-        "nationality": ["eng"],
-        "position": ["DF"],
-        "birth_year": 1973,
-    },
-    "Dan-Petrescu": {
-        "id": "dc2e7399",
-        "nationality": ["ro"],
-        "position": ["DF"],
-        "birth_year": 1967,
-    },
-    "Kevin-Phillips": {
-        "id": "23d97ca1",
-        "nationality": ["eng"],
-        "position": ["FW"],
-        "birth_year": 1973,
-    },
-    "John-Piercy": {
-        "id": "5a9436c4",
-        "nationality": ["eng"],
-        "position": ["MF"],
-        "birth_year": 1979,
-    },
-    "Robert-Pir\u00e8s": {
-        "id": "59bfafcf",
-        "nationality": ["fr"],
-        "position": ["FW", "MF"],
-        "birth_year": 1973,
-    },
-    "Alessandro-Pistone": {
-        "id": "956096ee",
-        "nationality": ["it"],
-        "position": ["DF"],
-        "birth_year": 1975,
-    },
-    "Mart-Poom": {
-        "id": "f60f19b7",
-        "nationality": ["ee"],
-        "position": ["GK"],
-        "birth_year": 1972,
-    },
-    "Steve-Potts": {
-        "id": "3607a95d",
-        "nationality": ["eng"],
-        "position": ["DF"],
-        "birth_year": 1967,
-    },
-    "Chris-Powell": {
-        "id": "721060d9",
-        "nationality": ["eng"],
-        "position": ["DF"],
-        "birth_year": 1969,
-    },
-    "Darryl-Powell": {
-        "id": "4b351524",
-        "nationality": ["jm"],
-        "position": ["MF"],
-        "birth_year": 1971,
-    },
-    "Gus-Poyet": {
-        "id": "27cd364d",
-        "nationality": ["uy"],
-        "position": ["MF"],
-        "birth_year": 1967,
-    },
-    "Martin-Pringle": {
-        "id": "2178adca",
-        "nationality": ["se"],
-        "position": ["FW"],
-        "birth_year": 1970,
-    },
-    "Spencer-Prior": {
-        "id": "d68181d1",
-        "nationality": ["eng"],
-        "position": ["DF"],
-        "birth_year": 1971,
-    },
-    "Barry-Quinn": {
-        "id": "1f0d112e",
-        "nationality": ["ie"],
-        "position": ["DF"],
-        "birth_year": 1979,
-    },
-    "Niall-Quinn": {
-        "id": "050093a9",
-        "nationality": ["ie"],
-        "position": ["FW"],
-        "birth_year": 1966,
-    },
-    "Wayne-Quinn": {
-        "id": "3611e81e",
-        "nationality": ["eng"],
-        "position": ["DF"],
-        "birth_year": 1976,
-    },
-    "Paul-Rachubka": {
-        "id": "f3229025",
-        "nationality": ["eng"],
-        "position": ["GK"],
-        "birth_year": 1981,
-    },
-    "Lucas-Radebe": {
-        "id": "84d2a0f0",
-        "nationality": ["za"],
-        "position": ["DF"],
-        "birth_year": 1969,
-    },
-    "Alex-Rae": {
-        "id": "a64175a1",
-        "nationality": ["sct"],
-        "position": ["MF"],
-        "birth_year": 1969,
-    },
-    "Isaiah-Rankin": {
-        "id": "306bb797",
-        "nationality": ["eng"],
-        "position": ["FW", "MF"],
-        "birth_year": 1978,
-    },
-    "Serhiy-Rebrov": {
-        "id": "493b0ae2",
-        "nationality": ["ua"],
-        "position": ["FW", "MF"],
-        "birth_year": 1974,
-    },
-    "Michael-Reddy": {
-        "id": "a186df74",
-        "nationality": ["ie"],
-        "position": ["FW"],
-        "birth_year": 1980,
-    },
-    "Martijn-Reuser": {
-        "id": "21404bef",
-        "nationality": ["nl"],
-        "position": ["MF"],
-        "birth_year": 1975,
-    },
-    "Hamilton-Ricard": {
-        "id": "e08d8909",
-        "nationality": ["co"],
-        "position": ["FW"],
-        "birth_year": 1974,
-    },
-    "Dean-Richards": {
-        "id": "9fc6fda5",
-        "nationality": ["eng"],
-        "position": ["DF"],
-        "birth_year": 1974,
-    },
-    "Chris-Riggott": {
-        "id": "6ec07df6",
-        "nationality": ["eng"],
-        "position": ["DF"],
-        "birth_year": 1980,
-    },
-    "Stuart-Ripley": {
-        "id": "6516188c",
-        "nationality": ["eng"],
-        "position": ["FW", "MF"],
-        "birth_year": 1967,
-    },
-    "Paul-Ritchie": {
-        "id": "fd68153d",
-        "nationality": ["sct"],
-        "position": ["DF"],
-        "birth_year": 1975,
-    },
-    "John-Robinson": {
-        "id": "0a8ac335",
-        "nationality": ["wls"],
-        "position": ["MF"],
-        "birth_year": 1971,
-    },
-    "Paul-Robinson": {
-        "id": "a1a9da94",
-        "nationality": ["eng"],
-        "position": ["FW"],
-        "birth_year": 1978,
-    },
-    "Uwe-R\u00f6sler": {
-        "id": "77a6a70d",
-        "nationality": ["de"],
-        "position": ["FW"],
-        "birth_year": 1968,
-    },
-    "C\u00e9dric-Roussel": {
-        "id": "ac150720",
-        "nationality": ["be"],
-        "position": ["FW"],
-        "birth_year": 1978,
-    },
-    "Gary-Rowett": {
-        "id": "92c33b52",
-        "nationality": ["eng"],
-        "position": ["DF"],
-        "birth_year": 1974,
-    },
-    "\u00c9ric-Roy": {
-        "id": "adeca4c0",
-        "nationality": ["fr"],
-        "position": ["MF"],
-        "birth_year": 1967,
-    },
-    "Simon-Royce": {
-        "id": "0d7bbc61",
-        "nationality": ["eng"],
-        "position": ["GK"],
-        "birth_year": 1971,
-    },
-    "Richard-Rufus": {
-        "id": "16e11f73",
-        "nationality": ["eng"],
-        "position": ["DF"],
-        "birth_year": 1975,
-    },
-    "John-Salako": {
-        "id": "2749f5b7",
-        "nationality": ["eng"],
-        "position": ["MF"],
-        "birth_year": 1969,
-    },
-    "Jlloyd-Samuel": {
-        "id": "efc9ff16",
-        "nationality": ["tt"],
-        "position": ["DF", "MF"],
-        "birth_year": 1981,
-    },
-    "Dean-Saunders": {
-        "id": "c1435456",
-        "nationality": ["wls"],
-        "position": ["FW"],
-        "birth_year": 1964,
-    },
-    "Robbie-Savage": {
-        "id": "f60a24de",
-        "nationality": ["wls"],
-        "position": ["MF"],
-        "birth_year": 1974,
-    },
-    "John-Scales": {
-        "id": "1c67bd76",
-        "nationality": ["eng"],
-        "position": ["DF"],
-        "birth_year": 1966,
-    },
-    "S\u00e9bastien-Schemmel": {
-        "id": "3a12ed68",
-        "nationality": ["fr"],
-        "position": ["DF"],
-        "birth_year": 1975,
-    },
-    "Stefan-Schnoor": {
-        "id": "adca018f",
-        "nationality": ["de"],
-        "position": ["DF"],
-        "birth_year": 1971,
-    },
-    "Paul-Scholes": {
-        "id": "24a3a72c",
-        "nationality": ["eng"],
-        "position": ["MF"],
-        "birth_year": 1974,
-    },
-    "Stefan-Schwarz": {
-        "id": "aeab7566",
-        "nationality": ["se"],
-        "position": ["DF", "MF"],
-        "birth_year": 1969,
-    },
-    "Mark-Schwarzer": {
-        "id": "da409c6f",
-        "nationality": ["au"],
-        "position": ["GK"],
-        "birth_year": 1972,
-    },
-    "James-Scowcroft": {
-        "id": "91aafa3c",
-        "nationality": ["eng"],
-        "position": ["FW"],
-        "birth_year": 1975,
-    },
-    "David-Seaman": {
-        "id": "2d578837",
-        "nationality": ["eng"],
-        "position": ["GK"],
-        "birth_year": 1963,
-    },
-    "Lee-Sharpe": {
-        "id": "2143398b",
-        "nationality": ["eng"],
-        "position": ["MF"],
-        "birth_year": 1971,
-    },
-    "Richard-Shaw": {
-        "id": "88b5bd84",
-        "nationality": ["eng"],
-        "position": ["DF"],
-        "birth_year": 1968,
-    },
-    "Alan-Shearer": {
-        "id": "438b3a51",
-        "nationality": ["eng"],
-        "position": ["FW"],
-        "birth_year": 1970,
-    },
-    "Teddy-Sheringham": {
-        "id": "4e56eef6",
-        "nationality": ["eng"],
-        "position": ["FW"],
-        "birth_year": 1966,
-    },
-    "Tim-Sherwood": {
-        "id": "885f0b51",
-        "nationality": ["eng"],
-        "position": ["MF"],
-        "birth_year": 1969,
-    },
-    "Greg-Shields": {
-        "id": "3a8c6a9d",
-        "nationality": ["sct"],
-        "position": ["DF"],
-        "birth_year": 1976,
-    },
-    "Mika\u00ebl-Silvestre": {
-        "id": "4dde97ea",
-        "nationality": ["fr"],
-        "position": ["DF"],
-        "birth_year": 1977,
-    },
-    "Steve-Simonsen": {
-        "id": "b37c3eea",
-        "nationality": ["eng"],
-        "position": ["GK"],
-        "birth_year": 1979,
-    },
-    "Frank-Sinclair": {
-        "id": "02942593",
-        "nationality": ["jm"],
-        "position": ["DF"],
-        "birth_year": 1971,
-    },
-    "Trevor-Sinclair": {
-        "id": "d2f7373c",
-        "nationality": ["eng"],
-        "position": ["MF"],
-        "birth_year": 1973,
-    },
-    "Vladim\u00edr-\u0160micer": {
-        "id": "134c46b4",
-        "nationality": ["cz"],
-        "position": ["FW", "MF"],
-        "birth_year": 1973,
-    },
-    "Alan-Smith": {
-        "id": "fdac06ea",
-        "nationality": ["eng"],
-        "position": ["FW", "MF"],
-        "birth_year": 1980,
-    },
-    "Nolberto-Solano": {
-        "id": "37e7c753",
-        "nationality": ["pe"],
-        "position": ["MF"],
-        "birth_year": 1974,
-    },
-    "Ragnvald-Soma": {
-        "id": "9f6e2d34",
-        "nationality": ["no"],
-        "position": ["DF"],
-        "birth_year": 1979,
-    },
-    "Rigobert-Song": {
-        "id": "d884e39b",
-        "nationality": ["cm"],
-        "position": ["DF"],
-        "birth_year": 1976,
-    },
-    "Gareth-Southgate": {
-        "id": "a29c3ed6",
-        "nationality": ["eng"],
-        "position": ["DF"],
-        "birth_year": 1970,
-    },
-    "Gary-Speed": {
-        "id": "5ca13d11",
-        "nationality": ["wls"],
-        "position": ["MF"],
-        "birth_year": 1969,
-    },
-    "Jaap-Stam": {
-        "id": "7c48a3ec",
-        "nationality": ["nl"],
-        "position": ["DF"],
-        "birth_year": 1972,
-    },
-    "Phil-Stamp": {
-        "id": "f50ed0f5",
-        "nationality": ["eng"],
-        "position": ["MF"],
-        "birth_year": 1975,
-    },
-    "Mario-Stani\u0107": {
-        "id": "c5c88be5",
-        "nationality": ["hr"],
-        "position": ["FW", "MF"],
-        "birth_year": 1972,
-    },
-    "Steve-Staunton": {
-        "id": "cb617782",
-        "nationality": ["ie"],
-        "position": ["DF", "MF"],
-        "birth_year": 1969,
-    },
-    "Igors-Stepanovs": {
-        "id": "3216f38a",
-        "nationality": ["lv"],
-        "position": ["DF"],
-        "birth_year": 1976,
-    },
-    "Marcus-Stewart": {
-        "id": "80463957",
-        "nationality": ["eng"],
-        "position": ["FW"],
-        "birth_year": 1972,
-    },
-    "Michael-Stewart": {
-        "id": "58db0909",
-        "nationality": ["sct"],
-        "position": ["MF"],
-        "birth_year": 1981,
-    },
-    "Igor-\u0160timac": {
-        "id": "7bcb9285",
-        "nationality": ["hr"],
-        "position": ["DF"],
-        "birth_year": 1967,
-    },
-    "Steve-Stone": {
-        "id": "4592c48e",
-        "nationality": ["eng"],
-        "position": ["MF"],
-        "birth_year": 1971,
-    },
-    "Gavin-Strachan": {
-        "id": "d12f06f6",
-        "nationality": ["sct"],
-        "position": ["MF"],
-        "birth_year": 1978,
-    },
-    "Branko-Strupar": {
-        "id": "75b161bc",
-        "nationality": ["be"],
-        "position": ["FW"],
-        "birth_year": 1970,
-    },
-    "Graham-Stuart": {
-        "id": "159c714f",
-        "nationality": ["eng"],
-        "position": ["FW", "MF"],
-        "birth_year": 1970,
-    },
-    "Dean-Sturridge": {
-        "id": "70e13fa1",
-        "nationality": ["eng"],
-        "position": ["FW"],
-        "birth_year": 1973,
-    },
-    "Davor-\u0160uker": {
-        "id": "f3580cae",
-        "nationality": ["hr"],
-        "position": ["FW"],
-        "birth_year": 1968,
-    },
-    "Neil-Sullivan": {
-        "id": "2ea16583",
-        "nationality": ["sct"],
-        "position": ["GK"],
-        "birth_year": 1970,
-    },
-    "Mark-Summerbell": {
-        "id": "f92c694b",
-        "nationality": ["eng"],
-        "position": ["MF"],
-        "birth_year": 1976,
-    },
-    "Mathias-Svensson": {
-        "id": "d735eec3",
-        "nationality": ["se"],
-        "position": ["FW"],
-        "birth_year": 1974,
-    },
-    "Sylvinho": {
-        "id": "b46e497d",
-        "nationality": ["br"],
-        "position": ["DF"],
-        "birth_year": 1974,
-    },
-    "Thomas-S\u00f8rensen": {
-        "id": "31d82fec",
-        "nationality": ["dk"],
-        "position": ["GK"],
-        "birth_year": 1976,
-    },
-    "Gerry-Taggart": {
-        "id": "2bf06765",
-        "nationality": ["nir"],
-        "position": ["DF"],
-        "birth_year": 1970,
-    },
-    "Idan-Tal": {
-        "id": "0c9029e5",
-        "nationality": ["il"],
-        "position": ["MF"],
-        "birth_year": 1975,
-    },
-    "Mauricio-Taricco": {
-        "id": "efad718d",
-        "nationality": ["ar"],
-        "position": ["DF"],
-        "birth_year": 1973,
-    },
-    "Ian-Taylor": {
-        "id": "daa71b88",
-        "nationality": ["eng"],
-        "position": ["MF"],
-        "birth_year": 1968,
-    },
-    "Paul-Telfer": {
-        "id": "7b3990c5",
-        "nationality": ["sct"],
-        "position": ["DF", "MF"],
-        "birth_year": 1971,
-    },
-    "John-Terry": {
-        "id": "68517cfd",
-        "nationality": ["eng"],
-        "position": ["DF"],
-        "birth_year": 1980,
-    },
-    "Jo-Tessem": {
-        "id": "32290355",
-        "nationality": ["no"],
-        "position": ["MF"],
-        "birth_year": 1972,
-    },
-    "Ben-Thatcher": {
-        "id": "dc5460f9",
-        "nationality": ["wls"],
-        "position": ["DF"],
-        "birth_year": 1975,
-    },
-    "Alton-Thelwell": {
-        "id": "23d28571",
-        "nationality": ["eng"],
-        "position": ["DF"],
-        "birth_year": 1980,
-    },
-    "Paul-Thirlwell": {
-        "id": "3f658e48",
-        "nationality": ["eng"],
-        "position": ["MF"],
-        "birth_year": 1979,
-    },
-    "Emerson-Thome": {
-        "id": "7dc1b3c9",
-        "nationality": ["br"],
-        "position": ["DF"],
-        "birth_year": 1972,
-    },
-    "David-Thompson": {
-        "id": "5696222a",
-        "nationality": ["eng"],
-        "position": ["MF"],
-        "birth_year": 1977,
-    },
-    "Danny-Tiatto": {
-        "id": "98538ebb",
-        "nationality": ["au"],
-        "position": ["DF", "MF"],
-        "birth_year": 1973,
-    },
-    "Hannu-Tihinen": {
-        "id": "c01f3ab3",
-        "nationality": ["fi"],
-        "position": ["DF"],
-        "birth_year": 1976,
-    },
-    "Carl-Tiler": {
-        "id": "319d0cea",
-        "nationality": ["eng"],
-        "position": ["DF"],
-        "birth_year": 1970,
-    },
-    "Andy-Todd": {
-        "id": "1b9ecd06",
-        "nationality": ["eng"],
-        "position": ["DF"],
-        "birth_year": 1974,
-    },
-    "Svetoslav-Todorov": {
-        "id": "504688a9",
-        "nationality": ["bg"],
-        "position": ["FW"],
-        "birth_year": 1978,
-    },
-    "Djimi-Traor\u00e9": {
-        "id": "b8c992d8",
-        "nationality": ["ml"],
-        "position": ["DF"],
-        "birth_year": 1980,
-    },
-    "David-Unsworth": {
-        "id": "05fcbb55",
-        "nationality": ["eng"],
-        "position": ["DF"],
-        "birth_year": 1973,
-    },
-    "Matthew-Upson": {
-        "id": "1a6e6d03",
-        "nationality": ["eng"],
-        "position": ["DF"],
-        "birth_year": 1979,
-    },
-    "Simo-Valakari": {
-        "id": "49c751ba",
-        "nationality": ["fi"],
-        "position": ["MF"],
-        "birth_year": 1973,
-    },
-    "Stanislav-Varga": {
-        "id": "bcde5b12",
-        "nationality": ["sk"],
-        "position": ["DF"],
-        "birth_year": 1972,
-    },
-    "Darius-Vassell": {
-        "id": "e342b5e7",
-        "nationality": ["eng"],
-        "position": ["FW", "MF"],
-        "birth_year": 1980,
-    },
-    "Ramon-Vega": {
-        "id": "dc2ddfb5",
-        "nationality": ["ch"],
-        "position": ["DF"],
-        "birth_year": 1971,
-    },
-    "Mark-Venus": {
-        "id": "a92adc09",
-        "nationality": ["eng"],
-        "position": ["DF"],
-        "birth_year": 1967,
-    },
-    "Paolo-Vernazza": {
-        "id": "eafddfa3",
-        "nationality": ["eng"],
-        "position": ["MF"],
-        "birth_year": 1979,
-    },
-    "Steve-Vickers": {
-        "id": "4b0dbeef",
-        "nationality": ["eng"],
-        "position": ["DF"],
-        "birth_year": 1967,
-    },
-    "Mark-Viduka": {
-        "id": "c4c545c7",
-        "nationality": ["au"],
-        "position": ["FW"],
-        "birth_year": 1975,
-    },
-    "Patrick-Vieira": {
-        "id": "f90f1086",
-        "nationality": ["fr"],
-        "position": ["MF"],
-        "birth_year": 1976,
-    },
-    "Gr\u00e9gory-Vignal": {
-        "id": "5027d998",
-        "nationality": ["fr"],
-        "position": ["DF"],
-        "birth_year": 1981,
-    },
-    "Nelson-Vivas": {
-        "id": "21c083bf",
-        "nationality": ["ar"],
-        "position": ["DF"],
-        "birth_year": 1969,
-    },
-    "Ian-Walker": {
-        "id": "78a90cec",
-        "nationality": ["eng"],
-        "position": ["GK"],
-        "birth_year": 1971,
-    },
-    "Ronnie-Wallwork": {
-        "id": "cb7b25cf",
-        "nationality": ["eng"],
-        "position": ["DF", "MF"],
-        "birth_year": 1977,
-    },
-    "Gary-Walsh": {
-        "id": "82dc3961",
-        "nationality": ["eng"],
-        "position": ["GK"],
-        "birth_year": 1968,
-    },
-    "Steve-Walsh": {
-        "id": "3e59c893",
-        "nationality": ["eng"],
-        "position": ["DF"],
-        "birth_year": 1964,
-    },
-    "Paulo-Wanchope": {
-        "id": "3ab888b3",
-        "nationality": ["cr"],
-        "position": ["FW"],
-        "birth_year": 1976,
-    },
-    "Ashley-Ward": {
-        "id": "3df77824",
-        "nationality": ["eng"],
-        "position": ["FW"],
-        "birth_year": 1970,
-    },
-    "Steve-Watson": {
-        "id": "302d8e76",
-        "nationality": ["eng"],
-        "position": ["DF", "MF"],
-        "birth_year": 1974,
-    },
-    "George-Weah": {
-        "id": "186014ec",
-        "nationality": ["lr"],
-        "position": ["FW"],
-        "birth_year": 1966,
-    },
-    "Nicky-Weaver": {
-        "id": "44509649",
-        "nationality": ["eng"],
-        "position": ["GK"],
-        "birth_year": 1979,
-    },
-    "David-Weir": {
-        "id": "ba286fd8",
-        "nationality": ["sct"],
-        "position": ["DF"],
-        "birth_year": 1970,
-    },
-    "Taribo-West": {
-        "id": "1a6e7532",
-        "nationality": ["ng"],
-        "position": ["DF"],
-        "birth_year": 1974,
-    },
-    "Sander-Westerveld": {
-        "id": "dc8d38a2",
-        "nationality": ["nl"],
-        "position": ["GK"],
-        "birth_year": 1974,
-    },
-    "David-Wetherall": {
-        "id": "ceb3f12d",
-        "nationality": ["eng"],
-        "position": ["DF"],
-        "birth_year": 1971,
-    },
-    "Gareth-Whalley": {
-        "id": "4f2783db",
-        "nationality": ["eng"],
-        "position": ["MF"],
-        "birth_year": 1973,
-    },
-    "Noel-Whelan": {
-        "id": "901c3bdf",
-        "nationality": ["eng"],
-        "position": ["FW"],
-        "birth_year": 1974,
-    },
-    "Jeff-Whitley": {
-        "id": "4e93bfac",
-        "nationality": ["nir"],
-        "position": ["MF"],
-        "birth_year": 1979,
-    },
-    "Gerard-Wiekens": {
-        "id": "5e22707e",
-        "nationality": ["nl"],
-        "position": ["DF"],
-        "birth_year": 1973,
-    },
-    "Jason-Wilcox": {
-        "id": "6b9fa9ad",
-        "nationality": ["eng"],
-        "position": ["FW", "MF"],
-        "birth_year": 1971,
-    },
-    "Darren-Williams": {
-        "id": "45364051",
-        "nationality": ["eng"],
-        "position": ["DF"],
-        "birth_year": 1977,
-    },
-    "Paul-Williams": {
-        "id": "651f09cc",
-        "nationality": ["eng"],
-        "position": ["DF"],
-        "birth_year": 1971,
-    },
-    "Fabian-Wilnis": {
-        "id": "5c30b55b",
-        "nationality": ["nl"],
-        "position": ["DF"],
-        "birth_year": 1970,
-    },
-    "Sylvain-Wiltord": {
-        "id": "cdccf255",
-        "nationality": ["fr"],
-        "position": ["FW", "MF"],
-        "birth_year": 1974,
-    },
-    "Dean-Windass": {
-        "id": "5d318f2d",
-        "nationality": ["eng"],
-        "position": ["FW", "MF"],
-        "birth_year": 1969,
-    },
-    "Nigel-Winterburn": {
-        "id": "0672e24e",
-        "nationality": ["eng"],
-        "position": ["DF"],
-        "birth_year": 1963,
-    },
-    "Dennis-Wise": {
-        "id": "e718c23d",
-        "nationality": ["eng"],
-        "position": ["MF"],
-        "birth_year": 1966,
-    },
-    "Jonathan-Woodgate": {
-        "id": "9482a3bd",
-        "nationality": ["eng"],
-        "position": ["DF"],
-        "birth_year": 1980,
-    },
-    "Alan-Wright": {
-        "id": "df6cf3fe",
-        "nationality": ["eng"],
-        "position": ["DF"],
-        "birth_year": 1971,
-    },
-    "Jermaine-Wright": {
-        "id": "ed9cb8eb",
-        "nationality": ["eng"],
-        "position": ["DF", "MF"],
-        "birth_year": 1975,
-    },
-    "Richard-Wright": {
-        "id": "d9e2e2ae",
-        "nationality": ["eng"],
-        "position": ["GK"],
-        "birth_year": 1977,
-    },
-    "Stephen-Wright": {
-        "id": "1ec640c7",
-        "nationality": ["sct"],
-        "position": ["DF"],
-        "birth_year": 1971,
-    },
-    "Tommy-Wright": {
-        "id": "a5e01fbe",
-        "nationality": ["nir"],
-        "position": ["GK"],
-        "birth_year": 1963,
-    },
-    "Shaun-Wright-Phillips": {
-        "id": "e1e0b05f",
-        "nationality": ["eng"],
-        "position": ["FW", "MF"],
-        "birth_year": 1981,
-    },
-    "Abel-Xavier": {
-        "id": "1c4eb067",
-        "nationality": ["pt"],
-        "position": ["DF"],
-        "birth_year": 1972,
-    },
-    "Dwight-Yorke": {
-        "id": "2d0a99d3",
-        "nationality": ["tt"],
-        "position": ["FW", "MF"],
-        "birth_year": 1971,
-    },
-    "Luke-Young": {
-        "id": "409a29d7",
-        "nationality": ["eng"],
-        "position": ["DF"],
-        "birth_year": 1979,
-    },
-    "Christian-Ziege": {
-        "id": "c2984c2d",
-        "nationality": ["de"],
-        "position": ["DF", "MF"],
-        "birth_year": 1972,
-    },
-    "Gianfranco-Zola": {
-        "id": "59883773",
-        "nationality": ["it"],
-        "position": ["FW"],
-        "birth_year": 1966,
-    },
-    "Ysrael-Z\u00fa\u00f1iga": {
-        "id": "ca25d6b6",
-        "nationality": ["pe"],
-        "position": ["FW"],
-        "birth_year": 1976,
-    },
-    "Egil-\u00d8stenstad": {
-        "id": "bc242ac0",
-        "nationality": ["no"],
-        "position": ["FW"],
-        "birth_year": 1972,
-    },
-    "Christian-Abbiati": {
-        "id": "322421c2",
-        "nationality": ["it"],
-        "position": ["GK"],
-        "birth_year": 1977,
-    },
-    "Ada\u00edlton": {
-        "id": "06e3ae04",
-        "nationality": ["br"],
-        "position": ["FW"],
-        "birth_year": 1977,
-    },
-    "Daniele-Adani": {
-        "id": "ea6479e8",
-        "nationality": ["it"],
-        "position": ["DF"],
-        "birth_year": 1974,
-    },
-    "Demetrio-Albertini": {
-        "id": "91a9535a",
-        "nationality": ["it"],
-        "position": ["FW", "MF"],
-        "birth_year": 1971,
-    },
-    "Aldair": {
-        "id": "7b0ec088",
-        "nationality": ["br"],
-        "position": ["DF"],
-        "birth_year": 1965,
-    },
-    "Mat\u00edas-Almeyda": {
-        "id": "cea39bc0",
-        "nationality": ["ar"],
-        "position": ["DF", "MF"],
-        "birth_year": 1973,
-    },
-    "Amaral": {
-        "id": "672af6eb",
-        "nationality": ["br"],
-        "position": ["MF"],
-        "birth_year": 1973,
-    },
-    "Leandro-Amaral": {
-        "id": "e8f1f331",
-        "nationality": ["br"],
-        "position": ["FW"],
-        "birth_year": 1977,
-    },
-    "Amauri": {
-        "id": "b6d4bf9d",
-        "nationality": ["it"],
-        "position": ["FW"],
-        "birth_year": 1980,
-    },
-    "Massimo-Ambrosini": {
-        "id": "26b20735",
-        "nationality": ["it"],
-        "position": ["MF"],
-        "birth_year": 1977,
-    },
-    "Christian-Amoroso": {
-        "id": "a2a1210f",
-        "nationality": ["it"],
-        "position": ["MF"],
-        "birth_year": 1976,
-    },
-    "M\u00e1rcio-Amoroso": {
-        "id": "1e1bf801",
-        "nationality": ["br"],
-        "position": ["FW"],
-        "birth_year": 1974,
-    },
-    "Nicola-Amoruso": {
-        "id": "a65205a4",
-        "nationality": ["it"],
-        "position": ["FW"],
-        "birth_year": 1974,
-    },
-    "Luigi-Anaclerio": {
-        "id": "ae06f079",
-        "nationality": ["it"],
-        "position": ["FW"],
-        "birth_year": 1981,
-    },
-    "Michele-Anaclerio": {
-        "id": "87264b8b",
-        "nationality": ["it"],
-        "position": ["DF"],
-        "birth_year": 1982,
-    },
-    "Daniel-Andersson": {
-        "id": "b12ba903",
-        "nationality": ["se"],
-        "position": ["DF", "MF"],
-        "birth_year": 1977,
-    },
-    "Francesco-Antonioli": {
-        "id": "0fa7ec78",
-        "nationality": ["it"],
-        "position": ["GK"],
-        "birth_year": 1969,
-    },
-    "Luigi-Apolloni": {
-        "id": "dfd97a99",
-        "nationality": ["it"],
-        "position": ["DF"],
-        "birth_year": 1967,
-    },
-    "Stephen-Appiah": {
-        "id": "c4fb13cc",
-        "nationality": ["gh"],
-        "position": ["MF"],
-        "birth_year": 1980,
-    },
-    "Leonardo-Ara\u00fajo": {
-        "id": "a4a7f96a",
-        "nationality": ["br"],
-        "position": ["DF", "MF"],
-        "birth_year": 1969,
-    },
-    "Marcos-Assun\u00e7\u00e3o": {
-        "id": "2c563885",
-        "nationality": ["br"],
-        "position": ["MF"],
-        "birth_year": 1976,
-    },
-    "Athirson": {
-        "id": "c90b26be",
-        "nationality": ["br"],
-        "position": ["DF", "MF"],
-        "birth_year": 1977,
-    },
-    "Marco-Aur\u00e9lio": {
-        "id": "f436428b",
-        "nationality": ["br"],
-        "position": ["DF"],
-        "birth_year": 1967,
-    },
-    "Ibrahim-Ba": {
-        "id": "509ff2ca",
-        "nationality": ["fr"],
-        "position": ["MF"],
-        "birth_year": 1973,
-    },
-    "Dario-Baccin": {
-        "id": "9358a20d",
-        "nationality": ["it"],
-        "position": ["DF"],
-        "birth_year": 1976,
-    },
-    "Jonathan-Bachini": {
-        "id": "7aa43273",
-        "nationality": ["it"],
-        "position": ["MF"],
-        "birth_year": 1975,
-    },
-    "Dino-Baggio": {
-        "id": "0e351891",
-        "nationality": ["it"],
-        "position": ["MF"],
-        "birth_year": 1971,
-    },
-    "Roberto-Baggio": {
-        "id": "2bd30258",
-        "nationality": ["it"],
-        "position": ["FW", "MF"],
-        "birth_year": 1967,
-    },
-    "Davide-Baiocco": {
-        "id": "98a44c3c",
-        "nationality": ["it"],
-        "position": ["MF"],
-        "birth_year": 1975,
-    },
-    "Abel-Balbo": {
-        "id": "1757d7bb",
-        "nationality": ["ar"],
-        "position": ["FW"],
-        "birth_year": 1966,
-    },
-    "Francesco-Baldini": {
-        "id": "0d796e28",
-        "nationality": ["it"],
-        "position": ["DF"],
-        "birth_year": 1974,
-    },
-    "David-Balleri": {
-        "id": "c7b5e823",
-        "nationality": ["it"],
-        "position": ["DF"],
-        "birth_year": 1969,
-    },
-    "Marco-Ballotta": {
-        "id": "6e313d9f",
-        "nationality": ["it"],
-        "position": ["GK"],
-        "birth_year": 1964,
-    },
-    "Giacomo-Banchelli": {
-        "id": "41d0dded",
-        "nationality": ["it"],
-        "position": ["FW"],
-        "birth_year": 1973,
-    },
-    "Roberto-Baronio": {
-        "id": "6888b53a",
-        "nationality": ["it"],
-        "position": ["MF"],
-        "birth_year": 1977,
-    },
-    "Giovanni-Bartolucci": {
-        "id": "0396f3ab",
-        "nationality": ["it"],
-        "position": ["DF"],
-        "birth_year": 1984,
-    },
-    "Anthony-Basso": {
-        "id": "6b371c52",
-        "nationality": ["fr"],
-        "position": ["GK"],
-        "birth_year": 1979,
-    },
-    "Gabriel-Batistuta": {
-        "id": "792d83d1",
-        "nationality": ["ar"],
-        "position": ["FW"],
-        "birth_year": 1969,
-    },
-    "Nicola-Beati": {
-        "id": "a7245dc9",
-        "nationality": ["it"],
-        "position": ["MF"],
-        "birth_year": 1983,
-    },
-    "Maurizio-Bedin": {
-        "id": "f2ae1129",
-        "nationality": ["it"],
-        "position": ["MF"],
-        "birth_year": 1979,
-    },
-    "Massimo-Beghetto": {
-        "id": "fbd08c72",
-        "nationality": ["it"],
-        "position": ["DF"],
-        "birth_year": 1968,
-    },
-    "Emanuele-Belardi": {
-        "id": "788d51fa",
-        "nationality": ["it"],
-        "position": ["GK"],
-        "birth_year": 1977,
-    },
-    "Antonio-Bellavista": {
-        "id": "d71fe506",
-        "nationality": ["it"],
-        "position": ["MF"],
-        "birth_year": 1977,
-    },
-    "Gianpaolo-Bellini": {
-        "id": "77b818ea",
-        "nationality": ["it"],
-        "position": ["DF"],
-        "birth_year": 1980,
-    },
-    "Claudio-Bellucci": {
-        "id": "a47ab95c",
-        "nationality": ["it"],
-        "position": ["FW"],
-        "birth_year": 1975,
-    },
-    "Antonio-Benarrivo": {
-        "id": "3de89755",
-        "nationality": ["it"],
-        "position": ["DF"],
-        "birth_year": 1968,
-    },
-    "Pasquale-Berardi": {
-        "id": "c865b3ef",
-        "nationality": ["it"],
-        "position": ["MF"],
-        "birth_year": 1983,
-    },
-    "Antonino-Bernardini": {
-        "id": "4da92d8c",
-        "nationality": ["it"],
-        "position": ["MF"],
-        "birth_year": 1974,
-    },
-    "Andrea-Bernini": {
-        "id": "3e9454d8",
-        "nationality": ["it"],
-        "position": ["MF"],
-        "birth_year": 1973,
-    },
-    "Daniele-Berretta": {
-        "id": "3250af95",
-        "nationality": ["it"],
-        "position": ["MF"],
-        "birth_year": 1972,
-    },
-    "Valerio-Bertotto": {
-        "id": "153e1fb3",
-        "nationality": ["it"],
-        "position": ["DF"],
-        "birth_year": 1975,
-    },
-    "Giovanni-Bia": {
-        "id": "d993e91c",
-        "nationality": ["it"],
-        "position": ["DF"],
-        "birth_year": 1968,
-    },
-    "Rolando-Bianchi": {
-        "id": "11fcbfe7",
-        "nationality": ["it"],
-        "position": ["FW"],
-        "birth_year": 1983,
-    },
-    "Oliver-Bierhoff": {
-        "id": "dbb8741e",
-        "nationality": ["de"],
-        "position": ["FW"],
-        "birth_year": 1968,
-    },
-    "Jonatan-Binotto": {
-        "id": "8285e9c1",
-        "nationality": ["it"],
-        "position": ["MF"],
-        "birth_year": 1975,
-    },
-    "Alessandro-Birindelli": {
-        "id": "3c388958",
-        "nationality": ["it"],
-        "position": ["DF"],
-        "birth_year": 1974,
-    },
-    "Morten-Bisgaard": {
-        "id": "eea9a247",
-        "nationality": ["dk"],
-        "position": ["MF"],
-        "birth_year": 1974,
-    },
-    "Pierpaolo-Bisoli": {
-        "id": "9f1c283a",
-        "nationality": ["it"],
-        "position": ["MF"],
-        "birth_year": 1966,
-    },
-    "Laurent-Blanc": {
-        "id": "51a9b34c",
-        "nationality": ["fr"],
-        "position": ["DF", "MF"],
-        "birth_year": 1965,
-    },
-    "Manuele-Blasi": {
-        "id": "7aae335a",
-        "nationality": ["it"],
-        "position": ["MF"],
-        "birth_year": 1980,
-    },
-    "Zvonimir-Boban": {
-        "id": "d588d6d5",
-        "nationality": ["hr"],
-        "position": ["MF"],
-        "birth_year": 1968,
-    },
-    "Antonio-Bocchetti": {
-        "id": "29e679e1",
-        "nationality": ["it"],
-        "position": ["DF"],
-        "birth_year": 1980,
-    },
-    "Erjon-Bogdani": {
-        "id": "b7b545b5",
-        "nationality": ["al"],
-        "position": ["FW"],
-        "birth_year": 1977,
-    },
-    "Alain-Boghossian": {
-        "id": "d6c5b299",
-        "nationality": ["fr"],
-        "position": ["FW", "MF"],
-        "birth_year": 1970,
-    },
-    "Jorge-Bola\u00f1o": {
-        "id": "00e58b20",
-        "nationality": ["co"],
-        "position": ["MF"],
-        "birth_year": 1977,
-    },
-    "Emiliano-Bonazzoli": {
-        "id": "8389aafc",
-        "nationality": ["it"],
-        "position": ["FW"],
-        "birth_year": 1979,
-    },
-    "Daniele-Bonera": {
-        "id": "13b0c150",
-        "nationality": ["it"],
-        "position": ["DF"],
-        "birth_year": 1981,
-    },
-    "Giacomo-Bonora": {
-        "id": "381c02bc",
-        "nationality": ["it"],
-        "position": ["DF"],
-        "birth_year": 1980,
-    },
-    "Mauro-Bressan": {
-        "id": "676878ec",
-        "nationality": ["it"],
-        "position": ["MF"],
-        "birth_year": 1971,
-    },
-    "Ezio-Brevi": {
-        "id": "1accca52",
-        "nationality": ["it"],
-        "position": ["DF", "MF"],
-        "birth_year": 1970,
-    },
-    "Matteo-Brighi": {
-        "id": "d417b306",
-        "nationality": ["it"],
-        "position": ["MF"],
-        "birth_year": 1981,
-    },
-    "Emanuele-Brioschi": {
-        "id": "d973aa11",
-        "nationality": ["it"],
-        "position": ["DF"],
-        "birth_year": 1975,
-    },
-    "Dra\u017een-Brn\u010di\u0107": {
-        "id": "eb13555e",
-        "nationality": ["be"],
-        "position": ["DF", "MF"],
-        "birth_year": 1971,
-    },
-    "Cristian-Brocchi": {
-        "id": "14165e5f",
-        "nationality": ["it"],
-        "position": ["MF"],
-        "birth_year": 1976,
-    },
-    "Cristian-Bucchi": {
-        "id": "8df7ea1e",
-        "nationality": ["it"],
-        "position": ["FW"],
-        "birth_year": 1977,
-    },
-    "Gianluigi-Buffon": {
-        "id": "e40d028b",
-        "nationality": ["it"],
-        "position": ["GK"],
-        "birth_year": 1978,
-    },
-    "Caf\u00fa": {
-        "id": "f0ee7526",
-        "nationality": ["cv"],
-        "position": ["FW"],
-        "birth_year": 1977,
-    },
-    "Alessandro-Calori": {
-        "id": "7398c290",
-        "nationality": ["it"],
-        "position": ["DF"],
-        "birth_year": 1966,
-    },
-    "Mauro-Camoranesi": {
-        "id": "35163a80",
-        "nationality": ["it"],
-        "position": ["MF"],
-        "birth_year": 1976,
-    },
-    "Vincent-Candela": {
-        "id": "489d2628",
-        "nationality": ["fr"],
-        "position": ["DF", "MF"],
-        "birth_year": 1973,
-    },
-    "Marco-Caneira": {
-        "id": "e2ad9feb",
-        "nationality": ["pt"],
-        "position": ["DF"],
-        "birth_year": 1979,
-    },
-    "Fabio-Cannavaro": {
-        "id": "51152527",
-        "nationality": ["it"],
-        "position": ["DF"],
-        "birth_year": 1973,
-    },
-    "Paolo-Cannavaro": {
-        "id": "46ed55b6",
-        "nationality": ["it"],
-        "position": ["DF"],
-        "birth_year": 1981,
-    },
-    "Giuseppe-Cardone": {
-        "id": "9af326f7",
-        "nationality": ["it"],
-        "position": ["DF"],
-        "birth_year": 1974,
-    },
-    "Ant\u00f4nio-Carlos": {
-        "id": "bc73bbd3",
-        "nationality": ["br"],
-        "position": ["DF"],
-        "birth_year": 1969,
-    },
-    "Massimo-Carrera": {
-        "id": "8e09a712",
-        "nationality": ["it"],
-        "position": ["DF"],
-        "birth_year": 1964,
-    },
-    "Antonio-Cassano": {
-        "id": "d0ed4d32",
-        "nationality": ["it"],
-        "position": ["FW"],
-        "birth_year": 1982,
-    },
-    "Marco-Cassetti": {
-        "id": "d607e02f",
-        "nationality": ["it"],
-        "position": ["DF", "MF"],
-        "birth_year": 1977,
-    },
-    "Luca-Castellazzi": {
-        "id": "36281ecb",
-        "nationality": ["it"],
-        "position": ["GK"],
-        "birth_year": 1975,
-    },
-    "Marcello-Castellini": {
-        "id": "a5e71a54",
-        "nationality": ["it"],
-        "position": ["DF"],
-        "birth_year": 1973,
-    },
-    "Lucas-Castrom\u00e1n": {
-        "id": "a055c12e",
-        "nationality": ["ar"],
-        "position": ["FW", "MF"],
-        "birth_year": 1980,
-    },
-    "Beno\u00eet-Cauet": {
-        "id": "eea89132",
-        "nationality": ["fr"],
-        "position": ["MF"],
-        "birth_year": 1969,
-    },
-    "Axel-C\u00e9dric-Konan": {
-        "id": "7f8969ae",
-        "nationality": ["ci"],
-        "position": ["FW"],
-        "birth_year": 1983,
-    },
-    "J\u00falio-C\u00e9sar": {
-        "id": "754ac76b",
-        "nationality": ["br"],
-        "position": ["DF"],
-        "birth_year": 1978,
-    },
-    "Jos\u00e9-Chamot": {
-        "id": "5cebcd18",
-        "nationality": ["ar"],
-        "position": ["DF"],
-        "birth_year": 1969,
-    },
-    "Enrico-Chiesa": {
-        "id": "28dd2f5b",
-        "nationality": ["it"],
-        "position": ["FW"],
-        "birth_year": 1970,
-    },
-    "Antonio-Chimenti": {
-        "id": "96d5e916",
-        "nationality": ["it"],
-        "position": ["GK"],
-        "birth_year": 1970,
-    },
-    "Giacomo-Cipriani": {
-        "id": "0e09b48a",
-        "nationality": ["it"],
-        "position": ["FW"],
-        "birth_year": 1980,
-    },
-    "Bruno-Cirillo": {
-        "id": "94ffc023",
-        "nationality": ["it"],
-        "position": ["DF"],
-        "birth_year": 1977,
-    },
-    "Claiton": {
-        "id": "67a3c8bc",
-        "nationality": ["br"],
-        "position": ["DF"],
-        "birth_year": 1984,
-    },
-    "Francesco-Coco": {
-        "id": "70f1f304",
-        "nationality": ["it"],
-        "position": ["DF"],
-        "birth_year": 1977,
-    },
-    "Sandro-Cois": {
-        "id": "289d7e12",
-        "nationality": ["it"],
-        "position": ["MF"],
-        "birth_year": 1972,
-    },
-    "Mattia-Collauto": {
-        "id": "e4bca0cd",
-        "nationality": ["it"],
-        "position": ["MF"],
-        "birth_year": 1973,
-    },
-    "Corrado-Colombo": {
-        "id": "803e5dfe",
-        "nationality": ["it"],
-        "position": ["FW"],
-        "birth_year": 1979,
-    },
-    "Gianluca-Colonnello": {
-        "id": "bfccbe32",
-        "nationality": ["it"],
-        "position": ["DF"],
-        "birth_year": 1973,
-    },
-    "Francesco-Colonnese": {
-        "id": "57d6ff32",
-        "nationality": ["it"],
-        "position": ["DF"],
-        "birth_year": 1971,
-    },
-    "Giuseppe-Colucci": {
-        "id": "e41ba477",
-        "nationality": ["it"],
-        "position": ["MF"],
-        "birth_year": 1980,
-    },
-    "Leonardo-Colucci": {
-        "id": "762cc140",
-        "nationality": ["it"],
-        "position": ["MF"],
-        "birth_year": 1972,
-    },
-    "Gianni-Comandini": {
-        "id": "39a10c25",
-        "nationality": ["it"],
-        "position": ["FW"],
-        "birth_year": 1977,
-    },
-    "Gianluca-Comotto": {
-        "id": "d7a5f9ce",
-        "nationality": ["it"],
-        "position": ["DF"],
-        "birth_year": 1978,
-    },
-    "S\u00e9rgio-Concei\u00e7\u00e3o": {
-        "id": "f396d247",
-        "nationality": ["pt"],
-        "position": ["MF"],
-        "birth_year": 1974,
-    },
-    "Antonio-Conte": {"id": ""},
-    "Alessandro-Conticchio": {
-        "id": "62eb5677",
-        "nationality": ["it"],
-        "position": ["MF"],
-        "birth_year": 1974,
-    },
-    "Ferdinando-Coppola": {
-        "id": "7feaf90b",
-        "nationality": ["it"],
-        "position": ["GK"],
-        "birth_year": 1978,
-    },
-    "Iv\u00e1n-C\u00f3rdoba": {
-        "id": "853b902b",
-        "nationality": ["co"],
-        "position": ["DF"],
-        "birth_year": 1976,
-    },
-    "Alejandro-Correa": {
-        "id": "19ec4e79",
-        "nationality": ["uy"],
-        "position": ["MF"],
-        "birth_year": 1979,
-    },
-    "Michele-Cossato": {
-        "id": "cf99710c",
-        "nationality": ["it"],
-        "position": ["FW"],
-        "birth_year": 1970,
-    },
-    "Paulo-Costa": {
-        "id": "aca60c39",
-        "nationality": ["pt"],
-        "position": ["MF"],
-        "birth_year": 1979,
-    },
-    "Rui-Costa": {
-        "id": "ecf1642b",
-        "nationality": ["pt"],
-        "position": ["MF"],
-        "birth_year": 1972,
-    },
-    "Alessandro-Costacurta": {
-        "id": "69f22898",
-        "nationality": ["it"],
-        "position": ["DF"],
-        "birth_year": 1966,
-    },
-    "Fernando-Couto": {
-        "id": "fa2e0b8a",
-        "nationality": ["pt"],
-        "position": ["DF"],
-        "birth_year": 1969,
-    },
-    "Francesco-Cozza": {
-        "id": "f8ea6e80",
-        "nationality": ["it"],
-        "position": ["MF"],
-        "birth_year": 1974,
-    },
-    "Hern\u00e1n-Crespo": {
-        "id": "09089343",
-        "nationality": ["ar"],
-        "position": ["FW"],
-        "birth_year": 1975,
-    },
-    "Federico-Crovari": {
-        "id": "861c28a5",
-        "nationality": ["it"],
-        "position": ["MF"],
-        "birth_year": 1975,
-    },
-    "Mario-Cvitanovi\u0107": {
-        "id": "210801ab",
-        "nationality": ["hr"],
-        "position": ["DF"],
-        "birth_year": 1975,
-    },
-    "Gaetano-D'Agostino": {
-        "id": "7a469087",
-        "nationality": ["it"],
-        "position": ["MF"],
-        "birth_year": 1982,
-    },
-    "Ousmane-Dabo": {
-        "id": "9af295a5",
-        "nationality": ["fr"],
-        "position": ["MF"],
-        "birth_year": 1977,
-    },
-    "Dario-Dainelli": {
-        "id": "3858e611",
-        "nationality": ["it"],
-        "position": ["DF"],
-        "birth_year": 1979,
-    },
-    "Daniele-Daino": {
-        "id": "fd5eea43",
-        "nationality": ["it"],
-        "position": ["DF"],
-        "birth_year": 1979,
-    },
-    "Alessandro-Dal-Canto": {
-        "id": "b43aab00",
-        "nationality": ["it"],
-        "position": ["DF"],
-        "birth_year": 1975,
-    },
-    "St\u00e9phane-Dalmat": {
-        "id": "d5fe3aa1",
-        "nationality": ["fr"],
-        "position": ["MF"],
-        "birth_year": 1979,
-    },
-    "Gabriele-Davanzante": {
-        "id": "35847dbf",
-        "nationality": ["it"],
-        "position": ["MF"],
-        "birth_year": 1981,
-    },
-    "Edgar-Davids": {
-        "id": "19d5e43e",
-        "nationality": ["nl"],
-        "position": ["MF"],
-        "birth_year": 1973,
-    },
-    "Joseph-Dayo-Oshadogan": {
-        "id": "01099c91",
-        "nationality": ["it"],
-        "position": ["DF"],
-        "birth_year": 1976,
-    },
-    "Gaetano-De-Rosa": {
-        "id": "3022964d",
-        "nationality": ["it"],
-        "position": ["DF"],
-        "birth_year": 1973,
-    },
-    "Morgan-De-Sanctis": {
-        "id": "83228343",
-        "nationality": ["it"],
-        "position": ["GK"],
-        "birth_year": 1977,
-    },
-    "Alessandro-Del-Grosso": {
-        "id": "70747da7",
-        "nationality": ["it"],
-        "position": ["DF"],
-        "birth_year": 1972,
-    },
-    "Simone-Del-Nero": {
-        "id": "ce1ace0d",
-        "nationality": ["it"],
-        "position": ["DF", "FW"],
-        "birth_year": 1981,
-    },
-    "Alessandro-Del-Piero": {
-        "id": "80bc263c",
-        "nationality": ["it"],
-        "position": ["FW", "MF"],
-        "birth_year": 1974,
-    },
-    "Luigi-Della-Rocca": {
-        "id": "9ed9e4f5",
-        "nationality": ["it"],
-        "position": ["FW"],
-        "birth_year": 1984,
-    },
-    "Marco-Delvecchio": {
-        "id": "f7a94520",
-        "nationality": ["it"],
-        "position": ["FW"],
-        "birth_year": 1973,
-    },
-    "Edwin-van-der-Sar": {
-        "id": "98ee8a67",
-        "nationality": ["nl"],
-        "position": ["GK"],
-        "birth_year": 1970,
-    },
-    "Luigi-Di-Biagio": {
-        "id": "7b085418",
-        "nationality": ["it"],
-        "position": ["MF"],
-        "birth_year": 1971,
-    },
-    "Eusebio-Di-Francesco": {
-        "id": "9a729928",
-        "nationality": ["it"],
-        "position": ["MF"],
-        "birth_year": 1969,
-    },
-    "Angelo-Di-Livio": {
-        "id": "88fb629b",
-        "nationality": ["it"],
-        "position": ["DF", "MF"],
-        "birth_year": 1966,
-    },
-    "Marco-Di-Loreto": {
-        "id": "b0c42340",
-        "nationality": ["it"],
-        "position": ["DF"],
-        "birth_year": 1974,
-    },
-    "Marco-Di-Vaio": {
-        "id": "dfa05223",
-        "nationality": ["it"],
-        "position": ["FW"],
-        "birth_year": 1976,
-    },
-    "Giorgio-Di-Vicino": {
-        "id": "5c0c1f44",
-        "nationality": ["it"],
-        "position": ["MF"],
-        "birth_year": 1980,
-    },
-    "Aimo-Diana": {
-        "id": "d2c9e8e2",
-        "nationality": ["it"],
-        "position": ["DF", "MF"],
-        "birth_year": 1978,
-    },
-    "Christian-D\u00edaz": {
-        "id": "4c6f6ef4",
-        "nationality": ["ar"],
-        "position": ["DF", "MF"],
-        "birth_year": 1976,
-    },
-    "Giacomo-Dicara": {
-        "id": "d4bec4f1",
-        "nationality": ["it"],
-        "position": ["DF"],
-        "birth_year": 1970,
-    },
-    "Dida": {
-        "id": "294919b2",
-        "nationality": ["br"],
-        "position": ["GK"],
-        "birth_year": 1973,
-    },
-    "Davide-Dionigi": {
-        "id": "83dc0b9c",
-        "nationality": ["it"],
-        "position": ["MF"],
-        "birth_year": 1974,
-    },
-    "Domenico-Doardo": {
-        "id": "83c0a5d9",
-        "nationality": ["it"],
-        "position": ["GK"],
-        "birth_year": 1974,
-    },
-    "Marco-Donadel": {
-        "id": "3169af41",
-        "nationality": ["it"],
-        "position": ["MF"],
-        "birth_year": 1983,
-    },
-    "Massimo-Donati": {
-        "id": "568d84b2",
-        "nationality": ["it"],
-        "position": ["MF"],
-        "birth_year": 1981,
-    },
-    "Cristiano-Doni": {
-        "id": "4b6a7e60",
-        "nationality": ["it"],
-        "position": ["MF"],
-        "birth_year": 1973,
-    },
-    "Ljubi\u0161a-Dun\u0111erski": {
-        "id": "cc6d1bf0",
-        "nationality": ["rs"],
-        "position": ["MF"],
-        "birth_year": 1972,
-    },
-    "Edmundo": {
-        "id": "5508a7cf",
-        "nationality": ["br"],
-        "position": ["FW", "MF"],
-        "birth_year": 1971,
-    },
-    "Emerson": {
-        "id": "67d57df1",
-        "nationality": ["br"],
-        "position": ["MF"],
-        "birth_year": 1972,
-    },
-    "Hugo-Enyinnaya": {
-        "id": "ef608111",
-        "nationality": ["ng"],
-        "position": ["FW"],
-        "birth_year": 1981,
-    },
-    "Jos\u00e9-Espinal": {
-        "id": "6acd7a3d",
-        "nationality": ["do"],
-        "position": ["FW", "MF"],
-        "birth_year": 1982,
-    },
-    "Vinicio-Espinal": {
-        "id": "2fa8aa4d",
-        "nationality": ["do"],
-        "position": ["MF"],
-        "birth_year": 1982,
-    },
-    "Carmine-Esposito": {
-        "id": "c517c79d",
-        "nationality": ["it"],
-        "position": ["FW"],
-        "birth_year": 1970,
-    },
-    "Massimiliano-Esposito": {
-        "id": "12925390",
-        "nationality": ["it"],
-        "position": ["MF"],
-        "birth_year": 1972,
-    },
-    "Mauro-Esposito": {
-        "id": "ef9aecbb",
-        "nationality": ["it"],
-        "position": ["FW", "MF"],
-        "birth_year": 1979,
-    },
-    "Vasco-Fa\u00edsca": {
-        "id": "f6c38a9d",
-        "nationality": ["pt"],
-        "position": ["DF"],
-        "birth_year": 1980,
-    },
-    "Giulio-Falcone": {
-        "id": "fc96ae28",
-        "nationality": ["it"],
-        "position": ["DF"],
-        "birth_year": 1974,
-    },
-    "Gianluca-Falsini": {
-        "id": "940691eb",
-        "nationality": ["it"],
-        "position": ["DF"],
-        "birth_year": 1975,
-    },
-    "Javier-Farin\u00f3s": {
-        "id": "d9b0f08e",
-        "nationality": ["es"],
-        "position": ["MF"],
-        "birth_year": 1978,
-    },
-    "Stefano-Fattori": {
-        "id": "acc5bd59",
-        "nationality": ["it"],
-        "position": ["DF"],
-        "birth_year": 1972,
-    },
-    "Giuseppe-Favalli": {
-        "id": "4e960f0f",
-        "nationality": ["it"],
-        "position": ["DF"],
-        "birth_year": 1972,
-    },
-    "Marco-Ferrante": {
-        "id": "b07ddfbb",
-        "nationality": ["it"],
-        "position": ["FW"],
-        "birth_year": 1971,
-    },
-    "Ciro-Ferrara": {
-        "id": "d31cea40",
-        "nationality": ["it"],
-        "position": ["DF"],
-        "birth_year": 1967,
-    },
-    "Claudio-Ferrarese": {
-        "id": "d1d96205",
-        "nationality": ["it"],
-        "position": ["MF"],
-        "birth_year": 1978,
-    },
-    "Matteo-Ferrari": {
-        "id": "218f3d60",
-        "nationality": ["it"],
-        "position": ["DF"],
-        "birth_year": 1979,
-    },
-    "Fabrizio-Ferron": {
-        "id": "1ec82e86",
-        "nationality": ["it"],
-        "position": ["GK"],
-        "birth_year": 1965,
-    },
-    "Antonio-Filippini": {
-        "id": "7f621318",
-        "nationality": ["it"],
-        "position": ["DF", "MF"],
-        "birth_year": 1973,
-    },
-    "Emanuele-Filippini": {
-        "id": "b6c4ff9c",
-        "nationality": ["it"],
-        "position": ["MF"],
-        "birth_year": 1973,
-    },
-    "Giancarlo-Filippini": {
-        "id": "dba1880c",
-        "nationality": ["it"],
-        "position": ["DF"],
-        "birth_year": 1968,
-    },
-    "Stefano-Fiore": {
-        "id": "2eb707d3",
-        "nationality": ["it"],
-        "position": ["MF"],
-        "birth_year": 1975,
-    },
-    "Aldo-Firicano": {
-        "id": "124f70ed",
-        "nationality": ["it"],
-        "position": ["DF"],
-        "birth_year": 1967,
-    },
-    "Fabio-Firmani": {
-        "id": "98dfb43e",
-        "nationality": ["it"],
-        "position": ["MF"],
-        "birth_year": 1978,
-    },
-    "Riccardo-Fissore": {
-        "id": "fe175835",
-        "nationality": ["it"],
-        "position": ["DF"],
-        "birth_year": 1980,
-    },
-    "Antonio-Floro-Flores": {
-        "id": "d6846501",
-        "nationality": ["it"],
-        "position": ["FW"],
-        "birth_year": 1983,
-    },
-    "Daniel-Fonseca": {
-        "id": "edc7f72a",
-        "nationality": ["uy"],
-        "position": ["FW"],
-        "birth_year": 1969,
-    },
-    "Alberto-Fontana": {
-        "id": "1942d36b",
-        "nationality": ["it"],
-        "position": ["GK"],
-        "birth_year": 1967,
-    },
-    "Marco-Franceschetti": {
-        "id": "cf14583a",
-        "nationality": ["it"],
-        "position": ["MF"],
-        "birth_year": 1967,
-    },
-    "Jorge-Francisco-Vargas": {
-        "id": "08863412",
-        "nationality": ["cl"],
-        "position": ["DF"],
-        "birth_year": 1976,
-    },
-    "Salvatore-Fresi": {
-        "id": "b1844739",
-        "nationality": ["it"],
-        "position": ["DF"],
-        "birth_year": 1973,
-    },
-    "S\u00e9bastien-Frey": {
-        "id": "e1d3c5a8",
-        "nationality": ["fr"],
-        "position": ["GK"],
-        "birth_year": 1980,
-    },
-    "Nicola-Fumai": {"id": "52055ec0", "birth_year": 1981},
-    "Diego-Fuser": {
-        "id": "8467e7f0",
-        "nationality": ["it"],
-        "position": ["MF"],
-        "birth_year": 1968,
-    },
-    "Allan-Gaarde": {
-        "id": "0ff5054d",
-        "nationality": ["dk"],
-        "position": ["MF"],
-        "birth_year": 1975,
-    },
-    "Filippo-Galli": {
-        "id": "4b5f3c23",
-        "nationality": ["it"],
-        "position": ["DF"],
-        "birth_year": 1963,
-    },
-    "Niccol\u00f2-Galli": {
-        "id": "4e4ee573",
-        "nationality": ["it"],
-        "position": ["DF"],
-        "birth_year": 1983,
-    },
-    "Fabio-Gallo": {
-        "id": "4e3dab16",
-        "nationality": ["it"],
-        "position": ["MF"],
-        "birth_year": 1970,
-    },
-    "Alessandro-Gamberini": {
-        "id": "8ec95452",
-        "nationality": ["it"],
-        "position": ["DF"],
-        "birth_year": 1981,
-    },
-    "Maurizio-Ganz": {
-        "id": "0df039c2",
-        "nationality": ["it"],
-        "position": ["FW", "MF"],
-        "birth_year": 1968,
-    },
-    "Pablo-Garc\u00eda": {
-        "id": "911299ca",
-        "nationality": ["uy"],
-        "position": ["DF", "MF"],
-        "birth_year": 1977,
-    },
-    "Mohammed-Gargo": {
-        "id": "35bc50fc",
-        "nationality": ["gh"],
-        "position": ["DF"],
-        "birth_year": 1975,
-    },
-    "Fabio-Gatti": {
-        "id": "4424bcaf",
-        "nationality": ["it"],
-        "position": ["MF"],
-        "birth_year": 1982,
-    },
-    "Gennaro-Gattuso": {
-        "id": "46b066b5",
-        "nationality": ["it"],
-        "position": ["MF"],
-        "birth_year": 1978,
-    },
-    "R\u00e9gis-Genaux": {
-        "id": "36ba562d",
-        "nationality": ["be"],
-        "position": ["DF"],
-        "birth_year": 1973,
-    },
-    "Giuliano-Giannichedda": {
-        "id": "1bfa94c1",
-        "nationality": ["it"],
-        "position": ["MF"],
-        "birth_year": 1974,
-    },
-    "Alberto-Gilardino": {
-        "id": "45aa5d13",
-        "nationality": ["it"],
-        "position": ["FW"],
-        "birth_year": 1982,
-    },
-    "Jean-Fran\u00e7ois-Gillet": {
-        "id": "ee013fa5",
-        "nationality": ["be"],
-        "position": ["GK"],
-        "birth_year": 1979,
-    },
-    "Rodolfo-Giorgetti": {
-        "id": "a1526b09",
-        "nationality": ["it"],
-        "position": ["MF"],
-        "birth_year": 1971,
-    },
-    "Federico-Giunti": {
-        "id": "96dca9f2",
-        "nationality": ["it"],
-        "position": ["MF"],
-        "birth_year": 1971,
-    },
-    "Nuno-Gomes": {
-        "id": "ca5beb0d",
-        "nationality": ["pt"],
-        "position": ["FW"],
-        "birth_year": 1976,
-    },
-    "Natale-Gonnella": {
-        "id": "0654d766",
-        "nationality": ["it"],
-        "position": ["DF"],
-        "birth_year": 1976,
-    },
-    "Ra\u00fal-Gonz\u00e1lez": {
-        "id": "8c674bff",
-        "nationality": ["ar"],
-        "position": ["FW"],
-        "birth_year": 1976,
-    },
-    "Roberto-Goretti": {
-        "id": "c844c8c0",
-        "nationality": ["it"],
-        "position": ["MF"],
-        "birth_year": 1976,
-    },
-    "Guerino-Gottardi": {
-        "id": "6a7b83b8",
-        "nationality": ["ch"],
-        "position": ["DF", "MF"],
-        "birth_year": 1970,
-    },
-    "Attilio-Gregori": {
-        "id": "bb11c4b7",
-        "nationality": ["it"],
-        "position": ["GK"],
-        "birth_year": 1965,
-    },
-    "Pascual-de-Gregorio": {
-        "id": "9ca3fe74",
-        "nationality": ["cl"],
-        "position": ["FW"],
-        "birth_year": 1972,
-    },
-    "Vratislav-Gre\u0161ko": {
-        "id": "81bc6dbe",
-        "nationality": ["sk"],
-        "position": ["DF"],
-        "birth_year": 1977,
-    },
-    "Roberto-Guana": {
-        "id": "65fcaf78",
-        "nationality": ["it"],
-        "position": ["MF"],
-        "birth_year": 1981,
-    },
-    "Andr\u00e9s-Guglielminpietro": {
-        "id": "65f39e1b",
-        "nationality": ["ar"],
-        "position": ["MF"],
-        "birth_year": 1974,
-    },
-    "Gianni-Guigou": {
-        "id": "7c495f42",
-        "nationality": ["uy"],
-        "position": ["MF"],
-        "birth_year": 1975,
-    },
-    "Pablo-Gui\u00f1az\u00fa": {
-        "id": "83e77d5a",
-        "nationality": ["ar"],
-        "position": ["MF"],
-        "birth_year": 1978,
-    },
-    "Julio-Guti\u00e9rrez": {
-        "id": "d47e6dc9",
-        "nationality": ["cl"],
-        "position": ["FW"],
-        "birth_year": 1979,
-    },
-    "Luis-Helguera": {
-        "id": "873ff2a7",
-        "nationality": ["es"],
-        "position": ["MF"],
-        "birth_year": 1976,
-    },
-    "Thomas-Helveg": {
-        "id": "8388b5e0",
-        "nationality": ["dk"],
-        "position": ["DF"],
-        "birth_year": 1971,
-    },
-    "Dario-H\u00fcbner": {
-        "id": "f35487af",
-        "nationality": ["it"],
-        "position": ["FW"],
-        "birth_year": 1967,
-    },
-    "Claudio-Husa\u00edn": {
-        "id": "d87e872e",
-        "nationality": ["ar"],
-        "position": ["MF"],
-        "birth_year": 1974,
-    },
-    "Vincenzo-Iaquinta": {
-        "id": "69960e0c",
-        "nationality": ["it"],
-        "position": ["FW"],
-        "birth_year": 1979,
-    },
-    "Klas-Ingesson": {
-        "id": "2255df73",
-        "nationality": ["se"],
-        "position": ["MF"],
-        "birth_year": 1968,
-    },
-    "Giuseppe-Ingrosso": {
-        "id": "fcec8102",
-        "nationality": ["it"],
-        "position": ["DF"],
-        "birth_year": 1982,
-    },
-    "Duccio-Innocenti": {
-        "id": "0ee3b2d9",
-        "nationality": ["it"],
-        "position": ["DF"],
-        "birth_year": 1975,
-    },
-    "Filippo-Inzaghi": {
-        "id": "27b041d6",
-        "nationality": ["it"],
-        "position": ["FW"],
-        "birth_year": 1973,
-    },
-    "Simone-Inzaghi": {
-        "id": "5e479984",
-        "nationality": ["it"],
-        "position": ["FW"],
-        "birth_year": 1976,
-    },
-    "Vincenzo-Italiano": {
-        "id": "accda0f5",
-        "nationality": ["it"],
-        "position": ["MF"],
-        "birth_year": 1977,
-    },
-    "Mark-Iuliano": {
-        "id": "9385eaee",
-        "nationality": ["it"],
-        "position": ["DF"],
-        "birth_year": 1973,
-    },
-    "Marek-Jankulovski": {
-        "id": "faef7749",
-        "nationality": ["cz"],
-        "position": ["DF", "MF"],
-        "birth_year": 1977,
-    },
-    "Jeda": {
-        "id": "eeae9bc3",
-        "nationality": ["br"],
-        "position": ["FW"],
-        "birth_year": 1979,
-    },
-    "Martin-Jir\u00e1nek": {
-        "id": "eb005dc3",
-        "nationality": ["cz"],
-        "position": ["DF"],
-        "birth_year": 1979,
-    },
-    "Ju\u00e1rez": {
-        "id": "e860d365",
-        "nationality": ["br"],
-        "position": ["DF"],
-        "birth_year": 1973,
-    },
-    "Vladimir-Jugovi\u0107": {
-        "id": "0f06c0c9",
-        "nationality": ["rs"],
-        "position": ["MF"],
-        "birth_year": 1969,
-    },
-    "Ahn-Jung-hwan": {
-        "id": "6f10c5f4",
-        "nationality": ["kr"],
-        "position": ["FW", "MF"],
-        "birth_year": 1976,
-    },
-    "J\u00fanior": {
-        "id": "0f4a92dc",
-        "nationality": ["br"],
-        "position": ["DF", "MF"],
-        "birth_year": 1973,
-    },
-    "Roque-J\u00fanior": {
-        "id": "ef2d5206",
-        "nationality": ["br"],
-        "position": ["DF"],
-        "birth_year": 1976,
-    },
-    "Martin-J\u00f8rgensen": {
-        "id": "0d955bbe",
-        "nationality": ["dk"],
-        "position": ["MF"],
-        "birth_year": 1975,
-    },
-    "Kakha-Kaladze": {
-        "id": "342ab619",
-        "nationality": ["ge"],
-        "position": ["DF", "MF"],
-        "birth_year": 1978,
-    },
-    "Mohamed-Kallon": {
-        "id": "efe5e7b3",
-        "nationality": ["sl"],
-        "position": ["FW"],
-        "birth_year": 1979,
-    },
-    "Igor-Kolyvanov": {
-        "id": "b646463f",
-        "nationality": ["xc"],
-        "position": ["FW"],
-        "birth_year": 1968,
-    },
-    "Darko-Kova\u010devi\u0107": {
-        "id": "12c6ec44",
-        "nationality": ["rs"],
-        "position": ["FW"],
-        "birth_year": 1973,
-    },
-    "Marek-Ko\u017ami\u0144ski": {
-        "id": "5af7f2de",
-        "nationality": ["pl"],
-        "position": ["DF", "MF"],
-        "birth_year": 1971,
-    },
-    "Antonio-La-Fortezza": {
-        "id": "8bec6062",
-        "nationality": ["it"],
-        "position": ["MF"],
-        "birth_year": 1982,
-    },
-    "Sabri-Lamouchi": {
-        "id": "228b66e7",
-        "nationality": ["fr"],
-        "position": ["MF"],
-        "birth_year": 1971,
-    },
-    "Maurizio-Lanzaro": {
-        "id": "52eacf54",
-        "nationality": ["it"],
-        "position": ["DF"],
-        "birth_year": 1982,
-    },
-    "Saliou-Lassissi": {
-        "id": "8d409431",
-        "nationality": ["ci"],
-        "position": ["DF"],
-        "birth_year": 1978,
-    },
-    "Martin-Laursen": {
-        "id": "ab40cc8b",
-        "nationality": ["dk"],
-        "position": ["DF"],
-        "birth_year": 1977,
-    },
-    "Hil\u00e1rio-Leal": {
-        "id": "d232219a",
-        "nationality": ["pt"],
-        "position": ["DF"],
-        "birth_year": 1974,
-    },
-    "Francisco-Lima": {
-        "id": "01721c93",
-        "nationality": ["br"],
-        "position": ["MF"],
-        "birth_year": 1971,
-    },
-    "Fabio-Liverani": {
-        "id": "3fe72775",
-        "nationality": ["it"],
-        "position": ["MF"],
-        "birth_year": 1976,
-    },
-    "Tomas-Locatelli": {
-        "id": "5cf768a4",
-        "nationality": ["it"],
-        "position": ["FW", "MF"],
-        "birth_year": 1976,
-    },
-    "Stefano-Lombardi": {
-        "id": "73cc4ed6",
-        "nationality": ["it"],
-        "position": ["DF"],
-        "birth_year": 1976,
-    },
-    "Attilio-Lombardo": {
-        "id": "367b041c",
-        "nationality": ["it"],
-        "position": ["MF"],
-        "birth_year": 1966,
-    },
-    "Raffaele-Longo": {
-        "id": "ca2adedb",
-        "nationality": ["it"],
-        "position": ["MF"],
-        "birth_year": 1977,
-    },
-    "Claudio-L\u00f3pez": {
-        "id": "ce8a4e4c",
-        "nationality": ["ar"],
-        "position": ["FW"],
-        "birth_year": 1974,
-    },
-    "Stefano-Lorenzi": {
-        "id": "68c13467",
-        "nationality": ["it"],
-        "position": ["DF"],
-        "birth_year": 1977,
-    },
-    "Cristiano-Lucarelli": {
-        "id": "a8aebb58",
-        "nationality": ["it"],
-        "position": ["FW"],
-        "birth_year": 1975,
-    },
-    "Jos\u00e9-Lu\u00eds-Vidigal": {
-        "id": "10011693",
-        "nationality": ["pt"],
-        "position": ["MF"],
-        "birth_year": 1973,
-    },
-    "Pasquale-Luiso": {
-        "id": "ab361c4d",
-        "nationality": ["it"],
-        "position": ["FW"],
-        "birth_year": 1969,
-    },
-    "Cristiano-Lupatelli": {
-        "id": "0fb9a389",
-        "nationality": ["it"],
-        "position": ["GK"],
-        "birth_year": 1978,
-    },
-    "Patrick-M'Boma": {
-        "id": "1a6928ad",
-        "nationality": ["cm"],
-        "position": ["FW"],
-        "birth_year": 1970,
-    },
-    "Fabio-Macellari": {
-        "id": "2ee3312a",
-        "nationality": ["it"],
-        "position": ["DF"],
-        "birth_year": 1974,
-    },
-    "Michael-Madsen": {
-        "id": "78c466e4",
-        "nationality": ["dk"],
-        "position": ["DF"],
-        "birth_year": 1974,
-    },
-    "Christian-Maggio": {
-        "id": "31d7f557",
-        "nationality": ["it"],
-        "position": ["DF", "MF"],
-        "birth_year": 1982,
-    },
-    "Oscar-Magoni": {
-        "id": "7ba6372b",
-        "nationality": ["it"],
-        "position": ["MF"],
-        "birth_year": 1967,
-    },
-    "Paolo-Maldini": {
-        "id": "14323e81",
-        "nationality": ["it"],
-        "position": ["DF"],
-        "birth_year": 1968,
-    },
-    "Alberto-Malusci": {
-        "id": "a8e4ab0b",
-        "nationality": ["it"],
-        "position": ["DF"],
-        "birth_year": 1972,
-    },
-    "Jos\u00e9-Mamede": {
-        "id": "7473f8c1",
-        "nationality": ["pt"],
-        "position": ["MF"],
-        "birth_year": 1974,
-    },
-    "Francesco-Mancini": {
-        "id": "6edcd2db",
-        "nationality": ["it"],
-        "position": ["GK"],
-        "birth_year": 1968,
-    },
-    "Thomas-Manfredini": {
-        "id": "cd2d825f",
-        "nationality": ["it"],
-        "position": ["DF"],
-        "birth_year": 1980,
-    },
-    "Amedeo-Mangone": {
-        "id": "d2da2768",
-        "nationality": ["it"],
-        "position": ["DF"],
-        "birth_year": 1968,
-    },
-    "Massimo-Marazzina": {
-        "id": "8b0f45d8",
-        "nationality": ["it"],
-        "position": ["FW"],
-        "birth_year": 1974,
-    },
-    "Luca-Marchegiani": {
-        "id": "aa3ed24e",
-        "nationality": ["it"],
-        "position": ["GK"],
-        "birth_year": 1966,
-    },
-    "Michele-Marcolini": {
-        "id": "fefecf08",
-        "nationality": ["it"],
-        "position": ["MF"],
-        "birth_year": 1975,
-    },
-    "Enzo-Maresca": {
-        "id": "1a899d99",
-        "nationality": ["it"],
-        "position": ["MF"],
-        "birth_year": 1980,
-    },
-    "Massimo-Margiotta": {
-        "id": "8056b6e9",
-        "nationality": ["ve"],
-        "position": ["FW"],
-        "birth_year": 1977,
-    },
-    "Jos\u00e9-Mari": {
-        "id": "b56835b1",
-        "nationality": ["es"],
-        "position": ["FW"],
-        "birth_year": 1978,
-    },
-    "Z\u00e9-Maria": {
-        "id": "c4e72f3d",
-        "nationality": ["br"],
-        "position": ["DF"],
-        "birth_year": 1973,
-    },
-    "Francesco-Marino": {
-        "id": "6c474ce8",
-        "nationality": ["it"],
-        "position": ["FW"],
-        "birth_year": 1970,
-    },
-    "Diego-Markic": {
-        "id": "478145d8",
-        "nationality": ["ar"],
-        "position": ["FW", "MF"],
-        "birth_year": 1977,
-    },
-    "Phil-Masinga": {
-        "id": "92522d39",
-        "nationality": ["za"],
-        "position": ["FW"],
-        "birth_year": 1969,
-    },
-    "Roberto-Massaro": {
-        "id": "5630a708",
-        "nationality": ["it"],
-        "position": ["FW"],
-        "birth_year": 1983,
-    },
-    "Diego-Mateo": {
-        "id": "6ff0efaa",
-        "nationality": ["ar"],
-        "position": ["DF", "MF"],
-        "birth_year": 1978,
-    },
-    "Marco-Materazzi": {
-        "id": "5f08a3e3",
-        "nationality": ["it"],
-        "position": ["DF"],
-        "birth_year": 1973,
-    },
-    "Matuzal\u00e9m": {
-        "id": "5ba2fc63",
-        "nationality": ["br"],
-        "position": ["MF"],
-        "birth_year": 1980,
-    },
-    "Andrea-Mazzantini": {
-        "id": "9223a22b",
-        "nationality": ["it"],
-        "position": ["GK"],
-        "birth_year": 1968,
-    },
-    "Giuseppe-Mazzarelli": {
-        "id": "42de46d6",
-        "nationality": ["ch"],
-        "position": ["DF"],
-        "birth_year": 1972,
-    },
-    "Alessandro-Mazzola": {
-        "id": "1e7a7ae7",
-        "nationality": ["it"],
-        "position": ["MF"],
-        "birth_year": 1969,
-    },
-    "Martino-Melis": {
-        "id": "30039e92",
-        "nationality": ["it"],
-        "position": ["MF"],
-        "birth_year": 1973,
-    },
-    "Vittorio-Mero": {
-        "id": "c7f60505",
-        "nationality": ["it"],
-        "position": ["DF"],
-        "birth_year": 1974,
-    },
-    "Luca-Mezzano": {
-        "id": "749644d6",
-        "nationality": ["it"],
-        "position": ["DF"],
-        "birth_year": 1977,
-    },
-    "Vittorio-Micolucci": {
-        "id": "65b4dec6",
-        "nationality": ["it"],
-        "position": ["DF"],
-        "birth_year": 1983,
-    },
-    "Johan-Micoud": {
-        "id": "61e0aa85",
-        "nationality": ["fr"],
-        "position": ["MF"],
-        "birth_year": 1973,
-    },
-    "Sini\u0161a-Mihajlovi\u0107": {
-        "id": "c14fb1a0",
-        "nationality": ["rs"],
-        "position": ["DF"],
-        "birth_year": 1969,
-    },
-    "Predrag-Mijatovi\u0107": {
-        "id": "1191c3d6",
-        "nationality": ["rs"],
-        "position": ["FW", "MF"],
-        "birth_year": 1969,
-    },
-    "Mauro-Milanese": {
-        "id": "51b36a39",
-        "nationality": ["it"],
-        "position": ["DF"],
-        "birth_year": 1971,
-    },
-    "Savo-Milo\u0161evi\u0107": {
-        "id": "bab73c39",
-        "nationality": ["rs"],
-        "position": ["FW"],
-        "birth_year": 1973,
-    },
-    "Salvatore-Monaco": {
-        "id": "fe95801e",
-        "nationality": ["it"],
-        "position": ["DF"],
-        "birth_year": 1972,
-    },
-    "Luca-Mondini": {
-        "id": "d3982cb9",
-        "nationality": ["it"],
-        "position": ["GK"],
-        "birth_year": 1970,
-    },
-    "Johnnier-Monta\u00f1o": {
-        "id": "3b7077e1",
-        "nationality": ["co"],
-        "position": ["MF"],
-        "birth_year": 1983,
-    },
-    "Vincenzo-Montella": {
-        "id": "e817154c",
-        "nationality": ["it"],
-        "position": ["FW"],
-        "birth_year": 1974,
-    },
-    "Paolo-Montero": {
-        "id": "ca09be9a",
-        "nationality": ["uy"],
-        "position": ["DF"],
-        "birth_year": 1971,
-    },
-    "Giovanni-Morabito": {
-        "id": "00ee3062",
-        "nationality": ["it"],
-        "position": ["DF"],
-        "birth_year": 1978,
-    },
-    "Emiliano-Moretti": {
-        "id": "55667895",
-        "nationality": ["it"],
-        "position": ["DF"],
-        "birth_year": 1981,
-    },
-    "Domenico-Morfeo": {
-        "id": "dc8fcd3e",
-        "nationality": ["it"],
-        "position": ["FW", "MF"],
-        "birth_year": 1976,
-    },
-    "Francesco-Moriero": {
-        "id": "7c214e53",
-        "nationality": ["it"],
-        "position": ["MF"],
-        "birth_year": 1969,
-    },
-    "Mozart": {
-        "id": "9fa8813f",
-        "nationality": ["br"],
-        "position": ["MF"],
-        "birth_year": 1979,
-    },
-    "Zlatan-Muslimovi\u0107": {
-        "id": "4fee2f7a",
-        "nationality": ["ba"],
-        "position": ["FW"],
-        "birth_year": 1981,
-    },
-    "Adrian-Mutu": {
-        "id": "7af7fbd8",
-        "nationality": ["ro"],
-        "position": ["FW", "MF"],
-        "birth_year": 1979,
-    },
-    "Roberto-Muzzi": {
-        "id": "1dd51eaf",
-        "nationality": ["it"],
-        "position": ["FW"],
-        "birth_year": 1971,
-    },
-    "Hidetoshi-Nakata": {
-        "id": "917ee796",
-        "nationality": ["jp"],
-        "position": ["MF"],
-        "birth_year": 1977,
-    },
-    "Marco-Nappi": {
-        "id": "b911feb3",
-        "nationality": ["it"],
-        "position": ["FW"],
-        "birth_year": 1966,
-    },
-    "Antonio-Narciso": {
-        "id": "d3bd4bcf",
-        "nationality": ["it"],
-        "position": ["GK"],
-        "birth_year": 1980,
-    },
-    "Maurizio-Nassi": {
-        "id": "5f8d75b5",
-        "nationality": ["it"],
-        "position": ["FW"],
-        "birth_year": 1977,
-    },
-    "Pavel-Nedv\u011bd": {
-        "id": "ab059f29",
-        "nationality": ["cz"],
-        "position": ["MF"],
-        "birth_year": 1972,
-    },
-    "Paolo-Negro": {
-        "id": "2538335b",
-        "nationality": ["it"],
-        "position": ["DF"],
-        "birth_year": 1972,
-    },
-    "Rachid-Neqrouz": {
-        "id": "9f6ea567",
-        "nationality": ["ma"],
-        "position": ["DF"],
-        "birth_year": 1972,
-    },
-    "Carlo-Nervo": {
-        "id": "38c55e08",
-        "nationality": ["it"],
-        "position": ["MF"],
-        "birth_year": 1971,
-    },
-    "Alessandro-Nesta": {
-        "id": "16cabe2a",
-        "nationality": ["it"],
-        "position": ["DF"],
-        "birth_year": 1976,
-    },
-    "Salvatore-Novembrino": {"id": "d2955946", "birth_year": 1981},
-    "Fabi\u00e1n-O'Neill": {
-        "id": "e3c47d46",
-        "nationality": ["uy"],
-        "position": ["MF"],
-        "birth_year": 1973,
-    },
-    "Massimo-Oddo": {
-        "id": "552f6449",
-        "nationality": ["it"],
-        "position": ["DF"],
-        "birth_year": 1976,
-    },
-    "Davide-Olivares": {
-        "id": "04a9ed47",
-        "nationality": ["it"],
-        "position": ["MF"],
-        "birth_year": 1971,
-    },
-    "Renato-Olive": {
-        "id": "c1387a46",
-        "nationality": ["it"],
-        "position": ["MF"],
-        "birth_year": 1971,
-    },
-    "Lu\u00eds-Oliveira": {
-        "id": "194efff9",
-        "nationality": ["be"],
-        "position": ["FW"],
-        "birth_year": 1969,
-    },
-    "\u00d3scar-Omar-Ayala": {
-        "id": "5bcfee8f",
-        "nationality": ["py"],
-        "position": ["DF"],
-        "birth_year": 1980,
-    },
-    "Pierluigi-Orlandini": {
-        "id": "03770d74",
-        "nationality": ["it"],
-        "position": ["MF"],
-        "birth_year": 1972,
-    },
-    "Paolo-Orlandoni": {
-        "id": "01ca5694",
-        "nationality": ["it"],
-        "position": ["GK"],
-        "birth_year": 1972,
-    },
-    "Yksel-Osmanovski": {
-        "id": "801b48e2",
-        "nationality": ["se"],
-        "position": ["FW", "MF"],
-        "birth_year": 1977,
-    },
-    "Aldo-Osorio": {
-        "id": "c366b111",
-        "nationality": ["ar"],
-        "position": ["FW"],
-        "birth_year": 1974,
-    },
-    "Antonio-Pacheco": {
-        "id": "9ad93cb3",
-        "nationality": ["uy"],
-        "position": ["FW", "MF"],
-        "birth_year": 1976,
-    },
-    "Pasquale-Padalino": {
-        "id": "a3801f0c",
-        "nationality": ["it"],
-        "position": ["DF"],
-        "birth_year": 1972,
-    },
-    "Massimo-Paganin": {
-        "id": "96644fe3",
-        "nationality": ["it"],
-        "position": ["DF"],
-        "birth_year": 1970,
-    },
-    "Biagio-Pagano": {
-        "id": "19639241",
-        "nationality": ["it"],
-        "position": ["MF"],
-        "birth_year": 1983,
-    },
-    "Gianluca-Pagliuca": {
-        "id": "adec5dbb",
-        "nationality": ["it"],
-        "position": ["GK"],
-        "birth_year": 1966,
-    },
-    "Ottavio-Palladini": {
-        "id": "4c3e94b5",
-        "nationality": ["it"],
-        "position": ["MF"],
-        "birth_year": 1971,
-    },
-    "Giuseppe-Pancaro": {
-        "id": "804dd34f",
-        "nationality": ["it"],
-        "position": ["DF"],
-        "birth_year": 1971,
-    },
-    "Michele-Paramatti": {
-        "id": "80c56d35",
-        "nationality": ["it"],
-        "position": ["DF"],
-        "birth_year": 1968,
-    },
-    "Claudio-Paris": {
-        "id": "5854b0d4",
-        "nationality": ["ar"],
-        "position": ["MF"],
-        "birth_year": 1973,
-    },
-    "Fabio-Pecchia": {
-        "id": "0b10d75b",
-        "nationality": ["it"],
-        "position": ["MF"],
-        "birth_year": 1973,
-    },
-    "Ivan-Pelizzoli": {
-        "id": "f1679973",
-        "nationality": ["it"],
-        "position": ["GK"],
-        "birth_year": 1980,
-    },
-    "Alessandro-Pellicori": {
-        "id": "e01b1dfa",
-        "nationality": ["it"],
-        "position": ["FW"],
-        "birth_year": 1981,
-    },
-    "Simone-Perrotta": {
-        "id": "12fedefa",
-        "nationality": ["it"],
-        "position": ["MF"],
-        "birth_year": 1977,
-    },
-    "Angelo-Peruzzi": {
-        "id": "bcd5e1ca",
-        "nationality": ["it"],
-        "position": ["GK"],
-        "birth_year": 1970,
-    },
-    "Emanuele-Pesaresi": {
-        "id": "6d94c37b",
-        "nationality": ["it"],
-        "position": ["DF"],
-        "birth_year": 1976,
-    },
-    "Gianluca-Pessotto": {
-        "id": "a4bf5d1f",
-        "nationality": ["it"],
-        "position": ["DF", "MF"],
-        "birth_year": 1970,
-    },
-    "Gianluca-Petrachi": {
-        "id": "59b0b333",
-        "nationality": ["it"],
-        "position": ["MF"],
-        "birth_year": 1969,
-    },
-    "Fabio-Petruzzi": {
-        "id": "e6581c9b",
-        "nationality": ["it"],
-        "position": ["DF"],
-        "birth_year": 1970,
-    },
-    "Giovanni-Piacentini": {
-        "id": "d1881ad3",
-        "nationality": ["it"],
-        "position": ["MF"],
-        "birth_year": 1968,
-    },
-    "Luigi-Piangerelli": {
-        "id": "5a7ee48a",
-        "nationality": ["it"],
-        "position": ["MF"],
-        "birth_year": 1973,
-    },
-    "Mirko-Pieri": {
-        "id": "83e75ac6",
-        "nationality": ["it"],
-        "position": ["DF", "MF"],
-        "birth_year": 1978,
-    },
-    "Alessandro-Pierini": {
-        "id": "a8e313f0",
-        "nationality": ["it"],
-        "position": ["DF"],
-        "birth_year": 1973,
-    },
-    "Alex-Pinardi": {
-        "id": "ddc72e72",
-        "nationality": ["it"],
-        "position": ["MF"],
-        "birth_year": 1980,
-    },
-    "Davide-Pinato": {
-        "id": "ea53f8c6",
-        "nationality": ["it"],
-        "position": ["GK"],
-        "birth_year": 1964,
-    },
-    "Mauricio-Pineda": {
-        "id": "e0c17cde",
-        "nationality": ["us"],
-        "position": ["MF", "DF"],
-        "birth_year": 1997,
-    },
-    "Giampiero-Pinzi": {
-        "id": "8857991f",
-        "nationality": ["it"],
-        "position": ["MF"],
-        "birth_year": 1981,
-    },
-    "Marco-Piovanelli": {
-        "id": "f8e8ea29",
-        "nationality": ["it"],
-        "position": ["MF"],
-        "birth_year": 1974,
-    },
-    "Andrea-Pirlo": {
-        "id": "71c5f16f",
-        "nationality": ["it"],
-        "position": ["MF"],
-        "birth_year": 1979,
-    },
-    "Matteo-Pivotto": {
-        "id": "d51cc6c4",
-        "nationality": ["it"],
-        "position": ["DF"],
-        "birth_year": 1974,
-    },
-    "David-Pizarro": {
-        "id": "8b92c119",
-        "nationality": ["cl"],
-        "position": ["MF"],
-        "birth_year": 1979,
-    },
-    "Karel-Poborsk\u00fd": {
-        "id": "bcff20dc",
-        "nationality": ["cz"],
-        "position": ["MF"],
-        "birth_year": 1972,
-    },
-    "Paolo-Poggi": {
-        "id": "4a352e36",
-        "nationality": ["it"],
-        "position": ["FW"],
-        "birth_year": 1971,
-    },
-    "Davide-Possanzini": {
-        "id": "6078984b",
-        "nationality": ["it"],
-        "position": ["FW", "MF"],
-        "birth_year": 1976,
-    },
-    "Roberto-Previtali": {
-        "id": "6c81b6c4",
-        "nationality": ["it"],
-        "position": ["MF"],
-        "birth_year": 1981,
-    },
-    "Francesco-Quintavalla": {
-        "id": "c70d4a57",
-        "nationality": ["it"],
-        "position": ["MF"],
-        "birth_year": 1982,
-    },
-    "Facundo-Quiroga": {
-        "id": "c143b6bb",
-        "nationality": ["ar"],
-        "position": ["DF"],
-        "birth_year": 1978,
-    },
-    "Fabrizio-Ravanelli": {
-        "id": "dc462766",
-        "nationality": ["it"],
-        "position": ["FW"],
-        "birth_year": 1968,
-    },
-    "\u00c1lvaro-Recoba": {
-        "id": "25b11ac7",
-        "nationality": ["uy"],
-        "position": ["FW", "MF"],
-        "birth_year": 1976,
-    },
-    "Gustavo-Reggi": {
-        "id": "877bbcf1",
-        "nationality": ["ar"],
-        "position": ["FW"],
-        "birth_year": 1973,
-    },
-    "Tom\u00e1\u0161-\u0158epka": {
-        "id": "d1494d48",
-        "nationality": ["cz"],
-        "position": ["DF"],
-        "birth_year": 1974,
-    },
-    "Julio-Ricardo-Cruz": {
-        "id": "7679c2bc",
-        "nationality": ["ar"],
-        "position": ["FW"],
-        "birth_year": 1974,
-    },
-    "Alessandro-Rinaldi": {
-        "id": "87af0ffd",
-        "nationality": ["it"],
-        "position": ["DF"],
-        "birth_year": 1974,
-    },
-    "Claudio-Rivalta": {
-        "id": "3002e7c9",
-        "nationality": ["it"],
-        "position": ["DF"],
-        "birth_year": 1978,
-    },
-    "Anselmo-Robbiati": {
-        "id": "9252051a",
-        "nationality": ["it"],
-        "position": ["FW", "MF"],
-        "birth_year": 1970,
-    },
-    "Generoso-Rossi": {
-        "id": "a113ca3e",
-        "nationality": ["it"],
-        "position": ["GK"],
-        "birth_year": 1979,
-    },
-    "Marco-Rossi": {
-        "id": "85a6f80b",
-        "nationality": ["it"],
-        "position": ["MF"],
-        "birth_year": 1978,
-    },
-    "Maurizio-Rossi": {
-        "id": "a91ce696",
-        "nationality": ["it"],
-        "position": ["MF"],
-        "birth_year": 1970,
-    },
-    "Sebastiano-Rossi": {
-        "id": "a34be5af",
-        "nationality": ["it"],
-        "position": ["GK"],
-        "birth_year": 1964,
-    },
-    "Fausto-Rossini": {
-        "id": "e775840f",
-        "nationality": ["it"],
-        "position": ["FW"],
-        "birth_year": 1978,
-    },
-    "Fabio-Rossitto": {
-        "id": "84a0904c",
-        "nationality": ["it"],
-        "position": ["MF"],
-        "birth_year": 1971,
-    },
-    "Fabio-Rustico": {
-        "id": "2487b2dd",
-        "nationality": ["it"],
-        "position": ["DF"],
-        "birth_year": 1976,
-    },
-    "Abdelilah-Saber": {
-        "id": "8fb4fb96",
-        "nationality": ["ma"],
-        "position": ["DF"],
-        "birth_year": 1974,
-    },
-    "Hany-Sa\u00efd": {
-        "id": "30a91f18",
-        "nationality": ["eg"],
-        "position": ["DF"],
-        "birth_year": 1980,
-    },
-    "Luigi-Sala": {
-        "id": "d447541e",
-        "nationality": ["it"],
-        "position": ["DF"],
-        "birth_year": 1974,
-    },
-    "Marcelo-Salas": {
-        "id": "0836ac1e",
-        "nationality": ["cl"],
-        "position": ["FW"],
-        "birth_year": 1974,
-    },
-    "Emiliano-Salvetti": {
-        "id": "b396ecbf",
-        "nationality": ["it"],
-        "position": ["MF"],
-        "birth_year": 1974,
-    },
-    "Walter-Samuel": {
-        "id": "ceb6c79d",
-        "nationality": ["ar"],
-        "position": ["DF"],
-        "birth_year": 1978,
-    },
-    "Luigi-Sartor": {
-        "id": "0c87971e",
-        "nationality": ["it"],
-        "position": ["DF"],
-        "birth_year": 1975,
-    },
-    "Luca-Saudati": {
-        "id": "2d90e354",
-        "nationality": ["it"],
-        "position": ["FW", "MF"],
-        "birth_year": 1978,
-    },
-    "Alberto-Savino": {
-        "id": "824a769d",
-        "nationality": ["it"],
-        "position": ["DF"],
-        "birth_year": 1973,
-    },
-    "Juan-Sebasti\u00e1n-Ver\u00f3n": {
-        "id": "f11a57c1",
-        "nationality": ["ar"],
-        "position": ["MF"],
-        "birth_year": 1975,
-    },
-    "Clarence-Seedorf": {
-        "id": "e6af3cc7",
-        "nationality": ["nl"],
-        "position": ["MF"],
-        "birth_year": 1976,
-    },
-    "Roberto-Sensini": {
-        "id": "5cb3d53a",
-        "nationality": ["ar"],
-        "position": ["DF"],
-        "birth_year": 1966,
-    },
-    "Michele-Serena": {
-        "id": "e862f68a",
-        "nationality": ["it"],
-        "position": ["DF"],
-        "birth_year": 1970,
-    },
-    "Serginho": {
-        "id": "9f318993",
-        "nationality": ["br"],
-        "position": ["DF", "MF"],
-        "birth_year": 1971,
-    },
-    "Anthony-\u0160eri\u0107": {
-        "id": "e1dc1b88",
-        "nationality": ["hr"],
-        "position": ["DF"],
-        "birth_year": 1979,
-    },
-    "David-Sesa": {
-        "id": "85aadde2",
-        "nationality": ["ch"],
-        "position": ["FW", "MF"],
-        "birth_year": 1973,
-    },
-    "Andriy-Shevchenko": {
-        "id": "32eb0f30",
-        "nationality": ["ua"],
-        "position": ["FW"],
-        "birth_year": 1976,
-    },
-    "Lorenzo-Sibilano": {
-        "id": "1ae9ebbb",
-        "nationality": ["it"],
-        "position": ["DF"],
-        "birth_year": 1978,
-    },
-    "Giuseppe-Signori": {
-        "id": "b48c2ccb",
-        "nationality": ["it"],
-        "position": ["FW"],
-        "birth_year": 1968,
-    },
-    "Diego-Simeone": {
-        "id": "4b58d1e3",
-        "nationality": ["ar"],
-        "position": ["MF"],
-        "birth_year": 1970,
-    },
-    "Dario-\u0160imi\u0107": {
-        "id": "c84ddbc4",
-        "nationality": ["hr"],
-        "position": ["DF"],
-        "birth_year": 1975,
-    },
-    "Sebastiano-Siviglia": {
-        "id": "d8c086d3",
-        "nationality": ["it"],
-        "position": ["DF"],
-        "birth_year": 1973,
-    },
-    "Sean-Sogliano": {
-        "id": "54875eee",
-        "nationality": ["it"],
-        "position": ["DF"],
-        "birth_year": 1971,
-    },
-    "Vincenzo-Sommese": {
-        "id": "857110b0",
-        "nationality": ["it"],
-        "position": ["MF"],
-        "birth_year": 1976,
-    },
-    "Roberto-Sosa": {
-        "id": "4698b988",
-        "nationality": ["ar"],
-        "position": ["FW"],
-        "birth_year": 1975,
-    },
-    "Andrea-Sottil": {
-        "id": "05d16399",
-        "nationality": ["it"],
-        "position": ["DF"],
-        "birth_year": 1974,
-    },
-    "Gionatha-Spinesi": {
-        "id": "136bf61b",
-        "nationality": ["it"],
-        "position": ["FW"],
-        "birth_year": 1978,
-    },
-    "Pavel-Srn\u00ed\u010dek": {
-        "id": "db13a630",
-        "nationality": ["cz"],
-        "position": ["GK"],
-        "birth_year": 1968,
-    },
-    "Dejan-Stankovi\u0107": {
-        "id": "167d7dd3",
-        "nationality": ["rs"],
-        "position": ["MF"],
-        "birth_year": 1978,
-    },
-    "Roberto-Stellone": {
-        "id": "72f23b97",
-        "nationality": ["it"],
-        "position": ["FW"],
-        "birth_year": 1977,
-    },
-    "Giorgio-Sterchele": {
-        "id": "a500c25e",
-        "nationality": ["it"],
-        "position": ["GK"],
-        "birth_year": 1970,
-    },
-    "Damir-Stojak": {
-        "id": "8cfb6ac7",
-        "nationality": ["rs"],
-        "position": ["FW"],
-        "birth_year": 1975,
-    },
-    "Lorenzo-Stovini": {
-        "id": "20f1193c",
-        "nationality": ["it"],
-        "position": ["DF"],
-        "birth_year": 1976,
-    },
-    "Hakan-\u015e\u00fck\u00fcr": {
-        "id": "7a6fce9a",
-        "nationality": ["tr"],
-        "position": ["FW"],
-        "birth_year": 1971,
-    },
-    "Alessio-Tacchinardi": {
-        "id": "b99799e5",
-        "nationality": ["it"],
-        "position": ["MF"],
-        "birth_year": 1975,
-    },
-    "Riccardo-Taddei": {
-        "id": "cac46faa",
-        "nationality": ["it"],
-        "position": ["FW", "MF"],
-        "birth_year": 1980,
-    },
-    "Giuseppe-Taglialatela": {
-        "id": "ba81b116",
-        "nationality": ["it"],
-        "position": ["GK"],
-        "birth_year": 1969,
-    },
-    "Massimo-Taibi": {
-        "id": "ee9ba025",
-        "nationality": ["it"],
-        "position": ["GK"],
-        "birth_year": 1970,
-    },
-    "Emiliano-Tarana": {
-        "id": "f9c6d93b",
-        "nationality": ["it"],
-        "position": ["MF"],
-        "birth_year": 1979,
-    },
-    "Massimo-Tarantino": {
-        "id": "b19fc549",
-        "nationality": ["it"],
-        "position": ["DF"],
-        "birth_year": 1971,
-    },
-    "Michele-Tardioli": {
-        "id": "fd647b61",
-        "nationality": ["it"],
-        "position": ["GK"],
-        "birth_year": 1970,
-    },
-    "Igli-Tare": {
-        "id": "c491b53d",
-        "nationality": ["al"],
-        "position": ["FW"],
-        "birth_year": 1973,
-    },
-    "Andrea-Tarozzi": {
-        "id": "75201a07",
-        "nationality": ["it"],
-        "position": ["DF"],
-        "birth_year": 1973,
-    },
-    "Tomaso-Tatti": {
-        "id": "c7f219dd",
-        "nationality": ["it"],
-        "position": ["FW"],
-        "birth_year": 1972,
-    },
-    "Giacomo-Tedesco": {
-        "id": "f3ae87af",
-        "nationality": ["it"],
-        "position": ["MF"],
-        "birth_year": 1976,
-    },
-    "Giovanni-Tedesco": {
-        "id": "01666ea1",
-        "nationality": ["it"],
-        "position": ["MF"],
-        "birth_year": 1972,
-    },
-    "Carlo-Teodorani": {
-        "id": "9b22357c",
-        "nationality": ["it"],
-        "position": ["DF"],
-        "birth_year": 1977,
-    },
-    "Lilian-Thuram": {
-        "id": "643ca22c",
-        "nationality": ["fr"],
-        "position": ["DF"],
-        "birth_year": 1972,
-    },
-    "Francesco-Toldo": {
-        "id": "9a71df39",
-        "nationality": ["it"],
-        "position": ["GK"],
-        "birth_year": 1971,
-    },
-    "Stjepan-Tomas": {
-        "id": "3349cf84",
-        "nationality": ["hr"],
-        "position": ["DF"],
-        "birth_year": 1976,
-    },
-    "Goran-Tomi\u0107": {
-        "id": "ab1589a7",
-        "nationality": ["hr"],
-        "position": ["FW"],
-        "birth_year": 1977,
-    },
-    "Damiano-Tommasi": {
-        "id": "46361093",
-        "nationality": ["it"],
-        "position": ["MF"],
-        "birth_year": 1974,
-    },
-    "Max-Tonetto": {
-        "id": "2378ae69",
-        "nationality": ["it"],
-        "position": ["DF", "MF"],
-        "birth_year": 1974,
-    },
-    "Luca-Toni": {
-        "id": "dd74033b",
-        "nationality": ["it"],
-        "position": ["FW"],
-        "birth_year": 1977,
-    },
-    "Moreno-Torricelli": {
-        "id": "3103b024",
-        "nationality": ["it"],
-        "position": ["DF"],
-        "birth_year": 1970,
-    },
-    "Stefano-Torrisi": {
-        "id": "e2db6b45",
-        "nationality": ["it"],
-        "position": ["DF"],
-        "birth_year": 1971,
-    },
-    "Francesco-Totti": {
-        "id": "ed75b6c7",
-        "nationality": ["it"],
-        "position": ["FW", "MF"],
-        "birth_year": 1976,
-    },
-    "David-Trezeguet": {
-        "id": "80183cb2",
-        "nationality": ["fr"],
-        "position": ["FW"],
-        "birth_year": 1977,
-    },
-    "Carlo-Trezzi": {
-        "id": "ae846dcc",
-        "nationality": ["it"],
-        "position": ["MF"],
-        "birth_year": 1982,
-    },
-    "Emanuele-Troise": {
-        "id": "da129c1e",
-        "nationality": ["it"],
-        "position": ["DF"],
-        "birth_year": 1979,
-    },
-    "Igor-Tudor": {
-        "id": "565d4832",
-        "nationality": ["hr"],
-        "position": ["DF"],
-        "birth_year": 1978,
-    },
-    "Luigi-Turci": {
-        "id": "256dd162",
-        "nationality": ["it"],
-        "position": ["GK"],
-        "birth_year": 1970,
-    },
-    "Kubilay-T\u00fcrkyilmaz": {
-        "id": "d2088343",
-        "nationality": ["ch"],
-        "position": ["FW"],
-        "birth_year": 1967,
-    },
-    "Jaime-Vald\u00e9s": {
-        "id": "77e6776f",
-        "nationality": ["cl"],
-        "position": ["FW", "MF"],
-        "birth_year": 1981,
-    },
-    "Alberto-Valentim": {
-        "id": "64a84087",
-        "nationality": ["br"],
-        "position": ["DF", "MF"],
-        "birth_year": 1975,
-    },
-    "Vampeta": {
-        "id": "50ee794b",
-        "nationality": ["br"],
-        "position": ["MF"],
-        "birth_year": 1974,
-    },
-    "Paolo-Vanoli": {
-        "id": "ba8aa529",
-        "nationality": ["it"],
-        "position": ["DF"],
-        "birth_year": 1972,
-    },
-    "Gaetano-Vasari": {
-        "id": "a99a0cf5",
-        "nationality": ["it"],
-        "position": ["FW", "MF"],
-        "birth_year": 1970,
-    },
-    "Nicola-Ventola": {
-        "id": "dc7672a6",
-        "nationality": ["it"],
-        "position": ["FW"],
-        "birth_year": 1978,
-    },
-    "Ricardo-Ver\u00f3n": {
-        "id": "8270d155",
-        "nationality": ["ar"],
-        "position": ["MF"],
-        "birth_year": 1981,
-    },
-    "William-Viali": {
-        "id": "2d4c95ac",
-        "nationality": ["it"],
-        "position": ["DF"],
-        "birth_year": 1974,
-    },
-    "Salvatore-Vicari": {
-        "id": "f2b42803",
-        "nationality": ["it"],
-        "position": ["FW", "MF"],
-        "birth_year": 1981,
-    },
-    "Christian-Vieri": {
-        "id": "1abff24a",
-        "nationality": ["it"],
-        "position": ["FW"],
-        "birth_year": 1973,
-    },
-    "Fabio-Viviani": {
-        "id": "23a5f9fb",
-        "nationality": ["it"],
-        "position": ["MF"],
-        "birth_year": 1966,
-    },
-    "Zisis-Vryzas": {
-        "id": "e477030a",
-        "nationality": ["gr"],
-        "position": ["FW"],
-        "birth_year": 1973,
-    },
-    "Mirko-Vu\u010dini\u0107": {
-        "id": "b04b9530",
-        "nationality": ["me"],
-        "position": ["FW"],
-        "birth_year": 1983,
-    },
-    "Davor-Vugrinec": {
-        "id": "9c68e4d2",
-        "nationality": ["hr"],
-        "position": ["FW", "MF"],
-        "birth_year": 1975,
-    },
-    "Johan-Walem": {
-        "id": "789e291b",
-        "nationality": ["be"],
-        "position": ["MF"],
-        "birth_year": 1972,
-    },
-    "Pierre-Wom\u00e9": {
-        "id": "981757db",
-        "nationality": ["cm"],
-        "position": ["DF"],
-        "birth_year": 1979,
-    },
-    "Andr\u00e9s-Yllana": {
-        "id": "b882a7cc",
-        "nationality": ["ar"],
-        "position": ["MF"],
-        "birth_year": 1974,
-    },
-    "Marco-Zamboni": {
-        "id": "b055e962",
-        "nationality": ["it"],
-        "position": ["DF"],
-        "birth_year": 1977,
-    },
-    "Gianluca-Zambrotta": {
-        "id": "94508225",
-        "nationality": ["it"],
-        "position": ["DF"],
-        "birth_year": 1977,
-    },
-    "Iv\u00e1n-Zamorano": {
-        "id": "b581c76d",
-        "nationality": ["cl"],
-        "position": ["FW"],
-        "birth_year": 1967,
-    },
-    "Andrea-Zanchetta": {
-        "id": "7d187d25",
-        "nationality": ["it"],
-        "position": ["MF"],
-        "birth_year": 1975,
-    },
-    "Marco-Zanchi": {
-        "id": "6cc8d0c9",
-        "nationality": ["it"],
-        "position": ["DF"],
-        "birth_year": 1977,
-    },
-    "Cristiano-Zanetti": {
-        "id": "21dd8591",
-        "nationality": ["it"],
-        "position": ["MF"],
-        "birth_year": 1977,
-    },
-    "Javier-Zanetti": {
-        "id": "2fb9e5c1",
-        "nationality": ["ar"],
-        "position": ["DF", "MF"],
-        "birth_year": 1973,
-    },
-    "Paolo-Zanetti": {
-        "id": "7f0ab51f",
-        "nationality": ["it"],
-        "position": ["MF"],
-        "birth_year": 1982,
-    },
-    "Lamberto-Zauli": {
-        "id": "a25fdbe2",
-        "nationality": ["it"],
-        "position": ["MF"],
-        "birth_year": 1971,
-    },
-    "Luciano-Zauri": {
-        "id": "96947b99",
-        "nationality": ["it"],
-        "position": ["DF"],
-        "birth_year": 1978,
-    },
-    "Jonathan-Zebina": {
-        "id": "5b48889f",
-        "nationality": ["fr"],
-        "position": ["DF"],
-        "birth_year": 1978,
-    },
-    "Cristian-Zenoni": {
-        "id": "e5f3120a",
-        "nationality": ["it"],
-        "position": ["DF"],
-        "birth_year": 1977,
-    },
-    "Damiano-Zenoni": {
-        "id": "1ecfa5c5",
-        "nationality": ["it"],
-        "position": ["DF", "MF"],
-        "birth_year": 1977,
-    },
-    "Zin\u00e9dine-Zidane": {
-        "id": "654f4e63",
-        "nationality": ["fr"],
-        "position": ["MF"],
-        "birth_year": 1972,
-    },
-    "Otto-Addo": {
-        "id": "5a90e8df",
-        "nationality": ["gh"],
-        "position": ["MF"],
-        "birth_year": 1975,
-    },
-    "Adhemar": {
-        "id": "f2a2a887",
-        "nationality": ["br"],
-        "position": ["FW"],
-        "birth_year": 1972,
-    },
-    "Silvio-Adzic": {
-        "id": "6ac3b297",
-        "nationality": ["de"],
-        "position": ["FW", "MF"],
-        "birth_year": 1980,
-    },
-    "Victor-Agali": {
-        "id": "3d3b9044",
-        "nationality": ["ng"],
-        "position": ["FW"],
-        "birth_year": 1978,
-    },
-    "Jan-\u00c5ge-Fj\u00f8rtoft": {
-        "id": "c5694827",
-        "nationality": ["no"],
-        "position": ["FW"],
-        "birth_year": 1967,
-    },
-    "Paul-Agostino": {
-        "id": "56d4e66a",
-        "nationality": ["au"],
-        "position": ["FW"],
-        "birth_year": 1975,
-    },
-    "Abdelaziz-Ahanfouf": {
-        "id": "fcdc023f",
-        "nationality": ["ma"],
-        "position": ["FW"],
-        "birth_year": 1978,
-    },
-    "Charles-Akonnor": {
-        "id": "db3a79dd",
-        "nationality": ["gh"],
-        "position": ["MF"],
-        "birth_year": 1974,
-    },
-    "Jonathan-Akpoborie": {
-        "id": "a8430a75",
-        "nationality": ["ng"],
-        "position": ["FW"],
-        "birth_year": 1968,
-    },
-    "Bruno-Akrapovi\u0107": {
-        "id": "27935851",
-        "nationality": ["ba"],
-        "position": ["MF"],
-        "birth_year": 1967,
-    },
-    "\u00dcnal-Alpu\u011fan": {
-        "id": "d362739d",
-        "nationality": ["de"],
-        "position": ["MF"],
-        "birth_year": 1973,
-    },
-    "Alex-Alves": {
-        "id": "e0b8febd",
-        "nationality": ["br"],
-        "position": ["FW"],
-        "birth_year": 1974,
-    },
-    "Patrik-Andersson": {
-        "id": "95749f23",
-        "nationality": ["se"],
-        "position": ["DF"],
-        "birth_year": 1971,
-    },
-    "Archil-Arveladze": {
-        "id": "c71a2a0b",
-        "nationality": ["ge"],
-        "position": ["FW"],
-        "birth_year": 1973,
-    },
-    "Magnus-Arvidsson": {
-        "id": "6f207fd1",
-        "nationality": ["se"],
-        "position": ["FW"],
-        "birth_year": 1973,
-    },
-    "Gerald-Asamoah": {
-        "id": "2ce9172f",
-        "nationality": ["de"],
-        "position": ["FW", "MF"],
-        "birth_year": 1978,
-    },
-    "Marko-Babi\u0107": {
-        "id": "1b4b049b",
-        "nationality": ["hr"],
-        "position": ["DF", "MF"],
-        "birth_year": 1981,
-    },
-    "Alexander-Bade": {
-        "id": "5111ab60",
-        "nationality": ["de"],
-        "position": ["GK"],
-        "birth_year": 1970,
-    },
-    "Krasimir-Balakov": {
-        "id": "7c067852",
-        "nationality": ["bg"],
-        "position": ["MF"],
-        "birth_year": 1966,
-    },
-    "Michael-Ballack": {
-        "id": "9d1b8b6b",
-        "nationality": ["de"],
-        "position": ["MF"],
-        "birth_year": 1976,
-    },
-    "Ivica-Banovi\u0107": {
-        "id": "0f348db8",
-        "nationality": ["hr"],
-        "position": ["MF"],
-        "birth_year": 1980,
-    },
-    "Miroslav-Baranek": {
-        "id": "95905b71",
-        "nationality": ["cz"],
-        "position": ["MF"],
-        "birth_year": 1973,
-    },
-    "Sergej-Barbarez": {
-        "id": "ed3ba712",
-        "nationality": ["ba"],
-        "position": ["FW", "MF"],
-        "birth_year": 1971,
-    },
-    "Mike-Barten": {
-        "id": "6590e102",
-        "nationality": ["de"],
-        "position": ["DF"],
-        "birth_year": 1973,
-    },
-    "Mario-Basler": {
-        "id": "606ce112",
-        "nationality": ["de"],
-        "position": ["FW", "MF"],
-        "birth_year": 1968,
-    },
-    "Y\u0131ld\u0131ray-Ba\u015ft\u00fcrk": {
-        "id": "5d31c998",
-        "nationality": ["tr"],
-        "position": ["MF"],
-        "birth_year": 1978,
-    },
-    "Frank-Baumann": {
-        "id": "3e328a63",
-        "nationality": ["de"],
-        "position": ["DF", "MF"],
-        "birth_year": 1975,
-    },
-    "Steffen-Baumgart": {
-        "id": "95ba398d",
-        "nationality": ["de"],
-        "position": ["FW"],
-        "birth_year": 1972,
-    },
-    "Zoubeir-Baya": {
-        "id": "b4c1f1b2",
-        "nationality": ["tn"],
-        "position": ["MF"],
-        "birth_year": 1971,
-    },
-    "Henryk-Ba\u0142uszy\u0144ski": {
-        "id": "c22e0497",
-        "nationality": ["pl"],
-        "position": ["FW"],
-        "birth_year": 1972,
-    },
-    "Christian-Beeck": {
-        "id": "96e3cf62",
-        "nationality": ["de"],
-        "position": ["DF"],
-        "birth_year": 1971,
-    },
-    "Markus-Beierle": {
-        "id": "ab232e74",
-        "nationality": ["de"],
-        "position": ["FW"],
-        "birth_year": 1972,
-    },
-    "Stefan-Beinlich": {
-        "id": "f1c2030c",
-        "nationality": ["de"],
-        "position": ["MF"],
-        "birth_year": 1972,
-    },
-    "Micha\u0142-Bemben": {
-        "id": "2e96f485",
-        "nationality": ["de"],
-        "position": ["DF", "MF"],
-        "birth_year": 1976,
-    },
-    "Sven-Benken": {
-        "id": "5b9430f8",
-        "nationality": ["de"],
-        "position": ["DF", "MF"],
-        "birth_year": 1970,
-    },
-    "Dimitar-Berbatov": {
-        "id": "f5781978",
-        "nationality": ["bg"],
-        "position": ["FW"],
-        "birth_year": 1981,
-    },
-    "J\u00f6rg-Bergen": {
-        "id": "08a25d4d",
-        "nationality": ["de"],
-        "position": ["DF"],
-        "birth_year": 1966,
-    },
-    "Tommy-Berntsen": {
-        "id": "128577bc",
-        "nationality": ["no"],
-        "position": ["DF"],
-        "birth_year": 1973,
-    },
-    "Marinus-Bester": {
-        "id": "77ef14ca",
-        "nationality": ["de"],
-        "position": ["FW"],
-        "birth_year": 1969,
-    },
-    "Daniel-Bierofka": {
-        "id": "aa98cbbb",
-        "nationality": ["de"],
-        "position": ["MF"],
-        "birth_year": 1979,
-    },
-    "Marino-Bili\u0161kov": {
-        "id": "9ff7f35a",
-        "nationality": ["hr"],
-        "position": ["DF"],
-        "birth_year": 1976,
-    },
-    "Uwe-Bindewald": {
-        "id": "c705c1e7",
-        "nationality": ["de"],
-        "position": ["DF"],
-        "birth_year": 1968,
-    },
-    "Nenad-Bjelica": {
-        "id": "7dc7d468",
-        "nationality": ["hr"],
-        "position": ["MF"],
-        "birth_year": 1971,
-    },
-    "Stefan-Blank": {
-        "id": "227ec69d",
-        "nationality": ["de"],
-        "position": ["DF"],
-        "birth_year": 1977,
-    },
-    "Fredi-Bobic": {
-        "id": "e3f9d3e8",
-        "nationality": ["de"],
-        "position": ["FW"],
-        "birth_year": 1971,
-    },
-    "Marco-Bode": {
-        "id": "7ac88328",
-        "nationality": ["de"],
-        "position": ["FW", "MF"],
-        "birth_year": 1969,
-    },
-    "Rade-Bogdanovi\u0107": {
-        "id": "a88e05bc",
-        "nationality": ["rs"],
-        "position": ["FW"],
-        "birth_year": 1970,
-    },
-    "J\u00f6rg-B\u00f6hme": {
-        "id": "c60a637c",
-        "nationality": ["de"],
-        "position": ["MF"],
-        "birth_year": 1974,
-    },
-    "Marcelo-Bordon": {
-        "id": "6826394d",
-        "nationality": ["br"],
-        "position": ["DF"],
-        "birth_year": 1976,
-    },
-    "Daniel-Borimirov": {
-        "id": "97bc39d3",
-        "nationality": ["bg"],
-        "position": ["MF"],
-        "birth_year": 1970,
-    },
-    "Serge-Branco": {
-        "id": "dc001f05",
-        "nationality": ["cm"],
-        "position": ["DF", "MF"],
-        "birth_year": 1980,
-    },
-    "Christian-Brand": {
-        "id": "bfaf7a44",
-        "nationality": ["de"],
-        "position": ["MF"],
-        "birth_year": 1972,
-    },
-    "Thomas-Brdari\u0107": {
-        "id": "71863c9b",
-        "nationality": ["de"],
-        "position": ["FW"],
-        "birth_year": 1975,
-    },
-    "Andr\u00e9-Breitenreiter": {
-        "id": "3895386f",
-        "nationality": ["de"],
-        "position": ["FW", "MF"],
-        "birth_year": 1973,
-    },
-    "Matthias-Breitkreutz": {
-        "id": "dacb5c1e",
-        "nationality": ["de"],
-        "position": ["MF"],
-        "birth_year": 1971,
-    },
-    "Florian-Bruns": {
-        "id": "df41ad24",
-        "nationality": ["de"],
-        "position": ["MF"],
-        "birth_year": 1979,
-    },
-    "Ralf-Bucher": {
-        "id": "58ab90ac",
-        "nationality": ["de"],
-        "position": ["DF"],
-        "birth_year": 1972,
-    },
-    "Andreas-Buck": {
-        "id": "3c86afd6",
-        "nationality": ["de"],
-        "position": ["MF"],
-        "birth_year": 1967,
-    },
-    "Delron-Buckley": {
-        "id": "212eb018",
-        "nationality": ["za"],
-        "position": ["FW", "MF"],
-        "birth_year": 1977,
-    },
-    "Alexander-Bugera": {
-        "id": "497859aa",
-        "nationality": ["de"],
-        "position": ["DF"],
-        "birth_year": 1978,
-    },
-    "Spasoje-Bulaji\u010d": {
-        "id": "fd1826f0",
-        "nationality": ["si"],
-        "position": ["DF"],
-        "birth_year": 1975,
-    },
-    "Erol-Bulut": {
-        "id": "2f01e2c4",
-        "nationality": ["tr"],
-        "position": ["DF", "MF"],
-        "birth_year": 1975,
-    },
-    "Dick-van-Burik": {
-        "id": "ae649d2f",
-        "nationality": ["nl"],
-        "position": ["DF"],
-        "birth_year": 1973,
-    },
-    "Mike-B\u00fcskens": {
-        "id": "b8c2909d",
-        "nationality": ["de"],
-        "position": ["MF"],
-        "birth_year": 1968,
-    },
-    "Vladimir-But": {
-        "id": "2dc0e614",
-        "nationality": ["ru"],
-        "position": ["MF"],
-        "birth_year": 1977,
-    },
-    "Hans-J\u00f6rg-Butt": {
-        "id": "5c6a124a",
-        "nationality": ["de"],
-        "position": ["GK"],
-        "birth_year": 1974,
-    },
-    "Rodolfo-Cardoso": {
-        "id": "ab026a26",
-        "nationality": ["ar"],
-        "position": ["MF"],
-        "birth_year": 1968,
-    },
-    "Bradley-Carnell": {
-        "id": "8d7b5b6a",
-        "nationality": ["za"],
-        "position": ["DF", "MF"],
-        "birth_year": 1977,
-    },
-    "Harald-Cerny": {
-        "id": "e41db53c",
-        "nationality": ["at"],
-        "position": ["MF"],
-        "birth_year": 1973,
-    },
-    "Thomas-Christiansen": {
-        "id": "955dca2f",
-        "nationality": ["es"],
-        "position": ["FW"],
-        "birth_year": 1973,
-    },
-    "Thomas-Cichon": {
-        "id": "0e7c3590",
-        "nationality": ["de"],
-        "position": ["DF"],
-        "birth_year": 1976,
-    },
-    "Sa\u0161a-\u0106iri\u0107": {
-        "id": "43283dba",
-        "nationality": ["mk"],
-        "position": ["FW"],
-        "birth_year": 1968,
-    },
-    "Martin-\u010c\u00ed\u017eek": {
-        "id": "fda315d1",
-        "nationality": ["cz"],
-        "position": ["MF"],
-        "birth_year": 1974,
-    },
-    "S\u00f8ren-Colding": {
-        "id": "085e6351",
-        "nationality": ["dk"],
-        "position": ["DF"],
-        "birth_year": 1972,
-    },
-    "Francisco-Copado": {
-        "id": "0427c7cc",
-        "nationality": ["es"],
-        "position": ["FW", "MF"],
-        "birth_year": 1974,
-    },
-    "Soumaila-Coulibaly": {
-        "id": "38a1e813",
-        "nationality": ["ml"],
-        "position": ["MF"],
-        "birth_year": 1978,
-    },
-    "Ante-\u010covi\u0107": {
-        "id": "069a22ea",
-        "nationality": ["hr"],
-        "position": ["MF"],
-        "birth_year": 1975,
-    },
-    "Carsten-Cullmann": {
-        "id": "7d78fe24",
-        "nationality": ["de"],
-        "position": ["DF"],
-        "birth_year": 1976,
-    },
-    "Christoph-Dabrowski": {
-        "id": "6792e1bc",
-        "nationality": ["de"],
-        "position": ["MF"],
-        "birth_year": 1978,
-    },
-    "Ali-Daei": {
-        "id": "bab23a33",
-        "nationality": ["ir"],
-        "position": ["FW"],
-        "birth_year": 1969,
-    },
-    "P\u00e1l-D\u00e1rdai": {
-        "id": "5ce5e906",
-        "nationality": ["hu"],
-        "position": ["MF"],
-        "birth_year": 1976,
-    },
-    "Markus-Daun": {
-        "id": "55180189",
-        "nationality": ["de"],
-        "position": ["FW"],
-        "birth_year": 1980,
-    },
-    "Ded\u00ea": {
-        "id": "823fb255",
-        "nationality": ["br"],
-        "position": ["DF"],
-        "birth_year": 1978,
-    },
-    "Peter-Dei\u00dfenberger": {
-        "id": "c83be211",
-        "nationality": ["de"],
-        "position": ["MF"],
-        "birth_year": 1976,
-    },
-    "Sebastian-Deisler": {
-        "id": "2a06c00a",
-        "nationality": ["de"],
-        "position": ["MF"],
-        "birth_year": 1980,
-    },
-    "Antonio-Di-Salvo": {
-        "id": "d72cb9ae",
-        "nationality": ["de"],
-        "position": ["FW"],
-        "birth_year": 1979,
-    },
-    "Boubacar-Diarra": {
-        "id": "331ccddd",
-        "nationality": ["ml"],
-        "position": ["DF"],
-        "birth_year": 1979,
-    },
-    "Mirko-Dickhaut": {
-        "id": "44f5152d",
-        "nationality": ["de"],
-        "position": ["DF", "MF"],
-        "birth_year": 1971,
-    },
-    "Youri-Djorkaeff": {
-        "id": "e9f1bedd",
-        "nationality": ["fr"],
-        "position": ["FW", "MF"],
-        "birth_year": 1968,
-    },
-    "Thomas-Doll": {
-        "id": "89178a30",
-        "nationality": ["de"],
-        "position": ["FW", "MF"],
-        "birth_year": 1966,
-    },
-    "Lee-Dong-gook": {
-        "id": "1c6f28eb",
-        "nationality": ["kr"],
-        "position": ["FW"],
-        "birth_year": 1979,
-    },
-    "Georgi-Donkov": {
-        "id": "eb8324bc",
-        "nationality": ["bg"],
-        "position": ["FW"],
-        "birth_year": 1970,
-    },
-    "R\u00e9gis-Dorn": {
-        "id": "b43198bf",
-        "nationality": ["fr"],
-        "position": ["FW"],
-        "birth_year": 1979,
-    },
-    "Bernd-Dreher": {
-        "id": "8477f289",
-        "nationality": ["de"],
-        "position": ["GK"],
-        "birth_year": 1966,
-    },
-    "Bj\u00f6rn-Dreyer": {
-        "id": "e4d00c84",
-        "nationality": ["de"],
-        "position": ["MF"],
-        "birth_year": 1977,
-    },
-    "Zdravko-Drin\u010di\u0107": {
-        "id": "0507895a",
-        "nationality": ["me"],
-        "position": ["FW"],
-        "birth_year": 1972,
-    },
-    "Rein-van-Duijnhoven": {
-        "id": "da2b4497",
-        "nationality": ["nl"],
-        "position": ["GK"],
-        "birth_year": 1967,
-    },
-    "Sean-Dundee": {
-        "id": "733d341b",
-        "nationality": ["de"],
-        "position": ["FW"],
-        "birth_year": 1972,
-    },
-    "Markus-Dworrak": {
-        "id": "64041728",
-        "nationality": ["de"],
-        "position": ["FW", "MF"],
-        "birth_year": 1978,
-    },
-    "Anel-D\u017eaka": {
-        "id": "542adc17",
-        "nationality": ["de"],
-        "position": ["MF"],
-        "birth_year": 1980,
-    },
-    "Janosch-Dziwior": {
-        "id": "07883115",
-        "nationality": ["de"],
-        "position": ["DF", "MF"],
-        "birth_year": 1974,
-    },
-    "Stefan-Effenberg": {
-        "id": "c0e1708c",
-        "nationality": ["de"],
-        "position": ["MF"],
-        "birth_year": 1968,
-    },
-    "Uwe-Ehlers": {
-        "id": "e6c8e278",
-        "nationality": ["de"],
-        "position": ["DF"],
-        "birth_year": 1975,
-    },
-    "Yves-Eigenrauch": {
-        "id": "c1c2d1e0",
-        "nationality": ["de"],
-        "position": ["DF"],
-        "birth_year": 1971,
-    },
-    "Dieter-Eilts": {
-        "id": "6aa0e9bb",
-        "nationality": ["de"],
-        "position": ["MF"],
-        "birth_year": 1964,
-    },
-    "Giovane-\u00c9lber": {
-        "id": "c0f9667c",
-        "nationality": ["br"],
-        "position": ["FW"],
-        "birth_year": 1972,
-    },
-    "Mohamed-Emara": {
-        "id": "965a2b80",
-        "nationality": ["eg"],
-        "position": ["DF", "MF"],
-        "birth_year": 1974,
-    },
-    "Jochen-Endre\u00df": {
-        "id": "2a8f40a7",
-        "nationality": ["de"],
-        "position": ["DF"],
-        "birth_year": 1972,
-    },
-    "Fabian-Ernst": {
-        "id": "bc35f9b2",
-        "nationality": ["de"],
-        "position": ["MF"],
-        "birth_year": 1979,
-    },
-    "Thomas-Ernst": {
-        "id": "ddbfbb6b",
-        "nationality": ["de"],
-        "position": ["GK"],
-        "birth_year": 1967,
-    },
-    "Evan\u00edlson": {
-        "id": "69c9cdaf",
-        "nationality": ["br"],
-        "position": ["DF", "FW"],
-        "birth_year": 1975,
-    },
-    "Eyj\u00f3lfur": {
-        "id": "7636e105",
-        "nationality": ["is"],
-        "position": ["DF", "MF"],
-        "birth_year": 1968,
-    },
-    "Frank-Fahrenhorst": {
-        "id": "bd4685bb",
-        "nationality": ["de"],
-        "position": ["DF"],
-        "birth_year": 1977,
-    },
-    "Thorsten-Fink": {
-        "id": "8987c418",
-        "nationality": ["de"],
-        "position": ["MF"],
-        "birth_year": 1967,
-    },
-    "Andreas-Fischer": {
-        "id": "0f1059a9",
-        "nationality": ["de"],
-        "position": ["DF", "MF"],
-        "birth_year": 1964,
-    },
-    "Dirk-Flock": {
-        "id": "185d8d1e",
-        "nationality": ["de"],
-        "position": ["MF"],
-        "birth_year": 1972,
-    },
-    "Franklin": {
-        "id": "de27b666",
-        "nationality": ["br"],
-        "position": ["FW"],
-        "birth_year": 1969,
-    },
-    "Paul-Freier": {
-        "id": "208f9757",
-        "nationality": ["de"],
-        "position": ["MF"],
-        "birth_year": 1979,
-    },
-    "Torsten-Frings": {
-        "id": "e6c8ded2",
-        "nationality": ["de"],
-        "position": ["MF"],
-        "birth_year": 1976,
-    },
-    "Henri-Fuchs": {
-        "id": "9442d1ea",
-        "nationality": ["de"],
-        "position": ["FW"],
-        "birth_year": 1970,
-    },
-    "Milan-Fukal": {
-        "id": "94c20a60",
-        "nationality": ["cz"],
-        "position": ["DF", "MF"],
-        "birth_year": 1975,
-    },
-    "Ionel-Ganea": {
-        "id": "e02f16b2",
-        "nationality": ["ro"],
-        "position": ["FW"],
-        "birth_year": 1973,
-    },
-    "Alfonso-Garcia": {
-        "id": "bf543cce",
-        "nationality": ["es"],
-        "position": ["FW"],
-        "birth_year": 1969,
-    },
-    "Marco-Gebhardt": {
-        "id": "832b7808",
-        "nationality": ["de"],
-        "position": ["DF", "MF"],
-        "birth_year": 1972,
-    },
-    "Giuseppe-Gemiti": {
-        "id": "dd67558e",
-        "nationality": ["de"],
-        "position": ["DF", "MF"],
-        "birth_year": 1981,
-    },
-    "Heiko-Gerber": {
-        "id": "ed45b99a",
-        "nationality": ["de"],
-        "position": ["DF", "MF"],
-        "birth_year": 1972,
-    },
-    "Berkant-G\u00f6ktan": {
-        "id": "9dc6ce11",
-        "nationality": ["tr"],
-        "position": ["FW"],
-        "birth_year": 1980,
-    },
-    "Richard-Golz": {
-        "id": "dd041263",
-        "nationality": ["de"],
-        "position": ["GK"],
-        "birth_year": 1968,
-    },
-    "A\u00edlton-Gon\u00e7alves": {
-        "id": "692a249e",
-        "nationality": ["br"],
-        "position": ["FW"],
-        "birth_year": 1973,
-    },
-    "Dimitrios-Grammozis": {
-        "id": "f9f929d1",
-        "nationality": ["gr"],
-        "position": ["MF"],
-        "birth_year": 1978,
-    },
-    "Dennis-Grassow": {
-        "id": "b35cb445",
-        "nationality": ["de"],
-        "position": ["DF"],
-        "birth_year": 1971,
-    },
-    "Holger-Greilich": {
-        "id": "491c8324",
-        "nationality": ["de"],
-        "position": ["DF"],
-        "birth_year": 1971,
-    },
-    "Frank-Greiner": {
-        "id": "3b6420f0",
-        "nationality": ["de"],
-        "position": ["DF", "MF"],
-        "birth_year": 1966,
-    },
-    "Ivica-Grli\u0107": {
-        "id": "7900696d",
-        "nationality": ["ba"],
-        "position": ["MF"],
-        "birth_year": 1975,
-    },
-    "Frode-Grod\u00e5s": {
-        "id": "07b2c083",
-        "nationality": ["no"],
-        "position": ["GK"],
-        "birth_year": 1964,
-    },
-    "Martin-Groth": {
-        "id": "3d5a4bc6",
-        "nationality": ["de"],
-        "position": ["MF"],
-        "birth_year": 1969,
-    },
-    "Rolf-Christel-Gui\u00e9-Mien": {
-        "id": "cce4cd9c",
-        "nationality": ["cg"],
-        "position": ["MF"],
-        "birth_year": 1977,
-    },
-    "Marco-Haber": {
-        "id": "41ef8ade",
-        "nationality": ["de"],
-        "position": ["MF"],
-        "birth_year": 1971,
-    },
-    "Tomasz-Hajto": {
-        "id": "5c1bed6b",
-        "nationality": ["pl"],
-        "position": ["DF"],
-        "birth_year": 1972,
-    },
-    "Markus-Happe": {
-        "id": "1a6acdeb",
-        "nationality": ["de"],
-        "position": ["DF"],
-        "birth_year": 1972,
-    },
-    "Owen-Hargreaves": {
-        "id": "1b2b5b86",
-        "nationality": ["eng"],
-        "position": ["MF"],
-        "birth_year": 1981,
-    },
-    "Michael-Hartmann": {
-        "id": "c2a670ce",
-        "nationality": ["de"],
-        "position": ["DF", "MF"],
-        "birth_year": 1974,
-    },
-    "Vahid-Hashemian": {
-        "id": "5b2834ed",
-        "nationality": ["ir"],
-        "position": ["FW", "MF"],
-        "birth_year": 1976,
-    },
-    "Thomas-H\u00e4\u00dfler": {
-        "id": "97ff665a",
-        "nationality": ["de"],
-        "position": ["MF"],
-        "birth_year": 1966,
-    },
-    "Rainer-Hauck": {
-        "id": "ff399b13",
-        "nationality": ["de"],
-        "position": ["DF"],
-        "birth_year": 1978,
-    },
-    "Ralf-Hauptmann": {
-        "id": "90235045",
-        "nationality": ["dd"],
-        "position": ["DF", "MF"],
-        "birth_year": 1968,
-    },
-    "Steffen-Heidrich": {
-        "id": "b1809eba",
-        "nationality": ["de"],
-        "position": ["MF"],
-        "birth_year": 1967,
-    },
-    "Dirk-Heinen": {
-        "id": "60cd9094",
-        "nationality": ["de"],
-        "position": ["GK"],
-        "birth_year": 1970,
-    },
-    "J\u00f6rg-Heinrich": {
-        "id": "bdf3492d",
-        "nationality": ["de"],
-        "position": ["DF", "MF"],
-        "birth_year": 1969,
-    },
-    "Marek-Heinz": {
-        "id": "0624e150",
-        "nationality": ["cz"],
-        "position": ["FW", "MF"],
-        "birth_year": 1977,
-    },
-    "Frankie-Hejduk": {
-        "id": "4d57c9a6",
-        "nationality": ["us"],
-        "position": ["DF", "MF"],
-        "birth_year": 1974,
-    },
-    "Sebastian-Helbig": {
-        "id": "2ff04b42",
-        "nationality": ["de"],
-        "position": ["FW", "MF"],
-        "birth_year": 1977,
-    },
-    "Oliver-Held": {
-        "id": "8f2439cd",
-        "nationality": ["de"],
-        "position": ["DF", "MF"],
-        "birth_year": 1972,
-    },
-    "Horst-Heldt": {
-        "id": "cae062df",
-        "nationality": ["de"],
-        "position": ["MF"],
-        "birth_year": 1969,
-    },
-    "Thomas-Hengen": {
-        "id": "9a635301",
-        "nationality": ["de"],
-        "position": ["DF"],
-        "birth_year": 1974,
-    },
-    "Lars-Hermel": {
-        "id": "7497ee64",
-        "nationality": ["de"],
-        "position": ["DF"],
-        "birth_year": 1970,
-    },
-    "Heiko-Herrlich": {
-        "id": "c5c8e9ca",
-        "nationality": ["de"],
-        "position": ["FW"],
-        "birth_year": 1971,
-    },
-    "Bj\u00f6rn-Hertl": {
-        "id": "65c7eaca",
-        "nationality": ["de"],
-        "position": ["DF", "MF"],
-        "birth_year": 1976,
-    },
-    "Ingo-Hertzsch": {
-        "id": "8084a11e",
-        "nationality": ["de"],
-        "position": ["DF"],
-        "birth_year": 1977,
-    },
-    "Andreas-Herzog": {
-        "id": "f46c7df9",
-        "nationality": ["at"],
-        "position": ["MF"],
-        "birth_year": 1968,
-    },
-    "Hendrik-Herzog": {
-        "id": "0670a3e2",
-        "nationality": ["de"],
-        "position": ["DF"],
-        "birth_year": 1969,
-    },
-    "Timo-Hildebrand": {
-        "id": "672b5171",
-        "nationality": ["de"],
-        "position": ["GK"],
-        "birth_year": 1979,
-    },
-    "Andreas-Hinkel": {
-        "id": "9d56817e",
-        "nationality": ["de"],
-        "position": ["DF"],
-        "birth_year": 1982,
-    },
-    "Dietmar-Hirsch": {
-        "id": "3e8f06bb",
-        "nationality": ["de"],
-        "position": ["DF", "MF"],
-        "birth_year": 1971,
-    },
-    "Alexander-Hleb": {
-        "id": "35cf43aa",
-        "nationality": ["by"],
-        "position": ["MF"],
-        "birth_year": 1981,
-    },
-    "Torben-Hoffmann": {
-        "id": "967a7889",
-        "nationality": ["de"],
-        "position": ["DF"],
-        "birth_year": 1974,
-    },
-    "Michael-Hofmann": {
-        "id": "11cd8973",
-        "nationality": ["de"],
-        "position": ["GK"],
-        "birth_year": 1972,
-    },
-    "Bernd-Hollerbach": {
-        "id": "850d07eb",
-        "nationality": ["de"],
-        "position": ["DF", "MF"],
-        "birth_year": 1969,
-    },
-    "Marco-van-Hoogdalem": {
-        "id": "683c4ff1",
-        "nationality": ["nl"],
-        "position": ["DF"],
-        "birth_year": 1972,
-    },
-    "Nico-Jan-Hoogma": {
-        "id": "2d782ef7",
-        "nationality": ["nl"],
-        "position": ["DF"],
-        "birth_year": 1968,
-    },
-    "Ferenc-Horv\u00e1th": {
-        "id": "2df4b5c5",
-        "nationality": ["hu"],
-        "position": ["FW"],
-        "birth_year": 1973,
-    },
-    "Marian-Hristov": {
-        "id": "78daf60d",
-        "nationality": ["bg"],
-        "position": ["MF"],
-        "birth_year": 1973,
-    },
-    "Petar-Hubchev": {
-        "id": "6c0bc4d9",
-        "nationality": ["bg"],
-        "position": ["DF"],
-        "birth_year": 1964,
-    },
-    "Faruk-Hujdurovi\u0107": {
-        "id": "3914969c",
-        "nationality": ["ba"],
-        "position": ["DF"],
-        "birth_year": 1970,
-    },
-    "Aleksandre-Iashvili": {
-        "id": "69215d39",
-        "nationality": ["ge"],
-        "position": ["FW", "MF"],
-        "birth_year": 1977,
-    },
-    "Emeka-Ifejiagwa": {
-        "id": "48f4f598",
-        "nationality": ["ng"],
-        "position": ["DF"],
-        "birth_year": 1977,
-    },
-    "Victor-Ikpeba": {
-        "id": "03a1cdbe",
-        "nationality": ["ng"],
-        "position": ["FW"],
-        "birth_year": 1973,
-    },
-    "Sabin-Ilie": {
-        "id": "c3aa244a",
-        "nationality": ["ro"],
-        "position": ["FW"],
-        "birth_year": 1975,
-    },
-    "Andreas-Jakobsson": {
-        "id": "4fa47ef0",
-        "nationality": ["se"],
-        "position": ["DF", "MF"],
-        "birth_year": 1972,
-    },
-    "Carsten-Jancker": {
-        "id": "20570c32",
-        "nationality": ["de"],
-        "position": ["FW"],
-        "birth_year": 1974,
-    },
-    "Simon-Jentzsch": {
-        "id": "2f1318de",
-        "nationality": ["de"],
-        "position": ["GK"],
-        "birth_year": 1976,
-    },
-    "Jens-Jeremies": {
-        "id": "b4632c7c",
-        "nationality": ["de"],
-        "position": ["MF"],
-        "birth_year": 1974,
-    },
-    "Jermaine-Jones": {
-        "id": "0c577541",
-        "nationality": ["us"],
-        "position": ["MF"],
-        "birth_year": 1981,
-    },
-    "Frank-Juric": {
-        "id": "f16f45b0",
-        "nationality": ["au"],
-        "position": ["GK"],
-        "birth_year": 1973,
-    },
-    "Andrzej-Juskowiak": {
-        "id": "d234cdc4",
-        "nationality": ["pl"],
-        "position": ["FW"],
-        "birth_year": 1970,
-    },
-    "Oliver-Kahn": {
-        "id": "c53142b5",
-        "nationality": ["de"],
-        "position": ["GK"],
-        "birth_year": 1969,
-    },
-    "Sead-Kapetanovi\u0107": {
-        "id": "4f16b083",
-        "nationality": ["ba"],
-        "position": ["DF", "MF"],
-        "birth_year": 1972,
-    },
-    "R\u00fcdiger-Kauf": {
-        "id": "73e5a63c",
-        "nationality": ["de"],
-        "position": ["MF"],
-        "birth_year": 1975,
-    },
-    "Sebastian-Kehl": {
-        "id": "6167875f",
-        "nationality": ["de"],
-        "position": ["DF", "MF"],
-        "birth_year": 1980,
-    },
-    "Jens-Keller": {
-        "id": "1e42fbe3",
-        "nationality": ["de"],
-        "position": ["DF"],
-        "birth_year": 1970,
-    },
-    "Joshua-Kennedy": {
-        "id": "cac2205d",
-        "nationality": ["au"],
-        "position": ["FW"],
-        "birth_year": 1982,
-    },
-    "Marcel-Ketelaer": {
-        "id": "d6fb7ed7",
-        "nationality": ["de"],
-        "position": ["FW", "MF"],
-        "birth_year": 1977,
-    },
-    "Jochen-Kientz": {
-        "id": "98a60af1",
-        "nationality": ["de"],
-        "position": ["DF"],
-        "birth_year": 1972,
-    },
-    "G\u00e1bor-Kir\u00e1ly": {
-        "id": "6603a18c",
-        "nationality": ["hu"],
-        "position": ["GK"],
-        "birth_year": 1976,
-    },
-    "Ulf-Kirsten": {
-        "id": "618e53cb",
-        "nationality": ["de"],
-        "position": ["FW"],
-        "birth_year": 1965,
-    },
-    "Miroslav-Klose": {
-        "id": "5e36a0dd",
-        "nationality": ["de"],
-        "position": ["FW"],
-        "birth_year": 1978,
-    },
-    "Sven-Kmetsch": {
-        "id": "5a84c9e8",
-        "nationality": ["de"],
-        "position": ["MF"],
-        "birth_year": 1970,
-    },
-    "Levan-Kobiashvili": {
-        "id": "b9196983",
-        "nationality": ["ge"],
-        "position": ["DF", "MF"],
-        "birth_year": 1977,
-    },
-    "Andrzej-Kobyla\u0144ski": {
-        "id": "44f82058",
-        "nationality": ["pl"],
-        "position": ["FW", "MF"],
-        "birth_year": 1970,
-    },
-    "Georg-Koch": {
-        "id": "2aeb9841",
-        "nationality": ["de"],
-        "position": ["GK"],
-        "birth_year": 1972,
-    },
-    "Harry-Koch": {
-        "id": "d1a7c74e",
-        "nationality": ["de"],
-        "position": ["DF"],
-        "birth_year": 1969,
-    },
-    "Ludwig-K\u00f6gl": {
-        "id": "9346f5a4",
-        "nationality": ["de"],
-        "position": ["FW", "MF"],
-        "birth_year": 1966,
-    },
-    "Ralf-Kohl": {
-        "id": "c4010b7a",
-        "nationality": ["de"],
-        "position": ["DF", "MF"],
-        "birth_year": 1965,
-    },
-    "Benjamin-K\u00f6hler": {
-        "id": "7172ae94",
-        "nationality": ["de"],
-        "position": ["MF"],
-        "birth_year": 1980,
-    },
-    "J\u00fcrgen-Kohler": {
-        "id": "06c613b9",
-        "nationality": ["de"],
-        "position": ["DF"],
-        "birth_year": 1965,
-    },
-    "Slobodan-Komljenovi\u0107": {
-        "id": "a8e80766",
-        "nationality": ["rs"],
-        "position": ["DF"],
-        "birth_year": 1971,
-    },
-    "Oumar-Kond\u00e9": {
-        "id": "d9d22372",
-        "nationality": ["cg"],
-        "position": ["DF"],
-        "birth_year": 1979,
-    },
-    "Kostas-Konstantinidis": {
-        "id": "e28ce024",
-        "nationality": ["gr"],
-        "position": ["DF"],
-        "birth_year": 1972,
-    },
-    "Niko-Kova\u010d": {
-        "id": "0670ad93",
-        "nationality": ["hr"],
-        "position": ["MF"],
-        "birth_year": 1971,
-    },
-    "Robert-Kova\u010d": {
-        "id": "cc19ca30",
-        "nationality": ["hr"],
-        "position": ["DF"],
-        "birth_year": 1974,
-    },
-    "Kreso-Kovacec": {
-        "id": "55e55369",
-        "nationality": ["de"],
-        "position": ["FW"],
-        "birth_year": 1969,
-    },
-    "Torsten-Kracht": {
-        "id": "d782733b",
-        "nationality": ["de"],
-        "position": ["DF"],
-        "birth_year": 1967,
-    },
-    "Markus-Kreuz": {
-        "id": "abf5cf2c",
-        "nationality": ["de"],
-        "position": ["MF"],
-        "birth_year": 1977,
-    },
-    "Emmanuel-Krontiris": {
-        "id": "a4c240ac",
-        "nationality": ["de"],
-        "position": ["FW"],
-        "birth_year": 1983,
-    },
-    "Mladen-Krstaji\u0107": {
-        "id": "d19b8686",
-        "nationality": ["rs"],
-        "position": ["DF"],
-        "birth_year": 1974,
-    },
-    "Benjamin-Kruse": {
-        "id": "c4b35666",
-        "nationality": ["de"],
-        "position": ["DF"],
-        "birth_year": 1978,
-    },
-    "Waldemar-Kryger": {
-        "id": "dd6d0848",
-        "nationality": ["pl"],
-        "position": ["DF"],
-        "birth_year": 1968,
-    },
-    "Pawe\u0142-Krysza\u0142owicz": {
-        "id": "c4f5c55d",
-        "nationality": ["pl"],
-        "position": ["FW"],
-        "birth_year": 1974,
-    },
-    "Samuel-Kuffour": {
-        "id": "a7221cc1",
-        "nationality": ["gh"],
-        "position": ["DF"],
-        "birth_year": 1976,
-    },
-    "Dietmar-K\u00fchbauer": {
-        "id": "8ddbbaa0",
-        "nationality": ["at"],
-        "position": ["MF"],
-        "birth_year": 1971,
-    },
-    "Markus-Kurth": {
-        "id": "13b09154",
-        "nationality": ["de"],
-        "position": ["FW"],
-        "birth_year": 1973,
-    },
-    "Marco-Kurz": {
-        "id": "ebd284a2",
-        "nationality": ["de"],
-        "position": ["DF"],
-        "birth_year": 1969,
-    },
-    "Alexander-Kutschera": {
-        "id": "69418ad4",
-        "nationality": ["de"],
-        "position": ["DF"],
-        "birth_year": 1968,
-    },
-    "Tomasz-K\u0142os": {
-        "id": "efb1247f",
-        "nationality": ["pl"],
-        "position": ["DF"],
-        "birth_year": 1973,
-    },
-    "Antun-Labak": {
-        "id": "80817574",
-        "nationality": ["hr"],
-        "position": ["FW"],
-        "birth_year": 1970,
-    },
-    "Timo-Lange": {
-        "id": "01d401e9",
-        "nationality": ["de"],
-        "position": ["MF"],
-        "birth_year": 1968,
-    },
-    "Marcus-Lantz": {
-        "id": "0ade90c7",
-        "nationality": ["se"],
-        "position": ["MF"],
-        "birth_year": 1975,
-    },
-    "Radoslav-L\u00e1tal": {
-        "id": "20b575b3",
-        "nationality": ["cz"],
-        "position": ["MF"],
-        "birth_year": 1970,
-    },
-    "Moussa-Latoundji": {
-        "id": "d720f552",
-        "nationality": ["bj"],
-        "position": ["MF"],
-        "birth_year": 1978,
-    },
-    "Philipp-Laux": {
-        "id": "7ccfee7c",
-        "nationality": ["de"],
-        "position": ["GK"],
-        "birth_year": 1973,
-    },
-    "Jens-Lehmann": {
-        "id": "d1ca1129",
-        "nationality": ["de"],
-        "position": ["GK"],
-        "birth_year": 1969,
-    },
-    "Thomas-Linke": {
-        "id": "f8ca1b7e",
-        "nationality": ["de"],
-        "position": ["DF"],
-        "birth_year": 1969,
-    },
-    "Kriszti\u00e1n-Lisztes": {
-        "id": "73338e07",
-        "nationality": ["hu"],
-        "position": ["MF"],
-        "birth_year": 1976,
-    },
-    "Bixente-Lizarazu": {
-        "id": "2ab8a20e",
-        "nationality": ["fr"],
-        "position": ["DF"],
-        "birth_year": 1969,
-    },
-    "Vratislav-Lokvenc": {
-        "id": "d26feb50",
-        "nationality": ["cz"],
-        "position": ["FW"],
-        "birth_year": 1973,
-    },
-    "Markus-L\u00f6sch": {
-        "id": "a2ce3520",
-        "nationality": ["de"],
-        "position": ["MF"],
-        "birth_year": 1971,
-    },
-    "Dirk-Lottner": {
-        "id": "849bc5be",
-        "nationality": ["de"],
-        "position": ["DF", "MF"],
-        "birth_year": 1972,
-    },
-    "L\u00facio": {
-        "id": "8abd0414",
-        "nationality": ["br"],
-        "position": ["DF"],
-        "birth_year": 1978,
-    },
-    "Matthias-Lust": {
-        "id": "6c5daa9a",
-        "nationality": ["de"],
-        "position": ["MF"],
-        "birth_year": 1970,
-    },
-    "Rob-Maas": {
-        "id": "65007930",
-        "nationality": ["nl"],
-        "position": ["DF", "MF"],
-        "birth_year": 1969,
-    },
-    "Mehdi-Mahdavikia": {
-        "id": "d048b174",
-        "nationality": ["ir"],
-        "position": ["DF", "MF"],
-        "birth_year": 1977,
-    },
-    "S\u0142awomir-Majak": {
-        "id": "8745fd32",
-        "nationality": ["pl"],
-        "position": ["FW", "MF"],
-        "birth_year": 1969,
-    },
-    "Yuriy-Maksymov": {
-        "id": "b8017d15",
-        "nationality": ["ua"],
-        "position": ["MF"],
-        "birth_year": 1968,
-    },
-    "Vladimir-Maljkovi\u0107": {
-        "id": "a60eb391",
-        "nationality": ["hr"],
-        "position": ["DF"],
-        "birth_year": 1982,
-    },
-    "Marcel-Maltritz": {
-        "id": "3580e8f6",
-        "nationality": ["de"],
-        "position": ["DF", "MF"],
-        "birth_year": 1978,
-    },
-    "Zoran-Mami\u0107": {
-        "id": "b2112837",
-        "nationality": ["hr"],
-        "position": ["DF", "MF"],
-        "birth_year": 1971,
-    },
-    "Sergei-Mandreko": {
-        "id": "e741c65a",
-        "nationality": ["xc"],
-        "position": ["MF"],
-        "birth_year": 1971,
-    },
-    "Marijo-Mari\u0107": {
-        "id": "577291af",
-        "nationality": ["hr"],
-        "position": ["FW"],
-        "birth_year": 1977,
-    },
-    "Tomislav-Mari\u0107": {
-        "id": "9b798967",
-        "nationality": ["hr"],
-        "position": ["FW"],
-        "birth_year": 1973,
-    },
-    "Rui-Marques": {
-        "id": "51947459",
-        "nationality": ["ao"],
-        "position": ["DF"],
-        "birth_year": 1977,
-    },
-    "Olaf-Marschall": {
-        "id": "b96ccd3b",
-        "nationality": ["de"],
-        "position": ["FW"],
-        "birth_year": 1966,
-    },
-    "Thorben-Marx": {
-        "id": "515f7a10",
-        "nationality": ["de"],
-        "position": ["MF"],
-        "birth_year": 1981,
-    },
-    "Adam-Matysek": {
-        "id": "e2982f89",
-        "nationality": ["pl"],
-        "position": ["GK"],
-        "birth_year": 1968,
-    },
-    "J\u00e1nos-M\u00e1tyus": {
-        "id": "856f60be",
-        "nationality": ["hu"],
-        "position": ["DF"],
-        "birth_year": 1974,
-    },
-    "Ronald-Maul": {
-        "id": "1ea2cbf8",
-        "nationality": ["de"],
-        "position": ["MF"],
-        "birth_year": 1973,
-    },
-    "Martin-Max": {
-        "id": "b8733b6c",
-        "nationality": ["de"],
-        "position": ["FW"],
-        "birth_year": 1968,
-    },
-    "Kevin-McKenna": {
-        "id": "b8f61657",
-        "nationality": ["ca"],
-        "position": ["DF", "FW"],
-        "birth_year": 1980,
-    },
-    "Martin-Meichelbeck": {
-        "id": "334aa0ee",
-        "nationality": ["de"],
-        "position": ["DF"],
-        "birth_year": 1976,
-    },
-    "Silvio-Mei\u00dfner": {
-        "id": "8fda9d61",
-        "nationality": ["de"],
-        "position": ["MF"],
-        "birth_year": 1973,
-    },
-    "Christoph-Metzelder": {
-        "id": "3f866377",
-        "nationality": ["de"],
-        "position": ["DF"],
-        "birth_year": 1980,
-    },
-    "Toni-Mi\u010devski": {
-        "id": "fee21928",
-        "nationality": ["mk"],
-        "position": ["MF"],
-        "birth_year": 1970,
-    },
-    "Kai-Michalke": {
-        "id": "c8cd6341",
-        "nationality": ["de"],
-        "position": ["FW"],
-        "birth_year": 1976,
-    },
-    "Christian-Mikolajczak": {
-        "id": "380e0686",
-        "nationality": ["de"],
-        "position": ["MF"],
-        "birth_year": 1981,
-    },
-    "Damir-Milinovi\u0107": {
-        "id": "2b7c73b3",
-        "nationality": ["hr"],
-        "position": ["DF"],
-        "birth_year": 1972,
-    },
-    "Vasile-Miriu\u021b\u0103": {
-        "id": "92f3bf58",
-        "nationality": ["hu"],
-        "position": ["MF"],
-        "birth_year": 1968,
-    },
-    "Andreas-M\u00f6ller": {
-        "id": "2ea0fe2e",
-        "nationality": ["de"],
-        "position": ["MF"],
-        "birth_year": 1967,
-    },
-    "\u00c9mile-Mpenza": {
-        "id": "4745cfd0",
-        "nationality": ["be"],
-        "position": ["FW"],
-        "birth_year": 1978,
-    },
-    "Youri-Mulder": {
-        "id": "ae882fff",
-        "nationality": ["nl"],
-        "position": ["FW"],
-        "birth_year": 1969,
-    },
-    "Ren\u00e9-M\u00fcller": {
-        "id": "a7a24279",
-        "nationality": ["de"],
-        "position": ["FW"],
-        "birth_year": 1974,
-    },
-    "Stefan-M\u00fcller": {
-        "id": "fd008ac3",
-        "nationality": ["de"],
-        "position": ["DF"],
-        "birth_year": 1974,
-    },
-    "Sven-M\u00fcller": {
-        "id": "406b138d",
-        "nationality": ["de"],
-        "position": ["DF", "MF"],
-        "birth_year": 1980,
-    },
-    "Dorinel-Munteanu": {
-        "id": "548cf04b",
-        "nationality": ["ro"],
-        "position": ["MF"],
-        "birth_year": 1968,
-    },
-    "Michael-Mutzel": {
-        "id": "5b135ddc",
-        "nationality": ["de"],
-        "position": ["MF"],
-        "birth_year": 1979,
-    },
-    "Erik-Mykland": {
-        "id": "594e5384",
-        "nationality": ["no"],
-        "position": ["DF", "MF"],
-        "birth_year": 1971,
-    },
-    "Ji\u0159\u00ed-N\u011bmec": {
-        "id": "dd9cc71a",
-        "nationality": ["cz"],
-        "position": ["MF"],
-        "birth_year": 1966,
-    },
-    "Christian-Nerlinger": {
-        "id": "ab2b8349",
-        "nationality": ["de"],
-        "position": ["MF"],
-        "birth_year": 1973,
-    },
-    "Andreas-Neuendorf": {
-        "id": "bd84ecfc",
-        "nationality": ["de"],
-        "position": ["MF"],
-        "birth_year": 1975,
-    },
-    "Oliver-Neuville": {
-        "id": "8181d015",
-        "nationality": ["de"],
-        "position": ["FW"],
-        "birth_year": 1973,
-    },
-    "Alfred-Nijhuis": {
-        "id": "aff49196",
-        "nationality": ["nl"],
-        "position": ["DF"],
-        "birth_year": 1966,
-    },
-    "Oka-Nikolov": {
-        "id": "99655abd",
-        "nationality": ["mk"],
-        "position": ["GK"],
-        "birth_year": 1974,
-    },
-    "D\u017eoni-Novak": {
-        "id": "0b74143a",
-        "nationality": ["si"],
-        "position": ["MF"],
-        "birth_year": 1969,
-    },
-    "Krzysztof-Nowak": {
-        "id": "6ab1da17",
-        "nationality": ["pl"],
-        "position": ["MF"],
-        "birth_year": 1975,
-    },
-    "Jens-Nowotny": {
-        "id": "ddae6a6e",
-        "nationality": ["de"],
-        "position": ["DF"],
-        "birth_year": 1974,
-    },
-    "Markus-Oberleitner": {
-        "id": "ec15d294",
-        "nationality": ["de"],
-        "position": ["MF"],
-        "birth_year": 1973,
-    },
-    "Pascal-Ojigwe": {
-        "id": "6e99b723",
-        "nationality": ["ng"],
-        "position": ["DF", "MF"],
-        "birth_year": 1976,
-    },
-    "Sunday-Oliseh": {
-        "id": "77502ae4",
-        "nationality": ["ng"],
-        "position": ["DF", "MF"],
-        "birth_year": 1974,
-    },
-    "Kai-Oswald": {
-        "id": "8ee871a3",
-        "nationality": ["de"],
-        "position": ["DF"],
-        "birth_year": 1977,
-    },
-    "Niels-Oude-Kamphuis": {
-        "id": "bc522dfd",
-        "nationality": ["nl"],
-        "position": ["DF", "MF"],
-        "birth_year": 1977,
-    },
-    "Alassane-Ou\u00e9draogo": {
-        "id": "8412b7c3",
-        "nationality": ["bf"],
-        "position": ["MF"],
-        "birth_year": 1980,
-    },
-    "Andrej-Panadi\u0107": {
-        "id": "ea475365",
-        "nationality": ["yu"],
-        "position": ["DF"],
-        "birth_year": 1969,
-    },
-    "Stephan-Pa\u00dflack": {
-        "id": "2518e80c",
-        "nationality": ["de"],
-        "position": ["DF"],
-        "birth_year": 1970,
-    },
-    "Peter-Peschel": {
-        "id": "cc0a32c1",
-        "nationality": ["de"],
-        "position": ["MF"],
-        "birth_year": 1972,
-    },
-    "J\u00f6rgen-Pettersson": {
-        "id": "ffec523c",
-        "nationality": ["se"],
-        "position": ["FW"],
-        "birth_year": 1975,
-    },
-    "Achim-Pfuderer": {
-        "id": "05a30e73",
-        "nationality": ["de"],
-        "position": ["DF"],
-        "birth_year": 1975,
-    },
-    "Martin-Pieckenhagen": {
-        "id": "ccfe52bd",
-        "nationality": ["de"],
-        "position": ["GK"],
-        "birth_year": 1971,
-    },
-    "Roberto-Pinto": {
-        "id": "60a7c62c",
-        "nationality": ["pt"],
-        "position": ["MF"],
-        "birth_year": 1978,
-    },
-    "Tomislav-Piplica": {
-        "id": "87a8d51c",
-        "nationality": ["ba"],
-        "position": ["GK"],
-        "birth_year": 1969,
-    },
-    "Darko-Pivaljevi\u0107": {
-        "id": "07a9346a",
-        "nationality": ["rs"],
-        "position": ["FW"],
-        "birth_year": 1975,
-    },
-    "Claudio-Pizarro": {
-        "id": "54b6ee79",
-        "nationality": ["pe"],
-        "position": ["FW"],
-        "birth_year": 1978,
-    },
-    "Diego-Placente": {
-        "id": "f6bcca5d",
-        "nationality": ["ar"],
-        "position": ["DF"],
-        "birth_year": 1977,
-    },
-    "Robson-Ponte": {
-        "id": "26204e02",
-        "nationality": ["br"],
-        "position": ["FW", "MF"],
-        "birth_year": 1976,
-    },
-    "Roy-Pr\u00e4ger": {
-        "id": "f1cb95be",
-        "nationality": ["de"],
-        "position": ["FW"],
-        "birth_year": 1971,
-    },
-    "Michael-Preetz": {
-        "id": "d7a37303",
-        "nationality": ["de"],
-        "position": ["FW"],
-        "birth_year": 1967,
-    },
-    "Christoph-Preu\u00df": {
-        "id": "8b4a6fcb",
-        "nationality": ["de"],
-        "position": ["DF", "MF"],
-        "birth_year": 1981,
-    },
-    "Markus-Pr\u00f6ll": {
-        "id": "a41c070b",
-        "nationality": ["de"],
-        "position": ["GK"],
-        "birth_year": 1979,
-    },
-    "Marcus-P\u00fcrk": {
-        "id": "fde7b101",
-        "nationality": ["at"],
-        "position": ["FW", "MF"],
-        "birth_year": 1974,
-    },
-    "Karel-Rada": {
-        "id": "f7ef313f",
-        "nationality": ["cz"],
-        "position": ["DF"],
-        "birth_year": 1971,
-    },
-    "Yasser-Radwan": {
-        "id": "a06db3e8",
-        "nationality": ["eg"],
-        "position": ["DF", "MF"],
-        "birth_year": 1972,
-    },
-    "Abder-Ramdane": {
-        "id": "80f9b16d",
-        "nationality": ["fr"],
-        "position": ["FW", "MF"],
-        "birth_year": 1974,
-    },
-    "Carsten-Ramelow": {
-        "id": "3c0a5007",
-        "nationality": ["de"],
-        "position": ["DF", "MF"],
-        "birth_year": 1974,
-    },
-    "Hany-Ramzy": {
-        "id": "1b267b7c",
-        "nationality": ["eg"],
-        "position": ["DF"],
-        "birth_year": 1969,
-    },
-    "Jens-Rasiejewski": {
-        "id": "e8066322",
-        "nationality": ["de"],
-        "position": ["DF"],
-        "birth_year": 1975,
-    },
-    "Ratinho": {
-        "id": "86431278",
-        "nationality": ["br"],
-        "position": ["MF"],
-        "birth_year": 1971,
-    },
-    "Oliver-Reck": {
-        "id": "09bef3ad",
-        "nationality": ["de"],
-        "position": ["GK"],
-        "birth_year": 1965,
-    },
-    "J\u00f6rg-Reeb": {
-        "id": "53f95cc9",
-        "nationality": ["de"],
-        "position": ["DF", "MF"],
-        "birth_year": 1972,
-    },
-    "Lauren\u021biu-Reghecampf": {
-        "id": "346cebbd",
-        "nationality": ["ro"],
-        "position": ["MF"],
-        "birth_year": 1975,
-    },
-    "Marko-Rehmer": {
-        "id": "82ea7af7",
-        "nationality": ["de"],
-        "position": ["DF"],
-        "birth_year": 1972,
-    },
-    "Marco-Reich": {
-        "id": "e1706a91",
-        "nationality": ["de"],
-        "position": ["FW", "MF"],
-        "birth_year": 1977,
-    },
-    "Thomas-Reichenberger": {
-        "id": "0e43f0a9",
-        "nationality": ["de"],
-        "position": ["FW"],
-        "birth_year": 1974,
-    },
-    "Giuseppe-Reina": {
-        "id": "645f3aa6",
-        "nationality": ["de"],
-        "position": ["FW"],
-        "birth_year": 1972,
-    },
-    "Thomas-Reis": {
-        "id": "4e6e133d",
-        "nationality": ["de"],
-        "position": ["DF", "MF"],
-        "birth_year": 1973,
-    },
-    "Piotr-Reiss": {
-        "id": "7b5d30a3",
-        "nationality": ["pl"],
-        "position": ["FW"],
-        "birth_year": 1972,
-    },
-    "Claus-Reitmaier": {
-        "id": "02c38c9a",
-        "nationality": ["de"],
-        "position": ["GK"],
-        "birth_year": 1964,
-    },
-    "Stefan-Reuter": {
-        "id": "72ed91c2",
-        "nationality": ["de"],
-        "position": ["DF", "MF"],
-        "birth_year": 1966,
-    },
-    "Lars-Ricken": {
-        "id": "0ce743a7",
-        "nationality": ["de"],
-        "position": ["FW", "MF"],
-        "birth_year": 1976,
-    },
-    "Thomas-Riedl": {
-        "id": "a6d7e7c8",
-        "nationality": ["de"],
-        "position": ["DF", "MF"],
-        "birth_year": 1976,
-    },
-    "Mike-Rietpietsch": {
-        "id": "45e98c81",
-        "nationality": ["de"],
-        "position": ["MF"],
-        "birth_year": 1974,
-    },
-    "Paulo-Rink": {
-        "id": "0fc15098",
-        "nationality": ["de"],
-        "position": ["FW", "MF"],
-        "birth_year": 1973,
-    },
-    "J\u00fcrgen-Rische": {
-        "id": "bbd421ce",
-        "nationality": ["de"],
-        "position": ["FW"],
-        "birth_year": 1970,
-    },
-    "Vidar-Riseth": {
-        "id": "815b6e14",
-        "nationality": ["no"],
-        "position": ["DF", "MF"],
-        "birth_year": 1972,
-    },
-    "Hilko-Ristau": {
-        "id": "3a9faabe",
-        "nationality": ["de"],
-        "position": ["DF"],
-        "birth_year": 1974,
-    },
-    "Z\u00e9-Roberto": {"id": "48557761", "birth_year": 1978},
-    "Jonny-R\u00f6dlund": {
-        "id": "f357d3ee",
-        "nationality": ["se"],
-        "position": ["MF"],
-        "birth_year": 1971,
-    },
-    "Axel-Roos": {
-        "id": "8c341cc5",
-        "nationality": ["de"],
-        "position": ["DF", "FW"],
-        "birth_year": 1964,
-    },
-    "Alexander-Rosen": {
-        "id": "caa54b46",
-        "nationality": ["de"],
-        "position": ["MF"],
-        "birth_year": 1979,
-    },
-    "Tom\u00e1\u0161-Rosick\u00fd": {
-        "id": "dbb688e3",
-        "nationality": ["cz"],
-        "position": ["MF"],
-        "birth_year": 1980,
-    },
-    "Frank-Rost": {
-        "id": "887b89b8",
-        "nationality": ["de"],
-        "position": ["GK"],
-        "birth_year": 1973,
-    },
-    "Bryan-Roy": {
-        "id": "f30a9664",
-        "nationality": ["nl"],
-        "position": ["FW", "MF"],
-        "birth_year": 1970,
-    },
-    "Altin-Rraklli": {
-        "id": "385de54f",
-        "nationality": ["al"],
-        "position": ["FW"],
-        "birth_year": 1970,
-    },
-    "Ren\u00e9-Rydlewicz": {
-        "id": "7c137b7f",
-        "nationality": ["de"],
-        "position": ["FW", "MF"],
-        "birth_year": 1973,
-    },
-    "Willy-Sagnol": {
-        "id": "bc932987",
-        "nationality": ["fr"],
-        "position": ["DF"],
-        "birth_year": 1977,
-    },
-    "Ahmed-Salah-Hosny": {
-        "id": "076b0eeb",
-        "nationality": ["eg"],
-        "position": ["FW"],
-        "birth_year": 1979,
-    },
-    "Hasan-Salihamid\u017ei\u0107": {
-        "id": "f1366d68",
-        "nationality": ["ba"],
-        "position": ["DF", "MF"],
-        "birth_year": 1977,
-    },
-    "Bachirou-Salou": {
-        "id": "fb00cd6d",
-        "nationality": ["tg"],
-        "position": ["FW"],
-        "birth_year": 1970,
-    },
-    "Ebbe-Sand": {
-        "id": "24654dcb",
-        "nationality": ["dk"],
-        "position": ["FW"],
-        "birth_year": 1972,
-    },
-    "Jan-Sandmann": {
-        "id": "50fe66ef",
-        "nationality": ["de"],
-        "position": ["DF"],
-        "birth_year": 1978,
-    },
-    "Tony-Sanneh": {
-        "id": "42047fe3",
-        "nationality": ["us"],
-        "position": ["DF", "MF"],
-        "birth_year": 1971,
-    },
-    "Roque-Santa-Cruz": {
-        "id": "7f2107eb",
-        "nationality": ["py"],
-        "position": ["FW"],
-        "birth_year": 1981,
-    },
-    "J\u00f6rg-Scherbe": {
-        "id": "39b6f545",
-        "nationality": ["de"],
-        "position": ["MF"],
-        "birth_year": 1977,
-    },
-    "Matthias-Scherz": {
-        "id": "cea72c78",
-        "nationality": ["de"],
-        "position": ["FW"],
-        "birth_year": 1971,
-    },
-    "Bj\u00f6rn-Schierenbeck": {
-        "id": "6bdf80fb",
-        "nationality": ["de"],
-        "position": ["DF", "MF"],
-        "birth_year": 1974,
-    },
-    "Sebastian-Schindzielorz": {
-        "id": "b813dfd2",
-        "nationality": ["de"],
-        "position": ["MF"],
-        "birth_year": 1979,
-    },
-    "Michael-Schj\u00f8nberg": {
-        "id": "2277baf6",
-        "nationality": ["dk"],
-        "position": ["DF", "MF"],
-        "birth_year": 1967,
-    },
-    "Andreas-Schmidt": {
-        "id": "7dc158ba",
-        "nationality": ["de"],
-        "position": ["DF", "MF"],
-        "birth_year": 1973,
-    },
-    "Ralf-Schmitt": {
-        "id": "1532d01c",
-        "nationality": ["de"],
-        "position": ["FW"],
-        "birth_year": 1977,
-    },
-    "Sven-Schmitt": {
-        "id": "3982fd9d",
-        "nationality": ["de"],
-        "position": ["GK"],
-        "birth_year": 1976,
-    },
-    "Bernd-Schneider": {
-        "id": "5487a63d",
-        "nationality": ["de"],
-        "position": ["DF", "MF"],
-        "birth_year": 1973,
-    },
-    "Ren\u00e9-Schneider": {
-        "id": "91266716",
-        "nationality": ["de"],
-        "position": ["DF"],
-        "birth_year": 1973,
-    },
-    "Thomas-Schneider": {
-        "id": "5fa6354f",
-        "nationality": ["de"],
-        "position": ["DF"],
-        "birth_year": 1972,
-    },
-    "Mathias-Schober": {
-        "id": "2c171840",
-        "nationality": ["de"],
-        "position": ["GK"],
-        "birth_year": 1976,
-    },
-    "Mehmet-Scholl": {
-        "id": "8da38495",
-        "nationality": ["de"],
-        "position": ["MF"],
-        "birth_year": 1970,
-    },
-    "Olaf-Schreiber": {
-        "id": "5d32a2b6",
-        "nationality": ["de"],
-        "position": ["MF"],
-        "birth_year": 1969,
-    },
-    "Rayk-Schr\u00f6der": {
-        "id": "c12db5a2",
-        "nationality": ["de"],
-        "position": ["DF"],
-        "birth_year": 1974,
-    },
-    "Rouven-Schr\u00f6der": {
-        "id": "3f4c7046",
-        "nationality": ["de"],
-        "position": ["DF"],
-        "birth_year": 1975,
-    },
-    "Markus-Schroth": {
-        "id": "495af691",
-        "nationality": ["de"],
-        "position": ["FW"],
-        "birth_year": 1975,
-    },
-    "Daniel-Schumann": {
-        "id": "9b86aa4c",
-        "nationality": ["de"],
-        "position": ["DF"],
-        "birth_year": 1977,
-    },
-    "Alexander-Schur": {
-        "id": "f6269f26",
-        "nationality": ["de"],
-        "position": ["MF"],
-        "birth_year": 1971,
-    },
-    "Danny-Schwarz": {
-        "id": "f4e968e9",
-        "nationality": ["de"],
-        "position": ["MF"],
-        "birth_year": 1975,
-    },
-    "Zolt\u00e1n-Sebescen": {
-        "id": "81541d99",
-        "nationality": ["de"],
-        "position": ["DF", "MF"],
-        "birth_year": 1975,
-    },
-    "Vilmos-Seb\u0151k": {
-        "id": "897182a4",
-        "nationality": ["hu"],
-        "position": ["DF"],
-        "birth_year": 1973,
-    },
-    "Jan-Seifert": {
-        "id": "867ab211",
-        "nationality": ["de"],
-        "position": ["DF"],
-        "birth_year": 1968,
-    },
-    "Jochen-Seitz": {
-        "id": "b2af62d9",
-        "nationality": ["de"],
-        "position": ["DF", "MF"],
-        "birth_year": 1976,
-    },
-    "Adel-Sellimi": {
-        "id": "73a4eb71",
-        "nationality": ["tn"],
-        "position": ["FW"],
-        "birth_year": 1972,
-    },
-    "Paulo-S\u00e9rgio": {"id": "a2bb868a", "birth_year": 1969},
-    "Ciriaco-Sforza": {
-        "id": "132c2f20",
-        "nationality": ["ch"],
-        "position": ["DF", "MF"],
-        "birth_year": 1970,
-    },
-    "Moses-Sichone": {
-        "id": "c0271a1b",
-        "nationality": ["zm"],
-        "position": ["DF"],
-        "birth_year": 1977,
-    },
-    "Sascha-Siebert": {
-        "id": "04bf1b29",
-        "nationality": ["de"],
-        "position": ["FW"],
-        "birth_year": 1977,
-    },
-    "Benjamin-Siegert": {
-        "id": "e3a325b9",
-        "nationality": ["de"],
-        "position": ["MF"],
-        "birth_year": 1981,
-    },
-    "Josip-\u0160imuni\u0107": {
-        "id": "6f10d8e1",
-        "nationality": ["hr"],
-        "position": ["DF"],
-        "birth_year": 1978,
-    },
-    "Andrew-Sinkala": {
-        "id": "676808bb",
-        "nationality": ["zm"],
-        "position": ["MF"],
-        "birth_year": 1979,
-    },
-    "Viktor-Skrypnyk": {
-        "id": "5afb2790",
-        "nationality": ["ua"],
-        "position": ["DF", "MF"],
-        "birth_year": 1969,
-    },
-    "Thomas-Sobotzik": {
-        "id": "9b1e2ab7",
-        "nationality": ["de"],
-        "position": ["MF"],
-        "birth_year": 1974,
-    },
-    "Zvonimir-Soldo": {
-        "id": "05af2722",
-        "nationality": ["hr"],
-        "position": ["DF", "MF"],
-        "birth_year": 1967,
-    },
-    "Miros\u0142aw-Spi\u017cak": {
-        "id": "be791654",
-        "nationality": ["pl"],
-        "position": ["FW"],
-        "birth_year": 1979,
-    },
-    "Harald-Sp\u00f6rl": {
-        "id": "ad291784",
-        "nationality": ["de"],
-        "position": ["MF"],
-        "birth_year": 1966,
-    },
-    "Christian-Springer": {
-        "id": "fdea0bff",
-        "nationality": ["de"],
-        "position": ["MF"],
-        "birth_year": 1971,
-    },
-    "Paul-Stalteri": {
-        "id": "0a0e673c",
-        "nationality": ["ca"],
-        "position": ["DF", "MF"],
-        "birth_year": 1977,
-    },
-    "Marco-Stark": {
-        "id": "d01d3589",
-        "nationality": ["de"],
-        "position": ["DF"],
-        "birth_year": 1981,
-    },
-    "Miroslav-Stevi\u0107": {
-        "id": "323ef7e4",
-        "nationality": ["rs"],
-        "position": ["MF"],
-        "birth_year": 1970,
-    },
-    "Thomas-Stickroth": {
-        "id": "374f1cf7",
-        "nationality": ["de"],
-        "position": ["DF", "MF"],
-        "birth_year": 1965,
-    },
-    "Martin-Stranzl": {
-        "id": "4786c8d5",
-        "nationality": ["at"],
-        "position": ["DF", "MF"],
-        "birth_year": 1980,
-    },
-    "Jeff-Strasser": {
-        "id": "d784f294",
-        "nationality": ["lu"],
-        "position": ["DF"],
-        "birth_year": 1974,
-    },
-    "Oliver-Straube": {
-        "id": "68e1dd2e",
-        "nationality": ["de"],
-        "position": ["MF"],
-        "birth_year": 1971,
-    },
-    "Alexander-Strehmel": {
-        "id": "12b22920",
-        "nationality": ["de"],
-        "position": ["DF", "MF"],
-        "birth_year": 1968,
-    },
-    "Albert-Streit": {
-        "id": "35acf792",
-        "nationality": ["de"],
-        "position": ["MF"],
-        "birth_year": 1980,
-    },
-    "Thomas-Strunz": {
-        "id": "a199fcc7",
-        "nationality": ["de"],
-        "position": ["MF"],
-        "birth_year": 1968,
-    },
-    "Axel-Sundermann": {
-        "id": "2dd9cbba",
-        "nationality": ["de"],
-        "position": ["DF"],
-        "birth_year": 1968,
-    },
-    "Jan-Derek-S\u00f8rensen": {
-        "id": "d2bb0d7c",
-        "nationality": ["no"],
-        "position": ["FW", "MF"],
-        "birth_year": 1971,
-    },
-    "Ibrahim-Tanko": {
-        "id": "cd54ef5c",
-        "nationality": ["gh"],
-        "position": ["FW"],
-        "birth_year": 1977,
-    },
-    "Filip-Tapalovi\u0107": {
-        "id": "7e25065d",
-        "nationality": ["hr"],
-        "position": ["MF"],
-        "birth_year": 1976,
-    },
-    "Michael-Tarnat": {
-        "id": "2572fceb",
-        "nationality": ["de"],
-        "position": ["DF", "MF"],
-        "birth_year": 1969,
-    },
-    "Pablo-Thiam": {
-        "id": "9044d2e5",
-        "nationality": ["gn"],
-        "position": ["DF", "MF"],
-        "birth_year": 1974,
-    },
-    "Ronny-Thielemann": {
-        "id": "baae37ac",
-        "nationality": ["de"],
-        "position": ["MF"],
-        "birth_year": 1973,
-    },
-    "Andreas-Thom": {
-        "id": "0e3344f9",
-        "nationality": ["de"],
-        "position": ["FW"],
-        "birth_year": 1965,
-    },
-    "Claus-Thomsen": {
-        "id": "75cc86bc",
-        "nationality": ["dk"],
-        "position": ["DF"],
-        "birth_year": 1970,
-    },
-    "Olaf-Thon": {
-        "id": "89afc102",
-        "nationality": ["de"],
-        "position": ["DF", "MF"],
-        "birth_year": 1966,
-    },
-    "Christian-Tiffert": {
-        "id": "e6f3a40a",
-        "nationality": ["de"],
-        "position": ["MF"],
-        "birth_year": 1982,
-    },
-    "Christian-Timm": {
-        "id": "f84537a7",
-        "nationality": ["de"],
-        "position": ["FW"],
-        "birth_year": 1979,
-    },
-    "Razundara-Tjikuzu": {
-        "id": "d2d2d5bc",
-        "nationality": ["na"],
-        "position": ["DF", "MF"],
-        "birth_year": 1979,
-    },
-    "Jens-Todt": {
-        "id": "7f7ccbcb",
-        "nationality": ["de"],
-        "position": ["DF", "MF"],
-        "birth_year": 1970,
-    },
-    "Samir-Toplak": {
-        "id": "ab1c33ad",
-        "nationality": ["hr"],
-        "position": ["DF"],
-        "birth_year": 1970,
-    },
-    "Marco-Toppm\u00f6ller": {
-        "id": "e2b17814",
-        "nationality": ["de"],
-        "position": ["FW"],
-        "birth_year": 1978,
-    },
-    "Bernhard-Trares": {
-        "id": "9b46abf3",
-        "nationality": ["de"],
-        "position": ["DF", "MF"],
-        "birth_year": 1965,
-    },
-    "Gerhard-Tremmel": {
-        "id": "4370cecc",
-        "nationality": ["de"],
-        "position": ["GK"],
-        "birth_year": 1978,
-    },
-    "Ren\u00e9-Tretschok": {
-        "id": "f2a1d32e",
-        "nationality": ["de"],
-        "position": ["MF"],
-        "birth_year": 1968,
-    },
-    "Levan-Tskitishvili": {
-        "id": "c9f0e69c",
-        "nationality": ["ge"],
-        "position": ["MF"],
-        "birth_year": 1976,
-    },
-    "Tsanko-Tsvetanov": {
-        "id": "69f38db3",
-        "nationality": ["bg"],
-        "position": ["DF"],
-        "birth_year": 1970,
-    },
-    "Roman-T\u00fdce": {
-        "id": "9b56e7b9",
-        "nationality": ["cz"],
-        "position": ["DF", "MF"],
-        "birth_year": 1977,
-    },
-    "Stig-T\u00f8fting": {
-        "id": "a8fe3e31",
-        "nationality": ["dk"],
-        "position": ["MF"],
-        "birth_year": 1969,
-    },
-    "Tom\u00e1\u0161-Ujfalu\u0161i": {
-        "id": "37d34e0a",
-        "nationality": ["cz"],
-        "position": ["DF"],
-        "birth_year": 1978,
-    },
-    "Angelo-Vaccaro": {
-        "id": "dd877569",
-        "nationality": ["it"],
-        "position": ["FW"],
-        "birth_year": 1981,
-    },
-    "Nico-Van-Kerckhoven": {
-        "id": "a0860436",
-        "nationality": ["be"],
-        "position": ["DF", "FW"],
-        "birth_year": 1970,
-    },
-    "Christian-Vander": {
-        "id": "6e1095f4",
-        "nationality": ["de"],
-        "position": ["GK"],
-        "birth_year": 1980,
-    },
-    "Rudi-Vata": {
-        "id": "e7ded1ad",
-        "nationality": ["al"],
-        "position": ["DF", "MF"],
-        "birth_year": 1969,
-    },
-    "Sixten-Veit": {
-        "id": "14056bca",
-        "nationality": ["de"],
-        "position": ["MF"],
-        "birth_year": 1970,
-    },
-    "Frank-Verlaat": {
-        "id": "183a6279",
-        "nationality": ["nl"],
-        "position": ["DF"],
-        "birth_year": 1968,
-    },
-    "Alexander-Voigt": {
-        "id": "3357cd1c",
-        "nationality": ["de"],
-        "position": ["DF"],
-        "birth_year": 1978,
-    },
-    "Andreas-Voss": {
-        "id": "21121bde",
-        "nationality": ["de"],
-        "position": ["MF"],
-        "birth_year": 1979,
-    },
-    "Tom\u00e1\u0161-Votava": {
-        "id": "ddc220fc",
-        "nationality": ["cz"],
-        "position": ["DF"],
-        "birth_year": 1974,
-    },
-    "Jurica-Vranje\u0161": {
-        "id": "62889ae9",
-        "nationality": ["hr"],
-        "position": ["MF"],
-        "birth_year": 1980,
-    },
-    "Ivan-Vukomanovi\u0107": {
-        "id": "7dc1a237",
-        "nationality": ["rs"],
-        "position": ["MF"],
-        "birth_year": 1977,
-    },
-    "Martin-Wagner": {
-        "id": "2c1752ea",
-        "nationality": ["de"],
-        "position": ["DF", "MF"],
-        "birth_year": 1968,
-    },
-    "Witold-Wawrzyczek": {
-        "id": "3474c98f",
-        "nationality": ["pl"],
-        "position": ["DF", "MF"],
-        "birth_year": 1973,
-    },
-    "Tomasz-Wa\u0142doch": {
-        "id": "1c57784d",
-        "nationality": ["pl"],
-        "position": ["DF"],
-        "birth_year": 1971,
-    },
-    "Achim-Weber": {
-        "id": "db1b5f0d",
-        "nationality": ["de"],
-        "position": ["FW"],
-        "birth_year": 1969,
-    },
-    "Roman-Weidenfeller": {
-        "id": "16b8fabd",
-        "nationality": ["de"],
-        "position": ["GK"],
-        "birth_year": 1980,
-    },
-    "Hilmar-Weilandt": {
-        "id": "4231cfa2",
-        "nationality": ["de"],
-        "position": ["DF", "MF"],
-        "birth_year": 1966,
-    },
-    "Patrick-Weiser": {
-        "id": "04c958c0",
-        "nationality": ["de"],
-        "position": ["DF", "MF"],
-        "birth_year": 1971,
-    },
-    "Marco-Wei\u00dfhaupt": {
-        "id": "0f756469",
-        "nationality": ["de"],
-        "position": ["MF"],
-        "birth_year": 1972,
-    },
-    "Timo-Wenzel": {
-        "id": "bf1cbcda",
-        "nationality": ["de"],
-        "position": ["DF"],
-        "birth_year": 1977,
-    },
-    "Stefan-Wessels": {
-        "id": "b405f32d",
-        "nationality": ["de"],
-        "position": ["GK"],
-        "birth_year": 1979,
-    },
-    "Peter-Wibr\u00e5n": {
-        "id": "a50cbe89",
-        "nationality": ["se"],
-        "position": ["MF"],
-        "birth_year": 1969,
-    },
-    "Rapha\u00ebl-Wicky": {
-        "id": "4d8a501c",
-        "nationality": ["ch"],
-        "position": ["DF", "MF"],
-        "birth_year": 1977,
-    },
-    "Andree-Wiedener": {
-        "id": "716b8e40",
-        "nationality": ["de"],
-        "position": ["DF"],
-        "birth_year": 1970,
-    },
-    "Michael-Wiesinger": {
-        "id": "6aa7c6bd",
-        "nationality": ["de"],
-        "position": ["MF"],
-        "birth_year": 1972,
-    },
-    "Tobias-Willi": {
-        "id": "2fd5e3cf",
-        "nationality": ["de"],
-        "position": ["MF"],
-        "birth_year": 1979,
-    },
-    "Gerd-Wimmer": {
-        "id": "db969d76",
-        "nationality": ["at"],
-        "position": ["DF", "MF"],
-        "birth_year": 1977,
-    },
-    "Bernhard-Winkler": {
-        "id": "19e3c3d3",
-        "nationality": ["de"],
-        "position": ["FW"],
-        "birth_year": 1966,
-    },
-    "J\u00fcrgen-Wittmann": {
-        "id": "3dddec0e",
-        "nationality": ["de"],
-        "position": ["GK"],
-        "birth_year": 1966,
-    },
-    "Claus-Dieter-Wollitz": {
-        "id": "0ea38972",
-        "nationality": ["de"],
-        "position": ["MF"],
-        "birth_year": 1965,
-    },
-    "Christian-W\u00f6rns": {
-        "id": "3a1a98a2",
-        "nationality": ["de"],
-        "position": ["DF"],
-        "birth_year": 1972,
-    },
-    "Dariusz-Wosz": {
-        "id": "915a6c2b",
-        "nationality": ["de"],
-        "position": ["MF"],
-        "birth_year": 1969,
-    },
-    "Murat-Yakin": {
-        "id": "145d5675",
-        "nationality": ["ch"],
-        "position": ["DF"],
-        "birth_year": 1974,
-    },
-    "Chen-Yang": {
-        "id": "7ac8d103",
-        "nationality": ["cn"],
-        "position": ["MF"],
-        "birth_year": 1977,
-    },
-    "Tony-Yeboah": {
-        "id": "19256324",
-        "nationality": ["gh"],
-        "position": ["FW"],
-        "birth_year": 1966,
-    },
-    "Mahmut-Y\u0131lmaz": {
-        "id": "951eca17",
-        "nationality": ["de"],
-        "position": ["FW"],
-        "birth_year": 1979,
-    },
-    "Marco-Zallmann": {
-        "id": "1558653e",
-        "nationality": ["de"],
-        "position": ["DF"],
-        "birth_year": 1967,
-    },
-    "Ferydoon-Zandi": {
-        "id": "1baca5f1",
-        "nationality": ["ir"],
-        "position": ["MF"],
-        "birth_year": 1979,
-    },
-    "David-Zdrilic": {
-        "id": "d4f07495",
-        "nationality": ["au"],
-        "position": ["FW"],
-        "birth_year": 1974,
-    },
-    "Ned-Zeli\u0107": {
-        "id": "4240b370",
-        "nationality": ["au"],
-        "position": ["DF", "MF"],
-        "birth_year": 1971,
-    },
-    "Andreas-Zeyer": {
-        "id": "77cd12fe",
-        "nationality": ["de"],
-        "position": ["MF"],
-        "birth_year": 1968,
-    },
-    "Alexander-Zickler": {
-        "id": "702be2ae",
-        "nationality": ["de"],
-        "position": ["FW"],
-        "birth_year": 1974,
-    },
-    "R\u00fcdiger-Ziehl": {
-        "id": "17dc1007",
-        "nationality": ["de"],
-        "position": ["MF"],
-        "birth_year": 1977,
-    },
-    "Sead-Zili\u0107": {
-        "id": "e5d6e6cf",
-        "nationality": ["ba"],
-        "position": ["FW"],
-        "birth_year": 1982,
-    },
-    "Matthias-Zimmermann": {
-        "id": "db186580",
-        "nationality": ["de"],
-        "position": ["MF"],
-        "birth_year": 1970,
-    },
-    "Stefan-Zinnow": {
-        "id": "769e69ad",
-        "nationality": ["de"],
-        "position": ["MF"],
-        "birth_year": 1980,
-    },
-    "Boris-\u017divkovi\u0107": {
-        "id": "f6338bc4",
-        "nationality": ["hr"],
-        "position": ["DF"],
-        "birth_year": 1975,
-    },
-    "Pascal-Zuberb\u00fchler": {
-        "id": "8f8a3b65",
-        "nationality": ["ch"],
-        "position": ["GK"],
-        "birth_year": 1971,
-    },
-    "Kristijan-\u0110or\u0111evi\u0107": {
-        "id": "5524079a",
-        "nationality": ["rs"],
-        "position": ["MF"],
-        "birth_year": 1976,
-    },
-    "Roberto-Acu\u00f1a": {
-        "id": "8b70bf2f",
-        "nationality": ["py"],
-        "position": ["MF"],
-        "birth_year": 1972,
-    },
-    "Agostinho": {
-        "id": "b7190f2b",
-        "nationality": ["pt"],
-        "position": ["MF"],
-        "birth_year": 1975,
-    },
-    "Xavier-Aguado": {
-        "id": "41c22973",
-        "nationality": ["es"],
-        "position": ["DF"],
-        "birth_year": 1968,
-    },
-    "Pablo-Aimar": {
-        "id": "ab6c00d3",
-        "nationality": ["ar"],
-        "position": ["MF"],
-        "birth_year": 1979,
-    },
-    "David-Albelda": {
-        "id": "def14f68",
-        "nationality": ["es"],
-        "position": ["DF", "MF"],
-        "birth_year": 1977,
-    },
-    "Alberto": {
-        "id": "9335367b",
-        "nationality": ["es"],
-        "position": ["GK"],
-        "birth_year": 1969,
-    },
-    "Luiz-Alberto": {
-        "id": "5b803ce4",
-        "nationality": ["br"],
-        "position": ["DF"],
-        "birth_year": 1977,
-    },
-    "Alc\u00e1zar": {
-        "id": "55becc43",
-        "nationality": ["es"],
-        "position": ["DF"],
-        "birth_year": 1967,
-    },
-    "Alberto-Alejandro": {"id": "6db490c7", "position": ["FW"], "birth_year": 1979},
-    "\u00c1lex": {
-        "id": "4512fa60",
-        "nationality": ["es"],
-        "position": ["MF"],
-        "birth_year": 1974,
-    },
-    "Alfredo": {
-        "id": "f150686a",
-        "nationality": ["es"],
-        "position": ["MF"],
-        "birth_year": 1972,
-    },
-    "Bittor-Alkiza": {
-        "id": "bfebd236",
-        "nationality": ["es"],
-        "position": ["MF"],
-        "birth_year": 1970,
-    },
-    "Rafael-Alkorta": {
-        "id": "aadbfaf0",
-        "nationality": ["es"],
-        "position": ["DF"],
-        "birth_year": 1968,
-    },
-    "Diego-Alonso": {
-        "id": "21a7914b",
-        "nationality": ["uy"],
-        "position": ["FW"],
-        "birth_year": 1975,
-    },
-    "Edu-Alonso": {
-        "id": "911e7b8d",
-        "nationality": ["es"],
-        "position": ["MF"],
-        "birth_year": 1974,
-    },
-    "Iv\u00e1n-Alonso": {
-        "id": "80084c87",
-        "nationality": ["uy"],
-        "position": ["FW"],
-        "birth_year": 1979,
-    },
-    "Mikel-Alonso": {
-        "id": "eab32eb2",
-        "nationality": ["es"],
-        "position": ["MF"],
-        "birth_year": 1980,
-    },
-    "Txema-Alonso": {
-        "id": "f2375c9e",
-        "nationality": ["es"],
-        "position": ["DF", "MF"],
-        "birth_year": 1971,
-    },
-    "Xabi-Alonso": {
-        "id": "dc001a06",
-        "nationality": ["es"],
-        "position": ["MF"],
-        "birth_year": 1981,
-    },
-    "Armando-\u00c1lvarez": {
-        "id": "a28ae3ef",
-        "nationality": ["es"],
-        "position": ["DF"],
-        "birth_year": 1970,
-    },
-    "Julio-\u00c1lvarez": {
-        "id": "17b1a0ee",
-        "nationality": ["ve"],
-        "position": ["MF"],
-        "birth_year": 1981,
-    },
-    "Quique-\u00c1lvarez": {
-        "id": "7ddc4550",
-        "nationality": ["es"],
-        "position": ["DF"],
-        "birth_year": 1975,
-    },
-    "\u00c1lvaro": {
-        "id": "3bb76c65",
-        "nationality": ["br"],
-        "position": ["DF"],
-        "birth_year": 1977,
-    },
-    "Amador": {
-        "id": "60441954",
-        "nationality": ["es"],
-        "position": ["GK"],
-        "birth_year": 1968,
-    },
-    "Jos\u00e9-Amavisca": {
-        "id": "2cf17c90",
-        "nationality": ["es"],
-        "position": ["FW", "MF"],
-        "birth_year": 1971,
-    },
-    "Daniel-Amieva": {
-        "id": "d38960bd",
-        "nationality": ["es"],
-        "position": ["MF"],
-        "birth_year": 1976,
-    },
-    "Guillermo-Amor": {
-        "id": "12508a43",
-        "nationality": ["es"],
-        "position": ["MF"],
-        "birth_year": 1967,
-    },
-    "Miguel-\u00c1ngel-Angulo": {
-        "id": "434f4055",
-        "nationality": ["es"],
-        "position": ["FW", "MF"],
-        "birth_year": 1977,
-    },
-    "Miguel-\u00c1ngel-Ben\u00edtez": {
-        "id": "e292572b",
-        "nationality": ["py"],
-        "position": ["FW"],
-        "birth_year": 1970,
-    },
-    "\u00c1ngel-Luis": {
-        "id": "db3ca8d1",
-        "nationality": ["es"],
-        "position": ["FW"],
-        "birth_year": 1973,
-    },
-    "Miguel-\u00c1ngel-Nadal": {
-        "id": "36d58178",
-        "nationality": ["es"],
-        "position": ["DF", "MF"],
-        "birth_year": 1966,
-    },
-    "Miguel-\u00c1ngel-Soria": {
-        "id": "22ab6697",
-        "nationality": ["es"],
-        "position": ["DF"],
-        "birth_year": 1974,
-    },
-    "Jocelyn-Angloma": {
-        "id": "88ab9338",
-        "nationality": ["fr"],
-        "position": ["DF", "MF"],
-        "birth_year": 1965,
-    },
-    "Iv\u00e1n-Ania": {
-        "id": "12d37503",
-        "nationality": ["es"],
-        "position": ["MF"],
-        "birth_year": 1977,
-    },
-    "Mikel-Ant\u00eda": {
-        "id": "f9008eea",
-        "nationality": ["es"],
-        "position": ["DF"],
-        "birth_year": 1973,
-    },
-    "Jos\u00e9-Antonio-Culebras": {
-        "id": "c8b270a2",
-        "nationality": ["es"],
-        "position": ["DF"],
-        "birth_year": 1979,
-    },
-    "Jos\u00e9-Antonio-Pikabea": {
-        "id": "4d5aa759",
-        "nationality": ["es"],
-        "position": ["DF"],
-        "birth_year": 1970,
-    },
-    "Santiago-Arag\u00f3n": {
-        "id": "eca1bef0",
-        "nationality": ["es"],
-        "position": ["MF"],
-        "birth_year": 1968,
-    },
-    "Mikel-Aranburu": {
-        "id": "9452d85a",
-        "nationality": ["es"],
-        "position": ["MF"],
-        "birth_year": 1979,
-    },
-    "Agust\u00edn-Aranz\u00e1bal": {
-        "id": "ee65d657",
-        "nationality": ["es"],
-        "position": ["DF"],
-        "birth_year": 1973,
-    },
-    "Daniel-Aranzubia": {
-        "id": "0e9ce3e0",
-        "nationality": ["es"],
-        "position": ["GK"],
-        "birth_year": 1979,
-    },
-    "Alfredo-Argens\u00f3": {
-        "id": "90b67cf9",
-        "nationality": ["es"],
-        "position": ["GK"],
-        "birth_year": 1974,
-    },
-    "Mariano-Armentano": {
-        "id": "5819b50b",
-        "nationality": ["ar"],
-        "position": ["FW"],
-        "birth_year": 1974,
-    },
-    "Francesc-Arnau": {
-        "id": "23ab8dc9",
-        "nationality": ["es"],
-        "position": ["GK"],
-        "birth_year": 1975,
-    },
-    "\u00d3scar-Arp\u00f3n": {
-        "id": "705d238d",
-        "nationality": ["es"],
-        "position": ["MF"],
-        "birth_year": 1975,
-    },
-    "Rodolfo-Arruabarrena": {
-        "id": "fbd07266",
-        "nationality": ["ar"],
-        "position": ["DF"],
-        "birth_year": 1975,
-    },
-    "Arteaga": {
-        "id": "65b6e13c",
-        "nationality": ["es"],
-        "position": ["MF"],
-        "birth_year": 1969,
-    },
-    "Claudio-Arzeno": {
-        "id": "22ba1000",
-        "nationality": ["ar"],
-        "position": ["DF"],
-        "birth_year": 1970,
-    },
-    "David-Asensio-L\u00f3pez": {"id": "aa28d57e", "birth_year": 1980},
-    "Mattias-Asper": {
-        "id": "cfb59bed",
-        "nationality": ["se"],
-        "position": ["GK"],
-        "birth_year": 1974,
-    },
-    "Mart\u00edn-Astudillo": {
-        "id": "fda30cfc",
-        "nationality": ["ar"],
-        "position": ["MF"],
-        "birth_year": 1977,
-    },
-    "F\u00e1bio-Aur\u00e9lio": {
-        "id": "68f0ce09",
-        "nationality": ["br"],
-        "position": ["DF", "MF"],
-        "birth_year": 1979,
-    },
-    "Roberto-Ayala": {
-        "id": "561d182e",
-        "nationality": ["ar"],
-        "position": ["DF"],
-        "birth_year": 1973,
-    },
-    "Jorge-Azkoitia": {
-        "id": "4ac3dade",
-        "nationality": ["es"],
-        "position": ["MF"],
-        "birth_year": 1974,
-    },
-    "Baiano": {
-        "id": "26a7618d",
-        "nationality": ["br"],
-        "position": ["DF", "MF"],
-        "birth_year": 1978,
-    },
-    "Sergio-Ballesteros": {
-        "id": "29863c56",
-        "nationality": ["es"],
-        "position": ["DF"],
-        "birth_year": 1975,
-    },
-    "Ricardo-Bango": {
-        "id": "b249a858",
-        "nationality": ["es"],
-        "position": ["MF"],
-        "birth_year": 1968,
-    },
-    "H\u00e9lder-Baptista": {
-        "id": "d4a788b4",
-        "nationality": ["pt"],
-        "position": ["MF"],
-        "birth_year": 1972,
-    },
-    "Rub\u00e9n-Baraja": {
-        "id": "31a8e5c3",
-        "nationality": ["es"],
-        "position": ["MF"],
-        "birth_year": 1975,
-    },
-    "Constantin-Barbu": {
-        "id": "f44e49bf",
-        "nationality": ["ro"],
-        "position": ["MF"],
-        "birth_year": 1971,
-    },
-    "Sergi-Barju\u00e1n": {
-        "id": "906a398c",
-        "nationality": ["es"],
-        "position": ["DF"],
-        "birth_year": 1971,
-    },
-    "Gustavo-Barros-Schelotto": {
-        "id": "112fb7ce",
-        "nationality": ["ar"],
-        "position": ["MF"],
-        "birth_year": 1973,
-    },
-    "Gustavo-Bartelt": {
-        "id": "3fe8b8de",
-        "nationality": ["ar"],
-        "position": ["FW"],
-        "birth_year": 1974,
-    },
-    "Basti": {
-        "id": "ff5c374b",
-        "nationality": ["es"],
-        "position": ["FW"],
-        "birth_year": 1974,
-    },
-    "Ibon-Bego\u00f1a": {
-        "id": "301f6f65",
-        "nationality": ["es"],
-        "position": ["DF"],
-        "birth_year": 1973,
-    },
-    "Eduardo-Berizzo": {
-        "id": "d28dbfe9",
-        "nationality": ["ar"],
-        "position": ["DF"],
-        "birth_year": 1969,
-    },
-    "I\u00f1aki-Berruet": {
-        "id": "9fd5c7b8",
-        "nationality": ["es"],
-        "position": ["DF"],
-        "birth_year": 1973,
-    },
-    "Vladimir-Beschastnykh": {
-        "id": "e4f60b89",
-        "nationality": ["ru"],
-        "position": ["FW", "MF"],
-        "birth_year": 1974,
-    },
-    "Leonardo-Biagini": {
-        "id": "44793331",
-        "nationality": ["ar"],
-        "position": ["FW"],
-        "birth_year": 1977,
-    },
-    "Albano-Bizzarri": {
-        "id": "32b9b5fa",
-        "nationality": ["ar"],
-        "position": ["GK"],
-        "birth_year": 1977,
-    },
-    "Joachim-Bj\u00f6rklund": {
-        "id": "bedacbef",
-        "nationality": ["se"],
-        "position": ["DF"],
-        "birth_year": 1971,
-    },
-    "Cuauht\u00e9moc-Blanco": {
-        "id": "5e9dba5d",
-        "nationality": ["mx"],
-        "position": ["FW"],
-        "birth_year": 1973,
-    },
-    "Frank-de-Boer": {
-        "id": "777eaa16",
-        "nationality": ["nl"],
-        "position": ["DF"],
-        "birth_year": 1970,
-    },
-    "Elvir-Boli\u0107": {
-        "id": "779df1aa",
-        "nationality": ["ba"],
-        "position": ["FW"],
-        "birth_year": 1971,
-    },
-    "Bolo": {
-        "id": "ca7589a9",
-        "nationality": ["es"],
-        "position": ["FW"],
-        "birth_year": 1974,
-    },
-    "Boris": {
-        "id": "6f531b7d",
-        "nationality": ["es"],
-        "position": ["DF"],
-        "birth_year": 1980,
-    },
-    "Dani-Bouzas": {
-        "id": "5d50d194",
-        "nationality": ["es"],
-        "position": ["FW", "MF"],
-        "birth_year": 1974,
-    },
-    "Pablo-Brand\u00e1n": {
-        "id": "b27a9e0e",
-        "nationality": ["ar"],
-        "position": ["DF", "MF"],
-        "birth_year": 1983,
-    },
-    "Bravo": {
-        "id": "2fcd97a4",
-        "nationality": ["es"],
-        "position": ["DF"],
-        "birth_year": 1974,
-    },
-    "Germ\u00e1n-Burgos": {
-        "id": "53028dd9",
-        "nationality": ["ar"],
-        "position": ["GK"],
-        "birth_year": 1969,
-    },
-    "Kike-Burgos": {
-        "id": "2f1cbecf",
-        "nationality": ["es"],
-        "position": ["GK"],
-        "birth_year": 1971,
-    },
-    "Fernando-C\u00e1ceres": {
-        "id": "fab1ce6d",
-        "nationality": ["ar"],
-        "position": ["DF"],
-        "birth_year": 1969,
-    },
-    "Diego-Cagna": {
-        "id": "3e31738e",
-        "nationality": ["ar"],
-        "position": ["MF"],
-        "birth_year": 1970,
-    },
-    "Javier-Calleja": {
-        "id": "3c99e7de",
-        "nationality": ["es"],
-        "position": ["MF"],
-        "birth_year": 1978,
-    },
-    "Iv\u00e1n-Campo": {
-        "id": "b655e58d",
-        "nationality": ["es"],
-        "position": ["DF", "MF"],
-        "birth_year": 1974,
-    },
-    "Manuel-Canabal": {
-        "id": "3baf8fb9",
-        "nationality": ["es"],
-        "position": ["FW"],
-        "birth_year": 1974,
-    },
-    "Santiago-Ca\u00f1izares": {
-        "id": "e104f31c",
-        "nationality": ["es"],
-        "position": ["GK"],
-        "birth_year": 1969,
-    },
-    "Joan-Capdevila": {
-        "id": "69697a6d",
-        "nationality": ["es"],
-        "position": ["DF"],
-        "birth_year": 1978,
-    },
-    "Amedeo-Carboni": {
-        "id": "5c66ca76",
-        "nationality": ["it"],
-        "position": ["DF"],
-        "birth_year": 1965,
-    },
-    "John-Carew": {
-        "id": "91ef929d",
-        "nationality": ["no"],
-        "position": ["FW"],
-        "birth_year": 1979,
-    },
-    "Roberto-Carlos": {
-        "id": "6a3aaf62",
-        "nationality": ["br"],
-        "position": ["DF"],
-        "birth_year": 1973,
-    },
-    "Juan-Carlos-Valer\u00f3n": {
-        "id": "71e8d6b0",
-        "nationality": ["es"],
-        "position": ["MF"],
-        "birth_year": 1975,
-    },
-    "Llu\u00eds-Carreras": {
-        "id": "4e1b59cf",
-        "nationality": ["es"],
-        "position": ["DF"],
-        "birth_year": 1972,
-    },
-    "Iker-Casillas": {
-        "id": "1ddbb0da",
-        "nationality": ["es"],
-        "position": ["GK"],
-        "birth_year": 1981,
-    },
-    "Rub\u00e9n-Castro": {
-        "id": "d109f62b",
-        "nationality": ["es"],
-        "position": ["FW", "MF"],
-        "birth_year": 1981,
-    },
-    "Catanha": {
-        "id": "69349680",
-        "nationality": ["es"],
-        "position": ["FW"],
-        "birth_year": 1972,
-    },
-    "Pablo-Cavallero": {
-        "id": "754d4db5",
-        "nationality": ["ar"],
-        "position": ["GK"],
-        "birth_year": 1974,
-    },
-    "Albert-Celades": {
-        "id": "61796b1f",
-        "nationality": ["es"],
-        "position": ["MF"],
-        "birth_year": 1975,
-    },
-    "Luis-Cembranos": {
-        "id": "bf313a5c",
-        "nationality": ["es"],
-        "position": ["MF"],
-        "birth_year": 1972,
-    },
-    "Chema": {
-        "id": "6c53d111",
-        "nationality": ["es"],
-        "position": ["MF"],
-        "birth_year": 1976,
-    },
-    "\u017deljko-Cicovi\u0107": {
-        "id": "62803fde",
-        "nationality": ["rs"],
-        "position": ["GK"],
-        "birth_year": 1970,
-    },
-    "Dragan-\u0106iri\u0107": {
-        "id": "680a7e96",
-        "nationality": ["rs"],
-        "position": ["MF"],
-        "birth_year": 1974,
-    },
-    "Rafael-Clavero": {
-        "id": "1590d66a",
-        "nationality": ["es"],
-        "position": ["DF"],
-        "birth_year": 1977,
-    },
-    "David-Clotet": {
-        "id": "cd3a8fa3",
-        "nationality": ["es"],
-        "position": ["DF"],
-        "birth_year": 1972,
-    },
-    "Phillip-Cocu": {
-        "id": "75522231",
-        "nationality": ["nl"],
-        "position": ["DF", "FW"],
-        "birth_year": 1970,
-    },
-    "Pablo-Coira": {
-        "id": "7099e844",
-        "nationality": ["es"],
-        "position": ["DF"],
-        "birth_year": 1979,
-    },
-    "St\u00e9phane-Collet": {
-        "id": "cb0fd29f",
-        "nationality": ["mg"],
-        "position": ["MF"],
-        "birth_year": 1972,
-    },
-    "Gonzalo-Colsa": {
-        "id": "6fa12b44",
-        "nationality": ["es"],
-        "position": ["MF"],
-        "birth_year": 1979,
-    },
-    "Fl\u00e1vio-Concei\u00e7\u00e3o": {
-        "id": "8783b7ca",
-        "nationality": ["br"],
-        "position": ["MF"],
-        "birth_year": 1974,
-    },
-    "Cosmin-Contra": {
-        "id": "9bdc0e80",
-        "nationality": ["ro"],
-        "position": ["DF", "MF"],
-        "birth_year": 1975,
-    },
-    "Pedro-Contreras": {
-        "id": "7d21afdb",
-        "nationality": ["es"],
-        "position": ["GK"],
-        "birth_year": 1972,
-    },
-    "Jorge-Cordero-S\u00e1nchez": {
-        "id": "878aa954",
-        "nationality": ["es"],
-        "position": ["MF"],
-        "birth_year": 1977,
-    },
-    "Sergio-Corino": {
-        "id": "bc624052",
-        "nationality": ["es"],
-        "position": ["DF"],
-        "birth_year": 1974,
-    },
-    "Corona": {
-        "id": "4798bc33",
-        "nationality": ["es"],
-        "position": ["MF"],
-        "birth_year": 1981,
-    },
-    "Pablo-Cou\u00f1ago": {
-        "id": "1633746c",
-        "nationality": ["es"],
-        "position": ["FW"],
-        "birth_year": 1979,
-    },
-    "Gheorghe-Craioveanu": {
-        "id": "f4fdadf6",
-        "nationality": ["ro"],
-        "position": ["FW"],
-        "birth_year": 1968,
-    },
-    "C\u00e9sar-Cruchaga": {
-        "id": "a8ba9d44",
-        "nationality": ["es"],
-        "position": ["DF"],
-        "birth_year": 1974,
-    },
-    "Jordi-Cruyff": {
-        "id": "7ebf561b",
-        "nationality": ["nl"],
-        "position": ["FW", "MF"],
-        "birth_year": 1974,
-    },
-    "Luis-Cuartero": {
-        "id": "8180abbf",
-        "nationality": ["es"],
-        "position": ["DF"],
-        "birth_year": 1975,
-    },
-    "David-Cu\u00e9llar": {
-        "id": "d386f165",
-        "nationality": ["es"],
-        "position": ["MF"],
-        "birth_year": 1979,
-    },
-    "Fr\u00e9d\u00e9ric-Danjou": {
-        "id": "de57e4ef",
-        "nationality": ["fr"],
-        "position": ["DF"],
-        "birth_year": 1974,
-    },
-    "Asier-del-Horno": {
-        "id": "eb525f4a",
-        "nationality": ["es"],
-        "position": ["DF"],
-        "birth_year": 1981,
-    },
-    "Jorge-Delgado": {
-        "id": "5737c9e9",
-        "nationality": ["uy"],
-        "position": ["FW"],
-        "birth_year": 1975,
-    },
-    "Julio-Dely-Vald\u00e9s": {
-        "id": "16753970",
-        "nationality": ["pa"],
-        "position": ["FW"],
-        "birth_year": 1967,
-    },
-    "Giorgi-Demetradze": {
-        "id": "b6357ac2",
-        "nationality": ["ge"],
-        "position": ["FW"],
-        "birth_year": 1976,
-    },
-    "Oktay-Derelio\u011flu": {
-        "id": "fa8cf4c6",
-        "nationality": ["tr"],
-        "position": ["FW"],
-        "birth_year": 1975,
-    },
-    "Didier-Deschamps": {
-        "id": "1d9b994f",
-        "nationality": ["fr"],
-        "position": ["MF"],
-        "birth_year": 1968,
-    },
-    "Hermes-Desio": {
-        "id": "1c0c23ed",
-        "nationality": ["ar"],
-        "position": ["MF"],
-        "birth_year": 1970,
-    },
-    "Iv\u00e1n-D\u00edaz-Ruiz": {
-        "id": "e7870c95",
-        "nationality": ["es"],
-        "position": ["MF"],
-        "birth_year": 1978,
-    },
-    "Pablo-D\u00edaz-Stalla": {
-        "id": "a42419f7",
-        "nationality": ["es"],
-        "position": ["DF"],
-        "birth_year": 1971,
-    },
-    "Djalminha": {
-        "id": "1dce6791",
-        "nationality": ["br"],
-        "position": ["FW", "MF"],
-        "birth_year": 1970,
-    },
-    "Carlos-Dom\u00ednguez": {
-        "id": "c008c1c3",
-        "nationality": ["es"],
-        "position": ["FW"],
-        "birth_year": 1976,
-    },
-    "Donato": {
-        "id": "78f034ac",
-        "nationality": ["es"],
-        "position": ["DF", "MF"],
-        "birth_year": 1962,
-    },
-    "Doriva": {
-        "id": "6b8ab05e",
-        "nationality": ["br"],
-        "position": ["MF"],
-        "birth_year": 1972,
-    },
-    "Aldo-Duscher": {
-        "id": "44944ca7",
-        "nationality": ["ar"],
-        "position": ["MF"],
-        "birth_year": 1979,
-    },
-    "Richard-Dutruel": {
-        "id": "b51c1e29",
-        "nationality": ["fr"],
-        "position": ["GK"],
-        "birth_year": 1972,
-    },
-    "Edu": {
-        "id": "71a2b3ed",
-        "nationality": ["br"],
-        "position": ["FW", "MF"],
-        "birth_year": 1976,
-    },
-    "Dan-Eggen": {
-        "id": "176fab3d",
-        "nationality": ["no"],
-        "position": ["DF"],
-        "birth_year": 1970,
-    },
-    "Vicente-Engonga": {
-        "id": "1c3dec1d",
-        "nationality": ["es"],
-        "position": ["MF"],
-        "birth_year": 1965,
-    },
-    "Luis-Enrique": {
-        "id": "b9407435",
-        "nationality": ["es"],
-        "position": ["FW", "MF"],
-        "birth_year": 1970,
-    },
-    "Arif-Erdem": {
-        "id": "3aca91f5",
-        "nationality": ["tr"],
-        "position": ["FW"],
-        "birth_year": 1972,
-    },
-    "Gerard-Escoda": {
-        "id": "ff9383b6",
-        "nationality": ["es"],
-        "position": ["FW"],
-        "birth_year": 1972,
-    },
-    "Juan-Esn\u00e1ider": {
-        "id": "a9bdc347",
-        "nationality": ["ar"],
-        "position": ["FW"],
-        "birth_year": 1973,
-    },
-    "Marcelo-Espina": {
-        "id": "f746d707",
-        "nationality": ["ar"],
-        "position": ["MF"],
-        "birth_year": 1967,
-    },
-    "Esteban": {
-        "id": "e4fc2638",
-        "nationality": ["es"],
-        "position": ["GK"],
-        "birth_year": 1975,
-    },
-    "Maximiliano-Est\u00e9vez": {
-        "id": "0fbb9aed",
-        "nationality": ["ar"],
-        "position": ["FW"],
-        "birth_year": 1977,
-    },
-    "Samuel-Eto'o": {
-        "id": "06420c93",
-        "nationality": ["cm"],
-        "position": ["FW"],
-        "birth_year": 1981,
-    },
-    "Joseba-Etxeberria": {
-        "id": "756aa908",
-        "nationality": ["es"],
-        "position": ["FW", "MF"],
-        "birth_year": 1977,
-    },
-    "Santiago-Ezquerro": {
-        "id": "c836203d",
-        "nationality": ["es"],
-        "position": ["FW"],
-        "birth_year": 1976,
-    },
-    "Jos\u00e9-F\u00e9lix-Guerrero": {
-        "id": "19f7728e",
-        "nationality": ["es"],
-        "position": ["MF"],
-        "birth_year": 1975,
-    },
-    "Abelardo-Fern\u00e1ndez": {
-        "id": "fd6cdf88",
-        "nationality": ["es"],
-        "position": ["DF"],
-        "birth_year": 1970,
-    },
-    "Alex-Fern\u00e1ndez": {
-        "id": "79a22469",
-        "nationality": ["es"],
-        "position": ["MF"],
-        "birth_year": 1974,
-    },
-    "Fernando": {
-        "id": "2a81fa5d",
-        "nationality": ["br"],
-        "position": ["DF"],
-        "birth_year": 1998,
-    },
-    "Patxi-Ferreira": {
-        "id": "85a78fa5",
-        "nationality": ["es"],
-        "position": ["DF"],
-        "birth_year": 1967,
-    },
-    "Jordi-Ferr\u00f3n": {
-        "id": "cd37881d",
-        "nationality": ["es"],
-        "position": ["DF"],
-        "birth_year": 1978,
-    },
-    "Lu\u00eds-Figo": {
-        "id": "f20f347f",
-        "nationality": ["pt"],
-        "position": ["FW", "MF"],
-        "birth_year": 1972,
-    },
-    "Fran": {
-        "id": "5a8170c0",
-        "nationality": ["es"],
-        "position": ["MF"],
-        "birth_year": 1969,
-    },
-    "Sergio-Francisco": {
-        "id": "bb97c683",
-        "nationality": ["es"],
-        "position": ["FW"],
-        "birth_year": 1979,
-    },
-    "Leo-Franco": {
-        "id": "c39a5c6b",
-        "nationality": ["ar"],
-        "position": ["GK"],
-        "birth_year": 1977,
-    },
-    "Miguel-Fuentes": {
-        "id": "21398b16",
-        "nationality": ["es"],
-        "position": ["DF"],
-        "birth_year": 1964,
-    },
-    "Igor-Gabilondo": {
-        "id": "4ce0dff0",
-        "nationality": ["es"],
-        "position": ["MF"],
-        "birth_year": 1979,
-    },
-    "Walter-Gait\u00e1n": {
-        "id": "0061247c",
-        "nationality": ["ar"],
-        "position": ["FW", "MF"],
-        "birth_year": 1977,
-    },
-    "Constantin-G\u00e2lc\u0103": {
-        "id": "624ddea0",
-        "nationality": ["ro"],
-        "position": ["MF"],
-        "birth_year": 1972,
-    },
-    "Jes\u00fas-Galv\u00e1n": {
-        "id": "5f605a71",
-        "nationality": ["es"],
-        "position": ["DF"],
-        "birth_year": 1974,
-    },
-    "Ra\u00fal-Ga\u00f1\u00e1n": {
-        "id": "46404399",
-        "nationality": ["es"],
-        "position": ["DF"],
-        "birth_year": 1974,
-    },
-    "Leonel-Gancedo": {
-        "id": "cc525f3d",
-        "nationality": ["ar"],
-        "position": ["MF"],
-        "birth_year": 1971,
-    },
-    "Jos\u00e9-Garc\u00eda-Calvo": {
-        "id": "c79150ab",
-        "nationality": ["es"],
-        "position": ["DF"],
-        "birth_year": 1975,
-    },
-    "Carlos-Garc\u00eda": {
-        "id": "4227b136",
-        "nationality": ["es"],
-        "position": ["DF", "MF"],
-        "birth_year": 1970,
-    },
-    "Dani-Garc\u00eda": {
-        "id": "68411ed5",
-        "nationality": ["es"],
-        "position": ["FW"],
-        "birth_year": 1974,
-    },
-    "David-Garc\u00eda": {
-        "id": "f47bf593",
-        "nationality": ["es"],
-        "position": ["DF"],
-        "birth_year": 1981,
-    },
-    "Gabri-Garc\u00eda": {
-        "id": "ed94a7aa",
-        "nationality": ["es"],
-        "position": ["DF", "MF"],
-        "birth_year": 1979,
-    },
-    "Mauro-Garc\u00eda": {
-        "id": "9171c383",
-        "nationality": ["es"],
-        "position": ["DF"],
-        "birth_year": 1971,
-    },
-    "Ra\u00fal-Garc\u00eda": {
-        "id": "3c439210",
-        "nationality": ["es"],
-        "position": ["DF"],
-        "birth_year": 1980,
-    },
-    "Ander-Garitano": {
-        "id": "8936adb7",
-        "nationality": ["es"],
-        "position": ["MF"],
-        "birth_year": 1969,
-    },
-    "Miki-Garro": {
-        "id": "d95befde",
-        "nationality": ["es"],
-        "position": ["GK"],
-        "birth_year": 1975,
-    },
-    "Gaspar": {
-        "id": "75e5329b",
-        "nationality": ["es"],
-        "position": ["DF"],
-        "birth_year": 1979,
-    },
-    "Delf\u00ed-Geli": {
-        "id": "6b058d9b",
-        "nationality": ["es"],
-        "position": ["DF"],
-        "birth_year": 1969,
-    },
-    "Geni": {
-        "id": "2a46bc48",
-        "nationality": ["es"],
-        "position": ["FW"],
-        "birth_year": 1980,
-    },
-    "Finidi-George": {
-        "id": "87fcf713",
-        "nationality": ["ng"],
-        "position": ["FW", "MF"],
-        "birth_year": 1971,
-    },
-    "Gerardo": {
-        "id": "07c345de",
-        "nationality": ["es"],
-        "position": ["DF", "MF"],
-        "birth_year": 1974,
-    },
-    "Geremi": {
-        "id": "3571f3d1",
-        "nationality": ["cm"],
-        "position": ["DF", "MF"],
-        "birth_year": 1978,
-    },
-    "Everton-Giovanella": {
-        "id": "e6a5d427",
-        "nationality": ["br"],
-        "position": ["MF"],
-        "birth_year": 1970,
-    },
-    "Gl\u00e1ucio": {
-        "id": "2f4b411c",
-        "nationality": ["br"],
-        "position": ["MF"],
-        "birth_year": 1975,
-    },
-    "Pablo-G\u00f3mez": {
-        "id": "0a9e2033",
-        "nationality": ["es"],
-        "position": ["MF"],
-        "birth_year": 1970,
-    },
-    "Javi-Gonz\u00e1lez": {
-        "id": "b1e9277c",
-        "nationality": ["es"],
-        "position": ["MF"],
-        "birth_year": 1974,
-    },
-    "Juan-Gonz\u00e1lez": {
-        "id": "22c57b88",
-        "nationality": ["uy"],
-        "position": ["FW"],
-        "birth_year": 1972,
-    },
-    "Kily-Gonz\u00e1lez": {
-        "id": "69966620",
-        "nationality": ["ar"],
-        "position": ["FW", "MF"],
-        "birth_year": 1974,
-    },
-    "Nacho-Gonz\u00e1lez": {
-        "id": "0c99d0e9",
-        "nationality": ["ar"],
-        "position": ["GK"],
-        "birth_year": 1971,
-    },
-    "Javi-Gracia": {
-        "id": "f46017c3",
-        "nationality": ["es"],
-        "position": ["MF"],
-        "birth_year": 1970,
-    },
-    "Pep-Guardiola": {
-        "id": "b21fe2db",
-        "nationality": ["es"],
-        "position": ["MF"],
-        "birth_year": 1971,
-    },
-    "Antonio-Guayre": {
-        "id": "82cf603f",
-        "nationality": ["es"],
-        "position": ["FW", "MF"],
-        "birth_year": 1980,
-    },
-    "Julen-Guerrero": {
-        "id": "8cb2c693",
-        "nationality": ["es"],
-        "position": ["FW", "MF"],
-        "birth_year": 1974,
-    },
-    "Dani-G\u00fciza": {
-        "id": "d863ea53",
-        "nationality": ["es"],
-        "position": ["FW"],
-        "birth_year": 1980,
-    },
-    "Felipe-Gur\u00e9ndez": {
-        "id": "4f4973c3",
-        "nationality": ["es"],
-        "position": ["MF"],
-        "birth_year": 1975,
-    },
-    "Sergei-Gurenko": {
-        "id": "aae2139c",
-        "nationality": ["by"],
-        "position": ["DF", "MF"],
-        "birth_year": 1972,
-    },
-    "Zuhaitz-Gurrutxaga": {
-        "id": "b366fa6e",
-        "nationality": ["es"],
-        "position": ["DF"],
-        "birth_year": 1980,
-    },
-    "Guti": {
-        "id": "dd0a0fa1",
-        "nationality": ["es"],
-        "position": ["FW", "MF"],
-        "birth_year": 1976,
-    },
-    "John-Harold-Lozano": {
-        "id": "94ccf890",
-        "nationality": ["co"],
-        "position": ["MF"],
-        "birth_year": 1972,
-    },
-    "Gabriel-Heinze": {
-        "id": "54629cf9",
-        "nationality": ["ar"],
-        "position": ["DF"],
-        "birth_year": 1978,
-    },
-    "H\u00e9lder": {
-        "id": "18231c7e",
-        "nationality": ["pt"],
-        "position": ["DF"],
-        "birth_year": 1971,
-    },
-    "Iv\u00e1n-Helguera": {
-        "id": "44151558",
-        "nationality": ["es"],
-        "position": ["DF", "MF"],
-        "birth_year": 1975,
-    },
-    "Mart\u00edn-Herrera": {
-        "id": "d7b793fb",
-        "nationality": ["ar"],
-        "position": ["GK"],
-        "birth_year": 1970,
-    },
-    "Tom\u00e1s-Herv\u00e1s": {
-        "id": "9f1f6292",
-        "nationality": ["es"],
-        "position": ["MF"],
-        "birth_year": 1970,
-    },
-    "Fernando-Hierro": {
-        "id": "2f926dd0",
-        "nationality": ["es"],
-        "position": ["DF", "MF"],
-        "birth_year": 1968,
-    },
-    "Pedro-Hontecillas-G\u00f3mez": {"id": "333326a1", "birth_year": 1982},
-    "I\u00f1aki-Hurtado": {
-        "id": "354a89df",
-        "nationality": ["es"],
-        "position": ["FW", "MF"],
-        "birth_year": 1972,
-    },
-    "Ariel-Ibagaza": {
-        "id": "bd513ca4",
-        "nationality": ["ar"],
-        "position": ["MF"],
-        "birth_year": 1976,
-    },
-    "I\u00f1igo-Idiakez": {
-        "id": "caf38c72",
-        "nationality": ["es"],
-        "position": ["FW", "MF"],
-        "birth_year": 1973,
-    },
-    "Iv\u00e1n-Iglesias": {
-        "id": "5ba3417f",
-        "nationality": ["es"],
-        "position": ["MF"],
-        "birth_year": 1971,
-    },
-    "Jos\u00e9-Ignacio": {
-        "id": "4477d395",
-        "nationality": ["es"],
-        "position": ["MF"],
-        "birth_year": 1973,
-    },
-    "Adrian-Ilie": {
-        "id": "5ec3ec8d",
-        "nationality": ["ro"],
-        "position": ["FW", "MF"],
-        "birth_year": 1974,
-    },
-    "Andoni-Imaz": {
-        "id": "f3fc124b",
-        "nationality": ["es"],
-        "position": ["MF"],
-        "birth_year": 1971,
-    },
-    "Irurzun": {
-        "id": "08243062",
-        "nationality": ["es"],
-        "position": ["FW"],
-        "birth_year": 1975,
-    },
-    "Ivo": {
-        "id": "9248c4fb",
-        "nationality": ["es"],
-        "position": ["MF"],
-        "birth_year": 1978,
-    },
-    "Ra\u00fal-Iznata": {
-        "id": "3b706127",
-        "nationality": ["es"],
-        "position": ["DF"],
-        "birth_year": 1977,
-    },
-    "Jaime": {
-        "id": "87a334ab",
-        "nationality": ["es"],
-        "position": ["MF"],
-        "birth_year": 1973,
-    },
-    "Paulo-Jamelli": {
-        "id": "e9cdf4c1",
-        "nationality": ["br"],
-        "position": ["FW"],
-        "birth_year": 1974,
-    },
-    "Edgaras-Jankauskas": {
-        "id": "92786fd3",
-        "nationality": ["lt"],
-        "position": ["FW"],
-        "birth_year": 1975,
-    },
-    "Robert-Jarni": {
-        "id": "fad25a58",
-        "nationality": ["hr"],
-        "position": ["DF", "FW"],
-        "birth_year": 1968,
-    },
-    "Diego-Jaume": {
-        "id": "9663d985",
-        "nationality": ["uy"],
-        "position": ["DF"],
-        "birth_year": 1973,
-    },
-    "Igor-Jauregi": {
-        "id": "1f011af5",
-        "nationality": ["es"],
-        "position": ["DF", "MF"],
-        "birth_year": 1974,
-    },
-    "Jesuli": {
-        "id": "3bfc833a",
-        "nationality": ["es"],
-        "position": ["MF"],
-        "birth_year": 1978,
-    },
-    "C\u00e9sar-Jim\u00e9nez": {
-        "id": "efc6342b",
-        "nationality": ["es"],
-        "position": ["DF"],
-        "birth_year": 1977,
-    },
-    "Eloy-Jim\u00e9nez": {
-        "id": "facaf56c",
-        "nationality": ["es"],
-        "position": ["FW"],
-        "birth_year": 1971,
-    },
-    "Juan-Jos\u00e9-Jayo": {
-        "id": "1ad7d386",
-        "nationality": ["pe"],
-        "position": ["MF"],
-        "birth_year": 1973,
-    },
-    "Josemi": {
-        "id": "e85dd0fc",
-        "nationality": ["es"],
-        "position": ["DF"],
-        "birth_year": 1979,
-    },
-    "Josico": {
-        "id": "1d2fe5a5",
-        "nationality": ["es"],
-        "position": ["FW", "MF"],
-        "birth_year": 1975,
-    },
-    "Juanele": {
-        "id": "d0927870",
-        "nationality": ["es"],
-        "position": ["FW"],
-        "birth_year": 1971,
-    },
-    "Juanfran": {
-        "id": "d8a22e59",
-        "nationality": ["es"],
-        "position": ["DF"],
-        "birth_year": 1976,
-    },
-    "Juanma": {
-        "id": "209581c1",
-        "nationality": ["es"],
-        "position": ["DF"],
-        "birth_year": 1977,
-    },
-    "Juanmi": {
-        "id": "9c6886e6",
-        "nationality": ["es"],
-        "position": ["GK"],
-        "birth_year": 1971,
-    },
-    "Francisco-Jusu\u00e9": {
-        "id": "c74f81a1",
-        "nationality": ["es"],
-        "position": ["DF"],
-        "birth_year": 1979,
-    },
-    "Aitor-Karanka": {
-        "id": "f3bf77fc",
-        "nationality": ["es"],
-        "position": ["DF"],
-        "birth_year": 1973,
-    },
-    "Antonio-Karmona": {
-        "id": "a6bf6531",
-        "nationality": ["es"],
-        "position": ["DF"],
-        "birth_year": 1968,
-    },
-    "Valeri-Karpin": {
-        "id": "c88a6bc0",
-        "nationality": ["ru"],
-        "position": ["MF"],
-        "birth_year": 1969,
-    },
-    "Iv\u00e1n-Kaviedes": {
-        "id": "94c89cb3",
-        "nationality": ["ec"],
-        "position": ["FW"],
-        "birth_year": 1977,
-    },
-    "Idrissa-Keita": {
-        "id": "e30db2ed",
-        "nationality": ["ci"],
-        "position": ["MF"],
-        "birth_year": 1977,
-    },
-    "Kasey-Keller": {
-        "id": "5b5bcd83",
-        "nationality": ["us"],
-        "position": ["GK"],
-        "birth_year": 1969,
-    },
-    "Dmitri-Khokhlov": {
-        "id": "1168dd23",
-        "nationality": ["ru"],
-        "position": ["MF"],
-        "birth_year": 1975,
-    },
-    "Patrick-Kluivert": {
-        "id": "6c3b0583",
-        "nationality": ["nl"],
-        "position": ["FW"],
-        "birth_year": 1976,
-    },
-    "Tayfun-Korkut": {
-        "id": "8fafc61c",
-        "nationality": ["tr"],
-        "position": ["DF", "MF"],
-        "birth_year": 1974,
-    },
-    "Gustavo-de-la-Parra": {
-        "id": "ba328cca",
-        "nationality": ["es"],
-        "position": ["DF"],
-        "birth_year": 1975,
-    },
-    "Iv\u00e1n-de-la-Pe\u00f1a": {
-        "id": "96a4976d",
-        "nationality": ["es"],
-        "position": ["MF"],
-        "birth_year": 1976,
-    },
-    "I\u00f1aki-Lafuente": {
-        "id": "a1757556",
-        "nationality": ["es"],
-        "position": ["GK"],
-        "birth_year": 1976,
-    },
-    "Pablo-Lago": {
-        "id": "e1a94953",
-        "nationality": ["es"],
-        "position": ["MF"],
-        "birth_year": 1974,
-    },
-    "C\u00e9sar-L\u00e1inez": {
-        "id": "c27fe765",
-        "nationality": ["es"],
-        "position": ["GK"],
-        "birth_year": 1977,
-    },
-    "Marco-Lanna": {
-        "id": "9cc18c1b",
-        "nationality": ["it"],
-        "position": ["DF"],
-        "birth_year": 1968,
-    },
-    "Jordi-Lard\u00edn": {
-        "id": "96a7324e",
-        "nationality": ["es"],
-        "position": ["FW", "MF"],
-        "birth_year": 1973,
-    },
-    "Jorge-Larena": {
-        "id": "3de25195",
-        "nationality": ["es"],
-        "position": ["MF"],
-        "birth_year": 1981,
-    },
-    "Domingo-Larrainzar": {
-        "id": "747cdf38",
-        "nationality": ["es"],
-        "position": ["DF"],
-        "birth_year": 1969,
-    },
-    "I\u00f1igo-Larrainzar": {
-        "id": "4c7b1e6c",
-        "nationality": ["es"],
-        "position": ["DF"],
-        "birth_year": 1971,
-    },
-    "Aitor-Larraz\u00e1bal": {
-        "id": "d84bc12f",
-        "nationality": ["es"],
-        "position": ["DF"],
-        "birth_year": 1971,
-    },
-    "Mikel-Lasa": {
-        "id": "63140312",
-        "nationality": ["es"],
-        "position": ["DF"],
-        "birth_year": 1971,
-    },
-    "\u00c1ngel-Lekumberri": {
-        "id": "a7f69653",
-        "nationality": ["es"],
-        "position": ["MF"],
-        "birth_year": 1970,
-    },
-    "Erwin-Lemmens": {
-        "id": "a7a1a4c9",
-        "nationality": ["be"],
-        "position": ["GK"],
-        "birth_year": 1976,
-    },
-    "Carlos-Llorens": {
-        "id": "cc1c44b3",
-        "nationality": ["es"],
-        "position": ["DF"],
-        "birth_year": 1969,
-    },
-    "Joseba-Llorente": {
-        "id": "ddb98947",
-        "nationality": ["es"],
-        "position": ["FW"],
-        "birth_year": 1979,
-    },
-    "Julen-Lopetegui": {
-        "id": "84958d4b",
-        "nationality": ["es"],
-        "position": ["GK"],
-        "birth_year": 1966,
-    },
-    "\u00c1ngel-L\u00f3pez": {
-        "id": "93cdc601",
-        "nationality": ["es"],
-        "position": ["DF", "MF"],
-        "birth_year": 1981,
-    },
-    "Antonio-L\u00f3pez": {
-        "id": "1fdd5ff7",
-        "nationality": ["es"],
-        "position": ["MF"],
-        "birth_year": 1980,
-    },
-    "Gerard-L\u00f3pez": {
-        "id": "403b0279",
-        "nationality": ["es"],
-        "position": ["MF"],
-        "birth_year": 1979,
-    },
-    "Gustavo-L\u00f3pez": {
-        "id": "bbd74f67",
-        "nationality": ["ar"],
-        "position": ["FW", "MF"],
-        "birth_year": 1973,
-    },
-    "Jorge-L\u00f3pez": {
-        "id": "cf66479e",
-        "nationality": ["es"],
-        "position": ["MF"],
-        "birth_year": 1978,
-    },
-    "Alberto-L\u00f3pez-Moreno": {
-        "id": "116731aa",
-        "nationality": ["es"],
-        "position": ["FW"],
-        "birth_year": 1967,
-    },
-    "Javier-L\u00f3pez-Vallejo": {
-        "id": "54562263",
-        "nationality": ["es"],
-        "position": ["GK"],
-        "birth_year": 1975,
-    },
-    "Alberto-Lopo": {
-        "id": "17cd5bb7",
-        "nationality": ["es"],
-        "position": ["DF"],
-        "birth_year": 1980,
-    },
-    "Loren": {
-        "id": "b70c42fb",
-        "nationality": ["es"],
-        "position": ["DF", "FW"],
-        "birth_year": 1966,
-    },
-    "Gonzalo-de-los-Santos": {
-        "id": "1855302a",
-        "nationality": ["uy"],
-        "position": ["MF"],
-        "birth_year": 1976,
-    },
-    "Roberto-Losada": {
-        "id": "547ccdd5",
-        "nationality": ["es"],
-        "position": ["FW"],
-        "birth_year": 1976,
-    },
-    "Enrique-de-Lucas": {
-        "id": "ae61cc61",
-        "nationality": ["es"],
-        "position": ["FW", "MF"],
-        "birth_year": 1978,
-    },
-    "Jos\u00e9-Luis-Caminero": {
-        "id": "f9199e3b",
-        "nationality": ["es"],
-        "position": ["FW", "MF"],
-        "birth_year": 1967,
-    },
-    "Juan-Luis-Mora": {
-        "id": "2e1a7599",
-        "nationality": ["es"],
-        "position": ["GK"],
-        "birth_year": 1973,
-    },
-    "Jos\u00e9-Luis-Santamar\u00eda": {
-        "id": "495f0364",
-        "nationality": ["es"],
-        "position": ["DF"],
-        "birth_year": 1973,
-    },
-    "Albert-Luque": {
-        "id": "80a6b1d8",
-        "nationality": ["es"],
-        "position": ["FW", "MF"],
-        "birth_year": 1978,
-    },
-    "Federico-Magallanes": {
-        "id": "d75da374",
-        "nationality": ["uy"],
-        "position": ["FW", "MF"],
-        "birth_year": 1976,
-    },
-    "Roy-Makaay": {
-        "id": "22cd2356",
-        "nationality": ["nl"],
-        "position": ["FW"],
-        "birth_year": 1975,
-    },
-    "Claude-Mak\u00e9l\u00e9l\u00e9": {
-        "id": "c27d01de",
-        "nationality": ["fr"],
-        "position": ["MF"],
-        "birth_year": 1973,
-    },
-    "Manel": {
-        "id": "11df8348",
-        "nationality": ["es"],
-        "position": ["FW"],
-        "birth_year": 1973,
-    },
-    "Javier-Manjar\u00edn": {
-        "id": "9328ba11",
-        "nationality": ["es"],
-        "position": ["FW"],
-        "birth_year": 1969,
-    },
-    "Jos\u00e9-Manuel": {
-        "id": "1d6f3570",
-        "nationality": ["es"],
-        "position": ["MF"],
-        "birth_year": 1973,
-    },
-    "Jos\u00e9-Manuel-Mateo": {
-        "id": "d7458f0a",
-        "nationality": ["es"],
-        "position": ["DF"],
-        "birth_year": 1975,
-    },
-    "Juan-Manuel-Pe\u00f1a": {
-        "id": "0f7909da",
-        "nationality": ["bo"],
-        "position": ["DF"],
-        "birth_year": 1973,
-    },
-    "Jos\u00e9-Manuel-Pinto": {
-        "id": "4a3cd9b7",
-        "nationality": ["es"],
-        "position": ["GK"],
-        "birth_year": 1975,
-    },
-    "Jos\u00e9-Manuel-Yanguas": {
-        "id": "ae3a7b7e",
-        "nationality": ["es"],
-        "position": ["DF"],
-        "birth_year": 1972,
-    },
-    "Marcos": {
-        "id": "7e5d2eb1",
-        "nationality": ["es"],
-        "position": ["MF"],
-        "birth_year": 1968,
-    },
-    "Alberto-Marcos-Rey": {
-        "id": "7fd2179f",
-        "nationality": ["es"],
-        "position": ["DF"],
-        "birth_year": 1974,
-    },
-    "Jos\u00e9-Mar\u00eda-Ceballos": {
-        "id": "60bed8c0",
-        "nationality": ["es"],
-        "position": ["GK"],
-        "birth_year": 1968,
-    },
-    "Jes\u00fas-Mar\u00eda-Lacruz": {
-        "id": "ee381989",
-        "nationality": ["es"],
-        "position": ["DF"],
-        "birth_year": 1978,
-    },
-    "Jos\u00e9-Mar\u00eda-Movilla": {
-        "id": "1ac170a8",
-        "nationality": ["es"],
-        "position": ["MF"],
-        "birth_year": 1975,
-    },
-    "Claudio-Marini": {
-        "id": "446a7d68",
-        "nationality": ["ar"],
-        "position": ["MF"],
-        "birth_year": 1972,
-    },
-    "Bruno-Marioni": {
-        "id": "76123163",
-        "nationality": ["ar"],
-        "position": ["FW"],
-        "birth_year": 1975,
-    },
-    "Luis-M\u00e1rquez-Mart\u00edn": {
-        "id": "e83bc2d5",
-        "nationality": ["es"],
-        "position": ["MF"],
-        "birth_year": 1971,
-    },
-    "C\u00e9sar-Mart\u00edn": {
-        "id": "f29d6eb0",
-        "nationality": ["es"],
-        "position": ["DF"],
-        "birth_year": 1977,
-    },
-    "Milan-Martinovi\u0107": {
-        "id": "d7f1eb31",
-        "nationality": ["rs"],
-        "position": ["DF"],
-        "birth_year": 1979,
-    },
-    "Javier-Mazzoni": {
-        "id": "7b4b1959",
-        "nationality": ["ar"],
-        "position": ["FW"],
-        "birth_year": 1972,
-    },
-    "Benni-McCarthy": {
-        "id": "a6f401c6",
-        "nationality": ["za"],
-        "position": ["FW"],
-        "birth_year": 1977,
-    },
-    "Steve-McManaman": {
-        "id": "9be05f40",
-        "nationality": ["eng"],
-        "position": ["MF"],
-        "birth_year": 1972,
-    },
-    "Quique-Medina": {
-        "id": "0aa5e053",
-        "nationality": ["es"],
-        "position": ["DF"],
-        "birth_year": 1974,
-    },
-    "Olof-Mellberg": {
-        "id": "1c95e93d",
-        "nationality": ["se"],
-        "position": ["DF", "MF"],
-        "birth_year": 1977,
-    },
-    "Gaizka-Mendieta": {
-        "id": "c5589415",
-        "nationality": ["es"],
-        "position": ["MF"],
-        "birth_year": 1974,
-    },
-    "Carlos-Merino": {
-        "id": "443c8c9a",
-        "nationality": ["es"],
-        "position": ["MF"],
-        "birth_year": 1980,
-    },
-    "M\u00edchel": {
-        "id": "19b3b837",
-        "nationality": ["es"],
-        "position": ["MF"],
-        "birth_year": 1975,
-    },
-    "Luis-Miguel-Ramis": {
-        "id": "3719bace",
-        "nationality": ["es"],
-        "position": ["DF"],
-        "birth_year": 1970,
-    },
-    "Luis-Milla": {
-        "id": "0471ed1d",
-        "nationality": ["es"],
-        "position": ["MF"],
-        "birth_year": 1966,
-    },
-    "Mingo": {
-        "id": "6fc287d5",
-        "nationality": ["es"],
-        "position": ["DF"],
-        "birth_year": 1977,
-    },
-    "Magno-Mocelin": {
-        "id": "a5d58ff0",
-        "nationality": ["br"],
-        "position": ["FW"],
-        "birth_year": 1974,
-    },
-    "Moha": {
-        "id": "e3d09e03",
-        "nationality": ["ma"],
-        "position": ["DF", "FW"],
-        "birth_year": 1977,
-    },
-    "Mois\u00e9s": {
-        "id": "e3415193",
-        "nationality": ["br"],
-        "position": ["MF"],
-        "birth_year": 1995,
-    },
-    "Jaime-Molina": {
-        "id": "2e1f6f32",
-        "nationality": ["es"],
-        "position": ["DF"],
-        "birth_year": 1969,
-    },
-    "Jos\u00e9-Molina": {
-        "id": "b0d136e8",
-        "nationality": ["es"],
-        "position": ["GK"],
-        "birth_year": 1970,
-    },
-    "Daniel-Montenegro": {
-        "id": "ca7697e0",
-        "nationality": ["ar"],
-        "position": ["FW", "MF"],
-        "birth_year": 1979,
-    },
-    "Curro-Montoya": {
-        "id": "e18e8059",
-        "nationality": ["es"],
-        "position": ["MF"],
-        "birth_year": 1977,
-    },
-    "\u00c1ngel-Morales": {
-        "id": "ba7ae976",
-        "nationality": ["es"],
-        "position": ["MF"],
-        "birth_year": 1975,
-    },
-    "Caco-Mor\u00e1n": {
-        "id": "41fc8068",
-        "nationality": ["es"],
-        "position": ["MF"],
-        "birth_year": 1973,
-    },
-    "Fernando-Mor\u00e1n": {
-        "id": "0fce6e4c",
-        "nationality": ["es"],
-        "position": ["MF"],
-        "birth_year": 1976,
-    },
-    "Antonio-Moreno": {
-        "id": "ded0f4b8",
-        "nationality": ["es"],
-        "position": ["MF"],
-        "birth_year": 1974,
-    },
-    "Javi-Moreno": {
-        "id": "64497d05",
-        "nationality": ["es"],
-        "position": ["FW"],
-        "birth_year": 1974,
-    },
-    "Joyce-Moreno": {
-        "id": "845cf4ff",
-        "nationality": ["es"],
-        "position": ["DF"],
-        "birth_year": 1974,
-    },
-    "Fernando-Morientes": {
-        "id": "bceebb25",
-        "nationality": ["es"],
-        "position": ["FW"],
-        "birth_year": 1976,
-    },
-    "Aleksandr-Mostovoi": {
-        "id": "6d215bed",
-        "nationality": ["ru"],
-        "position": ["MF"],
-        "birth_year": 1968,
-    },
-    "Pedro-Munitis": {
-        "id": "61b5cd53",
-        "nationality": ["es"],
-        "position": ["FW"],
-        "birth_year": 1975,
-    },
-    "Juan-Mu\u00f1iz": {
-        "id": "80eb9fbf",
-        "nationality": ["es"],
-        "position": ["DF"],
-        "birth_year": 1968,
-    },
-    "Kiki-Musampa": {
-        "id": "4095895b",
-        "nationality": ["nl"],
-        "position": ["FW", "MF"],
-        "birth_year": 1977,
-    },
-    "Peter-M\u00f8ller": {
-        "id": "f1fcdefc",
-        "nationality": ["dk"],
-        "position": ["FW"],
-        "birth_year": 1972,
-    },
-    "Mehdi-Nafti": {
-        "id": "93e31883",
-        "nationality": ["tn"],
-        "position": ["MF"],
-        "birth_year": 1978,
-    },
-    "Txomin-Nagore": {
-        "id": "41a60718",
-        "nationality": ["es"],
-        "position": ["MF"],
-        "birth_year": 1974,
-    },
-    "Nando": {
-        "id": "de6e9291",
-        "nationality": ["es"],
-        "position": ["DF"],
-        "birth_year": 1967,
-    },
-    "Rub\u00e9n-Navarro": {
-        "id": "59cc2821",
-        "nationality": ["es"],
-        "position": ["FW"],
-        "birth_year": 1978,
-    },
-    "Mauro-Navas": {
-        "id": "97fe2167",
-        "nationality": ["ar"],
-        "position": ["DF"],
-        "birth_year": 1974,
-    },
-    "Noureddine-Naybet": {
-        "id": "fa01d80f",
-        "nationality": ["ma"],
-        "position": ["DF"],
-        "birth_year": 1970,
-    },
-    "Albert-Na\u0111": {
-        "id": "04710860",
-        "nationality": ["rs"],
-        "position": ["MF"],
-        "birth_year": 1974,
-    },
-    "Neru": {
-        "id": "1c8dd214",
-        "nationality": ["es"],
-        "position": ["DF"],
-        "birth_year": 1974,
-    },
-    "Fernando-Ni\u00f1o": {
-        "id": "13cdd971",
-        "nationality": ["es"],
-        "position": ["DF"],
-        "birth_year": 1974,
-    },
-    "Akinori-Nishizawa": {
-        "id": "acb5ef4c",
-        "nationality": ["jp"],
-        "position": ["FW"],
-        "birth_year": 1976,
-    },
-    "Francisco-Noguerol": {
-        "id": "73bdd0b1",
-        "nationality": ["es"],
-        "position": ["DF"],
-        "birth_year": 1976,
-    },
-    "\u00c1lvaro-Novo": {
-        "id": "e2b88098",
-        "nationality": ["es"],
-        "position": ["MF"],
-        "birth_year": 1978,
-    },
-    "\u00c1lvaro-N\u00fa\u00f1ez": {
-        "id": "4267e1a9",
-        "nationality": ["uy"],
-        "position": ["GK"],
-        "birth_year": 1973,
-    },
-    "Nuno": {
-        "id": "82ebfa09",
-        "nationality": ["pt"],
-        "position": ["GK"],
-        "birth_year": 1974,
-    },
-    "Aitor-Ocio": {
-        "id": "f1c8639b",
-        "nationality": ["es"],
-        "position": ["DF"],
-        "birth_year": 1976,
-    },
-    "Pedro-Ojeda": {
-        "id": "60b2ae27",
-        "nationality": ["ar"],
-        "position": ["MF"],
-        "birth_year": 1972,
-    },
-    "Javier-Olaizola": {
-        "id": "023fc776",
-        "nationality": ["es"],
-        "position": ["DF"],
-        "birth_year": 1969,
-    },
-    "Oli": {
-        "id": "656bea4c",
-        "nationality": ["es"],
-        "position": ["FW"],
-        "birth_year": 1972,
-    },
-    "Tom\u00e1s-Ol\u00edas": {
-        "id": "74795116",
-        "nationality": ["es"],
-        "position": ["DF"],
-        "birth_year": 1969,
-    },
-    "Viktor-Onopko": {
-        "id": "bf6223cc",
-        "nationality": ["ru"],
-        "position": ["DF"],
-        "birth_year": 1969,
-    },
-    "Pablo-Orbaiz": {
-        "id": "3654d355",
-        "nationality": ["es"],
-        "position": ["MF"],
-        "birth_year": 1979,
-    },
-    "Paquito-Ortiz": {
-        "id": "acb14ba6",
-        "nationality": ["es"],
-        "position": ["MF"],
-        "birth_year": 1969,
-    },
-    "\u00d2scar": {
-        "id": "ae93cd06",
-        "nationality": ["es"],
-        "position": ["FW", "MF"],
-        "birth_year": 1973,
-    },
-    "Jos\u00e9-Oscar-Flores": {
-        "id": "5c5dc0eb",
-        "nationality": ["ar"],
-        "position": ["FW"],
-        "birth_year": 1971,
-    },
-    "Souleymane-Oulare": {
-        "id": "fb993615",
-        "nationality": ["gn"],
-        "position": ["FW"],
-        "birth_year": 1972,
-    },
-    "Marc-Overmars": {
-        "id": "c9cc6332",
-        "nationality": ["nl"],
-        "position": ["FW", "MF"],
-        "birth_year": 1973,
-    },
-    "Manuel-Pablo": {
-        "id": "c1776cef",
-        "nationality": ["es"],
-        "position": ["DF"],
-        "birth_year": 1976,
-    },
-    "Edgar-Pacheco": {
-        "id": "e70c4ab5",
-        "nationality": ["pt"],
-        "position": ["FW"],
-        "birth_year": 1977,
-    },
-    "Pacheta": {
-        "id": "7545007b",
-        "nationality": ["es"],
-        "position": ["MF"],
-        "birth_year": 1968,
-    },
-    "Sergio-Pach\u00f3n": {
-        "id": "ae85fca9",
-        "nationality": ["es"],
-        "position": ["FW"],
-        "birth_year": 1977,
-    },
-    "Paco": {
-        "id": "e52392a7",
-        "nationality": ["es"],
-        "position": ["DF"],
-        "birth_year": 1970,
-    },
-    "C\u00e9sar-Palacios": {
-        "id": "dc32054b",
-        "nationality": ["es"],
-        "position": ["MF"],
-        "birth_year": 1974,
-    },
-    "Mart\u00edn-Palermo": {
-        "id": "02aa1dbe",
-        "nationality": ["ar"],
-        "position": ["FW"],
-        "birth_year": 1973,
-    },
-    "Andr\u00e9s-Palop": {
-        "id": "9ab4e785",
-        "nationality": ["es"],
-        "position": ["GK"],
-        "birth_year": 1973,
-    },
-    "Walter-Pandiani": {
-        "id": "11899bb1",
-        "nationality": ["uy"],
-        "position": ["FW"],
-        "birth_year": 1976,
-    },
-    "Paqui": {
-        "id": "cf8ddf0b",
-        "nationality": ["es"],
-        "position": ["DF"],
-        "birth_year": 1970,
-    },
-    "Crist\u00f3bal-Parralo": {
-        "id": "814fda14",
-        "nationality": ["es"],
-        "position": ["DF"],
-        "birth_year": 1967,
-    },
-    "L\u00edbero-Parri": {
-        "id": "203ff743",
-        "nationality": ["es"],
-        "position": ["MF"],
-        "birth_year": 1982,
-    },
-    "Andr\u00e9s-Pato-Bernal": {
-        "id": "7405d294",
-        "nationality": ["es"],
-        "position": ["DF"],
-        "birth_year": 1980,
-    },
-    "\u00d3scar-de-Paula": {
-        "id": "4b7217c8",
-        "nationality": ["es"],
-        "position": ["FW"],
-        "birth_year": 1975,
-    },
-    "Veljko-Paunovi\u0107": {
-        "id": "7d0ae66f",
-        "nationality": ["es"],
-        "position": ["FW", "MF"],
-        "birth_year": 1977,
-    },
-    "Javier-de-Pedro": {
-        "id": "0023e354",
-        "nationality": ["es"],
-        "position": ["MF"],
-        "birth_year": 1973,
-    },
-    "Mauricio-Pellegrino": {
-        "id": "8b3d6528",
-        "nationality": ["ar"],
-        "position": ["DF"],
-        "birth_year": 1971,
-    },
-    "Alfonso-P\u00e9rez": {
-        "id": "22a2f25e",
-        "nationality": ["es"],
-        "position": ["FW"],
-        "birth_year": 1972,
-    },
-    "Ib\u00e1n-P\u00e9rez": {
-        "id": "c90c4965",
-        "nationality": ["es"],
-        "position": ["DF"],
-        "birth_year": 1974,
-    },
-    "Iv\u00e1n-P\u00e9rez-Mu\u00f1oz": {
-        "id": "08087521",
-        "nationality": ["es"],
-        "position": ["FW"],
-        "birth_year": 1976,
-    },
-    "\u00d3scar-P\u00e9rez": {
-        "id": "a4ae5f6a",
-        "nationality": ["es"],
-        "position": ["MF"],
-        "birth_year": 1981,
-    },
-    "Alen-Peternac": {
-        "id": "c0b4ee52",
-        "nationality": ["hr"],
-        "position": ["FW"],
-        "birth_year": 1972,
-    },
-    "Emmanuel-Petit": {
-        "id": "291358c4",
-        "nationality": ["fr"],
-        "position": ["DF", "MF"],
-        "birth_year": 1970,
-    },
-    "Javi-Pineda": {
-        "id": "4f3c2c52",
-        "nationality": ["es"],
-        "position": ["DF"],
-        "birth_year": 1973,
-    },
-    "David-Pirri": {
-        "id": "e84f523d",
-        "nationality": ["es"],
-        "position": ["MF"],
-        "birth_year": 1974,
-    },
-    "Mauricio-Pochettino": {
-        "id": "92c5faee",
-        "nationality": ["ar"],
-        "position": ["DF"],
-        "birth_year": 1972,
-    },
-    "Gerhard-Poschner": {
-        "id": "da48d522",
-        "nationality": ["de"],
-        "position": ["MF"],
-        "birth_year": 1969,
-    },
-    "Mart\u00edn-Posse": {
-        "id": "cec1d8dd",
-        "nationality": ["ar"],
-        "position": ["FW"],
-        "birth_year": 1975,
-    },
-    "L\u00e9ider-Preciado": {
-        "id": "f37a5b51",
-        "nationality": ["co"],
-        "position": ["FW"],
-        "birth_year": 1977,
-    },
-    "Carles-Puyol": {
-        "id": "7c0bda9b",
-        "nationality": ["es"],
-        "position": ["DF"],
-        "birth_year": 1978,
-    },
-    "Abdullah-Quaye": {
-        "id": "8f8f93d2",
-        "nationality": ["gh"],
-        "position": ["MF"],
-        "birth_year": 1983,
-    },
-    "Mami-Quevedo": {
-        "id": "2c1d71b5",
-        "nationality": ["es"],
-        "position": ["MF"],
-        "birth_year": 1969,
-    },
-    "Ram\u00f3n-de-Quintana": {
-        "id": "657ad2f1",
-        "nationality": ["es"],
-        "position": ["DF"],
-        "birth_year": 1972,
-    },
-    "Franck-Rabarivony": {
-        "id": "8b4a1585",
-        "nationality": ["mg"],
-        "position": ["DF"],
-        "birth_year": 1970,
-    },
-    "Rafa": {
-        "id": "e6198207",
-        "nationality": ["es"],
-        "position": ["GK"],
-        "birth_year": 1970,
-    },
-    "Ram\u00f3n": {
-        "id": "6892efc4",
-        "nationality": ["es"],
-        "position": ["DF"],
-        "birth_year": 1974,
-    },
-    "Jaime-Ramos": {
-        "id": "0efbd49c",
-        "nationality": ["es"],
-        "position": ["MF"],
-        "birth_year": 1973,
-    },
-    "Ra\u00fal": {
-        "id": "2b81295d",
-        "nationality": ["es"],
-        "position": ["FW"],
-        "birth_year": 1977,
-    },
-    "Miguel-Rebosio": {
-        "id": "306e0437",
-        "nationality": ["pe"],
-        "position": ["DF"],
-        "birth_year": 1976,
-    },
-    "Mario-Regueiro": {
-        "id": "c792d665",
-        "nationality": ["uy"],
-        "position": ["FW", "MF"],
-        "birth_year": 1978,
-    },
-    "Pepe-Reina": {
-        "id": "e358587b",
-        "nationality": ["es"],
-        "position": ["GK"],
-        "birth_year": 1982,
-    },
-    "Michael-Reiziger": {
-        "id": "6e75ab56",
-        "nationality": ["nl"],
-        "position": ["DF"],
-        "birth_year": 1973,
-    },
-    "L\u00f3pez-Rekarte": {
-        "id": "346b3104",
-        "nationality": ["es"],
-        "position": ["DF"],
-        "birth_year": 1975,
-    },
-    "Rub\u00e9n-Reyes": {
-        "id": "770a119c",
-        "nationality": ["es"],
-        "position": ["MF"],
-        "birth_year": 1979,
-    },
-    "Nan-Ribera": {
-        "id": "b235c57c",
-        "nationality": ["es"],
-        "position": ["MF"],
-        "birth_year": 1975,
-    },
-    "Ricardo": {
-        "id": "2fe713ed",
-        "nationality": ["br"],
-        "position": ["GK"],
-        "birth_year": 1993,
-    },
-    "Pablo-Ricchetti": {
-        "id": "69952e6a",
-        "nationality": ["ar"],
-        "position": ["DF", "MF"],
-        "birth_year": 1977,
-    },
-    "Albert-Riera": {
-        "id": "3a0a5056",
-        "nationality": ["es"],
-        "position": ["DF", "FW"],
-        "birth_year": 1982,
-    },
-    "Rub\u00e9n-Su\u00e1rez-Del-R\u00edo": {
-        "id": "bd8fb3bd",
-        "nationality": ["es"],
-        "position": ["FW"],
-        "birth_year": 1975,
-    },
-    "Roberto-R\u00edos": {
-        "id": "0270edc0",
-        "nationality": ["es"],
-        "position": ["DF"],
-        "birth_year": 1971,
-    },
-    "Rivaldo": {
-        "id": "5c7f3153",
-        "nationality": ["br"],
-        "position": ["FW", "MF"],
-        "birth_year": 1972,
-    },
-    "Mart\u00edn-Rivas": {
-        "id": "d62e9e52",
-        "nationality": ["uy"],
-        "position": ["DF"],
-        "birth_year": 1977,
-    },
-    "Alberto-Rivera": {
-        "id": "7002b605",
-        "nationality": ["es"],
-        "position": ["MF"],
-        "birth_year": 1978,
-    },
-    "Carlos-Roa": {
-        "id": "eb148b07",
-        "nationality": ["ar"],
-        "position": ["GK"],
-        "birth_year": 1969,
-    },
-    "Juli\u00e1n-Robles": {
-        "id": "a9b429a7",
-        "nationality": ["es"],
-        "position": ["MF"],
-        "birth_year": 1981,
-    },
-    "Xavier-Roca": {
-        "id": "d58118a4",
-        "nationality": ["es"],
-        "position": ["DF"],
-        "birth_year": 1974,
-    },
-    "\u00c1ngel-Rodr\u00edguez": {
-        "id": "81645497",
-        "nationality": ["es"],
-        "position": ["MF"],
-        "birth_year": 1972,
-    },
-    "Ra\u00fal-Rodr\u00edguez-Serrano": {
-        "id": "c9b1f845",
-        "nationality": ["es"],
-        "position": ["GK"],
-        "birth_year": 1973,
-    },
-    "Vicente-Rodr\u00edguez": {
-        "id": "73b8c719",
-        "nationality": ["es"],
-        "position": ["FW", "MF"],
-        "birth_year": 1981,
-    },
-    "Roger": {
-        "id": "78bc5697",
-        "nationality": ["es"],
-        "position": ["MF"],
-        "birth_year": 1976,
-    },
-    "Roberto-Rojas": {
-        "id": "4d3bb679",
-        "nationality": ["es"],
-        "position": ["DF"],
-        "birth_year": 1974,
-    },
-    "Enrique-Romero": {
-        "id": "7714c21a",
-        "nationality": ["es"],
-        "position": ["DF"],
-        "birth_year": 1971,
-    },
-    "Iv\u00e1n-Rosado": {
-        "id": "21bbfc0b",
-        "nationality": ["es"],
-        "position": ["FW"],
-        "birth_year": 1974,
-    },
-    "Mario-Rosas": {
-        "id": "81718397",
-        "nationality": ["es"],
-        "position": ["MF"],
-        "birth_year": 1980,
-    },
-    "Lauren\u021biu-Ro\u0219u": {
-        "id": "83e63626",
-        "nationality": ["ro"],
-        "position": ["FW", "MF"],
-        "birth_year": 1975,
-    },
-    "Pablo-Rotchen": {
-        "id": "ad2723bd",
-        "nationality": ["ar"],
-        "position": ["DF"],
-        "birth_year": 1973,
-    },
-    "Mikel-Roteta": {
-        "id": "05ec1ccf",
-        "nationality": ["es"],
-        "position": ["DF"],
-        "birth_year": 1970,
-    },
-    "Manuel-Ruano": {
-        "id": "67eb7267",
-        "nationality": ["es"],
-        "position": ["MF"],
-        "birth_year": 1974,
-    },
-    "Francisco-Rufete": {
-        "id": "95aca6cd",
-        "nationality": ["es"],
-        "position": ["MF"],
-        "birth_year": 1976,
-    },
-    "Ismael-Ruiz": {
-        "id": "13401e74",
-        "nationality": ["es"],
-        "position": ["MF"],
-        "birth_year": 1977,
-    },
-    "Jos\u00e9-Miguel-P\u00e9rez-Ruiz": {
-        "id": "659a5eed",
-        "nationality": ["es"],
-        "position": ["FW"],
-        "birth_year": 1976,
-    },
-    "Sigurd-Rushfeldt": {
-        "id": "dcc4043b",
-        "nationality": ["no"],
-        "position": ["FW"],
-        "birth_year": 1972,
-    },
-    "Sabino": {
-        "id": "1859d624",
-        "nationality": ["es"],
-        "position": ["FW"],
-        "birth_year": 1978,
-    },
-    "Sim\u00e3o-Sabrosa": {
-        "id": "76a65612",
-        "nationality": ["pt"],
-        "position": ["MF"],
-        "birth_year": 1979,
-    },
-    "Eusebio-Sacrist\u00e1n": {
-        "id": "db2e55a3",
-        "nationality": ["es"],
-        "position": ["MF"],
-        "birth_year": 1964,
-    },
-    "Fernando-Sales": {
-        "id": "24486536",
-        "nationality": ["es"],
-        "position": ["MF"],
-        "birth_year": 1977,
-    },
-    "M\u00edchel-Salgado": {
-        "id": "68f36bc6",
-        "nationality": ["es"],
-        "position": ["DF"],
-        "birth_year": 1975,
-    },
-    "C\u00e9sar-Sampaio": {
-        "id": "c94f0886",
-        "nationality": ["br"],
-        "position": ["MF"],
-        "birth_year": 1968,
-    },
-    "Vinny-Samways": {
-        "id": "9dc41793",
-        "nationality": ["eng"],
-        "position": ["MF"],
-        "birth_year": 1968,
-    },
-    "C\u00e9sar-S\u00e1nchez": {
-        "id": "c6e6e5d6",
-        "nationality": ["es"],
-        "position": ["GK"],
-        "birth_year": 1971,
-    },
-    "Jes\u00fas-S\u00e1nchez": {
-        "id": "a92bade1",
-        "nationality": ["es"],
-        "position": ["MF"],
-        "birth_year": 1974,
-    },
-    "Juan-S\u00e1nchez": {
-        "id": "58c2f75c",
-        "nationality": ["es"],
-        "position": ["FW"],
-        "birth_year": 1972,
-    },
-    "Manolo-S\u00e1nchez": {
-        "id": "b40c4904",
-        "nationality": ["es"],
-        "position": ["MF"],
-        "birth_year": 1976,
-    },
-    "V\u00edctor-S\u00e1nchez": {
-        "id": "811bc23c",
-        "nationality": ["es"],
-        "position": ["MF"],
-        "birth_year": 1976,
-    },
-    "Manolo-Sanch\u00eds": {
-        "id": "fba2513d",
-        "nationality": ["es"],
-        "position": ["DF"],
-        "birth_year": 1965,
-    },
-    "Sandro": {
-        "id": "9c890cc8",
-        "nationality": ["es"],
-        "position": ["MF"],
-        "birth_year": 1982,
-    },
-    "Sergio-Santamar\u00eda": {
-        "id": "4795800e",
-        "nationality": ["es"],
-        "position": ["FW", "MF"],
-        "birth_year": 1980,
-    },
-    "Urbano-Santos": {
-        "id": "64592758",
-        "nationality": ["es"],
-        "position": ["DF"],
-        "birth_year": 1975,
-    },
-    "Fernando-Sanz": {
-        "id": "d23f0cc6",
-        "nationality": ["es"],
-        "position": ["DF"],
-        "birth_year": 1974,
-    },
-    "Pablo-Sanz-Iniesta": {
-        "id": "f56d83dd",
-        "nationality": ["es"],
-        "position": ["MF"],
-        "birth_year": 1973,
-    },
-    "Ricardo-Sanzol": {
-        "id": "1aa419de",
-        "nationality": ["es"],
-        "position": ["GK"],
-        "birth_year": 1976,
-    },
-    "Koldo-Saras\u00faa": {
-        "id": "5d6cce88",
-        "nationality": ["es"],
-        "position": ["DF"],
-        "birth_year": 1972,
-    },
-    "Josu-Sarriegi": {
-        "id": "cca08d01",
-        "nationality": ["es"],
-        "position": ["DF"],
-        "birth_year": 1979,
-    },
-    "S\u00e1vio": {
-        "id": "4abe5c93",
-        "nationality": ["br"],
-        "position": ["MF"],
-        "birth_year": 1974,
-    },
-    "Lionel-Scaloni": {
-        "id": "6cc4990c",
-        "nationality": ["ar"],
-        "position": ["DF", "MF"],
-        "birth_year": 1978,
-    },
-    "Gabriel-Sch\u00fcrrer": {
-        "id": "ae350391",
-        "nationality": ["ar"],
-        "position": ["DF"],
-        "birth_year": 1971,
-    },
-    "Leandro-Sena": {
-        "id": "1721d7af",
-        "nationality": ["br"],
-        "position": ["MF"],
-        "birth_year": 1976,
-    },
-    "Sergio": {
-        "id": "c6ed9815",
-        "nationality": ["es"],
-        "position": ["MF"],
-        "birth_year": 1976,
-    },
-    "Manolo-Serrano": {
-        "id": "b89f1066",
-        "nationality": ["es"],
-        "position": ["MF"],
-        "birth_year": 1972,
-    },
-    "Josep-Setvalls": {
-        "id": "18c53e9e",
-        "nationality": ["es"],
-        "position": ["MF"],
-        "birth_year": 1974,
-    },
-    "Sietes": {
-        "id": "bae8225f",
-        "nationality": ["es"],
-        "position": ["DF"],
-        "birth_year": 1974,
-    },
-    "Dar\u00edo-Silva": {
-        "id": "1efa0295",
-        "nationality": ["uy"],
-        "position": ["FW"],
-        "birth_year": 1972,
-    },
-    "Mauro-Silva": {
-        "id": "0c2beece",
-        "nationality": ["br"],
-        "position": ["MF"],
-        "birth_year": 1968,
-    },
-    "Gustavo-Siviero": {
-        "id": "aa1f67bf",
-        "nationality": ["ar"],
-        "position": ["DF"],
-        "birth_year": 1969,
-    },
-    "Santiago-Solari": {
-        "id": "e34c6e97",
-        "nationality": ["ar"],
-        "position": ["MF"],
-        "birth_year": 1976,
-    },
-    "Antonio-Soldevilla": {
-        "id": "6a88843a",
-        "nationality": ["es"],
-        "position": ["DF"],
-        "birth_year": 1978,
-    },
-    "Miquel-Soler": {
-        "id": "258ef5f1",
-        "nationality": ["es"],
-        "position": ["DF", "MF"],
-        "birth_year": 1965,
-    },
-    "Paco-Soler": {
-        "id": "1d07ab0a",
-        "nationality": ["es"],
-        "position": ["MF"],
-        "birth_year": 1970,
-    },
-    "Jacques-Songo'o": {
-        "id": "1d51be3b",
-        "nationality": ["cm"],
-        "position": ["GK"],
-        "birth_year": 1964,
-    },
-    "Jovan-Stankovi\u0107": {
-        "id": "6985b8f9",
-        "nationality": ["rs"],
-        "position": ["MF"],
-        "birth_year": 1971,
-    },
-    "Orlando-Su\u00e1rez": {
-        "id": "ed1316be",
-        "nationality": ["es"],
-        "position": ["FW"],
-        "birth_year": 1972,
-    },
-    "Pablo-Su\u00e1rez": {
-        "id": "8358f17d",
-        "nationality": ["es"],
-        "position": ["DF"],
-        "birth_year": 1979,
-    },
-    "Gary-Sundgren": {
-        "id": "10057c28",
-        "nationality": ["se"],
-        "position": ["DF", "MF"],
-        "birth_year": 1967,
-    },
-    "Washington-Tais": {
-        "id": "6b310a03",
-        "nationality": ["uy"],
-        "position": ["DF"],
-        "birth_year": 1972,
-    },
-    "Ra\u00fal-Tamudo": {
-        "id": "c026089c",
-        "nationality": ["es"],
-        "position": ["FW"],
-        "birth_year": 1977,
-    },
-    "Igor-Ta\u0161evski": {
-        "id": "8a69ac47",
-        "nationality": ["rs"],
-        "position": ["DF"],
-        "birth_year": 1972,
-    },
-    "\u00d3scar-T\u00e9llez": {
-        "id": "c4b1fe41",
-        "nationality": ["es"],
-        "position": ["DF"],
-        "birth_year": 1975,
-    },
-    "Tiko": {
-        "id": "88a00d5d",
-        "nationality": ["es"],
-        "position": ["MF"],
-        "birth_year": 1976,
-    },
-    "Tito": {
-        "id": "8f451bf9",
-        "nationality": ["es"],
-        "position": ["MF"],
-        "birth_year": 1972,
-    },
-    "Delio-Toledo": {
-        "id": "916beb71",
-        "nationality": ["py"],
-        "position": ["DF"],
-        "birth_year": 1976,
-    },
-    "Ivan-Tomi\u0107": {
-        "id": "dff4f3f2",
-        "nationality": ["rs"],
-        "position": ["MF"],
-        "birth_year": 1976,
-    },
-    "\u0110or\u0111e-Tomi\u0107": {
-        "id": "8bf4ab16",
-        "nationality": ["rs"],
-        "position": ["MF"],
-        "birth_year": 1972,
-    },
-    "Javier-Torres-G\u00f3mez": {
-        "id": "677aa169",
-        "nationality": ["es"],
-        "position": ["DF"],
-        "birth_year": 1970,
-    },
-    "Tote": {
-        "id": "e3e74421",
-        "nationality": ["es"],
-        "position": ["FW", "MF"],
-        "birth_year": 1978,
-    },
-    "Diego-Trist\u00e1n": {
-        "id": "e63209c5",
-        "nationality": ["es"],
-        "position": ["FW"],
-        "birth_year": 1976,
-    },
-    "Miros\u0142aw-Trzeciak": {
-        "id": "526f71db",
-        "nationality": ["pl"],
-        "position": ["FW"],
-        "birth_year": 1968,
-    },
-    "Mario-Turd\u00f3": {
-        "id": "0e08ad62",
-        "nationality": ["ar"],
-        "position": ["FW"],
-        "birth_year": 1979,
-    },
-    "Jes\u00fas-Turiel": {
-        "id": "7c737496",
-        "nationality": ["es"],
-        "position": ["MF"],
-        "birth_year": 1973,
-    },
-    "Jes\u00fas-Unanua": {
-        "id": "a592fec8",
-        "nationality": ["es"],
-        "position": ["GK"],
-        "birth_year": 1969,
-    },
-    "Josu-Urrutia": {
-        "id": "73940c77",
-        "nationality": ["es"],
-        "position": ["MF"],
-        "birth_year": 1968,
-    },
-    "Ismael-Urzaiz": {
-        "id": "3ceb9882",
-        "nationality": ["es"],
-        "position": ["FW"],
-        "birth_year": 1971,
-    },
-    "V\u00e1gner": {
-        "id": "c0efb885",
-        "nationality": ["br"],
-        "position": ["MF"],
-        "birth_year": 1973,
-    },
-    "Vicente-Valcarce": {
-        "id": "1fecb68c",
-        "nationality": ["es"],
-        "position": ["DF"],
-        "birth_year": 1974,
-    },
-    "Marcos-Vales": {
-        "id": "f96c7239",
-        "nationality": ["es"],
-        "position": ["MF"],
-        "birth_year": 1975,
-    },
-    "\u00d3scar-Vales": {
-        "id": "f8ef72c8",
-        "nationality": ["es"],
-        "position": ["DF"],
-        "birth_year": 1974,
-    },
-    "Rub\u00e9n-Vega": {
-        "id": "a4a62d56",
-        "nationality": ["es"],
-        "position": ["FW", "MF"],
-        "birth_year": 1977,
-    },
-    "Toni-Velamaz\u00e1n": {
-        "id": "4a6b56a2",
-        "nationality": ["es"],
-        "position": ["MF"],
-        "birth_year": 1977,
-    },
-    "Juan-Velasco-Damas": {
-        "id": "6630e590",
-        "nationality": ["es"],
-        "position": ["DF"],
-        "birth_year": 1977,
-    },
-    "Mart\u00edn-Vellisca": {
-        "id": "d859d8c2",
-        "nationality": ["es"],
-        "position": ["MF"],
-        "birth_year": 1971,
-    },
-    "Alfonso-Vera": {
-        "id": "d0b31ce2",
-        "nationality": ["es"],
-        "position": ["MF"],
-        "birth_year": 1973,
-    },
-    "Unai-Vergara": {
-        "id": "c9d08ea0",
-        "nationality": ["es"],
-        "position": ["DF"],
-        "birth_year": 1977,
-    },
-    "V\u00edctor": {
-        "id": "00979380",
-        "nationality": ["es"],
-        "position": ["FW"],
-        "birth_year": 1974,
-    },
-    "Risto-Vidakovi\u0107": {
-        "id": "a2ddc971",
-        "nationality": ["yu"],
-        "position": ["DF"],
-        "birth_year": 1969,
-    },
-    "Octavio-Vi\u00f1als": {
-        "id": "c2a9f580",
-        "nationality": ["es"],
-        "position": ["MF"],
-        "birth_year": 1970,
-    },
-    "\u00c1ngel-Vivar-Dorado": {
-        "id": "ac6d027e",
-        "nationality": ["es"],
-        "position": ["MF"],
-        "birth_year": 1974,
-    },
-    "Jurica-Vu\u010dko": {
-        "id": "d12b2233",
-        "nationality": ["hr"],
-        "position": ["FW"],
-        "birth_year": 1976,
-    },
-    "Xavi": {
-        "id": "c1b4188c",
-        "nationality": ["es"],
-        "position": ["MF"],
-        "birth_year": 1980,
-    },
-    "Yago-Yao": {
-        "id": "a25c8b6c",
-        "nationality": ["gq"],
-        "position": ["DF"],
-        "birth_year": 1979,
-    },
-    "Francisco-Yeste": {
-        "id": "8b3e6045",
-        "nationality": ["es"],
-        "position": ["MF"],
-        "birth_year": 1979,
-    },
-    "Yordi": {
-        "id": "8cbb78fb",
-        "nationality": ["es"],
-        "position": ["FW"],
-        "birth_year": 1975,
-    },
-    "Zlatko-Zahovi\u010d": {
-        "id": "8286a2d7",
-        "nationality": ["si"],
-        "position": ["FW", "MF"],
-        "birth_year": 1971,
-    },
-    "Ariel-Z\u00e1rate": {
-        "id": "9c670adf",
-        "nationality": ["ar"],
-        "position": ["FW", "MF"],
-        "birth_year": 1973,
-    },
-    "Boudewijn-Zenden": {
-        "id": "4e27a622",
-        "nationality": ["nl"],
-        "position": ["DF", "FW"],
-        "birth_year": 1976,
-    },
-    "Cuco-Ziganda": {
-        "id": "66bb7b9b",
-        "nationality": ["es"],
-        "position": ["FW"],
-        "birth_year": 1966,
-    },
-    "Vlatko-\u0110olonga": {
-        "id": "bd14a37e",
-        "nationality": ["hr"],
-        "position": ["DF"],
-        "birth_year": 1976,
-    },
-    "Goran-\u0110orovi\u0107": {
-        "id": "a1b5c999",
-        "nationality": ["rs"],
-        "position": ["DF"],
-        "birth_year": 1971,
-    },
-    "Miroslav-\u0110uki\u0107": {
-        "id": "a3e76b49",
-        "nationality": ["rs"],
-        "position": ["DF"],
-        "birth_year": 1966,
-    },
-    "Jacques-Abardonado": {
-        "id": "ecab07ee",
-        "nationality": ["fr"],
-        "position": ["DF"],
-        "birth_year": 1978,
-    },
-    "Yacine-Abdessadki": {
-        "id": "fc6a1641",
-        "nationality": ["ma"],
-        "position": ["MF"],
-        "birth_year": 1981,
-    },
-    "\u00c9ric-Abidal": {
-        "id": "016828bd",
-        "nationality": ["fr"],
-        "position": ["DF"],
-        "birth_year": 1979,
-    },
-    "Fabrice-Abriel": {
-        "id": "94ae30a8",
-        "nationality": ["fr"],
-        "position": ["MF"],
-        "birth_year": 1979,
-    },
-    "Fr\u00e9d\u00e9ric-Adam": {
-        "id": "907a0e29",
-        "nationality": ["fr"],
-        "position": ["MF"],
-        "birth_year": 1973,
-    },
-    "Madjid-Adjaoud": {
-        "id": "1e8d4df0",
-        "nationality": ["dz"],
-        "position": ["MF"],
-        "birth_year": 1971,
-    },
-    "Kodjo-Afanou": {
-        "id": "74e09745",
-        "nationality": ["fr"],
-        "position": ["DF"],
-        "birth_year": 1977,
-    },
-    "Kuami-Agboh": {
-        "id": "6ba31df5",
-        "nationality": ["tg"],
-        "position": ["MF"],
-        "birth_year": 1977,
-    },
-    "Hassan-Ahamada": {
-        "id": "63072d7a",
-        "nationality": ["fr"],
-        "position": ["FW", "MF"],
-        "birth_year": 1981,
-    },
-    "Ra\u00fal-Alfredo-Cascini": {
-        "id": "16143756",
-        "nationality": ["ar"],
-        "position": ["MF"],
-        "birth_year": 1971,
-    },
-    "Jimmy-Algerino": {
-        "id": "2ca61847",
-        "nationality": ["fr"],
-        "position": ["DF"],
-        "birth_year": 1971,
-    },
-    "Herv\u00e9-Alicarte": {
-        "id": "7f294503",
-        "nationality": ["fr"],
-        "position": ["DF"],
-        "birth_year": 1974,
-    },
-    "\u00c9ric-Allibert": {
-        "id": "ac8279be",
-        "nationality": ["fr"],
-        "position": ["GK"],
-        "birth_year": 1976,
-    },
-    "Alo\u00edsio": {
-        "id": "9a3cc558",
-        "nationality": ["br"],
-        "position": ["FW"],
-        "birth_year": 1975,
-    },
-    "J\u00e9r\u00f4me-Alonzo": {
-        "id": "7865d245",
-        "nationality": ["fr"],
-        "position": ["GK"],
-        "birth_year": 1972,
-    },
-    "Gharib-Amzine": {
-        "id": "faccb389",
-        "nationality": ["ma"],
-        "position": ["MF"],
-        "birth_year": 1973,
-    },
-    "Sonny-Anderson": {
-        "id": "27a82cca",
-        "nationality": ["br"],
-        "position": ["FW"],
-        "birth_year": 1970,
-    },
-    "Pierre-Yves-Andr\u00e9": {
-        "id": "a8ab0bcd",
-        "nationality": ["fr"],
-        "position": ["FW"],
-        "birth_year": 1974,
-    },
-    "Nicolas-Anelka": {
-        "id": "931ed5e9",
-        "nationality": ["fr"],
-        "position": ["FW"],
-        "birth_year": 1979,
-    },
-    "Edwin-van-Ankeren": {
-        "id": "0be62049",
-        "nationality": ["nl"],
-        "position": ["FW"],
-        "birth_year": 1968,
-    },
-    "Pierre-Aristouy": {
-        "id": "0458fd2b",
-        "nationality": ["fr"],
-        "position": ["FW"],
-        "birth_year": 1979,
-    },
-    "Sylvain-Armand": {
-        "id": "cfa036c3",
-        "nationality": ["fr"],
-        "position": ["DF"],
-        "birth_year": 1980,
-    },
-    "John-Arne-Riise": {
-        "id": "9bf988c2",
-        "nationality": ["no"],
-        "position": ["DF", "MF"],
-        "birth_year": 1980,
-    },
-    "Fr\u00e9d\u00e9ric-Arpinon": {
-        "id": "64ad6336",
-        "nationality": ["fr"],
-        "position": ["MF"],
-        "birth_year": 1969,
-    },
-    "Dominique-Arribag\u00e9": {
-        "id": "244738ef",
-        "nationality": ["fr"],
-        "position": ["DF"],
-        "birth_year": 1971,
-    },
-    "Mikel-Arteta": {
-        "id": "d934d1e6",
-        "nationality": ["es"],
-        "position": ["MF"],
-        "birth_year": 1982,
-    },
-    "\u00c9ric-Assati": {
-        "id": "59c4705d",
-        "nationality": ["re"],
-        "position": ["DF"],
-        "birth_year": 1974,
-    },
-    "Ludovic-Asuar": {
-        "id": "4f85715d",
-        "nationality": ["fr"],
-        "position": ["MF"],
-        "birth_year": 1976,
-    },
-    "Jean-Marie-Aubry": {
-        "id": "93f80434",
-        "nationality": ["fr"],
-        "position": ["GK"],
-        "birth_year": 1969,
-    },
-    "Fabien-Audard": {
-        "id": "9bb204e5",
-        "nationality": ["fr"],
-        "position": ["GK"],
-        "birth_year": 1978,
-    },
-    "Mamadou-Bagayoko": {
-        "id": "dc579188",
-        "nationality": ["ml"],
-        "position": ["FW"],
-        "birth_year": 1979,
-    },
-    "Schumann-Bah": {
-        "id": "82a98965",
-        "nationality": ["gn"],
-        "position": ["DF"],
-        "birth_year": 1974,
-    },
-    "Jacek-B\u0105k": {
-        "id": "91456062",
-        "nationality": ["pl"],
-        "position": ["DF"],
-        "birth_year": 1973,
-    },
-    "Dagui-Bakari": {
-        "id": "6aa8b491",
-        "nationality": ["ci"],
-        "position": ["FW"],
-        "birth_year": 1974,
-    },
-    "Ibrahima-Bakayoko": {
-        "id": "db4c20fe",
-        "nationality": ["ci"],
-        "position": ["FW"],
-        "birth_year": 1976,
-    },
-    "Bobo-Bald\u00e9": {
-        "id": "60c76531",
-        "nationality": ["gn"],
-        "position": ["DF"],
-        "birth_year": 1975,
-    },
-    "C\u00e9dric-Bardon": {
-        "id": "dd1414ac",
-        "nationality": ["fr"],
-        "position": ["FW", "MF"],
-        "birth_year": 1976,
-    },
-    "Yannick-Baret": {
-        "id": "68285a25",
-        "nationality": ["fr"],
-        "position": ["MF"],
-        "birth_year": 1972,
-    },
-    "Jos\u00e9-Barkero": {
-        "id": "89a1b23c",
-        "nationality": ["es"],
-        "position": ["MF"],
-        "birth_year": 1979,
-    },
-    "Patrick-Barul": {
-        "id": "693780ad",
-        "nationality": ["fr"],
-        "position": ["DF"],
-        "birth_year": 1977,
-    },
-    "Christophe-Bastien": {
-        "id": "c3512cde",
-        "nationality": ["fr"],
-        "position": ["MF"],
-        "birth_year": 1976,
-    },
-    "Bruno-Basto": {
-        "id": "75d256f6",
-        "nationality": ["pt"],
-        "position": ["DF"],
-        "birth_year": 1978,
-    },
-    "G\u00e9rald-Baticle": {
-        "id": "53ca78c8",
-        "nationality": ["fr"],
-        "position": ["FW"],
-        "birth_year": 1969,
-    },
-    "Laurent-Batlles": {
-        "id": "3cd2fd3b",
-        "nationality": ["fr"],
-        "position": ["MF"],
-        "birth_year": 1975,
-    },
-    "Xavier-B\u00e9cas": {
-        "id": "295cb7fe",
-        "nationality": ["fr"],
-        "position": ["MF"],
-        "birth_year": 1979,
-    },
-    "Mikkel-Beck": {
-        "id": "e68ed370",
-        "nationality": ["dk"],
-        "position": ["FW"],
-        "birth_year": 1973,
-    },
-    "Radek-Bejbl": {
-        "id": "56f2b9a2",
-        "nationality": ["cz"],
-        "position": ["DF", "MF"],
-        "birth_year": 1972,
-    },
-    "Gonzalo-Belloso": {
-        "id": "2f278661",
-        "nationality": ["ar"],
-        "position": ["FW"],
-        "birth_year": 1974,
-    },
-    "Djamel-Belmadi": {
-        "id": "fa0f8351",
-        "nationality": ["dz"],
-        "position": ["MF"],
-        "birth_year": 1976,
-    },
-    "Ali-Benarbia": {
-        "id": "43b3c8bd",
-        "nationality": ["dz"],
-        "position": ["MF"],
-        "birth_year": 1968,
-    },
-    "Lucas-Bernardi": {
-        "id": "b845d856",
-        "nationality": ["ar"],
-        "position": ["MF"],
-        "birth_year": 1977,
-    },
-    "Mathieu-Berson": {
-        "id": "31d48214",
-        "nationality": ["fr"],
-        "position": ["MF"],
-        "birth_year": 1980,
-    },
-    "S\u00e9kou-Berth\u00e9": {
-        "id": "44d51294",
-        "nationality": ["ml"],
-        "position": ["DF"],
-        "birth_year": 1977,
-    },
-    "Teddy-Bertin": {
-        "id": "ccb21cf3",
-        "nationality": ["fr"],
-        "position": ["DF"],
-        "birth_year": 1969,
-    },
-    "Habib-Beye": {
-        "id": "459b0b19",
-        "nationality": ["sn"],
-        "position": ["DF"],
-        "birth_year": 1977,
-    },
-    "Andr\u00e9-Biancarelli": {
-        "id": "4dbbb0fe",
-        "nationality": ["fr"],
-        "position": ["GK"],
-        "birth_year": 1970,
-    },
-    "Yoann-Bign\u00e9": {
-        "id": "6eb984d5",
-        "nationality": ["fr"],
-        "position": ["MF"],
-        "birth_year": 1977,
-    },
-    "Serge-Blanc": {
-        "id": "49b8eeb5",
-        "nationality": ["fr"],
-        "position": ["DF"],
-        "birth_year": 1972,
-    },
-    "Jocelyn-Blanchard": {
-        "id": "2934f575",
-        "nationality": ["fr"],
-        "position": ["MF"],
-        "birth_year": 1972,
-    },
-    "Patrick-Blondeau": {
-        "id": "df753ae4",
-        "nationality": ["fr"],
-        "position": ["DF"],
-        "birth_year": 1968,
-    },
-    "Danny-Boffin": {
-        "id": "8cdc85df",
-        "nationality": ["be"],
-        "position": ["MF"],
-        "birth_year": 1965,
-    },
-    "V\u00edctor-Bonilla": {
-        "id": "5e3bd07a",
-        "nationality": ["co"],
-        "position": ["FW"],
-        "birth_year": 1971,
-    },
-    "Nicolas-Bonnal": {
-        "id": "a3eec824",
-        "nationality": ["fr"],
-        "position": ["MF"],
-        "birth_year": 1976,
-    },
-    "J\u00e9r\u00f4me-Bonnissel": {
-        "id": "11588a83",
-        "nationality": ["fr"],
-        "position": ["DF", "FW"],
-        "birth_year": 1973,
-    },
-    "St\u00e9phane-Borbiconi": {
-        "id": "0033efe5",
-        "nationality": ["fr"],
-        "position": ["DF"],
-        "birth_year": 1979,
-    },
-    "Fabien-Boudar\u00e8ne": {
-        "id": "a43a87c8",
-        "nationality": ["fr"],
-        "position": ["MF"],
-        "birth_year": 1978,
-    },
-    "Guillaume-Bouisset": {
-        "id": "72ea6c5f",
-        "nationality": ["fr"],
-        "position": ["DF"],
-        "birth_year": 1973,
-    },
-    "Ali-Boumnijel": {
-        "id": "319dbabd",
-        "nationality": ["tn"],
-        "position": ["GK"],
-        "birth_year": 1966,
-    },
-    "Jean-Alain-Boumsong": {
-        "id": "c2c31ca9",
-        "nationality": ["fr"],
-        "position": ["DF"],
-        "birth_year": 1979,
-    },
-    "Pierre-Emmanuel-Bourdeau": {
-        "id": "688bc596",
-        "nationality": ["fr"],
-        "position": ["DF"],
-        "birth_year": 1975,
-    },
-    "Samuel-Boutal": {
-        "id": "051b0271",
-        "nationality": ["fr"],
-        "position": ["FW", "MF"],
-        "birth_year": 1969,
-    },
-    "Dj\u00e9zon-Boutoille": {
-        "id": "29ab567a",
-        "nationality": ["fr"],
-        "position": ["FW"],
-        "birth_year": 1975,
-    },
-    "Mohamed-Bradja": {
-        "id": "6d34fa68",
-        "nationality": ["dz"],
-        "position": ["DF"],
-        "birth_year": 1969,
-    },
-    "Fabien-Brandes": {
-        "id": "1d235029",
-        "nationality": ["fr"],
-        "position": ["MF"],
-        "birth_year": 1972,
-    },
-    "Fr\u00e9d\u00e9ric-Brando": {
-        "id": "c868b9ac",
-        "nationality": ["fr"],
-        "position": ["MF"],
-        "birth_year": 1973,
-    },
-    "J\u00e9r\u00e9mie-Br\u00e9chet": {
-        "id": "2a13c80b",
-        "nationality": ["fr"],
-        "position": ["DF", "MF"],
-        "birth_year": 1979,
-    },
-    "Toni-Brogno": {
-        "id": "850324cc",
-        "nationality": ["be"],
-        "position": ["FW"],
-        "birth_year": 1973,
-    },
-    "Philippe-Brunel": {
-        "id": "364d8e06",
-        "nationality": ["fr"],
-        "position": ["MF"],
-        "birth_year": 1973,
-    },
-    "Mathieu-Bucher": {
-        "id": "aa1d6b29",
-        "nationality": ["fr"],
-        "position": ["FW"],
-        "birth_year": 1982,
-    },
-    "Herv\u00e9-Bugnet": {
-        "id": "72792bbe",
-        "nationality": ["fr"],
-        "position": ["FW", "MF"],
-        "birth_year": 1981,
-    },
-    "Dar\u00edo-Cabrol": {
-        "id": "f79961d2",
-        "nationality": ["ar"],
-        "position": ["MF"],
-        "birth_year": 1972,
-    },
-    "Ca\u00e7apa": {
-        "id": "887c3af5",
-        "nationality": ["br"],
-        "position": ["DF", "MF"],
-        "birth_year": 1976,
-    },
-    "Pablo-Calandria": {
-        "id": "9c010ae8",
-        "nationality": ["ar"],
-        "position": ["FW"],
-        "birth_year": 1982,
-    },
-    "Pascal-Camadini": {
-        "id": "df2ca142",
-        "nationality": ["fr"],
-        "position": ["MF"],
-        "birth_year": 1972,
-    },
-    "Zoumana-Camara": {
-        "id": "dd8ab3d6",
-        "nationality": ["fr"],
-        "position": ["DF"],
-        "birth_year": 1979,
-    },
-    "Eddy-Capron": {
-        "id": "8cb3fb13",
-        "nationality": ["fr"],
-        "position": ["DF"],
-        "birth_year": 1971,
-    },
-    "St\u00e9phane-Carnot": {
-        "id": "b6fd0b8b",
-        "nationality": ["fr"],
-        "position": ["MF"],
-        "birth_year": 1972,
-    },
-    "Bruno-Carotti": {
-        "id": "39ccde00",
-        "nationality": ["fr"],
-        "position": ["DF", "MF"],
-        "birth_year": 1972,
-    },
-    "\u00c9ric-Carri\u00e8re": {
-        "id": "011f56f1",
-        "nationality": ["fr"],
-        "position": ["MF"],
-        "birth_year": 1973,
-    },
-    "Dominique-Casagrande": {
-        "id": "3e02351d",
-        "nationality": ["fr"],
-        "position": ["GK"],
-        "birth_year": 1971,
-    },
-    "Laurent-Casanova": {
-        "id": "9a36e99a",
-        "nationality": ["fr"],
-        "position": ["DF"],
-        "birth_year": 1971,
-    },
-    "Philippe-Celdran": {
-        "id": "5f28360b",
-        "nationality": ["fr"],
-        "position": ["MF"],
-        "birth_year": 1973,
-    },
-    "Fabio-Celestini": {
-        "id": "c36ce86e",
-        "nationality": ["ch"],
-        "position": ["MF"],
-        "birth_year": 1975,
-    },
-    "C\u00e9sar": {
-        "id": "564915c8",
-        "nationality": ["br"],
-        "position": ["DF"],
-        "birth_year": 1975,
-    },
-    "S\u00e9bastien-Chabbert": {
-        "id": "646e10fd",
-        "nationality": ["fr"],
-        "position": ["GK"],
-        "birth_year": 1978,
-    },
-    "Jean-Marc-Chanelet": {
-        "id": "70610acf",
-        "nationality": ["fr"],
-        "position": ["DF"],
-        "birth_year": 1968,
-    },
-    "Cyril-Chapuis": {
-        "id": "a6921a34",
-        "nationality": ["fr"],
-        "position": ["FW"],
-        "birth_year": 1979,
-    },
-    "Loic-Chaveriat": {
-        "id": "18c0b117",
-        "nationality": ["fr"],
-        "position": ["FW"],
-        "birth_year": 1977,
-    },
-    "Beno\u00eet-Cheyrou": {
-        "id": "683e9dbc",
-        "nationality": ["fr"],
-        "position": ["MF"],
-        "birth_year": 1981,
-    },
-    "Bruno-Cheyrou": {
-        "id": "9655ab80",
-        "nationality": ["fr"],
-        "position": ["MF"],
-        "birth_year": 1978,
-    },
-    "Philippe-Christanval": {
-        "id": "2b1074c4",
-        "nationality": ["fr"],
-        "position": ["DF"],
-        "birth_year": 1978,
-    },
-    "Christian": {
-        "id": "40dccd05",
-        "nationality": ["br"],
-        "position": ["FW"],
-        "birth_year": 1975,
-    },
-    "Aliou-Ciss\u00e9": {
-        "id": "0717f817",
-        "nationality": ["sn"],
-        "position": ["DF", "MF"],
-        "birth_year": 1976,
-    },
-    "Djibril-Ciss\u00e9": {
-        "id": "7e6917be",
-        "nationality": ["fr"],
-        "position": ["FW"],
-        "birth_year": 1981,
-    },
-    "\u00c9douard-Ciss\u00e9": {
-        "id": "4fe329a7",
-        "nationality": ["fr"],
-        "position": ["MF"],
-        "birth_year": 1978,
-    },
-    "Micha\u00ebl-Citony": {"id": "c15c48bf", "position": ["MF"], "birth_year": 1980},
-    "Jos\u00e9-Clayton": {
-        "id": "0caa5fdd",
-        "nationality": ["tn"],
-        "position": ["DF"],
-        "birth_year": 1974,
-    },
-    "Fabrice-Colleau": {
-        "id": "0c0d3a8c",
-        "nationality": ["fr"],
-        "position": ["MF"],
-        "birth_year": 1977,
-    },
-    "Patrick-Collot": {
-        "id": "da481b0b",
-        "nationality": ["fr"],
-        "position": ["FW", "MF"],
-        "birth_year": 1967,
-    },
-    "Ferdinand-Coly": {
-        "id": "da5d198d",
-        "nationality": ["sn"],
-        "position": ["DF"],
-        "birth_year": 1973,
-    },
-    "Alexandre-Comisetti": {
-        "id": "53b219c0",
-        "nationality": ["ch"],
-        "position": ["MF"],
-        "birth_year": 1973,
-    },
-    "Edwin-Congo": {
-        "id": "08925878",
-        "nationality": ["co"],
-        "position": ["FW"],
-        "birth_year": 1976,
-    },
-    "Denni-Conteh": {
-        "id": "17ba77de",
-        "nationality": ["dk"],
-        "position": ["FW", "MF"],
-        "birth_year": 1975,
-    },
-    "Pablo-Contreras": {
-        "id": "1cba86c6",
-        "nationality": ["cl"],
-        "position": ["DF"],
-        "birth_year": 1978,
-    },
-    "Fabien-Cool": {
-        "id": "909ac3cd",
-        "nationality": ["fr"],
-        "position": ["GK"],
-        "birth_year": 1972,
-    },
-    "Charles-\u00c9douard-Coridon": {
-        "id": "35e0ff7a",
-        "nationality": ["mq"],
-        "position": ["MF"],
-        "birth_year": 1973,
-    },
-    "Costinha": {
-        "id": "88e9ba29",
-        "nationality": ["pt"],
-        "position": ["MF"],
-        "birth_year": 1974,
-    },
-    "Dramane-Coulibaly": {
-        "id": "768f9fab",
-        "nationality": ["ml"],
-        "position": ["FW"],
-        "birth_year": 1979,
-    },
-    "Gr\u00e9gory-Coupet": {
-        "id": "80e389fb",
-        "nationality": ["fr"],
-        "position": ["GK"],
-        "birth_year": 1972,
-    },
-    "Laurent-Courtois": {
-        "id": "fdd8f774",
-        "nationality": ["fr"],
-        "position": ["MF"],
-        "birth_year": 1978,
-    },
-    "Uliano-Courville": {
-        "id": "47e2251d",
-        "nationality": ["fr"],
-        "position": ["MF"],
-        "birth_year": 1978,
-    },
-    "Pascal-Cygan": {
-        "id": "96d186cf",
-        "nationality": ["fr"],
-        "position": ["DF"],
-        "birth_year": 1974,
-    },
-    "Fernando-D'Amico": {
-        "id": "b09f32a1",
-        "nationality": ["ar"],
-        "position": ["MF"],
-        "birth_year": 1975,
-    },
-    "Patricio-D'Amico": {
-        "id": "095ff8fd",
-        "nationality": ["ar"],
-        "position": ["FW", "MF"],
-        "birth_year": 1975,
-    },
-    "Bruno-Da-Rocha": {
-        "id": "e6c6fd0b",
-        "nationality": ["fr"],
-        "position": ["MF"],
-        "birth_year": 1977,
-    },
-    "Fr\u00e9d\u00e9ric-Da-Rocha": {
-        "id": "be2110c6",
-        "nationality": ["fr"],
-        "position": ["MF"],
-        "birth_year": 1974,
-    },
-    "Eug\u00e8ne-Dadi": {
-        "id": "c58bc1fb",
-        "nationality": ["ci"],
-        "position": ["FW"],
-        "birth_year": 1973,
-    },
-    "Karim-Dahou": {
-        "id": "c81bdb5c",
-        "nationality": ["fr"],
-        "position": ["MF"],
-        "birth_year": 1982,
-    },
-    "Wilfried-Dalmat": {
-        "id": "441884a2",
-        "nationality": ["mf"],
-        "position": ["FW", "MF"],
-        "birth_year": 1982,
-    },
-    "Ga\u00ebl-Danic": {
-        "id": "5a529d5a",
-        "nationality": ["fr"],
-        "position": ["MF"],
-        "birth_year": 1981,
-    },
-    "Prince-Daye": {
-        "id": "5848902a",
-        "nationality": ["lr"],
-        "position": ["FW"],
-        "birth_year": 1978,
-    },
-    "Fabien-Debec": {
-        "id": "1d29902f",
-        "nationality": ["fr"],
-        "position": ["GK"],
-        "birth_year": 1976,
-    },
-    "Thierry-Deb\u00e8s": {
-        "id": "fa9d524c",
-        "nationality": ["fr"],
-        "position": ["GK"],
-        "birth_year": 1974,
-    },
-    "Micka\u00ebl-Deb\u00e8ve": {
-        "id": "7fca7f25",
-        "nationality": ["fr"],
-        "position": ["MF"],
-        "birth_year": 1970,
-    },
-    "Pierre-Deblock": {
-        "id": "c08ce057",
-        "nationality": ["fr"],
-        "position": ["MF"],
-        "birth_year": 1973,
-    },
-    "\u00c9ric-Deflandre": {
-        "id": "771cda4f",
-        "nationality": ["be"],
-        "position": ["DF"],
-        "birth_year": 1973,
-    },
-    "Christophe-Deguerville": {
-        "id": "fb4a8d0a",
-        "nationality": ["fr"],
-        "position": ["DF"],
-        "birth_year": 1970,
-    },
-    "Fr\u00e9d\u00e9ric-D\u00e9hu": {
-        "id": "e972aae6",
-        "nationality": ["fr"],
-        "position": ["DF", "MF"],
-        "birth_year": 1972,
-    },
-    "Philippe-Delaye": {
-        "id": "0bc96090",
-        "nationality": ["fr"],
-        "position": ["MF"],
-        "birth_year": 1975,
-    },
-    "Pascal-Delhommeau": {
-        "id": "be71c254",
-        "nationality": ["fr"],
-        "position": ["DF"],
-        "birth_year": 1978,
-    },
-    "Christophe-Delmotte": {
-        "id": "087ec3cb",
-        "nationality": ["fr"],
-        "position": ["DF", "MF"],
-        "birth_year": 1969,
-    },
-    "Matthieu-Delpierre": {
-        "id": "40019289",
-        "nationality": ["fr"],
-        "position": ["DF"],
-        "birth_year": 1981,
-    },
-    "Sylvain-Deplace": {
-        "id": "293b6fc3",
-        "nationality": ["fr"],
-        "position": ["MF"],
-        "birth_year": 1972,
-    },
-    "Geoffrey-Dernis": {
-        "id": "1a50eab9",
-        "nationality": ["fr"],
-        "position": ["FW", "MF"],
-        "birth_year": 1980,
-    },
-    "Yves-Deroff": {
-        "id": "47187985",
-        "nationality": ["fr"],
-        "position": ["DF"],
-        "birth_year": 1978,
-    },
-    "Jean-Christophe-Devaux": {
-        "id": "f41feff0",
-        "nationality": ["fr"],
-        "position": ["DF"],
-        "birth_year": 1975,
-    },
-    "Charles-Devineau": {
-        "id": "6a391d1e",
-        "nationality": ["fr"],
-        "position": ["MF"],
-        "birth_year": 1979,
-    },
-    "Vikash-Dhorasoo": {
-        "id": "8c803b45",
-        "nationality": ["fr"],
-        "position": ["MF"],
-        "birth_year": 1973,
-    },
-    "Alex-Di-Rocco": {
-        "id": "0c16a204",
-        "nationality": ["fr"],
-        "position": ["FW"],
-        "birth_year": 1970,
-    },
-    "David-Di-Tommaso": {
-        "id": "a145fbc8",
-        "nationality": ["fr"],
-        "position": ["DF"],
-        "birth_year": 1979,
-    },
-    "Lassina-Diabat\u00e9": {
-        "id": "09ee3764",
-        "nationality": ["ci"],
-        "position": ["DF", "MF"],
-        "birth_year": 1974,
-    },
-    "Salif-Diao": {
-        "id": "acc326da",
-        "nationality": ["sn"],
-        "position": ["MF"],
-        "birth_year": 1977,
-    },
-    "Alex-Dias": {
-        "id": "02648b28",
-        "nationality": ["br"],
-        "position": ["FW"],
-        "birth_year": 1972,
-    },
-    "Lamine-Diatta": {
-        "id": "403ff2c2",
-        "nationality": ["sn"],
-        "position": ["DF"],
-        "birth_year": 1975,
-    },
-    "Fousseni-Diawara": {
-        "id": "e6d582ed",
-        "nationality": ["ml"],
-        "position": ["DF"],
-        "birth_year": 1980,
-    },
-    "Nicolas-Dieuze": {
-        "id": "57992d1e",
-        "nationality": ["fr"],
-        "position": ["MF"],
-        "birth_year": 1979,
-    },
-    "Sylvain-Distin": {
-        "id": "002d06bb",
-        "nationality": ["fr"],
-        "position": ["DF"],
-        "birth_year": 1977,
-    },
-    "Martin-Djetou": {
-        "id": "59a231bb",
-        "nationality": ["fr"],
-        "position": ["DF", "MF"],
-        "birth_year": 1974,
-    },
-    "Cyril-Domoraud": {
-        "id": "0c0ac13c",
-        "nationality": ["ci"],
-        "position": ["DF"],
-        "birth_year": 1971,
-    },
-    "Manuel-dos-Santos": {
-        "id": "5c1ac62c",
-        "nationality": ["fr"],
-        "position": ["DF"],
-        "birth_year": 1974,
-    },
-    "Vincent-Doukanti\u00e9": {
-        "id": "46318f9f",
-        "nationality": ["ml"],
-        "position": ["DF", "MF"],
-        "birth_year": 1977,
-    },
-    "Cyril-Dubroca": {
-        "id": "2c24c11d",
-        "nationality": ["fr"],
-        "position": ["DF"],
-        "birth_year": 1981,
-    },
-    "Pierre-Ducrocq": {
-        "id": "6d7ac11b",
-        "nationality": ["fr"],
-        "position": ["DF", "MF"],
-        "birth_year": 1976,
-    },
-    "Christophe-Dugarry": {
-        "id": "4c5db7e2",
-        "nationality": ["fr"],
-        "position": ["FW", "MF"],
-        "birth_year": 1972,
-    },
-    "Franck-Dumas": {
-        "id": "48218721",
-        "nationality": ["fr"],
-        "position": ["DF", "MF"],
-        "birth_year": 1968,
-    },
-    "\u00c9ric-Durand": {
-        "id": "13dc0d21",
-        "nationality": ["fr"],
-        "position": ["GK"],
-        "birth_year": 1965,
-    },
-    "Olivier-Echouafni": {
-        "id": "b8c67e6e",
-        "nationality": ["fr"],
-        "position": ["MF"],
-        "birth_year": 1972,
-    },
-    "Johnny-Ecker": {
-        "id": "85e34e43",
-        "nationality": ["fr"],
-        "position": ["DF"],
-        "birth_year": 1973,
-    },
-    "Edm\u00edlson": {
-        "id": "13853c88",
-        "nationality": ["br"],
-        "position": ["DF", "MF"],
-        "birth_year": 1976,
-    },
-    "Christophe-Eggimann": {
-        "id": "fa872234",
-        "nationality": ["fr"],
-        "position": ["GK"],
-        "birth_year": 1976,
-    },
-    "Fabrice-Ehret": {
-        "id": "f143b126",
-        "nationality": ["fr"],
-        "position": ["DF", "MF"],
-        "birth_year": 1979,
-    },
-    "Wagneau-Eloi": {
-        "id": "18a240f1",
-        "nationality": ["ht"],
-        "position": ["FW"],
-        "birth_year": 1973,
-    },
-    "C\u00e9dric-Elz\u00e9ard": {
-        "id": "2b9ae6c9",
-        "nationality": ["fr"],
-        "position": ["DF"],
-        "birth_year": 1975,
-    },
-    "Julien-Escud\u00e9": {
-        "id": "6aa5bd41",
-        "nationality": ["fr"],
-        "position": ["DF"],
-        "birth_year": 1979,
-    },
-    "Mario-Espartero": {
-        "id": "505d8533",
-        "nationality": ["fr"],
-        "position": ["MF"],
-        "birth_year": 1978,
-    },
-    "Michael-Essien": {
-        "id": "d6577282",
-        "nationality": ["gh"],
-        "position": ["DF", "MF"],
-        "birth_year": 1982,
-    },
-    "N\u00e9stor-Fabbri": {
-        "id": "0c658595",
-        "nationality": ["ar"],
-        "position": ["DF"],
-        "birth_year": 1968,
-    },
-    "Lu\u00eds-Fabiano": {
-        "id": "eaaeef7b",
-        "nationality": ["br"],
-        "position": ["FW"],
-        "birth_year": 1980,
-    },
-    "David-Faderne": {
-        "id": "262ffffa",
-        "nationality": ["fr"],
-        "position": ["FW"],
-        "birth_year": 1970,
-    },
-    "Khalilou-Fadiga": {
-        "id": "0946c6b7",
-        "nationality": ["sn"],
-        "position": ["MF"],
-        "birth_year": 1974,
-    },
-    "Abdelilah-Fahmi": {
-        "id": "e0277721",
-        "nationality": ["ma"],
-        "position": ["DF"],
-        "birth_year": 1973,
-    },
-    "Pontus-Farnerud": {
-        "id": "d7b18dcd",
-        "nationality": ["se"],
-        "position": ["MF"],
-        "birth_year": 1980,
-    },
-    "Amdy-Faye": {
-        "id": "c0e82ee2",
-        "nationality": ["sn"],
-        "position": ["DF", "MF"],
-        "birth_year": 1977,
-    },
-    "Pascal-Feindouno": {
-        "id": "d32d9947",
-        "nationality": ["gn"],
-        "position": ["FW", "MF"],
-        "birth_year": 1981,
-    },
-    "Karim-Fellahi": {
-        "id": "cb6d8a6f",
-        "nationality": ["fr"],
-        "position": ["MF"],
-        "birth_year": 1974,
-    },
-    "Demetrius-Ferreira": {
-        "id": "cde356e2",
-        "nationality": ["br"],
-        "position": ["DF"],
-        "birth_year": 1974,
-    },
-    "Romain-Ferrier": {
-        "id": "aa518e17",
-        "nationality": ["fr"],
-        "position": ["DF"],
-        "birth_year": 1976,
-    },
-    "Fabrice-Fior\u00e8se": {
-        "id": "41585f65",
-        "nationality": ["fr"],
-        "position": ["FW", "MF"],
-        "birth_year": 1975,
-    },
-    "Yannick-Fischer": {
-        "id": "336a8eaa",
-        "nationality": ["fr"],
-        "position": ["DF"],
-        "birth_year": 1974,
-    },
-    "Marc-Vivien-Fo\u00e9": {
-        "id": "f98e429e",
-        "nationality": ["cm"],
-        "position": ["MF"],
-        "birth_year": 1975,
-    },
-    "Hubert-Fournier": {
-        "id": "b66c9d16",
-        "nationality": ["fr"],
-        "position": ["DF"],
-        "birth_year": 1967,
-    },
-    "J\u00e9r\u00f4me-Fr\u00e9tard": {
-        "id": "2d2d1655",
-        "nationality": ["fr"],
-        "position": ["MF"],
-        "birth_year": 1975,
-    },
-    "Alexandre-Frutos": {
-        "id": "a0055a0e",
-        "nationality": ["fr"],
-        "position": ["FW", "MF"],
-        "birth_year": 1982,
-    },
-    "Esteban-Fuertes": {
-        "id": "244cff56",
-        "nationality": ["ar"],
-        "position": ["FW"],
-        "birth_year": 1972,
-    },
-    "Adriano-Gabiru": {
-        "id": "8d310f9a",
-        "nationality": ["br"],
-        "position": ["MF"],
-        "birth_year": 1977,
-    },
-    "Philippe-Gaillot": {
-        "id": "261a77b4",
-        "nationality": ["fr"],
-        "position": ["DF"],
-        "birth_year": 1965,
-    },
-    "Marcelo-Gallardo": {
-        "id": "483e1b7a",
-        "nationality": ["ar"],
-        "position": ["MF"],
-        "birth_year": 1976,
-    },
-    "William-Gallas": {
-        "id": "286fb7e0",
-        "nationality": ["fr"],
-        "position": ["DF"],
-        "birth_year": 1977,
-    },
-    "Benjamin-Gavanon": {
-        "id": "b5835a51",
-        "nationality": ["fr"],
-        "position": ["MF"],
-        "birth_year": 1980,
-    },
-    "Farid-Ghazi": {
-        "id": "ffd94918",
-        "nationality": ["dz"],
-        "position": ["FW"],
-        "birth_year": 1974,
-    },
-    "Nicolas-Gillet": {
-        "id": "f44c1aca",
-        "nationality": ["fr"],
-        "position": ["DF"],
-        "birth_year": 1976,
-    },
-    "Ludovic-Giuly": {
-        "id": "028d362d",
-        "nationality": ["fr"],
-        "position": ["FW", "MF"],
-        "birth_year": 1976,
-    },
-    "Ga\u00ebl-Givet": {
-        "id": "6d28f149",
-        "nationality": ["fr"],
-        "position": ["DF"],
-        "birth_year": 1981,
-    },
-    "Louis-Gomis": {
-        "id": "14ac56c3",
-        "nationality": ["fr"],
-        "position": ["DF"],
-        "birth_year": 1971,
-    },
-    "Jocelyn-Gourvennec": {
-        "id": "d980dc8b",
-        "nationality": ["fr"],
-        "position": ["MF"],
-        "birth_year": 1972,
-    },
-    "Pascal-Gourville": {
-        "id": "fc58574c",
-        "nationality": ["mr"],
-        "position": ["DF"],
-        "birth_year": 1975,
-    },
-    "Nicolas-Gouss\u00e9": {
-        "id": "87e3288a",
-        "nationality": ["fr"],
-        "position": ["FW"],
-        "birth_year": 1976,
-    },
-    "Sidney-Govou": {
-        "id": "05428bc9",
-        "nationality": ["fr"],
-        "position": ["FW", "MF"],
-        "birth_year": 1979,
-    },
-    "Xavier-Gravelaine": {
-        "id": "b13af7a1",
-        "nationality": ["fr"],
-        "position": ["FW", "MF"],
-        "birth_year": 1968,
-    },
-    "St\u00e9phane-Gr\u00e9goire": {
-        "id": "37f81ff1",
-        "nationality": ["fr"],
-        "position": ["MF"],
-        "birth_year": 1968,
-    },
-    "Damien-Gregorini": {
-        "id": "1edb2e8f",
-        "nationality": ["fr"],
-        "position": ["GK"],
-        "birth_year": 1979,
-    },
-    "Fran\u00e7ois-Grenet": {
-        "id": "171ac2af",
-        "nationality": ["fr"],
-        "position": ["DF"],
-        "birth_year": 1975,
-    },
-    "Willy-Grondin": {
-        "id": "d22779ae",
-        "nationality": ["fr"],
-        "position": ["GK"],
-        "birth_year": 1974,
-    },
-    "Nenad-Grozdi\u0107": {
-        "id": "a1a9039f",
-        "nationality": ["rs"],
-        "position": ["MF"],
-        "birth_year": 1974,
-    },
-    "Tchiressoua-Guel": {
-        "id": "7068ac7d",
-        "nationality": ["ci"],
-        "position": ["MF"],
-        "birth_year": 1975,
-    },
-    "Auriol-Guillaume": {"id": "ca09f433", "position": ["DF"], "birth_year": 1979},
-    "St\u00e9phane-Guivarc'h": {
-        "id": "b526c1a9",
-        "nationality": ["fr"],
-        "position": ["FW"],
-        "birth_year": 1970,
-    },
-    "Laurent-Guyot": {
-        "id": "0c88f6b6",
-        "nationality": ["fr"],
-        "position": ["DF"],
-        "birth_year": 1969,
-    },
-    "Mario-Haas": {
-        "id": "56728e3f",
-        "nationality": ["at"],
-        "position": ["FW"],
-        "birth_year": 1974,
-    },
-    "El-Hadji-Diouf": {
-        "id": "1a4542c8",
-        "nationality": ["sn"],
-        "position": ["FW", "MF"],
-        "birth_year": 1981,
-    },
-    "Nasser-Hakkar": {
-        "id": "8581fff9",
-        "nationality": ["fr"],
-        "position": ["MF"],
-        "birth_year": 1981,
-    },
-    "David-Hamed": {
-        "id": "0079b6f0",
-        "nationality": ["fr"],
-        "position": ["DF"],
-        "birth_year": 1974,
-    },
-    "Riad-Hammadou": {
-        "id": "af9827f5",
-        "nationality": ["dz"],
-        "position": ["MF"],
-        "birth_year": 1976,
-    },
-    "Eric-Hassli": {
-        "id": "45af85fa",
-        "nationality": ["fr"],
-        "position": ["FW"],
-        "birth_year": 1981,
-    },
-    "Brahim-Hemdani": {
-        "id": "08d006ef",
-        "nationality": ["dz"],
-        "position": ["DF", "MF"],
-        "birth_year": 1978,
-    },
-    "St\u00e9phane-Hernandez": {
-        "id": "deba6655",
-        "nationality": ["fr"],
-        "position": ["DF"],
-        "birth_year": 1979,
-    },
-    "Laurent-Herv\u00e9": {
-        "id": "32e32e5c",
-        "nationality": ["fr"],
-        "position": ["MF"],
-        "birth_year": 1976,
-    },
-    "Tony-Heurtebis": {
-        "id": "9f450baa",
-        "nationality": ["fr"],
-        "position": ["GK"],
-        "birth_year": 1975,
-    },
-    "Laurent-Huard": {
-        "id": "785e4b47",
-        "nationality": ["fr"],
-        "position": ["MF"],
-        "birth_year": 1973,
-    },
-    "Angelo-Hugues": {
-        "id": "8bc084d8",
-        "nationality": ["fr"],
-        "position": ["GK"],
-        "birth_year": 1966,
-    },
-    "Bruno-Irles": {
-        "id": "5b92913f",
-        "nationality": ["fr"],
-        "position": ["DF"],
-        "birth_year": 1975,
-    },
-    "Val\u00e9rien-Isma\u00ebl": {
-        "id": "a3d06a0f",
-        "nationality": ["fr"],
-        "position": ["DF"],
-        "birth_year": 1975,
-    },
-    "Pierre-Issa": {
-        "id": "29276708",
-        "nationality": ["za"],
-        "position": ["DF"],
-        "birth_year": 1975,
-    },
-    "Jonathan-J\u00e4ger": {
-        "id": "f1d98960",
-        "nationality": ["fr"],
-        "position": ["FW"],
-        "birth_year": 1978,
-    },
-    "Hamada-Jambay": {
-        "id": "eb78379c",
-        "nationality": ["mg"],
-        "position": ["DF"],
-        "birth_year": 1975,
-    },
-    "J\u00e9r\u00e9mie-Janot": {
-        "id": "20881853",
-        "nationality": ["fr"],
-        "position": ["GK"],
-        "birth_year": 1977,
-    },
-    "Fabrice-Jau": {
-        "id": "c77901d4",
-        "nationality": ["fr"],
-        "position": ["MF"],
-        "birth_year": 1978,
-    },
-    "Jean-S\u00e9bastien-Jaur\u00e8s": {
-        "id": "342e8cc4",
-        "nationality": ["fr"],
-        "position": ["DF"],
-        "birth_year": 1977,
-    },
-    "Fr\u00e9d\u00e9ric-Jay": {
-        "id": "cae49f46",
-        "nationality": ["fr"],
-        "position": ["DF"],
-        "birth_year": 1976,
-    },
-    "Nordin-Jbari": {
-        "id": "b048d5ef",
-        "nationality": ["be"],
-        "position": ["FW"],
-        "birth_year": 1975,
-    },
-    "David-Jemmali": {
-        "id": "e02e47b8",
-        "nationality": ["tn"],
-        "position": ["DF"],
-        "birth_year": 1974,
-    },
-    "Cyril-Jeunechamp": {
-        "id": "0738014e",
-        "nationality": ["fr"],
-        "position": ["DF", "MF"],
-        "birth_year": 1975,
-    },
-    "Richard-J\u00e9zierski": {
-        "id": "ef4ab9da",
-        "nationality": ["fr"],
-        "position": ["DF"],
-        "birth_year": 1971,
-    },
-    "Pascal-Johansen": {
-        "id": "29d45bd9",
-        "nationality": ["fr"],
-        "position": ["MF"],
-        "birth_year": 1979,
-    },
-    "Jonathan-Joseph-Augustin": {
-        "id": "f2d93560",
-        "nationality": ["fr"],
-        "position": ["DF"],
-        "birth_year": 1981,
-    },
-    "Marek-J\u00f3\u017awiak": {
-        "id": "b01d9a48",
-        "nationality": ["pl"],
-        "position": ["DF"],
-        "birth_year": 1967,
-    },
-    "Franck-Jurietti": {
-        "id": "b0b22879",
-        "nationality": ["fr"],
-        "position": ["DF"],
-        "birth_year": 1975,
-    },
-    "C\u00e9dric-Kant\u00e9": {
-        "id": "42901a47",
-        "nationality": ["ml"],
-        "position": ["DF"],
-        "birth_year": 1979,
-    },
-    "Olivier-Kapo": {
-        "id": "992c2db8",
-        "nationality": ["fr"],
-        "position": ["FW", "MF"],
-        "birth_year": 1980,
-    },
-    "Talal-El-Karkouri": {
-        "id": "a6292419",
-        "nationality": ["ma"],
-        "position": ["DF", "MF"],
-        "birth_year": 1976,
-    },
-    "Sylvain-Kastendeuch": {
-        "id": "9f670a07",
-        "nationality": ["fr"],
-        "position": ["DF"],
-        "birth_year": 1963,
-    },
-    "Ted-Kelton-Agasson": {
-        "id": "d606164a",
-        "nationality": ["fr"],
-        "position": ["FW", "MF"],
-        "birth_year": 1973,
-    },
-    "David-Klein": {
-        "id": "536e9ac3",
-        "nationality": ["fr"],
-        "position": ["GK"],
-        "birth_year": 1973,
-    },
-    "Blaise-Kouassi": {
-        "id": "752f87e3",
-        "nationality": ["ci"],
-        "position": ["DF"],
-        "birth_year": 1975,
-    },
-    "Yann-Lachuer": {
-        "id": "1eb45fa3",
-        "nationality": ["fr"],
-        "position": ["MF"],
-        "birth_year": 1972,
-    },
-    "Gr\u00e9gory-Lacombe": {
-        "id": "60dd94ab",
-        "nationality": ["fr"],
-        "position": ["MF"],
-        "birth_year": 1982,
-    },
-    "Baptiste-Lafleuriel": {
-        "id": "ebb20e00",
-        "nationality": ["fr"],
-        "position": ["MF"],
-        "birth_year": 1981,
-    },
-    "Pierre-Laigle": {
-        "id": "1f4e7f1b",
-        "nationality": ["fr"],
-        "position": ["DF", "MF"],
-        "birth_year": 1970,
-    },
-    "Bernard-Lama": {
-        "id": "980e2173",
-        "nationality": ["fr"],
-        "position": ["GK"],
-        "birth_year": 1963,
-    },
-    "Micka\u00ebl-Landreau": {
-        "id": "12bf5523",
-        "nationality": ["fr"],
-        "position": ["GK"],
-        "birth_year": 1979,
-    },
-    "Christophe-Landrin": {
-        "id": "06fdad54",
-        "nationality": ["fr"],
-        "position": ["MF"],
-        "birth_year": 1977,
-    },
-    "Didier-Lang": {
-        "id": "68140b25",
-        "nationality": ["fr"],
-        "position": ["DF", "MF"],
-        "birth_year": 1970,
-    },
-    "Lilian-Laslandes": {
-        "id": "8cdeb339",
-        "nationality": ["fr"],
-        "position": ["FW"],
-        "birth_year": 1971,
-    },
-    "Nicolas-Laspalles": {
-        "id": "0ad0383b",
-        "nationality": ["fr"],
-        "position": ["DF"],
-        "birth_year": 1971,
-    },
-    "Pierre-Laurent": {
-        "id": "908330e0",
-        "nationality": ["fr"],
-        "position": ["FW"],
-        "birth_year": 1970,
-    },
-    "Florent-Laville": {
-        "id": "49909716",
-        "nationality": ["fr"],
-        "position": ["DF"],
-        "birth_year": 1973,
-    },
-    "Ronan-Le-Crom": {
-        "id": "5d1b9f5b",
-        "nationality": ["fr"],
-        "position": ["GK"],
-        "birth_year": 1974,
-    },
-    "Christophe-Le-Roux": {
-        "id": "05e8bb12",
-        "nationality": ["fr"],
-        "position": ["MF"],
-        "birth_year": 1969,
-    },
-    "Gr\u00e9gory-Leca": {
-        "id": "7ea00ab3",
-        "nationality": ["fr"],
-        "position": ["DF", "MF"],
-        "birth_year": 1980,
-    },
-    "Sylvain-Legwinski": {
-        "id": "b6054175",
-        "nationality": ["fr"],
-        "position": ["MF"],
-        "birth_year": 1973,
-    },
-    "Philippe-L\u00e9onard": {
-        "id": "885ebb73",
-        "nationality": ["be"],
-        "position": ["DF"],
-        "birth_year": 1974,
-    },
-    "J\u00e9r\u00f4me-Leroy": {
-        "id": "a6607cb6",
-        "nationality": ["fr"],
-        "position": ["MF"],
-        "birth_year": 1974,
-    },
-    "Laurent-Leroy": {
-        "id": "a6db43e0",
-        "nationality": ["fr"],
-        "position": ["FW"],
-        "birth_year": 1976,
-    },
-    "Mehdi-Leroy": {
-        "id": "0a6b5a44",
-        "nationality": ["fr"],
-        "position": ["MF"],
-        "birth_year": 1978,
-    },
-    "Lionel-Letizi": {
-        "id": "6b7bf7e0",
-        "nationality": ["fr"],
-        "position": ["GK"],
-        "birth_year": 1973,
-    },
-    "Maksym-Levytskyi": {
-        "id": "bac0b14e",
-        "nationality": ["ua"],
-        "position": ["GK"],
-        "birth_year": 1972,
-    },
-    "Marc-Libbra": {
-        "id": "fa69e442",
-        "nationality": ["fr"],
-        "position": ["FW"],
-        "birth_year": 1972,
-    },
-    "St\u00e9phane-Li\u00e8vre": {
-        "id": "ba95ac4b",
-        "nationality": ["fr"],
-        "position": ["DF"],
-        "birth_year": 1972,
-    },
-    "David-Linar\u00e8s": {
-        "id": "088df245",
-        "nationality": ["fr"],
-        "position": ["MF"],
-        "birth_year": 1975,
-    },
-    "Danijel-Ljuboja": {
-        "id": "6352ab30",
-        "nationality": ["rs"],
-        "position": ["FW"],
-        "birth_year": 1978,
-    },
-    "Patrice-Loko": {
-        "id": "a5a06ca8",
-        "nationality": ["fr"],
-        "position": ["FW"],
-        "birth_year": 1970,
-    },
-    "Vinh-Long-Willemin": {
-        "id": "d06852de",
-        "nationality": ["fr"],
-        "position": ["DF"],
-        "birth_year": 1982,
-    },
-    "\u00c9ric-Loussouarn": {
-        "id": "12b4588c",
-        "nationality": ["fr"],
-        "position": ["GK"],
-        "birth_year": 1974,
-    },
-    "Peter-Luccin": {
-        "id": "3270f1b5",
-        "nationality": ["fr"],
-        "position": ["MF"],
-        "birth_year": 1979,
-    },
-    "Jos\u00e9-Luis-Chilavert": {
-        "id": "8b88ac0e",
-        "nationality": ["py"],
-        "position": ["GK"],
-        "birth_year": 1965,
-    },
-    "P\u00e9guy-Luyindula": {
-        "id": "cedc0a16",
-        "nationality": ["fr"],
-        "position": ["FW", "MF"],
-        "birth_year": 1979,
-    },
-    "Modeste-M'bami": {
-        "id": "82ec2963",
-        "nationality": ["cm"],
-        "position": ["MF"],
-        "birth_year": 1982,
-    },
-    "S\u00e9bastien-Mac\u00e9": {
-        "id": "b1ee0eab",
-        "nationality": ["fr"],
-        "position": ["MF"],
-        "birth_year": 1978,
-    },
-    "Micka\u00ebl-Madar": {
-        "id": "70acbad3",
-        "nationality": ["fr"],
-        "position": ["FW"],
-        "birth_year": 1968,
-    },
-    "Cyrille-Magnier": {
-        "id": "5a8bad1c",
-        "nationality": ["fr"],
-        "position": ["DF"],
-        "birth_year": 1969,
-    },
-    "Steed-Malbranque": {
-        "id": "e3df61bc",
-        "nationality": ["fr"],
-        "position": ["MF"],
-        "birth_year": 1980,
-    },
-    "Pape-Malick-Diop": {
-        "id": "419b6ed0",
-        "nationality": ["sn"],
-        "position": ["DF", "MF"],
-        "birth_year": 1974,
-    },
-    "Florent-Malouda": {
-        "id": "6fe6d820",
-        "nationality": ["fr"],
-        "position": ["FW", "MF"],
-        "birth_year": 1980,
-    },
-    "Sylvain-Marchal": {
-        "id": "149a5e41",
-        "nationality": ["fr"],
-        "position": ["DF"],
-        "birth_year": 1980,
-    },
-    "Steve-Marlet": {
-        "id": "1d248a46",
-        "nationality": ["fr"],
-        "position": ["FW", "MF"],
-        "birth_year": 1974,
-    },
-    "Jean-Christophe-Marquet": {
-        "id": "bd74055a",
-        "nationality": ["fr"],
-        "position": ["DF", "MF"],
-        "birth_year": 1974,
-    },
-    "Rafael-M\u00e1rquez": {
-        "id": "ce067ffe",
-        "nationality": ["mx"],
-        "position": ["DF", "MF"],
-        "birth_year": 1979,
-    },
-    "Micka\u00ebl-Marsiglia": {
-        "id": "de406a7b",
-        "nationality": ["fr"],
-        "position": ["MF"],
-        "birth_year": 1975,
-    },
-    "Corentin-Martins": {
-        "id": "d5341cb4",
-        "nationality": ["fr"],
-        "position": ["MF"],
-        "birth_year": 1969,
-    },
-    "Alain-Masudi": {
-        "id": "1655c4e0",
-        "nationality": ["cd"],
-        "position": ["FW", "MF"],
-        "birth_year": 1978,
-    },
-    "Lionel-Mathis": {
-        "id": "ebed1a06",
-        "nationality": ["fr"],
-        "position": ["MF"],
-        "birth_year": 1981,
-    },
-    "Franck-Matingou": {
-        "id": "8ac60c12",
-        "nationality": ["cd"],
-        "position": ["MF"],
-        "birth_year": 1979,
-    },
-    "Florian-Maurice": {
-        "id": "2e0a259f",
-        "nationality": ["fr"],
-        "position": ["FW"],
-        "birth_year": 1974,
-    },
-    "Abdoulaye-M\u00e9\u00eft\u00e9": {
-        "id": "2b548af1",
-        "nationality": ["ci"],
-        "position": ["DF"],
-        "birth_year": 1980,
-    },
-    "Nuno-Mendes": {
-        "id": "ac367328",
-        "nationality": ["pt"],
-        "position": ["DF", "MF"],
-        "birth_year": 1978,
-    },
-    "Bernard-Mendy": {
-        "id": "ea52a7a5",
-        "nationality": ["fr"],
-        "position": ["DF", "FW"],
-        "birth_year": 1981,
-    },
-    "Fr\u00e9d\u00e9ric-Mendy": {
-        "id": "acd87e30",
-        "nationality": ["fr"],
-        "position": ["DF"],
-        "birth_year": 1973,
-    },
-    "Mehdi-M\u00e9niri": {
-        "id": "ff6d2d89",
-        "nationality": ["dz"],
-        "position": ["DF"],
-        "birth_year": 1977,
-    },
-    "Sylvain-Meslien": {
-        "id": "47b1a07c",
-        "nationality": ["fr"],
-        "position": ["DF"],
-        "birth_year": 1980,
-    },
-    "Lucien-Mettomo": {
-        "id": "4d72172a",
-        "nationality": ["cm"],
-        "position": ["DF"],
-        "birth_year": 1977,
-    },
-    "Philippe-Mex\u00e8s": {
-        "id": "a5eb25eb",
-        "nationality": ["fr"],
-        "position": ["DF"],
-        "birth_year": 1982,
-    },
-    "Fr\u00e9d\u00e9ric-Meyrieu": {
-        "id": "d55220bb",
-        "nationality": ["fr"],
-        "position": ["MF"],
-        "birth_year": 1968,
-    },
-    "Rafik-Mezriche": {
-        "id": "dda0fc5e",
-        "nationality": ["dz"],
-        "position": ["MF"],
-        "birth_year": 1978,
-    },
-    "Claude-Michel": {
-        "id": "f286e691",
-        "nationality": ["fr"],
-        "position": ["MF"],
-        "birth_year": 1971,
-    },
-    "Samuel-Michel": {
-        "id": "268a9be0",
-        "nationality": ["fr"],
-        "position": ["FW"],
-        "birth_year": 1971,
-    },
-    "C\u00e9dric-Mionnet": {
-        "id": "e0839c45",
-        "nationality": ["fr"],
-        "position": ["FW"],
-        "birth_year": 1974,
-    },
-    "Viorel-Moldovan": {
-        "id": "cc1b9a50",
-        "nationality": ["ro"],
-        "position": ["FW"],
-        "birth_year": 1972,
-    },
-    "Faryd-Mondrag\u00f3n": {
-        "id": "cbd99275",
-        "nationality": ["co"],
-        "position": ["GK"],
-        "birth_year": 1971,
-    },
-    "J\u00e9r\u00f4me-Monier": {
-        "id": "27e42704",
-        "nationality": ["fr"],
-        "position": ["MF"],
-        "birth_year": 1971,
-    },
-    "Juan-Luis-Montero": {
-        "id": "054d74e0",
-        "nationality": ["fr"],
-        "position": ["DF"],
-        "birth_year": 1971,
-    },
-    "Olivier-Monterrubio": {
-        "id": "65918f95",
-        "nationality": ["fr"],
-        "position": ["MF"],
-        "birth_year": 1976,
-    },
-    "Patrick-Moreau": {
-        "id": "ee20f88b",
-        "nationality": ["fr"],
-        "position": ["DF"],
-        "birth_year": 1973,
-    },
-    "Thierry-Moreau": {
-        "id": "f7c0b480",
-        "nationality": ["fr"],
-        "position": ["MF"],
-        "birth_year": 1967,
-    },
-    "Daniel-Moreira": {
-        "id": "ac788626",
-        "nationality": ["fr"],
-        "position": ["FW"],
-        "birth_year": 1977,
-    },
-    "Tressor-Moreno": {
-        "id": "ba5c401a",
-        "nationality": ["co"],
-        "position": ["FW", "MF"],
-        "birth_year": 1979,
-    },
-    "St\u00e9phane-Morisot": {
-        "id": "44478c87",
-        "nationality": ["fr"],
-        "position": ["DF", "MF"],
-        "birth_year": 1978,
-    },
-    "C\u00e9dric-Mouret": {
-        "id": "b3dab26e",
-        "nationality": ["fr"],
-        "position": ["FW", "MF"],
-        "birth_year": 1978,
-    },
-    "Patrick-M\u00fcller": {
-        "id": "83430692",
-        "nationality": ["ch"],
-        "position": ["DF"],
-        "birth_year": 1976,
-    },
-    "Edvin-Murati": {
-        "id": "760a5806",
-        "nationality": ["al"],
-        "position": ["FW", "MF"],
-        "birth_year": 1975,
-    },
-    "Makhtar-N'Diaye": {
-        "id": "ef003b17",
-        "nationality": ["sn"],
-        "position": ["MF"],
-        "birth_year": 1981,
-    },
-    "Moussa-N'Diaye": {
-        "id": "416c89fd",
-        "nationality": ["sn"],
-        "position": ["FW", "MF"],
-        "birth_year": 1979,
-    },
-    "Sylvain-N'Diaye": {
-        "id": "fb5f3505",
-        "nationality": ["sn"],
-        "position": ["DF", "MF"],
-        "birth_year": 1976,
-    },
-    "Bruno-N'Gotty": {
-        "id": "95682207",
-        "nationality": ["fr"],
-        "position": ["DF"],
-        "birth_year": 1971,
-    },
-    "Lilian-Nalis": {
-        "id": "dfe37369",
-        "nationality": ["fr"],
-        "position": ["MF"],
-        "birth_year": 1971,
-    },
-    "Pius-Ndiefi": {
-        "id": "890205ca",
-        "nationality": ["cm"],
-        "position": ["FW"],
-        "birth_year": 1975,
-    },
-    "Fr\u00e9d\u00e9ric-N\u00e9e": {
-        "id": "cbccacd4",
-        "nationality": ["fr"],
-        "position": ["FW"],
-        "birth_year": 1975,
-    },
-    "Mamadou-Niang": {
-        "id": "5eb504fb",
-        "nationality": ["sn"],
-        "position": ["FW"],
-        "birth_year": 1979,
-    },
-    "Morten-Nielsen": {
-        "id": "dff87f76",
-        "nationality": ["dk"],
-        "position": ["DF"],
-        "birth_year": 1971,
-    },
-    "Pierre-Njanka": {
-        "id": "ece816d6",
-        "nationality": ["cm"],
-        "position": ["DF"],
-        "birth_year": 1975,
-    },
-    "Shabani-Nonda": {
-        "id": "a0d7482c",
-        "nationality": ["cd"],
-        "position": ["FW"],
-        "birth_year": 1977,
-    },
-    "St\u00e9phane-Odet": {
-        "id": "bda82ef6",
-        "nationality": ["fr"],
-        "position": ["MF"],
-        "birth_year": 1976,
-    },
-    "Jay-Jay-Okocha": {
-        "id": "66ceb871",
-        "nationality": ["ng"],
-        "position": ["MF"],
-        "birth_year": 1973,
-    },
-    "Godwin-Okpara": {
-        "id": "a6cdc5cb",
-        "nationality": ["ng"],
-        "position": ["DF"],
-        "birth_year": 1972,
-    },
-    "Salomon-Olemb\u00e9": {
-        "id": "d7ac4a47",
-        "nationality": ["cm"],
-        "position": ["MF"],
-        "birth_year": 1980,
-    },
-    "Allan-Olesen": {
-        "id": "45b3fb76",
-        "nationality": ["dk"],
-        "position": ["DF"],
-        "birth_year": 1974,
-    },
-    "Eduardo-Oliveira": {
-        "id": "1566e55b",
-        "nationality": ["fr"],
-        "position": ["DF"],
-        "birth_year": 1972,
-    },
-    "Djima-Oyawol\u00e9": {
-        "id": "b782c43d",
-        "nationality": ["tg"],
-        "position": ["FW"],
-        "birth_year": 1976,
-    },
-    "Gr\u00e9gory-Paisley": {
-        "id": "9c787be7",
-        "nationality": ["fr"],
-        "position": ["DF"],
-        "birth_year": 1977,
-    },
-    "Fabrice-Pancrate": {
-        "id": "70d29079",
-        "nationality": ["fr"],
-        "position": ["FW", "MF"],
-        "birth_year": 1980,
-    },
-    "Aleksandr-Panov": {
-        "id": "5164df6e",
-        "nationality": ["ru"],
-        "position": ["FW"],
-        "birth_year": 1975,
-    },
-    "Marcelinho-Para\u00edba": {
-        "id": "711ca65b",
-        "nationality": ["br"],
-        "position": ["FW", "MF"],
-        "birth_year": 1975,
-    },
-    "Pauleta": {
-        "id": "a484e13e",
-        "nationality": ["pt"],
-        "position": ["FW"],
-        "birth_year": 1973,
-    },
-    "Michel-Pavon": {
-        "id": "471c2c23",
-        "nationality": ["fr"],
-        "position": ["MF"],
-        "birth_year": 1968,
-    },
-    "St\u00e9phane-P\u00e9dron": {
-        "id": "2323b688",
-        "nationality": ["fr"],
-        "position": ["MF"],
-        "birth_year": 1971,
-    },
-    "Reynald-Pedros": {
-        "id": "66c139bb",
-        "nationality": ["fr"],
-        "position": ["MF"],
-        "birth_year": 1971,
-    },
-    "Nicolas-Penneteau": {
-        "id": "3870f7c3",
-        "nationality": ["fr"],
-        "position": ["GK"],
-        "birth_year": 1981,
-    },
-    "J\u00e9r\u00f4me-P\u00e9rez": {
-        "id": "27d644e8",
-        "nationality": ["fr"],
-        "position": ["DF", "MF"],
-        "birth_year": 1982,
-    },
-    "S\u00e9bastien-P\u00e9rez": {
-        "id": "934f32bf",
-        "nationality": ["fr"],
-        "position": ["DF", "MF"],
-        "birth_year": 1973,
-    },
-    "Jean-Jo\u00ebl-Perrier-Doumb\u00e9": {
-        "id": "90352958",
-        "nationality": ["cm"],
-        "position": ["DF"],
-        "birth_year": 1978,
-    },
-    "Dan-Petersen": {
-        "id": "28b82741",
-        "nationality": ["dk"],
-        "position": ["FW"],
-        "birth_year": 1972,
-    },
-    "Vladimir-Petrovi\u0107": {
-        "id": "381b0491",
-        "nationality": ["hr"],
-        "position": ["FW"],
-        "birth_year": 1972,
-    },
-    "Laurent-Peyrelade": {
-        "id": "d702eb91",
-        "nationality": ["fr"],
-        "position": ["FW"],
-        "birth_year": 1970,
-    },
-    "St\u00e9phane-Pichot": {
-        "id": "37dd8343",
-        "nationality": ["fr"],
-        "position": ["DF"],
-        "birth_year": 1976,
-    },
-    "Pascal-Pierre": {
-        "id": "e8969ad0",
-        "nationality": ["fr"],
-        "position": ["DF"],
-        "birth_year": 1968,
-    },
-    "Jos\u00e9-Karl-Pierre-Fanfan": {
-        "id": "f6cfc003",
-        "nationality": ["mq"],
-        "position": ["DF"],
-        "birth_year": 1975,
-    },
-    "Christophe-Pignol": {
-        "id": "121a7286",
-        "nationality": ["fr"],
-        "position": ["DF"],
-        "birth_year": 1969,
-    },
-    "S\u00e9bastien-Piocelle": {
-        "id": "58aea39f",
-        "nationality": ["fr"],
-        "position": ["MF"],
-        "birth_year": 1978,
-    },
-    "Micka\u00ebl-Pontal": {
-        "id": "864e422e",
-        "nationality": ["fr"],
-        "position": ["DF"],
-        "birth_year": 1980,
-    },
-    "St\u00e9phane-Porato": {
-        "id": "ead5f446",
-        "nationality": ["fr"],
-        "position": ["GK"],
-        "birth_year": 1973,
-    },
-    "Lionel-Potillon": {
-        "id": "be54ffd6",
-        "nationality": ["fr"],
-        "position": ["DF"],
-        "birth_year": 1974,
-    },
-    "Cyrille-Pouget": {
-        "id": "f0724b1b",
-        "nationality": ["fr"],
-        "position": ["FW"],
-        "birth_year": 1972,
-    },
-    "Gr\u00e9gory-Proment": {
-        "id": "c665d49f",
-        "nationality": ["fr"],
-        "position": ["MF"],
-        "birth_year": 1978,
-    },
-    "Dado-Pr\u0161o": {
-        "id": "4c2e1ea0",
-        "nationality": ["hr"],
-        "position": ["FW"],
-        "birth_year": 1974,
-    },
-    "William-Prunier": {
-        "id": "9d9864d4",
-        "nationality": ["fr"],
-        "position": ["DF"],
-        "birth_year": 1967,
-    },
-    "Mathieu-Puig": {
-        "id": "c8a52781",
-        "nationality": ["fr"],
-        "position": ["DF", "MF"],
-        "birth_year": 1978,
-    },
-    "Franck-Queudrue": {
-        "id": "4b7d3170",
-        "nationality": ["fr"],
-        "position": ["DF"],
-        "birth_year": 1978,
-    },
-    "Olivier-Quint": {
-        "id": "839104a1",
-        "nationality": ["fr"],
-        "position": ["MF"],
-        "birth_year": 1971,
-    },
-    "\u00c9ric-Rab\u00e9sandratana": {
-        "id": "009799bf",
-        "nationality": ["mg"],
-        "position": ["DF", "MF"],
-        "birth_year": 1972,
-    },
-    "Johan-Radet": {
-        "id": "a8b14a04",
-        "nationality": ["fr"],
-        "position": ["DF"],
-        "birth_year": 1976,
-    },
-    "Florin-R\u0103ducioiu": {
-        "id": "6b78b463",
-        "nationality": ["ro"],
-        "position": ["FW"],
-        "birth_year": 1970,
-    },
-    "Ulrich-Ram\u00e9": {
-        "id": "3a95880b",
-        "nationality": ["fr"],
-        "position": ["GK"],
-        "birth_year": 1972,
-    },
-    "Tahina-Randria": {"id": "27179d1c", "nationality": ["mg"], "birth_year": 1980},
-    "David-Regis": {
-        "id": "df6c9232",
-        "nationality": ["us"],
-        "position": ["DF"],
-        "birth_year": 1968,
-    },
-    "Patrick-Regnault": {
-        "id": "476a4f51",
-        "nationality": ["fr"],
-        "position": ["GK"],
-        "birth_year": 1974,
-    },
-    "Hoalid-Regragui": {
-        "id": "654026a1",
-        "nationality": ["ma"],
-        "position": ["DF", "MF"],
-        "birth_year": 1975,
-    },
-    "Jacques-R\u00e9my": {
-        "id": "7681231d",
-        "nationality": ["fr"],
-        "position": ["FW"],
-        "birth_year": 1972,
-    },
-    "Pascal-Renier": {
-        "id": "9e00fefc",
-        "nationality": ["be"],
-        "position": ["DF"],
-        "birth_year": 1971,
-    },
-    "Christophe-Revault": {
-        "id": "62732adc",
-        "nationality": ["fr"],
-        "position": ["GK"],
-        "birth_year": 1972,
-    },
-    "Anthony-R\u00e9veill\u00e8re": {
-        "id": "8ad24039",
-        "nationality": ["fr"],
-        "position": ["DF"],
-        "birth_year": 1979,
-    },
-    "Pedro-Reyes": {
-        "id": "7c36b3ff",
-        "nationality": ["cl"],
-        "position": ["DF"],
-        "birth_year": 1972,
-    },
-    "Fr\u00e9d\u00e9ric-Ribeiro": {"id": "cdca04b6", "birth_year": 1979},
-    "Teddy-Richert": {
-        "id": "18b03203",
-        "nationality": ["fr"],
-        "position": ["GK"],
-        "birth_year": 1974,
-    },
-    "Laurent-Robert": {
-        "id": "2f907a4b",
-        "nationality": ["fr"],
-        "position": ["FW", "MF"],
-        "birth_year": 1975,
-    },
-    "Alain-Roche": {
-        "id": "dd4e9eed",
-        "nationality": ["fr"],
-        "position": ["DF"],
-        "birth_year": 1967,
-    },
-    "St\u00e9phane-Roda": {
-        "id": "dc078a3f",
-        "nationality": ["fr"],
-        "position": ["FW", "MF"],
-        "birth_year": 1973,
-    },
-    "Bruno-Rodriguez": {
-        "id": "81def070",
-        "nationality": ["fr"],
-        "position": ["FW"],
-        "birth_year": 1972,
-    },
-    "Julien-Rodriguez": {
-        "id": "700165a8",
-        "nationality": ["fr"],
-        "position": ["DF"],
-        "birth_year": 1978,
-    },
-    "Sebasti\u00e1n-Romero": {
-        "id": "031ce2ef",
-        "nationality": ["ar"],
-        "position": ["FW", "MF"],
-        "birth_year": 1978,
-    },
-    "Cyril-Rool": {
-        "id": "2cb527ad",
-        "nationality": ["fr"],
-        "position": ["DF", "MF"],
-        "birth_year": 1975,
-    },
-    "J\u00e9r\u00f4me-Rothen": {
-        "id": "5ad9d2bc",
-        "nationality": ["fr"],
-        "position": ["MF"],
-        "birth_year": 1978,
-    },
-    "Jean-Christophe-Rouvi\u00e8re": {
-        "id": "b6456881",
-        "nationality": ["fr"],
-        "position": ["MF"],
-        "birth_year": 1974,
-    },
-    "Goran-Rubil": {
-        "id": "575f630b",
-        "nationality": ["hr"],
-        "position": ["DF", "MF"],
-        "birth_year": 1981,
-    },
-    "Julien-Sabl\u00e9": {
-        "id": "3eec50d0",
-        "nationality": ["fr"],
-        "position": ["MF"],
-        "birth_year": 1980,
-    },
-    "Nicolas-Sachy": {
-        "id": "05c1cae3",
-        "nationality": ["fr"],
-        "position": ["GK"],
-        "birth_year": 1967,
-    },
-    "Moussa-Sa\u00efb": {
-        "id": "5f923d76",
-        "nationality": ["dz"],
-        "position": ["MF"],
-        "birth_year": 1969,
-    },
-    "Rafik-Sa\u00effi": {
-        "id": "684177cc",
-        "nationality": ["dz"],
-        "position": ["FW", "MF"],
-        "birth_year": 1975,
-    },
-    "Lamine-Sakho": {
-        "id": "5d65dcf4",
-        "nationality": ["sn"],
-        "position": ["FW", "MF"],
-        "birth_year": 1977,
-    },
-    "Christophe-Sanchez": {
-        "id": "0df22343",
-        "nationality": ["fr"],
-        "position": ["FW"],
-        "birth_year": 1972,
-    },
-    "Didier-Santini": {
-        "id": "c6125f63",
-        "nationality": ["fr"],
-        "position": ["DF"],
-        "birth_year": 1968,
-    },
-    "Pape-Sarr": {
-        "id": "7be00da6",
-        "nationality": ["sn"],
-        "position": ["MF"],
-        "birth_year": 1977,
-    },
-    "Luis-Satorra": {
-        "id": "74a929c3",
-        "nationality": ["fr"],
-        "position": ["DF"],
-        "birth_year": 1969,
-    },
-    "Ni\u0161a-Savelji\u0107": {
-        "id": "02afae9d",
-        "nationality": ["rs"],
-        "position": ["DF"],
-        "birth_year": 1970,
-    },
-    "Nicolas-Savinaud": {
-        "id": "eba6e66a",
-        "nationality": ["fr"],
-        "position": ["DF", "MF"],
-        "birth_year": 1975,
-    },
-    "Lucas-Severino": {
-        "id": "f69f7286",
-        "nationality": ["br"],
-        "position": ["FW"],
-        "birth_year": 1979,
-    },
-    "Antoine-Sibierski": {
-        "id": "22936ff2",
-        "nationality": ["fr"],
-        "position": ["FW", "MF"],
-        "birth_year": 1974,
-    },
-    "\u00c9ric-Sikora": {
-        "id": "be5e9066",
-        "nationality": ["fr"],
-        "position": ["DF"],
-        "birth_year": 1968,
-    },
-    "M\u00e1rio-Silva": {
-        "id": "f5f7fa5f",
-        "nationality": ["pt"],
-        "position": ["DF"],
-        "birth_year": 1977,
-    },
-    "Marco-Simone": {
-        "id": "31ba7b19",
-        "nationality": ["it"],
-        "position": ["FW", "MF"],
-        "birth_year": 1969,
-    },
-    "Serhiy-Skachenko": {
-        "id": "6150ecb1",
-        "nationality": ["ua"],
-        "position": ["FW"],
-        "birth_year": 1972,
-    },
-    "Alen-\u0160koro": {
-        "id": "cd7fbe4f",
-        "nationality": ["ba"],
-        "position": ["FW"],
-        "birth_year": 1981,
-    },
-    "Alexey-Smertin": {
-        "id": "006d419b",
-        "nationality": ["ru"],
-        "position": ["MF"],
-        "birth_year": 1975,
-    },
-    "David-Sommeil": {
-        "id": "f4c68930",
-        "nationality": ["gp"],
-        "position": ["DF"],
-        "birth_year": 1974,
-    },
-    "Oussama-Souaidy": {
-        "id": "ebee1414",
-        "nationality": ["ma"],
-        "position": ["MF"],
-        "birth_year": 1981,
-    },
-    "Morlaye-Soumah": {
-        "id": "56cb9c67",
-        "nationality": ["gn"],
-        "position": ["DF"],
-        "birth_year": 1971,
-    },
-    "Ousmane-Soumah": {
-        "id": "df8ea778",
-        "nationality": ["fr"],
-        "position": ["FW"],
-        "birth_year": 1973,
-    },
-    "Gr\u00e9goire-Spiewak": {"id": "2b094c2d", "birth_year": 1980},
-    "Mile-Sterjovski": {
-        "id": "48bbaea2",
-        "nationality": ["au"],
-        "position": ["FW", "MF"],
-        "birth_year": 1979,
-    },
-    "Piotr-\u015awierczewski": {
-        "id": "77946472",
-        "nationality": ["pl"],
-        "position": ["MF"],
-        "birth_year": 1972,
-    },
-    "J\u00e9r\u00f4me-Tagherset": {"id": "fa38b713", "birth_year": 1980},
-    "Teemu-Tainio": {
-        "id": "9b6b6b04",
-        "nationality": ["fi"],
-        "position": ["MF"],
-        "birth_year": 1979,
-    },
-    "Abdelhafid-Tasfaout": {
-        "id": "eea23db3",
-        "nationality": ["dz"],
-        "position": ["FW", "MF"],
-        "birth_year": 1969,
-    },
-    "\u00c9douard-Thomas": {
-        "id": "fcd029af",
-        "nationality": ["fr"],
-        "position": ["DF"],
-        "birth_year": 1971,
-    },
-    "Bj\u00f8rn-Tore-Kvarme": {
-        "id": "07965324",
-        "nationality": ["no"],
-        "position": ["DF"],
-        "birth_year": 1972,
-    },
-    "Alioune-Tour\u00e9": {
-        "id": "ec2dc195",
-        "nationality": ["fr"],
-        "position": ["FW", "MF"],
-        "birth_year": 1978,
-    },
-    "Carl-Tourenne": {
-        "id": "0d38513e",
-        "nationality": ["fr"],
-        "position": ["MF"],
-        "birth_year": 1972,
-    },
-    "Geoffray-Toyes": {
-        "id": "48d5d83e",
-        "nationality": ["fr"],
-        "position": ["DF"],
-        "birth_year": 1973,
-    },
-    "St\u00e9phane-Tr\u00e9visan": {
-        "id": "594a6ad1",
-        "nationality": ["fr"],
-        "position": ["GK"],
-        "birth_year": 1974,
-    },
-    "C\u00e9dric-Uras": {
-        "id": "aa08ba58",
-        "nationality": ["fr"],
-        "position": ["DF"],
-        "birth_year": 1977,
-    },
-    "Marama-Vahirua": {
-        "id": "a7c98968",
-        "nationality": ["pf"],
-        "position": ["FW", "MF"],
-        "birth_year": 1980,
-    },
-    "Tony-Vairelles": {
-        "id": "18a2396a",
-        "nationality": ["fr"],
-        "position": ["DF", "FW"],
-        "birth_year": 1973,
-    },
-    "Patrick-Val\u00e9ry": {
-        "id": "3efe9a77",
-        "nationality": ["fr"],
-        "position": ["DF"],
-        "birth_year": 1969,
-    },
-    "Jean-Louis-Valois": {
-        "id": "c1905b04",
-        "nationality": ["fr"],
-        "position": ["MF"],
-        "birth_year": 1973,
-    },
-    "Gunter-Van-Handenhoven": {
-        "id": "af18f197",
-        "nationality": ["be"],
-        "position": ["FW", "MF"],
-        "birth_year": 1978,
-    },
-    "David-Vandenbossche": {
-        "id": "91c5f9ef",
-        "nationality": ["fr"],
-        "position": ["FW", "MF"],
-        "birth_year": 1980,
-    },
-    "V\u00e2nder": {
-        "id": "dfe4b986",
-        "nationality": ["br"],
-        "position": ["MF"],
-        "birth_year": 1974,
-    },
-    "Matthieu-Verschu\u00e8re": {
-        "id": "2094c092",
-        "nationality": ["fr"],
-        "position": ["MF"],
-        "birth_year": 1972,
-    },
-    "Philippe-Violeau": {
-        "id": "fba5d09e",
-        "nationality": ["fr"],
-        "position": ["MF"],
-        "birth_year": 1970,
-    },
-    "Jean-Guy-Wallemme": {
-        "id": "350b5e6c",
-        "nationality": ["fr"],
-        "position": ["DF"],
-        "birth_year": 1967,
-    },
-    "Guillaume-Warmuz": {
-        "id": "47033c3f",
-        "nationality": ["fr"],
-        "position": ["GK"],
-        "birth_year": 1970,
-    },
-    "Marc-Wilmots": {
-        "id": "4d08c800",
-        "nationality": ["be"],
-        "position": ["FW", "MF"],
-        "birth_year": 1969,
-    },
-    "Gr\u00e9gory-Wimb\u00e9e": {
-        "id": "c6e3ff84",
-        "nationality": ["fr"],
-        "position": ["GK"],
-        "birth_year": 1971,
-    },
-    "Igor-Yanovsky": {
-        "id": "080cb122",
-        "nationality": ["ru"],
-        "position": ["DF"],
-        "birth_year": 1974,
-    },
-    "Yannick-Zambernardi": {
-        "id": "124d4c15",
-        "nationality": ["fr"],
-        "position": ["DF"],
-        "birth_year": 1977,
-    },
-    "Luciano-Zavagno": {
-        "id": "e7ada559",
-        "nationality": ["ar"],
-        "position": ["DF"],
-        "birth_year": 1977,
-    },
-    "St\u00e9phane-Ziani": {
-        "id": "e5e2f44f",
-        "nationality": ["fr"],
-        "position": ["MF"],
-        "birth_year": 1971,
-    },
-    "Sla\u0111an-\u0110uki\u0107": {
-        "id": "31970bce",
-        "nationality": ["rs"],
-        "position": ["FW", "MF"],
-        "birth_year": 1966,
-    },
-    "Paxten-Aaronson": {
-        "id": "4cd41883",
-        "nationality": ["us"],
-        "position": ["FW", "MF"],
-        "birth_year": 2003,
-    },
-    "Lalas-Abubakar": {
-        "id": "4a67f05b",
-        "nationality": ["gh"],
-        "position": ["DF"],
-        "birth_year": 1994,
-    },
-    "Nicol\u00e1s-Acevedo": {
-        "id": "6140be7b",
-        "nationality": ["uy"],
-        "position": ["MF", "DF"],
-        "birth_year": 1999,
-    },
-    "Ifunanyachi-Achara": {
-        "id": "d31bf83e",
-        "nationality": ["us"],
-        "position": ["FW", "MF"],
-        "birth_year": 1997,
-    },
-    "Bryan-Acosta": {
-        "id": "c5f400f4",
-        "nationality": ["hn"],
-        "position": ["MF"],
-        "birth_year": 1993,
-    },
-    "George-Acosta": {
-        "id": "409d5b26",
-        "nationality": ["us"],
-        "position": ["MF"],
-        "birth_year": 2000,
-    },
-    "Kellyn-Acosta": {
-        "id": "ece10cfe",
-        "nationality": ["us"],
-        "position": ["MF", "DF"],
-        "birth_year": 1995,
-    },
-    "Luciano-Acosta": {
-        "id": "363ba6d7",
-        "nationality": ["ar"],
-        "position": ["MF"],
-        "birth_year": 1994,
-    },
-    "Mo-Adams": {
-        "id": "00362ef7",
-        "nationality": ["eng"],
-        "position": ["MF"],
-        "birth_year": 1996,
-    },
-    "Samuel-Adeniran": {
-        "id": "86429529",
-        "nationality": ["us"],
-        "position": ["FW"],
-        "birth_year": 1998,
-    },
-    "Harrison-Afful": {
-        "id": "7d8ede09",
-        "nationality": ["gh"],
-        "position": ["DF"],
-        "birth_year": 1986,
-    },
-    "Samuel-Afriyie-Owusu": {
-        "id": "ea0af15a",
-        "nationality": ["gh"],
-        "position": ["DF", "MF"],
-        "birth_year": 2000,
-    },
-    "William-Agada": {
-        "id": "d2275b1b",
-        "nationality": ["ng"],
-        "position": ["FW"],
-        "birth_year": 1999,
-    },
-    "Oskar-\u00c5gren": {
-        "id": "5ad77e97",
-        "nationality": ["se"],
-        "position": ["DF"],
-        "birth_year": 1998,
-    },
-    "Daniel-Aguirre": {
-        "id": "ecc5063f",
-        "nationality": ["us"],
-        "position": ["MF", "DF"],
-        "birth_year": 1999,
-    },
-    "Ali-Ahmed": {
-        "id": "540a5be1",
-        "nationality": ["ca"],
-        "position": ["DF"],
-        "birth_year": 2000,
-    },
-    "Arnaud-Ake": {
-        "id": "3402bb17",
-        "nationality": ["ci"],
-        "position": ["FW", "MF"],
-        "birth_year": 1998,
-    },
-    "Tesho-Akindele": {
-        "id": "897304e5",
-        "nationality": ["ca"],
-        "position": ["FW"],
-        "birth_year": 1992,
-    },
-    "Matai-Akinmboni": {
-        "id": "cfed08d5",
-        "nationality": ["us"],
-        "position": ["DF"],
-        "birth_year": 2006,
-    },
-    "Ayo-Akinola": {
-        "id": "214d2406",
-        "nationality": ["ca"],
-        "position": ["FW"],
-        "birth_year": 2000,
-    },
-    "Jordy-Alcivar": {
-        "id": "6e98c19f",
-        "nationality": ["ec"],
-        "position": ["MF"],
-        "birth_year": 1999,
-    },
-    "Caio-Alexandre": {
-        "id": "08ac23b7",
-        "nationality": ["br"],
-        "position": ["MF", "DF"],
-        "birth_year": 1999,
-    },
-    "Tony-Alfaro": {
-        "id": "4118b12a",
-        "nationality": ["us"],
-        "position": ["DF"],
-        "birth_year": 1993,
-    },
-    "Noah-Allen": {
-        "id": "043f389a",
-        "nationality": ["us"],
-        "position": ["DF", "MF"],
-        "birth_year": 2004,
-    },
-    "Thiago-Almada": {
-        "id": "27f33438",
-        "nationality": ["ar"],
-        "position": ["MF", "FW"],
-        "birth_year": 2001,
-    },
-    "Osvaldo-Alonso": {
-        "id": "8449bfda",
-        "nationality": ["cu"],
-        "position": ["MF"],
-        "birth_year": 1985,
-    },
-    "Jozy-Altidore": {
-        "id": "8db8ad1e",
-        "nationality": ["us"],
-        "position": ["FW", "MF"],
-        "birth_year": 1989,
-    },
-    "Efrain-Alvarez": {
-        "id": "3cd08ab7",
-        "nationality": ["mx"],
-        "position": ["MF", "FW"],
-        "birth_year": 2002,
-    },
-    "Luis-Amarilla": {
-        "id": "fa66adb6",
-        "nationality": ["py"],
-        "position": ["FW"],
-        "birth_year": 1995,
-    },
-    "Frankie-Amaya": {
-        "id": "2e8bd00c",
-        "nationality": ["us"],
-        "position": ["MF"],
-        "birth_year": 2000,
-    },
-    "Mikey-Ambrose": {
-        "id": "f649d6aa",
-        "nationality": ["us"],
-        "position": ["DF"],
-        "birth_year": 1993,
-    },
-    "Malte-Amundsen": {
-        "id": "83b6e15d",
-        "nationality": ["dk"],
-        "position": ["DF"],
-        "birth_year": 1998,
-    },
-    "Max-Anchor": {
-        "id": "d6aa8848",
-        "nationality": ["ca"],
-        "position": ["GK"],
-        "birth_year": 2004,
-    },
-    "Sebastian-Anderson": {
-        "id": "3a9911ce",
-        "nationality": ["us"],
-        "position": ["DF", "MF"],
-        "birth_year": 2002,
-    },
-    "Jos\u00e9-Andr\u00e9s-Mart\u00ednez": {
-        "id": "c8364e8e",
-        "nationality": ["ve"],
-        "position": ["MF"],
-        "birth_year": 1994,
-    },
-    "Iv\u00e1n-Angulo": {
-        "id": "55a5d959",
-        "nationality": ["co"],
-        "position": ["FW"],
-        "birth_year": 1999,
-    },
-    "Jalil-Anibaba": {
-        "id": "e44593b0",
-        "nationality": ["us"],
-        "position": ["DF"],
-        "birth_year": 1988,
-    },
-    "Themi-Antonoglou": {
-        "id": "b137ee51",
-        "nationality": ["ca"],
-        "position": ["DF"],
-        "birth_year": 2001,
-    },
-    "Brian-Anunga": {
-        "id": "17b28ec7",
-        "nationality": ["cm"],
-        "position": ["MF"],
-        "birth_year": 1996,
-    },
-    "Cristian-Arango": {
-        "id": "fea9401e",
-        "nationality": ["co"],
-        "position": ["FW"],
-        "birth_year": 1995,
-    },
-    "C\u00e9sar-Araujo": {
-        "id": "3ed214ff",
-        "nationality": ["uy"],
-        "position": ["MF"],
-        "birth_year": 2001,
-    },
-    "Julian-Araujo": {
-        "id": "8f4541c2",
-        "nationality": ["mx"],
-        "position": ["DF"],
-        "birth_year": 2001,
-    },
-    "Luiz-Ara\u00fajo": {
-        "id": "fa18c72e",
-        "nationality": ["br"],
-        "position": ["FW", "MF"],
-        "birth_year": 1996,
-    },
-    "Daniel-Armando-R\u00edos": {
-        "id": "078b2c07",
-        "nationality": ["mx"],
-        "position": ["FW"],
-        "birth_year": 1995,
-    },
-    "Adam-Armour": {
-        "id": "546c2c25",
-        "nationality": ["us"],
-        "position": ["MF"],
-        "birth_year": 2002,
-    },
-    "Xavier-Arreaga": {
-        "id": "7f2b7640",
-        "nationality": ["ec"],
-        "position": ["DF"],
-        "birth_year": 1994,
-    },
-    "Kervin-Arriaga": {
-        "id": "4f8a9f70",
-        "nationality": ["hn"],
-        "position": ["MF"],
-        "birth_year": 1998,
-    },
-    "Paul-Arriola": {
-        "id": "1bb2acce",
-        "nationality": ["us"],
-        "position": ["FW"],
-        "birth_year": 1995,
-    },
-    "Artur": {
-        "id": "ea6803c7",
-        "nationality": ["br"],
-        "position": ["MF"],
-        "birth_year": 1996,
-    },
-    "Dairon-Asprilla": {
-        "id": "218d336c",
-        "nationality": ["co"],
-        "position": ["FW", "MF"],
-        "birth_year": 1992,
-    },
-    "Isaac-Atanga": {
-        "id": "ff0f2a53",
-        "nationality": ["gh"],
-        "position": ["DF"],
-        "birth_year": 2000,
-    },
-    "Joshua-Atencio": {
-        "id": "1f084637",
-        "nationality": ["us"],
-        "position": ["MF"],
-        "birth_year": 2002,
-    },
-    "Roberto-Avila": {
-        "id": "bb666b57",
-        "nationality": ["us"],
-        "position": ["FW", "MF"],
-        "birth_year": 2000,
-    },
-    "David-Ayala": {
-        "id": "06dafc0e",
-        "nationality": ["ar"],
-        "position": ["MF"],
-        "birth_year": 2002,
-    },
-    "Edison-Azcona": {
-        "id": "05f54837",
-        "nationality": ["do"],
-        "position": ["MF"],
-        "birth_year": 2003,
-    },
-    "Dominique-Badji": {
-        "id": "758ac389",
-        "nationality": ["sn"],
-        "position": ["FW"],
-        "birth_year": 1992,
-    },
-    "Zico-Bailey": {
-        "id": "aa9e1161",
-        "nationality": ["us"],
-        "position": ["DF", "MF"],
-        "birth_year": 2000,
-    },
-    "Corey-Baird": {
-        "id": "2d0d1442",
-        "nationality": ["us"],
-        "position": ["FW"],
-        "birth_year": 1996,
-    },
-    "Esmir-Bajraktarevic": {"id": "dff24174", "position": ["MF", "FW"]},
-    "Reed-Baker-Whiting": {
-        "id": "816d7aec",
-        "nationality": ["us"],
-        "position": ["MF"],
-        "birth_year": 2005,
-    },
-    "Michael-Baldisimo": {
-        "id": "894b41c5",
-        "nationality": ["ca"],
-        "position": ["MF"],
-        "birth_year": 2000,
-    },
-    "Gareth-Bale": {
-        "id": "a58bb1e1",
-        "nationality": ["wls"],
-        "position": ["FW"],
-        "birth_year": 1989,
-    },
-    "Tom-Barlow": {
-        "id": "da4821de",
-        "nationality": ["us"],
-        "position": ["FW"],
-        "birth_year": 1995,
-    },
-    "\u00c1lvaro-Barreal": {
-        "id": "ffca53e1",
-        "nationality": ["ar"],
-        "position": ["DF", "MF"],
-        "birth_year": 2000,
-    },
-    "Michael-Barrios": {
-        "id": "df782c79",
-        "nationality": ["co"],
-        "position": ["FW", "MF"],
-        "birth_year": 1991,
-    },
-    "Ethan-Bartlow": {
-        "id": "552898bd",
-        "nationality": ["us"],
-        "position": ["DF", "MF"],
-        "birth_year": 2000,
-    },
-    "Zorhan-Bassong": {
-        "id": "6297d826",
-        "nationality": ["ca"],
-        "position": ["DF"],
-        "birth_year": 1999,
-    },
-    "Tanner-Beason": {
-        "id": "3f1b018e",
-        "nationality": ["us"],
-        "position": ["DF"],
-        "birth_year": 1997,
-    },
-    "Simon-Becher": {
-        "id": "bc921182",
-        "nationality": ["us"],
-        "position": ["FW"],
-        "birth_year": 1999,
-    },
-    "Alejandro-Bedoya": {
-        "id": "9a6f8dfd",
-        "nationality": ["us"],
-        "position": ["MF"],
-        "birth_year": 1987,
-    },
-    "Steven-Beitashour": {
-        "id": "64f1680a",
-        "nationality": ["ir"],
-        "position": ["DF", "MF"],
-        "birth_year": 1987,
-    },
-    "Jon-Bell": {
-        "id": "658a3134",
-        "nationality": ["us"],
-        "position": ["DF"],
-        "birth_year": 1997,
-    },
-    "Ben-Bender": {
-        "id": "bc307884",
-        "nationality": ["us"],
-        "position": ["MF"],
-        "birth_year": 2001,
-    },
-    "Alan-Ben\u00edtez": {
-        "id": "5c7c798b",
-        "nationality": ["py"],
-        "position": ["DF"],
-        "birth_year": 1994,
-    },
-    "Julio-Benitez": {
-        "id": "625ed11d",
-        "nationality": ["us"],
-        "position": ["MF"],
-        "birth_year": 2005,
-    },
-    "Christian-Benteke": {
-        "id": "ab070c55",
-        "nationality": ["be"],
-        "position": ["FW"],
-        "birth_year": 1990,
-    },
-    "Sebastian-Berhalter": {
-        "id": "f33ee427",
-        "nationality": ["us"],
-        "position": ["MF"],
-        "birth_year": 2001,
-    },
-    "Federico-Bernardeschi": {
-        "id": "ee93c1a9",
-        "nationality": ["it"],
-        "position": ["FW"],
-        "birth_year": 1994,
-    },
-    "Miguel-Berry": {
-        "id": "a5532e80",
-        "nationality": ["es"],
-        "position": ["FW"],
-        "birth_year": 1997,
-    },
-    "Matt-Bersano": {
-        "id": "9110da2b",
-        "nationality": ["us"],
-        "position": ["GK"],
-        "birth_year": 1992,
-    },
-    "Nick-Besler": {
-        "id": "cc9fa1a8",
-        "nationality": ["us"],
-        "position": ["MF", "DF"],
-        "birth_year": 1993,
-    },
-    "Victor-Bezerra": {
-        "id": "cbfb6ca5",
-        "nationality": ["us"],
-        "position": ["FW", "DF"],
-        "birth_year": 2000,
-    },
-    "David-Bingham": {
-        "id": "7fd42a85",
-        "nationality": ["us"],
-        "position": ["GK"],
-        "birth_year": 1989,
-    },
-    "Steve-Birnbaum": {
-        "id": "26637ac8",
-        "nationality": ["us"],
-        "position": ["DF"],
-        "birth_year": 1991,
-    },
-    "Tyler-Blackett": {
-        "id": "a68a5466",
-        "nationality": ["eng"],
-        "position": ["DF"],
-        "birth_year": 1994,
-    },
-    "Tristan-Blackmon": {
-        "id": "7f35d14e",
-        "nationality": ["us"],
-        "position": ["DF"],
-        "birth_year": 1996,
-    },
-    "Andre-Blake": {
-        "id": "b3b21a11",
-        "nationality": ["jm"],
-        "position": ["GK"],
-        "birth_year": 1990,
-    },
-    "Sebasti\u00e1n-Blanco": {
-        "id": "4ddd0834",
-        "nationality": ["ar"],
-        "position": ["FW", "MF"],
-        "birth_year": 1988,
-    },
-    "Latif-Blessing": {
-        "id": "5153d32e",
-        "nationality": ["gh"],
-        "position": ["MF", "FW"],
-        "birth_year": 1996,
-    },
-    "Emmanuel-Boateng": {
-        "id": "efad6707",
-        "nationality": ["gh"],
-        "position": ["MF"],
-        "birth_year": 1997,
-    },
-    "Blake-Bodily": {
-        "id": "612a0951",
-        "nationality": ["us"],
-        "position": ["FW", "DF"],
-        "birth_year": 1998,
-    },
-    "Isaac-Boehmer": {
-        "id": "9792574e",
-        "nationality": ["us"],
-        "position": ["GK"],
-        "birth_year": 2001,
-    },
-    "Jonathan-Bond": {
-        "id": "c3a86eea",
-        "nationality": ["eng"],
-        "position": ["GK"],
-        "birth_year": 1993,
-    },
-    "Pablo-Bonilla": {
-        "id": "da23cdc3",
-        "nationality": ["ve"],
-        "position": ["DF"],
-        "birth_year": 1999,
-    },
-    "Alex-Bono": {
-        "id": "aa28a396",
-        "nationality": ["us"],
-        "position": ["GK"],
-        "birth_year": 1994,
-    },
-    "Jonathan-Bornstein": {
-        "id": "79a6c95f",
-        "nationality": ["us"],
-        "position": ["DF", "MF"],
-        "birth_year": 1984,
-    },
-    "Dylan-Borrero": {
-        "id": "a72d14de",
-        "nationality": ["co"],
-        "position": ["FW"],
-        "birth_year": 2002,
-    },
-    "Gustavo-Bou": {
-        "id": "3dfcc735",
-        "nationality": ["ar"],
-        "position": ["FW"],
-        "birth_year": 1990,
-    },
-    "Denis-Bouanga": {
-        "id": "0b0cbe5b",
-        "nationality": ["ga"],
-        "position": ["FW"],
-        "birth_year": 1994,
-    },
-    "Ousseni-Bouda": {
-        "id": "0672f944",
-        "nationality": ["bf"],
-        "position": ["FW", "MF"],
-        "birth_year": 2000,
-    },
-    "Michael-Boxall": {
-        "id": "6bfa0d3a",
-        "nationality": ["nz"],
-        "position": ["DF"],
-        "birth_year": 1988,
-    },
-    "Michael-Bradley": {
-        "id": "fd5e3a73",
-        "nationality": ["us"],
-        "position": ["MF"],
-        "birth_year": 1987,
-    },
-    "Christopher-Brady": {
-        "id": "a71768a2",
-        "nationality": ["us"],
-        "position": ["GK"],
-        "birth_year": 2004,
-    },
-    "Zachary-Brault-Guillard": {
-        "id": "948a58c2",
-        "nationality": ["ca"],
-        "position": ["DF"],
-        "birth_year": 1998,
-    },
-    "Claudio-Bravo": {
-        "id": "5619c5e8",
-        "nationality": ["ar"],
-        "position": ["DF"],
-        "birth_year": 1997,
-    },
-    "Brenner": {
-        "id": "279508bf",
-        "nationality": ["br"],
-        "position": ["FW"],
-        "birth_year": 2000,
-    },
-    "Sebastian-Breza": {
-        "id": "52e7f812",
-        "nationality": ["ca"],
-        "position": ["GK"],
-        "birth_year": 1998,
-    },
-    "Emiliano-Brienza": {
-        "id": "b54cf257",
-        "nationality": ["ca"],
-        "position": ["FW"],
-        "birth_year": 2002,
-    },
-    "Andrew-Brody": {
-        "id": "33e46323",
-        "nationality": ["us"],
-        "position": ["DF"],
-        "birth_year": 1995,
-    },
-    "Brandt-Bronico": {
-        "id": "bd4460b1",
-        "nationality": ["us"],
-        "position": ["MF"],
-        "birth_year": 1995,
-    },
-    "Javain-Brown": {
-        "id": "3d14c62e",
-        "nationality": ["jm"],
-        "position": ["DF"],
-        "birth_year": 1999,
-    },
-    "Gast\u00f3n-Brugman": {
-        "id": "e947ee4a",
-        "nationality": ["uy"],
-        "position": ["MF"],
-        "birth_year": 1992,
-    },
-    "Will-Bruin": {
-        "id": "87a6ac29",
-        "nationality": ["us"],
-        "position": ["FW"],
-        "birth_year": 1989,
-    },
-    "Noel-Buck": {
-        "id": "3d47c1ad",
-        "nationality": ["us"],
-        "position": ["MF", "FW"],
-        "birth_year": 2005,
-    },
-    "Adam-Buksa": {
-        "id": "3b676989",
-        "nationality": ["pl"],
-        "position": ["FW"],
-        "birth_year": 1996,
-    },
-    "Teal-Bunbury": {
-        "id": "3077fce8",
-        "nationality": ["us"],
-        "position": ["FW", "MF"],
-        "birth_year": 1990,
-    },
-    "Cory-Burke": {
-        "id": "39fde61c",
-        "nationality": ["jm"],
-        "position": ["FW"],
-        "birth_year": 1991,
-    },
-    "Kendall-Burks": {
-        "id": "38e88892",
-        "nationality": ["us"],
-        "position": ["DF"],
-        "birth_year": 1999,
-    },
-    "Handwalla-Bwana": {
-        "id": "b56080ee",
-        "nationality": ["so"],
-        "position": ["FW"],
-        "birth_year": 1997,
-    },
-    "Brandon-Bye": {
-        "id": "9fcd12af",
-        "nationality": ["us"],
-        "position": ["DF"],
-        "birth_year": 1995,
-    },
-    "Nathan-Byrne": {
-        "id": "c4041fbc",
-        "nationality": ["eng"],
-        "position": ["DF"],
-        "birth_year": 1992,
-    },
-    "Kevin-Cabral": {
-        "id": "42af215b",
-        "nationality": ["fr"],
-        "position": ["FW", "MF"],
-        "birth_year": 1999,
-    },
-    "Mart\u00edn-C\u00e1ceres": {
-        "id": "e94d79e3",
-        "nationality": ["uy"],
-        "position": ["DF"],
-        "birth_year": 1987,
-    },
-    "Deiber-Caicedo": {
-        "id": "9bfa2f52",
-        "nationality": ["co"],
-        "position": ["FW", "MF"],
-        "birth_year": 2000,
-    },
-    "Scott-Caldwell": {
-        "id": "4a54592d",
-        "nationality": ["us"],
-        "position": ["MF"],
-        "birth_year": 1991,
-    },
-    "Drake-Callender": {
-        "id": "c4d9567d",
-        "nationality": ["us"],
-        "position": ["GK"],
-        "birth_year": 1997,
-    },
-    "Alexander-Callens": {
-        "id": "af34f10d",
-        "nationality": ["pe"],
-        "position": ["DF"],
-        "birth_year": 1992,
-    },
-    "Francisco-Calvo": {
-        "id": "706bd23f",
-        "nationality": ["cr"],
-        "position": ["DF"],
-        "birth_year": 1992,
-    },
-    "Rudy-Camacho": {
-        "id": "6ad16d47",
-        "nationality": ["fr"],
-        "position": ["DF"],
-        "birth_year": 1991,
-    },
-    "Geoff-Cameron": {
-        "id": "1a160ea3",
-        "nationality": ["us"],
-        "position": ["DF"],
-        "birth_year": 1985,
-    },
-    "Leonardo-Campana": {
-        "id": "bf9c0749",
-        "nationality": ["ec"],
-        "position": ["FW"],
-        "birth_year": 2000,
-    },
-    "George-Campbell": {
-        "id": "45e1a597",
-        "nationality": ["us"],
-        "position": ["DF"],
-        "birth_year": 2001,
-    },
-    "Russell-Canouse": {
-        "id": "ec730d9a",
-        "nationality": ["us"],
-        "position": ["MF"],
-        "birth_year": 1995,
-    },
-    "Nathan-Cardoso": {
-        "id": "d4438745",
-        "nationality": ["br"],
-        "position": ["DF"],
-        "birth_year": 1995,
-    },
-    "Antonio-Carlos": {
-        "id": "949fe1e8",
-        "nationality": ["br"],
-        "position": ["DF"],
-        "birth_year": 1993,
-    },
-    "Wikelman-Carmona": {
-        "id": "cab97dd2",
-        "nationality": ["ve"],
-        "position": ["MF", "FW"],
-        "birth_year": 2003,
-    },
-    "Juli\u00e1n-Carranza": {
-        "id": "3e9ae1db",
-        "nationality": ["ar"],
-        "position": ["FW"],
-        "birth_year": 2000,
-    },
-    "Adalberto-Carrasquilla": {
-        "id": "f087912d",
-        "nationality": ["pa"],
-        "position": ["MF"],
-        "birth_year": 1998,
-    },
-    "Wilder-Cartagena": {
-        "id": "9f0f5d15",
-        "nationality": ["pe"],
-        "position": ["MF"],
-        "birth_year": 1994,
-    },
-    "Javier-Casas": {
-        "id": "2ed8d81b",
-        "nationality": ["us"],
-        "position": ["MF"],
-        "birth_year": 2003,
-    },
-    "Julio-Cascante": {
-        "id": "cc120b4f",
-        "nationality": ["cr"],
-        "position": ["DF"],
-        "birth_year": 1993,
-    },
-    "Cristian-C\u00e1sseres-Jr.": {
-        "id": "f86fe8c1",
-        "nationality": ["ve"],
-        "position": ["MF"],
-        "birth_year": 2000,
-    },
-    "Valent\u00edn-Castellanos": {
-        "id": "da76bab4",
-        "nationality": ["ar"],
-        "position": ["FW"],
-        "birth_year": 1998,
-    },
-    "Lucas-Cavallini": {
-        "id": "dd8de641",
-        "nationality": ["ca"],
-        "position": ["FW"],
-        "birth_year": 1992,
-    },
-    "Roman-Celentano": {
-        "id": "42ba8628",
-        "nationality": ["us"],
-        "position": ["GK"],
-        "birth_year": 2000,
-    },
-    "Darwin-Cer\u00e9n": {
-        "id": "a58de3f0",
-        "nationality": ["sv"],
-        "position": ["MF"],
-        "birth_year": 1989,
-    },
-    "Edwin-Cerrillo": {
-        "id": "bd060315",
-        "nationality": ["us"],
-        "position": ["MF"],
-        "birth_year": 2000,
-    },
-    "Maikel-Chang": {
-        "id": "04cc9edd",
-        "nationality": ["cu"],
-        "position": ["MF", "FW"],
-        "birth_year": 1991,
-    },
-    "Maxime-Chanot": {
-        "id": "ca366055",
-        "nationality": ["lu"],
-        "position": ["DF"],
-        "birth_year": 1989,
-    },
-    "Diego-Char\u00e1": {
-        "id": "6260cc9d",
-        "nationality": ["co"],
-        "position": ["MF"],
-        "birth_year": 1986,
-    },
-    "Yimmi-Char\u00e1": {
-        "id": "9df9baab",
-        "nationality": ["co"],
-        "position": ["MF", "FW"],
-        "birth_year": 1991,
-    },
-    "Giorgio-Chiellini": {
-        "id": "e85fb9b8",
-        "nationality": ["it"],
-        "position": ["DF"],
-        "birth_year": 1984,
-    },
-    "Mathieu-Choiniere": {
-        "id": "017459bb",
-        "nationality": ["ca"],
-        "position": ["DF", "MF"],
-        "birth_year": 1999,
-    },
-    "L\u00e9o-Ch\u00fa": {
-        "id": "d88ebbe9",
-        "nationality": ["br"],
-        "position": ["FW", "MF"],
-        "birth_year": 2000,
-    },
-    "Kadin-Chung": {
-        "id": "d616ce40",
-        "nationality": ["ca"],
-        "position": ["DF"],
-        "birth_year": 1998,
-    },
-    "Jos\u00e9-Cifuentes": {
-        "id": "8c8c07a7",
-        "nationality": ["ec"],
-        "position": ["MF"],
-        "birth_year": 1999,
-    },
-    "Ronaldo-Cisneros": {
-        "id": "e526c193",
-        "nationality": ["mx"],
-        "position": ["FW"],
-        "birth_year": 1997,
-    },
-    "Abdoulaye-Cissoko": {
-        "id": "52a6ef30",
-        "nationality": ["fr"],
-        "position": ["DF"],
-        "birth_year": 1999,
-    },
-    "Caden-Clark": {
-        "id": "6e327d0d",
-        "nationality": ["us"],
-        "position": ["FW", "MF"],
-        "birth_year": 2003,
-    },
-    "Steve-Clark": {
-        "id": "ed6320b7",
-        "nationality": ["us"],
-        "position": ["GK"],
-        "birth_year": 1986,
-    },
-    "Stefan-Cleveland": {
-        "id": "873fdbdf",
-        "nationality": ["us"],
-        "position": ["GK"],
-        "birth_year": 1994,
-    },
-    "Jackson-Conway": {
-        "id": "1cfa6e1a",
-        "nationality": ["us"],
-        "position": ["FW", "MF"],
-        "birth_year": 2001,
-    },
-    "Gabriele-Corbo": {
-        "id": "091795f2",
-        "nationality": ["it"],
-        "position": ["DF"],
-        "birth_year": 2000,
-    },
-    "Sergio-C\u00f3rdova": {
-        "id": "229cd98a",
-        "nationality": ["ve"],
-        "position": ["FW", "MF"],
-        "birth_year": 1997,
-    },
-    "Carlos-Coronel": {
-        "id": "5c07e176",
-        "nationality": ["br"],
-        "position": ["GK"],
-        "birth_year": 1996,
-    },
-    "Washington-Corozo": {
-        "id": "1391217a",
-        "nationality": ["ec"],
-        "position": ["MF", "FW"],
-        "birth_year": 1998,
-    },
-    "Guzm\u00e1n-Corujo": {
-        "id": "5c6051ad",
-        "nationality": ["uy"],
-        "position": ["DF"],
-        "birth_year": 1996,
-    },
-    "Douglas-Costa": {
-        "id": "4fa7cb9b",
-        "nationality": ["br"],
-        "position": ["MF", "FW"],
-        "birth_year": 1990,
-    },
-    "S\u00e9ga-Coulibaly": {
-        "id": "dab9537e",
-        "nationality": ["fr"],
-        "position": ["DF"],
-        "birth_year": 1996,
-    },
-    "Cade-Cowell": {
-        "id": "f8e95f87",
-        "nationality": ["us"],
-        "position": ["FW", "MF"],
-        "birth_year": 2003,
-    },
-    "Brandan-Craig": {
-        "id": "4d0f7cb3",
-        "nationality": ["us"],
-        "position": ["MF"],
-        "birth_year": 2004,
-    },
-    "Maxime-Cr\u00e9peau": {
-        "id": "ea42e480",
-        "nationality": ["ca"],
-        "position": ["GK"],
-        "birth_year": 1994,
-    },
-    "Domenico-Criscito": {
-        "id": "35dd6d80",
-        "nationality": ["it"],
-        "position": ["DF"],
-        "birth_year": 1986,
-    },
-    "Daniel-Crisostomo": {
-        "id": "33fdd2aa",
-        "nationality": ["us"],
-        "position": ["MF"],
-        "birth_year": 1997,
-    },
-    "Cody-Cropper": {
-        "id": "aa133046",
-        "nationality": ["us"],
-        "position": ["GK"],
-        "birth_year": 1993,
-    },
-    "Allan-Cruz": {
-        "id": "030105a5",
-        "nationality": ["cr"],
-        "position": ["MF"],
-        "birth_year": 1996,
-    },
-    "Andr\u00e9s-Cubas": {
-        "id": "9b40a6ea",
-        "nationality": ["py"],
-        "position": ["MF"],
-        "birth_year": 1996,
-    },
-    "Cucho": {
-        "id": "71b47ab9",
-        "nationality": ["co"],
-        "position": ["FW"],
-        "birth_year": 1999,
-    },
-    "Rafael-Czichos": {
-        "id": "b0a0698b",
-        "nationality": ["de"],
-        "position": ["DF"],
-        "birth_year": 1990,
-    },
-    "Cristi\u00e1n-Dajome": {
-        "id": "a065e877",
-        "nationality": ["co"],
-        "position": ["DF", "MF"],
-        "birth_year": 1994,
-    },
-    "Jes\u00fas-Daniel-Bueno": {
-        "id": "b5687b08",
-        "nationality": ["ve"],
-        "position": ["MF"],
-        "birth_year": 1999,
-    },
-    "Abu-Danladi": {
-        "id": "507383d1",
-        "nationality": ["gh"],
-        "position": ["FW", "MF"],
-        "birth_year": 1995,
-    },
-    "Bode-Davis": {
-        "id": "891f8b82",
-        "nationality": ["us"],
-        "position": ["MF", "FW"],
-        "birth_year": 2002,
-    },
-    "Jake-Davis": {
-        "id": "79d3a503",
-        "nationality": ["us"],
-        "position": ["MF", "FW"],
-        "birth_year": 2002,
-    },
-    "Sean-Davis": {
-        "id": "cb75cac9",
-        "nationality": ["us"],
-        "position": ["MF"],
-        "birth_year": 1993,
-    },
-    "Milo\u0161-Degenek": {
-        "id": "c8e65157",
-        "nationality": ["au"],
-        "position": ["DF"],
-        "birth_year": 1994,
-    },
-    "Alex-DeJohn": {
-        "id": "2a6c024c",
-        "nationality": ["us"],
-        "position": ["DF"],
-        "birth_year": 1991,
-    },
-    "A.J.-DeLaGarza": {
-        "id": "171b3c37",
-        "nationality": ["gu"],
-        "position": ["DF", "MF"],
-        "birth_year": 1987,
-    },
-    "Marky-Delgado": {
-        "id": "7f6a25b7",
-        "nationality": ["us"],
-        "position": ["MF"],
-        "birth_year": 1995,
-    },
-    "Nick-DePuy": {
-        "id": "ba7b4e67",
-        "nationality": ["us"],
-        "position": ["DF"],
-        "birth_year": 1994,
-    },
-    "Silvester-van-der-Water": {
-        "id": "5d83500d",
-        "nationality": ["nl"],
-        "position": ["FW"],
-        "birth_year": 1996,
-    },
-    "Joey-DeZart": {
-        "id": "9d7142a6",
-        "nationality": ["us"],
-        "position": ["DF"],
-        "birth_year": 1998,
-    },
-    "Luis-D\u00edaz": {
-        "id": "1c9838aa",
-        "nationality": ["cr"],
-        "position": ["FW"],
-        "birth_year": 1998,
-    },
-    "Bakaye-Dibassy": {
-        "id": "247accfd",
-        "nationality": ["ml"],
-        "position": ["DF"],
-        "birth_year": 1989,
-    },
-    "Cl\u00e9ment-Diop": {
-        "id": "0d5c0218",
-        "nationality": ["sn"],
-        "position": ["GK"],
-        "birth_year": 1993,
-    },
-    "Sofiane-Djeffal": {
-        "id": "29d85f83",
-        "nationality": ["fr"],
-        "position": ["MF"],
-        "birth_year": 1999,
-    },
-    "Moussa-Djitte": {
-        "id": "627b570a",
-        "nationality": ["sn"],
-        "position": ["FW"],
-        "birth_year": 1999,
-    },
-    "Ethan-Dobbelaere": {
-        "id": "1e772b7c",
-        "nationality": ["us"],
-        "position": ["DF", "MF"],
-        "birth_year": 2002,
-    },
-    "Cecilio-Dom\u00ednguez": {
-        "id": "3162d667",
-        "nationality": ["py"],
-        "position": ["FW", "MF"],
-        "birth_year": 1994,
-    },
-    "Christopher-Donovan": {
-        "id": "8f995d10",
-        "nationality": ["us"],
-        "position": ["FW"],
-        "birth_year": 2000,
-    },
-    "Griffin-Dorsey": {
-        "id": "c182ca04",
-        "nationality": ["us"],
-        "position": ["DF"],
-        "birth_year": 1999,
-    },
-    "Hassani-Dotson": {
-        "id": "8f2af1ed",
-        "nationality": ["us"],
-        "position": ["DF", "MF"],
-        "birth_year": 1997,
-    },
-    "Sebasti\u00e1n-Driussi": {
-        "id": "60e86875",
-        "nationality": ["ar"],
-        "position": ["MF"],
-        "birth_year": 1996,
-    },
-    "Bryce-Duke": {
-        "id": "59557625",
-        "nationality": ["us"],
-        "position": ["MF", "FW"],
-        "birth_year": 2001,
-    },
-    "Cameron-Duke": {
-        "id": "c679d9fd",
-        "nationality": ["us"],
-        "position": ["MF", "FW"],
-        "birth_year": 2001,
-    },
-    "Kyle-Duncan": {
-        "id": "575e6cb1",
-        "nationality": ["us"],
-        "position": ["DF", "MF"],
-        "birth_year": 1997,
-    },
-    "Jhon-Dur\u00e1n": {
-        "id": "414184f7",
-        "nationality": ["co"],
-        "position": ["FW"],
-        "birth_year": 2003,
-    },
-    "Chris-Durkin": {
-        "id": "0ffd4373",
-        "nationality": ["us"],
-        "position": ["MF"],
-        "birth_year": 2000,
-    },
-    "Dom-Dwyer": {
-        "id": "bdfc15f8",
-        "nationality": ["us"],
-        "position": ["FW"],
-        "birth_year": 1990,
-    },
-    "Jeremy-Ebobisse": {
-        "id": "5fa7b2ec",
-        "nationality": ["us"],
-        "position": ["FW"],
-        "birth_year": 1997,
-    },
-    "Daniel-Edelman": {
-        "id": "a8de0bd5",
-        "nationality": ["us"],
-        "position": ["MF"],
-        "birth_year": 2003,
-    },
-    "Javier-Eduardo-L\u00f3pez": {
-        "id": "f851b52f",
-        "nationality": ["mx"],
-        "position": ["MF", "FW"],
-        "birth_year": 1994,
-    },
-    "Earl-Edwards-Jr.": {
-        "id": "10f6f942",
-        "nationality": ["us"],
-        "position": ["GK"],
-        "birth_year": 1992,
-    },
-    "Raheem-Edwards": {
-        "id": "b828d56a",
-        "nationality": ["ca"],
-        "position": ["DF"],
-        "birth_year": 1995,
-    },
-    "Tom-Edwards": {
-        "id": "1b780599",
-        "nationality": ["eng"],
-        "position": ["DF"],
-        "birth_year": 1999,
-    },
-    "Jack-Elliott": {
-        "id": "041deebd",
-        "nationality": ["eng"],
-        "position": ["DF"],
-        "birth_year": 1995,
-    },
-    "Kalil-ElMedkhar": {
-        "id": "272c1aaf",
-        "nationality": ["us"],
-        "position": ["FW", "MF"],
-        "birth_year": 1999,
-    },
-    "Franco-Escobar": {
-        "id": "54f33d0e",
-        "nationality": ["ar"],
-        "position": ["DF"],
-        "birth_year": 1995,
-    },
-    "Adam-Esparza": {
-        "id": "ca135560",
-        "nationality": ["us"],
-        "position": ["MF"],
-        "birth_year": 2002,
-    },
-    "Cristian-Espinoza": {
-        "id": "9c794a80",
-        "nationality": ["ar"],
-        "position": ["FW", "MF"],
-        "birth_year": 1995,
-    },
-    "Jhon-Espinoza": {
-        "id": "79666d5a",
-        "nationality": ["ec"],
-        "position": ["DF", "FW"],
-        "birth_year": 1999,
-    },
-    "Roger-Espinoza": {
-        "id": "60b7c195",
-        "nationality": ["hn"],
-        "position": ["MF"],
-        "birth_year": 1986,
-    },
-    "Lucas-Esteves": {
-        "id": "c6ec0258",
-        "nationality": ["br"],
-        "position": ["DF", "MF"],
-        "birth_year": 2000,
-    },
-    "Michael-Estrada": {
-        "id": "773f5f12",
-        "nationality": ["ec"],
-        "position": ["FW"],
-        "birth_year": 1996,
-    },
-    "Derrick-Etienne": {
-        "id": "59059f1e",
-        "nationality": ["ht"],
-        "position": ["FW", "DF"],
-        "birth_year": 1996,
-    },
-    "Diego-Fag\u00fandez": {
-        "id": "fe81682e",
-        "nationality": ["uy"],
-        "position": ["FW"],
-        "birth_year": 1995,
-    },
-    "Mamadou-Fall": {
-        "id": "805a2a11",
-        "nationality": ["sn"],
-        "position": ["DF"],
-        "birth_year": 2002,
-    },
-    "Marco-Farfan": {
-        "id": "cfc68595",
-        "nationality": ["us"],
-        "position": ["DF"],
-        "birth_year": 1998,
-    },
-    "Andrew-Farrell": {
-        "id": "71eda165",
-        "nationality": ["us"],
-        "position": ["DF"],
-        "birth_year": 1992,
-    },
-    "Mohamed-Farsi": {
-        "id": "81039302",
-        "nationality": ["ca"],
-        "position": ["DF", "FW"],
-        "birth_year": 1999,
-    },
-    "Felipe": {
-        "id": "2415bd0a",
-        "nationality": ["br"],
-        "position": ["FW"],
-        "birth_year": 2000,
-    },
-    "Thiago-Fernandes": {
-        "id": "e3550df1",
-        "nationality": ["br"],
-        "position": ["FW", "MF"],
-        "birth_year": 2001,
-    },
-    "Omir-Fernandez": {
-        "id": "622986f0",
-        "nationality": ["us"],
-        "position": ["MF", "FW"],
-        "birth_year": 1999,
-    },
-    "Jes\u00fas-Ferreira": {
-        "id": "f61246d8",
-        "nationality": ["us"],
-        "position": ["FW", "MF"],
-        "birth_year": 2000,
-    },
-    "Sebasti\u00e1n-Ferreira": {
-        "id": "5439dba0",
-        "nationality": ["py"],
-        "position": ["FW"],
-        "birth_year": 1998,
-    },
-    "Stuart-Findlay": {
-        "id": "edffe99a",
-        "nationality": ["sct"],
-        "position": ["DF"],
-        "birth_year": 1995,
-    },
-    "Ethan-Finlay": {
-        "id": "c16a59af",
-        "nationality": ["us"],
-        "position": ["FW"],
-        "birth_year": 1990,
-    },
-    "Oniel-Fisher": {
-        "id": "ed5fdca6",
-        "nationality": ["jm"],
-        "position": ["DF"],
-        "birth_year": 1991,
-    },
-    "Leon-Flach": {
-        "id": "39859fa1",
-        "nationality": ["us"],
-        "position": ["MF"],
-        "birth_year": 2001,
-    },
-    "Ashley-Fletcher": {
-        "id": "eeb6551f",
-        "nationality": ["eng"],
-        "position": ["FW"],
-        "birth_year": 1995,
-    },
-    "Kristian-Fletcher": {
-        "id": "67d3d023",
-        "nationality": ["us"],
-        "position": ["FW"],
-        "birth_year": 2005,
-    },
-    "Edison-Flores": {
-        "id": "ef2c82f8",
-        "nationality": ["pe"],
-        "position": ["MF"],
-        "birth_year": 1994,
-    },
-    "George-Fochive": {
-        "id": "f99000bb",
-        "nationality": ["us"],
-        "position": ["MF"],
-        "birth_year": 1992,
-    },
-    "Nathan-Foga\u00e7a": {
-        "id": "aad135a3",
-        "nationality": ["br"],
-        "position": ["FW"],
-        "birth_year": 1999,
-    },
-    "Andreu-Font\u00e0s": {
-        "id": "0f138d5a",
-        "nationality": ["es"],
-        "position": ["DF"],
-        "birth_year": 1989,
-    },
-    "Kortne-Ford": {
-        "id": "552a7707",
-        "nationality": ["us"],
-        "position": ["DF"],
-        "birth_year": 1996,
-    },
-    "Taxiarchis-Fountas": {
-        "id": "2ce71308",
-        "nationality": ["gr"],
-        "position": ["MF", "FW"],
-        "birth_year": 1995,
-    },
-    "Franco-Fragapane": {
-        "id": "09538c47",
-        "nationality": ["ar"],
-        "position": ["FW"],
-        "birth_year": 1993,
-    },
-    "Alan-Franco": {
-        "id": "c76b161b",
-        "nationality": ["ec"],
-        "position": ["MF"],
-        "birth_year": 1998,
-    },
-    "Kobe-Franklin": {
-        "id": "407325c4",
-        "nationality": ["ca"],
-        "position": ["DF"],
-        "birth_year": 2003,
-    },
-    "Stefan-Frei": {
-        "id": "1d0a0f3e",
-        "nationality": ["ch"],
-        "position": ["GK"],
-        "birth_year": 1986,
-    },
-    "Christian-Fuchs": {
-        "id": "a67a09fb",
-        "nationality": ["at"],
-        "position": ["DF"],
-        "birth_year": 1986,
-    },
-    "Ruben-Gabrielsen": {
-        "id": "9e64fc85",
-        "nationality": ["no"],
-        "position": ["DF"],
-        "birth_year": 1992,
-    },
-    "Ray-Gaddis": {
-        "id": "8348b24d",
-        "nationality": ["us"],
-        "position": ["DF"],
-        "birth_year": 1990,
-    },
-    "McKinze-Gaines": {
-        "id": "8ef72983",
-        "nationality": ["us"],
-        "position": ["MF", "FW"],
-        "birth_year": 1998,
-    },
-    "Jon-Gallagher": {
-        "id": "9d5afdfb",
-        "nationality": ["ie"],
-        "position": ["DF"],
-        "birth_year": 1996,
-    },
-    "Pedro-Gallese": {
-        "id": "b76e1394",
-        "nationality": ["pe"],
-        "position": ["GK"],
-        "birth_year": 1990,
-    },
-    "Christopher-Garcia": {
-        "id": "f6390a6b",
-        "nationality": ["us"],
-        "position": ["MF", "FW"],
-        "birth_year": 2003,
-    },
-    "Mender-Garc\u00eda": {
-        "id": "2375dd75",
-        "nationality": ["co"],
-        "position": ["FW"],
-        "birth_year": 1998,
-    },
-    "Chase-Gasper": {
-        "id": "7371ec36",
-        "nationality": ["us"],
-        "position": ["DF"],
-        "birth_year": 1996,
-    },
-    "Ryan-Gauld": {
-        "id": "862e93c2",
-        "nationality": ["sct"],
-        "position": ["MF", "FW"],
-        "birth_year": 1995,
-    },
-    "D\u00e1niel-Gazdag": {
-        "id": "527d0e31",
-        "nationality": ["hu"],
-        "position": ["MF"],
-        "birth_year": 1996,
-    },
-    "Kieran-Gibbs": {
-        "id": "46ee5234",
-        "nationality": ["eng"],
-        "position": ["DF"],
-        "birth_year": 1989,
-    },
-    "Carles-Gil": {
-        "id": "11c30a46",
-        "nationality": ["es"],
-        "position": ["MF"],
-        "birth_year": 1992,
-    },
-    "Nacho-Gil": {
-        "id": "87ec1a2a",
-        "nationality": ["es"],
-        "position": ["FW", "MF"],
-        "birth_year": 1995,
-    },
-    "Gast\u00f3n-Gim\u00e9nez": {
-        "id": "ab66cc31",
-        "nationality": ["py"],
-        "position": ["MF"],
-        "birth_year": 1991,
-    },
-    "Francisco-Ginella": {
-        "id": "5a28a782",
-        "nationality": ["uy"],
-        "position": ["MF"],
-        "birth_year": 1999,
-    },
-    "Nicholas-Gioacchini": {
-        "id": "79ab7593",
-        "nationality": ["us"],
-        "position": ["FW", "MF"],
-        "birth_year": 2000,
-    },
-    "Justen-Glad": {
-        "id": "5b768b0f",
-        "nationality": ["us"],
-        "position": ["DF"],
-        "birth_year": 1997,
-    },
-    "Jakob-Glesnes": {
-        "id": "ac65aef3",
-        "nationality": ["no"],
-        "position": ["DF"],
-        "birth_year": 1994,
-    },
-    "Chris-Gloster": {
-        "id": "01cd3c12",
-        "nationality": ["us"],
-        "position": ["DF"],
-        "birth_year": 2000,
-    },
-    "Marcus-Godinho": {
-        "id": "27854bf6",
-        "nationality": ["ca"],
-        "position": ["DF"],
-        "birth_year": 1997,
-    },
-    "An\u00edbal-Godoy": {
-        "id": "2d496ca3",
-        "nationality": ["pa"],
-        "position": ["MF"],
-        "birth_year": 1990,
-    },
-    "Erik-Godoy": {
-        "id": "e8b80334",
-        "nationality": ["ar"],
-        "position": ["DF"],
-        "birth_year": 1993,
-    },
-    "Eul\u00e2nio-\u00c2ngelo-Chipela-Gomes": {
-        "id": "d9b9b71a",
-        "nationality": ["gw"],
-        "position": ["DF"],
-        "birth_year": 1994,
-    },
-    "Yeimar-G\u00f3mez-Andrade": {
-        "id": "e43c8d72",
-        "nationality": ["co"],
-        "position": ["DF"],
-        "birth_year": 1992,
-    },
-    "Jonathan-Gonz\u00e1lez": {
-        "id": "a8785279",
-        "nationality": ["mx"],
-        "position": ["MF", "FW"],
-        "birth_year": 1999,
-    },
-    "Omar-Gonzalez": {
-        "id": "0d2fe665",
-        "nationality": ["us"],
-        "position": ["DF"],
-        "birth_year": 1988,
-    },
-    "Samuel-Grandsir": {
-        "id": "d2448564",
-        "nationality": ["fr"],
-        "position": ["FW", "MF"],
-        "birth_year": 1996,
-    },
-    "Tayvon-Gray": {
-        "id": "c839e1b2",
-        "nationality": ["us"],
-        "position": ["DF"],
-        "birth_year": 2002,
-    },
-    "Gregore": {
-        "id": "49815f34",
-        "nationality": ["br"],
-        "position": ["MF"],
-        "birth_year": 1994,
-    },
-    "J\u00e1n-Gregu\u0161": {
-        "id": "7d974435",
-        "nationality": ["sk"],
-        "position": ["MF"],
-        "birth_year": 1991,
-    },
-    "Julian-Gressel": {
-        "id": "acd47bc0",
-        "nationality": ["de"],
-        "position": ["MF", "DF"],
-        "birth_year": 1993,
-    },
-    "Ra\u00fal-Gudi\u00f1o": {
-        "id": "2f061b36",
-        "nationality": ["mx"],
-        "position": ["GK"],
-        "birth_year": 1996,
-    },
-    "Sami-Guediri": {
-        "id": "e3dc71a7",
-        "nationality": ["us"],
-        "position": ["DF"],
-        "birth_year": 1997,
-    },
-    "Brian-Guti\u00e9rrez": {
-        "id": "d88f31db",
-        "nationality": ["us"],
-        "position": ["FW", "MF"],
-        "birth_year": 2003,
-    },
-    "Cristi\u00e1n-Guti\u00e9rrez": {
-        "id": "6e56a4f2",
-        "nationality": ["cl"],
-        "position": ["DF"],
-        "birth_year": 1997,
-    },
-    "Diego-Gutierrez": {
-        "id": "4903a306",
-        "nationality": ["us"],
-        "position": ["FW"],
-        "birth_year": 1999,
-    },
-    "Felipe-Guti\u00e9rrez": {
-        "id": "80ae314a",
-        "nationality": ["cl"],
-        "position": ["MF"],
-        "birth_year": 1990,
-    },
-    "Andrew-Gutman": {
-        "id": "b7a23251",
-        "nationality": ["us"],
-        "position": ["DF"],
-        "birth_year": 1996,
-    },
-    "Brad-Guzan": {
-        "id": "d899e3bf",
-        "nationality": ["us"],
-        "position": ["GK"],
-        "birth_year": 1984,
-    },
-    "Justin-Haak": {
-        "id": "c644e140",
-        "nationality": ["us"],
-        "position": ["MF", "DF"],
-        "birth_year": 2001,
-    },
-    "Luke-Haakenson": {
-        "id": "77d28e45",
-        "nationality": ["us"],
-        "position": ["MF", "FW"],
-        "birth_year": 1997,
-    },
-    "Teenage-Hadebe": {
-        "id": "582952f2",
-        "nationality": ["zw"],
-        "position": ["DF"],
-        "birth_year": 1995,
-    },
-    "Nick-Hagglund": {
-        "id": "39632554",
-        "nationality": ["us"],
-        "position": ["DF"],
-        "birth_year": 1992,
-    },
-    "Marlon-Hairston": {
-        "id": "1d531c57",
-        "nationality": ["us"],
-        "position": ["DF"],
-        "birth_year": 1994,
-    },
-    "Siad-Haji": {
-        "id": "9212f1cb",
-        "nationality": ["so"],
-        "position": ["DF", "FW"],
-        "birth_year": 1999,
-    },
-    "Michael-Halliday": {
-        "id": "6ad5f50e",
-        "nationality": ["us"],
-        "position": ["DF", "MF"],
-        "birth_year": 2003,
-    },
-    "Ahmed-Hamdi": {
-        "id": "fc7c8d3d",
-        "nationality": ["eg"],
-        "position": ["MF"],
-        "birth_year": 1998,
-    },
-    "Bill-Hamid": {
-        "id": "012fc030",
-        "nationality": ["us"],
-        "position": ["GK"],
-        "birth_year": 1990,
-    },
-    "Niko-Hansen": {
-        "id": "9bebd450",
-        "nationality": ["dk"],
-        "position": ["FW", "MF"],
-        "birth_year": 1994,
-    },
-    "Cameron-Harper": {
-        "id": "4a78c769",
-        "nationality": ["us"],
-        "position": ["DF", "FW"],
-        "birth_year": 2001,
-    },
-    "Nathan-Harriel": {
-        "id": "b3edbeff",
-        "nationality": ["us"],
-        "position": ["DF"],
-        "birth_year": 2001,
-    },
-    "Calvin-Harris": {
-        "id": "07b0aeef",
-        "nationality": ["eng"],
-        "position": ["DF", "FW"],
-        "birth_year": 2000,
-    },
-    "Thomas-Hasal": {
-        "id": "86bac87b",
-        "nationality": ["ca"],
-        "position": ["GK"],
-        "birth_year": 1999,
-    },
-    "Jacori-Hayes": {
-        "id": "d2173b7b",
-        "nationality": ["us"],
-        "position": ["MF"],
-        "birth_year": 1995,
-    },
-    "H\u00e9ber": {
-        "id": "d552c4a1",
-        "nationality": ["br"],
-        "position": ["FW"],
-        "birth_year": 1991,
-    },
-    "Matt-Hedges": {
-        "id": "5e2a4d0e",
-        "nationality": ["us"],
-        "position": ["DF"],
-        "birth_year": 1990,
-    },
-    "Chris-Hegardt": {
-        "id": "99a6142d",
-        "nationality": ["us"],
-        "position": ["MF", "FW"],
-        "birth_year": 2002,
-    },
-    "Doneil-Henry": {
-        "id": "22636117",
-        "nationality": ["ca"],
-        "position": ["DF"],
-        "birth_year": 1993,
-    },
-    "Fabian-Herbers": {
-        "id": "5cbf5ccd",
-        "nationality": ["de"],
-        "position": ["FW", "MF"],
-        "birth_year": 1993,
-    },
-    "Felipe-Hernandez": {
-        "id": "31a4d0b8",
-        "nationality": ["us"],
-        "position": ["MF"],
-        "birth_year": 1998,
-    },
-    "Javier-Hern\u00e1ndez": {
-        "id": "189cee7b",
-        "nationality": ["mx"],
-        "position": ["FW"],
-        "birth_year": 1988,
-    },
-    "Ronald-Hern\u00e1ndez": {
-        "id": "de907bab",
-        "nationality": ["ve"],
-        "position": ["DF"],
-        "birth_year": 1997,
-    },
-    "Aaron-Herrera": {
-        "id": "d86e3070",
-        "nationality": ["us"],
-        "position": ["DF"],
-        "birth_year": 1997,
-    },
-    "H\u00e9ctor-Herrera": {
-        "id": "a8542814",
-        "nationality": ["mx"],
-        "position": ["MF"],
-        "birth_year": 1990,
-    },
-    "Gonzalo-Higua\u00edn": {
-        "id": "8a08491a",
-        "nationality": ["ar"],
-        "position": ["FW"],
-        "birth_year": 1987,
-    },
-    "Brendan-Hines-Ike": {
-        "id": "b807c1dc",
-        "nationality": ["us"],
-        "position": ["DF"],
-        "birth_year": 1994,
-    },
-    "Bongokuhle-Hlongwane": {
-        "id": "de9952b5",
-        "nationality": ["za"],
-        "position": ["FW"],
-        "birth_year": 2000,
-    },
-    "Danny-Hoesen": {
-        "id": "5ef1939b",
-        "nationality": ["nl"],
-        "position": ["FW"],
-        "birth_year": 1991,
-    },
-    "Ryan-Hollingshead": {
-        "id": "28b58797",
-        "nationality": ["us"],
-        "position": ["DF"],
-        "birth_year": 1991,
-    },
-    "Erik-Holt": {
-        "id": "3677d047",
-        "nationality": ["us"],
-        "position": ["DF"],
-        "birth_year": 1996,
-    },
-    "Jackson-Hopkins": {
-        "id": "8344adf5",
-        "nationality": ["us"],
-        "position": ["MF", "FW"],
-        "birth_year": 2004,
-    },
-    "Adrien-Hunou": {
-        "id": "d14229f3",
-        "nationality": ["fr"],
-        "position": ["FW", "MF"],
-        "birth_year": 1994,
-    },
-    "Erik-Hurtado": {
-        "id": "b11e6f2b",
-        "nationality": ["us"],
-        "position": ["FW"],
-        "birth_year": 1990,
-    },
-    "Emerson-Hyndman": {
-        "id": "3be1a627",
-        "nationality": ["us"],
-        "position": ["MF"],
-        "birth_year": 1996,
-    },
-    "Franco-Ibarra": {
-        "id": "db6540c5",
-        "nationality": ["ar"],
-        "position": ["MF"],
-        "birth_year": 2001,
-    },
-    "Sebastien-Ibeagha": {
-        "id": "41ba8175",
-        "nationality": ["us"],
-        "position": ["DF"],
-        "birth_year": 1992,
-    },
-    "Sunusi-Ibrahim": {
-        "id": "796994e5",
-        "nationality": ["ng"],
-        "position": ["MF", "FW"],
-        "birth_year": 2002,
-    },
-    "James-Igbekeme": {
-        "id": "c9ce0fc8",
-        "nationality": ["ng"],
-        "position": ["FW", "MF"],
-        "birth_year": 1995,
-    },
-    "Tega-Ikoba": {
-        "id": "35d550f2",
-        "nationality": ["us"],
-        "position": ["FW"],
-        "birth_year": 2003,
-    },
-    "Arn\u00f3r-Ingvi-Traustason": {
-        "id": "7d036b4a",
-        "nationality": ["is"],
-        "position": ["MF", "FW"],
-        "birth_year": 1993,
-    },
-    "Lorenzo-Insigne": {
-        "id": "2f557579",
-        "nationality": ["it"],
-        "position": ["FW", "MF"],
-        "birth_year": 1991,
-    },
-    "Nicolas-Isimat-Mirin": {
-        "id": "14e8e9d7",
-        "nationality": ["fr"],
-        "position": ["DF"],
-        "birth_year": 1991,
-    },
-    "Alja\u017e-Iva\u010di\u010d": {
-        "id": "4d6e50d8",
-        "nationality": ["si"],
-        "position": ["GK"],
-        "birth_year": 1993,
-    },
-    "Stanislav-Ivanov": {
-        "id": "0cafba94",
-        "nationality": ["bg"],
-        "position": ["FW", "MF"],
-        "birth_year": 1999,
-    },
-    "Robin-Jansson": {
-        "id": "8ca5c176",
-        "nationality": ["se"],
-        "position": ["DF"],
-        "birth_year": 1991,
-    },
-    "Franco-Jara": {
-        "id": "413cce14",
-        "nationality": ["ar"],
-        "position": ["FW"],
-        "birth_year": 1988,
-    },
-    "Andres-Jasson": {
-        "id": "31d049b2",
-        "nationality": ["us"],
-        "position": ["DF", "MF"],
-        "birth_year": 2002,
-    },
-    "Corentin-Jean": {
-        "id": "7d9b37bf",
-        "nationality": ["fr"],
-        "position": ["FW", "MF"],
-        "birth_year": 1995,
-    },
-    "Cal-Jennings": {
-        "id": "44f6672a",
-        "nationality": ["us"],
-        "position": ["FW", "MF"],
-        "birth_year": 1997,
-    },
-    "Hector-Jim\u00e9nez": {
-        "id": "2dc1e90e",
-        "nationality": ["us"],
-        "position": ["DF"],
-        "birth_year": 1988,
-    },
-    "Jes\u00fas-Jim\u00e9nez": {
-        "id": "1e161d47",
-        "nationality": ["es"],
-        "position": ["FW"],
-        "birth_year": 1993,
-    },
-    "Sean-Johnson": {
-        "id": "c164335e",
-        "nationality": ["us"],
-        "position": ["GK"],
-        "birth_year": 1989,
-    },
-    "Alistair-Johnston": {
-        "id": "4fb17e20",
-        "nationality": ["ca"],
-        "position": ["DF"],
-        "birth_year": 1998,
-    },
-    "DeJuan-Jones": {
-        "id": "10d1139c",
-        "nationality": ["us"],
-        "position": ["DF"],
-        "birth_year": 1997,
-    },
-    "Derrick-Jones": {
-        "id": "93c92d6c",
-        "nationality": ["us"],
-        "position": ["MF"],
-        "birth_year": 1997,
-    },
-    "Joevin-Jones": {
-        "id": "fc23d956",
-        "nationality": ["tt"],
-        "position": ["DF", "MF"],
-        "birth_year": 1991,
-    },
-    "Jony": {
-        "id": "60665492",
-        "nationality": ["ar"],
-        "position": ["FW", "MF"],
-        "birth_year": 1994,
-    },
-    "Juan-Jos\u00e9-S\u00e1nchez": {
-        "id": "1835f053",
-        "nationality": ["co"],
-        "position": ["DF"],
-        "birth_year": 1998,
-    },
-    "Dejan-Jovelji\u0107": {
-        "id": "95a24690",
-        "nationality": ["rs"],
-        "position": ["FW", "MF"],
-        "birth_year": 1999,
-    },
-    "Kamil-J\u00f3\u017awiak": {
-        "id": "bd4e3824",
-        "nationality": ["pl"],
-        "position": ["FW", "MF"],
-        "birth_year": 1998,
-    },
-    "Judson": {
-        "id": "e1535f82",
-        "nationality": ["br"],
-        "position": ["MF"],
-        "birth_year": 1993,
-    },
-    "Anderson-Julio": {
-        "id": "f907a6a8",
-        "nationality": ["ec"],
-        "position": ["FW", "MF"],
-        "birth_year": 1996,
-    },
-    "Florian-Jungwirth": {
-        "id": "f179c207",
-        "nationality": ["de"],
-        "position": ["DF", "MF"],
-        "birth_year": 1989,
-    },
-    "Sam-Junqua": {
-        "id": "91981d97",
-        "nationality": ["us"],
-        "position": ["DF"],
-        "birth_year": 1996,
-    },
-    "Chris-Kablan": {
-        "id": "04159652",
-        "nationality": ["ch"],
-        "position": ["MF"],
-        "birth_year": 1994,
-    },
-    "Kristijan-Kahlina": {
-        "id": "53e360bb",
-        "nationality": ["hr"],
-        "position": ["GK"],
-        "birth_year": 1992,
-    },
-    "Brent-Kallman": {
-        "id": "2b24702b",
-        "nationality": ["us"],
-        "position": ["DF"],
-        "birth_year": 1990,
-    },
-    "Kei-Kamara": {
-        "id": "6e3f3809",
-        "nationality": ["sl"],
-        "position": ["FW"],
-        "birth_year": 1984,
-    },
-    "Ola-Kamara": {
-        "id": "e134351a",
-        "nationality": ["no"],
-        "position": ["FW", "MF"],
-        "birth_year": 1989,
-    },
-    "Bernard-Kamungo": {
-        "id": "186acc62",
-        "nationality": ["tz"],
-        "position": ["FW"],
-        "birth_year": 2002,
-    },
-    "Alec-Kann": {
-        "id": "4a8af93c",
-        "nationality": ["us"],
-        "position": ["GK"],
-        "birth_year": 1990,
-    },
-    "Johan-Kappelhof": {
-        "id": "465015a5",
-        "nationality": ["nl"],
-        "position": ["DF"],
-        "birth_year": 1990,
-    },
-    "Wilfrid-Kaptoum": {
-        "id": "d717630e",
-        "nationality": ["cm"],
-        "position": ["MF"],
-        "birth_year": 1996,
-    },
-    "Ercan-Kara": {
-        "id": "540c9a17",
-        "nationality": ["at"],
-        "position": ["FW"],
-        "birth_year": 1996,
-    },
-    "Mark-Anthony-Kaye": {
-        "id": "36a38acd",
-        "nationality": ["ca"],
-        "position": ["MF"],
-        "birth_year": 1994,
-    },
-    "Kipp-Keller": {
-        "id": "fe5fea9f",
-        "nationality": ["us"],
-        "position": ["DF"],
-        "birth_year": 2000,
-    },
-    "Jon-Kempin": {
-        "id": "063adc5e",
-        "nationality": ["us"],
-        "position": ["GK"],
-        "birth_year": 1993,
-    },
-    "Deandre-Kerr": {
-        "id": "a3e85f7b",
-        "nationality": ["ca"],
-        "position": ["MF", "FW"],
-        "birth_year": 2002,
-    },
-    "Henry-Kessler": {
-        "id": "23c75879",
-        "nationality": ["us"],
-        "position": ["DF"],
-        "birth_year": 1998,
-    },
-    "Nabilai-Kibunguchy": {
-        "id": "3b114bfc",
-        "nationality": ["us"],
-        "position": ["MF"],
-        "birth_year": 1998,
-    },
-    "Benjamin-Kikanovic": {
-        "id": "fe11d61b",
-        "nationality": ["us"],
-        "position": ["FW", "MF"],
-        "birth_year": 2000,
-    },
-    "Patryk-Klimala": {
-        "id": "0bf3c11c",
-        "nationality": ["pl"],
-        "position": ["FW"],
-        "birth_year": 1998,
-    },
-    "Sacha-Kljestan": {
-        "id": "73682895",
-        "nationality": ["us"],
-        "position": ["MF", "FW"],
-        "birth_year": 1985,
-    },
-    "Brad-Knighton": {
-        "id": "9903a3cb",
-        "nationality": ["us"],
-        "position": ["GK"],
-        "birth_year": 1985,
-    },
-    "\u017dan-Kolmani\u010d": {
-        "id": "4501fd21",
-        "nationality": ["si"],
-        "position": ["DF"],
-        "birth_year": 2000,
-    },
-    "Isma\u00ebl-Kon\u00e9": {
-        "id": "e0220b70",
-        "nationality": ["ca"],
-        "position": ["MF"],
-        "birth_year": 2002,
-    },
-    "Damir-Kreilach": {
-        "id": "068be155",
-        "nationality": ["hr"],
-        "position": ["MF", "FW"],
-        "birth_year": 1989,
-    },
-    "Theodore-Ku-Dipietro": {
-        "id": "ef7c10e0",
-        "nationality": ["us"],
-        "position": ["FW", "MF"],
-        "birth_year": 2002,
-    },
-    "Yuya-Kubo": {
-        "id": "cba16a46",
-        "nationality": ["jp"],
-        "position": ["MF"],
-        "birth_year": 1993,
-    },
-    "Jojea-Kwizera": {
-        "id": "cc61360d",
-        "nationality": ["cg"],
-        "position": ["DF", "MF"],
-        "birth_year": 1999,
-    },
-    "Lassi-Lappalainen": {
-        "id": "bcb2282d",
-        "nationality": ["fi"],
-        "position": ["DF", "MF"],
-        "birth_year": 1998,
-    },
-    "Jes\u00fas-David-Murillo-Largacha": {
-        "id": "68d48a71",
-        "nationality": ["co"],
-        "position": ["DF"],
-        "birth_year": 1994,
-    },
-    "Richie-Laryea": {
-        "id": "276fdbe4",
-        "nationality": ["ca"],
-        "position": ["DF"],
-        "birth_year": 1995,
-    },
-    "Ariel-Lassiter": {
-        "id": "bd7b916c",
-        "nationality": ["cr"],
-        "position": ["FW", "MF"],
-        "birth_year": 1994,
-    },
-    "Vuk-Latinovich": {
-        "id": "5c0e047a",
-        "nationality": ["us"],
-        "position": ["DF"],
-        "birth_year": 1997,
-    },
-    "Kemar-Lawrence": {
-        "id": "80be3efe",
-        "nationality": ["jm"],
-        "position": ["DF"],
-        "birth_year": 1992,
-    },
-    "Randall-Leal": {
-        "id": "874a5031",
-        "nationality": ["cr"],
-        "position": ["MF"],
-        "birth_year": 1997,
-    },
-    "Kelvin-Leerdam": {
-        "id": "d8b47705",
-        "nationality": ["sr"],
-        "position": ["DF", "MF"],
-        "birth_year": 1990,
-    },
-    "Brooks-Lennon": {
-        "id": "ec80ba72",
-        "nationality": ["us"],
-        "position": ["DF", "FW"],
-        "birth_year": 1997,
-    },
-    "Jonathan-Lewis": {
-        "id": "2501eb59",
-        "nationality": ["us"],
-        "position": ["FW", "MF"],
-        "birth_year": 1997,
-    },
-    "Danny-Leyva": {
-        "id": "ecc3a9c9",
-        "nationality": ["us"],
-        "position": ["MF"],
-        "birth_year": 2003,
-    },
-    "Azaad-Liadi": {
-        "id": "ba702426",
-        "nationality": ["us"],
-        "position": ["MF"],
-        "birth_year": 1998,
-    },
-    "Nick-Lima": {
-        "id": "959686eb",
-        "nationality": ["us"],
-        "position": ["DF"],
-        "birth_year": 1994,
-    },
-    "Jaylin-Lindsey": {
-        "id": "83cb6e59",
-        "nationality": ["us"],
-        "position": ["DF"],
-        "birth_year": 2000,
-    },
-    "Sebastian-Lletget": {
-        "id": "73019c31",
-        "nationality": ["us"],
-        "position": ["FW", "MF"],
-        "birth_year": 1992,
-    },
-    "Robin-Lod": {
-        "id": "33c69aa0",
-        "nationality": ["fi"],
-        "position": ["FW", "MF"],
-        "birth_year": 1993,
-    },
-    "Nicol\u00e1s-Lodeiro": {
-        "id": "fe81d0d1",
-        "nationality": ["uy"],
-        "position": ["MF"],
-        "birth_year": 1989,
-    },
-    "Jasper-L\u00f6ffelsend": {
-        "id": "ce037639",
-        "nationality": ["de"],
-        "position": ["MF"],
-        "birth_year": 1997,
-    },
-    "Aaron-Long": {
-        "id": "46b89640",
-        "nationality": ["us"],
-        "position": ["DF"],
-        "birth_year": 1992,
-    },
-    "Marcos-L\u00f3pez": {
-        "id": "9b3ab988",
-        "nationality": ["pe"],
-        "position": ["DF"],
-        "birth_year": 1999,
-    },
-    "Marvin-Lor\u00eda": {
-        "id": "71380d87",
-        "nationality": ["cr"],
-        "position": ["FW", "MF"],
-        "birth_year": 1997,
-    },
-    "Daniel-Lovitz": {
-        "id": "db97d838",
-        "nationality": ["us"],
-        "position": ["DF"],
-        "birth_year": 1991,
-    },
-    "Damion-Lowe": {
-        "id": "b6e2e54c",
-        "nationality": ["jm"],
-        "position": ["DF"],
-        "birth_year": 1993,
-    },
-    "Everton-Luiz": {
-        "id": "3799e138",
-        "nationality": ["br"],
-        "position": ["MF"],
-        "birth_year": 1988,
-    },
-    "Diego-Luna": {
-        "id": "e67f8af0",
-        "nationality": ["us"],
-        "position": ["MF"],
-        "birth_year": 2003,
-    },
-    "Adam-Lundqvist": {
-        "id": "91769a24",
-        "nationality": ["se"],
-        "position": ["DF"],
-        "birth_year": 1994,
-    },
-    "Luquinhas": {
-        "id": "85937928",
-        "nationality": ["br"],
-        "position": ["MF"],
-        "birth_year": 1997,
-    },
-    "Jack-Lynn": {
-        "id": "c81d718e",
-        "nationality": ["us"],
-        "position": ["FW", "DF"],
-        "birth_year": 2000,
-    },
-    "Larrys-Mabiala": {
-        "id": "5bdec47f",
-        "nationality": ["cd"],
-        "position": ["DF"],
-        "birth_year": 1987,
-    },
-    "Aim\u00e9-Mabika": {
-        "id": "3a37d349",
-        "nationality": ["zm"],
-        "position": ["DF"],
-        "birth_year": 1998,
-    },
-    "Maciel": {
-        "id": "a39d51e0",
-        "nationality": ["br"],
-        "position": ["MF"],
-        "birth_year": 2000,
-    },
-    "Zac-MacMath": {
-        "id": "06caac45",
-        "nationality": ["us"],
-        "position": ["GK"],
-        "birth_year": 1991,
-    },
-    "Lukas-MacNaughton": {
-        "id": "b6111d16",
-        "nationality": ["ca"],
-        "position": ["DF"],
-        "birth_year": 1995,
-    },
-    "Talles-Magno": {
-        "id": "64c98878",
-        "nationality": ["br"],
-        "position": ["FW", "MF"],
-        "birth_year": 2002,
-    },
-    "Jack-Maher": {
-        "id": "0c6f2fa6",
-        "nationality": ["us"],
-        "position": ["DF"],
-        "birth_year": 1999,
-    },
-    "Christian-Makoun": {
-        "id": "7efffe65",
-        "nationality": ["ve"],
-        "position": ["DF"],
-        "birth_year": 2000,
-    },
-    "Adilson-Malanda": {
-        "id": "9d83969b",
-        "nationality": ["fr"],
-        "position": ["DF"],
-        "birth_year": 2001,
-    },
-    "Machop-Malual": {
-        "id": "1701b012",
-        "nationality": ["ss"],
-        "position": ["DF", "FW"],
-        "birth_year": 1998,
-    },
-    "Elias-Manoel": {
-        "id": "7f19cbe0",
-        "nationality": ["br"],
-        "position": ["FW"],
-        "birth_year": 2001,
-    },
-    "J.T.-Marcinkowski": {
-        "id": "977791f4",
-        "nationality": ["us"],
-        "position": ["GK"],
-        "birth_year": 1997,
-    },
-    "Paul-Marie": {
-        "id": "da0bb55a",
-        "nationality": ["fr"],
-        "position": ["DF"],
-        "birth_year": 1995,
-    },
-    "Anthony-Markanich": {
-        "id": "565fde4a",
-        "nationality": ["us"],
-        "position": ["DF"],
-        "birth_year": 1999,
-    },
-    "Nick-Markanich": {
-        "id": "65988c73",
-        "nationality": ["us"],
-        "position": ["FW", "MF"],
-        "birth_year": 1999,
-    },
-    "George-Marks": {
-        "id": "e75f9dba",
-        "nationality": ["us"],
-        "position": ["GK"],
-        "birth_year": 1999,
-    },
-    "Jahkeele-Marshall-Rutty": {
-        "id": "b9459f85",
-        "nationality": ["ca"],
-        "position": ["DF"],
-        "birth_year": 2004,
-    },
-    "Nick-Marsman": {
-        "id": "f352799f",
-        "nationality": ["nl"],
-        "position": ["GK"],
-        "birth_year": 1990,
-    },
-    "Jos\u00e9-Mart\u00ednez": {
-        "id": "8e049cbd",
-        "nationality": ["es"],
-        "position": ["DF"],
-        "birth_year": 1993,
-    },
-    "Josef-Mart\u00ednez": {
-        "id": "e73f0aa1",
-        "nationality": ["ve"],
-        "position": ["FW"],
-        "birth_year": 1993,
-    },
-    "Lu\u00eds-Martins": {
-        "id": "56b7c09b",
-        "nationality": ["pt"],
-        "position": ["DF", "MF"],
-        "birth_year": 1992,
-    },
-    "Thiago-Martins": {
-        "id": "4d6ec370",
-        "nationality": ["br"],
-        "position": ["DF"],
-        "birth_year": 1995,
-    },
-    "Alexandru-M\u0103\u021ban": {
-        "id": "3bd3bcc4",
-        "nationality": ["ro"],
-        "position": ["FW", "MF"],
-        "birth_year": 1999,
-    },
-    "R\u00f3nald-Matarrita": {
-        "id": "491862dd",
-        "nationality": ["cr"],
-        "position": ["DF"],
-        "birth_year": 1994,
-    },
-    "Jimmy-Maurer": {
-        "id": "ca1c6f3d",
-        "nationality": ["us"],
-        "position": ["GK"],
-        "birth_year": 1988,
-    },
-    "Jos\u00e9-Mauri": {
-        "id": "644faf10",
-        "nationality": ["it"],
-        "position": ["MF"],
-        "birth_year": 1996,
-    },
-    "Chris-Mavinga": {
-        "id": "fda36cfb",
-        "nationality": ["cd"],
-        "position": ["DF"],
-        "birth_year": 1991,
-    },
-    "Max": {
-        "id": "67c3efa4",
-        "nationality": ["br"],
-        "position": ["MF", "FW"],
-        "birth_year": 2001,
-    },
-    "Olivier-Mbaizo": {
-        "id": "f6315619",
-        "nationality": ["cm"],
-        "position": ["DF"],
-        "birth_year": 1997,
-    },
-    "Hugo-Hilaire-Mbongue-Mbongue": {
-        "id": "df4fe2b7",
-        "nationality": ["ca"],
-        "position": ["FW"],
-        "birth_year": 2004,
-    },
-    "John-McCarthy": {
-        "id": "249362e9",
-        "nationality": ["us"],
-        "position": ["GK"],
-        "birth_year": 1992,
-    },
-    "Dax-McCarty": {
-        "id": "b74e58c0",
-        "nationality": ["us"],
-        "position": ["MF"],
-        "birth_year": 1987,
-    },
-    "Aiden-McFadden": {
-        "id": "eed1b8f6",
-        "nationality": ["us"],
-        "position": ["DF"],
-        "birth_year": 1998,
-    },
-    "Jack-McGlynn": {
-        "id": "e2b8c25c",
-        "nationality": ["us"],
-        "position": ["MF"],
-        "birth_year": 2003,
-    },
-    "Zac-McGraw": {
-        "id": "83129dc7",
-        "nationality": ["us"],
-        "position": ["DF"],
-        "birth_year": 1997,
-    },
-    "Kendall-McIntosh": {
-        "id": "d1f3e74b",
-        "nationality": ["us"],
-        "position": ["GK"],
-        "birth_year": 1994,
-    },
-    "Thomas-McNamara": {
-        "id": "ab36595d",
-        "nationality": ["us"],
-        "position": ["MF", "FW"],
-        "birth_year": 1991,
-    },
-    "Quinn-McNeill": {
-        "id": "2a9b1a97",
-        "nationality": ["us"],
-        "position": ["MF"],
-        "birth_year": 1998,
-    },
-    "Christopher-McVey": {
-        "id": "149d8165",
-        "nationality": ["se"],
-        "position": ["DF"],
-        "birth_year": 1997,
-    },
-    "Ryan-Meara": {
-        "id": "18f0723b",
-        "nationality": ["us"],
-        "position": ["GK"],
-        "birth_year": 1990,
-    },
-    "Jimmy-Medranda": {
-        "id": "6f7ac622",
-        "nationality": ["co"],
-        "position": ["DF", "FW"],
-        "birth_year": 1994,
-    },
-    "Haris-Medunjanin": {
-        "id": "de5d5d41",
-        "nationality": ["ba"],
-        "position": ["MF"],
-        "birth_year": 1985,
-    },
-    "Tim-Melia": {
-        "id": "cc741f50",
-        "nationality": ["us"],
-        "position": ["GK"],
-        "birth_year": 1986,
-    },
-    "Jhegson-M\u00e9ndez": {
-        "id": "db0c5324",
-        "nationality": ["ec"],
-        "position": ["MF", "FW"],
-        "birth_year": 1997,
-    },
-    "Jonathan-Mensah": {
-        "id": "8087e6cb",
-        "nationality": ["gh"],
-        "position": ["DF"],
-        "birth_year": 1990,
-    },
-    "Justin-Meram": {
-        "id": "ae34c71d",
-        "nationality": ["iq"],
-        "position": ["MF", "FW"],
-        "birth_year": 1988,
-    },
-    "Romain-M\u00e9tanire": {
-        "id": "0fb21da9",
-        "nationality": ["mg"],
-        "position": ["MF"],
-        "birth_year": 1990,
-    },
-    "Nicol\u00e1s-Mezquida": {
-        "id": "00b629e1",
-        "nationality": ["uy"],
-        "position": ["MF", "FW"],
-        "birth_year": 1992,
-    },
-    "Matt-Miazga": {
-        "id": "9fc0f253",
-        "nationality": ["us"],
-        "position": ["DF"],
-        "birth_year": 1995,
-    },
-    "Micael": {
-        "id": "ea95d7a6",
-        "nationality": ["br"],
-        "position": ["MF"],
-        "birth_year": 2000,
-    },
-    "Benji-Michel": {
-        "id": "151ca25f",
-        "nationality": ["us"],
-        "position": ["FW", "MF"],
-        "birth_year": 1997,
-    },
-    "Djordje-Mihailovic": {
-        "id": "83cf9719",
-        "nationality": ["us"],
-        "position": ["MF", "FW"],
-        "birth_year": 1998,
-    },
-    "Matko-Miljevic": {
-        "id": "74b76abc",
-        "nationality": ["us"],
-        "position": ["MF", "FW"],
-        "birth_year": 2001,
-    },
-    "Eric-Miller": {
-        "id": "c0593f5d",
-        "nationality": ["us"],
-        "position": ["DF"],
-        "birth_year": 1993,
-    },
-    "Kamal-Miller": {
-        "id": "0646bd8a",
-        "nationality": ["ca"],
-        "position": ["DF"],
-        "birth_year": 1997,
-    },
-    "Tyler-Miller": {
-        "id": "7827a6b3",
-        "nationality": ["us"],
-        "position": ["GK"],
-        "birth_year": 1993,
-    },
-    "Kevin-Molino": {
-        "id": "371645ca",
-        "nationality": ["tt"],
-        "position": ["FW"],
-        "birth_year": 1990,
-    },
-    "Alex-Monis": {
-        "id": "66db9e72",
-        "nationality": ["us"],
-        "position": ["FW"],
-        "birth_year": 2003,
-    },
-    "Jamiro-Monteiro": {
-        "id": "d384bddd",
-        "nationality": ["cv"],
-        "position": ["MF"],
-        "birth_year": 1993,
-    },
-    "Fredy-Montero": {
-        "id": "bc5b5be5",
-        "nationality": ["co"],
-        "position": ["FW", "MF"],
-        "birth_year": 1987,
-    },
-    "Kim-Moonhwan": {
-        "id": "6bce7dd8",
-        "nationality": ["kr"],
-        "position": ["DF"],
-        "birth_year": 1995,
-    },
-    "Drew-Moor": {
-        "id": "220cf869",
-        "nationality": ["us"],
-        "position": ["DF", "MF"],
-        "birth_year": 1984,
-    },
-    "Shaquell-Moore": {
-        "id": "3b9f859b",
-        "nationality": ["us"],
-        "position": ["DF"],
-        "birth_year": 1996,
-    },
-    "Felipe-Mora": {
-        "id": "f4b0ea46",
-        "nationality": ["cl"],
-        "position": ["FW", "MF"],
-        "birth_year": 1993,
-    },
-    "Joseph-Mora": {
-        "id": "2af71023",
-        "nationality": ["cr"],
-        "position": ["DF"],
-        "birth_year": 1993,
-    },
-    "Alfredo-Morales": {
-        "id": "ff45add5",
-        "nationality": ["us"],
-        "position": ["MF", "DF"],
-        "birth_year": 1990,
-    },
-    "Maximiliano-Moralez": {
-        "id": "f99f37fc",
-        "nationality": ["ar"],
-        "position": ["MF"],
-        "birth_year": 1987,
-    },
-    "Steven-Moreira": {
-        "id": "f10983ae",
-        "nationality": ["fr"],
-        "position": ["DF"],
-        "birth_year": 1994,
-    },
-    "Junior-Moreno": {
-        "id": "5dcb4ac4",
-        "nationality": ["ve"],
-        "position": ["MF"],
-        "birth_year": 1993,
-    },
-    "Marcelino-Moreno": {
-        "id": "058c938c",
-        "nationality": ["ar"],
-        "position": ["MF", "FW"],
-        "birth_year": 1994,
-    },
-    "Santiago-Moreno": {
-        "id": "3261d0e4",
-        "nationality": ["co"],
-        "position": ["FW", "MF"],
-        "birth_year": 2000,
-    },
-    "Lewis-Morgan": {
-        "id": "b675e328",
-        "nationality": ["sct"],
-        "position": ["FW", "MF"],
-        "birth_year": 1996,
-    },
-    "Aidan-Morris": {
-        "id": "3778339c",
-        "nationality": ["us"],
-        "position": ["MF"],
-        "birth_year": 2001,
-    },
-    "Jordan-Morris": {
-        "id": "bd298d0d",
-        "nationality": ["us"],
-        "position": ["FW"],
-        "birth_year": 1994,
-    },
-    "Ravel-Morrison": {
-        "id": "bf59c794",
-        "nationality": ["jm"],
-        "position": ["MF", "FW"],
-        "birth_year": 1993,
-    },
-    "Edwin-Mosquera": {
-        "id": "15cda5f6",
-        "nationality": ["co"],
-        "position": ["FW", "DF"],
-        "birth_year": 2001,
-    },
-    "Juan-Mosquera": {
-        "id": "bb18b3b6",
-        "nationality": ["co"],
-        "position": ["DF", "MF"],
-        "birth_year": 2002,
-    },
-    "Jean-Mota": {
-        "id": "1ee0513b",
-        "nationality": ["br"],
-        "position": ["MF"],
-        "birth_year": 1993,
-    },
-    "Jo\u00e3o-Moutinho": {
-        "id": "a0aee24e",
-        "nationality": ["pt"],
-        "position": ["DF"],
-        "birth_year": 1998,
-    },
-    "Chris-Mueller": {
-        "id": "a5334099",
-        "nationality": ["us"],
-        "position": ["FW"],
-        "birth_year": 1996,
-    },
-    "Hany-Mukhtar": {
-        "id": "87fe8526",
-        "nationality": ["de"],
-        "position": ["FW", "MF"],
-        "birth_year": 1995,
-    },
-    "Jake-Mulraney": {
-        "id": "0f04858e",
-        "nationality": ["ie"],
-        "position": ["FW", "MF"],
-        "birth_year": 1996,
-    },
-    "Eddie-Munjoma": {
-        "id": "0e1f6ffa",
-        "nationality": ["us"],
-        "position": ["DF", "FW"],
-        "birth_year": 1998,
-    },
-    "Ian-Murphy": {
-        "id": "c6d233e3",
-        "nationality": ["us"],
-        "position": ["DF"],
-        "birth_year": 2000,
-    },
-    "Daniel-Musovski": {
-        "id": "925a2703",
-        "nationality": ["us"],
-        "position": ["FW", "MF"],
-        "birth_year": 1995,
-    },
-    "Alex-Muyl": {
-        "id": "2c1025bf",
-        "nationality": ["us"],
-        "position": ["DF", "MF"],
-        "birth_year": 1995,
-    },
-    "Darlington-Nagbe": {
-        "id": "6219c704",
-        "nationality": ["us"],
-        "position": ["MF"],
-        "birth_year": 1990,
-    },
-    "Andy-Najar": {
-        "id": "f8280175",
-        "nationality": ["hn"],
-        "position": ["DF"],
-        "birth_year": 1993,
-    },
-    "Federico-Navarro": {
-        "id": "61c628be",
-        "nationality": ["ar"],
-        "position": ["MF"],
-        "birth_year": 2000,
-    },
-    "Miguel-Navarro": {
-        "id": "3fbff39a",
-        "nationality": ["ve"],
-        "position": ["DF"],
-        "birth_year": 1999,
-    },
-    "Hassan-Ndam": {
-        "id": "148f3d0f",
-        "nationality": ["cm"],
-        "position": ["DF"],
-        "birth_year": 1998,
-    },
-    "Logan-Ndenbe": {
-        "id": "f625e8a5",
-        "nationality": ["be"],
-        "position": ["DF"],
-        "birth_year": 2000,
-    },
-    "Dylan-Nealis": {
-        "id": "24f4dd87",
-        "nationality": ["us"],
-        "position": ["DF"],
-        "birth_year": 1998,
-    },
-    "Sean-Nealis": {
-        "id": "8c1b17b3",
-        "nationality": ["us"],
-        "position": ["DF"],
-        "birth_year": 1997,
-    },
-    "Jayden-Nelson": {
-        "id": "92305a81",
-        "nationality": ["ca"],
-        "position": ["MF", "FW"],
-        "birth_year": 2002,
-    },
-    "John-Nelson": {
-        "id": "df8c4d49",
-        "nationality": ["us"],
-        "position": ["DF"],
-        "birth_year": 1998,
-    },
-    "Michael-Nelson": {
-        "id": "f4a12161",
-        "nationality": ["us"],
-        "position": ["GK"],
-        "birth_year": 1995,
-    },
-    "Jake-Nerwinski": {
-        "id": "2b5801d0",
-        "nationality": ["us"],
-        "position": ["DF"],
-        "birth_year": 1994,
-    },
-    "Harvey-Neville": {
-        "id": "92442794",
-        "nationality": ["eng"],
-        "position": ["DF"],
-        "birth_year": 2002,
-    },
-    "Serge-Ngoma": {
-        "id": "de7a0fe6",
-        "nationality": ["us"],
-        "position": ["FW", "MF"],
-        "birth_year": 2005,
-    },
-    "Sam-Nicholson": {
-        "id": "8c8ac996",
-        "nationality": ["sct"],
-        "position": ["MF", "FW"],
-        "birth_year": 1995,
-    },
-    "Jaros\u0142aw-Niezgoda": {
-        "id": "60c659b6",
-        "nationality": ["pl"],
-        "position": ["FW"],
-        "birth_year": 1995,
-    },
-    "Tsiki-Ntsabeleng": {
-        "id": "bcbc53d5",
-        "nationality": ["za"],
-        "position": ["MF"],
-        "birth_year": 1998,
-    },
-    "Obinna-Nwobodo": {
-        "id": "897c8066",
-        "nationality": ["ng"],
-        "position": ["MF"],
-        "birth_year": 1996,
-    },
-    "Moses-Nyeman": {
-        "id": "09d33255",
-        "nationality": ["us"],
-        "position": ["MF"],
-        "birth_year": 2003,
-    },
-    "Shane-O'Neill": {
-        "id": "a62a56b4",
-        "nationality": ["us"],
-        "position": ["DF"],
-        "birth_year": 1993,
-    },
-    "Kevin-O'Toole": {
-        "id": "72a0f655",
-        "nationality": ["us"],
-        "position": ["FW", "MF"],
-        "birth_year": 1998,
-    },
-    "J\u00e1der-Obrian": {
-        "id": "1471b2a8",
-        "nationality": ["co"],
-        "position": ["FW"],
-        "birth_year": 1995,
-    },
-    "David-Ochoa": {
-        "id": "dba6b279",
-        "nationality": ["us"],
-        "position": ["GK"],
-        "birth_year": 2001,
-    },
-    "Chris-Odoi-Atsem": {
-        "id": "375ec69e",
-        "nationality": ["us"],
-        "position": ["DF"],
-        "birth_year": 1995,
-    },
-    "Chinonso-Offor": {
-        "id": "dc590664",
-        "nationality": ["ng"],
-        "position": ["FW"],
-        "birth_year": 2000,
-    },
-    "Braian-Ojeda": {
-        "id": "60953af0",
-        "nationality": ["py"],
-        "position": ["MF"],
-        "birth_year": 2000,
-    },
-    "Noble-Okello": {
-        "id": "6bc16162",
-        "nationality": ["ca"],
-        "position": ["MF", "FW"],
-        "birth_year": 2000,
-    },
-    "Wyatt-Omsberg": {
-        "id": "cd44ba68",
-        "nationality": ["us"],
-        "position": ["DF"],
-        "birth_year": 1995,
-    },
-    "Easton-Ongaro": {
-        "id": "8d3dd05f",
-        "nationality": ["ca"],
-        "position": ["FW"],
-        "birth_year": 1998,
-    },
-    "Kwadwo-Opoku": {
-        "id": "226a288e",
-        "nationality": ["gh"],
-        "position": ["FW", "MF"],
-        "birth_year": 2001,
-    },
-    "Arquimides-Ordonez": {
-        "id": "8941d9b2",
-        "nationality": ["gt"],
-        "position": ["FW", "MF"],
-        "birth_year": 2003,
-    },
-    "Sergio-Oregel": {
-        "id": "f6c6ff09",
-        "nationality": ["us"],
-        "position": ["MF"],
-        "birth_year": 2005,
-    },
-    "Jaziel-Orozco": {
-        "id": "46af4656",
-        "nationality": ["us"],
-        "position": ["DF"],
-        "birth_year": 2004,
-    },
-    "Christian-Ortiz": {
-        "id": "bd8ddbd6",
-        "nationality": ["ar"],
-        "position": ["MF", "FW"],
-        "birth_year": 1992,
-    },
-    "Jonathan-Osorio": {
-        "id": "70106ff6",
-        "nationality": ["ca"],
-        "position": ["MF"],
-        "birth_year": 1992,
-    },
-    "Bryan-Oviedo": {
-        "id": "31faf295",
-        "nationality": ["cr"],
-        "position": ["DF", "MF"],
-        "birth_year": 1990,
-    },
-    "Leonard-Owusu": {
-        "id": "a06c6c8a",
-        "nationality": ["gh"],
-        "position": ["MF"],
-        "birth_year": 1997,
-    },
-    "Maarten-Paes": {
-        "id": "eb343262",
-        "nationality": ["nl"],
-        "position": ["GK"],
-        "birth_year": 1998,
-    },
-    "Diego-Palacios": {
-        "id": "6ec37f2e",
-        "nationality": ["ec"],
-        "position": ["DF"],
-        "birth_year": 1999,
-    },
-    "Victor-P\u00e1lsson": {
-        "id": "831cf3ac",
-        "nationality": ["is"],
-        "position": ["MF", "DF"],
-        "birth_year": 1991,
-    },
-    "Elliot-Panicco": {
-        "id": "e93972ac",
-        "nationality": ["us"],
-        "position": ["GK"],
-        "birth_year": 1996,
-    },
-    "James-Pantemis": {
-        "id": "901408ac",
-        "nationality": ["ca"],
-        "position": ["GK"],
-        "birth_year": 1997,
-    },
-    "Cristhian-Paredes": {
-        "id": "0d8a2551",
-        "nationality": ["py"],
-        "position": ["MF"],
-        "birth_year": 1998,
-    },
-    "Tim-Parker": {
-        "id": "4988a44d",
-        "nationality": ["us"],
-        "position": ["DF"],
-        "birth_year": 1993,
-    },
-    "Keaton-Parks": {
-        "id": "77986763",
-        "nationality": ["us"],
-        "position": ["MF"],
-        "birth_year": 1997,
-    },
-    "Tyler-Pasher": {
-        "id": "3a7bec1b",
-        "nationality": ["ca"],
-        "position": ["FW", "MF"],
-        "birth_year": 1994,
-    },
-    "Alexandre-Pato": {
-        "id": "7dd83c7d",
-        "nationality": ["br"],
-        "position": ["FW", "MF"],
-        "birth_year": 1989,
-    },
-    "Jo\u00e3o-Paulo-Mior": {
-        "id": "b96aa1d6",
-        "nationality": ["br"],
-        "position": ["MF"],
-        "birth_year": 1991,
-    },
-    "Mat\u00edas-Pellegrini": {
-        "id": "b59f0060",
-        "nationality": ["ar"],
-        "position": ["DF", "FW"],
-        "birth_year": 2000,
-    },
-    "Jason-Pendant": {
-        "id": "22fe9049",
-        "nationality": ["fr"],
-        "position": ["DF", "MF"],
-        "birth_year": 1997,
-    },
-    "Andr\u00e9s-Perea": {
-        "id": "7e1dbecf",
-        "nationality": ["us"],
-        "position": ["MF", "FW"],
-        "birth_year": 2000,
-    },
-    "Daniel-Pereira": {
-        "id": "b8862e65",
-        "nationality": ["ve"],
-        "position": ["MF"],
-        "birth_year": 2000,
-    },
-    "Gabriel-Pereira": {
-        "id": "60c4ac82",
-        "nationality": ["br"],
-        "position": ["FW"],
-        "birth_year": 2001,
-    },
-    "Mauricio-Pereyra": {
-        "id": "f45eb18d",
-        "nationality": ["uy"],
-        "position": ["MF"],
-        "birth_year": 1990,
-    },
-    "Adrien-Perez": {
-        "id": "298a167b",
-        "nationality": ["us"],
-        "position": ["MF"],
-        "birth_year": 1995,
-    },
-    "Jonathan-Perez": {
-        "id": "41e57408",
-        "nationality": ["mx"],
-        "position": ["DF"],
-        "birth_year": 2003,
-    },
-    "Jordan-Perruzza": {
-        "id": "edc8791f",
-        "nationality": ["ca"],
-        "position": ["FW", "MF"],
-        "birth_year": 2001,
-    },
-    "Luca-Petrasso": {
-        "id": "fafeaf3d",
-        "nationality": ["ca"],
-        "position": ["DF", "MF"],
-        "birth_year": 2000,
-    },
-    "\u0110or\u0111e-Petrovi\u0107": {
-        "id": "0cf321c8",
-        "nationality": ["rs"],
-        "position": ["GK"],
-        "birth_year": 1999,
-    },
-    "Faf\u00e0-Picault": {
-        "id": "dbaa10c0",
-        "nationality": ["us"],
-        "position": ["FW"],
-        "birth_year": 1991,
-    },
-    "Kayden-Pierre": {
-        "id": "2f5f098b",
-        "nationality": ["us"],
-        "position": ["DF"],
-        "birth_year": 2003,
-    },
-    "Samuel-Piette": {
-        "id": "bc33c73b",
-        "nationality": ["ca"],
-        "position": ["MF"],
-        "birth_year": 1994,
-    },
-    "Donovan-Pines": {
-        "id": "7bd25363",
-        "nationality": ["us"],
-        "position": ["DF"],
-        "birth_year": 1998,
-    },
-    "Matt-Polster": {
-        "id": "d1d418f8",
-        "nationality": ["us"],
-        "position": ["MF"],
-        "birth_year": 1993,
-    },
-    "Paxton-Pomykal": {
-        "id": "c1f0fb45",
-        "nationality": ["us"],
-        "position": ["MF"],
-        "birth_year": 1999,
-    },
-    "Alvas-Powell": {
-        "id": "2f91124d",
-        "nationality": ["jm"],
-        "position": ["DF"],
-        "birth_year": 1994,
-    },
-    "Alejandro-Pozuelo": {
-        "id": "5e1280ff",
-        "nationality": ["es"],
-        "position": ["MF", "FW"],
-        "birth_year": 1991,
-    },
-    "Jack-Price": {
-        "id": "6217c92d",
-        "nationality": ["eng"],
-        "position": ["MF"],
-        "birth_year": 1992,
-    },
-    "Ralph-Priso-Mbongue": {
-        "id": "acb3e899",
-        "nationality": ["ca"],
-        "position": ["MF"],
-        "birth_year": 2002,
-    },
-    "Kacper-Przyby\u0142ko": {
-        "id": "4c53a714",
-        "nationality": ["pl"],
-        "position": ["FW"],
-        "birth_year": 1993,
-    },
-    "Riqui-Puig": {
-        "id": "f090a37a",
-        "nationality": ["es"],
-        "position": ["MF"],
-        "birth_year": 1999,
-    },
-    "John-Pulskamp": {
-        "id": "6b306c92",
-        "nationality": ["us"],
-        "position": ["GK"],
-        "birth_year": 2001,
-    },
-    "Facundo-Quignon": {
-        "id": "5b33b84c",
-        "nationality": ["ar"],
-        "position": ["MF"],
-        "birth_year": 1993,
-    },
-    "Nelson-Qui\u00f1ones": {
-        "id": "a295f0b3",
-        "nationality": ["co"],
-        "position": ["FW"],
-        "birth_year": 2002,
-    },
-    "Joshu\u00e9-Qui\u00f1\u00f3nez": {
-        "id": "c7305b1d",
-        "nationality": ["ec"],
-        "position": ["DF"],
-        "birth_year": 2000,
-    },
-    "Darwin-Quintero": {
-        "id": "0cc00553",
-        "nationality": ["co"],
-        "position": ["MF", "FW"],
-        "birth_year": 1987,
-    },
-    "Jairo-Quinteros": {
-        "id": "8363a7e8",
-        "nationality": ["bo"],
-        "position": ["DF"],
-        "birth_year": 2001,
-    },
-    "Romell-Quioto": {
-        "id": "122e850d",
-        "nationality": ["hn"],
-        "position": ["FW"],
-        "birth_year": 1991,
-    },
-    "Jackson-Ragen": {
-        "id": "a3d67f70",
-        "nationality": ["us"],
-        "position": ["DF"],
-        "birth_year": 1998,
-    },
-    "Brooklyn-Raines": {
-        "id": "b4caa0c5",
-        "nationality": ["us"],
-        "position": ["MF"],
-        "birth_year": 2005,
-    },
-    "Ryan-Raposo": {
-        "id": "f006a9b3",
-        "nationality": ["ca"],
-        "position": ["DF"],
-        "birth_year": 1999,
-    },
-    "Justin-Rasmussen": {
-        "id": "989ecf23",
-        "nationality": ["us"],
-        "position": ["DF"],
-        "birth_year": 1998,
-    },
-    "Rayan-Raveloson": {
-        "id": "fb3236a7",
-        "nationality": ["mg"],
-        "position": ["MF"],
-        "birth_year": 1997,
-    },
-    "Matthew-Real": {
-        "id": "1c2c030a",
-        "nationality": ["us"],
-        "position": ["MF", "DF"],
-        "birth_year": 1999,
-    },
-    "Rodney-Redes": {
-        "id": "426c3982",
-        "nationality": ["py"],
-        "position": ["FW", "MF"],
-        "birth_year": 2000,
-    },
-    "Benjamin-Redzic": {
-        "id": "ea8087aa",
-        "nationality": ["us"],
-        "position": ["MF", "FW"],
-        "birth_year": 2002,
-    },
-    "Pierre-Reedy": {
-        "id": "903f2d95",
-        "nationality": ["us"],
-        "position": ["MF"],
-        "birth_year": 1998,
-    },
-    "Eric-Remedi": {
-        "id": "38e2cbd6",
-        "nationality": ["ar"],
-        "position": ["MF"],
-        "birth_year": 1995,
-    },
-    "Justin-Rennicks": {
-        "id": "0aaa1c04",
-        "nationality": ["us"],
-        "position": ["FW"],
-        "birth_year": 1999,
-    },
-    "Ben-Reveno": {
-        "id": "6f0a801a",
-        "nationality": ["us"],
-        "position": ["FW"],
-        "birth_year": 1999,
-    },
-    "Andr\u00e9s-Reyes": {
-        "id": "36ab14f5",
-        "nationality": ["co"],
-        "position": ["DF"],
-        "birth_year": 1999,
-    },
-    "Yordy-Reyna": {
-        "id": "eec316d9",
-        "nationality": ["pe"],
-        "position": ["MF", "FW"],
-        "birth_year": 1993,
-    },
-    "Andre-Reynolds-II": {
-        "id": "d46dbe4f",
-        "nationality": ["us"],
-        "position": ["FW", "DF"],
-        "birth_year": 2001,
-    },
-    "Emanuel-Reynoso": {
-        "id": "614b26e3",
-        "nationality": ["ar"],
-        "position": ["MF", "FW"],
-        "birth_year": 1995,
-    },
-    "Spencer-Richey": {
-        "id": "d9178ea2",
-        "nationality": ["us"],
-        "position": ["GK"],
-        "birth_year": 1992,
-    },
-    "Will-Richmond": {
-        "id": "e46ee2e9",
-        "nationality": ["us"],
-        "position": ["MF", "FW"],
-        "birth_year": 2000,
-    },
-    "Tosaint-Ricketts": {
-        "id": "54769358",
-        "nationality": ["ca"],
-        "position": ["FW", "DF"],
-        "birth_year": 1987,
-    },
-    "Emiliano-Rigoni": {
-        "id": "a1216563",
-        "nationality": ["ar"],
-        "position": ["FW"],
-        "birth_year": 1993,
-    },
-    "Alexander-Ring": {
-        "id": "6c1221d6",
-        "nationality": ["fi"],
-        "position": ["MF"],
-        "birth_year": 1991,
-    },
-    "Rocco-R\u00edos-Novo": {
-        "id": "f59bd2d3",
-        "nationality": ["ar"],
-        "position": ["GK"],
-        "birth_year": 2002,
-    },
-    "Damien-Rivera": {
-        "id": "2822f3dd",
-        "nationality": ["us"],
-        "position": ["FW", "MF"],
-        "birth_year": 2002,
-    },
-    "Nigel-Robertha": {
-        "id": "a94bad97",
-        "nationality": ["nl"],
-        "position": ["FW", "MF"],
-        "birth_year": 1998,
-    },
-    "Miles-Robinson": {
-        "id": "782a95d9",
-        "nationality": ["us"],
-        "position": ["DF"],
-        "birth_year": 1997,
-    },
-    "Robbie-Robinson": {
-        "id": "e0dae99f",
-        "nationality": ["us"],
-        "position": ["FW", "MF"],
-        "birth_year": 1998,
-    },
-    "Harrison-Robledo": {
-        "id": "1f36ce15",
-        "nationality": ["us"],
-        "position": ["MF", "DF"],
-        "birth_year": 2002,
-    },
-    "Rodrigues": {
-        "id": "67f5e064",
-        "nationality": ["br"],
-        "position": ["DF"],
-        "birth_year": 1997,
-    },
-    "Abraham-Rodriguez": {
-        "id": "c7e14787",
-        "nationality": ["us"],
-        "position": ["GK"],
-        "birth_year": 2002,
-    },
-    "Brian-Rodr\u00edguez": {
-        "id": "c86041d7",
-        "nationality": ["uy"],
-        "position": ["FW"],
-        "birth_year": 2000,
-    },
-    "Emerson-Rodr\u00edguez": {
-        "id": "09e5ae16",
-        "nationality": ["co"],
-        "position": ["FW", "MF"],
-        "birth_year": 2000,
-    },
-    "Mart\u00edn-Rodr\u00edguez": {
-        "id": "f85d398c",
-        "nationality": ["pe"],
-        "position": ["MF"],
-        "birth_year": 1968,
-    },
-    "Memo-Rodriguez": {
-        "id": "fc6c6b2b",
-        "nationality": ["us"],
-        "position": ["MF", "FW"],
-        "birth_year": 1995,
-    },
-    "Santiago-Rodr\u00edguez": {
-        "id": "86dff811",
-        "nationality": ["uy"],
-        "position": ["MF", "FW"],
-        "birth_year": 2000,
-    },
-    "Alex-Roldan": {
-        "id": "1255a82a",
-        "nationality": ["sv"],
-        "position": ["DF"],
-        "birth_year": 1996,
-    },
-    "Cristian-Roldan": {
-        "id": "48875649",
-        "nationality": ["us"],
-        "position": ["FW", "MF"],
-        "birth_year": 1995,
-    },
-    "Jhohan-Roma\u00f1a": {
-        "id": "4e32c2d6",
-        "nationality": ["co"],
-        "position": ["DF"],
-        "birth_year": 1998,
-    },
-    "David-Romney": {
-        "id": "b7b6e781",
-        "nationality": ["us"],
-        "position": ["DF"],
-        "birth_year": 1993,
-    },
-    "Rafael-Romo": {
-        "id": "8827c189",
-        "nationality": ["ve"],
-        "position": ["GK"],
-        "birth_year": 1990,
-    },
-    "Eloy-Room": {
-        "id": "6b33d86b",
-        "nationality": ["cw"],
-        "position": ["GK"],
-        "birth_year": 1989,
-    },
-    "Joseph-Rosales": {
-        "id": "6a29d06b",
-        "nationality": ["hn"],
-        "position": ["MF"],
-        "birth_year": 2000,
-    },
-    "Oriol-Rosell": {
-        "id": "2a17ef3e",
-        "nationality": ["es"],
-        "position": ["MF"],
-        "birth_year": 1992,
-    },
-    "Keegan-Rosenberry": {
-        "id": "f940c69e",
-        "nationality": ["us"],
-        "position": ["DF", "MF"],
-        "birth_year": 1993,
-    },
-    "Matheus-Rossetto": {
-        "id": "daf8c775",
-        "nationality": ["br"],
-        "position": ["MF"],
-        "birth_year": 1996,
-    },
-    "Paul-Rothrock": {
-        "id": "875e8269",
-        "nationality": ["us"],
-        "position": ["FW", "DF"],
-        "birth_year": 1999,
-    },
-    "Kelyn-Rowe": {
-        "id": "cf928adb",
-        "nationality": ["us"],
-        "position": ["DF", "MF"],
-        "birth_year": 1991,
-    },
-    "Ruan": {
-        "id": "f2665f7c",
-        "nationality": ["br"],
-        "position": ["DF"],
-        "birth_year": 1995,
-    },
-    "Rubio-Rubin": {
-        "id": "9bad7100",
-        "nationality": ["gt"],
-        "position": ["FW", "MF"],
-        "birth_year": 1996,
-    },
-    "Diego-Rubio": {
-        "id": "3f082234",
-        "nationality": ["cl"],
-        "position": ["MF", "FW"],
-        "birth_year": 1993,
-    },
-    "Ra\u00fal-Ruid\u00edaz": {
-        "id": "7a4296e1",
-        "nationality": ["pe"],
-        "position": ["FW"],
-        "birth_year": 1990,
-    },
-    "Pablo-Ru\u00edz": {
-        "id": "7368cd70",
-        "nationality": ["ar"],
-        "position": ["MF"],
-        "birth_year": 1998,
-    },
-    "Sergio-Ruiz": {
-        "id": "1f423a54",
-        "nationality": ["es"],
-        "position": ["MF"],
-        "birth_year": 1994,
-    },
-    "Albert-Rusn\u00e1k": {
-        "id": "0adeafaa",
-        "nationality": ["sk"],
-        "position": ["MF"],
-        "birth_year": 1994,
-    },
-    "Johnny-Russell": {
-        "id": "a30e1562",
-        "nationality": ["sct"],
-        "position": ["FW", "MF"],
-        "birth_year": 1990,
-    },
-    "Jacen-Russell-Rowe": {
-        "id": "b33c6ed5",
-        "nationality": ["ca"],
-        "position": ["FW"],
-        "birth_year": 2002,
-    },
-    "Zach-Ryan": {
-        "id": "74ba46bc",
-        "nationality": ["us"],
-        "position": ["FW"],
-        "birth_year": 1999,
-    },
-    "Ryan-Sailor": {
-        "id": "4924d9bb",
-        "nationality": ["us"],
-        "position": ["DF"],
-        "birth_year": 1998,
-    },
-    "Carlos-Salcedo": {
-        "id": "64c07ae1",
-        "nationality": ["mx"],
-        "position": ["DF"],
-        "birth_year": 1993,
-    },
-    "Shea-Salinas": {
-        "id": "4c10838d",
-        "nationality": ["us"],
-        "position": ["FW", "DF"],
-        "birth_year": 1986,
-    },
-    "D\u00e1niel-Sall\u00f3i": {
-        "id": "6fcddf5f",
-        "nationality": ["hu"],
-        "position": ["FW", "MF"],
-        "birth_year": 1996,
-    },
-    "Gaoussou-Samak\u00e9": {
-        "id": "ae760cf4",
-        "nationality": ["ci"],
-        "position": ["DF"],
-        "birth_year": 1997,
-    },
-    "Ilie-S\u00e1nchez": {
-        "id": "72979f65",
-        "nationality": ["es"],
-        "position": ["MF"],
-        "birth_year": 1990,
-    },
-    "William-Sands": {
-        "id": "960a4473",
-        "nationality": ["us"],
-        "position": ["DF"],
-        "birth_year": 2000,
-    },
-    "Sergio-Santos-Gomes": {
-        "id": "a930b263",
-        "nationality": ["br"],
-        "position": ["FW"],
-        "birth_year": 1994,
-    },
-    "Koa-Santos": {
-        "id": "c09ddc5e",
-        "nationality": ["us"],
-        "position": ["MF"],
-        "birth_year": 1999,
-    },
-    "Nuno-Santos": {
-        "id": "6fc57554",
-        "nationality": ["pt"],
-        "position": ["MF", "FW"],
-        "birth_year": 1999,
-    },
-    "Pedro-Santos": {
-        "id": "789da0f2",
-        "nationality": ["pt"],
-        "position": ["DF"],
-        "birth_year": 1988,
-    },
-    "C.J.-Sapong": {
-        "id": "ef4e4c5d",
-        "nationality": ["us"],
-        "position": ["FW"],
-        "birth_year": 1988,
-    },
-    "Jefferson-Savarino": {
-        "id": "91721722",
-        "nationality": ["ve"],
-        "position": ["FW", "MF"],
-        "birth_year": 1996,
-    },
-    "Rodrigo-Schlegel": {
-        "id": "5bb02df4",
-        "nationality": ["ar"],
-        "position": ["DF"],
-        "birth_year": 1997,
-    },
-    "Tate-Schmitt": {
-        "id": "fa21bbc8",
-        "nationality": ["us"],
-        "position": ["DF", "MF"],
-        "birth_year": 1997,
-    },
-    "Alessandro-Sch\u00f6pf": {
-        "id": "106bca06",
-        "nationality": ["at"],
-        "position": ["MF"],
-        "birth_year": 1994,
-    },
-    "Eddie-Segura": {
-        "id": "c70e3fe0",
-        "nationality": ["co"],
-        "position": ["DF"],
-        "birth_year": 1997,
-    },
-    "Amar-Sejdic": {
-        "id": "43ca2019",
-        "nationality": ["us"],
-        "position": ["MF"],
-        "birth_year": 1996,
-    },
-    "Boris-Sekuli\u0107": {
-        "id": "adf26bd4",
-        "nationality": ["sk"],
-        "position": ["DF"],
-        "birth_year": 1991,
-    },
-    "Brandon-Servania": {
-        "id": "4d825a2d",
-        "nationality": ["us"],
-        "position": ["MF"],
-        "birth_year": 1999,
-    },
-    "Jacob-Shaffelburg": {
-        "id": "339a2561",
-        "nationality": ["ca"],
-        "position": ["MF", "FW"],
-        "birth_year": 1999,
-    },
-    "Xherdan-Shaqiri": {
-        "id": "6421ec64",
-        "nationality": ["ch"],
-        "position": ["MF"],
-        "birth_year": 1991,
-    },
-    "Brek-Shea": {
-        "id": "adb6ae24",
-        "nationality": ["us"],
-        "position": ["DF"],
-        "birth_year": 1990,
-    },
-    "Khiry-Shelton": {
-        "id": "f935709c",
-        "nationality": ["us"],
-        "position": ["FW"],
-        "birth_year": 1993,
-    },
-    "Andre-Shinyashiki": {
-        "id": "8c395868",
-        "nationality": ["br"],
-        "position": ["MF", "FW"],
-        "birth_year": 1995,
-    },
-    "Bobby-Shuttleworth": {
-        "id": "4598ac94",
-        "nationality": ["us"],
-        "position": ["GK"],
-        "birth_year": 1987,
-    },
-    "Marcelo-Silva": {
-        "id": "b9596515",
-        "nationality": ["uy"],
-        "position": ["DF"],
-        "birth_year": 1989,
-    },
-    "Pablo-Sisniega": {
-        "id": "550557e1",
-        "nationality": ["mx"],
-        "position": ["GK"],
-        "birth_year": 1995,
-    },
-    "Jack-Skahan": {
-        "id": "9c07bdc7",
-        "nationality": ["us"],
-        "position": ["DF", "MF"],
-        "birth_year": 1998,
-    },
-    "Drew-Skundrich": {
-        "id": "51f50135",
-        "nationality": ["us"],
-        "position": ["MF", "DF"],
-        "birth_year": 1995,
-    },
-    "Gaga-Slonina": {
-        "id": "c55a846e",
-        "nationality": ["us"],
-        "position": ["GK"],
-        "birth_year": 2004,
-    },
-    "Brad-Smith": {
-        "id": "c76c717c",
-        "nationality": ["au"],
-        "position": ["DF"],
-        "birth_year": 1994,
-    },
-    "Kimarni-Smith": {
-        "id": "bbbb244b",
-        "nationality": ["eng"],
-        "position": ["DF", "MF"],
-        "birth_year": 1998,
-    },
-    "Kyle-Smith": {
-        "id": "9e6b2ec3",
-        "nationality": ["us"],
-        "position": ["DF"],
-        "birth_year": 1992,
-    },
-    "Jan-Soboci\u0144ski": {
-        "id": "5358009d",
-        "nationality": ["pl"],
-        "position": ["DF"],
-        "birth_year": 1999,
-    },
-    "Santiago-Sosa": {
-        "id": "f080dd22",
-        "nationality": ["ar"],
-        "position": ["MF"],
-        "birth_year": 1999,
-    },
-    "Ryan-Spaulding": {
-        "id": "9fda5cd3",
-        "nationality": ["us"],
-        "position": ["DF"],
-        "birth_year": 1998,
-    },
-    "Steven-Sserwadda": {
-        "id": "bddc8df4",
-        "nationality": ["ug"],
-        "position": ["MF"],
-        "birth_year": 2002,
-    },
-    "Dayne-St.-Clair": {
-        "id": "3f41d25f",
-        "nationality": ["ca"],
-        "position": ["GK"],
-        "birth_year": 1997,
-    },
-    "Mason-Stajduhar": {
-        "id": "f01df62c",
-        "nationality": ["us"],
-        "position": ["GK"],
-        "birth_year": 1997,
-    },
-    "Daniel-Steres": {
-        "id": "17c03c76",
-        "nationality": ["us"],
-        "position": ["DF"],
-        "birth_year": 1990,
-    },
-    "Jared-Stroud": {
-        "id": "5d018899",
-        "nationality": ["us"],
-        "position": ["MF", "FW"],
-        "birth_year": 1996,
-    },
-    "Brad-Stuver": {
-        "id": "6a1940d5",
-        "nationality": ["us"],
-        "position": ["GK"],
-        "birth_year": 1991,
-    },
-    "Quinn-Sullivan": {
-        "id": "92f62cfe",
-        "nationality": ["us"],
-        "position": ["FW", "MF"],
-        "birth_year": 2004,
-    },
-    "Ben-Sweat": {
-        "id": "6937b1ac",
-        "nationality": ["us"],
-        "position": ["DF"],
-        "birth_year": 1991,
-    },
-    "Karol-\u015awiderski": {
-        "id": "41723204",
-        "nationality": ["pl"],
-        "position": ["FW", "MF"],
-        "birth_year": 1997,
-    },
-    "Nkosi-Tafari": {
-        "id": "4a07ae31",
-        "nationality": ["us"],
-        "position": ["DF"],
-        "birth_year": 1997,
-    },
-    "Ismael-Tajouri-Shradi": {
-        "id": "ef4249ff",
-        "nationality": ["ly"],
-        "position": ["FW", "MF"],
-        "birth_year": 1994,
-    },
-    "Andrew-Tarbell": {
-        "id": "c5487a34",
-        "nationality": ["us"],
-        "position": ["GK"],
-        "birth_year": 1993,
-    },
-    "D.J.-Taylor": {
-        "id": "ed4dc7f4",
-        "nationality": ["us"],
-        "position": ["DF"],
-        "birth_year": 1997,
-    },
-    "Robert-Taylor": {
-        "id": "1fc0973f",
-        "nationality": ["fi"],
-        "position": ["MF", "FW"],
-        "birth_year": 1994,
-    },
-    "Russell-Teibert": {
-        "id": "674befe9",
-        "nationality": ["ca"],
-        "position": ["MF"],
-        "birth_year": 1992,
-    },
-    "Cristian-Tello": {
-        "id": "72a99e38",
-        "nationality": ["es"],
-        "position": ["FW", "MF"],
-        "birth_year": 1991,
-    },
-    "Carlos-Ter\u00e1n": {
-        "id": "324509e2",
-        "nationality": ["co"],
-        "position": ["DF"],
-        "birth_year": 2000,
-    },
-    "Dylan-Teves": {
-        "id": "f68ed3ba",
-        "nationality": ["us"],
-        "position": ["FW", "MF"],
-        "birth_year": 2000,
-    },
-    "Thiago": {
-        "id": "6adb0b79",
-        "nationality": ["br"],
-        "position": ["FW"],
-        "birth_year": 2000,
-    },
-    "Erik-Thommy": {
-        "id": "df8e7b62",
-        "nationality": ["de"],
-        "position": ["MF"],
-        "birth_year": 1994,
-    },
-    "Kosi-Thompson": {
-        "id": "517bef8b",
-        "nationality": ["ca"],
-        "position": ["DF", "MF"],
-        "birth_year": 2003,
-    },
-    "Tommy-Thompson": {
-        "id": "5f6c69d8",
-        "nationality": ["us"],
-        "position": ["DF"],
-        "birth_year": 1995,
-    },
-    "Anton-Tinnerholm": {
-        "id": "0fe96099",
-        "nationality": ["se"],
-        "position": ["DF", "MF"],
-        "birth_year": 1991,
-    },
-    "John-Tolkin": {
-        "id": "5e88c524",
-        "nationality": ["us"],
-        "position": ["DF", "MF"],
-        "birth_year": 2002,
-    },
-    "Nouhou-Tolo": {
-        "id": "0796512f",
-        "nationality": ["cm"],
-        "position": ["DF"],
-        "birth_year": 1997,
-    },
-    "Facundo-Torres": {
-        "id": "4de3b2c0",
-        "nationality": ["uy"],
-        "position": ["FW", "MF"],
-        "birth_year": 2000,
-    },
-    "Jairo-Torres": {
-        "id": "7ed56490",
-        "nationality": ["mx"],
-        "position": ["FW", "MF"],
-        "birth_year": 2000,
-    },
-    "Joaqu\u00edn-Torres": {
-        "id": "c82dcb70",
-        "nationality": ["ar"],
-        "position": ["MF", "FW"],
-        "birth_year": 1997,
-    },
-    "Dantouma-Toure": {
-        "id": "b5d2014f",
-        "nationality": ["gn"],
-        "position": ["FW", "MF"],
-        "birth_year": 2004,
-    },
-    "Mason-Toye": {
-        "id": "0aa41f67",
-        "nationality": ["us"],
-        "position": ["FW"],
-        "birth_year": 1998,
-    },
-    "Wil-Trapp": {
-        "id": "9bf9391c",
-        "nationality": ["us"],
-        "position": ["MF"],
-        "birth_year": 1993,
-    },
-    "Miguel-Trauco": {
-        "id": "e4b72e34",
-        "nationality": ["pe"],
-        "position": ["DF"],
-        "birth_year": 1992,
-    },
-    "Danny-Trejo": {
-        "id": "1312c534",
-        "nationality": ["us"],
-        "position": ["FW"],
-        "birth_year": 1998,
-    },
-    "Auston-Trusty": {
-        "id": "cddf767b",
-        "nationality": ["us"],
-        "position": ["DF"],
-        "birth_year": 1998,
-    },
-    "Niko-Tsakiris": {
-        "id": "cb501677",
-        "nationality": ["us"],
-        "position": ["MF"],
-        "birth_year": 2005,
-    },
-    "Bill-Tuiloma": {
-        "id": "bf547c54",
-        "nationality": ["nz"],
-        "position": ["DF"],
-        "birth_year": 1995,
-    },
-    "Matt-Turner": {
-        "id": "4a51ba65",
-        "nationality": ["us"],
-        "position": ["GK"],
-        "birth_year": 1994,
-    },
-    "Ema-Twumasi": {
-        "id": "9ca4b140",
-        "nationality": ["gh"],
-        "position": ["DF"],
-        "birth_year": 1997,
-    },
-    "Marinos-Tzionis": {
-        "id": "b004076a",
-        "nationality": ["cy"],
-        "position": ["FW", "MF"],
-        "birth_year": 2001,
-    },
-    "Mikael-Uhre": {
-        "id": "be84c466",
-        "nationality": ["dk"],
-        "position": ["FW"],
-        "birth_year": 1994,
-    },
-    "\u00deorleifur-\u00dalfarsson": {
-        "id": "7e1046fa",
-        "nationality": ["is"],
-        "position": ["FW"],
-        "birth_year": 2000,
-    },
-    "Victor-Ulloa": {
-        "id": "e7056f05",
-        "nationality": ["us"],
-        "position": ["MF", "DF"],
-        "birth_year": 1992,
-    },
-    "Maximiliano-Urruti": {
-        "id": "6c8fb474",
-        "nationality": ["ar"],
-        "position": ["FW"],
-        "birth_year": 1991,
-    },
-    "J\u00fanior-Urso": {
-        "id": "b40424f1",
-        "nationality": ["br"],
-        "position": ["MF", "FW"],
-        "birth_year": 1989,
-    },
-    "Jhojan-Valencia": {
-        "id": "3fbe573e",
-        "nationality": ["co"],
-        "position": ["MF"],
-        "birth_year": 1996,
-    },
-    "Zarek-Valentin": {
-        "id": "f0d23e7b",
-        "nationality": ["pr"],
-        "position": ["DF"],
-        "birth_year": 1991,
-    },
-    "Gustavo-Vallecilla": {
-        "id": "2ce88662",
-        "nationality": ["ec"],
-        "position": ["DF"],
-        "birth_year": 1999,
-    },
-    "Jos\u00e9-Van-Rankin": {
-        "id": "09ce2ebe",
-        "nationality": ["mx"],
-        "position": ["DF"],
-        "birth_year": 1993,
-    },
-    "Kerwin-Vargas": {
-        "id": "758de7b4",
-        "nationality": ["co"],
-        "position": ["FW", "MF"],
-        "birth_year": 2002,
-    },
-    "Obed-Vargas": {
-        "id": "9cc1fde4",
-        "nationality": ["us"],
-        "position": ["MF", "FW"],
-        "birth_year": 2005,
-    },
-    "Indiana-Vassilev": {
-        "id": "04e195ee",
-        "nationality": ["us"],
-        "position": ["FW", "MF"],
-        "birth_year": 2001,
-    },
-    "Brandon-Vazquez": {
-        "id": "c570cf22",
-        "nationality": ["us"],
-        "position": ["FW"],
-        "birth_year": 1998,
-    },
-    "V\u00edctor-V\u00e1zquez": {
-        "id": "6c564d36",
-        "nationality": ["es"],
-        "position": ["MF", "FW"],
-        "birth_year": 1987,
-    },
-    "Carlos-Vela": {
-        "id": "e0cd04e0",
-        "nationality": ["mx"],
-        "position": ["FW", "MF"],
-        "birth_year": 1989,
-    },
-    "Alan-Velasco": {
-        "id": "16349210",
-        "nationality": ["ar"],
-        "position": ["FW"],
-        "birth_year": 2002,
-    },
-    "Mat\u00edas-Vera": {
-        "id": "fe529f25",
-        "nationality": ["ar"],
-        "position": ["MF"],
-        "birth_year": 1995,
-    },
-    "Ranko-Veselinovi\u0107": {
-        "id": "366609b6",
-        "nationality": ["rs"],
-        "position": ["DF"],
-        "birth_year": 1999,
-    },
-    "Pedro-Vite": {
-        "id": "9c146b36",
-        "nationality": ["ec"],
-        "position": ["MF", "FW"],
-        "birth_year": 2002,
-    },
-    "Robert-Voloder": {
-        "id": "33d9d789",
-        "nationality": ["ba"],
-        "position": ["DF"],
-        "birth_year": 2001,
-    },
-    "Giacomo-Vrioni": {
-        "id": "bf4d31d3",
-        "nationality": ["al"],
-        "position": ["FW"],
-        "birth_year": 1998,
-    },
-    "Nikola-Vujnovi\u0107": {
-        "id": "128d62ba",
-        "nationality": ["me"],
-        "position": ["FW"],
-        "birth_year": 1997,
-    },
-    "Kai-Wagner": {
-        "id": "fdc715d9",
-        "nationality": ["de"],
-        "position": ["DF"],
-        "birth_year": 1997,
-    },
-    "Anton-Walkes": {
-        "id": "8a062bba",
-        "nationality": ["eng"],
-        "position": ["DF"],
-        "birth_year": 1997,
-    },
-    "R\u00e9mi-Walter": {
-        "id": "0984c5d5",
-        "nationality": ["fr"],
-        "position": ["MF"],
-        "birth_year": 1995,
-    },
-    "Victor-Wanyama": {
-        "id": "e0900238",
-        "nationality": ["ke"],
-        "position": ["MF"],
-        "birth_year": 1991,
-    },
-    "Collen-Warner": {
-        "id": "75babbce",
-        "nationality": ["us"],
-        "position": ["MF"],
-        "birth_year": 1988,
-    },
-    "Taylor-Washington": {
-        "id": "480d3bcc",
-        "nationality": ["us"],
-        "position": ["DF", "MF"],
-        "birth_year": 1993,
-    },
-    "Joel-Waterman": {
-        "id": "47ddcc22",
-        "nationality": ["ca"],
-        "position": ["DF"],
-        "birth_year": 1996,
-    },
-    "Quentin-Westberg": {
-        "id": "5480ae05",
-        "nationality": ["us"],
-        "position": ["GK"],
-        "birth_year": 1986,
-    },
-    "Brian-White": {
-        "id": "54c948de",
-        "nationality": ["us"],
-        "position": ["FW"],
-        "birth_year": 1996,
-    },
-    "Caleb-Wiley": {
-        "id": "64796fe0",
-        "nationality": ["us"],
-        "position": ["DF", "FW"],
-        "birth_year": 2004,
-    },
-    "Derrick-Williams": {
-        "id": "c0a28fbd",
-        "nationality": ["ie"],
-        "position": ["DF"],
-        "birth_year": 1993,
-    },
-    "Josh-Williams": {
-        "id": "06098bfc",
-        "nationality": ["us"],
-        "position": ["DF"],
-        "birth_year": 1988,
-    },
-    "Thomas-Williams": {
-        "id": "d46d1cdd",
-        "nationality": ["us"],
-        "position": ["DF"],
-        "birth_year": 2004,
-    },
-    "Eryk-Williamson": {
-        "id": "e0364352",
-        "nationality": ["us"],
-        "position": ["MF"],
-        "birth_year": 1997,
-    },
-    "Joe-Willis": {
-        "id": "467f09c8",
-        "nationality": ["us"],
-        "position": ["GK"],
-        "birth_year": 1988,
-    },
-    "Danny-Wilson": {
-        "id": "9cfe9254",
-        "nationality": ["sct"],
-        "position": ["DF"],
-        "birth_year": 1991,
-    },
-    "Owen-Wolff": {
-        "id": "9edc70d6",
-        "nationality": ["us"],
-        "position": ["FW", "MF"],
-        "birth_year": 2004,
-    },
-    "Tyler-Wolff": {
-        "id": "0985c282",
-        "nationality": ["us"],
-        "position": ["FW", "MF"],
-        "birth_year": 2003,
-    },
-    "Bobby-Wood": {
-        "id": "9853983f",
-        "nationality": ["us"],
-        "position": ["FW"],
-        "birth_year": 1992,
-    },
-    "Darren-Yapi": {
-        "id": "63abd734",
-        "nationality": ["us"],
-        "position": ["FW", "MF"],
-        "birth_year": 2004,
-    },
-    "William-Yarbrough": {
-        "id": "ec646e88",
-        "nationality": ["us"],
-        "position": ["GK"],
-        "birth_year": 1989,
-    },
-    "Dru-Yearwood": {
-        "id": "2eb09121",
-        "nationality": ["eng"],
-        "position": ["MF"],
-        "birth_year": 2000,
-    },
-    "Steffen-Yeattes": {
-        "id": "bf89f7a7",
-        "nationality": ["ca"],
-        "position": ["DF", "MF"],
-        "birth_year": 2000,
-    },
-    "Yaw-Yeboah": {
-        "id": "36292031",
-        "nationality": ["gh"],
-        "position": ["FW"],
-        "birth_year": 1997,
-    },
-    "DeAndre-Yedlin": {
-        "id": "ae0a7ddf",
-        "nationality": ["us"],
-        "position": ["DF"],
-        "birth_year": 1993,
-    },
-    "Griffin-Yow": {
-        "id": "ddd5cf39",
-        "nationality": ["us"],
-        "position": ["MF", "DF"],
-        "birth_year": 2002,
-    },
-    "Jackson-Yueill": {
-        "id": "7dce16bf",
-        "nationality": ["us"],
-        "position": ["MF", "DF"],
-        "birth_year": 1997,
-    },
-    "Abdoul-Zanne": {
-        "id": "e5b49f0e",
-        "nationality": ["ci"],
-        "position": ["FW"],
-        "birth_year": 2003,
-    },
-    "Gyasi-Zardes": {
-        "id": "09ae7f92",
-        "nationality": ["us"],
-        "position": ["FW"],
-        "birth_year": 1991,
-    },
-    "Eriq-Zavaleta": {
-        "id": "edbfbb3f",
-        "nationality": ["sv"],
-        "position": ["DF", "MF"],
-        "birth_year": 1992,
-    },
-    "Sean-Zawadzki": {
-        "id": "380ee265",
-        "nationality": ["us"],
-        "position": ["MF"],
-        "birth_year": 2000,
-    },
-    "Zeca": {
-        "id": "c816eea6",
-        "nationality": ["pt"],
-        "position": ["MF"],
-        "birth_year": 1975,
-    },
-    "Gedion-Zelalem": {
-        "id": "b15ac68f",
-        "nationality": ["us"],
-        "position": ["MF", "FW"],
-        "birth_year": 1997,
-    },
-    "Lucas-Zelaray\u00e1n": {
-        "id": "3ce30893",
-        "nationality": ["am"],
-        "position": ["MF", "FW"],
-        "birth_year": 1992,
-    },
-    "Walker-Zimmerman": {
-        "id": "220fa883",
-        "nationality": ["us"],
-        "position": ["DF"],
-        "birth_year": 1993,
-    },
-    "Rida-Zouhir": {
-        "id": "e1e65f24",
-        "nationality": ["ca"],
-        "position": ["MF"],
-        "birth_year": 2003,
-    },
-    "Ethan-Zubak": {
-        "id": "9f39b6cf",
-        "nationality": ["us"],
-        "position": ["FW"],
-        "birth_year": 1998,
-    },
-    "Dario-\u017dupari\u0107": {
-        "id": "c6f99e42",
-        "nationality": ["ba"],
-        "position": ["DF"],
-        "birth_year": 1992,
-    },
-    "Graham-Zusi": {
-        "id": "9ba42447",
-        "nationality": ["us"],
-        "position": ["DF"],
-        "birth_year": 1986,
-    },
-    "R\u00f3bert-\u00deorkelsson": {
-        "id": "0eb8ad80",
-        "nationality": ["is"],
-        "position": ["DF", "MF"],
-        "birth_year": 2002,
-    },
-    "Elias-Aarflot": {
-        "id": "f470e10a",
-        "nationality": ["no"],
-        "position": ["MF"],
-        "birth_year": 2003,
-    },
-    "Syver-Aas": {
-        "id": "b25d02b7",
-        "nationality": ["no"],
-        "position": ["MF", "FW"],
-        "birth_year": 2004,
-    },
-    "Christoffer-Aasbak": {
-        "id": "d77f1a42",
-        "nationality": ["no"],
-        "position": ["DF"],
-        "birth_year": 1993,
-    },
-    "Jonas-El-Abdellaoui": {
-        "id": "262553da",
-        "nationality": ["no"],
-        "position": ["FW"],
-        "birth_year": 2006,
-    },
-    "Jibril-Abubakar": {
-        "id": "aaf1d561",
-        "nationality": ["ng"],
-        "position": ["FW"],
-        "birth_year": 2000,
-    },
-    "Akor-Adams": {
-        "id": "2ccd39ed",
-        "nationality": ["ng"],
-        "position": ["FW"],
-        "birth_year": 2000,
-    },
-    "David-Agbo": {
-        "id": "bb2e18fc",
-        "nationality": ["gh"],
-        "position": ["MF"],
-        "birth_year": 2000,
-    },
-    "P\u00e5l-Alexander-Kirkevold": {
-        "id": "60dc8778",
-        "nationality": ["no"],
-        "position": ["FW"],
-        "birth_year": 1990,
-    },
-    "Philip-Alexander-Sl\u00f8rdahl": {
-        "id": "d442ad04",
-        "nationality": ["no"],
-        "position": ["DF"],
-        "birth_year": 2000,
-    },
-    "Marius-Alm": {
-        "id": "0490eb25",
-        "nationality": ["no"],
-        "position": ["DF"],
-        "birth_year": 1997,
-    },
-    "Alexander-Ammitzb\u00f8ll": {
-        "id": "0d1c3981",
-        "nationality": ["dk"],
-        "position": ["FW"],
-        "birth_year": 1999,
-    },
-    "Isak-Amundsen": {
-        "id": "7fdb872a",
-        "nationality": ["no"],
-        "position": ["DF"],
-        "birth_year": 1999,
-    },
-    "Benjamin-Andersen": {
-        "id": "f5f1e9c8",
-        "nationality": ["no"],
-        "position": ["MF"],
-        "birth_year": 2005,
-    },
-    "Adam-Andersson": {
-        "id": "ecf8b85f",
-        "nationality": ["se"],
-        "position": ["MF"],
-        "birth_year": 1996,
-    },
-    "P\u00e5l-Andr\u00e9-Helland": {
-        "id": "ef8f266e",
-        "nationality": ["no"],
-        "position": ["FW"],
-        "birth_year": 1990,
-    },
-    "Markus-Andreas-Kaasa": {
-        "id": "0a7fa520",
-        "nationality": ["no"],
-        "position": ["MF"],
-        "birth_year": 1997,
-    },
-    "Aleksander-Andreassen": {
-        "id": "5a3fda90",
-        "nationality": ["no"],
-        "position": ["MF", "DF"],
-        "birth_year": 1989,
-    },
-    "Isaac-Annan": {
-        "id": "32bc5860",
-        "nationality": ["gh"],
-        "position": ["DF"],
-        "birth_year": 2001,
-    },
-    "Kent-Are-Antonsen": {
-        "id": "f374a4b3",
-        "nationality": ["no"],
-        "position": ["DF", "MF"],
-        "birth_year": 1995,
-    },
-    "Rodney-Antwi": {
-        "id": "f30c6a09",
-        "nationality": ["nl"],
-        "position": ["MF", "FW"],
-        "birth_year": 1995,
-    },
-    "Daniel-Arrocha": {
-        "id": "44d3262d",
-        "nationality": ["dk"],
-        "position": ["DF"],
-        "birth_year": 1995,
-    },
-    "Gjermund-\u00c5sen": {
-        "id": "6b767188",
-        "nationality": ["no"],
-        "position": ["MF", "FW"],
-        "birth_year": 1991,
-    },
-    "Amin-Askar": {
-        "id": "940efd73",
-        "nationality": ["et"],
-        "position": ["MF", "DF"],
-        "birth_year": 1985,
-    },
-    "Jonathan-Augustinsson": {
-        "id": "7311c03b",
-        "nationality": ["se"],
-        "position": ["DF"],
-        "birth_year": 1996,
-    },
-    "Sondre-Auklend": {
-        "id": "aa744585",
-        "nationality": ["no"],
-        "position": ["MF"],
-        "birth_year": 2003,
-    },
-    "Edvin-Austb\u00f8": {
-        "id": "fbde2933",
-        "nationality": ["no"],
-        "position": ["FW"],
-        "birth_year": 2005,
-    },
-    "Keanin-Ayer-Boya": {
-        "id": "5b5c4d01",
-        "nationality": ["za"],
-        "position": ["MF", "DF"],
-        "birth_year": 2000,
-    },
-    "Johan-Bakke": {
-        "id": "63b56730",
-        "nationality": ["no"],
-        "position": ["MF"],
-        "birth_year": 2004,
-    },
-    "Kristoffer-Barmen": {
-        "id": "0f89f7b3",
-        "nationality": ["no"],
-        "position": ["MF"],
-        "birth_year": 1993,
-    },
-    "Clement-Bayiha": {
-        "id": "ca9f2034",
-        "nationality": ["ca"],
-        "position": ["MF", "DF"],
-        "birth_year": 1999,
-    },
-    "Patrick-Berg": {
-        "id": "e4114f5d",
-        "nationality": ["no"],
-        "position": ["MF"],
-        "birth_year": 1997,
-    },
-    "Veton-Berisha": {
-        "id": "9c145144",
-        "nationality": ["no"],
-        "position": ["FW"],
-        "birth_year": 1994,
-    },
-    "Federico-Bikoro": {
-        "id": "ed28f256",
-        "nationality": ["gq"],
-        "position": ["MF"],
-        "birth_year": 1996,
-    },
-    "Henrik-Bj\u00f8rdal": {
-        "id": "7e2c5d75",
-        "nationality": ["no"],
-        "position": ["MF"],
-        "birth_year": 1997,
-    },
-    "Morten-Bj\u00f8rlo": {
-        "id": "5131b5b3",
-        "nationality": ["no"],
-        "position": ["MF"],
-        "birth_year": 1995,
-    },
-    "Martin-Bj\u00f8rnbak": {
-        "id": "eb49bd3f",
-        "nationality": ["no"],
-        "position": ["DF"],
-        "birth_year": 1992,
-    },
-    "Sondre-Bj\u00f8rshol": {
-        "id": "d9e76115",
-        "nationality": ["no"],
-        "position": ["DF", "MF"],
-        "birth_year": 1994,
-    },
-    "Eirik-Blikstad": {
-        "id": "095e79b2",
-        "nationality": ["no"],
-        "position": ["DF"],
-        "birth_year": 2004,
-    },
-    "Ernest-Boahene": {
-        "id": "103b2b0a",
-        "nationality": ["gh"],
-        "position": ["DF"],
-        "birth_year": 2000,
-    },
-    "Simen-Bolkan-Nordli": {
-        "id": "c33f3864",
-        "nationality": ["no"],
-        "position": ["FW", "MF"],
-        "birth_year": 1999,
-    },
-    "Mathis-Bolly": {
-        "id": "e9895d1c",
-        "nationality": ["ci"],
-        "position": ["FW", "MF"],
-        "birth_year": 1990,
-    },
-    "Victor-Boniface": {
-        "id": "b146275b",
-        "nationality": ["ng"],
-        "position": ["FW"],
-        "birth_year": 2000,
-    },
-    "Jonatan-Braut-Brunes": {
-        "id": "36adbbe0",
-        "nationality": ["no"],
-        "position": ["FW"],
-        "birth_year": 2000,
-    },
-    "Henrik-Bredeli": {
-        "id": "6cb21e8a",
-        "nationality": ["no"],
-        "position": ["DF"],
-        "birth_year": 1998,
-    },
-    "Emil-Breivik": {
-        "id": "611f4f60",
-        "nationality": ["no"],
-        "position": ["MF"],
-        "birth_year": 2000,
-    },
-    "David-Brekalo": {
-        "id": "fd594b15",
-        "nationality": ["si"],
-        "position": ["DF"],
-        "birth_year": 1998,
-    },
-    "Josef-Brian-Baccay": {
-        "id": "ea005201",
-        "nationality": ["no"],
-        "position": ["DF", "MF"],
-        "birth_year": 2001,
-    },
-    "Marius-Broholm": {
-        "id": "b5d543e4",
-        "nationality": ["no"],
-        "position": ["MF"],
-        "birth_year": 2004,
-    },
-    "Sondre-Brunstad-Fet": {
-        "id": "c1d9bf1f",
-        "nationality": ["no"],
-        "position": ["MF"],
-        "birth_year": 1997,
-    },
-    "Heine-Bruseth-": {
-        "id": "5f004975",
-        "nationality": ["no"],
-        "position": ["MF"],
-        "birth_year": 2004,
-    },
-    "Ola-Brynhildsen": {
-        "id": "ffe5ecdb",
-        "nationality": ["no"],
-        "position": ["FW"],
-        "birth_year": 1999,
-    },
-    "Bendik-Bye": {
-        "id": "fed73448",
-        "nationality": ["no"],
-        "position": ["FW", "MF"],
-        "birth_year": 1990,
-    },
-    "Anders-B\u00e6rtelsen": {
-        "id": "d234b7e7",
-        "nationality": ["dk"],
-        "position": ["DF"],
-        "birth_year": 2000,
-    },
-    "Tobias-B\u00f8rkeeiet": {
-        "id": "2d54d501",
-        "nationality": ["no"],
-        "position": ["MF", "DF"],
-        "birth_year": 1999,
-    },
-    "Anders-B\u00f8rset": {
-        "id": "6ace6343",
-        "nationality": ["no"],
-        "position": ["DF"],
-        "birth_year": 2006,
-    },
-    "Torgeir-B\u00f8rven": {
-        "id": "1ff40741",
-        "nationality": ["no"],
-        "position": ["FW"],
-        "birth_year": 1991,
-    },
-    "Dario-\u010cana\u0111ija": {
-        "id": "da933459",
-        "nationality": ["hr"],
-        "position": ["MF"],
-        "birth_year": 1994,
-    },
-    "Mikkel-Ceide": {
-        "id": "1318200b",
-        "nationality": ["no"],
-        "position": ["DF"],
-        "birth_year": 2001,
-    },
-    "Youssef-Chaib": {
-        "id": "5ac4dd54",
-        "nationality": ["no"],
-        "position": ["FW"],
-        "birth_year": 1996,
-    },
-    "Magnus-Christensen": {
-        "id": "f3357915",
-        "nationality": ["dk"],
-        "position": ["MF"],
-        "birth_year": 1997,
-    },
-    "Tobias-Christensen": {
-        "id": "d87d58e7",
-        "nationality": ["no"],
-        "position": ["MF"],
-        "birth_year": 2000,
-    },
-    "Ole-Christian-S\u00e6ter": {
-        "id": "6f8fc4e0",
-        "nationality": ["no"],
-        "position": ["FW"],
-        "birth_year": 1996,
-    },
-    "Mads-Christiansen": {
-        "id": "0c872cdf",
-        "nationality": ["no"],
-        "position": ["GK"],
-        "birth_year": 2000,
-    },
-    "Pawel-Churpalla": {
-        "id": "8b4bce6e",
-        "nationality": ["no"],
-        "position": ["FW"],
-        "birth_year": 2003,
-    },
-    "Jeremy-Cijntje": {
-        "id": "028733b2",
-        "nationality": ["cw"],
-        "position": ["FW", "MF"],
-        "birth_year": 1998,
-    },
-    "Per-Ciljan-Skjelbred": {
-        "id": "ecab64a0",
-        "nationality": ["no"],
-        "position": ["MF"],
-        "birth_year": 1987,
-    },
-    "Aliou-Coly": {
-        "id": "027bd318",
-        "nationality": ["sn"],
-        "position": ["DF"],
-        "birth_year": 1992,
-    },
-    "Leo-Cornic": {
-        "id": "b3f8e966",
-        "nationality": ["no"],
-        "position": ["DF"],
-        "birth_year": 2001,
-    },
-    "Erlend-Dahl-Reitan": {
-        "id": "6b14ce11",
-        "nationality": ["no"],
-        "position": ["MF", "DF"],
-        "birth_year": 1997,
-    },
-    "Rolf-Daniel-Vikst\u00f8l": {
-        "id": "403d44ed",
-        "nationality": ["no"],
-        "position": ["DF", "MF"],
-        "birth_year": 1989,
-    },
-    "Emmanuel-Danso": {
-        "id": "5a6a7f5c",
-        "nationality": ["gh"],
-        "position": ["MF"],
-        "birth_year": 2000,
-    },
-    "Brynjolfur-Darri-Willumsson": {
-        "id": "a597bf9a",
-        "nationality": ["is"],
-        "position": ["FW"],
-        "birth_year": 2000,
-    },
-    "Eduards-Da\u0161kevi\u010ds": {
-        "id": "cd17036b",
-        "nationality": ["lv"],
-        "position": ["MF"],
-        "birth_year": 2002,
-    },
-    "Amadou-Diallo": {
-        "id": "3151f070",
-        "nationality": ["gn"],
-        "position": ["MF", "FW"],
-        "birth_year": 1994,
-    },
-    "Mamadou-Diaw": {
-        "id": "f21907bc",
-        "nationality": ["sn"],
-        "position": ["FW"],
-        "birth_year": 2001,
-    },
-    "Adama-Diomande": {
-        "id": "336dbcb2",
-        "nationality": ["no"],
-        "position": ["FW"],
-        "birth_year": 1990,
-    },
-    "Amidou-Diop": {
-        "id": "f7f657a4",
-        "nationality": ["sn"],
-        "position": ["MF"],
-        "birth_year": 1992,
-    },
-    "Vetle-Dragsnes": {
-        "id": "6062bd22",
-        "nationality": ["no"],
-        "position": ["MF", "DF"],
-        "birth_year": 1994,
-    },
-    "Julian-Dunn-Johnson": {
-        "id": "220b5800",
-        "nationality": ["ca"],
-        "position": ["DF"],
-        "birth_year": 2000,
-    },
-    "Aron-D\u00f8nnum": {
-        "id": "10cff752",
-        "nationality": ["no"],
-        "position": ["FW", "MF"],
-        "birth_year": 1998,
-    },
-    "Moses-Ebiye": {
-        "id": "8bc0c3cd",
-        "nationality": ["ng"],
-        "position": ["FW"],
-        "birth_year": 1997,
-    },
-    "Vetle-Egeli": {
-        "id": "fed7524b",
-        "nationality": ["no"],
-        "position": ["MF"],
-        "birth_year": 2004,
-    },
-    "Vegar-Eggen-Hedenstad": {
-        "id": "a0313275",
-        "nationality": ["no"],
-        "position": ["DF"],
-        "birth_year": 1991,
-    },
-    "Mathias-Emilsen": {
-        "id": "eca45998",
-        "nationality": ["no"],
-        "position": ["MF"],
-        "birth_year": 2003,
-    },
-    "Jacob-Eng": {
-        "id": "b8b63e3e",
-        "nationality": ["no"],
-        "position": ["FW"],
-        "birth_year": 2004,
-    },
-    "Gustav-Engvall": {
-        "id": "680227aa",
-        "nationality": ["se"],
-        "position": ["FW"],
-        "birth_year": 1996,
-    },
-    "Jonas-Enkerud": {
-        "id": "4a4bf23a",
-        "nationality": ["no"],
-        "position": ["FW", "MF"],
-        "birth_year": 1990,
-    },
-    "Kristian-Eriksen": {
-        "id": "4353dd07",
-        "nationality": ["no"],
-        "position": ["FW", "MF"],
-        "birth_year": 1995,
-    },
-    "Julius-Eskesen": {
-        "id": "35753f28",
-        "nationality": ["dk"],
-        "position": ["MF", "FW"],
-        "birth_year": 1999,
-    },
-    "Runar-Espejord": {
-        "id": "16322a52",
-        "nationality": ["no"],
-        "position": ["FW"],
-        "birth_year": 1996,
-    },
-    "Fern\u00e1n-Faerr\u00f3n": {
-        "id": "3cf1f994",
-        "nationality": ["cr"],
-        "position": ["DF"],
-        "birth_year": 2000,
-    },
-    "David-F\u00e4llman": {
-        "id": "35981671",
-        "nationality": ["se"],
-        "position": ["DF"],
-        "birth_year": 1990,
-    },
-    "Benjamin-Faraas": {
-        "id": "3d6e5fdd",
-        "nationality": ["no"],
-        "position": ["MF"],
-        "birth_year": 2005,
-    },
-    "Kristian-Fardal-Opseth": {
-        "id": "769f9f28",
-        "nationality": ["no"],
-        "position": ["FW"],
-        "birth_year": 1990,
-    },
-    "Julian-Faye-Lund": {
-        "id": "ca3fff03",
-        "nationality": ["no"],
-        "position": ["GK"],
-        "birth_year": 1999,
-    },
-    "Leandro-Fernandes": {
-        "id": "e188b47f",
-        "nationality": ["nl"],
-        "position": ["MF"],
-        "birth_year": 1999,
-    },
-    "Bryan-Fiabema": {
-        "id": "78d458eb",
-        "nationality": ["no"],
-        "position": ["FW"],
-        "birth_year": 2003,
-    },
-    "Fredrik-Flo": {
-        "id": "4bd2d056",
-        "nationality": ["no"],
-        "position": ["DF"],
-        "birth_year": 1996,
-    },
-    "Datro-Fofana": {
-        "id": "e82900ef",
-        "nationality": ["ci"],
-        "position": ["FW"],
-        "birth_year": 2002,
-    },
-    "Sander-Foss": {
-        "id": "dd6c1712",
-        "nationality": ["no"],
-        "position": ["DF"],
-        "birth_year": 1998,
-    },
-    "Ulrik-Fredriksen": {
-        "id": "f8242397",
-        "nationality": ["no"],
-        "position": ["DF"],
-        "birth_year": 1999,
-    },
-    "Fred-Friday": {
-        "id": "fbaf247c",
-        "nationality": ["ng"],
-        "position": ["FW", "MF"],
-        "birth_year": 1995,
-    },
-    "H\u00f3lmbert-Fri\u00f0j\u00f3nsson": {
-        "id": "5e175384",
-        "nationality": ["is"],
-        "position": ["FW"],
-        "birth_year": 1993,
-    },
-    "Sam\u00fael-Fri\u00f0j\u00f3nsson": {
-        "id": "55557b25",
-        "nationality": ["is"],
-        "position": ["MF", "FW"],
-        "birth_year": 1996,
-    },
-    "Willis-Furtado": {
-        "id": "f901e984",
-        "nationality": ["cv"],
-        "position": ["MF", "FW"],
-        "birth_year": 1997,
-    },
-    "Espen-Garn\u00e5s": {
-        "id": "f0d43928",
-        "nationality": ["no"],
-        "position": ["DF"],
-        "birth_year": 1994,
-    },
-    "Renzo-Giampaoli": {
-        "id": "54d90093",
-        "nationality": ["ar"],
-        "position": ["DF"],
-        "birth_year": 2000,
-    },
-    "Dennis-Gjengaar": {
-        "id": "88a9b30e",
-        "nationality": ["no"],
-        "position": ["FW", "MF"],
-        "birth_year": 2004,
-    },
-    "Henrik-Gjesdal": {
-        "id": "d05d4e1b",
-        "nationality": ["no"],
-        "position": ["DF"],
-        "birth_year": 1993,
-    },
-    "Petar-Golubovi\u0107": {
-        "id": "78d38e39",
-        "nationality": ["rs"],
-        "position": ["DF", "MF"],
-        "birth_year": 1994,
-    },
-    "Hilary-Gong": {
-        "id": "f43c9b3f",
-        "nationality": ["ng"],
-        "position": ["FW"],
-        "birth_year": 1998,
-    },
-    "Albert-Gronbaek-Erlykke": {
-        "id": "0da5076f",
-        "nationality": ["dk"],
-        "position": ["MF", "FW"],
-        "birth_year": 2001,
-    },
-    "Sten-Grytebust": {
-        "id": "c9f11454",
-        "nationality": ["no"],
-        "position": ["GK"],
-        "birth_year": 1989,
-    },
-    "Magnus-Gr\u00f8dem": {
-        "id": "f6e8ee38",
-        "nationality": ["no"],
-        "position": ["MF", "FW"],
-        "birth_year": 1998,
-    },
-    "Thomas-Gr\u00f8gaard": {
-        "id": "836689d0",
-        "nationality": ["no"],
-        "position": ["DF"],
-        "birth_year": 1994,
-    },
-    "Tobias-Gulliksen": {
-        "id": "7f24d8d9",
-        "nationality": ["no"],
-        "position": ["FW", "MF"],
-        "birth_year": 2003,
-    },
-    "Jostein-Gundersen": {
-        "id": "bf4aca93",
-        "nationality": ["no"],
-        "position": ["DF"],
-        "birth_year": 1996,
-    },
-    "Niklas-Gunnarsson": {
-        "id": "64fbb7f4",
-        "nationality": ["no"],
-        "position": ["DF"],
-        "birth_year": 1991,
-    },
-    "Patrik-Gunnarsson": {
-        "id": "4d39152d",
-        "nationality": ["is"],
-        "position": ["GK"],
-        "birth_year": 2000,
-    },
-    "Sivert-Gussi\u00e5s": {
-        "id": "16855f19",
-        "nationality": ["no"],
-        "position": ["FW"],
-        "birth_year": 1999,
-    },
-    "Mats-Haakenstad": {
-        "id": "c85826b7",
-        "nationality": ["no"],
-        "position": ["DF"],
-        "birth_year": 1993,
-    },
-    "Mathias-Haarup": {
-        "id": "805d6207",
-        "nationality": ["dk"],
-        "position": ["DF"],
-        "birth_year": 1996,
-    },
-    "Tobias-Hafstad": {
-        "id": "b76eec70",
-        "nationality": ["no"],
-        "position": ["FW"],
-        "birth_year": 2002,
-    },
-    "Anders-Hagelskj\u00e6r": {
-        "id": "5c550ee1",
-        "nationality": ["dk"],
-        "position": ["DF"],
-        "birth_year": 1997,
-    },
-    "Elias-Hagen": {
-        "id": "7673e4bc",
-        "nationality": ["no"],
-        "position": ["MF"],
-        "birth_year": 2000,
-    },
-    "Nicholas-Hagen": {
-        "id": "4202ac27",
-        "nationality": ["gt"],
-        "position": ["GK"],
-        "birth_year": 1996,
-    },
-    "Steffen-Hagen": {
-        "id": "2ba1985a",
-        "nationality": ["no"],
-        "position": ["DF"],
-        "birth_year": 1986,
-    },
-    "Nikita-Haikin": {
-        "id": "60831426",
-        "nationality": ["ru"],
-        "position": ["GK"],
-        "birth_year": 1995,
-    },
-    "Daniel-H\u00e5kans": {
-        "id": "eb3cf40c",
-        "nationality": ["fi"],
-        "position": ["FW"],
-        "birth_year": 2000,
-    },
-    "Andr\u00e9-Hansen": {
-        "id": "5e91ddf8",
-        "nationality": ["no"],
-        "position": ["GK"],
-        "birth_year": 1989,
-    },
-    "Benjamin-Hansen": {
-        "id": "8916e76c",
-        "nationality": ["dk"],
-        "position": ["DF"],
-        "birth_year": 1994,
-    },
-    "Sondre-Hanssen": {
-        "id": "12ff6acb",
-        "nationality": ["no"],
-        "position": ["DF"],
-        "birth_year": 2001,
-    },
-    "Kjetil-Haug": {
-        "id": "d3ae48eb",
-        "nationality": ["no"],
-        "position": ["GK"],
-        "birth_year": 1998,
-    },
-    "Jakob-Haugaard": {
-        "id": "142741bb",
-        "nationality": ["dk"],
-        "position": ["GK"],
-        "birth_year": 1992,
-    },
-    "Eirik-Haugan": {
-        "id": "857411ed",
-        "nationality": ["no"],
-        "position": ["DF"],
-        "birth_year": 1997,
-    },
-    "Fredrik-Haugen": {
-        "id": "8b25b500",
-        "nationality": ["no"],
-        "position": ["MF"],
-        "birth_year": 1992,
-    },
-    "Herman-Haugen": {
-        "id": "da9f4fa3",
-        "nationality": ["no"],
-        "position": ["MF", "DF"],
-        "birth_year": 2000,
-    },
-    "Kristoffer-Haugen": {
-        "id": "52d7f819",
-        "nationality": ["no"],
-        "position": ["MF", "DF"],
-        "birth_year": 1994,
-    },
-    "Sigurd-Hauso-Haugen": {
-        "id": "70cf035e",
-        "nationality": ["no"],
-        "position": ["FW"],
-        "birth_year": 1997,
-    },
-    "Tobias-Heintz": {
-        "id": "a69cf944",
-        "nationality": ["no"],
-        "position": ["MF"],
-        "birth_year": 1998,
-    },
-    "Markus-Henriksen": {
-        "id": "26acecd2",
-        "nationality": ["no"],
-        "position": ["DF"],
-        "birth_year": 1992,
-    },
-    "Kobe-Hernandez-Foster": {
-        "id": "a928bb49",
-        "nationality": ["us"],
-        "position": ["MF"],
-        "birth_year": 2002,
-    },
-    "Vebj\u00f8rn-Hoff": {
-        "id": "7b462b1e",
-        "nationality": ["no"],
-        "position": ["MF"],
-        "birth_year": 1996,
-    },
-    "Noah-Holm": {
-        "id": "61b77d0a",
-        "nationality": ["no"],
-        "position": ["FW"],
-        "birth_year": 2001,
-    },
-    "Carlo-Holse": {
-        "id": "e248e62f",
-        "nationality": ["dk"],
-        "position": ["MF"],
-        "birth_year": 1999,
-    },
-    "Frederik-Holst": {
-        "id": "7f32741e",
-        "nationality": ["dk"],
-        "position": ["MF"],
-        "birth_year": 1994,
-    },
-    "Fabian-Holst-Larsen": {
-        "id": "38f1d514",
-        "nationality": ["no"],
-        "position": ["DF"],
-        "birth_year": 2004,
-    },
-    "Joacim-Holtan": {
-        "id": "019f68f4",
-        "nationality": ["no"],
-        "position": ["FW"],
-        "birth_year": 1998,
-    },
-    "Magnus-Holte": {
-        "id": "c4277d05",
-        "nationality": ["no"],
-        "position": ["FW"],
-        "birth_year": 2006,
-    },
-    "Nikolai-Hopland": {
-        "id": "72a1ac35",
-        "nationality": ["no"],
-        "position": ["DF"],
-        "birth_year": 2004,
-    },
-    "Andreas-Hopmark": {
-        "id": "62b38ef8",
-        "nationality": ["no"],
-        "position": ["DF", "MF"],
-        "birth_year": 1991,
-    },
-    "J\u00f8rgen-Horn": {
-        "id": "7d5e2c80",
-        "nationality": ["no"],
-        "position": ["DF"],
-        "birth_year": 1987,
-    },
-    "Johan-Hove": {
-        "id": "0a32c00c",
-        "nationality": ["no"],
-        "position": ["MF"],
-        "birth_year": 2000,
-    },
-    "Etzaz-Hussain": {
-        "id": "c3853da6",
-        "nationality": ["no"],
-        "position": ["MF"],
-        "birth_year": 1993,
-    },
-    "Erlend-Hustad": {
-        "id": "3346e9f1",
-        "nationality": ["no"],
-        "position": ["FW"],
-        "birth_year": 1997,
-    },
-    "Gaute-H\u00f8berg-Vetti": {
-        "id": "947239ca",
-        "nationality": ["no"],
-        "position": ["MF"],
-        "birth_year": 1998,
-    },
-    "Marius-H\u00f8ibr\u00e5ten": {
-        "id": "952afd27",
-        "nationality": ["no"],
-        "position": ["DF"],
-        "birth_year": 1995,
-    },
-    "Martin-H\u00f8yland": {
-        "id": "4eb19c82",
-        "nationality": ["no"],
-        "position": ["MF"],
-        "birth_year": 1995,
-    },
-    "Ylldren-Ibrahimaj": {
-        "id": "1daa205b",
-        "nationality": ["xk"],
-        "position": ["FW", "MF"],
-        "birth_year": 1995,
-    },
-    "Ogbu-Igoh": {
-        "id": "8af1b3a2",
-        "nationality": ["ng"],
-        "position": ["DF"],
-        "birth_year": 2000,
-    },
-    "Bj\u00f8rn-Inge-Utvik": {
-        "id": "5e388ecf",
-        "nationality": ["no"],
-        "position": ["DF"],
-        "birth_year": 1996,
-    },
-    "Mikael-Ingebrigtsen": {
-        "id": "57ec4a53",
-        "nationality": ["no"],
-        "position": ["FW"],
-        "birth_year": 1996,
-    },
-    "Brynjar-Ingi-Bjarnason": {
-        "id": "0434c1d5",
-        "nationality": ["is"],
-        "position": ["DF"],
-        "birth_year": 1999,
-    },
-    "Sander-Innv\u00e6r": {
-        "id": "dbf63d0f",
-        "nationality": ["no"],
-        "position": ["MF"],
-        "birth_year": 2004,
-    },
-    "Jack-Ipalibo": {
-        "id": "73e620c1",
-        "nationality": ["ng"],
-        "position": ["MF"],
-        "birth_year": 1998,
-    },
-    "Jesper-Isaksen": {
-        "id": "043f7a23",
-        "nationality": ["no"],
-        "position": ["MF"],
-        "birth_year": 1999,
-    },
-    "Taofeek-Ismaheel": {
-        "id": "81c6b877",
-        "nationality": ["ng"],
-        "position": ["FW"],
-        "birth_year": 2000,
-    },
-    "Quint-Jansen": {
-        "id": "583ead8a",
-        "nationality": ["nl"],
-        "position": ["DF"],
-        "birth_year": 1990,
-    },
-    "Sebastian-Jarl": {
-        "id": "d002e865",
-        "nationality": ["no"],
-        "position": ["DF", "MF"],
-        "birth_year": 2000,
-    },
-    "Seedy-Jatta": {
-        "id": "7b04c5cb",
-        "nationality": ["no"],
-        "position": ["FW"],
-        "birth_year": 2003,
-    },
-    "Lars-Jendal": {
-        "id": "a3bf0d4c",
-        "nationality": ["no"],
-        "position": ["GK"],
-        "birth_year": 1999,
-    },
-    "Oliver-Jensen": {
-        "id": "53e442e2",
-        "nationality": ["dk"],
-        "position": ["MF"],
-        "birth_year": 2002,
-    },
-    "Victor-Jensen": {
-        "id": "97b2279d",
-        "nationality": ["dk"],
-        "position": ["MF", "FW"],
-        "birth_year": 2000,
-    },
-    "Anders-Jenssen": {
-        "id": "e62d881a",
-        "nationality": ["no"],
-        "position": ["DF"],
-        "birth_year": 1993,
-    },
-    "Milan-Jevtovi\u0107": {
-        "id": "34bf7740",
-        "nationality": ["rs"],
-        "position": ["FW", "MF"],
-        "birth_year": 1993,
-    },
-    "Kevin-Johnsen": {
-        "id": "6c81108c",
-        "nationality": ["no"],
-        "position": ["DF"],
-        "birth_year": 2000,
-    },
-    "Filip-J\u00f6rgensen": {
-        "id": "2e6e223a",
-        "nationality": ["no"],
-        "position": ["MF", "FW"],
-        "birth_year": 2002,
-    },
-    "Alexander-Juel-Andersen": {
-        "id": "02ee8a6f",
-        "nationality": ["dk"],
-        "position": ["DF"],
-        "birth_year": 1991,
-    },
-    "Simen-Jukler\u00f8d": {
-        "id": "01ccefab",
-        "nationality": ["no"],
-        "position": ["DF"],
-        "birth_year": 1994,
-    },
-    "Ole-J\u00f8rgen-Halvorsen": {
-        "id": "13d74bff",
-        "nationality": ["no"],
-        "position": ["DF", "MF"],
-        "birth_year": 1987,
-    },
-    "Kevin-Kabran": {
-        "id": "a1d6139f",
-        "nationality": ["se"],
-        "position": ["FW", "MF"],
-        "birth_year": 1993,
-    },
-    "Kaan-Kairinen": {
-        "id": "b3dcc2cf",
-        "nationality": ["fi"],
-        "position": ["MF"],
-        "birth_year": 1998,
-    },
-    "Torbj\u00f8rn-Kallev\u00e5g": {
-        "id": "f2d1fefc",
-        "nationality": ["no"],
-        "position": ["MF", "FW"],
-        "birth_year": 1993,
-    },
-    "Liridon-Kalludra": {
-        "id": "c22336ee",
-        "nationality": ["se"],
-        "position": ["MF"],
-        "birth_year": 1991,
-    },
-    "Waren-Kamanzi": {
-        "id": "a426a912",
-        "nationality": ["no"],
-        "position": ["MF"],
-        "birth_year": 2000,
-    },
-    "Daniel-Karlsbakk": {
-        "id": "3cedae52",
-        "nationality": ["no"],
-        "position": ["FW"],
-        "birth_year": 2003,
-    },
-    "Jacob-Karlstrom": {
-        "id": "eb6fac77",
-        "nationality": ["no"],
-        "position": ["GK"],
-        "birth_year": 1997,
-    },
-    "Sander-Kartum": {
-        "id": "15aa1463",
-        "nationality": ["no"],
-        "position": ["MF"],
-        "birth_year": 1995,
-    },
-    "Flamur-Kastrati": {
-        "id": "f1972d2e",
-        "nationality": ["xk"],
-        "position": ["MF"],
-        "birth_year": 1991,
-    },
-    "Hugo-Keto": {
-        "id": "21d45036",
-        "nationality": ["fi"],
-        "position": ["GK"],
-        "birth_year": 1998,
-    },
-    "Eric-Kitolano": {
-        "id": "9bdb6d1b",
-        "nationality": ["no"],
-        "position": ["MF", "FW"],
-        "birth_year": 1997,
-    },
-    "John-Kitolano": {
-        "id": "e9312847",
-        "nationality": ["no"],
-        "position": ["DF"],
-        "birth_year": 1999,
-    },
-    "Joshua-Kitolano": {
-        "id": "5186dfbf",
-        "nationality": ["no"],
-        "position": ["MF"],
-        "birth_year": 2001,
-    },
-    "Magnus-Knudsen": {
-        "id": "a48fb0c7",
-        "nationality": ["no"],
-        "position": ["MF"],
-        "birth_year": 2001,
-    },
-    "Erling-Knudtzon": {
-        "id": "123dd5e2",
-        "nationality": ["no"],
-        "position": ["MF", "DF"],
-        "birth_year": 1988,
-    },
-    "Vegard-Kongsro": {
-        "id": "59f87305",
-        "nationality": ["no"],
-        "position": ["MF", "DF"],
-        "birth_year": 1998,
-    },
-    "Anders-Konradsen": {
-        "id": "60fd5334",
-        "nationality": ["no"],
-        "position": ["MF"],
-        "birth_year": 1990,
-    },
-    "Morten-Konradsen": {
-        "id": "0f816ae5",
-        "nationality": ["no"],
-        "position": ["MF"],
-        "birth_year": 1996,
-    },
-    "Boubou-Kont\u00e9": {
-        "id": "66249d65",
-        "nationality": ["ml"],
-        "position": ["FW"],
-        "birth_year": 2001,
-    },
-    "Gilbert-Koomson": {
-        "id": "e033cfb6",
-        "nationality": ["gh"],
-        "position": ["FW"],
-        "birth_year": 1994,
-    },
-    "Kreshnik-Krasniqi": {
-        "id": "03d254a7",
-        "nationality": ["xk"],
-        "position": ["MF"],
-        "birth_year": 2000,
-    },
-    "Bj\u00f8rn-Kristensen": {
-        "id": "943b38ba",
-        "nationality": ["no"],
-        "position": ["FW"],
-        "birth_year": 2002,
-    },
-    "Ole-Kristian-Enersen": {
-        "id": "5c79edf4",
-        "nationality": ["no"],
-        "position": ["FW", "MF"],
-        "birth_year": 2002,
-    },
-    "Anders-Kristiansen": {
-        "id": "61dc42f4",
-        "nationality": ["no"],
-        "position": ["GK"],
-        "birth_year": 1990,
-    },
-    "Bendik-Kristiansen": {
-        "id": "5847f34d",
-        "nationality": ["no"],
-        "position": ["DF"],
-        "birth_year": 2002,
-    },
-    "Kevin-Kryg\u00e5rd": {
-        "id": "7044bef8",
-        "nationality": ["no"],
-        "position": ["MF", "DF"],
-        "birth_year": 2000,
-    },
-    "William-Kurtovic": {
-        "id": "a78115ac",
-        "nationality": ["se"],
-        "position": ["MF"],
-        "birth_year": 1996,
-    },
-    "Hasan-Kuru\u00e7ay": {
-        "id": "8485c037",
-        "nationality": ["tr"],
-        "position": ["DF"],
-        "birth_year": 1997,
-    },
-    "Simen-Kvia-Egeskog": {
-        "id": "63826865",
-        "nationality": ["no"],
-        "position": ["FW"],
-        "birth_year": 2003,
-    },
-    "Sigurd-Kvile": {
-        "id": "569ce58e",
-        "nationality": ["no"],
-        "position": ["DF"],
-        "birth_year": 2000,
-    },
-    "Yann-Erik-de-Lanlay": {
-        "id": "42fe6b05",
-        "nationality": ["no"],
-        "position": ["MF", "FW"],
-        "birth_year": 1992,
-    },
-    "Tobias-Lauritsen": {
-        "id": "d266f8c9",
-        "nationality": ["no"],
-        "position": ["FW"],
-        "birth_year": 1997,
-    },
-    "Amor-Layouni": {
-        "id": "e9e41fd0",
-        "nationality": ["tn"],
-        "position": ["FW", "MF"],
-        "birth_year": 1992,
-    },
-    "Thomas-Lehne-Olsen": {
-        "id": "9dc3585e",
-        "nationality": ["no"],
-        "position": ["FW"],
-        "birth_year": 1991,
-    },
-    "Ari-Leifsson": {
-        "id": "c3e92b99",
-        "nationality": ["is"],
-        "position": ["DF"],
-        "birth_year": 1998,
-    },
-    "Bruno-Leite": {
-        "id": "571f8b30",
-        "nationality": ["cv"],
-        "position": ["MF"],
-        "birth_year": 1995,
-    },
-    "Magnus-Lekven": {
-        "id": "b32bc8b3",
-        "nationality": ["no"],
-        "position": ["MF"],
-        "birth_year": 1988,
-    },
-    "Steffen-Lie-Sk\u00e5levik": {
-        "id": "3f1bfab6",
-        "nationality": ["no"],
-        "position": ["FW", "MF"],
-        "birth_year": 1993,
-    },
-    "Victor-Lind": {
-        "id": "d2a83712",
-        "nationality": ["dk"],
-        "position": ["FW", "MF"],
-        "birth_year": 2003,
-    },
-    "Jonathan-Lindseth": {
-        "id": "ca3a24de",
-        "nationality": ["no"],
-        "position": ["MF"],
-        "birth_year": 1996,
-    },
-    "Martin-Linnes": {
-        "id": "0e100630",
-        "nationality": ["no"],
-        "position": ["MF", "DF"],
-        "birth_year": 1991,
-    },
-    "Marius-Lode": {
-        "id": "37f341f0",
-        "nationality": ["no"],
-        "position": ["DF"],
-        "birth_year": 1993,
-    },
-    "Filip-Loftesnes-Bjune": {
-        "id": "ea8507d2",
-        "nationality": ["no"],
-        "position": ["MF"],
-        "birth_year": 2005,
-    },
-    "Marius-Lundemo": {
-        "id": "76ecfb22",
-        "nationality": ["no"],
-        "position": ["MF"],
-        "birth_year": 1994,
-    },
-    "Odin-Lur\u00e5s-Bj\u00f8rtuft": {
-        "id": "49399401",
-        "nationality": ["no"],
-        "position": ["DF"],
-        "birth_year": 1998,
-    },
-    "Kristoffer-L\u00f8kberg": {
-        "id": "4e6fb569",
-        "nationality": ["no"],
-        "position": ["MF"],
-        "birth_year": 1992,
-    },
-    "Mathias-L\u00f8vik": {
-        "id": "f17aa65c",
-        "nationality": ["no"],
-        "position": ["MF", "DF"],
-        "birth_year": 2003,
-    },
-    "Isak-M\u00e4\u00e4tt\u00e4": {
-        "id": "9da07419",
-        "nationality": ["no"],
-        "position": ["DF", "MF"],
-        "birth_year": 2001,
-    },
-    "Iman-Mafi": {
-        "id": "b0620912",
-        "nationality": ["no"],
-        "position": ["DF"],
-        "birth_year": 1994,
-    },
-    "Mikkel-Maigaard": {
-        "id": "b123f11d",
-        "nationality": ["dk"],
-        "position": ["MF"],
-        "birth_year": 1995,
-    },
-    "Kristall-M\u00e1ni-Ingason": {
-        "id": "4fb2183b",
-        "nationality": ["is"],
-        "position": ["FW"],
-        "birth_year": 2002,
-    },
-    "Sivert-Mannsverk": {
-        "id": "773e16b9",
-        "nationality": ["no"],
-        "position": ["MF"],
-        "birth_year": 2002,
-    },
-    "Lars-Markmanrud": {
-        "id": "abb9e02a",
-        "nationality": ["no"],
-        "position": ["DF", "MF"],
-        "birth_year": 2001,
-    },
-    "Ole-Martin-Kolskogen": {
-        "id": "7c289e31",
-        "nationality": ["no"],
-        "position": ["DF"],
-        "birth_year": 2001,
-    },
-    "Serge-Junior-Martinsson-Ngouali": {
-        "id": "9d1aeaa6",
-        "nationality": ["ga"],
-        "position": ["MF", "DF"],
-        "birth_year": 1992,
-    },
-    "Ifeanyi-Mathew": {
-        "id": "93ff27ca",
-        "nationality": ["ng"],
-        "position": ["MF"],
-        "birth_year": 1997,
-    },
-    "Sebastian-Mathisen": {
-        "id": "fd6c5ec5",
-        "nationality": ["no"],
-        "position": ["FW"],
-        "birth_year": 2005,
-    },
-    "Moses-Mawa": {
-        "id": "2dd3f285",
-        "nationality": ["no"],
-        "position": ["FW"],
-        "birth_year": 1996,
-    },
-    "Dylan-Mboumbouni": {
-        "id": "218bfaa2",
-        "nationality": ["cf"],
-        "position": ["DF"],
-        "birth_year": 1996,
-    },
-    "Sean-McDermott": {
-        "id": "fc5c05cb",
-        "nationality": ["ie"],
-        "position": ["GK"],
-        "birth_year": 1993,
-    },
-    "Henrik-Melland": {
-        "id": "445ab36d",
-        "nationality": ["no"],
-        "position": ["MF"],
-        "birth_year": 2005,
-    },
-    "Laurent-Mendy": {
-        "id": "05f598e8",
-        "nationality": ["sn"],
-        "position": ["MF"],
-        "birth_year": 2001,
-    },
-    "Ivan-Mes\u00edk": {
-        "id": "7e054ee8",
-        "nationality": ["sk"],
-        "position": ["DF"],
-        "birth_year": 2001,
-    },
-    "August-Mikkelsen": {
-        "id": "8f2fd783",
-        "nationality": ["no"],
-        "position": ["FW"],
-        "birth_year": 2000,
-    },
-    "Brede-Moe": {
-        "id": "a55ba2f8",
-        "nationality": ["no"],
-        "position": ["DF"],
-        "birth_year": 1991,
-    },
-    "Jeppe-Moe": {
-        "id": "4c70514e",
-        "nationality": ["no"],
-        "position": ["DF"],
-        "birth_year": 1995,
-    },
-    "Guillermo-Molins": {
-        "id": "cda49f68",
-        "nationality": ["se"],
-        "position": ["FW", "MF"],
-        "birth_year": 1988,
-    },
-    "Serigne-Mor-Mbaye": {
-        "id": "fe415351",
-        "nationality": ["sn"],
-        "position": ["GK"],
-        "birth_year": 1996,
-    },
-    "Faris-Moumbagna": {
-        "id": "58aae0a9",
-        "nationality": ["cm"],
-        "position": ["FW"],
-        "birth_year": 2000,
-    },
-    "Agon-Mucolli": {
-        "id": "865c3f09",
-        "nationality": ["dk"],
-        "position": ["MF"],
-        "birth_year": 1998,
-    },
-    "Joel-Mugisha": {
-        "id": "0959184b",
-        "nationality": ["no"],
-        "position": ["FW"],
-        "birth_year": 2002,
-    },
-    "Rashad-Muhammed": {
-        "id": "29e33bf3",
-        "nationality": ["fr"],
-        "position": ["MF"],
-        "birth_year": 1993,
-    },
-    "Viljar-Myhra": {
-        "id": "7e83921b",
-        "nationality": ["no"],
-        "position": ["GK"],
-        "birth_year": 1996,
-    },
-    "Markus-Nakkim": {
-        "id": "0e12671e",
-        "nationality": ["no"],
-        "position": ["DF"],
-        "birth_year": 1996,
-    },
-    "Ivan-N\u00e4sberg": {
-        "id": "6e945f87",
-        "nationality": ["no"],
-        "position": ["DF"],
-        "birth_year": 1996,
-    },
-    "Torje-Naustdal": {
-        "id": "4972a771",
-        "nationality": ["no"],
-        "position": ["MF"],
-        "birth_year": 2000,
-    },
-    "Alioune-Ndour": {
-        "id": "6e3c43c9",
-        "nationality": ["sn"],
-        "position": ["FW", "MF"],
-        "birth_year": 1997,
-    },
-    "Nenass": {
-        "id": "0db9acd1",
-        "nationality": ["cv"],
-        "position": ["MF"],
-        "birth_year": 1995,
-    },
-    "Thomas-Ness": {
-        "id": "825e38ae",
-        "nationality": ["no"],
-        "position": ["MF"],
-        "birth_year": 1998,
-    },
-    "Lasse-Nilsen": {
-        "id": "c58c2194",
-        "nationality": ["no"],
-        "position": ["MF", "DF"],
-        "birth_year": 1995,
-    },
-    "Simen-Nilsen": {
-        "id": "65ee03f3",
-        "nationality": ["no"],
-        "position": ["GK"],
-        "birth_year": 2000,
-    },
-    "Aleksander-Nilsson": {
-        "id": "5f09f98f",
-        "nationality": ["se"],
-        "position": ["MF"],
-        "birth_year": 2002,
-    },
-    "Bilal-Njie": {
-        "id": "4ce1e02e",
-        "nationality": ["no"],
-        "position": ["MF", "FW"],
-        "birth_year": 1998,
-    },
-    "Wally-Njie": {
-        "id": "64a541d4",
-        "nationality": ["no"],
-        "position": ["MF"],
-        "birth_year": 2002,
-    },
-    "Lasse-Nord\u00e5s": {
-        "id": "71e1b938",
-        "nationality": ["no"],
-        "position": ["FW"],
-        "birth_year": 2002,
-    },
-    "Runar-Norheim": {
-        "id": "f20b5af8",
-        "nationality": ["no"],
-        "position": ["MF"],
-        "birth_year": 2005,
-    },
-    "Amin-Nouri": {
-        "id": "2ea2178a",
-        "nationality": ["no"],
-        "position": ["MF", "DF"],
-        "birth_year": 1990,
-    },
-    "Kristian-Novak": {
-        "id": "ab60091e",
-        "nationality": ["no"],
-        "position": ["MF"],
-        "birth_year": 1998,
-    },
-    "Franklin-Nyenetue": {
-        "id": "bd8df7cf",
-        "nationality": ["no"],
-        "position": ["FW"],
-        "birth_year": 2000,
-    },
-    "Sverre-Nypan": {
-        "id": "3dde85f2",
-        "nationality": ["no"],
-        "position": ["MF"],
-        "birth_year": 2006,
-    },
-    "Erik-N\u00e6sbak-Brenden": {
-        "id": "6c22a354",
-        "nationality": ["no"],
-        "position": ["MF", "FW"],
-        "birth_year": 1994,
-    },
-    "Mohamed-Ofkir": {
-        "id": "070f654b",
-        "nationality": ["no"],
-        "position": ["FW", "MF"],
-        "birth_year": 1996,
-    },
-    "Rilwan-Olanrewaju-Hassan": {
-        "id": "932c9313",
-        "nationality": ["ng"],
-        "position": ["FW"],
-        "birth_year": 1991,
-    },
-    "John-Olav-Norheim": {
-        "id": "cc8f5443",
-        "nationality": ["no"],
-        "position": ["DF", "MF"],
-        "birth_year": 1995,
-    },
-    "Fredrik-Oldrup-Jensen": {
-        "id": "33521c27",
-        "nationality": ["no"],
-        "position": ["MF", "DF"],
-        "birth_year": 1993,
-    },
-    "Kristian-Onsrud": {
-        "id": "1ee2a4fb",
-        "nationality": ["no"],
-        "position": ["MF"],
-        "birth_year": 1994,
-    },
-    "Halvor-Opsahl": {
-        "id": "34b87872",
-        "nationality": ["no"],
-        "position": ["DF"],
-        "birth_year": 2002,
-    },
-    "Oskar-Opsahl": {
-        "id": "f215373c",
-        "nationality": ["no"],
-        "position": ["DF"],
-        "birth_year": 2001,
-    },
-    "Sakarias-Opsahl": {
-        "id": "414ffde8",
-        "nationality": ["no"],
-        "position": ["MF"],
-        "birth_year": 1999,
-    },
-    "Amer-Ordagi\u0107": {
-        "id": "216696a4",
-        "nationality": ["ba"],
-        "position": ["MF"],
-        "birth_year": 1993,
-    },
-    "Vi\u00f0ar-\u00d6rn-Kjartansson": {
-        "id": "348e0505",
-        "nationality": ["is"],
-        "position": ["FW"],
-        "birth_year": 1990,
-    },
-    "Salomon-Owusu": {
-        "id": "3dbb4356",
-        "nationality": ["gh"],
-        "position": ["MF", "DF"],
-        "birth_year": 1995,
-    },
-    "Fredrik-P\u00e5lerud": {
-        "id": "e7b052f7",
-        "nationality": ["no"],
-        "position": ["DF"],
-        "birth_year": 1994,
-    },
-    "Shayne-Pattynama": {
-        "id": "a9acaa6b",
-        "nationality": ["nl"],
-        "position": ["DF", "MF"],
-        "birth_year": 1998,
-    },
-    "Marcus-Pedersen": {
-        "id": "8336699a",
-        "nationality": ["no"],
-        "position": ["FW"],
-        "birth_year": 1990,
-    },
-    "Thore-Pedersen": {
-        "id": "c4941340",
-        "nationality": ["no"],
-        "position": ["DF"],
-        "birth_year": 1996,
-    },
-    "Amahl-Pellegrino": {
-        "id": "9d9e69df",
-        "nationality": ["no"],
-        "position": ["FW"],
-        "birth_year": 1990,
-    },
-    "Adrian-Pereira": {
-        "id": "1c62f712",
-        "nationality": ["no"],
-        "position": ["MF", "DF"],
-        "birth_year": 1999,
-    },
-    "Dan-Peter-Ulvestad": {
-        "id": "f118d91f",
-        "nationality": ["no"],
-        "position": ["DF"],
-        "birth_year": 1989,
-    },
-    "Oliver-Petersen": {
-        "id": "17c602ca",
-        "nationality": ["no"],
-        "position": ["GK"],
-        "birth_year": 2001,
-    },
-    "Tom-Pettersson": {
-        "id": "c1268aa3",
-        "nationality": ["se"],
-        "position": ["DF"],
-        "birth_year": 1990,
-    },
-    "Christophe-Psych\u00e9": {
-        "id": "282a91fb",
-        "nationality": ["fr"],
-        "position": ["DF"],
-        "birth_year": 1988,
-    },
-    "Aridon-Racaj": {
-        "id": "75f361f4",
-        "nationality": ["xk"],
-        "position": ["FW"],
-        "birth_year": 2005,
-    },
-    "Simen-Rafn": {
-        "id": "df0ae81f",
-        "nationality": ["no"],
-        "position": ["DF", "MF"],
-        "birth_year": 1992,
-    },
-    "Mikkel-Rakneberg": {
-        "id": "a2af6be9",
-        "nationality": ["no"],
-        "position": ["FW"],
-        "birth_year": 2002,
-    },
-    "Lars-Ranger": {
-        "id": "73ed5e65",
-        "nationality": ["no"],
-        "position": ["MF"],
-        "birth_year": 1999,
-    },
-    "S\u00f8ren-Reese": {
-        "id": "816af57d",
-        "nationality": ["dk"],
-        "position": ["DF"],
-        "birth_year": 1993,
-    },
-    "Thomas-Rekdal": {
-        "id": "9155d2cf",
-        "nationality": ["no"],
-        "position": ["MF"],
-        "birth_year": 2001,
-    },
-    "Magnus-Riisn\u00e6s": {
-        "id": "f5f2a449",
-        "nationality": ["no"],
-        "position": ["MF"],
-        "birth_year": 2004,
-    },
-    "Birk-Risa": {
-        "id": "c70b221c",
-        "nationality": ["no"],
-        "position": ["DF"],
-        "birth_year": 1998,
-    },
-    "Sander-Risan-M\u00f8rk": {
-        "id": "768cfef9",
-        "nationality": ["no"],
-        "position": ["MF"],
-        "birth_year": 2000,
-    },
-    "Sam-Rogers": {
-        "id": "6a0be032",
-        "nationality": ["us"],
-        "position": ["DF"],
-        "birth_year": 1999,
-    },
-    "Gilli-R\u00f3lantsson": {
-        "id": "865306d1",
-        "nationality": ["fo"],
-        "position": ["DF"],
-        "birth_year": 1992,
-    },
-    "Colin-Rosler": {
-        "id": "a6d339fa",
-        "nationality": ["no"],
-        "position": ["DF"],
-        "birth_year": 2000,
-    },
-    "Sondre-Rossbach": {
-        "id": "a32554bc",
-        "nationality": ["no"],
-        "position": ["GK"],
-        "birth_year": 1996,
-    },
-    "Rufo": {
-        "id": "00174fb2",
-        "nationality": ["es"],
-        "position": ["MF", "FW"],
-        "birth_year": 1993,
-    },
-    "Espen-Ruud": {
-        "id": "ca1efb13",
-        "nationality": ["no"],
-        "position": ["DF"],
-        "birth_year": 1984,
-    },
-    "Alexander-Ruud-Tveter": {
-        "id": "2eb7eb41",
-        "nationality": ["no"],
-        "position": ["FW"],
-        "birth_year": 1991,
-    },
-    "H\u00e5kon-R\u00f8sten": {
-        "id": "467ac9d0",
-        "nationality": ["no"],
-        "position": ["DF"],
-        "birth_year": 2005,
-    },
-    "Osame-Sahraoui": {
-        "id": "6f9fa232",
-        "nationality": ["no"],
-        "position": ["FW", "MF"],
-        "birth_year": 2001,
-    },
-    "Anton-Sal\u00e9tros": {
-        "id": "3da8c3f9",
-        "nationality": ["se"],
-        "position": ["MF"],
-        "birth_year": 1996,
-    },
-    "Ulrik-Saltnes": {
-        "id": "f6af14b0",
-        "nationality": ["no"],
-        "position": ["MF"],
-        "birth_year": 1992,
-    },
-    "Lars-J\u00f8rgen-Salvesen": {
-        "id": "4736039a",
-        "nationality": ["no"],
-        "position": ["FW"],
-        "birth_year": 1996,
-    },
-    "Alfons-Sampsted": {
-        "id": "5d873dfb",
-        "nationality": ["is"],
-        "position": ["DF"],
-        "birth_year": 1998,
-    },
-    "Martin-Samuelsen": {
-        "id": "746df5d3",
-        "nationality": ["no"],
-        "position": ["FW", "MF"],
-        "birth_year": 1997,
-    },
-    "Erik-Sandberg": {
-        "id": "6a58d1d5",
-        "nationality": ["no"],
-        "position": ["DF"],
-        "birth_year": 2000,
-    },
-    "Niklas-Sandberg": {
-        "id": "62a90cfb",
-        "nationality": ["no"],
-        "position": ["MF", "FW"],
-        "birth_year": 1995,
-    },
-    "Mads-Sande": {
-        "id": "d3c59d4e",
-        "nationality": ["no"],
-        "position": ["MF", "FW"],
-        "birth_year": 1998,
-    },
-    "Edvard-Sandvik-Tagseth": {
-        "id": "215918bf",
-        "nationality": ["no"],
-        "position": ["MF"],
-        "birth_year": 2001,
-    },
-    "Felix-Schr\u00f6ter": {
-        "id": "2d1a1c4c",
-        "nationality": ["de"],
-        "position": ["FW"],
-        "birth_year": 1996,
-    },
-    "Sebastian-Sebulonsen": {
-        "id": "d62063b7",
-        "nationality": ["no"],
-        "position": ["MF", "DF"],
-        "birth_year": 2000,
-    },
-    "Erlend-Segberg": {
-        "id": "45178613",
-        "nationality": ["no"],
-        "position": ["MF"],
-        "birth_year": 1997,
-    },
-    "Egil-Selvik": {
-        "id": "05d89c1c",
-        "nationality": ["no"],
-        "position": ["GK"],
-        "birth_year": 1997,
-    },
-    "Besim-\u0160erbe\u010di\u0107": {
-        "id": "5384e3bf",
-        "nationality": ["ba"],
-        "position": ["DF"],
-        "birth_year": 1998,
-    },
-    "Japhet-Sery": {
-        "id": "03e7a498",
-        "nationality": ["dk"],
-        "position": ["DF"],
-        "birth_year": 2000,
-    },
-    "Oskar-Siira-Sivertsen": {
-        "id": "d50829e9",
-        "nationality": ["no"],
-        "position": ["FW"],
-        "birth_year": 2004,
-    },
-    "Emil-Sildnes": {
-        "id": "d0354060",
-        "nationality": ["no"],
-        "position": ["MF", "FW"],
-        "birth_year": 1993,
-    },
-    "Doguhan-Simsir": {
-        "id": "f91fa277",
-        "nationality": ["dk"],
-        "position": ["FW", "MF"],
-        "birth_year": 2002,
-    },
-    "Harmeet-Singh": {
-        "id": "aae023c4",
-        "nationality": ["no"],
-        "position": ["MF"],
-        "birth_year": 1990,
-    },
-    "Magnus-Sj\u00f8eng": {
-        "id": "571262e6",
-        "nationality": ["no"],
-        "position": ["GK"],
-        "birth_year": 2002,
-    },
-    "Fredrik-Sj\u00f8lstad": {
-        "id": "ce22ca27",
-        "nationality": ["no"],
-        "position": ["MF"],
-        "birth_year": 1994,
-    },
-    "Martin-Sj\u00f8lstad": {
-        "id": "2ee68d80",
-        "nationality": ["no"],
-        "position": ["MF"],
-        "birth_year": 2000,
-    },
-    "Fredrik-Sj\u00f8vold": {
-        "id": "2ca0c63c",
-        "nationality": ["no"],
-        "position": ["MF"],
-        "birth_year": 2003,
-    },
-    "Brage-Skaret": {
-        "id": "5a349949",
-        "nationality": ["no"],
-        "position": ["MF"],
-        "birth_year": 2002,
-    },
-    "Olaus-Skarsem": {
-        "id": "2c8c6968",
-        "nationality": ["no"],
-        "position": ["MF", "FW"],
-        "birth_year": 1998,
-    },
-    "Jesper-Skau": {
-        "id": "53cc8472",
-        "nationality": ["no"],
-        "position": ["DF"],
-        "birth_year": 2003,
-    },
-    "Anton-Skipper": {
-        "id": "9430626a",
-        "nationality": ["dk"],
-        "position": ["DF"],
-        "birth_year": 2000,
-    },
-    "Andreas-Skjold": {
-        "id": "771b8b13",
-        "nationality": ["no"],
-        "position": ["MF"],
-        "birth_year": 2003,
-    },
-    "Vetle-Skj\u00e6rvik": {
-        "id": "a7b1fe5e",
-        "nationality": ["no"],
-        "position": ["DF"],
-        "birth_year": 2000,
-    },
-    "Henrik-Skogvold": {
-        "id": "8353e96a",
-        "nationality": ["no"],
-        "position": ["MF"],
-        "birth_year": 2004,
-    },
-    "Naatan-Skytt\u00e4": {
-        "id": "d7547531",
-        "nationality": ["fi"],
-        "position": ["MF"],
-        "birth_year": 2002,
-    },
-    "Ian-Smeulers": {
-        "id": "732e0da3",
-        "nationality": ["nl"],
-        "position": ["DF"],
-        "birth_year": 2000,
-    },
-    "Eskil-Smidesang-Edh": {
-        "id": "e3372668",
-        "nationality": ["no"],
-        "position": ["MF"],
-        "birth_year": 2002,
-    },
-    "Markus-Solbakken": {
-        "id": "fe0f9f6a",
-        "nationality": ["no"],
-        "position": ["MF"],
-        "birth_year": 2000,
-    },
-    "Ola-Solbakken": {
-        "id": "78f13530",
-        "nationality": ["no"],
-        "position": ["FW"],
-        "birth_year": 1998,
-    },
-    "Elias-Solberg": {
-        "id": "0b864f94",
-        "nationality": ["no"],
-        "position": ["MF"],
-        "birth_year": 2004,
-    },
-    "Vegard-Solheim": {
-        "id": "1f7df534",
-        "nationality": ["no"],
-        "position": ["MF"],
-        "birth_year": 2004,
-    },
-    "Oscar-Soln\u00f8rdal": {
-        "id": "fdfd7cc4",
-        "nationality": ["no"],
-        "position": ["MF"],
-        "birth_year": 2002,
-    },
-    "Joachim-Soltvedt": {
-        "id": "e1453b38",
-        "nationality": ["no"],
-        "position": ["DF"],
-        "birth_year": 1995,
-    },
-    "Halldor-Stenevik": {
-        "id": "d1593f05",
-        "nationality": ["no"],
-        "position": ["FW", "MF"],
-        "birth_year": 2000,
-    },
-    "Herman-Stengel": {
-        "id": "00608940",
-        "nationality": ["no"],
-        "position": ["MF"],
-        "birth_year": 1995,
-    },
-    "Gianni-Stensness": {
-        "id": "b9549894",
-        "nationality": ["au"],
-        "position": ["DF"],
-        "birth_year": 1999,
-    },
-    "Abel-Stensrud": {
-        "id": "550cefc3",
-        "nationality": ["no"],
-        "position": ["FW", "MF"],
-        "birth_year": 2002,
-    },
-    "Jacob-Storevik": {
-        "id": "84088e33",
-        "nationality": ["no"],
-        "position": ["GK"],
-        "birth_year": 1996,
-    },
-    "Snorre-Strand-Nilsen": {
-        "id": "c38489c4",
-        "nationality": ["no"],
-        "position": ["DF", "MF"],
-        "birth_year": 1997,
-    },
-    "Petter-Strand": {
-        "id": "c26e60c2",
-        "nationality": ["no"],
-        "position": ["MF", "DF"],
-        "birth_year": 1994,
-    },
-    "Stefan-Strandberg": {
-        "id": "6d5e62b0",
-        "nationality": ["no"],
-        "position": ["DF"],
-        "birth_year": 1990,
-    },
-    "Sander-Svendsen": {
-        "id": "da60fd2a",
-        "nationality": ["no"],
-        "position": ["FW"],
-        "birth_year": 1997,
-    },
-    "Tobias-Svendsen": {
-        "id": "c2a35241",
-        "nationality": ["no"],
-        "position": ["FW"],
-        "birth_year": 1999,
-    },
-    "Alexander-S\u00f8derlund": {
-        "id": "e61d33f1",
-        "nationality": ["no"],
-        "position": ["FW"],
-        "birth_year": 1987,
-    },
-    "Andr\u00e9-S\u00f8dlund": {
-        "id": "a0bdd879",
-        "nationality": ["no"],
-        "position": ["MF"],
-        "birth_year": 1996,
-    },
-    "Sondre-S\u00f8rli": {
-        "id": "c2dadbf3",
-        "nationality": ["no"],
-        "position": ["FW", "MF"],
-        "birth_year": 1995,
-    },
-    "Jesper-T\u00e5je": {
-        "id": "e9896bd8",
-        "nationality": ["no"],
-        "position": ["DF"],
-        "birth_year": 1997,
-    },
-    "Harald-Tangen": {
-        "id": "550f5516",
-        "nationality": ["no"],
-        "position": ["MF"],
-        "birth_year": 2001,
-    },
-    "Sander-Tangvik": {
-        "id": "93525deb",
-        "nationality": ["no"],
-        "position": ["GK"],
-        "birth_year": 2002,
-    },
-    "Casper-Tengstedt": {
-        "id": "ff2fb007",
-        "nationality": ["dk"],
-        "position": ["FW"],
-        "birth_year": 2000,
-    },
-    "Fenuel-Tewelde": {
-        "id": "c0863e2e",
-        "nationality": ["no"],
-        "position": ["DF"],
-        "birth_year": 2006,
-    },
-    "Jonas-Therkelsen": {
-        "id": "94211340",
-        "nationality": ["no"],
-        "position": ["MF"],
-        "birth_year": 2003,
-    },
-    "Peter-Therkildsen": {
-        "id": "36f9e534",
-        "nationality": ["dk"],
-        "position": ["DF", "MF"],
-        "birth_year": 1998,
-    },
-    "Odin-Thiago-Holm": {
-        "id": "0355010f",
-        "nationality": ["no"],
-        "position": ["MF"],
-        "birth_year": 2003,
-    },
-    "Djibril-Thialaw-Diop": {
-        "id": "4d6c91b2",
-        "nationality": ["sn"],
-        "position": ["DF"],
-        "birth_year": 1999,
-    },
-    "Simon-Thomas": {
-        "id": "f4fe8ace",
-        "nationality": ["ca"],
-        "position": ["GK"],
-        "birth_year": 1990,
-    },
-    "Joachim-Thomassen": {
-        "id": "ebc06041",
-        "nationality": ["no"],
-        "position": ["DF"],
-        "birth_year": 1988,
-    },
-    "Albert-Thorsen": {
-        "id": "71c0b1ab",
-        "nationality": ["no"],
-        "position": ["FW"],
-        "birth_year": 2003,
-    },
-    "Simon-Tibbling": {
-        "id": "5f8aecce",
-        "nationality": ["se"],
-        "position": ["MF"],
-        "birth_year": 1994,
-    },
-    "Ask-Tj\u00e6randsen-Skau": {
-        "id": "77f7576d",
-        "nationality": ["no"],
-        "position": ["MF"],
-        "birth_year": 2000,
-    },
-    "Kristoffer-Tokstad": {
-        "id": "00337474",
-        "nationality": ["no"],
-        "position": ["FW", "MF"],
-        "birth_year": 1991,
-    },
-    "Jonatan-Toll\u00e5s": {
-        "id": "e8994bec",
-        "nationality": ["no"],
-        "position": ["DF"],
-        "birth_year": 1990,
-    },
-    "Victor-Torp": {
-        "id": "e8cc2cbb",
-        "nationality": ["dk"],
-        "position": ["MF"],
-        "birth_year": 1999,
-    },
-    "Fredrik-Torsteinb\u00f8": {
-        "id": "49e9ac62",
-        "nationality": ["no"],
-        "position": ["MF"],
-        "birth_year": 1991,
-    },
-    "Sebastian-Tounekti": {
-        "id": "584fee1f",
-        "nationality": ["tn"],
-        "position": ["FW"],
-        "birth_year": 2002,
-    },
-    "Mai-Traore": {
-        "id": "d5f32f5e",
-        "nationality": ["cg"],
-        "position": ["FW"],
-        "birth_year": 1999,
-    },
-    "Zlatko-Tripi\u0107": {
-        "id": "f6d4b6b2",
-        "nationality": ["no"],
-        "position": ["FW", "MF"],
-        "birth_year": 1992,
-    },
-    "Jasse-Tuominen": {
-        "id": "aaee68f1",
-        "nationality": ["fi"],
-        "position": ["FW"],
-        "birth_year": 1995,
-    },
-    "Henrik-Udahl": {
-        "id": "bd5d1d10",
-        "nationality": ["no"],
-        "position": ["FW"],
-        "birth_year": 1997,
-    },
-    "Mikael-Ugland": {
-        "id": "29ae142a",
-        "nationality": ["no"],
-        "position": ["MF", "DF"],
-        "birth_year": 2000,
-    },
-    "Eirik-Ulland-Andersen": {
-        "id": "5f06ae82",
-        "nationality": ["no"],
-        "position": ["FW"],
-        "birth_year": 1992,
-    },
-    "Pavle-Vagi\u0107": {
-        "id": "8f906c5f",
-        "nationality": ["se"],
-        "position": ["MF"],
-        "birth_year": 2000,
-    },
-    "Gustav-Valsvik": {
-        "id": "482e9289",
-        "nationality": ["no"],
-        "position": ["DF"],
-        "birth_year": 1993,
-    },
-    "Stefano-Vecchia": {
-        "id": "023a32ea",
-        "nationality": ["se"],
-        "position": ["FW"],
-        "birth_year": 1995,
-    },
-    "Deyver-Vega": {
-        "id": "29c0b088",
-        "nationality": ["cr"],
-        "position": ["FW", "MF"],
-        "birth_year": 1992,
-    },
-    "Niklas-Vesterlund": {
-        "id": "3829be9f",
-        "nationality": ["dk"],
-        "position": ["MF", "DF"],
-        "birth_year": 1999,
-    },
-    "Hugo-Vetlesen": {
-        "id": "aa982b0f",
-        "nationality": ["no"],
-        "position": ["MF"],
-        "birth_year": 2000,
-    },
-    "Viljar-Vevatne": {
-        "id": "fc5656a1",
-        "nationality": ["no"],
-        "position": ["DF"],
-        "birth_year": 1994,
-    },
-    "Isak-Vik": {
-        "id": "46294e23",
-        "nationality": ["no"],
-        "position": ["DF"],
-        "birth_year": 2003,
-    },
-    "Lars-Christopher-Vilsvik": {
-        "id": "35a43937",
-        "nationality": ["no"],
-        "position": ["DF"],
-        "birth_year": 1988,
-    },
-    "Leopold-Wahlstedt": {
-        "id": "9b26a433",
-        "nationality": ["se"],
-        "position": ["GK"],
-        "birth_year": 1999,
-    },
-    "Conrad-Wallem": {
-        "id": "443a4bb2",
-        "nationality": ["no"],
-        "position": ["MF", "FW"],
-        "birth_year": 2000,
-    },
-    "Nikolas-Walstad": {
-        "id": "7a877b93",
-        "nationality": ["no"],
-        "position": ["DF"],
-        "birth_year": 1997,
-    },
-    "Marius-Weidel": {
-        "id": "b21a8a49",
-        "nationality": ["no"],
-        "position": ["FW"],
-        "birth_year": 2005,
-    },
-    "Brice-Wembangomo": {
-        "id": "c1851bfd",
-        "nationality": ["no"],
-        "position": ["DF"],
-        "birth_year": 1996,
-    },
-    "Mathias-Wichmann": {
-        "id": "ce5e651f",
-        "nationality": ["dk"],
-        "position": ["MF"],
-        "birth_year": 1991,
-    },
-    "Amund-Wichne": {
-        "id": "0432ab24",
-        "nationality": ["no"],
-        "position": ["GK"],
-        "birth_year": 1997,
-    },
-    "Eirik-Wichne": {
-        "id": "aed60196",
-        "nationality": ["no"],
-        "position": ["DF"],
-        "birth_year": 1997,
-    },
-    "Torje-Wichne": {
-        "id": "e398b73f",
-        "nationality": ["no"],
-        "position": ["DF"],
-        "birth_year": 1997,
-    },
-    "Max-Williamsen": {
-        "id": "a30f80de",
-        "nationality": ["no"],
-        "position": ["DF"],
-        "birth_year": 2003,
-    },
-    "Peter-Wilson": {
-        "id": "b0f6bf47",
-        "nationality": ["lr"],
-        "position": ["FW", "MF"],
-        "birth_year": 1996,
-    },
-    "Albin-Winbo": {
-        "id": "2b5cd02e",
-        "nationality": ["se"],
-        "position": ["MF"],
-        "birth_year": 1997,
-    },
-    "Felix-Winther": {
-        "id": "95857afb",
-        "nationality": ["dk"],
-        "position": ["MF", "FW"],
-        "birth_year": 2000,
-    },
-    "Magnus-Wolff-Eikrem": {
-        "id": "3a770838",
-        "nationality": ["no"],
-        "position": ["FW", "MF"],
-        "birth_year": 1990,
-    },
-    "Yuriy-Yakovenko": {
-        "id": "2bd4affb",
-        "nationality": ["ua"],
-        "position": ["FW"],
-        "birth_year": 1993,
-    },
-    "Ruben-Ytterg\u00e5rd-Jenssen": {
-        "id": "62e0b5c2",
-        "nationality": ["no"],
-        "position": ["MF"],
-        "birth_year": 1988,
-    },
-    "Christos-Zafeiris": {
-        "id": "524ed774",
-        "nationality": ["no"],
-        "position": ["MF", "FW"],
-        "birth_year": 2003,
-    },
-    "Rafik-Zekhnini": {
-        "id": "1b62a7df",
-        "nationality": ["no"],
-        "position": ["FW"],
-        "birth_year": 1998,
-    },
-    "Nino-\u017dugelj": {
-        "id": "5529a99a",
-        "nationality": ["si"],
-        "position": ["FW"],
-        "birth_year": 2000,
-    },
-    "Philipp-Zulechner": {
-        "id": "d4141878",
-        "nationality": ["at"],
-        "position": ["FW"],
-        "birth_year": 1990,
-    },
-    "Leonard-Zuta": {
-        "id": "248be14f",
-        "nationality": ["mk"],
-        "position": ["DF"],
-        "birth_year": 1992,
-    },
-    "Magnar-\u00d8degaard": {
-        "id": "4fb49fb1",
-        "nationality": ["no"],
-        "position": ["DF"],
-        "birth_year": 1993,
-    },
-    "Niklas-\u00d8deg\u00e5rd": {
-        "id": "76d0e227",
-        "nationality": ["no"],
-        "position": ["FW"],
-        "birth_year": 2004,
-    },
-    "Kristoffer-\u00d8demarksbakken": {
-        "id": "00729f7a",
-        "nationality": ["no"],
-        "position": ["FW"],
-        "birth_year": 1995,
-    },
-    "Arild-\u00d8stb\u00f8": {
-        "id": "30263816",
-        "nationality": ["no"],
-        "position": ["GK"],
-        "birth_year": 1991,
-    },
-    "\u00d8ystein-\u00d8vretveit": {
-        "id": "afb3a529",
-        "nationality": ["no"],
-        "position": ["GK"],
-        "birth_year": 1994,
-    },
-    "Torgil-\u00d8wre-Gjertsen": {
-        "id": "a8e53a43",
-        "nationality": ["no"],
-        "position": ["MF", "DF"],
-        "birth_year": 1992,
-    },
-    "Leander-\u00d8y": {
-        "id": "f6d3db80",
-        "nationality": ["no"],
-        "position": ["GK"],
-        "birth_year": 2003,
-    },
-    "Casper-\u00d8yvann": {
-        "id": "12dfd92a",
-        "nationality": ["no"],
-        "position": ["DF"],
-        "birth_year": 1999,
-    },
-    "St\u00e9phane-Adam": {
-        "id": "53f04a61",
-        "nationality": ["fr"],
-        "position": ["FW"],
-        "birth_year": 1969,
-    },
-    "Dariusz-Adamczuk": {
-        "id": "294ea724",
-        "nationality": ["pl"],
-        "position": ["DF", "MF"],
-        "birth_year": 1969,
-    },
-    "Derek-Adams": {
-        "id": "9a34af56",
-        "nationality": ["sct"],
-        "position": ["MF"],
-        "birth_year": 1975,
-    },
-    "Didier-Agathe": {
-        "id": "053d8b6e",
-        "nationality": ["fr"],
-        "position": ["DF", "FW"],
-        "birth_year": 1975,
-    },
-    "J\u00f6rg-Albertz": {
-        "id": "06db606d",
-        "nationality": ["de"],
-        "position": ["MF"],
-        "birth_year": 1971,
-    },
-    "Hasney-Aljofree": {
-        "id": "8250d3dc",
-        "nationality": ["eng"],
-        "position": ["DF"],
-        "birth_year": 1978,
-    },
-    "Lorenzo-Amoruso": {
-        "id": "264b69a0",
-        "nationality": ["it"],
-        "position": ["DF"],
-        "birth_year": 1971,
-    },
-    "Lyndon-Andrews": {
-        "id": "9f08b6a7",
-        "nationality": ["tt"],
-        "position": ["MF"],
-        "birth_year": 1976,
-    },
-    "Javier-Artero": {
-        "id": "d6fdbfd4",
-        "nationality": ["es"],
-        "position": ["MF"],
-        "birth_year": 1975,
-    },
-    "Mvondo-Atangana": {
-        "id": "9295b66c",
-        "nationality": ["cm"],
-        "position": ["FW"],
-        "birth_year": 1979,
-    },
-    "Martin-Baker": {
-        "id": "59715261",
-        "nationality": ["sct"],
-        "position": ["DF"],
-        "birth_year": 1974,
-    },
-    "Sergei-Baltacha-Jr.": {
-        "id": "478d3b3c",
-        "nationality": ["sct"],
-        "position": ["DF"],
-        "birth_year": 1979,
-    },
-    "Scott-Bannerman": {
-        "id": "b0e0086b",
-        "nationality": ["sct"],
-        "position": ["MF"],
-        "birth_year": 1979,
-    },
-    "Rachid-Belabed": {
-        "id": "5f3cd9a2",
-        "nationality": ["ma"],
-        "position": ["MF"],
-        "birth_year": 1980,
-    },
-    "Eyal-Berkovic": {
-        "id": "10e485ae",
-        "nationality": ["il"],
-        "position": ["MF"],
-        "birth_year": 1972,
-    },
-    "Paul-Bernard": {
-        "id": "6262985f",
-        "nationality": ["sct"],
-        "position": ["MF"],
-        "birth_year": 1972,
-    },
-    "Calum-Bett": {
-        "id": "ae194b9e",
-        "nationality": ["is"],
-        "position": ["DF"],
-        "birth_year": 1981,
-    },
-    "Patrizio-Billio": {
-        "id": "bbf3822c",
-        "nationality": ["it"],
-        "position": ["MF"],
-        "birth_year": 1974,
-    },
-    "Ronald-de-Boer": {
-        "id": "b7485679",
-        "nationality": ["nl"],
-        "position": ["FW", "MF"],
-        "birth_year": 1970,
-    },
-    "Gary-Bollan": {
-        "id": "2ad7db11",
-        "nationality": ["sct"],
-        "position": ["DF"],
-        "birth_year": 1973,
-    },
-    "Ivano-Bonetti": {
-        "id": "b628ac57",
-        "nationality": ["it"],
-        "position": ["MF"],
-        "birth_year": 1964,
-    },
-    "Steven-Boyack": {
-        "id": "4a4ac49a",
-        "nationality": ["sct"],
-        "position": ["MF"],
-        "birth_year": 1976,
-    },
-    "Kris-Boyd": {
-        "id": "e9f4c7c5",
-        "nationality": ["sct"],
-        "position": ["FW"],
-        "birth_year": 1983,
-    },
-    "Tom-Boyd": {
-        "id": "7ca95233",
-        "nationality": ["sct"],
-        "position": ["DF"],
-        "birth_year": 1965,
-    },
-    "Darren-Brady": {
-        "id": "5bceeb1d",
-        "nationality": ["sct"],
-        "position": ["MF"],
-        "birth_year": 1981,
-    },
-    "Ged-Brannan": {
-        "id": "4cb453d5",
-        "nationality": ["eng"],
-        "position": ["MF"],
-        "birth_year": 1972,
-    },
-    "Grant-Brebner": {
-        "id": "4c6bbeb5",
-        "nationality": ["sct"],
-        "position": ["MF"],
-        "birth_year": 1977,
-    },
-    "Giovanni-van-Bronckhorst": {
-        "id": "7e4e7dea",
-        "nationality": ["nl"],
-        "position": ["DF", "MF"],
-        "birth_year": 1975,
-    },
-    "Mark-Brown": {
-        "id": "9c356533",
-        "nationality": ["sct"],
-        "position": ["GK"],
-        "birth_year": 1981,
-    },
-    "Tom-Brown": {
-        "id": "fba1f2c7",
-        "nationality": ["sct"],
-        "position": ["FW"],
-        "birth_year": 1968,
-    },
-    "Jamie-Buchan": {
-        "id": "c54d0447",
-        "nationality": ["sct"],
-        "position": ["MF"],
-        "birth_year": 1977,
-    },
-    "Lee-Bullen": {
-        "id": "58d1e624",
-        "nationality": ["sct"],
-        "position": ["DF"],
-        "birth_year": 1971,
-    },
-    "Fabi\u00e1n-Caballero": {
-        "id": "7233f435",
-        "nationality": ["ar"],
-        "position": ["FW"],
-        "birth_year": 1978,
-    },
-    "Antonio-Calder\u00f3n": {
-        "id": "375e57b1",
-        "nationality": ["es"],
-        "position": ["MF"],
-        "birth_year": 1967,
-    },
-    "Colin-Cameron": {
-        "id": "094c443c",
-        "nationality": ["sct"],
-        "position": ["MF"],
-        "birth_year": 1972,
-    },
-    "Peter-Canero": {
-        "id": "67c53caf",
-        "nationality": ["sct"],
-        "position": ["MF"],
-        "birth_year": 1981,
-    },
-    "Claudio-Caniggia": {
-        "id": "35cea26e",
-        "nationality": ["ar"],
-        "position": ["FW", "MF"],
-        "birth_year": 1967,
-    },
-    "Beto-Carranza": {
-        "id": "cc85e2bd",
-        "nationality": ["ar"],
-        "position": ["FW", "MF"],
-        "birth_year": 1972,
-    },
-    "Juan-Carricondo": {
-        "id": "214bb7b0",
-        "nationality": ["es"],
-        "position": ["MF"],
-        "birth_year": 1977,
-    },
-    "Stephen-Carson": {
-        "id": "db6380b2",
-        "nationality": ["nir"],
-        "position": ["MF"],
-        "birth_year": 1980,
-    },
-    "Sa\u00efd-Chiba": {
-        "id": "4693bdcd",
-        "nationality": ["ma"],
-        "position": ["MF"],
-        "birth_year": 1970,
-    },
-    "Jesper-Christiansen": {
-        "id": "a80cb423",
-        "nationality": ["dk"],
-        "position": ["GK"],
-        "birth_year": 1978,
-    },
-    "Chris-Clark": {
-        "id": "c37c58f1",
-        "nationality": ["sct"],
-        "position": ["MF"],
-        "birth_year": 1980,
-    },
-    "Christophe-Cocard": {
-        "id": "b425ff33",
-        "nationality": ["fr"],
-        "position": ["FW", "MF"],
-        "birth_year": 1967,
-    },
-    "Nick-Colgan": {
-        "id": "31a045d8",
-        "nationality": ["ie"],
-        "position": ["GK"],
-        "birth_year": 1973,
-    },
-    "Alan-Combe": {
-        "id": "0fa1f218",
-        "nationality": ["sct"],
-        "position": ["GK"],
-        "birth_year": 1974,
-    },
-    "Jon-Connolly": {
-        "id": "29b5d2b0",
-        "nationality": ["sct"],
-        "position": ["GK"],
-        "birth_year": 1981,
-    },
-    "Paddy-Connolly": {
-        "id": "66966623",
-        "nationality": ["sct"],
-        "position": ["FW"],
-        "birth_year": 1970,
-    },
-    "Martyn-Corrigan": {
-        "id": "9caaa11d",
-        "nationality": ["sct"],
-        "position": ["DF"],
-        "birth_year": 1977,
-    },
-    "Owen-Coyle": {
-        "id": "ba54c6f8",
-        "nationality": ["ie"],
-        "position": ["FW"],
-        "birth_year": 1966,
-    },
-    "Chris-Coyne": {
-        "id": "ed3bf0af",
-        "nationality": ["au"],
-        "position": ["DF"],
-        "birth_year": 1978,
-    },
-    "Stephen-Crainey": {
-        "id": "2f6dd6a3",
-        "nationality": ["sct"],
-        "position": ["DF"],
-        "birth_year": 1981,
-    },
-    "Stevie-Crawford": {
-        "id": "33a69223",
-        "nationality": ["sct"],
-        "position": ["FW"],
-        "birth_year": 1974,
-    },
-    "Moussa-Dagnogo": {
-        "id": "e08f609d",
-        "nationality": ["fr"],
-        "position": ["FW"],
-        "birth_year": 1972,
-    },
-    "Jason-Dair": {
-        "id": "e434fcd6",
-        "nationality": ["sct"],
-        "position": ["MF"],
-        "birth_year": 1974,
-    },
-    "Craig-Dargo": {
-        "id": "4cdba89f",
-        "nationality": ["sct"],
-        "position": ["FW"],
-        "birth_year": 1978,
-    },
-    "Nick-Dasovic": {
-        "id": "4a72b95c",
-        "nationality": ["ca"],
-        "position": ["MF"],
-        "birth_year": 1968,
-    },
-    "Hugh-Davidson": {
-        "id": "46f66567",
-        "nationality": ["sct"],
-        "position": ["MF"],
-        "birth_year": 1980,
-    },
-    "Stuart-Davidson": {
-        "id": "ba3ff5ea",
-        "nationality": ["sct"],
-        "position": ["MF"],
-        "birth_year": 1979,
-    },
-    "John-Davies": {"id": "4b8530f7", "position": ["MF"], "birth_year": 1966},
-    "Marco-De-Marchi": {
-        "id": "e9923b31",
-        "nationality": ["it"],
-        "position": ["DF"],
-        "birth_year": 1966,
-    },
-    "Walter-del-R\u00edo": {
-        "id": "0b03b705",
-        "nationality": ["ar"],
-        "position": ["DF"],
-        "birth_year": 1976,
-    },
-    "Mark-Dempsie": {
-        "id": "645f6c2a",
-        "nationality": ["sct"],
-        "position": ["DF"],
-        "birth_year": 1980,
-    },
-    "Paul-di-Giacomo": {
-        "id": "8bc2a05f",
-        "nationality": ["sct"],
-        "position": ["FW", "MF"],
-        "birth_year": 1982,
-    },
-    "Marinus-Dijkhuizen": {
-        "id": "6240df30",
-        "nationality": ["nl"],
-        "position": ["FW"],
-        "birth_year": 1972,
-    },
-    "Fr\u00e9d\u00e9ric-Dindeleux": {
-        "id": "3378af21",
-        "nationality": ["fr"],
-        "position": ["DF"],
-        "birth_year": 1974,
-    },
-    "Billy-Dodds": {
-        "id": "e1170057",
-        "nationality": ["sct"],
-        "position": ["FW"],
-        "birth_year": 1969,
-    },
-    "Darren-Dods": {
-        "id": "e22908a5",
-        "nationality": ["sct"],
-        "position": ["DF"],
-        "birth_year": 1975,
-    },
-    "Michel-Doesburg": {
-        "id": "137494a6",
-        "nationality": ["nl"],
-        "position": ["DF"],
-        "birth_year": 1968,
-    },
-    "Robert-Douglas": {
-        "id": "f8c81346",
-        "nationality": ["sct"],
-        "position": ["GK"],
-        "birth_year": 1972,
-    },
-    "Andy-Dow": {
-        "id": "47950b10",
-        "nationality": ["sct"],
-        "position": ["DF"],
-        "birth_year": 1973,
-    },
-    "Gordon-Durie": {
-        "id": "70370add",
-        "nationality": ["sct"],
-        "position": ["FW"],
-        "birth_year": 1965,
-    },
-    "Ian-Durrant": {
-        "id": "f036a4f8",
-        "nationality": ["sct"],
-        "position": ["MF"],
-        "birth_year": 1966,
-    },
-    "Craig-Easton": {
-        "id": "35900157",
-        "nationality": ["sct"],
-        "position": ["MF"],
-        "birth_year": 1979,
-    },
-    "Stuart-Elliott": {
-        "id": "d84137ee",
-        "nationality": ["nir"],
-        "position": ["MF"],
-        "birth_year": 1978,
-    },
-    "Ryan-Esson": {
-        "id": "34a5f810",
-        "nationality": ["sct"],
-        "position": ["GK"],
-        "birth_year": 1980,
-    },
-    "Sean-Evers": {
-        "id": "199e84ca",
-        "nationality": ["eng"],
-        "position": ["MF"],
-        "birth_year": 1977,
-    },
-    "Willie-Falconer": {
-        "id": "cb6882b6",
-        "nationality": ["sct"],
-        "position": ["FW"],
-        "birth_year": 1966,
-    },
-    "Graham-Fenton": {
-        "id": "d2fd5e70",
-        "nationality": ["eng"],
-        "position": ["MF"],
-        "birth_year": 1974,
-    },
-    "Paul-Fenwick": {
-        "id": "a672f728",
-        "nationality": ["ca"],
-        "position": ["DF"],
-        "birth_year": 1969,
-    },
-    "Barry-Ferguson": {
-        "id": "43420ade",
-        "nationality": ["sct"],
-        "position": ["MF"],
-        "birth_year": 1978,
-    },
-    "Ian-Ferguson": {
-        "id": "8de82773",
-        "nationality": ["sct"],
-        "position": ["MF"],
-        "birth_year": 1967,
-    },
-    "Fabrice-Fernandes": {
-        "id": "9838d388",
-        "nationality": ["fr"],
-        "position": ["MF"],
-        "birth_year": 1979,
-    },
-    "Joachim-Fernandez": {
-        "id": "535014bc",
-        "nationality": ["fr"],
-        "position": ["DF", "MF"],
-        "birth_year": 1972,
-    },
-    "Mark-Ferry": {
-        "id": "ee958682",
-        "nationality": ["sct"],
-        "position": ["DF", "MF"],
-        "birth_year": 1984,
-    },
-    "Thomas-Fl\u00f6gel": {
-        "id": "e32c18a9",
-        "nationality": ["at"],
-        "position": ["MF"],
-        "birth_year": 1971,
-    },
-    "Ross-Forsyth": {
-        "id": "2935682d",
-        "nationality": ["sct"],
-        "position": ["DF"],
-        "birth_year": 1982,
-    },
-    "Mark-Fotheringham": {
-        "id": "b109b36c",
-        "nationality": ["sct"],
-        "position": ["MF"],
-        "birth_year": 1983,
-    },
-    "Martyn-Fotheringham": {
-        "id": "f8e98054",
-        "nationality": ["sct"],
-        "position": ["MF"],
-        "birth_year": 1983,
-    },
-    "James-Fowler": {
-        "id": "3ba4aad9",
-        "nationality": ["sct"],
-        "position": ["DF", "MF"],
-        "birth_year": 1980,
-    },
-    "Stephen-Frail": {
-        "id": "10d6f04a",
-        "nationality": ["sct"],
-        "position": ["DF", "MF"],
-        "birth_year": 1969,
-    },
-    "Mike-Franks": {
-        "id": "71c3cfba",
-        "nationality": ["ca"],
-        "position": ["GK"],
-        "birth_year": 1977,
-    },
-    "Gustavo-Fuentes": {
-        "id": "9a98df4d",
-        "nationality": ["ar"],
-        "position": ["FW"],
-        "birth_year": 1973,
-    },
-    "Jamie-Fullarton": {
-        "id": "f002f9e6",
-        "nationality": ["sct"],
-        "position": ["MF"],
-        "birth_year": 1974,
-    },
-    "Steve-Fulton": {
-        "id": "090b1512",
-        "nationality": ["sct"],
-        "position": ["MF"],
-        "birth_year": 1970,
-    },
-    "Paul-Gallacher": {
-        "id": "d3c26f23",
-        "nationality": ["sct"],
-        "position": ["GK"],
-        "birth_year": 1979,
-    },
-    "Marcelino-Galoppo": {
-        "id": "0ac472e7",
-        "nationality": ["ar"],
-        "position": ["MF"],
-        "birth_year": 1970,
-    },
-    "Jes\u00fas-Garc\u00eda-Sanju\u00e1n": {
-        "id": "ab9c7306",
-        "nationality": ["es"],
-        "position": ["MF"],
-        "birth_year": 1971,
-    },
-    "Pascual-Garrido": {
-        "id": "9e86e886",
-        "nationality": ["ar"],
-        "position": ["DF"],
-        "birth_year": 1974,
-    },
-    "Marcus-Gayle": {
-        "id": "b80303a7",
-        "nationality": ["jm"],
-        "position": ["FW", "MF"],
-        "birth_year": 1970,
-    },
-    "Ricky-Gillies": {
-        "id": "fe6b1fa6",
-        "nationality": ["sct"],
-        "position": ["MF"],
-        "birth_year": 1976,
-    },
-    "Don-Goodman": {
-        "id": "8190f9dc",
-        "nationality": ["eng"],
-        "position": ["FW"],
-        "birth_year": 1966,
-    },
-    "Jonathan-Gould": {
-        "id": "6b5e5380",
-        "nationality": ["sct"],
-        "position": ["GK"],
-        "birth_year": 1968,
-    },
-    "David-Graham": {
-        "id": "b14b0ac2",
-        "nationality": ["sct"],
-        "position": ["FW"],
-        "birth_year": 1978,
-    },
-    "Danny-Griffin": {
-        "id": "c69b505f",
-        "nationality": ["nir"],
-        "position": ["DF", "MF"],
-        "birth_year": 1977,
-    },
-    "Cato-Guntveit": {
-        "id": "62c47045",
-        "nationality": ["no"],
-        "position": ["DF"],
-        "birth_year": 1975,
-    },
-    "Jim-Hamilton": {
-        "id": "24152198",
-        "nationality": ["sct"],
-        "position": ["FW"],
-        "birth_year": 1976,
-    },
-    "Steven-Hammell": {
-        "id": "4a92a8b1",
-        "nationality": ["sct"],
-        "position": ["DF", "MF"],
-        "birth_year": 1982,
-    },
-    "Steven-Hampshire": {
-        "id": "dc3aef87",
-        "nationality": ["sct"],
-        "position": ["FW"],
-        "birth_year": 1979,
-    },
-    "David-Hannah": {
-        "id": "21aec997",
-        "nationality": ["sct"],
-        "position": ["MF"],
-        "birth_year": 1973,
-    },
-    "Paul-Hartley": {
-        "id": "5e5fef9c",
-        "nationality": ["sct"],
-        "position": ["MF"],
-        "birth_year": 1976,
-    },
-    "Paul-Harvey": {"id": "49fe758f", "position": ["MF"], "birth_year": 1968},
-    "Garry-Hay": {
-        "id": "84149246",
-        "nationality": ["sct"],
-        "position": ["DF", "MF"],
-        "birth_year": 1977,
-    },
-    "Colin-Healy": {
-        "id": "56924fe6",
-        "nationality": ["ie"],
-        "position": ["MF"],
-        "birth_year": 1980,
-    },
-    "Neil-Heaney": {
-        "id": "cffb4fa2",
-        "nationality": ["eng"],
-        "position": ["MF"],
-        "birth_year": 1971,
-    },
-    "Sean-Hessey": {
-        "id": "92921891",
-        "nationality": ["eng"],
-        "position": ["DF"],
-        "birth_year": 1978,
-    },
-    "Gary-Holt": {
-        "id": "d2337a97",
-        "nationality": ["sct"],
-        "position": ["MF"],
-        "birth_year": 1973,
-    },
-    "Chris-Innes": {
-        "id": "6162f70a",
-        "nationality": ["sct"],
-        "position": ["DF"],
-        "birth_year": 1976,
-    },
-    "Mathias-Jack": {
-        "id": "13f452ac",
-        "nationality": ["de"],
-        "position": ["DF"],
-        "birth_year": 1969,
-    },
-    "Darren-Jackson": {
-        "id": "93b0f685",
-        "nationality": ["sct"],
-        "position": ["FW"],
-        "birth_year": 1966,
-    },
-    "Kevin-James": {
-        "id": "b55f79cf",
-        "nationality": ["sct"],
-        "position": ["DF"],
-        "birth_year": 1975,
-    },
-    "Tommy-Johnson": {
-        "id": "e8fa6f69",
-        "nationality": ["eng"],
-        "position": ["FW"],
-        "birth_year": 1971,
-    },
-    "Allan-Johnston": {
-        "id": "6136320d",
-        "nationality": ["sct"],
-        "position": ["MF"],
-        "birth_year": 1973,
-    },
-    "Graeme-Jones": {
-        "id": "a0071653",
-        "nationality": ["eng"],
-        "position": ["FW"],
-        "birth_year": 1970,
-    },
-    "Paul-Kaczan": {
-        "id": "f01a011d",
-        "nationality": ["sct"],
-        "position": ["DF"],
-        "birth_year": 1983,
-    },
-    "Paul-Kane": {
-        "id": "a1970072",
-        "nationality": ["sct"],
-        "position": ["MF"],
-        "birth_year": 1965,
-    },
-    "Jani-Kauppila": {
-        "id": "863e9680",
-        "nationality": ["fi"],
-        "position": ["MF"],
-        "birth_year": 1980,
-    },
-    "Benito-Kemble": {
-        "id": "56dd3a8e",
-        "nationality": ["nl"],
-        "position": ["DF"],
-        "birth_year": 1968,
-    },
-    "Tugay-Kerimo\u011flu": {
-        "id": "543e7bda",
-        "nationality": ["tr"],
-        "position": ["MF"],
-        "birth_year": 1970,
-    },
-    "Alan-Kernaghan": {
-        "id": "0b110943",
-        "nationality": ["ie"],
-        "position": ["DF"],
-        "birth_year": 1967,
-    },
-    "Chris-Kerr": {"id": "66805b59", "position": ["DF"], "birth_year": 1978},
-    "Dmitri-Kharine": {
-        "id": "48a7d00f",
-        "nationality": ["xc"],
-        "position": ["GK"],
-        "birth_year": 1968,
-    },
-    "Zurab-Khizanishvili": {
-        "id": "4e106307",
-        "nationality": ["ge"],
-        "position": ["DF"],
-        "birth_year": 1981,
-    },
-    "Andy-Kirk": {
-        "id": "45253c20",
-        "nationality": ["nir"],
-        "position": ["FW"],
-        "birth_year": 1979,
-    },
-    "Stefan-Klos": {
-        "id": "0f1e037e",
-        "nationality": ["de"],
-        "position": ["GK"],
-        "birth_year": 1971,
-    },
-    "Bert-Konterman": {
-        "id": "cb10a6d4",
-        "nationality": ["nl"],
-        "position": ["DF", "MF"],
-        "birth_year": 1971,
-    },
-    "Paul-Lambert": {
-        "id": "d6c6fa17",
-        "nationality": ["sct"],
-        "position": ["MF"],
-        "birth_year": 1969,
-    },
-    "Jamie-Langfield": {
-        "id": "e888ee83",
-        "nationality": ["sct"],
-        "position": ["GK"],
-        "birth_year": 1979,
-    },
-    "Henrik-Larsson": {
-        "id": "05ae7d22",
-        "nationality": ["se"],
-        "position": ["FW"],
-        "birth_year": 1971,
-    },
-    "Keith-Lasley": {
-        "id": "5ec2416f",
-        "nationality": ["sct"],
-        "position": ["MF"],
-        "birth_year": 1979,
-    },
-    "Russell-Latapy": {
-        "id": "6c01bef4",
-        "nationality": ["tt"],
-        "position": ["MF"],
-        "birth_year": 1968,
-    },
-    "Jim-Lauchlan": {
-        "id": "e922fdf5",
-        "nationality": ["sct"],
-        "position": ["DF"],
-        "birth_year": 1977,
-    },
-    "Martin-Lauchlan": {
-        "id": "a9f412a4",
-        "nationality": ["sct"],
-        "position": ["MF"],
-        "birth_year": 1980,
-    },
-    "Ulrik-Laursen": {
-        "id": "e0007219",
-        "nationality": ["dk"],
-        "position": ["DF"],
-        "birth_year": 1976,
-    },
-    "Dirk-Lehmann": {
-        "id": "ad39ea37",
-        "nationality": ["de"],
-        "position": ["FW", "MF"],
-        "birth_year": 1971,
-    },
-    "Scott-Leitch": {
-        "id": "f34209d0",
-        "nationality": ["sct"],
-        "position": ["MF"],
-        "birth_year": 1969,
-    },
-    "St\u00e9phane-L\u00e9oni": {
-        "id": "29bcfe77",
-        "nationality": ["fr"],
-        "position": ["DF"],
-        "birth_year": 1976,
-    },
-    "John-Licina": {
-        "id": "2870e4a9",
-        "nationality": ["fr"],
-        "position": ["DF"],
-        "birth_year": 1976,
-    },
-    "David-Lilley": {
-        "id": "7c41f151",
-        "nationality": ["sct"],
-        "position": ["DF"],
-        "birth_year": 1977,
-    },
-    "Derek-Lilley": {
-        "id": "b292ddd8",
-        "nationality": ["sct"],
-        "position": ["FW"],
-        "birth_year": 1974,
-    },
-    "Stuart-Lovell": {
-        "id": "e511c219",
-        "nationality": ["au"],
-        "position": ["FW"],
-        "birth_year": 1972,
-    },
-    "Nathan-Lowndes": {
-        "id": "663d5d18",
-        "nationality": ["eng"],
-        "position": ["FW"],
-        "birth_year": 1977,
-    },
-    "Peter-L\u00f8venkrands": {
-        "id": "609f6984",
-        "nationality": ["dk"],
-        "position": ["FW", "MF"],
-        "birth_year": 1980,
-    },
-    "Tommy-L\u00f8venkrands": {
-        "id": "8e7908e1",
-        "nationality": ["dk"],
-        "position": ["MF"],
-        "birth_year": 1974,
-    },
-    "Scott-M.-Thomson": {
-        "id": "0b582ab9",
-        "nationality": ["sct"],
-        "position": ["DF"],
-        "birth_year": 1972,
-    },
-    "Scott-MacKenzie": {
-        "id": "c88016e3",
-        "nationality": ["sct"],
-        "position": ["DF"],
-        "birth_year": 1970,
-    },
-    "Darren-Mackie": {
-        "id": "ffd28431",
-        "nationality": ["sct"],
-        "position": ["FW"],
-        "birth_year": 1982,
-    },
-    "Gus-MacPherson": {
-        "id": "ccfe4013",
-        "nationality": ["sct"],
-        "position": ["DF"],
-        "birth_year": 1968,
-    },
-    "St\u00e9phane-Mah\u00e9": {
-        "id": "1fccad10",
-        "nationality": ["fr"],
-        "position": ["DF"],
-        "birth_year": 1968,
-    },
-    "Alan-Mahood": {
-        "id": "38579664",
-        "nationality": ["sct"],
-        "position": ["MF"],
-        "birth_year": 1973,
-    },
-    "Alan-Main": {
-        "id": "e9d5b8dd",
-        "nationality": ["sct"],
-        "position": ["GK"],
-        "birth_year": 1967,
-    },
-    "Lee-Makel": {
-        "id": "317b6dd3",
-        "nationality": ["eng"],
-        "position": ["MF"],
-        "birth_year": 1973,
-    },
-    "Bob-Malcolm": {
-        "id": "5ba99c14",
-        "nationality": ["sct"],
-        "position": ["DF", "MF"],
-        "birth_year": 1980,
-    },
-    "Stuart-Malcolm": {
-        "id": "ed49a9bf",
-        "nationality": ["sct"],
-        "position": ["DF"],
-        "birth_year": 1979,
-    },
-    "Shaun-Maloney": {
-        "id": "0558e236",
-        "nationality": ["sct"],
-        "position": ["FW", "MF"],
-        "birth_year": 1983,
-    },
-    "Carlos-Marcora": {
-        "id": "226d6529",
-        "nationality": ["uy"],
-        "position": ["MF"],
-        "birth_year": 1976,
-    },
-    "Marcello-Marrocco": {
-        "id": "36cc490f",
-        "nationality": ["it"],
-        "position": ["DF"],
-        "birth_year": 1969,
-    },
-    "Gordon-Marshall": {
-        "id": "a911a017",
-        "nationality": ["sct"],
-        "position": ["GK"],
-        "birth_year": 1964,
-    },
-    "Gary-Mason": {
-        "id": "76c91a2c",
-        "nationality": ["sct"],
-        "position": ["MF"],
-        "birth_year": 1979,
-    },
-    "Alex-Mathie": {
-        "id": "01147747",
-        "nationality": ["sct"],
-        "position": ["FW"],
-        "birth_year": 1968,
-    },
-    "Rob-Matthaei": {
-        "id": "b8ac2f66",
-        "nationality": ["nl"],
-        "position": ["MF"],
-        "birth_year": 1966,
-    },
-    "Eddie-May": {
-        "id": "f3c6bb76",
-        "nationality": ["sct"],
-        "position": ["MF"],
-        "birth_year": 1967,
-    },
-    "Andreas-Mayer": {
-        "id": "bccd0c99",
-        "nationality": ["de"],
-        "position": ["MF"],
-        "birth_year": 1972,
-    },
-    "Jamie-McAllister": {
-        "id": "59df2b39",
-        "nationality": ["sct"],
-        "position": ["DF", "MF"],
-        "birth_year": 1978,
-    },
-    "Kieran-McAnespie": {
-        "id": "fdb41353",
-        "nationality": ["sct"],
-        "position": ["DF", "MF"],
-        "birth_year": 1979,
-    },
-    "Ian-McCaldon": {
-        "id": "91f2cd88",
-        "nationality": ["eng"],
-        "position": ["GK"],
-        "birth_year": 1974,
-    },
-    "Austin-McCann": {
-        "id": "9fbc8a61",
-        "nationality": ["sct"],
-        "position": ["DF"],
-        "birth_year": 1980,
-    },
-    "Neil-McCann": {
-        "id": "01ba4d73",
-        "nationality": ["sct"],
-        "position": ["MF"],
-        "birth_year": 1974,
-    },
-    "Jamie-McClen": {
-        "id": "4a2acfa7",
-        "nationality": ["eng"],
-        "position": ["DF", "MF"],
-        "birth_year": 1979,
-    },
-    "Stuart-McCluskey": {
-        "id": "528ae067",
-        "nationality": ["sct"],
-        "position": ["DF"],
-        "birth_year": 1977,
-    },
-    "Ally-McCoist": {
-        "id": "6984d45a",
-        "nationality": ["sct"],
-        "position": ["FW"],
-        "birth_year": 1962,
-    },
-    "Stephen-McConalogue": {
-        "id": "a69b747b",
-        "nationality": ["sct"],
-        "position": ["FW"],
-        "birth_year": 1981,
-    },
-    "David-McCracken": {
-        "id": "a4e5f707",
-        "nationality": ["sct"],
-        "position": ["DF"],
-        "birth_year": 1981,
-    },
-    "Lee-McCulloch": {
-        "id": "dbfc8648",
-        "nationality": ["sct"],
-        "position": ["DF", "FW"],
-        "birth_year": 1978,
-    },
-    "Marc-McCulloch": {
-        "id": "4829ae30",
-        "nationality": ["sct"],
-        "position": ["DF"],
-        "birth_year": 1980,
-    },
-    "Jamie-McCunnie": {
-        "id": "0676ff36",
-        "nationality": ["sct"],
-        "position": ["MF"],
-        "birth_year": 1983,
-    },
-    "Kevin-McDonald": {
-        "id": "7e8ad052",
-        "nationality": ["sct"],
-        "position": ["MF"],
-        "birth_year": 1981,
-    },
-    "James-McFadden": {
-        "id": "2cfdae75",
-        "nationality": ["sct"],
-        "position": ["FW", "MF"],
-        "birth_year": 1983,
-    },
-    "Steven-McGarry": {
-        "id": "968e05f9",
-        "nationality": ["sct"],
-        "position": ["MF"],
-        "birth_year": 1979,
-    },
-    "Jamie-McGowan": {"id": "0007fb64", "position": ["DF"], "birth_year": 1970},
-    "Kevin-McGowne": {
-        "id": "285bd394",
-        "nationality": ["sct"],
-        "position": ["DF"],
-        "birth_year": 1969,
-    },
-    "Chris-McGroarty": {
-        "id": "153ece3f",
-        "nationality": ["sct"],
-        "position": ["MF"],
-        "birth_year": 1981,
-    },
-    "Phil-McGuire": {
-        "id": "bc9c5906",
-        "nationality": ["sct"],
-        "position": ["DF", "MF"],
-        "birth_year": 1980,
-    },
-    "Martin-McIntosh": {
-        "id": "6245528d",
-        "nationality": ["sct"],
-        "position": ["DF"],
-        "birth_year": 1971,
-    },
-    "Roddy-McKenzie": {
-        "id": "d15b55ba",
-        "nationality": ["sct"],
-        "position": ["GK"],
-        "birth_year": 1975,
-    },
-    "Paul-McKnight": {
-        "id": "c3446d0e",
-        "nationality": ["nir"],
-        "position": ["FW"],
-        "birth_year": 1977,
-    },
-    "Andy-McLaren": {
-        "id": "67ed50db",
-        "nationality": ["sct"],
-        "position": ["MF"],
-        "birth_year": 1973,
-    },
-    "Barry-McLaughlin": {
-        "id": "772e78a7",
-        "nationality": ["sct"],
-        "position": ["DF"],
-        "birth_year": 1973,
-    },
-    "Tam-McManus": {
-        "id": "c3d63691",
-        "nationality": ["sct"],
-        "position": ["FW"],
-        "birth_year": 1981,
-    },
-    "Steve-McMillan": {
-        "id": "1c7b48f9",
-        "nationality": ["sct"],
-        "position": ["DF"],
-        "birth_year": 1976,
-    },
-    "Jackie-McNamara": {
-        "id": "3e4ef2f0",
-        "nationality": ["sct"],
-        "position": ["DF", "MF"],
-        "birth_year": 1973,
-    },
-    "Kevin-McNaughton": {
-        "id": "40a814af",
-        "nationality": ["sct"],
-        "position": ["DF"],
-        "birth_year": 1982,
-    },
-    "Stephen-McPhee": {
-        "id": "ce597b13",
-        "nationality": ["sct"],
-        "position": ["FW"],
-        "birth_year": 1981,
-    },
-    "John-McQuillan": {
-        "id": "5c672eb2",
-        "nationality": ["sct"],
-        "position": ["DF"],
-        "birth_year": 1970,
-    },
-    "Shaun-McSkimming": {
-        "id": "7157eaae",
-        "nationality": ["sct"],
-        "position": ["MF"],
-        "birth_year": 1970,
-    },
-    "Gary-McSwegan": {
-        "id": "efa25f81",
-        "nationality": ["sct"],
-        "position": ["FW"],
-        "birth_year": 1970,
-    },
-    "Colin-Meldrum": {
-        "id": "55007e13",
-        "nationality": ["sct"],
-        "position": ["GK"],
-        "birth_year": 1975,
-    },
-    "Junior-Mendes": {
-        "id": "add8c79d",
-        "nationality": ["ms"],
-        "position": ["FW"],
-        "birth_year": 1976,
-    },
-    "Scott-Michie": {
-        "id": "d181f9ca",
-        "nationality": ["sct"],
-        "position": ["FW"],
-        "birth_year": 1983,
-    },
-    "Charles-Miller": {
-        "id": "f0747c44",
-        "nationality": ["sct"],
-        "position": ["MF"],
-        "birth_year": 1976,
-    },
-    "Kenny-Miller": {
-        "id": "5e606f92",
-        "nationality": ["sct"],
-        "position": ["FW"],
-        "birth_year": 1979,
-    },
-    "Kenny-Milne": {
-        "id": "54614cd2",
-        "nationality": ["sct"],
-        "position": ["DF"],
-        "birth_year": 1979,
-    },
-    "Steven-Milne": {
-        "id": "9371cab8",
-        "nationality": ["sct"],
-        "position": ["FW"],
-        "birth_year": 1980,
-    },
-    "Ally-Mitchell": {
-        "id": "1452fb23",
-        "nationality": ["sct"],
-        "position": ["MF"],
-        "birth_year": 1968,
-    },
-    "Johan-Mj\u00e4llby": {
-        "id": "c2f225df",
-        "nationality": ["se"],
-        "position": ["DF", "MF"],
-        "birth_year": 1971,
-    },
-    "Michael-Mols": {
-        "id": "66f4e578",
-        "nationality": ["nl"],
-        "position": ["FW"],
-        "birth_year": 1970,
-    },
-    "Craig-Moore": {
-        "id": "bf594599",
-        "nationality": ["au"],
-        "position": ["DF"],
-        "birth_year": 1975,
-    },
-    "\u013dubom\u00edr-Morav\u010d\u00edk": {
-        "id": "224bcdd5",
-        "nationality": ["sk"],
-        "position": ["MF"],
-        "birth_year": 1965,
-    },
-    "David-Moss": {"id": "a2bf2324", "position": ["MF"], "birth_year": 1968},
-    "Grant-Murray": {
-        "id": "ff8c3bb8",
-        "nationality": ["sct"],
-        "position": ["DF"],
-        "birth_year": 1975,
-    },
-    "Hugh-Murray": {
-        "id": "68069167",
-        "nationality": ["sct"],
-        "position": ["MF"],
-        "birth_year": 1979,
-    },
-    "Ian-Murray": {
-        "id": "9beb28fd",
-        "nationality": ["sct"],
-        "position": ["DF", "MF"],
-        "birth_year": 1981,
-    },
-    "Beto-Naveda": {
-        "id": "5733c359",
-        "nationality": ["ar"],
-        "position": ["FW"],
-        "birth_year": 1972,
-    },
-    "Marco-Negri": {
-        "id": "b744ade8",
-        "nationality": ["it"],
-        "position": ["FW"],
-        "birth_year": 1970,
-    },
-    "Robbie-Neilson": {
-        "id": "28d09aad",
-        "nationality": ["sct"],
-        "position": ["DF"],
-        "birth_year": 1980,
-    },
-    "Georgi-Nemsadze": {
-        "id": "1fa23c87",
-        "nationality": ["ge"],
-        "position": ["MF"],
-        "birth_year": 1972,
-    },
-    "Stevie-Nicholas": {
-        "id": "b8c43cff",
-        "nationality": ["sct"],
-        "position": ["MF"],
-        "birth_year": 1981,
-    },
-    "Barry-Nicholson": {
-        "id": "a31efd61",
-        "nationality": ["sct"],
-        "position": ["MF"],
-        "birth_year": 1978,
-    },
-    "Iain-Nicolson": {
-        "id": "089bb53a",
-        "nationality": ["sct"],
-        "position": ["DF"],
-        "birth_year": 1976,
-    },
-    "Antti-Niemi": {
-        "id": "79c3c101",
-        "nationality": ["fi"],
-        "position": ["GK"],
-        "birth_year": 1972,
-    },
-    "Colin-Nish": {
-        "id": "1c5b72e0",
-        "nationality": ["sct"],
-        "position": ["FW"],
-        "birth_year": 1981,
-    },
-    "Arthur-Numan": {
-        "id": "6d089cb6",
-        "nationality": ["nl"],
-        "position": ["DF"],
-        "birth_year": 1969,
-    },
-    "Garry-O'Connor": {
-        "id": "07fffbc5",
-        "nationality": ["sct"],
-        "position": ["FW"],
-        "birth_year": 1983,
-    },
-    "Sean-O'Connor": {
-        "id": "70f5f105",
-        "nationality": ["eng"],
-        "position": ["FW"],
-        "birth_year": 1981,
-    },
-    "Ross-O'Donoghue": {
-        "id": "f7aa4208",
-        "nationality": ["sct"],
-        "position": ["MF"],
-        "birth_year": 1983,
-    },
-    "John-O'Neil": {
-        "id": "ca41af92",
-        "nationality": ["sct"],
-        "position": ["MF"],
-        "birth_year": 1971,
-    },
-    "Michael-O'Neill": {
-        "id": "9c4b0f99",
-        "nationality": ["nir"],
-        "position": ["MF"],
-        "birth_year": 1969,
-    },
-    "James-Okoli": {
-        "id": "b260d6a4",
-        "nationality": ["nl"],
-        "position": ["DF"],
-        "birth_year": 1976,
-    },
-    "Ange-Oueifio": {
-        "id": "b026bd69",
-        "nationality": ["cf"],
-        "position": ["DF"],
-        "birth_year": 1976,
-    },
-    "Mixu-Paatelainen": {
-        "id": "23e78267",
-        "nationality": ["fi"],
-        "position": ["FW"],
-        "birth_year": 1967,
-    },
-    "Jens-Paeslack": {
-        "id": "3146ed3c",
-        "nationality": ["de"],
-        "position": ["FW"],
-        "birth_year": 1974,
-    },
-    "Keigan-Parker": {
-        "id": "95ef020d",
-        "nationality": ["sct"],
-        "position": ["FW"],
-        "birth_year": 1982,
-    },
-    "David-Partridge": {
-        "id": "b4bdfde0",
-        "nationality": ["wls"],
-        "position": ["DF"],
-        "birth_year": 1978,
-    },
-    "Jim-Paterson": {
-        "id": "8032c745",
-        "nationality": ["sct"],
-        "position": ["DF", "MF"],
-        "birth_year": 1979,
-    },
-    "John-Paul-McBride": {
-        "id": "8d2dc36a",
-        "nationality": ["sct"],
-        "position": ["MF"],
-        "birth_year": 1978,
-    },
-    "Stephen-Pearson": {
-        "id": "568839eb",
-        "nationality": ["sct"],
-        "position": ["MF"],
-        "birth_year": 1982,
-    },
-    "Mark-Perry": {
-        "id": "a8957ba2",
-        "nationality": ["sct"],
-        "position": ["DF"],
-        "birth_year": 1971,
-    },
-    "Gordan-Petri\u0107": {
-        "id": "1da7aa13",
-        "nationality": ["yu"],
-        "position": ["DF"],
-        "birth_year": 1969,
-    },
-    "Stewart-Petrie": {
-        "id": "89f54dc6",
-        "nationality": ["sct"],
-        "position": ["FW", "MF"],
-        "birth_year": 1970,
-    },
-    "Stiliyan-Petrov": {
-        "id": "61e5c1a8",
-        "nationality": ["bg"],
-        "position": ["MF"],
-        "birth_year": 1979,
-    },
-    "Bobby-Petta": {
-        "id": "d86f5a68",
-        "nationality": ["nl"],
-        "position": ["MF"],
-        "birth_year": 1974,
-    },
-    "Sergio-Porrini": {
-        "id": "7388ef02",
-        "nationality": ["it"],
-        "position": ["DF"],
-        "birth_year": 1968,
-    },
-    "David-Preece": {
-        "id": "dbf346f5",
-        "nationality": ["eng"],
-        "position": ["GK"],
-        "birth_year": 1976,
-    },
-    "Steven-Pressley": {
-        "id": "25b379f2",
-        "nationality": ["sct"],
-        "position": ["DF"],
-        "birth_year": 1973,
-    },
-    "Jos\u00e9-Quitongo": {
-        "id": "205af967",
-        "nationality": ["ao"],
-        "position": ["MF"],
-        "birth_year": 1974,
-    },
-    "Gavin-Rae": {
-        "id": "267b20c3",
-        "nationality": ["sct"],
-        "position": ["MF"],
-        "birth_year": 1977,
-    },
-    "Dougie-Ramsay": {
-        "id": "cac03cfa",
-        "nationality": ["sct"],
-        "position": ["MF"],
-        "birth_year": 1979,
-    },
-    "Brian-Reid": {
-        "id": "c74c197b",
-        "nationality": ["sct"],
-        "position": ["DF"],
-        "birth_year": 1970,
-    },
-    "Mark-Reilly": {
-        "id": "378b1539",
-        "nationality": ["sct"],
-        "position": ["MF"],
-        "birth_year": 1969,
-    },
-    "Maikel-Renfurm": {
-        "id": "011360b0",
-        "nationality": ["nl"],
-        "position": ["FW"],
-        "birth_year": 1976,
-    },
-    "Claudio-Reyna": {
-        "id": "75a3a799",
-        "nationality": ["us"],
-        "position": ["MF"],
-        "birth_year": 1973,
-    },
-    "Fernando-Ricksen": {
-        "id": "4bfbe2d3",
-        "nationality": ["nl"],
-        "position": ["DF", "MF"],
-        "birth_year": 1976,
-    },
-    "Hugh-Robertson": {
-        "id": "a3c586a2",
-        "nationality": ["sct"],
-        "position": ["DF"],
-        "birth_year": 1975,
-    },
-    "Mark-Robertson": {
-        "id": "81db8db1",
-        "nationality": ["au"],
-        "position": ["DF", "MF"],
-        "birth_year": 1977,
-    },
-    "Marco-Roccati": {
-        "id": "485f28ee",
-        "nationality": ["it"],
-        "position": ["GK"],
-        "birth_year": 1975,
-    },
-    "Alessandro-Romano": {
-        "id": "e01282f0",
-        "nationality": ["it"],
-        "position": ["DF"],
-        "birth_year": 1969,
-    },
-    "Ian-Ross": {
-        "id": "b97e8112",
-        "nationality": ["sct"],
-        "position": ["MF"],
-        "birth_year": 1974,
-    },
-    "Maurice-Ross": {
-        "id": "720ad76b",
-        "nationality": ["sct"],
-        "position": ["DF"],
-        "birth_year": 1981,
-    },
-    "Youssef-Rossi": {
-        "id": "42848a5f",
-        "nationality": ["ma"],
-        "position": ["DF"],
-        "birth_year": 1973,
-    },
-    "David-Rowson": {
-        "id": "4f564e36",
-        "nationality": ["sct"],
-        "position": ["MF"],
-        "birth_year": 1976,
-    },
-    "Ludovic-Roy": {
-        "id": "f58f3d8f",
-        "nationality": ["fr"],
-        "position": ["GK"],
-        "birth_year": 1977,
-    },
-    "Marco-Ruitenbeek": {
-        "id": "0a4b02de",
-        "nationality": ["nl"],
-        "position": ["GK"],
-        "birth_year": 1968,
-    },
-    "Craig-Russell": {
-        "id": "fb6f16c0",
-        "nationality": ["eng"],
-        "position": ["DF", "FW"],
-        "birth_year": 1974,
-    },
-    "Marco-Russo": {
-        "id": "9fd0863c",
-        "nationality": ["it"],
-        "position": ["MF"],
-        "birth_year": 1982,
-    },
-    "Kevin-Rutkiewicz": {
-        "id": "11274d98",
-        "nationality": ["sct"],
-        "position": ["DF"],
-        "birth_year": 1980,
-    },
-    "Hakim-Sar-Temsoury": {
-        "id": "f72fa590",
-        "nationality": ["fr"],
-        "position": ["FW", "MF"],
-        "birth_year": 1981,
-    },
-    "Juan-Sara": {
-        "id": "bac30fdd",
-        "nationality": ["ar"],
-        "position": ["FW"],
-        "birth_year": 1976,
-    },
-    "Franck-Sauz\u00e9e": {
-        "id": "f7ec25c8",
-        "nationality": ["fr"],
-        "position": ["DF", "FW"],
-        "birth_year": 1965,
-    },
-    "Derek-Scrimgour": {
-        "id": "2b9de751",
-        "nationality": ["sct"],
-        "position": ["GK"],
-        "birth_year": 1978,
-    },
-    "Scott-Severin": {
-        "id": "affd2f0b",
-        "nationality": ["sct"],
-        "position": ["DF", "MF"],
-        "birth_year": 1979,
-    },
-    "Lee-Sharp": {
-        "id": "bc396b55",
-        "nationality": ["sct"],
-        "position": ["DF", "MF"],
-        "birth_year": 1975,
-    },
-    "Stephen-Simmons": {
-        "id": "2b5a852d",
-        "nationality": ["sct"],
-        "position": ["MF"],
-        "birth_year": 1982,
-    },
-    "Fitzroy-Simpson": {
-        "id": "54cd615c",
-        "nationality": ["jm"],
-        "position": ["MF"],
-        "birth_year": 1970,
-    },
-    "Andrius-Skerla": {
-        "id": "8bd1e142",
-        "nationality": ["lt"],
-        "position": ["DF"],
-        "birth_year": 1977,
-    },
-    "Justin-Skinner": {
-        "id": "9013cc16",
-        "nationality": ["eng"],
-        "position": ["MF"],
-        "birth_year": 1969,
-    },
-    "Barry-Smith": {
-        "id": "680b95d2",
-        "nationality": ["sct"],
-        "position": ["DF"],
-        "birth_year": 1974,
-    },
-    "Gary-Smith": {
-        "id": "9b38d261",
-        "nationality": ["sct"],
-        "position": ["DF"],
-        "birth_year": 1971,
-    },
-    "Jamie-Smith": {
-        "id": "0c0b6be0",
-        "nationality": ["sct"],
-        "position": ["MF"],
-        "birth_year": 1980,
-    },
-    "Tom-Smith": {
-        "id": "eb8f2eb6",
-        "nationality": ["sct"],
-        "position": ["DF"],
-        "birth_year": 1973,
-    },
-    "Tony-Smith": {
-        "id": "08afa59c",
-        "nationality": ["sct"],
-        "position": ["DF"],
-        "birth_year": 1973,
-    },
-    "Thomas-Solberg": {
-        "id": "5bfc8c8e",
-        "nationality": ["no"],
-        "position": ["DF"],
-        "birth_year": 1970,
-    },
-    "John-Spencer": {
-        "id": "81922efe",
-        "nationality": ["sct"],
-        "position": ["FW"],
-        "birth_year": 1970,
-    },
-    "Arild-Stavrum": {
-        "id": "2bc5bd64",
-        "nationality": ["no"],
-        "position": ["FW"],
-        "birth_year": 1972,
-    },
-    "Greg-Strong": {
-        "id": "12469566",
-        "nationality": ["eng"],
-        "position": ["DF"],
-        "birth_year": 1975,
-    },
-    "Alan-Stubbs": {
-        "id": "474865f9",
-        "nationality": ["eng"],
-        "position": ["DF"],
-        "birth_year": 1971,
-    },
-    "Chris-Sutton": {
-        "id": "83c38e36",
-        "nationality": ["eng"],
-        "position": ["DF", "FW"],
-        "birth_year": 1973,
-    },
-    "Mohammed-Sylla": {
-        "id": "92047aad",
-        "nationality": ["gn"],
-        "position": ["MF"],
-        "birth_year": 1977,
-    },
-    "Alphonse-Tchami": {
-        "id": "6280ea3d",
-        "nationality": ["cm"],
-        "position": ["FW"],
-        "birth_year": 1971,
-    },
-    "Olivier-T\u00e9bily": {
-        "id": "10b7ae2e",
-        "nationality": ["ci"],
-        "position": ["DF"],
-        "birth_year": 1975,
-    },
-    "Chris-Templeman": {
-        "id": "26119da8",
-        "nationality": ["sct"],
-        "position": ["FW"],
-        "birth_year": 1980,
-    },
-    "Alan-Thompson": {
-        "id": "2eaac012",
-        "nationality": ["eng"],
-        "position": ["MF"],
-        "birth_year": 1973,
-    },
-    "Steven-Thompson": {
-        "id": "20f187ba",
-        "nationality": ["sct"],
-        "position": ["FW"],
-        "birth_year": 1978,
-    },
-    "Fergus-Tiernan": {
-        "id": "abe7e0fb",
-        "nationality": ["sct"],
-        "position": ["MF"],
-        "birth_year": 1982,
-    },
-    "Andy-Tod": {
-        "id": "5f72311e",
-        "nationality": ["sct"],
-        "position": ["DF"],
-        "birth_year": 1971,
-    },
-    "R\u00f3bert-Tomaschek": {
-        "id": "54f7642c",
-        "nationality": ["sk"],
-        "position": ["MF"],
-        "birth_year": 1972,
-    },
-    "Derek-Townsley": {
-        "id": "4d21def0",
-        "nationality": ["eng"],
-        "position": ["MF"],
-        "birth_year": 1973,
-    },
-    "Tommy-Turner": {
-        "id": "572ce47f",
-        "nationality": ["sct"],
-        "position": ["MF"],
-        "birth_year": 1963,
-    },
-    "Kevin-Twaddle": {
-        "id": "598c6ad3",
-        "nationality": ["sct"],
-        "position": ["FW", "MF"],
-        "birth_year": 1971,
-    },
-    "Steven-Tweed": {
-        "id": "02c7b072",
-        "nationality": ["sct"],
-        "position": ["DF"],
-        "birth_year": 1972,
-    },
-    "Joos-Valgaeren": {
-        "id": "75edf1a6",
-        "nationality": ["be"],
-        "position": ["DF"],
-        "birth_year": 1976,
-    },
-    "J\u00e9r\u00f4me-Vareille": {
-        "id": "19fc8bb8",
-        "nationality": ["fr"],
-        "position": ["FW"],
-        "birth_year": 1974,
-    },
-    "Mauro-Vargiu": {
-        "id": "9c9724db",
-        "nationality": ["it"],
-        "position": ["DF"],
-        "birth_year": 1983,
-    },
-    "Tassos-Venetis": {
-        "id": "88d7a3e5",
-        "nationality": ["gr"],
-        "position": ["MF"],
-        "birth_year": 1980,
-    },
-    "Tony-Vidmar": {
-        "id": "52a1af8b",
-        "nationality": ["au"],
-        "position": ["DF"],
-        "birth_year": 1970,
-    },
-    "Jason-de-Vos": {
-        "id": "ff874486",
-        "nationality": ["ca"],
-        "position": ["DF"],
-        "birth_year": 1974,
-    },
-    "Gary-Wales": {
-        "id": "8ab86dc0",
-        "nationality": ["sct"],
-        "position": ["FW"],
-        "birth_year": 1979,
-    },
-    "Scott-Walker": {
-        "id": "4cfc5d5d",
-        "nationality": ["sct"],
-        "position": ["DF"],
-        "birth_year": 1975,
-    },
-    "Rod-Wallace": {
-        "id": "89421101",
-        "nationality": ["eng"],
-        "position": ["FW"],
-        "birth_year": 1969,
-    },
-    "Andy-Webster": {
-        "id": "f0c22147",
-        "nationality": ["sct"],
-        "position": ["DF"],
-        "birth_year": 1982,
-    },
-    "Jim-Weir": {
-        "id": "08b58f0f",
-        "nationality": ["sct"],
-        "position": ["DF"],
-        "birth_year": 1969,
-    },
-    "Derek-Whyte": {
-        "id": "97e8d820",
-        "nationality": ["sct"],
-        "position": ["DF"],
-        "birth_year": 1968,
-    },
-    "Lee-Wilkie": {
-        "id": "278aabd5",
-        "nationality": ["sct"],
-        "position": ["DF"],
-        "birth_year": 1980,
-    },
-    "Scott-Wilson": {
-        "id": "36af9ccf",
-        "nationality": ["sct"],
-        "position": ["DF"],
-        "birth_year": 1977,
-    },
-    "David-Winters": {
-        "id": "8e12035f",
-        "nationality": ["sct"],
-        "position": ["FW"],
-        "birth_year": 1983,
-    },
-    "Robbie-Winters": {
-        "id": "cb93d964",
-        "nationality": ["sct"],
-        "position": ["FW", "MF"],
-        "birth_year": 1974,
-    },
-    "Stevie-Woods": {
-        "id": "120f15f6",
-        "nationality": ["sct"],
-        "position": ["GK"],
-        "birth_year": 1970,
-    },
-    "Paul-Wright": {
-        "id": "7473978e",
-        "nationality": ["sct"],
-        "position": ["FW"],
-        "birth_year": 1967,
-    },
-    "Scott-Y.-Thomson": {
-        "id": "04a64eb8",
-        "nationality": ["sct"],
-        "position": ["GK"],
-        "birth_year": 1966,
-    },
-    "Mark-Yardley": {
-        "id": "29a8dc6c",
-        "nationality": ["sct"],
-        "position": ["FW"],
-        "birth_year": 1969,
-    },
-    "Darren-Young": {
-        "id": "6c87b7de",
-        "nationality": ["sct"],
-        "position": ["MF"],
-        "birth_year": 1978,
-    },
-    "Derek-Young": {
-        "id": "18929a43",
-        "nationality": ["sct"],
-        "position": ["MF"],
-        "birth_year": 1980,
-    },
-    "Hicham-Zerouali": {
-        "id": "7973ec74",
-        "nationality": ["ma"],
-        "position": ["FW"],
-        "birth_year": 1977,
-    },
-    "David-Zitelli": {
-        "id": "8ffd3af9",
-        "nationality": ["fr"],
-        "position": ["FW"],
-        "birth_year": 1968,
-    },
-    "Brendan-Crozier": {"id": ""},
-    "Colin-Drew": {"id": ""},
-    "Darren-Goldie": {"id": ""},
-    "David-McClune": {"id": ""},
-    "Gary-Bowman": {"id": ""},
-    "George-Fotheringham": {"id": ""},
-    "Kris-O'Neil": {"id": ""},
-    "Mark-McGarty": {"id": ""},
-    "Martin-Wood": {"id": ""},
-    "Michael-Yates": {"id": ""},
-    "Paul-Rudden": {"id": ""},
-    "Ryan-Robinson": {"id": ""},
-    "Wesley-Boyle": {"id": ""},
-    "Alberto-Acosta": {
-        "id": "0e552f4c",
-        "nationality": ["ar"],
-        "position": ["FW"],
-        "birth_year": 1966,
-    },
-    "\u00c1damo": {"id": "1e76ee1a", "birth_year": 1971},
-    "Ivo-Afonso": {
-        "id": "aeeb7f39",
-        "nationality": ["pt"],
-        "position": ["DF"],
-        "birth_year": 1975,
-    },
-    "Nuno-Afonso": {
-        "id": "6275452f",
-        "nationality": ["pt"],
-        "position": ["DF"],
-        "birth_year": 1974,
-    },
-    "Fernando-Aguiar": {
-        "id": "ed2a1e09",
-        "nationality": ["ca"],
-        "position": ["MF"],
-        "birth_year": 1972,
-    },
-    "Abiodun-Agunbiade": {
-        "id": "46d7801d",
-        "nationality": ["ng"],
-        "position": ["MF"],
-        "birth_year": 1983,
-    },
-    "Albertino": {"id": "faa15b9d", "birth_year": 1971},
-    "Carlos-Alberto": {
-        "id": "b5eb0c7b",
-        "nationality": ["br"],
-        "position": ["MF"],
-        "birth_year": 1981,
-    },
-    "Joaquim-Alberto-Silva": {
-        "id": "96c701a2",
-        "nationality": ["ao"],
-        "position": ["FW"],
-        "birth_year": 1974,
-    },
-    "Marco-Aleixo": {
-        "id": "1ebb0ddb",
-        "nationality": ["pt"],
-        "position": ["DF"],
-        "birth_year": 1975,
-    },
-    "Dmitri-Alenichev": {
-        "id": "aa2a111d",
-        "nationality": ["ru"],
-        "position": ["MF"],
-        "birth_year": 1972,
-    },
-    "Bas\u00edlio-Almeida": {
-        "id": "b52fa9ea",
-        "nationality": ["pt"],
-        "position": ["MF"],
-        "birth_year": 1971,
-    },
-    "Marco-Almeida": {
-        "id": "22b9bd19",
-        "nationality": ["pt"],
-        "position": ["DF"],
-        "birth_year": 1977,
-    },
-    "Romeu-Almeida": {
-        "id": "4d547949",
-        "nationality": ["pt"],
-        "position": ["FW"],
-        "birth_year": 1974,
-    },
-    "Geraldo-Alves": {
-        "id": "629d2734",
-        "nationality": ["pt"],
-        "position": ["DF"],
-        "birth_year": 1980,
-    },
-    "Paulo-Alves": {
-        "id": "d35e8c20",
-        "nationality": ["pt"],
-        "position": ["FW"],
-        "birth_year": 1969,
-    },
-    "Nuno-Amaro": {
-        "id": "f89ca325",
-        "nationality": ["pt"],
-        "position": ["DF"],
-        "birth_year": 1976,
-    },
-    "Anderson": {
-        "id": "0cd1a769",
-        "nationality": ["br"],
-        "position": ["FW"],
-        "birth_year": 1978,
-    },
-    "Carlos-Andrade": {"id": "f2768715", "birth_year": 1975},
-    "Jorge-Andrade": {
-        "id": "8704272f",
-        "nationality": ["pt"],
-        "position": ["DF"],
-        "birth_year": 1978,
-    },
-    "Lu\u00eds-Andrade": {
-        "id": "5ec7ec27",
-        "nationality": ["pt"],
-        "position": ["MF"],
-        "birth_year": 1973,
-    },
-    "William-Amaral-de-Andrade": {
-        "id": "91550016",
-        "nationality": ["br"],
-        "position": ["DF"],
-        "birth_year": 1967,
-    },
-    "Carlos-Andr\u00e9": {"id": "1c5fcb57", "position": ["MF"], "birth_year": 1971},
-    "C\u00edlio-Andr\u00e9-Souza": {
-        "id": "bc42a6d1",
-        "nationality": ["br"],
-        "position": ["FW"],
-        "birth_year": 1976,
-    },
-    "Rodrigo-Aniceto": {"id": "df85ad57", "birth_year": 1977},
-    "Jos\u00e9-Ant\u00f3nio": {
-        "id": "2aab5ea4",
-        "nationality": ["pt"],
-        "position": ["MF"],
-        "birth_year": 1975,
-    },
-    "Juan-Antonio-Pizzi": {
-        "id": "f8011e5c",
-        "nationality": ["es"],
-        "position": ["FW"],
-        "birth_year": 1968,
-    },
-    "Z\u00e9-Ant\u00f3nio": {
-        "id": "e0a2065d",
-        "nationality": ["pt"],
-        "position": ["DF"],
-        "birth_year": 1977,
-    },
-    "Filipe-Anuncia\u00e7\u00e3o": {
-        "id": "1cc6f271",
-        "nationality": ["pt"],
-        "position": ["MF"],
-        "birth_year": 1979,
-    },
-    "Miguel-Areias": {
-        "id": "4143fba4",
-        "nationality": ["pt"],
-        "position": ["DF"],
-        "birth_year": 1977,
-    },
-    "Ariomar": {"id": "a507a788", "birth_year": 1968},
-    "Jo\u00e3o-Armando": {"id": "9b746c32", "birth_year": 1972},
-    "Nuno-Assis": {
-        "id": "2e3d4bcf",
-        "nationality": ["pt"],
-        "position": ["MF"],
-        "birth_year": 1977,
-    },
-    "Marco-Aur\u00e9lio-Siqueira": {
-        "id": "8ed1f2c5",
-        "nationality": ["br"],
-        "position": ["GK"],
-        "birth_year": 1970,
-    },
-    "Nuno-Avelino": {
-        "id": "879dcfaf",
-        "nationality": ["pt"],
-        "position": ["GK"],
-        "birth_year": 1976,
-    },
-    "Filipe-Azevedo": {
-        "id": "8e8b3344",
-        "nationality": ["fr"],
-        "position": ["FW"],
-        "birth_year": 1975,
-    },
-    "Gaspar-Azevedo": {
-        "id": "fc95bb0b",
-        "nationality": ["pt"],
-        "position": ["DF"],
-        "birth_year": 1975,
-    },
-    "Phil-Babb": {
-        "id": "37af386a",
-        "nationality": ["ie"],
-        "position": ["DF"],
-        "birth_year": 1970,
-    },
-    "Rui-Bai\u00e3o": {
-        "id": "5cc177db",
-        "nationality": ["pt"],
-        "position": ["MF"],
-        "birth_year": 1980,
-    },
-    "Bakero": {"id": "9bf5593c", "nationality": ["pt"], "birth_year": 1978},
-    "Fernando-Baptista": {"id": "a0b5ec62", "birth_year": 1970},
-    "Pedro-Barbosa": {
-        "id": "9d862b3e",
-        "nationality": ["pt"],
-        "position": ["MF"],
-        "birth_year": 1970,
-    },
-    "Jos\u00e9-Barroso": {
-        "id": "380aba5a",
-        "nationality": ["pt"],
-        "position": ["MF"],
-        "birth_year": 1970,
-    },
-    "Beke": {"id": "2f1b462a", "birth_year": 1976},
-    "Paulo-Bento": {
-        "id": "6ea288ef",
-        "nationality": ["pt"],
-        "position": ["MF"],
-        "birth_year": 1969,
-    },
-    "Rui-Bento": {
-        "id": "db9c90c2",
-        "nationality": ["pt"],
-        "position": ["DF", "MF"],
-        "birth_year": 1972,
-    },
-    "Quim-Berto": {
-        "id": "ed647000",
-        "nationality": ["pt"],
-        "position": ["DF"],
-        "birth_year": 1971,
-    },
-    "Nail-Be\u0161irovi\u0107": {
-        "id": "df6f7c85",
-        "nationality": ["ba"],
-        "position": ["MF"],
-        "birth_year": 1967,
-    },
-    "Adriano-Bessa": {
-        "id": "d7e89d9a",
-        "nationality": ["pt"],
-        "position": ["DF"],
-        "birth_year": 1976,
-    },
-    "Beto": {
-        "id": "c9837c1b",
-        "nationality": ["pt"],
-        "position": ["GK"],
-        "birth_year": 1982,
-    },
-    "Meirival-Bezerra": {
-        "id": "1683a9ab",
-        "nationality": ["br"],
-        "position": ["MF"],
-        "birth_year": 1974,
-    },
-    "Lu\u00eds-Bilro": {
-        "id": "7a95930a",
-        "nationality": ["pt"],
-        "position": ["DF"],
-        "birth_year": 1971,
-    },
-    "Bino": {
-        "id": "8842b3a3",
-        "nationality": ["pt"],
-        "position": ["MF"],
-        "birth_year": 1972,
-    },
-    "Bodunha": {
-        "id": "2022e28b",
-        "nationality": ["ao"],
-        "position": ["DF"],
-        "birth_year": 1974,
-    },
-    "Alfredo-B\u00f3ia": {"id": "9fa8b248", "position": ["DF"], "birth_year": 1975},
-    "Rui-Borges": {
-        "id": "dce9d77f",
-        "nationality": ["pt"],
-        "position": ["MF"],
-        "birth_year": 1973,
-    },
-    "Carlos-Bossio": {
-        "id": "25baab74",
-        "nationality": ["ar"],
-        "position": ["GK"],
-        "birth_year": 1973,
-    },
-    "Briguel": {
-        "id": "0be1c32c",
-        "nationality": ["pt"],
-        "position": ["DF"],
-        "birth_year": 1979,
-    },
-    "Jorge-Br\u00edtez": {
-        "id": "09009730",
-        "nationality": ["py"],
-        "position": ["MF"],
-        "birth_year": 1981,
-    },
-    "Ant\u00f3nio-Pedro-de-Brito-Lopes": {
-        "id": "4d12b0d3",
-        "nationality": ["pt"],
-        "position": ["DF"],
-        "birth_year": 1979,
-    },
-    "Jos\u00e9-Laelson-Lima-Cabral": {
-        "id": "78d797a2",
-        "nationality": ["br"],
-        "position": ["FW"],
-        "birth_year": 1975,
-    },
-    "Paulo-Cabral": {
-        "id": "c0e9b211",
-        "nationality": ["pt"],
-        "position": ["DF"],
-        "birth_year": 1972,
-    },
-    "C\u00e9sar-C\u00e1ceres-Ca\u00f1ete": {
-        "id": "abf11338",
-        "nationality": ["py"],
-        "position": ["MF"],
-        "birth_year": 1977,
-    },
-    "Mario-C\u00e1ceres": {
-        "id": "ddc7b0ed",
-        "nationality": ["cl"],
-        "position": ["FW"],
-        "birth_year": 1981,
-    },
-    "Jorge-Cadete": {
-        "id": "cd677e75",
-        "nationality": ["pt"],
-        "position": ["FW"],
-        "birth_year": 1968,
-    },
-    "Caj\u00fa": {"id": "ba7d2c98", "birth_year": 1976},
-    "Jos\u00e9-Calado": {
-        "id": "51bb57da",
-        "nationality": ["pt"],
-        "position": ["MF"],
-        "birth_year": 1974,
-    },
-    "Pedro-Miguel-da-C\u00e2mara-Pinheiro": {
-        "id": "3f4c7134",
-        "nationality": ["pt"],
-        "position": ["MF"],
-        "birth_year": 1977,
-    },
-    "Camberra": {"id": "881a2266", "birth_year": 1971},
-    "Nuno-Campos": {"id": "29327322", "birth_year": 1975},
-    "C\u00e2ndido": {"id": "6249ae98", "birth_year": 1971},
-    "Nabor-Andr\u00e9-Sabino-Canilhas": {
-        "id": "eea6b1d8",
-        "nationality": ["pt"],
-        "birth_year": 1980,
-    },
-    "Cao": {
-        "id": "04617872",
-        "nationality": ["pt"],
-        "position": ["MF"],
-        "birth_year": 1968,
-    },
-    "Capucho": {
-        "id": "9b54153d",
-        "nationality": ["pt"],
-        "position": ["MF"],
-        "birth_year": 1972,
-    },
-    "Jos\u00e9-Gabriel-Lopes-Cardoso": {
-        "id": "0cef1d01",
-        "nationality": ["pt"],
-        "position": ["MF"],
-        "birth_year": 1978,
-    },
-    "Bernardo-Cariata": {
-        "id": "4d5f228d",
-        "nationality": ["ao"],
-        "position": ["MF"],
-        "birth_year": 1977,
-    },
-    "Carlitos": {
-        "id": "38ff247b",
-        "nationality": ["pt"],
-        "position": ["MF"],
-        "birth_year": 1977,
-    },
-    "Jos\u00e9-Carlos": {"id": "fffc4ff2", "birth_year": 1968},
-    "Lu\u00eds-Carlos": {
-        "id": "a7e60982",
-        "nationality": ["pt"],
-        "position": ["MF"],
-        "birth_year": 1972,
-    },
-    "Luiz-Carlos": {"id": "107a757a", "birth_year": 1974},
-    "Carlos-Carneiro": {
-        "id": "8daff527",
-        "nationality": ["pt"],
-        "position": ["FW"],
-        "birth_year": 1975,
-    },
-    "Ricardo-Carvalho": {
-        "id": "57e7081e",
-        "nationality": ["pt"],
-        "position": ["DF"],
-        "birth_year": 1978,
-    },
-    "S\u00e9rgio-Carvalho": {
-        "id": "9cabb0f9",
-        "nationality": ["pt"],
-        "position": ["DF"],
-        "birth_year": 1977,
-    },
-    "Preto-Casagrande": {
-        "id": "397ac84a",
-        "nationality": ["br"],
-        "position": ["MF"],
-        "birth_year": 1975,
-    },
-    "Jorge-Casquilha": {
-        "id": "6fff2a09",
-        "nationality": ["pt"],
-        "position": ["MF"],
-        "birth_year": 1969,
-    },
-    "V\u00edtor-Castanheira": {
-        "id": "b0abccbd",
-        "nationality": ["pt"],
-        "position": ["MF"],
-        "birth_year": 1977,
-    },
-    "Lu\u00eds-Cavaco": {
-        "id": "36e6982e",
-        "nationality": ["pt"],
-        "position": ["MF"],
-        "birth_year": 1972,
-    },
-    "Carlos-Cha\u00ednho": {
-        "id": "f322383a",
-        "nationality": ["pt"],
-        "position": ["MF"],
-        "birth_year": 1974,
-    },
-    "Chano": {
-        "id": "750b8660",
-        "nationality": ["es"],
-        "position": ["MF"],
-        "birth_year": 1965,
-    },
-    "Chinguila": {
-        "id": "2b1004d9",
-        "nationality": ["ao"],
-        "position": ["DF"],
-        "birth_year": 1978,
-    },
-    "Lu\u00eds-Cl\u00e1udio": {"id": "e7c517cb", "birth_year": 1975},
-    "Fernando-Jos\u00e9-Porto-Collazo": {
-        "id": "7ed6dc24",
-        "nationality": ["es"],
-        "position": ["DF"],
-        "birth_year": 1974,
-    },
-    "Coluna": {"id": "e81b038a", "birth_year": 1979},
-    "Ernesto-da-Concei\u00e7\u00e3o-Soares": {
-        "id": "39a0e7fd",
-        "nationality": ["cv"],
-        "position": ["GK"],
-        "birth_year": 1979,
-    },
-    "Chiquinho-Conde": {
-        "id": "c2ed2a68",
-        "nationality": ["mz"],
-        "position": ["FW"],
-        "birth_year": 1965,
-    },
-    "Andr\u00e9-Correia": {
-        "id": "f500dfcc",
-        "nationality": ["pt"],
-        "position": ["DF"],
-        "birth_year": 1979,
-    },
-    "Pedro-das-Neves-Correia": {
-        "id": "957a177c",
-        "nationality": ["pt"],
-        "position": ["GK"],
-        "birth_year": 1974,
-    },
-    "C\u00e2ndido-Costa": {
-        "id": "7a8cccf7",
-        "nationality": ["pt"],
-        "position": ["DF"],
-        "birth_year": 1981,
-    },
-    "Carlos-Costa": {"id": "f6bbc4b4", "position": ["MF"], "birth_year": 1966},
-    "Hugo-Costa": {
-        "id": "fb70b6b5",
-        "nationality": ["pt"],
-        "position": ["DF"],
-        "birth_year": 1973,
-    },
-    "Jorge-Costa": {
-        "id": "0635b219",
-        "nationality": ["pt"],
-        "position": ["DF"],
-        "birth_year": 1971,
-    },
-    "Quim-Costa": {"id": "4cb32ec1", "birth_year": 1969},
-    "Paulo-Costinha": {
-        "id": "6c5073b1",
-        "nationality": ["pt"],
-        "position": ["GK"],
-        "birth_year": 1973,
-    },
-    "Jorge-Couto": {
-        "id": "132805b4",
-        "nationality": ["pt"],
-        "position": ["FW", "MF"],
-        "birth_year": 1970,
-    },
-    "Marco-Couto": {
-        "id": "9baf3dac",
-        "nationality": ["pt"],
-        "position": ["DF"],
-        "birth_year": 1974,
-    },
-    "Cristov\u00e3o": {"id": "361ee397", "birth_year": 1975},
-    "Andr\u00e9-Cruz": {
-        "id": "32507916",
-        "nationality": ["br"],
-        "position": ["DF"],
-        "birth_year": 1968,
-    },
-    "Toninho-Cruz": {"id": "7307e696", "birth_year": 1969},
-    "Hugo-Cunha": {
-        "id": "0c2cddbd",
-        "nationality": ["pt"],
-        "position": ["MF"],
-        "birth_year": 1977,
-    },
-    "Michael-Curcija": {
-        "id": "1baaa496",
-        "nationality": ["au"],
-        "position": ["FW"],
-        "birth_year": 1977,
-    },
-    "Gilmar-Dal-Pozzo": {
-        "id": "9e5b8835",
-        "nationality": ["br"],
-        "position": ["GK"],
-        "birth_year": 1969,
-    },
-    "Ivo-Damas": {
-        "id": "ebd3f953",
-        "nationality": ["pt"],
-        "position": ["MF"],
-        "birth_year": 1977,
-    },
-    "Dani": {
-        "id": "8215fbee",
-        "nationality": ["pt"],
-        "position": ["FW", "MF"],
-        "birth_year": 1976,
-    },
-    "Deco": {
-        "id": "a8a2f283",
-        "nationality": ["pt"],
-        "position": ["MF"],
-        "birth_year": 1977,
-    },
-    "Del": {"id": "48afa5f1", "birth_year": 1979},
-    "Delfim": {
-        "id": "84a8ee14",
-        "nationality": ["pt"],
-        "position": ["MF"],
-        "birth_year": 1977,
-    },
-    "Chiquinho-Delgado": {
-        "id": "a79abc10",
-        "nationality": ["pt"],
-        "position": ["FW"],
-        "birth_year": 1980,
-    },
-    "Derlei": {
-        "id": "38cad95e",
-        "nationality": ["br"],
-        "position": ["FW"],
-        "birth_year": 1975,
-    },
-    "Detinho": {
-        "id": "5ae8da27",
-        "nationality": ["br"],
-        "position": ["FW"],
-        "birth_year": 1973,
-    },
-    "Auri-Dias-Faustino": {
-        "id": "04fd1910",
-        "nationality": ["br"],
-        "position": ["DF"],
-        "birth_year": 1973,
-    },
-    "N\u00e9lson-Dias-Morais": {
-        "id": "99cc97d4",
-        "nationality": ["pt"],
-        "position": ["DF"],
-        "birth_year": 1974,
-    },
-    "Paulo-Dias": {"id": "52124ef4", "birth_year": 1978},
-    "Dani-D\u00edaz": {"id": "965061ea", "birth_year": 1973},
-    "Dimas": {
-        "id": "b73db3e0",
-        "nationality": ["pt"],
-        "position": ["DF"],
-        "birth_year": 1969,
-    },
-    "Dinda": {"id": "7159b7da", "position": ["MF"], "birth_year": 1972},
-    "Rui-Dolores": {
-        "id": "fb5a2f62",
-        "nationality": ["pt"],
-        "position": ["MF"],
-        "birth_year": 1978,
-    },
-    "Roudolphe-Douala": {
-        "id": "abe5cc24",
-        "nationality": ["cm"],
-        "position": ["FW", "MF"],
-        "birth_year": 1978,
-    },
-    "Ljubinko-Drulovi\u0107": {
-        "id": "31f3a35d",
-        "nationality": ["rs"],
-        "position": ["FW", "MF"],
-        "birth_year": 1968,
-    },
-    "Emmanuel-Duah": {
-        "id": "f8fd4392",
-        "nationality": ["gh"],
-        "position": ["FW", "MF"],
-        "birth_year": 1975,
-    },
-    "Jorge-Duarte": {
-        "id": "5aca9ea5",
-        "nationality": ["pt"],
-        "position": ["MF"],
-        "birth_year": 1974,
-    },
-    "Paulo-Jorge-Rebelo-Duarte": {
-        "id": "594ac0ee",
-        "nationality": ["pt"],
-        "position": ["DF", "MF"],
-        "birth_year": 1969,
-    },
-    "Duda": {
-        "id": "6cbbe905",
-        "nationality": ["br"],
-        "position": ["FW"],
-        "birth_year": 1974,
-    },
-    "Ivan-Dudi\u0107": {
-        "id": "54013a05",
-        "nationality": ["rs"],
-        "position": ["DF"],
-        "birth_year": 1977,
-    },
-    "Duka": {"id": "239b7650", "birth_year": 1972},
-    "Ednilson": {
-        "id": "e10345f3",
-        "nationality": ["gw"],
-        "position": ["MF"],
-        "birth_year": 1982,
-    },
-    "Eliel": {"id": "8d77831c", "birth_year": 1969},
-    "Armindo-Jos\u00e9-Canosa-El\u00edsio": {"id": "fee9a3e7", "birth_year": 1967},
-    "Pedro-Emanuel": {
-        "id": "f835b975",
-        "nationality": ["pt"],
-        "position": ["DF"],
-        "birth_year": 1975,
-    },
-    "Robert-Enke": {
-        "id": "02692203",
-        "nationality": ["de"],
-        "position": ["GK"],
-        "birth_year": 1977,
-    },
-    "Erivan": {
-        "id": "3f218ea5",
-        "nationality": ["br"],
-        "position": ["DF"],
-        "birth_year": 1975,
-    },
-    "Alejandro-Escalona": {
-        "id": "5ce388d6",
-        "nationality": ["cl"],
-        "position": ["DF"],
-        "birth_year": 1979,
-    },
-    "Pedro-Espinha": {
-        "id": "a7cbe4bd",
-        "nationality": ["pt"],
-        "position": ["GK"],
-        "birth_year": 1965,
-    },
-    "Esquerdinha": {
-        "id": "d2ec3356",
-        "nationality": ["br"],
-        "position": ["DF", "MF"],
-        "birth_year": 1972,
-    },
-    "Ricardo-Esteves": {
-        "id": "7db2e9db",
-        "nationality": ["pt"],
-        "position": ["DF", "MF"],
-        "birth_year": 1979,
-    },
-    "Eus\u00e9bio": {
-        "id": "a98f360e",
-        "nationality": ["pt"],
-        "position": ["DF"],
-        "birth_year": 1973,
-    },
-    "Evando": {
-        "id": "c2726d4a",
-        "nationality": ["br"],
-        "position": ["FW"],
-        "birth_year": 1977,
-    },
-    "Everaldo": {"id": "87458af8", "birth_year": 1974},
-    "F\u00e1bio": {"id": "f35b38a6", "birth_year": 1977},
-    "Rodrigo-Fabri": {
-        "id": "c1a0a9e2",
-        "nationality": ["br"],
-        "position": ["MF"],
-        "birth_year": 1976,
-    },
-    "Carlos-Fangueiro": {
-        "id": "ec964a2b",
-        "nationality": ["pt"],
-        "position": ["MF"],
-        "birth_year": 1976,
-    },
-    "Fary-Faye": {
-        "id": "c77ac299",
-        "nationality": ["sn"],
-        "position": ["FW"],
-        "birth_year": 1974,
-    },
-    "Mikl\u00f3s-Feh\u00e9r": {
-        "id": "5e0162e1",
-        "nationality": ["hu"],
-        "position": ["FW"],
-        "birth_year": 1979,
-    },
-    "F\u00e1bio-Fel\u00edcio": {
-        "id": "a8d8dc0d",
-        "nationality": ["pt"],
-        "position": ["FW", "MF"],
-        "birth_year": 1982,
-    },
-    "Bruno-Fernandes": {
-        "id": "9227838e",
-        "nationality": ["pt"],
-        "position": ["MF"],
-        "birth_year": 1974,
-    },
-    "Carlos-Fernandes": {
-        "id": "d60a6ee8",
-        "nationality": ["pt"],
-        "position": ["DF"],
-        "birth_year": 1978,
-    },
-    "Nilton-Fernandes": {
-        "id": "996fbde1",
-        "nationality": ["cv"],
-        "position": ["MF"],
-        "birth_year": 1979,
-    },
-    "Ricardo-Fernandes": {
-        "id": "7ccddff6",
-        "nationality": ["pt"],
-        "position": ["DF"],
-        "birth_year": 1978,
-    },
-    "Joaquim-Ferraz": {
-        "id": "87c7dd50",
-        "nationality": ["pt"],
-        "position": ["FW"],
-        "birth_year": 1974,
-    },
-    "Abel-Ferreira": {
-        "id": "a6b70b37",
-        "nationality": ["pt"],
-        "position": ["DF"],
-        "birth_year": 1978,
-    },
-    "Carlos-Ferreira": {"id": "a99999de", "birth_year": 1971},
-    "Clayton-Ferreira-Cruz": {
-        "id": "d0fe81d1",
-        "nationality": ["br"],
-        "position": ["FW", "MF"],
-        "birth_year": 1975,
-    },
-    "Paulo-Ferreira": {"id": "2fbaf2d3", "position": ["FW"], "birth_year": 1973},
-    "Rui-Ferreira": {
-        "id": "9978ed11",
-        "nationality": ["pt"],
-        "position": ["MF"],
-        "birth_year": 1973,
-    },
-    "Tiago-Ferreira": {
-        "id": "57bff36e",
-        "nationality": ["pt"],
-        "position": ["GK"],
-        "birth_year": 1975,
-    },
-    "Rui-Figueiredo": {
-        "id": "a3bf3018",
-        "nationality": ["pt"],
-        "position": ["MF"],
-        "birth_year": 1983,
-    },
-    "Filgueira": {
-        "id": "b5330251",
-        "nationality": ["br"],
-        "position": ["DF"],
-        "birth_year": 1967,
-    },
-    "Lu\u00eds-Filipe": {
-        "id": "af94a351",
-        "nationality": ["pt"],
-        "position": ["DF", "MF"],
-        "birth_year": 1979,
-    },
-    "Ant\u00f3nio-Folha": {
-        "id": "e963bd53",
-        "nationality": ["pt"],
-        "position": ["FW", "MF"],
-        "birth_year": 1971,
-    },
-    "Chico-Fonseca": {"id": "a051e767", "birth_year": 1968},
-    "Paulo-Fonseca": {
-        "id": "e07610a6",
-        "nationality": ["pt"],
-        "position": ["DF"],
-        "birth_year": 1973,
-    },
-    "Ant\u00f3nio-Formoso": {
-        "id": "d46fb76c",
-        "nationality": ["pt"],
-        "position": ["MF"],
-        "birth_year": 1974,
-    },
-    "Serginho-Fraldinha": {
-        "id": "85b3808e",
-        "nationality": ["br"],
-        "position": ["FW"],
-        "birth_year": 1973,
-    },
-    "Juan-Francisco-Viveros": {
-        "id": "2bcb8105",
-        "nationality": ["cl"],
-        "position": ["FW"],
-        "birth_year": 1980,
-    },
-    "Franklim": {"id": "eef34f81", "birth_year": 1978},
-    "Nuno-Frechaut": {
-        "id": "78d0f1b0",
-        "nationality": ["pt"],
-        "position": ["DF", "MF"],
-        "birth_year": 1977,
-    },
-    "Carlos-Frederico-Lagorio": {"id": "669c1d7d", "birth_year": 1975},
-    "Eric-Freire-Gomes": {
-        "id": "83c69272",
-        "nationality": ["br"],
-        "position": ["FW"],
-        "birth_year": 1972,
-    },
-    "Marco-Freitas": {
-        "id": "8dfad353",
-        "nationality": ["ao"],
-        "position": ["MF"],
-        "birth_year": 1972,
-    },
-    "Tony-Frias": {
-        "id": "f287c3db",
-        "nationality": ["us"],
-        "position": ["FW", "MF"],
-        "birth_year": 1979,
-    },
-    "D\u00e1rio-Furtado": {
-        "id": "a534c641",
-        "nationality": ["cv"],
-        "position": ["DF"],
-        "birth_year": 1979,
-    },
-    "Fusco": {
-        "id": "4ae27533",
-        "nationality": ["pt"],
-        "position": ["MF"],
-        "birth_year": 1972,
-    },
-    "Roger-Galera-Flores": {
-        "id": "c13cc92c",
-        "nationality": ["br"],
-        "position": ["MF"],
-        "birth_year": 1978,
-    },
-    "Jorge-Gamboa": {
-        "id": "6e3a755b",
-        "nationality": ["pt"],
-        "position": ["MF"],
-        "birth_year": 1973,
-    },
-    "S\u00e9rgio-Gameiro": {
-        "id": "3b06ada7",
-        "nationality": ["pt"],
-        "position": ["MF"],
-        "birth_year": 1975,
-    },
-    "Ga\u00facho": {"id": "26790d30", "birth_year": 1971},
-    "\u00c9der-Ga\u00facho": {
-        "id": "5c8a7e8e",
-        "nationality": ["br"],
-        "position": ["DF"],
-        "birth_year": 1977,
-    },
-    "Geraldo": {
-        "id": "87a7d2db",
-        "nationality": ["br"],
-        "position": ["MF"],
-        "birth_year": 1974,
-    },
-    "Jos\u00e9-Gilberto": {"id": "32583ee2", "birth_year": 1967},
-    "Glauber": {
-        "id": "a37a8c86",
-        "nationality": ["br"],
-        "position": ["MF"],
-        "birth_year": 1975,
-    },
-    "Paulo-Jorge-Sousa-Gomes": {
-        "id": "0cc08120",
-        "nationality": ["pt"],
-        "position": ["MF"],
-        "birth_year": 1975,
-    },
-    "Edmilson-Gon\u00e7alves-Pimenta": {
-        "id": "05f7d822",
-        "nationality": ["br"],
-        "position": ["FW", "MF"],
-        "birth_year": 1971,
-    },
-    "Filipe-Gouveia": {
-        "id": "48981420",
-        "nationality": ["pt"],
-        "position": ["MF"],
-        "birth_year": 1973,
-    },
-    "Rui-Guerreiro": {
-        "id": "749b9594",
-        "nationality": ["pt"],
-        "position": ["DF"],
-        "birth_year": 1975,
-    },
-    "Guga": {
-        "id": "f72006e3",
-        "nationality": ["br"],
-        "position": ["MF"],
-        "birth_year": 1977,
-    },
-    "Ronaldo-Guiaro": {
-        "id": "e119f066",
-        "nationality": ["br"],
-        "position": ["DF"],
-        "birth_year": 1974,
-    },
-    "Henrique": {
-        "id": "7eef050b",
-        "nationality": ["pt"],
-        "position": ["FW"],
-        "birth_year": 1980,
-    },
-    "Pedro-Ricardo-Quintela-Henriques": {
-        "id": "435159fa",
-        "nationality": ["pt"],
-        "position": ["DF"],
-        "birth_year": 1974,
-    },
-    "Sebasti\u00e1n-Herrera": {
-        "id": "89223e8c",
-        "nationality": ["es"],
-        "position": ["DF"],
-        "birth_year": 1969,
-    },
-    "Pierre-van-Hooijdonk": {
-        "id": "ba534926",
-        "nationality": ["nl"],
-        "position": ["FW"],
-        "birth_year": 1969,
-    },
-    "Pavel-Horv\u00e1th": {
-        "id": "b01ee343",
-        "nationality": ["cz"],
-        "position": ["MF"],
-        "birth_year": 1975,
-    },
-    "Hugo": {
-        "id": "355ff285",
-        "nationality": ["br"],
-        "position": ["MF"],
-        "birth_year": 1974,
-    },
-    "V\u00edtor-Hugo": {"id": "af1358ae", "birth_year": 1982},
-    "Idal\u00e9cio": {
-        "id": "45ff721f",
-        "nationality": ["pt"],
-        "position": ["DF"],
-        "birth_year": 1973,
-    },
-    "Ra\u00fal-Iglesias": {"id": "a185c4c9", "position": ["GK"], "birth_year": 1974},
-    "Ilian-Iliev": {
-        "id": "2bf61e4c",
-        "nationality": ["bg"],
-        "position": ["MF"],
-        "birth_year": 1968,
-    },
-    "Bra\u00edma-Injai": {
-        "id": "64247711",
-        "nationality": ["gw"],
-        "position": ["MF"],
-        "birth_year": 1975,
-    },
-    "Ricardo-Ismael-Rojas": {
-        "id": "eddd6f1a",
-        "nationality": ["py"],
-        "position": ["DF"],
-        "birth_year": 1971,
-    },
-    "Constantino-Jardim": {
-        "id": "ce09c74d",
-        "nationality": ["pt"],
-        "position": ["FW"],
-        "birth_year": 1967,
-    },
-    "Predrag-Jokanovi\u0107": {
-        "id": "ee80651b",
-        "nationality": ["rs"],
-        "position": ["DF", "MF"],
-        "birth_year": 1968,
-    },
-    "Jord\u00e3o": {
-        "id": "d132b0ae",
-        "nationality": ["pt"],
-        "position": ["MF"],
-        "birth_year": 1971,
-    },
-    "Artur-Jorge-Amorim": {
-        "id": "47342447",
-        "nationality": ["pt"],
-        "position": ["DF"],
-        "birth_year": 1972,
-    },
-    "Carlos-Jorge": {
-        "id": "c6bb1ed4",
-        "nationality": ["pt"],
-        "position": ["DF"],
-        "birth_year": 1966,
-    },
-    "Mario-Jorge": {"id": "a7b7cd38", "birth_year": 1969},
-    "Paulo-Jorge": {"id": "0fd676aa", "birth_year": 1977},
-    "Renato-Jorge": {
-        "id": "a0274a8a",
-        "nationality": ["pt"],
-        "position": ["DF"],
-        "birth_year": 1973,
-    },
-    "Rui-Jorge": {
-        "id": "b29d5ef4",
-        "nationality": ["pt"],
-        "position": ["DF"],
-        "birth_year": 1973,
-    },
-    "Jorginho": {
-        "id": "10f7ad23",
-        "nationality": ["pt"],
-        "position": ["MF"],
-        "birth_year": 1970,
-    },
-    "Josivan": {"id": "db4597af", "birth_year": 1979},
-    "Jos\u00e9-Carlos-Nunes-Barbosa-J\u00fanior": {
-        "id": "fe853f81",
-        "nationality": ["br"],
-        "position": ["FW"],
-        "birth_year": 1977,
-    },
-    "Rubens-J\u00fanior": {
-        "id": "7f3fd317",
-        "nationality": ["br"],
-        "position": ["DF"],
-        "birth_year": 1975,
-    },
-    "S\u00e9rgio-J\u00fanior": {
-        "id": "5fb5c480",
-        "nationality": ["br"],
-        "position": ["FW"],
-        "birth_year": 1979,
-    },
-    "Serhiy-Kandaurov": {
-        "id": "7645f516",
-        "nationality": ["ua"],
-        "position": ["MF"],
-        "birth_year": 1972,
-    },
-    "Daniel-Kenedy": {
-        "id": "97778030",
-        "nationality": ["pt"],
-        "position": ["DF", "MF"],
-        "birth_year": 1974,
-    },
-    "Jovan-Kirovski": {
-        "id": "393c5930",
-        "nationality": ["us"],
-        "position": ["FW"],
-        "birth_year": 1976,
-    },
-    "Petar-Krpan": {
-        "id": "ad0ef8ec",
-        "nationality": ["hr"],
-        "position": ["FW"],
-        "birth_year": 1974,
-    },
-    "Jos\u00e9-Leal": {
-        "id": "1d2ea072",
-        "nationality": ["pt"],
-        "position": ["DF"],
-        "birth_year": 1965,
-    },
-    "Lemos": {
-        "id": "9ea3119a",
-        "nationality": ["br"],
-        "position": ["DF"],
-        "birth_year": 1971,
-    },
-    "Marco-Paulo-Faria-Lemos": {
-        "id": "4d0d6e9a",
-        "nationality": ["pt"],
-        "position": ["MF"],
-        "birth_year": 1973,
-    },
-    "Tiago-Lemos": {
-        "id": "51035ca7",
-        "nationality": ["pt"],
-        "position": ["MF"],
-        "birth_year": 1977,
-    },
-    "Leonardo": {
-        "id": "1090c781",
-        "birth_year": 1983,
-        "nationality": ["br"],
-        "position": ["FW", "MF"],
-    },
-    "Carlos-Lima": {"id": "9fd4b787", "position": ["MF"], "birth_year": 1977},
-    "Cl\u00e9ber-Guedes-de-Lima": {
-        "id": "a06c2bcf",
-        "nationality": ["br"],
-        "position": ["DF"],
-        "birth_year": 1974,
-    },
-    "Rui-Lima": {
-        "id": "a18f2e28",
-        "nationality": ["pt"],
-        "position": ["MF"],
-        "birth_year": 1978,
-    },
-    "Ivan-Litera": {
-        "id": "806058ec",
-        "nationality": ["rs"],
-        "position": ["MF"],
-        "birth_year": 1976,
-    },
-    "Litos": {
-        "id": "968afd3b",
-        "nationality": ["pt"],
-        "position": ["DF"],
-        "birth_year": 1974,
-    },
-    "Lixa": {
-        "id": "f1030602",
-        "nationality": ["cv"],
-        "position": ["FW"],
-        "birth_year": 1977,
-    },
-    "Lob\u00e3o": {
-        "id": "dae50aae",
-        "nationality": ["br"],
-        "position": ["DF"],
-        "birth_year": 1972,
-    },
-    "S\u00e9rgio-Lomba": {"id": "76352bdd", "position": ["DF"], "birth_year": 1973},
-    "Adelino-Lopes": {
-        "id": "63cdf597",
-        "nationality": ["gw"],
-        "position": ["DF"],
-        "birth_year": 1976,
-    },
-    "Fernando-Carlos-de-los-R\u00edos": {"id": "c33b7c7b", "birth_year": 1976},
-    "Marco-Cla\u00fadio-Cardoso-Louren\u00e7o": {
-        "id": "c98db151",
-        "nationality": ["pt"],
-        "position": ["MF"],
-        "birth_year": 1979,
-    },
-    "Edmilson-Dias-de-Lucena": {
-        "id": "63ef77c8",
-        "nationality": ["br"],
-        "position": ["FW"],
-        "birth_year": 1968,
-    },
-    "Jos\u00e9-Luis-Deus": {
-        "id": "a9a9c577",
-        "nationality": ["es"],
-        "position": ["FW"],
-        "birth_year": 1977,
-    },
-    "Diogo-Lu\u00eds": {
-        "id": "a353f253",
-        "nationality": ["pt"],
-        "position": ["DF"],
-        "birth_year": 1980,
-    },
-    "T\u00f3-Lu\u00eds": {
-        "id": "6eb20f59",
-        "nationality": ["pt"],
-        "position": ["GK"],
-        "birth_year": 1967,
-    },
-    "Z\u00e9-Lu\u00eds": {"id": "f87295a2", "birth_year": 1975},
-    "Andr\u00e9-Macanga": {
-        "id": "156c9c5a",
-        "nationality": ["ao"],
-        "position": ["MF"],
-        "birth_year": 1978,
-    },
-    "Ronaldo-Maczinski": {
-        "id": "ec40cc75",
-        "nationality": ["br"],
-        "position": ["FW"],
-        "birth_year": 1980,
-    },
-    "Paulo-Madeira": {
-        "id": "cfa697d7",
-        "nationality": ["pt"],
-        "position": ["DF"],
-        "birth_year": 1970,
-    },
-    "Alan-Mahon": {
-        "id": "fbe1f1d0",
-        "nationality": ["ie"],
-        "position": ["MF"],
-        "birth_year": 1978,
-    },
-    "Augusto-Pinto-Duarte-Maia": {
-        "id": "565a04bf",
-        "position": ["MF"],
-        "birth_year": 1971,
-    },
-    "Z\u00e9-Manel": {
-        "id": "8e9cb1c3",
-        "nationality": ["pt"],
-        "position": ["MF"],
-        "birth_year": 1975,
-    },
-    "Maniche": {
-        "id": "0355c8b5",
-        "nationality": ["pt"],
-        "position": ["MF"],
-        "birth_year": 1977,
-    },
-    "Mantorras": {
-        "id": "b3ec704f",
-        "nationality": ["ao"],
-        "position": ["FW"],
-        "birth_year": 1982,
-    },
-    "Jo\u00e3o-Manuel": {
-        "id": "6a2b9fb7",
-        "nationality": ["pt"],
-        "position": ["MF"],
-        "birth_year": 1967,
-    },
-    "Rui-Manuel": {"id": "224e9db7", "birth_year": 1976},
-    "Fernando-Manuel-Sousa": {
-        "id": "350c8043",
-        "nationality": ["ao"],
-        "position": ["MF"],
-        "birth_year": 1967,
-    },
-    "Vitor-Manuel": {
-        "id": "8beb449b",
-        "nationality": ["pt"],
-        "position": ["MF"],
-        "birth_year": 1970,
-    },
-    "Clayton-Maranhense": {"id": "b3b27c8c", "birth_year": 1973},
-    "Alessandro-Mar\u00e7al-Neves": {
-        "id": "ad1a82fa",
-        "position": ["DF"],
-        "birth_year": 1974,
-    },
-    "Marc\u00e3o": {
-        "id": "ea09e5cc",
-        "nationality": ["br"],
-        "position": ["FW", "GK"],
-        "birth_year": 1969,
-    },
-    "Carlos-Marchena": {
-        "id": "48ddb821",
-        "nationality": ["es"],
-        "position": ["DF", "MF"],
-        "birth_year": 1979,
-    },
-    "Mariano": {"id": "6a7251b7", "position": ["DF"], "birth_year": 1975},
-    "Silvio-Mari\u0107": {
-        "id": "617223d8",
-        "nationality": ["hr"],
-        "position": ["MF"],
-        "birth_year": 1975,
-    },
-    "Carlos-Manuel-Almeida-Marques": {
-        "id": "05e8530a",
-        "nationality": ["pt"],
-        "position": ["FW"],
-        "birth_year": 1979,
-    },
-    "Pedro-Alexandre-Santos-Marques": {
-        "id": "61931a3f",
-        "nationality": ["pt"],
-        "birth_year": 1975,
-    },
-    "S\u00e9rgio-Marqu\u00eas": {"id": "732333ac", "birth_year": 1976},
-    "Martelinho": {
-        "id": "a1f69c2d",
-        "nationality": ["pt"],
-        "position": ["MF"],
-        "birth_year": 1974,
-    },
-    "Carlos-Martins": {"id": "b9db58fd", "birth_year": 1973},
-    "Pedro-Martins": {
-        "id": "aaa2d5f0",
-        "nationality": ["pt"],
-        "position": ["MF"],
-        "birth_year": 1970,
-    },
-    "Jo\u00e3o-Lu\u00eds-Ribeiro-Matias": {"id": "413df047", "birth_year": 1969},
-    "Rog\u00e9rio-Matias": {
-        "id": "06362c14",
-        "nationality": ["pt"],
-        "position": ["DF"],
-        "birth_year": 1974,
-    },
-    "Diogo-Matos": {
-        "id": "72fd01d4",
-        "nationality": ["pt"],
-        "position": ["MF"],
-        "birth_year": 1975,
-    },
-    "Maur\u00edlio": {"id": "7c0687e4", "nationality": ["br"], "birth_year": 1969},
-    "Fernando-Meira": {
-        "id": "415bd344",
-        "nationality": ["pt"],
-        "position": ["DF", "MF"],
-        "birth_year": 1978,
-    },
-    "Jos\u00e9-Rog\u00e9rio-de-Melo": {
-        "id": "316f6e58",
-        "nationality": ["br"],
-        "position": ["FW", "MF"],
-        "birth_year": 1974,
-    },
-    "Bruno-Mendes": {
-        "id": "6269f72e",
-        "nationality": ["pt"],
-        "position": ["DF"],
-        "birth_year": 1976,
-    },
-    "Pedro-Mendes": {
-        "id": "801c23c5",
-        "nationality": ["pt"],
-        "position": ["MF"],
-        "birth_year": 1979,
-    },
-    "Roberto-Mendes-Silva": {
-        "id": "e12ab2d0",
-        "nationality": ["br"],
-        "position": ["MF"],
-        "birth_year": 1978,
-    },
-    "Tiago-Mendes": {
-        "id": "5e0f7b89",
-        "nationality": ["pt"],
-        "position": ["MF"],
-        "birth_year": 1981,
-    },
-    "Nuno-Miguel-Gomes": {
-        "id": "aefe9b33",
-        "nationality": ["pt"],
-        "position": ["DF"],
-        "birth_year": 1978,
-    },
-    "Lu\u00eds-Miguel": {
-        "id": "ef289663",
-        "nationality": ["ao"],
-        "position": ["MF"],
-        "birth_year": 1971,
-    },
-    "Zoran-Mijanovi\u0107": {
-        "id": "60872fed",
-        "nationality": ["rs"],
-        "position": ["GK"],
-        "birth_year": 1974,
-    },
-    "Nikola-Milinkovi\u0107": {
-        "id": "5585fe6d",
-        "nationality": ["ba"],
-        "position": ["FW", "MF"],
-        "birth_year": 1968,
-    },
-    "Dem\u00e9trius-Montanini": {
-        "id": "07d468a8",
-        "nationality": ["br"],
-        "position": ["FW"],
-        "birth_year": 1971,
-    },
-    "Miguel-Monteiro": {
-        "id": "930ef69d",
-        "nationality": ["pt"],
-        "position": ["DF"],
-        "birth_year": 1980,
-    },
-    "Carlos-Pedro-Silva-Morais": {
-        "id": "987f809b",
-        "nationality": ["cv"],
-        "position": ["FW", "MF"],
-        "birth_year": 1976,
-    },
-    "Hugo-Morais": {
-        "id": "a736cde3",
-        "nationality": ["pt"],
-        "position": ["MF"],
-        "birth_year": 1978,
-    },
-    "Oct\u00e1vio-Moreira": {"id": "d4a85e96", "birth_year": 1972},
-    "Pedro-Moutinho": {
-        "id": "b8496c3d",
-        "nationality": ["pt"],
-        "position": ["FW"],
-        "birth_year": 1979,
-    },
-    "Mozer": {
-        "id": "8441c1e4",
-        "nationality": ["pt"],
-        "position": ["MF"],
-        "birth_year": 1972,
-    },
-    "Mbo-Mpenza": {
-        "id": "7c17f978",
-        "nationality": ["be"],
-        "position": ["FW"],
-        "birth_year": 1976,
-    },
-    "Massaudu-Naddah": {"id": "f51d0002", "birth_year": 1976},
-    "Hassan-Nader": {
-        "id": "08e95195",
-        "nationality": ["ma"],
-        "position": ["FW"],
-        "birth_year": 1965,
-    },
-    "Nandinho": {
-        "id": "d1ed4ce7",
-        "nationality": ["pt"],
-        "position": ["MF"],
-        "birth_year": 1973,
-    },
-    "Z\u00e9-Nando": {
-        "id": "1fe681f4",
-        "nationality": ["pt"],
-        "position": ["DF"],
-        "birth_year": 1975,
-    },
-    "Neca": {
-        "id": "4087df66",
-        "nationality": ["pt"],
-        "position": ["MF"],
-        "birth_year": 1979,
-    },
-    "Andr\u00e9-Neles": {
-        "id": "828c129b",
-        "nationality": ["gq"],
-        "position": ["FW"],
-        "birth_year": 1978,
-    },
-    "N\u00e9lson": {
-        "id": "579f0a89",
-        "nationality": ["ao"],
-        "position": ["GK"],
-        "birth_year": 1976,
-    },
-    "Fernando-N\u00e9lson": {
-        "id": "2761461a",
-        "nationality": ["pt"],
-        "position": ["DF"],
-        "birth_year": 1971,
-    },
-    "Nen\u00e9": {
-        "id": "b33be4c1",
-        "nationality": ["pt"],
-        "position": ["DF"],
-        "birth_year": 1976,
-    },
-    "Joaquim-Neves": {
-        "id": "d7bd04bf",
-        "nationality": ["pt"],
-        "position": ["DF"],
-        "birth_year": 1970,
-    },
-    "Jorge-Neves": {"id": "66241d2b", "position": ["DF"], "birth_year": 1969},
-    "Pedro-Neves": {
-        "id": "fa304886",
-        "nationality": ["pt"],
-        "position": ["DF"],
-        "birth_year": 1981,
-    },
-    "Rui-Neves": {"id": "1ef12bf9", "position": ["DF"], "birth_year": 1969},
-    "Nini": {"id": "96ad0191", "birth_year": 1978},
-    "Ab\u00edlio-Novais": {
-        "id": "adfae454",
-        "nationality": ["pt"],
-        "position": ["MF"],
-        "birth_year": 1967,
-    },
-    "H\u00e9lder-Ant\u00f3nio-Freitas-Nover\u00e7a": {
-        "id": "c00ec55f",
-        "birth_year": 1970,
-    },
-    "Paulo-Jorge-Carreira-Nunes": {
-        "id": "9a96e324",
-        "nationality": ["pt"],
-        "position": ["GK"],
-        "birth_year": 1970,
-    },
-    "S\u00e9rgio-Nunes": {
-        "id": "6f5d2d31",
-        "nationality": ["pt"],
-        "position": ["DF"],
-        "birth_year": 1974,
-    },
-    "Z\u00e9-Nuno-Azevedo": {
-        "id": "1b0b3652",
-        "nationality": ["pt"],
-        "position": ["DF"],
-        "birth_year": 1969,
-    },
-    "Marco-Nuno": {
-        "id": "7414034a",
-        "nationality": ["pt"],
-        "position": ["FW"],
-        "birth_year": 1974,
-    },
-    "V\u00edtor-Nuno": {"id": "08b7610c", "birth_year": 1975},
-    "Th\u00e9odore-Nzue-Nguema": {
-        "id": "316769bd",
-        "nationality": ["ga"],
-        "position": ["FW", "MF"],
-        "birth_year": 1973,
-    },
-    "Odair": {"id": "28934d6a", "position": ["DF"], "birth_year": 1973},
-    "Lu\u00eds-Olim": {
-        "id": "78cc4d6e",
-        "nationality": ["pt"],
-        "position": ["DF"],
-        "birth_year": 1981,
-    },
-    "L\u00e1zaro-Oliveira": {
-        "id": "db581819",
-        "nationality": ["ao"],
-        "position": ["MF"],
-        "birth_year": 1967,
-    },
-    "Ra\u00fal-Oliveira": {
-        "id": "5f63bd7a",
-        "nationality": ["pt"],
-        "position": ["DF"],
-        "birth_year": 1972,
-    },
-    "\u00d3scar": {"id": "ee92a477", "nationality": ["pt"], "birth_year": 1976},
-    "Rui-\u00d3scar": {
-        "id": "32e21e83",
-        "nationality": ["pt"],
-        "position": ["DF"],
-        "birth_year": 1975,
-    },
-    "Ahmed-Ouattara": {
-        "id": "06fefdf9",
-        "nationality": ["ci"],
-        "position": ["FW"],
-        "birth_year": 1969,
-    },
-    "Sergei-Ovchinnikov": {
-        "id": "79f348a7",
-        "nationality": ["ru"],
-        "position": ["GK"],
-        "birth_year": 1970,
-    },
-    "Domingos-Paci\u00eancia": {
-        "id": "29779197",
-        "nationality": ["pt"],
-        "position": ["FW"],
-        "birth_year": 1969,
-    },
-    "Palacios": {
-        "id": "3af36ab0",
-        "nationality": ["es"],
-        "position": ["DF"],
-        "birth_year": 1970,
-    },
-    "J\u00e9r\u00f4me-Palatsi": {
-        "id": "ee84f572",
-        "nationality": ["fr"],
-        "position": ["GK"],
-        "birth_year": 1969,
-    },
-    "Carlos-Paredes": {
-        "id": "30af1e95",
-        "nationality": ["py"],
-        "position": ["MF"],
-        "birth_year": 1976,
-    },
-    "Marcelo-Passos": {
-        "id": "e47e4d7b",
-        "nationality": ["br"],
-        "position": ["MF"],
-        "birth_year": 1971,
-    },
-    "Bruno-Patacas": {
-        "id": "033eb3a3",
-        "nationality": ["pt"],
-        "position": ["DF"],
-        "birth_year": 1977,
-    },
-    "Patrick": {"id": "4ae5a7b4", "birth_year": 1978},
-    "Paul\u00e3o": {
-        "id": "c20a5279",
-        "nationality": ["br"],
-        "position": ["DF"],
-        "birth_year": 1973,
-    },
-    "Paulinho": {"id": "f06411c7", "position": ["DF"], "birth_year": 1966},
-    "Jean-Paulista": {
-        "id": "de10b9ea",
-        "nationality": ["br"],
-        "position": ["FW", "MF"],
-        "birth_year": 1977,
-    },
-    "Paulito": {"id": "e06858d5", "birth_year": 1967},
-    "Jo\u00e3o-Paulo-Brito": {
-        "id": "2f35dc32",
-        "nationality": ["pt"],
-        "position": ["MF"],
-        "birth_year": 1974,
-    },
-    "Jo\u00e3o-Paulo": {"id": "ce69a0db", "nationality": ["pt"], "birth_year": 1972},
-    "Nicolas-Paviot": {
-        "id": "b65fd024",
-        "nationality": ["fr"],
-        "position": ["DF"],
-        "birth_year": 1975,
-    },
-    "Miran-Pavlin": {
-        "id": "3bf3eb84",
-        "nationality": ["si"],
-        "position": ["MF"],
-        "birth_year": 1971,
-    },
-    "Jo\u00e3o-Pedro-Fernandes": {
-        "id": "e6acce80",
-        "nationality": ["pt"],
-        "position": ["FW"],
-        "birth_year": 1975,
-    },
-    "Pedrosa": {
-        "id": "4c5a33d8",
-        "nationality": ["pt"],
-        "position": ["MF"],
-        "birth_year": 1972,
-    },
-    "Em\u00edlio-Peixe": {
-        "id": "f49c4e0b",
-        "nationality": ["pt"],
-        "position": ["MF"],
-        "birth_year": 1973,
-    },
-    "Pena": {
-        "id": "58ad4fb3",
-        "nationality": ["br"],
-        "position": ["FW"],
-        "birth_year": 1974,
-    },
-    "Michel-Pens\u00e9e": {
-        "id": "aa25e49c",
-        "nationality": ["cm"],
-        "position": ["DF"],
-        "birth_year": 1973,
-    },
-    "N\u00e9lson-Pereira": {
-        "id": "d544c827",
-        "nationality": ["pt"],
-        "position": ["GK"],
-        "birth_year": 1975,
-    },
-    "Diocliciano-Pereira-Tavares": {"id": "7a8f2bca", "birth_year": 1976},
-    "Tiago-Pereira": {
-        "id": "7b3faedd",
-        "nationality": ["pt"],
-        "position": ["MF"],
-        "birth_year": 1975,
-    },
-    "Carlos-P\u00e9rez-\u00c1lvarez": {
-        "id": "8dea06f3",
-        "nationality": ["es"],
-        "position": ["MF"],
-        "birth_year": 1971,
-    },
-    "Juliano-Pescarolo-Martins": {
-        "id": "e2677274",
-        "nationality": ["br"],
-        "position": ["FW"],
-        "birth_year": 1974,
-    },
-    "Petit": {
-        "id": "27f6dd2e",
-        "nationality": ["pt"],
-        "position": ["MF"],
-        "birth_year": 1976,
-    },
-    "Jean-Pierre": {"id": "368b343e", "birth_year": 1972},
-    "Pinho": {"id": "ef93054f", "birth_year": 1971},
-    "Jo\u00e3o-Pinto": {
-        "id": "5703b66b",
-        "nationality": ["pt"],
-        "position": ["FW", "MF"],
-        "birth_year": 1971,
-    },
-    "Jo\u00e3o-Oliveira-Pinto": {
-        "id": "9235f65d",
-        "nationality": ["pt"],
-        "position": ["MF"],
-        "birth_year": 1971,
-    },
-    "Alo\u00edsio-Pires-Alves": {
-        "id": "c2f060aa",
-        "nationality": ["br"],
-        "position": ["DF"],
-        "birth_year": 1963,
-    },
-    "Poejo": {"id": "0e68b20a", "position": ["MF"], "birth_year": 1973},
-    "Dragoslav-Poleksi\u0107": {
-        "id": "571eb467",
-        "nationality": ["me"],
-        "position": ["GK"],
-        "birth_year": 1970,
-    },
-    "Hugo-Porf\u00edrio": {
-        "id": "ca7b2c95",
-        "nationality": ["pt"],
-        "position": ["FW", "MF"],
-        "birth_year": 1973,
-    },
-    "C\u00e9sar-Prates": {
-        "id": "ceb38166",
-        "nationality": ["br"],
-        "position": ["DF", "MF"],
-        "birth_year": 1975,
-    },
-    "H\u00e9lder-Quental": {"id": "214a7ba0", "birth_year": 1970},
-    "William-Quevedo": {
-        "id": "6a691343",
-        "nationality": ["fr"],
-        "position": ["DF"],
-        "birth_year": 1971,
-    },
-    "Quim": {
-        "id": "3e754736",
-        "nationality": ["pt"],
-        "position": ["GK"],
-        "birth_year": 1975,
-    },
-    "Rafael": {
-        "id": "bd2cf737",
-        "nationality": ["br"],
-        "position": ["MF"],
-        "birth_year": 1974,
-    },
-    "Ramires": {"id": "bdfdd85c", "position": ["MF"], "birth_year": 1976},
-    "Joaquim-Rebelo": {"id": "bc405827", "position": ["DF"], "birth_year": 1961},
-    "Jos\u00e9-Rego": {"id": "8f59e336", "birth_year": 1978},
-    "Renato": {"id": "fb524434", "birth_year": 1969},
-    "Adalberto-Manuel-Silva-Ribeiro": {
-        "id": "719a6f1c",
-        "nationality": ["pt"],
-        "position": ["DF"],
-        "birth_year": 1969,
-    },
-    "Bruno-Ribeiro": {
-        "id": "638e7441",
-        "nationality": ["pt"],
-        "position": ["MF"],
-        "birth_year": 1975,
-    },
-    "Jorge-Ribeiro": {"id": "bbd32006", "birth_year": 1975},
-    "Pedro-J\u00falio-Marques-Ribeiro": {
-        "id": "5659aecb",
-        "nationality": ["pt"],
-        "position": ["DF"],
-        "birth_year": 1979,
-    },
-    "Jo\u00e3o-Ricardo": {
-        "id": "6d375568",
-        "nationality": ["ao"],
-        "position": ["GK"],
-        "birth_year": 1970,
-    },
-    "Sreto-Risti\u0107": {
-        "id": "26098227",
-        "nationality": ["rs"],
-        "position": ["FW", "MF"],
-        "birth_year": 1976,
-    },
-    "Riva": {
-        "id": "00165563",
-        "nationality": ["br"],
-        "position": ["FW"],
-        "birth_year": 1970,
-    },
-    "Marco-Paulo-Paiva-Rocha": {
-        "id": "ce86b50e",
-        "nationality": ["pt"],
-        "position": ["MF"],
-        "birth_year": 1973,
-    },
-    "Ricardo-Rocha": {
-        "id": "9a3b9b2e",
-        "nationality": ["pt"],
-        "position": ["DF"],
-        "birth_year": 1978,
-    },
-    "Rodolfo-Miguens": {
-        "id": "2991a21c",
-        "nationality": ["pt"],
-        "position": ["MF"],
-        "birth_year": 1976,
-    },
-    "Rodri": {"id": "12e28e91", "birth_year": 1976},
-    "Rodrig\u00e3o": {
-        "id": "6952b563",
-        "nationality": ["br"],
-        "position": ["DF"],
-        "birth_year": 1995,
-    },
-    "Cristiano-Roland": {
-        "id": "da76f197",
-        "nationality": ["br"],
-        "position": ["DF"],
-        "birth_year": 1976,
-    },
-    "Paulo-C\u00e9sar-Rocha-Rosa": {
-        "id": "10d0df85",
-        "nationality": ["br"],
-        "position": ["FW"],
-        "birth_year": 1980,
-    },
-    "Rubio": {
-        "id": "72f800bf",
-        "nationality": ["es"],
-        "position": ["DF"],
-        "birth_year": 1976,
-    },
-    "Rui": {"id": "8aaab65e", "birth_year": 1977},
-    "Ricardo-S\u00e1-Pinto": {
-        "id": "4cfa2ad8",
-        "nationality": ["pt"],
-        "position": ["FW"],
-        "birth_year": 1972,
-    },
-    "Sadj\u00f3": {"id": "a489b136", "birth_year": 1975},
-    "Joseph-Samson": {"id": "09d81c26", "birth_year": 1982},
-    "Erwin-S\u00e1nchez": {
-        "id": "701f3633",
-        "nationality": ["bo"],
-        "position": ["MF"],
-        "birth_year": 1969,
-    },
-    "Alex-Sandro": {"id": "d098d6fd", "birth_year": 1977},
-    "Jo\u00e3o-Santos-Flores": {
-        "id": "7d72f4d5",
-        "nationality": ["pt"],
-        "position": ["MF"],
-        "birth_year": 1979,
-    },
-    "Hugo-Santos": {"id": "c8b7ad40", "position": ["MF"], "birth_year": 1972},
-    "Joel-Santos": {
-        "id": "23d69083",
-        "nationality": ["pt"],
-        "position": ["MF"],
-        "birth_year": 1975,
-    },
-    "Paulinho-Santos": {
-        "id": "06e8676c",
-        "nationality": ["pt"],
-        "position": ["MF"],
-        "birth_year": 1970,
-    },
-    "Paulo-Santos": {
-        "id": "e324f752",
-        "nationality": ["pt"],
-        "position": ["GK"],
-        "birth_year": 1972,
-    },
-    "Pedro-Jorge-Santos-Santos": {
-        "id": "bc7ee80d",
-        "nationality": ["pt"],
-        "position": ["MF"],
-        "birth_year": 1976,
-    },
-    "Abdel-Sattar-Sabry": {
-        "id": "83843607",
-        "nationality": ["eg"],
-        "position": ["MF"],
-        "birth_year": 1974,
-    },
-    "Peter-Schmeichel": {
-        "id": "f1fe7ffe",
-        "nationality": ["dk"],
-        "position": ["GK"],
-        "birth_year": 1963,
-    },
-    "Jes\u00fas-Seba": {
-        "id": "7f74a9ec",
-        "nationality": ["es"],
-        "position": ["FW", "MF"],
-        "birth_year": 1974,
-    },
-    "Carlos-Secret\u00e1rio": {
-        "id": "9da12cce",
-        "nationality": ["pt"],
-        "position": ["DF"],
-        "birth_year": 1970,
-    },
-    "Ant\u00f3nio-Semedo": {
-        "id": "8eaf65cd",
-        "nationality": ["pt"],
-        "position": ["FW", "MF"],
-        "birth_year": 1979,
-    },
-    "Carlos-Semedo": {
-        "id": "aed78abd",
-        "nationality": ["pt"],
-        "position": ["DF"],
-        "birth_year": 1980,
-    },
-    "Manuel-Senrada-Ramos": {"id": "f3419635", "birth_year": 1978},
-    "M\u00e1rio-S\u00e9rgio": {
-        "id": "5fe7e106",
-        "nationality": ["pt"],
-        "position": ["DF", "GK"],
-        "birth_year": 1981,
-    },
-    "Musa-Shannon": {
-        "id": "bfa95704",
-        "nationality": ["lr"],
-        "position": ["FW"],
-        "birth_year": 1975,
-    },
-    "Djalma-Henrique-da-Silva": {
-        "id": "4638d077",
-        "nationality": ["br"],
-        "position": ["MF"],
-        "birth_year": 1975,
-    },
-    "Elp\u00eddio-Silva": {
-        "id": "19c1d2a4",
-        "nationality": ["br"],
-        "position": ["FW"],
-        "birth_year": 1975,
-    },
-    "Fernando-Dinarte-Santos-Silva": {
-        "id": "b7073fe8",
-        "nationality": ["pt"],
-        "position": ["DF", "MF"],
-        "birth_year": 1980,
-    },
-    "Manoel-da-Silva-Filho": {
-        "id": "9556f523",
-        "nationality": ["br"],
-        "position": ["FW"],
-        "birth_year": 1978,
-    },
-    "Jorge-Pinto-da-Silva": {
-        "id": "b5bd7e48",
-        "nationality": ["pt"],
-        "position": ["MF"],
-        "birth_year": 1975,
-    },
-    "Jorge-Soares-da-Silva": {
-        "id": "bdedf31e",
-        "nationality": ["pt"],
-        "position": ["GK"],
-        "birth_year": 1972,
-    },
-    "Paulo-S\u00e9rgio-da-Silva": {
-        "id": "a12146c7",
-        "position": ["DF"],
-        "birth_year": 1972,
-    },
-    "Ricardo-Em\u00eddio-Ramalho-Silva": {
-        "id": "2ffcf188",
-        "nationality": ["pt"],
-        "position": ["DF"],
-        "birth_year": 1975,
-    },
-    "Nuno-Carlos-da-Silva-Rolo": {"id": "4cfa967d", "birth_year": 1976},
-    "V\u00edtor-Silva": {
-        "id": "88ccf3b4",
-        "nationality": ["pt"],
-        "position": ["DF"],
-        "birth_year": 1968,
-    },
-    "Miguel-Sim\u00e3o": {
-        "id": "0d0c2cbe",
-        "nationality": ["pt"],
-        "position": ["FW"],
-        "birth_year": 1973,
-    },
-    "Pedro-Sim\u00f5es": {"id": "3bbea63c", "position": ["MF"], "birth_year": 1974},
-    "Romano-Sion": {
-        "id": "32f70fb4",
-        "nationality": ["nl"],
-        "position": ["FW"],
-        "birth_year": 1971,
-    },
-    "Jorge-Soares": {
-        "id": "11378fbf",
-        "nationality": ["pt"],
-        "position": ["DF"],
-        "birth_year": 1971,
-    },
-    "Jos\u00e9-Soares": {
-        "id": "a081e7ff",
-        "nationality": ["pt"],
-        "position": ["DF"],
-        "birth_year": 1976,
-    },
-    "Fredrik-S\u00f6derstr\u00f6m": {
-        "id": "4a09c714",
-        "nationality": ["se"],
-        "position": ["MF"],
-        "birth_year": 1973,
-    },
-    "C\u00e9sar-Filipe-Santos-e-Sousa": {
-        "id": "288d9690",
-        "nationality": ["pt"],
-        "position": ["DF"],
-        "birth_year": 1974,
-    },
-    "Jos\u00e9-Carlos-Leite-de-Sousa": {
-        "id": "22ed77ac",
-        "nationality": ["pt"],
-        "position": ["DF"],
-        "birth_year": 1977,
-    },
-    "Gerson-Duarte-de-Sousa-Lobo": {
-        "id": "40cba401",
-        "nationality": ["cv"],
-        "position": ["DF"],
-        "birth_year": 1975,
-    },
-    "Paulo-Sousa": {
-        "id": "a1c45794",
-        "nationality": ["pt"],
-        "position": ["MF"],
-        "birth_year": 1970,
-    },
-    "Ricardo-Sousa": {
-        "id": "2dcaa07e",
-        "nationality": ["pt"],
-        "position": ["MF"],
-        "birth_year": 1979,
-    },
-    "Igor-Souza": {
-        "id": "b767f582",
-        "nationality": ["br"],
-        "position": ["FW"],
-        "birth_year": 1979,
-    },
-    "Robert-\u0160pehar": {
-        "id": "11844a46",
-        "nationality": ["hr"],
-        "position": ["FW"],
-        "birth_year": 1970,
-    },
-    "Marius-\u0218umudic\u0103": {
-        "id": "338c0e37",
-        "nationality": ["ro"],
-        "position": ["FW"],
-        "birth_year": 1971,
-    },
-    "Rodrigo-Tello": {
-        "id": "dc8120c6",
-        "nationality": ["cl"],
-        "position": ["MF"],
-        "birth_year": 1979,
-    },
-    "M\u00e1rcio-Theodoro": {
-        "id": "fd455e3d",
-        "nationality": ["br"],
-        "position": ["DF"],
-        "birth_year": 1968,
-    },
-    "Tinaia": {"id": "b4fbfe12", "birth_year": 1979},
-    "Jo\u00e3o-Tom\u00e1s": {
-        "id": "74b3eb9d",
-        "nationality": ["pt"],
-        "position": ["FW"],
-        "birth_year": 1975,
-    },
-    "Tomas-Tomic": {
-        "id": "dc8ef999",
-        "nationality": ["de"],
-        "position": ["GK"],
-        "birth_year": 1977,
-    },
-    "To\u00f1ito": {
-        "id": "c8e76c8e",
-        "nationality": ["es"],
-        "position": ["MF"],
-        "birth_year": 1977,
-    },
-    "Pedro-Torr\u00e3o": {
-        "id": "b3fba23c",
-        "nationality": ["pt"],
-        "position": ["MF"],
-        "birth_year": 1977,
-    },
-    "Toy": {
-        "id": "f01c3f11",
-        "nationality": ["cv"],
-        "position": ["FW"],
-        "birth_year": 1977,
-    },
-    "Diego-Trotta": {
-        "id": "e7ec1faf",
-        "nationality": ["ar"],
-        "position": ["DF"],
-        "birth_year": 1978,
-    },
-    "Tuck": {
-        "id": "f9cd4cc9",
-        "nationality": ["pt"],
-        "position": ["MF"],
-        "birth_year": 1969,
-    },
-    "Cristi\u00e1n-Uribe": {
-        "id": "c1326142",
-        "nationality": ["cl"],
-        "position": ["MF"],
-        "birth_year": 1976,
-    },
-    "Nuno-Valente": {
-        "id": "ac474cf2",
-        "nationality": ["pt"],
-        "position": ["DF"],
-        "birth_year": 1974,
-    },
-    "Lu\u00eds-Vasco": {"id": "dd9e7eac", "birth_year": 1966},
-    "Miguel-Vaz": {"id": "af620800", "birth_year": 1972},
-    "N\u00e9lson-Ver\u00edssimo": {
-        "id": "42959f9f",
-        "nationality": ["pt"],
-        "position": ["DF"],
-        "birth_year": 1977,
-    },
-    "Lu\u00eds-Manuel-Rodrigues-Viana": {
-        "id": "ff162543",
-        "nationality": ["pt"],
-        "position": ["MF"],
-        "birth_year": 1970,
-    },
-    "Paulo-Vida": {
-        "id": "77fef5be",
-        "nationality": ["pt"],
-        "position": ["FW"],
-        "birth_year": 1971,
-    },
-    "Lito-Vidigal": {
-        "id": "b7c87217",
-        "nationality": ["ao"],
-        "position": ["DF"],
-        "birth_year": 1969,
-    },
-    "Jos\u00e9-Rafael-Rios-Soares-Vieira": {"id": "ff978caf", "birth_year": 1970},
-    "V\u00edtor-Vieira": {"id": "4342ed26", "birth_year": 1973},
-    "Jorge-Manuel-Ferreira-Vinagre": {"id": "0ca39e71", "birth_year": 1975},
-    "Lu\u00eds-Vouzela": {
-        "id": "41370759",
-        "nationality": ["pt"],
-        "position": ["MF"],
-        "birth_year": 1974,
-    },
-    "Whelliton": {
-        "id": "40e9437f",
-        "nationality": ["br"],
-        "position": ["FW"],
-        "birth_year": 1972,
-    },
-    "Bassey-William-Andem": {
-        "id": "7110c958",
-        "nationality": ["cm"],
-        "position": ["GK"],
-        "birth_year": 1968,
-    },
-    "Wilson": {
-        "id": "47aef38d",
-        "nationality": ["ao"],
-        "position": ["DF"],
-        "birth_year": 1969,
-    },
-    "Ivaylo-Yordanov": {
-        "id": "143386b4",
-        "nationality": ["bg"],
-        "position": ["FW", "MF"],
-        "birth_year": 1968,
-    },
-    "Srgjan-Zaharievski": {
-        "id": "1c9ad5b6",
-        "nationality": ["mk"],
-        "position": ["MF"],
-        "birth_year": 1973,
-    },
-    "T\u00f3-Z\u00e9": {"id": "22711b60", "birth_year": 1977},
-    "Zeferino": {
-        "id": "5b5e3268",
-        "nationality": ["pt"],
-        "position": ["FW"],
-        "birth_year": 1978,
-    },
-    "Pablo-Zegarra": {
-        "id": "563d37bb",
-        "nationality": ["pe"],
-        "position": ["MF"],
-        "birth_year": 1973,
-    },
-    "Zezinho": {
-        "id": "1bc42e1a",
-        "nationality": ["cv"],
-        "position": ["MF"],
-        "birth_year": 1972,
-    },
-    "Ivan-\u0110ur\u0111evi\u0107": {
-        "id": "8815d37c",
-        "nationality": ["rs"],
-        "position": ["DF", "MF"],
-        "birth_year": 1977,
-    },
-    "Yassine-Abdellaoui": {
-        "id": "f93fa06c",
-        "nationality": ["nl"],
-        "position": ["FW", "MF"],
-        "birth_year": 1975,
-    },
-    "Eric-Addo": {
-        "id": "2f37e4dc",
-        "nationality": ["gh"],
-        "position": ["DF", "MF"],
-        "birth_year": 1978,
-    },
-    "Marcel-Akerboom": {
-        "id": "08240ba5",
-        "nationality": ["nl"],
-        "position": ["DF"],
-        "birth_year": 1981,
-    },
-    "Tony-Alberda": {
-        "id": "8f8a452b",
-        "nationality": ["nl"],
-        "position": ["FW"],
-        "birth_year": 1974,
-    },
-    "Mohammed-Allach": {
-        "id": "d6a307e2",
-        "nationality": ["nl"],
-        "position": ["DF"],
-        "birth_year": 1973,
-    },
-    "Marcus-Allb\u00e4ck": {
-        "id": "02c070c0",
-        "nationality": ["se"],
-        "position": ["FW"],
-        "birth_year": 1973,
-    },
-    "Matthew-Amoah": {
-        "id": "76bd0108",
-        "nationality": ["gh"],
-        "position": ["FW"],
-        "birth_year": 1980,
-    },
-    "Yannis-Anastasiou": {
-        "id": "5d13f975",
-        "nationality": ["gr"],
-        "position": ["FW"],
-        "birth_year": 1973,
-    },
-    "Arno-Arts": {
-        "id": "9aa1a241",
-        "nationality": ["nl"],
-        "position": ["MF"],
-        "birth_year": 1969,
-    },
-    "Shota-Arveladze": {
-        "id": "cd4e0298",
-        "nationality": ["ge"],
-        "position": ["FW"],
-        "birth_year": 1973,
-    },
-    "Jeffrey-van-As": {
-        "id": "1b36a2da",
-        "nationality": ["nl"],
-        "position": ["DF"],
-        "birth_year": 1972,
-    },
-    "Pascal-Averdijk": {
-        "id": "08ecdfa9",
-        "nationality": ["nl"],
-        "position": ["FW"],
-        "birth_year": 1977,
-    },
-    "Patrick-Ax": {
-        "id": "82bb6fb5",
-        "nationality": ["nl"],
-        "position": ["MF"],
-        "birth_year": 1979,
-    },
-    "G\u00e1bor-Babos": {
-        "id": "5b9987b3",
-        "nationality": ["hu"],
-        "position": ["GK"],
-        "birth_year": 1974,
-    },
-    "Winston-Bakboord": {
-        "id": "fc994245",
-        "nationality": ["nl"],
-        "position": ["DF"],
-        "birth_year": 1971,
-    },
-    "Said-Bakkati": {
-        "id": "8fdabaf7",
-        "nationality": ["nl"],
-        "position": ["DF"],
-        "birth_year": 1982,
-    },
-    "Joos-van-Barneveld": {
-        "id": "e5133af3",
-        "nationality": ["nl"],
-        "position": ["MF"],
-        "birth_year": 1982,
-    },
-    "Kiran-Bechan": {
-        "id": "bae47830",
-        "nationality": ["nl"],
-        "position": ["MF"],
-        "birth_year": 1982,
-    },
-    "Milan-Berck-Beelenkamp": {
-        "id": "8a23c055",
-        "nationality": ["nl"],
-        "position": ["DF"],
-        "birth_year": 1977,
-    },
-    "Andr\u00e9-Bergd\u00f8lmo": {
-        "id": "2916191e",
-        "nationality": ["no"],
-        "position": ["DF"],
-        "birth_year": 1971,
-    },
-    "Ruud-Berger": {
-        "id": "5e8ae04f",
-        "nationality": ["nl"],
-        "position": ["FW"],
-        "birth_year": 1980,
-    },
-    "Roy-Beukenkamp": {
-        "id": "004cc5cd",
-        "nationality": ["nl"],
-        "position": ["GK"],
-        "birth_year": 1968,
-    },
-    "Jhon-van-Beukering": {
-        "id": "9a9e71e0",
-        "nationality": ["id"],
-        "position": ["FW"],
-        "birth_year": 1983,
-    },
-    "Houssin-Bezzai": {
-        "id": "5622fbda",
-        "nationality": ["nl"],
-        "position": ["DF"],
-        "birth_year": 1978,
-    },
-    "Arjan-Bisseling": {
-        "id": "e952f992",
-        "nationality": ["nl"],
-        "position": ["MF"],
-        "birth_year": 1979,
-    },
-    "Nenad-Bjekovi\u0107": {
-        "id": "04ed2a16",
-        "nationality": ["rs"],
-        "position": ["FW", "MF"],
-        "birth_year": 1974,
-    },
-    "Regi-Blinker": {
-        "id": "c14cbc10",
-        "nationality": ["nl"],
-        "position": ["FW", "MF"],
-        "birth_year": 1969,
-    },
-    "Kevin-Bobson": {
-        "id": "accb244e",
-        "nationality": ["nl"],
-        "position": ["FW"],
-        "birth_year": 1980,
-    },
-    "Mariano-Bombarda": {
-        "id": "63fdb3bf",
-        "nationality": ["es"],
-        "position": ["FW"],
-        "birth_year": 1972,
-    },
-    "Mark-van-Bommel": {
-        "id": "f23bcfa3",
-        "nationality": ["nl"],
-        "position": ["MF"],
-        "birth_year": 1977,
-    },
-    "Scott-Booth": {
-        "id": "75fd9bbc",
-        "nationality": ["sct"],
-        "position": ["FW"],
-        "birth_year": 1971,
-    },
-    "Sander-Boschker": {
-        "id": "dcdd4427",
-        "nationality": ["nl"],
-        "position": ["GK"],
-        "birth_year": 1970,
-    },
-    "John-Bosman": {
-        "id": "d0f94bba",
-        "nationality": ["nl"],
-        "position": ["FW"],
-        "birth_year": 1965,
-    },
-    "Pascal-Bosschaart": {
-        "id": "68f30bb0",
-        "nationality": ["nl"],
-        "position": ["DF", "MF"],
-        "birth_year": 1980,
-    },
-    "Paul-Bosvelt": {
-        "id": "56d1e956",
-        "nationality": ["nl"],
-        "position": ["DF", "MF"],
-        "birth_year": 1970,
-    },
-    "Ren\u00e9-Bot": {
-        "id": "319702f0",
-        "nationality": ["nl"],
-        "position": ["DF"],
-        "birth_year": 1978,
-    },
-    "Elbekay-Bouchiba": {
-        "id": "2a71ae04",
-        "nationality": ["nl"],
-        "position": ["MF"],
-        "birth_year": 1978,
-    },
-    "Nourdin-Boukhari": {
-        "id": "f70e3225",
-        "nationality": ["ma"],
-        "position": ["MF"],
-        "birth_year": 1980,
-    },
-    "Wilfred-Bouma": {
-        "id": "fc2b357f",
-        "nationality": ["nl"],
-        "position": ["DF"],
-        "birth_year": 1978,
-    },
-    "Dries-Boussatta": {
-        "id": "b1f49154",
-        "nationality": ["nl"],
-        "position": ["FW", "MF"],
-        "birth_year": 1972,
-    },
-    "Faouzi-El-Brazi": {
-        "id": "0b4717cf",
-        "nationality": ["ma"],
-        "position": ["DF", "MF"],
-        "birth_year": 1977,
-    },
-    "Frank-Broers": {
-        "id": "a5bd33b2",
-        "nationality": ["nl"],
-        "position": ["DF"],
-        "birth_year": 1977,
-    },
-    "Joost-Broerse": {
-        "id": "1df9fe7c",
-        "nationality": ["nl"],
-        "position": ["DF", "MF"],
-        "birth_year": 1979,
-    },
-    "Arnold-Bruggink": {
-        "id": "419725a2",
-        "nationality": ["nl"],
-        "position": ["FW", "MF"],
-        "birth_year": 1977,
-    },
-    "Marvin-Brunswijk": {
-        "id": "151b4ddb",
-        "nationality": ["nl"],
-        "position": ["DF"],
-        "birth_year": 1976,
-    },
-    "Michael-Buskermolen": {
-        "id": "6f0831b7",
-        "nationality": ["nl"],
-        "position": ["DF", "MF"],
-        "birth_year": 1972,
-    },
-    "Kasper-B\u00f8gelund": {
-        "id": "78d62eb2",
-        "nationality": ["dk"],
-        "position": ["DF"],
-        "birth_year": 1980,
-    },
-    "Ellery-Cairo": {
-        "id": "ee85825d",
-        "nationality": ["nl"],
-        "position": ["FW", "MF"],
-        "birth_year": 1978,
-    },
-    "Rodney-Cairo": {
-        "id": "75b2845f",
-        "nationality": ["nl"],
-        "position": ["MF"],
-        "birth_year": 1975,
-    },
-    "Gijs-Cales": {
-        "id": "e09af306",
-        "nationality": ["nl"],
-        "position": ["FW"],
-        "birth_year": 1977,
-    },
-    "Tom-Caluw\u00e9": {
-        "id": "5c0e9c79",
-        "nationality": ["be"],
-        "position": ["MF"],
-        "birth_year": 1978,
-    },
-    "Marcel-Cas": {
-        "id": "1f090b09",
-        "nationality": ["nl"],
-        "position": ["MF"],
-        "birth_year": 1972,
-    },
-    "Jatto-Ceesay": {
-        "id": "84211105",
-        "nationality": ["gm"],
-        "position": ["FW"],
-        "birth_year": 1974,
-    },
-    "Cristian-Chivu": {
-        "id": "3bf30a4f",
-        "nationality": ["ro"],
-        "position": ["DF"],
-        "birth_year": 1980,
-    },
-    "Gert-Claessens": {
-        "id": "e9e70239",
-        "nationality": ["be"],
-        "position": ["DF", "MF"],
-        "birth_year": 1972,
-    },
-    "Cl\u00e1udio": {
-        "id": "ca01a61e",
-        "nationality": ["br"],
-        "position": ["FW"],
-        "birth_year": 1979,
-    },
-    "Tim-de-Cler": {
-        "id": "ce3fe9de",
-        "nationality": ["nl"],
-        "position": ["DF"],
-        "birth_year": 1978,
-    },
-    "Pieter-Collen": {
-        "id": "57852693",
-        "nationality": ["be"],
-        "position": ["DF"],
-        "birth_year": 1980,
-    },
-    "David-Connolly": {
-        "id": "3783ae20",
-        "nationality": ["ie"],
-        "position": ["FW"],
-        "birth_year": 1977,
-    },
-    "Tim-Cornelisse": {
-        "id": "90164472",
-        "nationality": ["nl"],
-        "position": ["DF"],
-        "birth_year": 1978,
-    },
-    "Yuri-Cornelisse": {
-        "id": "04d76c99",
-        "nationality": ["nl"],
-        "position": ["FW"],
-        "birth_year": 1975,
-    },
-    "Gino-Coutinho": {
-        "id": "5879940d",
-        "nationality": ["nl"],
-        "position": ["GK"],
-        "birth_year": 1982,
-    },
-    "Cristiano": {
-        "id": "5a76bbf3",
-        "nationality": ["br"],
-        "position": ["FW"],
-        "birth_year": 1981,
-    },
-    "Daniel-Cruz": {
-        "id": "6696358d",
-        "nationality": ["co"],
-        "position": ["MF"],
-        "birth_year": 1981,
-    },
-    "Dejan-\u010curovi\u0107": {
-        "id": "a69279e0",
-        "nationality": ["rs"],
-        "position": ["FW"],
-        "birth_year": 1968,
-    },
-    "Simon-Cziommer": {
-        "id": "1d1c6545",
-        "nationality": ["de"],
-        "position": ["MF"],
-        "birth_year": 1980,
-    },
-    "Jon-Dahl-Tomasson": {
-        "id": "4af3fb59",
-        "nationality": ["dk"],
-        "position": ["FW", "MF"],
-        "birth_year": 1976,
-    },
-    "Maurits-van-Dalen": {
-        "id": "e19c89c0",
-        "nationality": ["nl"],
-        "position": ["DF"],
-        "birth_year": 1980,
-    },
-    "Egbert-Darwinkel": {
-        "id": "de1d2cf2",
-        "nationality": ["nl"],
-        "position": ["GK"],
-        "birth_year": 1965,
-    },
-    "Ronald-Dassen": {
-        "id": "2309937a",
-        "nationality": ["nl"],
-        "position": ["DF"],
-        "birth_year": 1975,
-    },
-    "Garry-De-Graef": {
-        "id": "924b0501",
-        "nationality": ["be"],
-        "position": ["DF"],
-        "birth_year": 1974,
-    },
-    "Kurt-Van-De-Paar": {
-        "id": "3e3190f9",
-        "nationality": ["be"],
-        "position": ["FW"],
-        "birth_year": 1978,
-    },
-    "Geert-De-Vlieger": {
-        "id": "8c64906e",
-        "nationality": ["be"],
-        "position": ["GK"],
-        "birth_year": 1971,
-    },
-    "Chris-De-Witte": {
-        "id": "30db61a4",
-        "nationality": ["be"],
-        "position": ["FW"],
-        "birth_year": 1978,
-    },
-    "Peter-van-den-Berg": {
-        "id": "470a49be",
-        "nationality": ["nl"],
-        "position": ["DF"],
-        "birth_year": 1971,
-    },
-    "Dave-van-den-Bergh": {
-        "id": "ba681317",
-        "nationality": ["nl"],
-        "position": ["FW", "MF"],
-        "birth_year": 1976,
-    },
-    "John-van-den-Brom": {
-        "id": "79057191",
-        "nationality": ["nl"],
-        "position": ["DF", "MF"],
-        "birth_year": 1966,
-    },
-    "Wouter-van-den-Herik": {
-        "id": "f8e5db9d",
-        "nationality": ["nl"],
-        "position": ["FW"],
-        "birth_year": 1979,
-    },
-    "Dennis-den-Turk": {
-        "id": "189d0710",
-        "nationality": ["nl"],
-        "position": ["DF"],
-        "birth_year": 1969,
-    },
-    "Romano-Denneboom": {
-        "id": "3a2bb23c",
-        "nationality": ["nl"],
-        "position": ["FW"],
-        "birth_year": 1981,
-    },
-    "Bj\u00f6rn-van-der-Doelen": {
-        "id": "8720bc37",
-        "nationality": ["nl"],
-        "position": ["MF"],
-        "birth_year": 1976,
-    },
-    "Mitchell-van-der-Gaag": {
-        "id": "d25d5af1",
-        "nationality": ["nl"],
-        "position": ["DF"],
-        "birth_year": 1971,
-    },
-    "Cedric-van-der-Gun": {
-        "id": "c38d4962",
-        "nationality": ["nl"],
-        "position": ["FW", "MF"],
-        "birth_year": 1979,
-    },
-    "Jochem-van-der-Hoeven": {
-        "id": "01d30774",
-        "nationality": ["nl"],
-        "position": ["DF"],
-        "birth_year": 1975,
-    },
-    "Arjan-van-der-Laan": {
-        "id": "6f8bd258",
-        "nationality": ["nl"],
-        "position": ["MF"],
-        "birth_year": 1969,
-    },
-    "Tommie-van-der-Leegte": {
-        "id": "1bd43501",
-        "nationality": ["nl"],
-        "position": ["MF"],
-        "birth_year": 1977,
-    },
-    "Eric-van-der-Luer": {
-        "id": "d6beb399",
-        "nationality": ["nl"],
-        "position": ["MF"],
-        "birth_year": 1965,
-    },
-    "Dave-van-der-Meer": {
-        "id": "67ef7fac",
-        "nationality": ["nl"],
-        "position": ["DF"],
-        "birth_year": 1973,
-    },
-    "Andy-van-der-Meyde": {
-        "id": "d44b1ec0",
-        "nationality": ["nl"],
-        "position": ["FW", "MF"],
-        "birth_year": 1979,
-    },
-    "Dennis-van-der-Ree": {
-        "id": "770199a7",
-        "nationality": ["nl"],
-        "position": ["DF"],
-        "birth_year": 1979,
-    },
-    "Remco-van-der-Schaaf": {
-        "id": "7de5608a",
-        "nationality": ["nl"],
-        "position": ["DF", "MF"],
-        "birth_year": 1979,
-    },
-    "Albert-van-der-Sleen": {
-        "id": "633c5195",
-        "nationality": ["nl"],
-        "position": ["GK"],
-        "birth_year": 1963,
-    },
-    "Rafael-van-der-Vaart": {
-        "id": "41473b67",
-        "nationality": ["nl"],
-        "position": ["MF"],
-        "birth_year": 1983,
-    },
-    "Chris-van-der-Weerden": {
-        "id": "06967873",
-        "nationality": ["nl"],
-        "position": ["DF"],
-        "birth_year": 1972,
-    },
-    "Kevin-van-Dessel": {
-        "id": "d9fd27bf",
-        "nationality": ["be"],
-        "position": ["MF"],
-        "birth_year": 1979,
-    },
-    "Bakary-Diakit\u00e9": {
-        "id": "a29a8f0c",
-        "nationality": ["ml"],
-        "position": ["FW"],
-        "birth_year": 1980,
-    },
-    "Mahamadou-Diarra": {
-        "id": "4a6c3ade",
-        "nationality": ["ml"],
-        "position": ["MF"],
-        "birth_year": 1981,
-    },
-    "Jamal-Dibi": {
-        "id": "e214c6ee",
-        "nationality": ["nl"],
-        "position": ["MF"],
-        "birth_year": 1979,
-    },
-    "Ren\u00e9-van-Dieren": {
-        "id": "fa71b7f0",
-        "nationality": ["nl"],
-        "position": ["MF"],
-        "birth_year": 1981,
-    },
-    "Dominique-van-Dijk": {
-        "id": "d9f084ec",
-        "nationality": ["nl"],
-        "position": ["MF"],
-        "birth_year": 1979,
-    },
-    "Gregoor-van-Dijk": {
-        "id": "9167119e",
-        "nationality": ["nl"],
-        "position": ["MF"],
-        "birth_year": 1981,
-    },
-    "Rob-van-Dijk": {
-        "id": "819bc26e",
-        "nationality": ["nl"],
-        "position": ["GK"],
-        "birth_year": 1969,
-    },
-    "Sieb-Dijkstra": {
-        "id": "2de1c413",
-        "nationality": ["nl"],
-        "position": ["GK"],
-        "birth_year": 1966,
-    },
-    "Ivar-van-Dinteren": {
-        "id": "850d68ab",
-        "nationality": ["nl"],
-        "position": ["MF"],
-        "birth_year": 1979,
-    },
-    "J\u00fcrgen-Dirkx": {
-        "id": "c4b66d0f",
-        "nationality": ["nl"],
-        "position": ["DF"],
-        "birth_year": 1975,
-    },
-    "Tibor-Dombi": {
-        "id": "efe5876a",
-        "nationality": ["hu"],
-        "position": ["MF"],
-        "birth_year": 1973,
-    },
-    "Arno-Doomernik": {
-        "id": "64256244",
-        "nationality": ["nl"],
-        "position": ["MF"],
-        "birth_year": 1970,
-    },
-    "Adilson-dos-Santos": {
-        "id": "69909952",
-        "nationality": ["br"],
-        "position": ["DF"],
-        "birth_year": 1976,
-    },
-    "Darl-Douglas": {
-        "id": "a2840ef2",
-        "nationality": ["nl"],
-        "position": ["FW", "MF"],
-        "birth_year": 1979,
-    },
-    "Martin-Drent": {
-        "id": "ea81d1c2",
-        "nationality": ["nl"],
-        "position": ["FW"],
-        "birth_year": 1970,
-    },
-    "Jerzy-Dudek": {
-        "id": "1064659d",
-        "nationality": ["pl"],
-        "position": ["GK"],
-        "birth_year": 1973,
-    },
-    "Arjan-Ebbinge": {
-        "id": "ff615ca7",
-        "nationality": ["nl"],
-        "position": ["DF"],
-        "birth_year": 1974,
-    },
-    "Jan-Willem-van-Ede": {
-        "id": "ff2d5ef2",
-        "nationality": ["nl"],
-        "position": ["GK"],
-        "birth_year": 1963,
-    },
-    "Andy-Edwards": {
-        "id": "7cb1c185",
-        "nationality": ["eng"],
-        "position": ["DF"],
-        "birth_year": 1971,
-    },
-    "Ali-Elkhattabi": {
-        "id": "216cea4d",
-        "nationality": ["ma"],
-        "position": ["FW"],
-        "birth_year": 1977,
-    },
-    "Johan-Elmander": {
-        "id": "3438cef9",
-        "nationality": ["se"],
-        "position": ["FW"],
-        "birth_year": 1981,
-    },
-    "Kurt-Elshot": {
-        "id": "4036cf59",
-        "nationality": ["nl"],
-        "position": ["DF"],
-        "birth_year": 1977,
-    },
-    "Richard-Elzinga": {
-        "id": "543c1d06",
-        "nationality": ["nl"],
-        "position": ["DF"],
-        "birth_year": 1969,
-    },
-    "Fritz-Emeran": {
-        "id": "c0a3c10d",
-        "nationality": ["rw"],
-        "position": ["DF", "MF"],
-        "birth_year": 1976,
-    },
-    "Brett-Emerton": {
-        "id": "a1866af0",
-        "nationality": ["au"],
-        "position": ["DF", "MF"],
-        "birth_year": 1979,
-    },
-    "Orlando-Engelaar": {
-        "id": "bdf0f5c1",
-        "nationality": ["nl"],
-        "position": ["DF", "MF"],
-        "birth_year": 1979,
-    },
-    "Ernest-Faber": {
-        "id": "3112e5d3",
-        "nationality": ["nl"],
-        "position": ["DF"],
-        "birth_year": 1971,
-    },
-    "Csaba-Feh\u00e9r": {
-        "id": "fb643ba9",
-        "nationality": ["hu"],
-        "position": ["DF", "MF"],
-        "birth_year": 1975,
-    },
-    "Youssef-Fertout": {
-        "id": "aac9cffc",
-        "nationality": ["ma"],
-        "position": ["FW"],
-        "birth_year": 1970,
-    },
-    "Jim-van-Fessem": {
-        "id": "c50a1d2b",
-        "nationality": ["nl"],
-        "position": ["GK"],
-        "birth_year": 1975,
-    },
-    "Carlos-Fortes": {
-        "id": "3642d8de",
-        "nationality": ["nl"],
-        "position": ["FW"],
-        "birth_year": 1974,
-    },
-    "Jos\u00e9-Fortes-Rodriguez": {
-        "id": "6e4a4802",
-        "nationality": ["es"],
-        "position": ["DF"],
-        "birth_year": 1972,
-    },
-    "Purrel-Fr\u00e4nkel": {
-        "id": "76bb6de9",
-        "nationality": ["nl"],
-        "position": ["DF"],
-        "birth_year": 1976,
-    },
-    "Robert-Fuchs": {
-        "id": "e99e267c",
-        "nationality": ["nl"],
-        "position": ["MF"],
-        "birth_year": 1975,
-    },
-    "Giorgi-Gakhokidze": {
-        "id": "929b461f",
-        "nationality": ["ge"],
-        "position": ["MF"],
-        "birth_year": 1975,
-    },
-    "Tom\u00e1\u0161-Gal\u00e1sek": {
-        "id": "7191187c",
-        "nationality": ["cz"],
-        "position": ["MF"],
-        "birth_year": 1973,
-    },
-    "Barry-van-Galen": {
-        "id": "f55c77b5",
-        "nationality": ["nl"],
-        "position": ["MF"],
-        "birth_year": 1970,
-    },
-    "Martijn-van-Galen": {
-        "id": "41da05f8",
-        "nationality": ["nl"],
-        "position": ["FW"],
-        "birth_year": 1970,
-    },
-    "Jean-Paul-van-Gastel": {
-        "id": "4b1f6bda",
-        "nationality": ["nl"],
-        "position": ["MF"],
-        "birth_year": 1972,
-    },
-    "Dennis-Gentenaar": {
-        "id": "58a207b6",
-        "nationality": ["nl"],
-        "position": ["GK"],
-        "birth_year": 1975,
-    },
-    "Dennis-Gerritsen": {
-        "id": "0aec4387",
-        "nationality": ["nl"],
-        "position": ["FW"],
-        "birth_year": 1971,
-    },
-    "Sander-van-Gessel": {
-        "id": "99d5771c",
-        "nationality": ["nl"],
-        "position": ["DF"],
-        "birth_year": 1976,
-    },
-    "Jack-de-Gier": {
-        "id": "f81d61f7",
-        "nationality": ["nl"],
-        "position": ["FW"],
-        "birth_year": 1968,
-    },
-    "Igor-Glu\u0161\u010devi\u0107": {
-        "id": "a2c7da3e",
-        "nationality": ["me"],
-        "position": ["FW"],
-        "birth_year": 1974,
-    },
-    "Ulrich-van-Gobbel": {
-        "id": "859fce4f",
-        "nationality": ["nl"],
-        "position": ["DF"],
-        "birth_year": 1971,
-    },
-    "Harrie-Gommans": {
-        "id": "931e8c10",
-        "nationality": ["nl"],
-        "position": ["FW"],
-        "birth_year": 1983,
-    },
-    "Steve-Goossen": {
-        "id": "864689b3",
-        "nationality": ["nl"],
-        "position": ["DF"],
-        "birth_year": 1968,
-    },
-    "Dejan-Govedarica": {
-        "id": "93882612",
-        "nationality": ["rs"],
-        "position": ["MF"],
-        "birth_year": 1969,
-    },
-    "Fred-Grim": {
-        "id": "78351194",
-        "nationality": ["nl"],
-        "position": ["GK"],
-        "birth_year": 1965,
-    },
-    "Alfons-Groenendijk": {
-        "id": "2474c9f0",
-        "nationality": ["nl"],
-        "position": ["MF"],
-        "birth_year": 1964,
-    },
-    "Spira-Gruji\u0107": {
-        "id": "510a3ff0",
-        "nationality": ["rs"],
-        "position": ["DF"],
-        "birth_year": 1971,
-    },
-    "Neboj\u0161a-Gudelj": {
-        "id": "f852750f",
-        "nationality": ["rs"],
-        "position": ["DF"],
-        "birth_year": 1968,
-    },
-    "Joey-Gu\u00f0j\u00f3nsson": {
-        "id": "b79e0fde",
-        "nationality": ["is"],
-        "position": ["MF"],
-        "birth_year": 1980,
-    },
-    "Christian-Gyan": {
-        "id": "c6bcf54e",
-        "nationality": ["gh"],
-        "position": ["DF"],
-        "birth_year": 1978,
-    },
-    "Ferry-de-Haan": {
-        "id": "fbf9a4a6",
-        "nationality": ["nl"],
-        "position": ["DF"],
-        "birth_year": 1972,
-    },
-    "Ramon-van-Haaren": {
-        "id": "3ba83da1",
-        "nationality": ["nl"],
-        "position": ["DF"],
-        "birth_year": 1972,
-    },
-    "Abdelkrim-El-Hadrioui": {
-        "id": "2217b88f",
-        "nationality": ["ma"],
-        "position": ["DF"],
-        "birth_year": 1972,
-    },
-    "Stijn-Haeldermans": {
-        "id": "b21f5618",
-        "nationality": ["be"],
-        "position": ["MF"],
-        "birth_year": 1975,
-    },
-    "Jan-van-Halst": {
-        "id": "1d1c9387",
-        "nationality": ["nl"],
-        "position": ["MF"],
-        "birth_year": 1969,
-    },
-    "Ronald-Hamming": {
-        "id": "dfd9d869",
-        "nationality": ["nl"],
-        "position": ["FW"],
-        "birth_year": 1973,
-    },
-    "Johan-Hansma": {
-        "id": "000bf489",
-        "nationality": ["nl"],
-        "position": ["DF"],
-        "birth_year": 1969,
-    },
-    "Marco-Heering": {
-        "id": "26898cd8",
-        "nationality": ["nl"],
-        "position": ["FW"],
-        "birth_year": 1970,
-    },
-    "Remco-Heerkens": {
-        "id": "f9de0728",
-        "nationality": ["nl"],
-        "position": ["MF"],
-        "birth_year": 1977,
-    },
-    "Ron-Heesakkers": {
-        "id": "d6ba9ed9",
-        "nationality": ["nl"],
-        "position": ["FW"],
-        "birth_year": 1978,
-    },
-    "Pascal-Heije": {
-        "id": "496f181f",
-        "nationality": ["nl"],
-        "position": ["MF"],
-        "birth_year": 1979,
-    },
-    "Jan-Heintze": {
-        "id": "85783c6f",
-        "nationality": ["dk"],
-        "position": ["DF"],
-        "birth_year": 1963,
-    },
-    "Eric-Hellemons": {
-        "id": "9ee87f69",
-        "nationality": ["nl"],
-        "position": ["DF"],
-        "birth_year": 1971,
-    },
-    "Marcel-van-Helmond": {"id": "05d33ea1", "position": ["FW"], "birth_year": 1966},
-    "Edwin-Hermans": {
-        "id": "d464a1f6",
-        "nationality": ["nl"],
-        "position": ["DF"],
-        "birth_year": 1974,
-    },
-    "Youssouf-Hersi": {
-        "id": "206eb683",
-        "nationality": ["nl"],
-        "position": ["MF"],
-        "birth_year": 1982,
-    },
-    "Dami\u00ebn-Hertog": {
-        "id": "72e32653",
-        "nationality": ["nl"],
-        "position": ["MF"],
-        "birth_year": 1974,
-    },
-    "Danny-Hesp": {
-        "id": "109be231",
-        "nationality": ["nl"],
-        "position": ["DF"],
-        "birth_year": 1969,
-    },
-    "Ruud-Hesp": {
-        "id": "72817426",
-        "nationality": ["nl"],
-        "position": ["GK"],
-        "birth_year": 1965,
-    },
-    "Jan-Vennegoor-of-Hesselink": {
-        "id": "13a250bb",
-        "nationality": ["nl"],
-        "position": ["FW"],
-        "birth_year": 1978,
-    },
-    "Jeroen-Heubach": {
-        "id": "effb6273",
-        "nationality": ["nl"],
-        "position": ["DF"],
-        "birth_year": 1974,
-    },
-    "Delano-Hill": {
-        "id": "44f56100",
-        "nationality": ["nl"],
-        "position": ["DF"],
-        "birth_year": 1975,
-    },
-    "Marc-van-Hintum": {
-        "id": "39a1be9c",
-        "nationality": ["nl"],
-        "position": ["DF"],
-        "birth_year": 1967,
-    },
-    "Peter-Hoekstra": {
-        "id": "9b9e1b54",
-        "nationality": ["nl"],
-        "position": ["FW", "MF"],
-        "birth_year": 1973,
-    },
-    "Kevin-Hofland": {
-        "id": "9c26b434",
-        "nationality": ["nl"],
-        "position": ["DF"],
-        "birth_year": 1979,
-    },
-    "Thomas-Holm": {
-        "id": "35e3943d",
-        "nationality": ["no"],
-        "position": ["DF", "MF"],
-        "birth_year": 1981,
-    },
-    "Rick-Hoogendorp": {
-        "id": "26242e8f",
-        "nationality": ["nl"],
-        "position": ["FW"],
-        "birth_year": 1975,
-    },
-    "Brutil-Hos\u00e9": {
-        "id": "60017a21",
-        "nationality": ["cw"],
-        "position": ["FW"],
-        "birth_year": 1979,
-    },
-    "Max-Houttuin": {
-        "id": "a900531f",
-        "nationality": ["nl"],
-        "position": ["MF"],
-        "birth_year": 1978,
-    },
-    "Thijs-Houwing": {
-        "id": "6dd76504",
-        "nationality": ["nl"],
-        "position": ["FW"],
-        "birth_year": 1981,
-    },
-    "Gjorgji-Hristov": {
-        "id": "8e236141",
-        "nationality": ["mk"],
-        "position": ["FW"],
-        "birth_year": 1976,
-    },
-    "Max-Huiberts": {
-        "id": "9ff0ce1f",
-        "nationality": ["nl"],
-        "position": ["FW"],
-        "birth_year": 1970,
-    },
-    "Harris-Huizingh": {
-        "id": "319d557a",
-        "nationality": ["nl"],
-        "position": ["FW"],
-        "birth_year": 1963,
-    },
-    "Dennis-Hulshoff": {
-        "id": "b7b90e80",
-        "nationality": ["nl"],
-        "position": ["DF"],
-        "birth_year": 1970,
-    },
-    "Arjan-Human": {
-        "id": "4002e744",
-        "nationality": ["nl"],
-        "position": ["FW"],
-        "birth_year": 1978,
-    },
-    "Willem-Hupkes": {
-        "id": "401cae88",
-        "nationality": ["nl"],
-        "position": ["MF"],
-        "birth_year": 1979,
-    },
-    "Faysal-El-Idrissi": {
-        "id": "3f96e97d",
-        "nationality": ["ma"],
-        "position": ["MF"],
-        "birth_year": 1977,
-    },
-    "Pius-Ikedia": {
-        "id": "ac83c1e6",
-        "nationality": ["ng"],
-        "position": ["MF"],
-        "birth_year": 1980,
-    },
-    "Silvan-Inia": {
-        "id": "f6efb4c2",
-        "nationality": ["nl"],
-        "position": ["MF"],
-        "birth_year": 1969,
-    },
-    "Tomasz-Iwan": {
-        "id": "4be9b3a4",
-        "nationality": ["pl"],
-        "position": ["MF"],
-        "birth_year": 1971,
-    },
-    "Kew-Jaliens": {
-        "id": "62ccc535",
-        "nationality": ["nl"],
-        "position": ["DF"],
-        "birth_year": 1978,
-    },
-    "Anton-Janssen": {
-        "id": "dd78cac7",
-        "nationality": ["nl"],
-        "position": ["MF"],
-        "birth_year": 1963,
-    },
-    "Theo-Janssen": {
-        "id": "a89d6258",
-        "nationality": ["nl"],
-        "position": ["MF"],
-        "birth_year": 1981,
-    },
-    "Daniel-Jensen": {
-        "id": "ded677a5",
-        "nationality": ["dk"],
-        "position": ["MF"],
-        "birth_year": 1979,
-    },
-    "Arco-Jochemsen": {
-        "id": "f19a297d",
-        "nationality": ["nl"],
-        "position": ["MF"],
-        "birth_year": 1971,
-    },
-    "Magnus-Johansson": {
-        "id": "18a0788a",
-        "nationality": ["se"],
-        "position": ["DF"],
-        "birth_year": 1971,
-    },
-    "Dave-de-Jong": {
-        "id": "99df6487",
-        "nationality": ["nl"],
-        "position": ["MF"],
-        "birth_year": 1975,
-    },
-    "Jean-Paul-de-Jong": {
-        "id": "62220c29",
-        "nationality": ["nl"],
-        "position": ["MF"],
-        "birth_year": 1970,
-    },
-    "John-de-Jong": {
-        "id": "4f514764",
-        "nationality": ["nl"],
-        "position": ["MF"],
-        "birth_year": 1977,
-    },
-    "Zeljko-Kalac": {
-        "id": "ecbb480a",
-        "nationality": ["au"],
-        "position": ["GK"],
-        "birth_year": 1972,
-    },
-    "Darije-Kalezi\u0107": {
-        "id": "379c1338",
-        "nationality": ["ch"],
-        "position": ["DF"],
-        "birth_year": 1969,
-    },
-    "Bonaventure-Kalou": {
-        "id": "30eeb24a",
-        "nationality": ["ci"],
-        "position": ["FW", "MF"],
-        "birth_year": 1978,
-    },
-    "Christopher-Kanu": {
-        "id": "367e8f3e",
-        "nationality": ["ng"],
-        "position": ["DF"],
-        "birth_year": 1979,
-    },
-    "Andr\u00e9-Karnebeek": {
-        "id": "367954de",
-        "nationality": ["nl"],
-        "position": ["DF"],
-        "birth_year": 1971,
-    },
-    "Yurtcan-Kayis": {
-        "id": "6040deb8",
-        "nationality": ["nl"],
-        "position": ["MF"],
-        "birth_year": 1975,
-    },
-    "Sander-Keller": {
-        "id": "79a10f40",
-        "nationality": ["nl"],
-        "position": ["DF"],
-        "birth_year": 1979,
-    },
-    "Mateja-Ke\u017eman": {
-        "id": "41985204",
-        "nationality": ["rs"],
-        "position": ["FW"],
-        "birth_year": 1979,
-    },
-    "Wim-Kiekens": {
-        "id": "988e5b76",
-        "nationality": ["be"],
-        "position": ["MF"],
-        "birth_year": 1968,
-    },
-    "Tieme-Klompe": {
-        "id": "6c4200bb",
-        "nationality": ["nl"],
-        "position": ["DF"],
-        "birth_year": 1976,
-    },
-    "Ruud-Knol": {
-        "id": "378e1a44",
-        "nationality": ["nl"],
-        "position": ["DF"],
-        "birth_year": 1981,
-    },
-    "Richard-Knopper": {
-        "id": "db3398f0",
-        "nationality": ["nl"],
-        "position": ["MF"],
-        "birth_year": 1977,
-    },
-    "Danny-Koevermans": {
-        "id": "cecd8cb7",
-        "nationality": ["nl"],
-        "position": ["FW"],
-        "birth_year": 1978,
-    },
-    "Santi-Kolk": {
-        "id": "55aa7423",
-        "nationality": ["nl"],
-        "position": ["FW", "MF"],
-        "birth_year": 1981,
-    },
-    "Joonas-Kolkka": {
-        "id": "e5a99524",
-        "nationality": ["fi"],
-        "position": ["MF"],
-        "birth_year": 1974,
-    },
-    "Marcel-Koning": {
-        "id": "cd3263a1",
-        "nationality": ["nl"],
-        "position": ["MF"],
-        "birth_year": 1975,
-    },
-    "Frank-Kooiman": {
-        "id": "926d3104",
-        "nationality": ["nl"],
-        "position": ["GK"],
-        "birth_year": 1970,
-    },
-    "Jeffrey-Kooistra": {
-        "id": "9653346c",
-        "nationality": ["nl"],
-        "position": ["MF"],
-        "birth_year": 1968,
-    },
-    "Ruud-Kool": {
-        "id": "db65581d",
-        "nationality": ["nl"],
-        "position": ["MF"],
-        "birth_year": 1966,
-    },
-    "Igor-Korneev": {
-        "id": "1978a2b2",
-        "nationality": ["xc"],
-        "position": ["MF"],
-        "birth_year": 1967,
-    },
-    "Michel-Kreek": {
-        "id": "90390e0d",
-        "nationality": ["nl"],
-        "position": ["DF"],
-        "birth_year": 1971,
-    },
-    "Dennis-Krijgsman": {
-        "id": "010830b2",
-        "nationality": ["nl"],
-        "position": ["FW"],
-        "birth_year": 1972,
-    },
-    "Jan-Kromkamp": {
-        "id": "3c970929",
-        "nationality": ["nl"],
-        "position": ["DF"],
-        "birth_year": 1980,
-    },
-    "Mile-Krstev": {
-        "id": "68d10ec2",
-        "nationality": ["mk"],
-        "position": ["MF"],
-        "birth_year": 1979,
-    },
-    "Martijn-Kuiper": {
-        "id": "1b92c2fe",
-        "nationality": ["nl"],
-        "position": ["DF"],
-        "birth_year": 1978,
-    },
-    "Dirk-Kuyt": {
-        "id": "cd53ecf4",
-        "nationality": ["nl"],
-        "position": ["DF", "FW"],
-        "birth_year": 1980,
-    },
-    "Michael-Lamey": {
-        "id": "80a55449",
-        "nationality": ["nl"],
-        "position": ["DF"],
-        "birth_year": 1979,
-    },
-    "Roberto-Lanckohr": {
-        "id": "4994e4fe",
-        "nationality": ["nl"],
-        "position": ["MF"],
-        "birth_year": 1969,
-    },
-    "Rolf-Landerl": {
-        "id": "d268a855",
-        "nationality": ["at"],
-        "position": ["FW", "MF"],
-        "birth_year": 1975,
-    },
-    "Denny-Landzaat": {
-        "id": "93600e39",
-        "nationality": ["nl"],
-        "position": ["MF"],
-        "birth_year": 1976,
-    },
-    "Michel-Langerak": {
-        "id": "783ce114",
-        "nationality": ["nl"],
-        "position": ["MF"],
-        "birth_year": 1968,
-    },
-    "Louis-Laros": {
-        "id": "e44b3907",
-        "nationality": ["nl"],
-        "position": ["MF"],
-        "birth_year": 1973,
-    },
-    "Bart-Latuheru": {
-        "id": "7cba0e91",
-        "nationality": ["nl"],
-        "position": ["MF"],
-        "birth_year": 1965,
-    },
-    "Garba-Lawal": {
-        "id": "baba8433",
-        "nationality": ["ng"],
-        "position": ["MF"],
-        "birth_year": 1974,
-    },
-    "Stephen-Laybutt": {
-        "id": "01daa1dd",
-        "nationality": ["au"],
-        "position": ["DF"],
-        "birth_year": 1977,
-    },
-    "Urvin-Lee": {
-        "id": "3b4e170a",
-        "nationality": ["nl"],
-        "position": ["DF"],
-        "birth_year": 1973,
-    },
-    "Jeffrey-Leiwakabessy": {
-        "id": "b5147c00",
-        "nationality": ["nl"],
-        "position": ["DF"],
-        "birth_year": 1981,
-    },
-    "Olaf-Lindenbergh": {
-        "id": "17c23934",
-        "nationality": ["nl"],
-        "position": ["MF"],
-        "birth_year": 1974,
-    },
-    "Bogdan-Lobon\u021b": {
-        "id": "ee5fc087",
-        "nationality": ["ro"],
-        "position": ["GK"],
-        "birth_year": 1978,
-    },
-    "John-van-Loenhout": {
-        "id": "b0febd38",
-        "nationality": ["nl"],
-        "position": ["MF"],
-        "birth_year": 1977,
-    },
-    "Erwin-van-de-Looi": {
-        "id": "5ef22a64",
-        "nationality": ["nl"],
-        "position": ["DF"],
-        "birth_year": 1972,
-    },
-    "Theo-Lucius": {
-        "id": "aeb264d0",
-        "nationality": ["nl"],
-        "position": ["DF", "MF"],
-        "birth_year": 1976,
-    },
-    "Mark-Luijpers": {
-        "id": "4e1ddbd0",
-        "nationality": ["nl"],
-        "position": ["DF"],
-        "birth_year": 1970,
-    },
-    "Ramon-Luijten": {
-        "id": "93913d02",
-        "nationality": ["nl"],
-        "position": ["MF"],
-        "birth_year": 1981,
-    },
-    "Anthony-Lurling": {
-        "id": "eeabb641",
-        "nationality": ["nl"],
-        "position": ["FW", "MF"],
-        "birth_year": 1977,
-    },
-    "Nikos-Machlas": {
-        "id": "bae5e837",
-        "nationality": ["gr"],
-        "position": ["FW", "MF"],
-        "birth_year": 1973,
-    },
-    "Luuk-Maes": {
-        "id": "0fd0f64e",
-        "nationality": ["nl"],
-        "position": ["DF"],
-        "birth_year": 1971,
-    },
-    "Miel-Mans": {
-        "id": "57cda150",
-        "nationality": ["nl"],
-        "position": ["MF"],
-        "birth_year": 1978,
-    },
-    "Bram-Marbus": {
-        "id": "5d9385d5",
-        "nationality": ["nl"],
-        "position": ["FW"],
-        "birth_year": 1972,
-    },
-    "Marilia": {
-        "id": "34dc91b8",
-        "nationality": ["br"],
-        "position": ["DF"],
-        "birth_year": 1975,
-    },
-    "Didier-Martel": {
-        "id": "5bad673e",
-        "nationality": ["fr"],
-        "position": ["FW", "MF"],
-        "birth_year": 1971,
-    },
-    "Joris-Mathijsen": {
-        "id": "5758c29f",
-        "nationality": ["nl"],
-        "position": ["DF"],
-        "birth_year": 1980,
-    },
-    "Paul-Matthijs": {
-        "id": "b56ff65c",
-        "nationality": ["nl"],
-        "position": ["MF"],
-        "birth_year": 1976,
-    },
-    "Billy-Maximiano": {
-        "id": "77566c10",
-        "nationality": ["nl"],
-        "position": ["MF"],
-        "birth_year": 1974,
-    },
-    "\u00c9mile-Mbamba": {
-        "id": "452614b1",
-        "nationality": ["cm"],
-        "position": ["FW"],
-        "birth_year": 1982,
-    },
-    "Martijn-Meerdink": {
-        "id": "2302298c",
-        "nationality": ["nl"],
-        "position": ["MF"],
-        "birth_year": 1976,
-    },
-    "Marcel-Meeuwis": {
-        "id": "37425618",
-        "nationality": ["nl"],
-        "position": ["MF"],
-        "birth_year": 1980,
-    },
-    "Kofi-Mensah": {
-        "id": "e2532e86",
-        "nationality": ["nl"],
-        "position": ["DF"],
-        "birth_year": 1978,
-    },
-    "Peter-Mentink": {
-        "id": "1c48c2cd",
-        "nationality": ["nl"],
-        "position": ["DF"],
-        "birth_year": 1978,
-    },
-    "Youssef-Meriana": {
-        "id": "5bb31f93",
-        "nationality": ["ma"],
-        "position": ["MF"],
-        "birth_year": 1974,
-    },
-    "Oscar-Moens": {
-        "id": "6a974cb6",
-        "nationality": ["nl"],
-        "position": ["GK"],
-        "birth_year": 1973,
-    },
-    "Rui-Monteiro": {
-        "id": "ffe2f5e5",
-        "nationality": ["nl"],
-        "position": ["MF"],
-        "birth_year": 1977,
-    },
-    "Riga-Mustapha": {
-        "id": "eb666286",
-        "nationality": ["nl"],
-        "position": ["FW", "MF"],
-        "birth_year": 1981,
-    },
-    "\u0218tefan-Nanu": {
-        "id": "940d6e0d",
-        "nationality": ["ro"],
-        "position": ["DF"],
-        "birth_year": 1968,
-    },
-    "David-Nascimento": {
-        "id": "ecf79bfa",
-        "nationality": ["cv"],
-        "position": ["DF"],
-        "birth_year": 1966,
-    },
-    "Robin-Nelisse": {
-        "id": "84ddb3ef",
-        "nationality": ["cw"],
-        "position": ["FW"],
-        "birth_year": 1978,
-    },
-    "Anders-Nielsen": {
-        "id": "b94d83d0",
-        "nationality": ["dk"],
-        "position": ["FW"],
-        "birth_year": 1972,
-    },
-    "John-Nieuwenburg": {
-        "id": "d55093bd",
-        "nationality": ["nl"],
-        "position": ["MF"],
-        "birth_year": 1978,
-    },
-    "J\u00f6rg-van-Nieuwenhuijzen": {
-        "id": "c74fd6ec",
-        "nationality": ["nl"],
-        "position": ["GK"],
-        "birth_year": 1978,
-    },
-    "Jos-van-Nieuwstadt": {
-        "id": "2770341c",
-        "nationality": ["nl"],
-        "position": ["DF"],
-        "birth_year": 1979,
-    },
-    "Yuriy-Nikiforov": {
-        "id": "792ed7fb",
-        "nationality": ["ru"],
-        "position": ["DF", "MF"],
-        "birth_year": 1970,
-    },
-    "Ruud-van-Nistelrooy": {
-        "id": "80a30989",
-        "nationality": ["nl"],
-        "position": ["FW"],
-        "birth_year": 1976,
-    },
-    "Michel-Nok": {
-        "id": "56732eb5",
-        "nationality": ["nl"],
-        "position": ["DF"],
-        "birth_year": 1971,
-    },
-    "Dennis-de-Nooijer": {
-        "id": "a4b31fa5",
-        "nationality": ["nl"],
-        "position": ["FW"],
-        "birth_year": 1969,
-    },
-    "G\u00e9rard-de-Nooijer": {
-        "id": "5f4e0819",
-        "nationality": ["nl"],
-        "position": ["DF"],
-        "birth_year": 1969,
-    },
-    "Mika-Nurmela": {
-        "id": "b0db8abc",
-        "nationality": ["fi"],
-        "position": ["MF"],
-        "birth_year": 1971,
-    },
-    "Emmanuel-Nwakire": {
-        "id": "7861d082",
-        "nationality": ["ng"],
-        "position": ["DF"],
-        "birth_year": 1978,
-    },
-    "Godfrey-Nwankpa": {
-        "id": "e142793e",
-        "nationality": ["ng"],
-        "position": ["MF"],
-        "birth_year": 1978,
-    },
-    "Marc-Nygaard": {
-        "id": "b38f8bd7",
-        "nationality": ["dk"],
-        "position": ["FW"],
-        "birth_year": 1976,
-    },
-    "John-O'Brien": {
-        "id": "78676d53",
-        "nationality": ["us"],
-        "position": ["DF", "MF"],
-        "birth_year": 1977,
-    },
-    "Azubuike-Oliseh": {
-        "id": "6e73b4b7",
-        "nationality": ["ng"],
-        "position": ["DF", "MF"],
-        "birth_year": 1978,
-    },
-    "S\u00e9rgio-Oliveira": {
-        "id": "a9a94ff4",
-        "nationality": ["br"],
-        "position": ["MF"],
-        "birth_year": 1981,
-    },
-    "Andr\u00e9-Ooijer": {
-        "id": "49fd46a1",
-        "nationality": ["nl"],
-        "position": ["DF"],
-        "birth_year": 1974,
-    },
-    "Barry-Opdam": {
-        "id": "b6e9b5d1",
-        "nationality": ["nl"],
-        "position": ["DF"],
-        "birth_year": 1976,
-    },
-    "Rahim-Ou\u00e9draogo": {
-        "id": "1f69f2d9",
-        "nationality": ["bf"],
-        "position": ["DF"],
-        "birth_year": 1980,
-    },
-    "Patrick-Paauwe": {
-        "id": "0839191a",
-        "nationality": ["nl"],
-        "position": ["DF", "MF"],
-        "birth_year": 1975,
-    },
-    "Jarom\u00edr-Paciorek": {
-        "id": "837fe795",
-        "nationality": ["cz"],
-        "position": ["MF"],
-        "birth_year": 1979,
-    },
-    "Boudewijn-Pahlplatz": {
-        "id": "7ba027ee",
-        "nationality": ["nl"],
-        "position": ["FW"],
-        "birth_year": 1971,
-    },
-    "Petri-Pasanen": {
-        "id": "e008862c",
-        "nationality": ["fi"],
-        "position": ["DF"],
-        "birth_year": 1980,
-    },
-    "Bob-Peeters": {
-        "id": "508fd046",
-        "nationality": ["be"],
-        "position": ["FW"],
-        "birth_year": 1974,
-    },
-    "Rob-Penders": {
-        "id": "27b39c2c",
-        "nationality": ["nl"],
-        "position": ["DF"],
-        "birth_year": 1975,
-    },
-    "Kenneth-P\u00e9rez": {
-        "id": "c193006d",
-        "nationality": ["dk"],
-        "position": ["FW", "MF"],
-        "birth_year": 1974,
-    },
-    "Yuri-Petrov": {
-        "id": "1d6f049e",
-        "nationality": ["ru"],
-        "position": ["FW"],
-        "birth_year": 1974,
-    },
-    "\u017deljko-Petrovi\u0107": {
-        "id": "eed2b3b7",
-        "nationality": ["rs"],
-        "position": ["DF", "MF"],
-        "birth_year": 1965,
-    },
-    "Mitchell-Piqu\u00e9": {
-        "id": "2d56fa5a",
-        "nationality": ["nl"],
-        "position": ["DF"],
-        "birth_year": 1979,
-    },
-    "Rafael-Pires-Vieira": {
-        "id": "09077c52",
-        "nationality": ["br"],
-        "position": ["FW"],
-        "birth_year": 1978,
-    },
-    "Sjaak-Polak": {
-        "id": "e8e30f52",
-        "nationality": ["nl"],
-        "position": ["DF"],
-        "birth_year": 1976,
-    },
-    "Stefan-Postma": {
-        "id": "4bdfdc32",
-        "nationality": ["nl"],
-        "position": ["GK"],
-        "birth_year": 1976,
-    },
-    "Patrick-Pothuizen": {
-        "id": "19a95af0",
-        "nationality": ["nl"],
-        "position": ["DF"],
-        "birth_year": 1972,
-    },
-    "Marino-Promes": {
-        "id": "3bf4cc08",
-        "nationality": ["nl"],
-        "position": ["FW"],
-        "birth_year": 1977,
-    },
-    "Geoffrey-Prommayon": {
-        "id": "dbcfdb16",
-        "nationality": ["nl"],
-        "position": ["DF"],
-        "birth_year": 1971,
-    },
-    "Peter-van-Putten": {
-        "id": "babed615",
-        "nationality": ["nl"],
-        "position": ["FW"],
-        "birth_year": 1982,
-    },
-    "Arkadiusz-Radomski": {
-        "id": "a069b505",
-        "nationality": ["pl"],
-        "position": ["MF"],
-        "birth_year": 1977,
-    },
-    "Adil-Ramzi": {
-        "id": "48316f9e",
-        "nationality": ["ma"],
-        "position": ["FW", "MF"],
-        "birth_year": 1977,
-    },
-    "Iwan-Redan": {
-        "id": "b45a5d49",
-        "nationality": ["nl"],
-        "position": ["FW"],
-        "birth_year": 1980,
-    },
-    "Eric-Redeker": {
-        "id": "7cccf123",
-        "nationality": ["nl"],
-        "position": ["DF"],
-        "birth_year": 1968,
-    },
-    "Ren\u00e9-van-Rijswijk": {
-        "id": "9cf9e82a",
-        "nationality": ["nl"],
-        "position": ["FW"],
-        "birth_year": 1971,
-    },
-    "Reinier-Robbemond": {
-        "id": "5bdaa15c",
-        "nationality": ["nl"],
-        "position": ["MF"],
-        "birth_year": 1972,
-    },
-    "Arjen-Robben": {
-        "id": "09586899",
-        "nationality": ["nl"],
-        "position": ["FW", "MF"],
-        "birth_year": 1984,
-    },
-    "Robert-Roest": {
-        "id": "d380a16e",
-        "nationality": ["nl"],
-        "position": ["DF"],
-        "birth_year": 1969,
-    },
-    "Hennie-de-Romijn": {
-        "id": "79acfc6e",
-        "nationality": ["nl"],
-        "position": ["DF"],
-        "birth_year": 1968,
-    },
-    "Dennis-Rommedahl": {
-        "id": "5cf3dd42",
-        "nationality": ["dk"],
-        "position": ["FW", "MF"],
-        "birth_year": 1978,
-    },
-    "Bas-Roorda": {
-        "id": "48547166",
-        "nationality": ["nl"],
-        "position": ["GK"],
-        "birth_year": 1973,
-    },
-    "Humphrey-Rudge": {
-        "id": "58666dca",
-        "nationality": ["nl"],
-        "position": ["DF"],
-        "birth_year": 1977,
-    },
-    "Tomasz-Rz\u0105sa": {
-        "id": "b2f8589e",
-        "nationality": ["pl"],
-        "position": ["DF"],
-        "birth_year": 1973,
-    },
-    "Glen-Salmon": {
-        "id": "de78f3a3",
-        "nationality": ["za"],
-        "position": ["FW"],
-        "birth_year": 1977,
-    },
-    "Radoslav-Samard\u017ei\u0107": {
-        "id": "679c167b",
-        "nationality": ["rs"],
-        "position": ["FW"],
-        "birth_year": 1970,
-    },
-    "Ousmane-Sanou": {
-        "id": "ea5331b2",
-        "nationality": ["bf"],
-        "position": ["FW"],
-        "birth_year": 1978,
-    },
-    "Mark-Schenning": {
-        "id": "1ce3d71e",
-        "nationality": ["nl"],
-        "position": ["DF"],
-        "birth_year": 1970,
-    },
-    "Melchior-Schoenmakers": {
-        "id": "c468d805",
-        "nationality": ["nl"],
-        "position": ["DF"],
-        "birth_year": 1975,
-    },
-    "Maarten-Schops": {
-        "id": "8962520c",
-        "nationality": ["be"],
-        "position": ["MF"],
-        "birth_year": 1976,
-    },
-    "Alfred-Schreuder": {
-        "id": "cd5ba841",
-        "nationality": ["nl"],
-        "position": ["MF"],
-        "birth_year": 1972,
-    },
-    "Dennis-Schulp": {
-        "id": "8a9ab426",
-        "nationality": ["nl"],
-        "position": ["FW"],
-        "birth_year": 1978,
-    },
-    "Marchanno-Schultz": {
-        "id": "54c9dc0d",
-        "nationality": ["nl"],
-        "position": ["MF"],
-        "birth_year": 1972,
-    },
-    "Alje-Schut": {
-        "id": "a5d6fc3b",
-        "nationality": ["nl"],
-        "position": ["DF"],
-        "birth_year": 1981,
-    },
-    "Chedric-Seedorf": {
-        "id": "0256410b",
-        "nationality": ["nl"],
-        "position": ["MF"],
-        "birth_year": 1983,
-    },
-    "Tarik-Sektioui": {
-        "id": "d9e70bab",
-        "nationality": ["ma"],
-        "position": ["FW", "MF"],
-        "birth_year": 1977,
-    },
-    "Ger-Senden": {
-        "id": "4c4d53a7",
-        "nationality": ["nl"],
-        "position": ["DF"],
-        "birth_year": 1971,
-    },
-    "Etienne-Shew-Atjon": {
-        "id": "8df94eb7",
-        "nationality": ["nl"],
-        "position": ["DF"],
-        "birth_year": 1974,
-    },
-    "Dmitri-Shoukov": {
-        "id": "bd074a2e",
-        "nationality": ["nl"],
-        "position": ["MF"],
-        "birth_year": 1975,
-    },
-    "Tom-Sier": {
-        "id": "3a7497c8",
-        "nationality": ["nl"],
-        "position": ["DF"],
-        "birth_year": 1970,
-    },
-    "Victor-Sikora": {
-        "id": "260d9b40",
-        "nationality": ["nl"],
-        "position": ["FW", "MF"],
-        "birth_year": 1978,
-    },
-    "David-Mendes-da-Silva": {
-        "id": "86fcd9bd",
-        "nationality": ["nl"],
-        "position": ["DF", "MF"],
-        "birth_year": 1982,
-    },
-    "Regillio-Simons": {
-        "id": "dcf67ff3",
-        "nationality": ["nl"],
-        "position": ["FW"],
-        "birth_year": 1973,
-    },
-    "Khalid-Sinouh": {
-        "id": "4c31a341",
-        "nationality": ["ma"],
-        "position": ["GK"],
-        "birth_year": 1975,
-    },
-    "Euzebiusz-Smolarek": {
-        "id": "cbb68ce7",
-        "nationality": ["pl"],
-        "position": ["FW", "MF"],
-        "birth_year": 1981,
-    },
-    "Tom-Soetaers": {
-        "id": "29ab2de2",
-        "nationality": ["be"],
-        "position": ["MF"],
-        "birth_year": 1980,
-    },
-    "Som\u00e1lia": {
-        "id": "268d852e",
-        "nationality": ["br"],
-        "position": ["FW"],
-        "birth_year": 1977,
-    },
-    "Fatih-Sonkaya": {
-        "id": "9a690348",
-        "nationality": ["tr"],
-        "position": ["DF"],
-        "birth_year": 1981,
-    },
-    "Edrissa-Sonko": {
-        "id": "9c3ad830",
-        "nationality": ["gm"],
-        "position": ["FW", "MF"],
-        "birth_year": 1980,
-    },
-    "Arno-Splinter": {
-        "id": "f32f8bbf",
-        "nationality": ["nl"],
-        "position": ["MF"],
-        "birth_year": 1977,
-    },
-    "S\u00e9bastien-Stassin": {
-        "id": "88b6f1c4",
-        "nationality": ["be"],
-        "position": ["DF"],
-        "birth_year": 1978,
-    },
-    "Dejan-Stefanovi\u0107": {
-        "id": "1efa2799",
-        "nationality": ["rs"],
-        "position": ["DF"],
-        "birth_year": 1974,
-    },
-    "Maurice-Steijn": {
-        "id": "6bffd31e",
-        "nationality": ["nl"],
-        "position": ["MF"],
-        "birth_year": 1973,
-    },
-    "Earnie-Stewart": {
-        "id": "b60d6516",
-        "nationality": ["us"],
-        "position": ["FW", "MF"],
-        "birth_year": 1969,
-    },
-    "Jeffrey-Talan": {
-        "id": "1401a6e2",
-        "nationality": ["nl"],
-        "position": ["FW", "MF"],
-        "birth_year": 1971,
-    },
-    "Stefaan-Tanghe": {
-        "id": "ad156f09",
-        "nationality": ["be"],
-        "position": ["MF"],
-        "birth_year": 1972,
-    },
-    "Massamasso-Tchangai": {
-        "id": "23e6aee9",
-        "nationality": ["tg"],
-        "position": ["DF"],
-        "birth_year": 1978,
-    },
-    "Bernard-Tchoutang": {
-        "id": "6ae6dafe",
-        "nationality": ["cm"],
-        "position": ["FW"],
-        "birth_year": 1976,
-    },
-    "Virgilio-Teixeira": {
-        "id": "eb0671d0",
-        "nationality": ["nl"],
-        "position": ["DF"],
-        "birth_year": 1973,
-    },
-    "Erik-ten-Hag": {
-        "id": "d705f471",
-        "nationality": ["nl"],
-        "position": ["DF", "MF"],
-        "birth_year": 1970,
-    },
-    "Henk-Timmer": {
-        "id": "1f43dcdd",
-        "nationality": ["nl"],
-        "position": ["GK"],
-        "birth_year": 1971,
-    },
-    "Tininho": {
-        "id": "f445b7cf",
-        "nationality": ["br"],
-        "position": ["DF", "MF"],
-        "birth_year": 1977,
-    },
-    "Igor-Toma\u0161i\u0107": {
-        "id": "1b011b53",
-        "nationality": ["bg"],
-        "position": ["DF"],
-        "birth_year": 1976,
-    },
-    "G\u00e1bor-Torma": {
-        "id": "580222c2",
-        "nationality": ["hu"],
-        "position": ["FW"],
-        "birth_year": 1976,
-    },
-    "Karim-Touzani": {
-        "id": "34f07923",
-        "nationality": ["nl"],
-        "position": ["MF"],
-        "birth_year": 1980,
-    },
-    "Orlando-Trustfull": {
-        "id": "b4b249e7",
-        "nationality": ["nl"],
-        "position": ["MF"],
-        "birth_year": 1970,
-    },
-    "Ignacio-Tuhuteru": {
-        "id": "a0be6ca8",
-        "nationality": ["nl"],
-        "position": ["MF"],
-        "birth_year": 1973,
-    },
-    "Zico-Tumba": {
-        "id": "32a1e360",
-        "nationality": ["cd"],
-        "position": ["FW"],
-        "birth_year": 1977,
-    },
-    "Rody-Turpijn": {
-        "id": "d3b4f9ea",
-        "nationality": ["nl"],
-        "position": ["FW", "MF"],
-        "birth_year": 1978,
-    },
-    "Ruslan-Valeyev": {
-        "id": "8b03a1ca",
-        "nationality": ["ua"],
-        "position": ["MF"],
-        "birth_year": 1981,
-    },
-    "Tom-Van-Mol": {
-        "id": "61745746",
-        "nationality": ["be"],
-        "position": ["DF", "MF"],
-        "birth_year": 1972,
-    },
-    "Sven-Vandenbroeck": {
-        "id": "612b2f01",
-        "nationality": ["be"],
-        "position": ["MF"],
-        "birth_year": 1979,
-    },
-    "Guy-Veldeman": {
-        "id": "fa9bb9e2",
-        "nationality": ["be"],
-        "position": ["DF"],
-        "birth_year": 1978,
-    },
-    "John-Veldman": {
-        "id": "3ce5cafb",
-        "nationality": ["nl"],
-        "position": ["DF"],
-        "birth_year": 1968,
-    },
-    "Ronny-Venema": {
-        "id": "12fce640",
-        "nationality": ["nl"],
-        "position": ["DF"],
-        "birth_year": 1974,
-    },
-    "Mark-Verhoeven": {
-        "id": "b2821fe7",
-        "nationality": ["nl"],
-        "position": ["DF"],
-        "birth_year": 1969,
-    },
-    "Jan-Verlinden": {
-        "id": "e18fb5b7",
-        "nationality": ["be"],
-        "position": ["DF"],
-        "birth_year": 1977,
-    },
-    "Ivan-Vicelich": {
-        "id": "4080e408",
-        "nationality": ["nz"],
-        "position": ["DF", "MF"],
-        "birth_year": 1976,
-    },
-    "Raymond-Victoria": {
-        "id": "5b6db4ac",
-        "nationality": ["cw"],
-        "position": ["DF", "MF"],
-        "birth_year": 1972,
-    },
-    "Ferdi-Vierklau": {
-        "id": "b9d4e312",
-        "nationality": ["nl"],
-        "position": ["DF"],
-        "birth_year": 1973,
-    },
-    "Eric-Viscaal": {
-        "id": "5679798b",
-        "nationality": ["nl"],
-        "position": ["FW"],
-        "birth_year": 1968,
-    },
-    "Hans-Visser": {
-        "id": "6bc3b2ba",
-        "nationality": ["nl"],
-        "position": ["MF"],
-        "birth_year": 1966,
-    },
-    "Jan-de-Visser": {
-        "id": "2ada99a1",
-        "nationality": ["nl"],
-        "position": ["MF"],
-        "birth_year": 1968,
-    },
-    "Ferry-van-Vliet": {
-        "id": "e65b8e04",
-        "nationality": ["nl"],
-        "position": ["MF"],
-        "birth_year": 1980,
-    },
-    "Johann-Vogel": {
-        "id": "6b002e31",
-        "nationality": ["ch"],
-        "position": ["MF"],
-        "birth_year": 1977,
-    },
-    "Joost-Volmer": {
-        "id": "aa8fc47b",
-        "nationality": ["nl"],
-        "position": ["DF"],
-        "birth_year": 1974,
-    },
-    "Hans-Vonk": {
-        "id": "2bac428d",
-        "nationality": ["za"],
-        "position": ["GK"],
-        "birth_year": 1970,
-    },
-    "Henk-Vos": {
-        "id": "e5b2b11a",
-        "nationality": ["nl"],
-        "position": ["FW"],
-        "birth_year": 1968,
-    },
-    "Peter-van-Vossen": {
-        "id": "2081c4c2",
-        "nationality": ["nl"],
-        "position": ["FW"],
-        "birth_year": 1968,
-    },
-    "Regillio-Vrede": {
-        "id": "74c135cb",
-        "nationality": ["nl"],
-        "position": ["DF"],
-        "birth_year": 1973,
-    },
-    "Jan-Vreman": {
-        "id": "eebb6a6d",
-        "nationality": ["nl"],
-        "position": ["DF"],
-        "birth_year": 1965,
-    },
-    "Stijn-Vreven": {
-        "id": "90caa103",
-        "nationality": ["be"],
-        "position": ["DF"],
-        "birth_year": 1973,
-    },
-    "Raymond-de-Waard": {
-        "id": "987884eb",
-        "nationality": ["nl"],
-        "position": ["MF"],
-        "birth_year": 1973,
-    },
-    "Wamberto": {
-        "id": "c778ce3f",
-        "nationality": ["br"],
-        "position": ["FW", "MF"],
-        "birth_year": 1974,
-    },
-    "Carlos-van-Wanrooy": {
-        "id": "8db751c8",
-        "nationality": ["nl"],
-        "position": ["DF"],
-        "birth_year": 1967,
-    },
-    "Harald-Wapenaar": {
-        "id": "0e3808e5",
-        "nationality": ["nl"],
-        "position": ["GK"],
-        "birth_year": 1970,
-    },
-    "Ronald-Waterreus": {
-        "id": "02be3da0",
-        "nationality": ["nl"],
-        "position": ["GK"],
-        "birth_year": 1970,
-    },
-    "Erik-Wegh": {
-        "id": "c59b007d",
-        "nationality": ["nl"],
-        "position": ["MF"],
-        "birth_year": 1980,
-    },
-    "Peter-Wijker": {
-        "id": "098d1f32",
-        "nationality": ["nl"],
-        "position": ["DF"],
-        "birth_year": 1971,
-    },
-    "Harvey-Wijngaarde": {
-        "id": "a93feaf9",
-        "nationality": ["nl"],
-        "position": ["DF"],
-        "birth_year": 1981,
-    },
-    "Aron-Winter": {
-        "id": "326f1a3d",
-        "nationality": ["nl"],
-        "position": ["MF"],
-        "birth_year": 1967,
-    },
-    "Peter-Wisgerhof": {
-        "id": "43507389",
-        "nationality": ["nl"],
-        "position": ["DF"],
-        "birth_year": 1979,
-    },
-    "Richard-Witschge": {
-        "id": "52374748",
-        "nationality": ["nl"],
-        "position": ["MF"],
-        "birth_year": 1969,
-    },
-    "Jannes-Wolters": {
-        "id": "0ee200e8",
-        "nationality": ["nl"],
-        "position": ["DF"],
-        "birth_year": 1979,
-    },
-    "Kees-van-Wonderen": {
-        "id": "dc5ec77a",
-        "nationality": ["nl"],
-        "position": ["DF"],
-        "birth_year": 1969,
-    },
-    "Abubakari-Yakubu": {
-        "id": "3e9ca090",
-        "nationality": ["gh"],
-        "position": ["MF"],
-        "birth_year": 1981,
-    },
-    "Dave-Zafarin": {
-        "id": "799dbf28",
-        "nationality": ["nl"],
-        "position": ["MF"],
-        "birth_year": 1978,
-    },
-    "Mark-Zegers": {
-        "id": "42a905bc",
-        "nationality": ["nl"],
-        "position": ["GK"],
-        "birth_year": 1977,
-    },
-    "Mari\u00e1n-Zeman": {
-        "id": "8ec96ca1",
-        "nationality": ["sk"],
-        "position": ["DF"],
-        "birth_year": 1974,
-    },
-    "Sieme-Zijm": {
-        "id": "4c5b9905",
-        "nationality": ["nl"],
-        "position": ["MF"],
-        "birth_year": 1978,
-    },
-    "Edwin-Zoetebier": {
-        "id": "4a8e82c9",
-        "nationality": ["nl"],
-        "position": ["GK"],
-        "birth_year": 1970,
-    },
-    "Peter-Zo\u00efs": {
-        "id": "36c07a57",
-        "nationality": ["au"],
-        "position": ["GK"],
-        "birth_year": 1978,
-    },
-    "Mamadou-Zongo": {
-        "id": "808ae663",
-        "nationality": ["bf"],
-        "position": ["FW"],
-        "birth_year": 1980,
-    },
-    "Mike-Zonneveld": {
-        "id": "38158383",
-        "nationality": ["nl"],
-        "position": ["DF", "MF"],
-        "birth_year": 1980,
-    },
-    "Patrick-Zwaanswijk": {
-        "id": "4207871a",
-        "nationality": ["nl"],
-        "position": ["DF"],
-        "birth_year": 1975,
-    },
-    "Ahmed-Kasoum": {"id": ""},
-    "Arno-Schaap": {"id": ""},
-    "Arnold-Nijkamp": {"id": ""},
-    "Erwin-van-der-Woerdt": {"id": ""},
-    "Ivo-Pfennings": {"id": ""},
-    "Jean-Becht": {"id": ""},
-    "Jeremy-Overbeek": {"id": ""},
-    "Jo-Geerinckx": {"id": ""},
-    "Martijn-Besselink": {"id": ""},
-    "Rick-Versteeg": {"id": ""},
-    "Roel-Janssen": {"id": ""},
-    "Samir-Ouindi": {"id": ""},
-    "Stefano-Ragusa": {"id": ""},
-    "Mohammad-Afash": {
-        "id": "c2c0284a",
-        "nationality": ["sy"],
-        "position": ["MF"],
-        "birth_year": 1966,
-    },
-    "Marios-Agathokleous": {
-        "id": "72799a89",
-        "nationality": ["cy"],
-        "position": ["FW"],
-        "birth_year": 1974,
-    },
-    "Alexis-Alexandris": {
-        "id": "e7a7627a",
-        "nationality": ["gr"],
-        "position": ["FW"],
-        "birth_year": 1968,
-    },
-    "Georgios-Alexopoulos": {
-        "id": "5e6ca451",
-        "nationality": ["gr"],
-        "position": ["DF"],
-        "birth_year": 1977,
-    },
-    "Alexis-Alexoudis": {
-        "id": "96e69e27",
-        "nationality": ["gr"],
-        "position": ["FW"],
-        "birth_year": 1972,
-    },
-    "Gabriel-\u00c1lvez": {
-        "id": "d77f3f8c",
-        "nationality": ["uy"],
-        "position": ["FW"],
-        "birth_year": 1974,
-    },
-    "Georgios-Amanatidis": {
-        "id": "4aeb54f0",
-        "nationality": ["gr"],
-        "position": ["DF"],
-        "birth_year": 1970,
-    },
-    "Koffi-Amponsah": {
-        "id": "07028b6c",
-        "nationality": ["gh"],
-        "position": ["DF"],
-        "birth_year": 1978,
-    },
-    "Ilias-Anastasakos": {
-        "id": "6e960172",
-        "nationality": ["gr"],
-        "position": ["FW"],
-        "birth_year": 1978,
-    },
-    "Georgios-Anatolakis": {
-        "id": "25904598",
-        "nationality": ["gr"],
-        "position": ["DF"],
-        "birth_year": 1974,
-    },
-    "Sotiris-Antoniou": {"id": "ba9f7769", "birth_year": 1975},
-    "Paraskevas-Antzas": {
-        "id": "b574870c",
-        "nationality": ["gr"],
-        "position": ["DF"],
-        "birth_year": 1976,
-    },
-    "Elias-Atmatsidis": {
-        "id": "08500c9d",
-        "nationality": ["gr"],
-        "position": ["GK"],
-        "birth_year": 1969,
-    },
-    "Ismail-Ba": {
-        "id": "a0466c39",
-        "nationality": ["sn"],
-        "position": ["MF"],
-        "birth_year": 1974,
-    },
-    "Josip-Ba\u010dak": {
-        "id": "412d641b",
-        "nationality": ["au"],
-        "position": ["MF"],
-        "birth_year": 1973,
-    },
-    "Panagiotis-Bachramis": {
-        "id": "0d6d4216",
-        "nationality": ["gr"],
-        "position": ["MF"],
-        "birth_year": 1976,
-    },
-    "Giorgos-Barkoglou": {
-        "id": "c5f3c08a",
-        "nationality": ["gr"],
-        "position": ["MF"],
-        "birth_year": 1978,
-    },
-    "Angelos-Basinas": {
-        "id": "0d9168da",
-        "nationality": ["gr"],
-        "position": ["MF"],
-        "birth_year": 1976,
-    },
-    "Makis-Belevonis": {
-        "id": "10edd0fb",
-        "nationality": ["gr"],
-        "position": ["DF", "MF"],
-        "birth_year": 1975,
-    },
-    "Alberto-Belsu\u00e9": {
-        "id": "c309aa2a",
-        "nationality": ["es"],
-        "position": ["DF"],
-        "birth_year": 1968,
-    },
-    "Houssine-Benali": {
-        "id": "ff148c1e",
-        "nationality": ["ma"],
-        "position": ["MF"],
-        "birth_year": 1969,
-    },
-    "Karim-Benkouar": {
-        "id": "2103abd9",
-        "nationality": ["ma"],
-        "position": ["FW"],
-        "birth_year": 1979,
-    },
-    "Emanuel-Bentil": {
-        "id": "405107c5",
-        "nationality": ["gh"],
-        "position": ["MF"],
-        "birth_year": 1978,
-    },
-    "Arjan-Beqaj": {
-        "id": "8fbd3916",
-        "nationality": ["al"],
-        "position": ["GK"],
-        "birth_year": 1975,
-    },
-    "Bira": {
-        "id": "d3eb6e27",
-        "nationality": ["br"],
-        "position": ["FW"],
-        "birth_year": 1969,
-    },
-    "Derek-Boateng": {
-        "id": "e9ef3a0d",
-        "nationality": ["gh"],
-        "position": ["MF"],
-        "birth_year": 1983,
-    },
-    "Vassilios-Borbokis": {
-        "id": "90c90788",
-        "nationality": ["gr"],
-        "position": ["DF"],
-        "birth_year": 1969,
-    },
-    "Milan-Bosanac": {
-        "id": "46b11e02",
-        "nationality": ["rs"],
-        "position": ["MF"],
-        "birth_year": 1974,
-    },
-    "Vidak-Brati\u0107": {
-        "id": "24dfc64e",
-        "nationality": ["rs"],
-        "position": ["DF"],
-        "birth_year": 1976,
-    },
-    "Craig-Brewster": {
-        "id": "c25c8328",
-        "nationality": ["sct"],
-        "position": ["FW"],
-        "birth_year": 1966,
-    },
-    "Juraj-Bu\u010dek": {
-        "id": "4dedea96",
-        "nationality": ["sk"],
-        "position": ["GK"],
-        "birth_year": 1973,
-    },
-    "Fangio-Buyse": {
-        "id": "74669343",
-        "nationality": ["be"],
-        "position": ["MF"],
-        "birth_year": 1974,
-    },
-    "Patricio-Camps": {
-        "id": "133f8feb",
-        "nationality": ["ar"],
-        "position": ["FW", "MF"],
-        "birth_year": 1972,
-    },
-    "Pablo-Cardozo": {
-        "id": "7748b7dd",
-        "nationality": ["ar"],
-        "position": ["FW"],
-        "birth_year": 1972,
-    },
-    "Nery-Castillo": {
-        "id": "bb34761d",
-        "nationality": ["mx"],
-        "position": ["DF", "FW"],
-        "birth_year": 1984,
-    },
-    "Kostas-Chalkias": {
-        "id": "8c36086c",
-        "nationality": ["gr"],
-        "position": ["GK"],
-        "birth_year": 1974,
-    },
-    "Kostas-Chaniotakis": {
-        "id": "dd652f78",
-        "nationality": ["gr"],
-        "position": ["GK"],
-        "birth_year": 1968,
-    },
-    "Angelos-Charisteas": {
-        "id": "676f422b",
-        "nationality": ["gr"],
-        "position": ["FW"],
-        "birth_year": 1980,
-    },
-    "Dionysis-Chasiotis": {
-        "id": "be9033e5",
-        "nationality": ["gr"],
-        "position": ["DF", "MF"],
-        "birth_year": 1975,
-    },
-    "Dionisis-Chiotis": {
-        "id": "5b6bb6c2",
-        "nationality": ["gr"],
-        "position": ["GK"],
-        "birth_year": 1977,
-    },
-    "Lampros-Choutos": {
-        "id": "0a296ab6",
-        "nationality": ["gr"],
-        "position": ["FW", "MF"],
-        "birth_year": 1979,
-    },
-    "Marios-Christodoulou": {
-        "id": "7d8a7d3c",
-        "nationality": ["cy"],
-        "position": ["MF"],
-        "birth_year": 1974,
-    },
-    "Maur\u00edcio-Copertino": {
-        "id": "a6a34ddd",
-        "nationality": ["br"],
-        "position": ["DF"],
-        "birth_year": 1970,
-    },
-    "Ante-Covic": {
-        "id": "dfe32e59",
-        "nationality": ["au"],
-        "position": ["GK", "MF"],
-        "birth_year": 1975,
-    },
-    "Luis-Curbelo": {"id": "5d34aaae", "nationality": ["uy"], "birth_year": 1972},
-    "Bill-Damianos": {
-        "id": "b97595d0",
-        "nationality": ["au"],
-        "position": ["MF"],
-        "birth_year": 1977,
-    },
-    "Luis-Dar\u00edo-Calvo": {
-        "id": "ea0fabd1",
-        "nationality": ["ar"],
-        "position": ["FW", "MF"],
-        "birth_year": 1977,
-    },
-    "James-Debbah": {
-        "id": "f51b5fa7",
-        "nationality": ["lr"],
-        "position": ["FW"],
-        "birth_year": 1969,
-    },
-    "Dar\u00edo-Delgado": {
-        "id": "35d37a0d",
-        "nationality": ["uy"],
-        "position": ["MF"],
-        "birth_year": 1969,
-    },
-    "Traianos-Dellas": {
-        "id": "cefe8bcf",
-        "nationality": ["gr"],
-        "position": ["DF"],
-        "birth_year": 1976,
-    },
-    "Manolis-Dermitzakis": {
-        "id": "11c69242",
-        "nationality": ["gr"],
-        "position": ["DF"],
-        "birth_year": 1976,
-    },
-    "Angelos-Digozis": {
-        "id": "41f527a2",
-        "nationality": ["gr"],
-        "position": ["MF"],
-        "birth_year": 1974,
-    },
-    "Ousmane-Diop": {
-        "id": "b0520ece",
-        "nationality": ["sn"],
-        "position": ["DF"],
-        "birth_year": 1975,
-    },
-    "Diyan-Donchev": {
-        "id": "fc497b70",
-        "nationality": ["bg"],
-        "position": ["DF"],
-        "birth_year": 1974,
-    },
-    "Panagiotis-Drougas": {
-        "id": "51368be6",
-        "nationality": ["gr"],
-        "position": ["DF"],
-        "birth_year": 1974,
-    },
-    "Daniel-Edusei": {
-        "id": "c6be24b2",
-        "nationality": ["gh"],
-        "position": ["DF"],
-        "birth_year": 1980,
-    },
-    "\u00c9lder": {
-        "id": "ae258c87",
-        "nationality": ["br"],
-        "position": ["MF"],
-        "birth_year": 1976,
-    },
-    "Dimitrios-Eleftheropoulos": {
-        "id": "2a224b36",
-        "nationality": ["gr"],
-        "position": ["GK"],
-        "birth_year": 1976,
-    },
-    "Z\u00e9-Elias": {
-        "id": "f9fca7f0",
-        "nationality": ["br"],
-        "position": ["MF"],
-        "birth_year": 1976,
-    },
-    "Panayiotis-Engomitis": {
-        "id": "d0a9cccf",
-        "nationality": ["cy"],
-        "position": ["MF"],
-        "birth_year": 1972,
-    },
-    "Jo\u00ebl-Epalle": {
-        "id": "f62702a1",
-        "nationality": ["cm"],
-        "position": ["FW", "MF"],
-        "birth_year": 1978,
-    },
-    "Guy-Feutchine": {
-        "id": "78a30a5b",
-        "nationality": ["cm"],
-        "position": ["MF"],
-        "birth_year": 1976,
-    },
-    "Ederson-Fofonka": {
-        "id": "c09b392a",
-        "nationality": ["br"],
-        "position": ["FW"],
-        "birth_year": 1974,
-    },
-    "Kostas-Frantzeskos": {
-        "id": "494be826",
-        "nationality": ["gr"],
-        "position": ["MF"],
-        "birth_year": 1969,
-    },
-    "Nikolaos-Frousos": {
-        "id": "d7a9b954",
-        "nationality": ["gr"],
-        "position": ["FW"],
-        "birth_year": 1974,
-    },
-    "Takis-Fyssas": {
-        "id": "87964c0a",
-        "nationality": ["gr"],
-        "position": ["DF"],
-        "birth_year": 1973,
-    },
-    "Herbert-Gager": {
-        "id": "943b387b",
-        "nationality": ["at"],
-        "position": ["DF"],
-        "birth_year": 1969,
-    },
-    "Aris-Galanopoulos": {
-        "id": "7ed72740",
-        "nationality": ["gr"],
-        "position": ["DF"],
-        "birth_year": 1981,
-    },
-    "Fernando-Galetto": {
-        "id": "3e0b7794",
-        "nationality": ["ar"],
-        "position": ["MF"],
-        "birth_year": 1971,
-    },
-    "\u017deljko-Gavrilovi\u0107": {
-        "id": "ac1d4916",
-        "nationality": ["ba"],
-        "position": ["DF", "MF"],
-        "birth_year": 1971,
-    },
-    "Dimitrios-Geladaris": {
-        "id": "455dea90",
-        "nationality": ["gr"],
-        "position": ["DF"],
-        "birth_year": 1974,
-    },
-    "Grigoris-Georgatos": {
-        "id": "35dfe297",
-        "nationality": ["gr"],
-        "position": ["DF", "MF"],
-        "birth_year": 1972,
-    },
-    "Nikolaos-Georgeas": {
-        "id": "800ae789",
-        "nationality": ["gr"],
-        "position": ["DF", "MF"],
-        "birth_year": 1976,
-    },
-    "Georgios-Georgiadis": {
-        "id": "56932414",
-        "nationality": ["gr"],
-        "position": ["DF", "MF"],
-        "birth_year": 1972,
-    },
-    "Angelos-Georgiou": {
-        "id": "066b5ddf",
-        "nationality": ["gr"],
-        "position": ["GK"],
-        "birth_year": 1974,
-    },
-    "Stelios-Giannakopoulos": {
-        "id": "29a5f7d3",
-        "nationality": ["gr"],
-        "position": ["FW", "MF"],
-        "birth_year": 1974,
-    },
-    "Panagiotis-Giannopoulos": {
-        "id": "e34e04d2",
-        "nationality": ["gr"],
-        "position": ["DF"],
-        "birth_year": 1972,
-    },
-    "Giovanni": {
-        "id": "fecb9b7c",
-        "nationality": ["br"],
-        "position": ["FW", "MF"],
-        "birth_year": 1972,
-    },
-    "Xenofon-Gittas": {
-        "id": "bf325c2a",
-        "nationality": ["gr"],
-        "position": ["MF"],
-        "birth_year": 1979,
-    },
-    "Spyros-Gogolos": {
-        "id": "dd675bd2",
-        "nationality": ["gr"],
-        "position": ["DF"],
-        "birth_year": 1978,
-    },
-    "Jovan-Gojkovi\u0107": {
-        "id": "2594e35b",
-        "nationality": ["rs"],
-        "position": ["MF"],
-        "birth_year": 1975,
-    },
-    "R\u00f3nald-G\u00f3mez": {
-        "id": "10fed165",
-        "nationality": ["cr"],
-        "position": ["FW"],
-        "birth_year": 1975,
-    },
-    "Takis-Gonias": {
-        "id": "50d30c87",
-        "nationality": ["gr"],
-        "position": ["MF"],
-        "birth_year": 1971,
-    },
-    "Michal-Gottwald": {
-        "id": "6f7a9c11",
-        "nationality": ["sk"],
-        "position": ["FW"],
-        "birth_year": 1981,
-    },
-    "Giannis-Goumas": {
-        "id": "70667566",
-        "nationality": ["gr"],
-        "position": ["DF"],
-        "birth_year": 1975,
-    },
-    "Fanouris-Goundoulakis": {
-        "id": "17a38ef7",
-        "nationality": ["gr"],
-        "position": ["MF"],
-        "birth_year": 1983,
-    },
-    "Ariel-Grana": {
-        "id": "c97dafaf",
-        "nationality": ["ar"],
-        "position": ["DF"],
-        "birth_year": 1976,
-    },
-    "Ebenezer-Hagan": {
-        "id": "fe3a8b57",
-        "nationality": ["gh"],
-        "position": ["MF"],
-        "birth_year": 1975,
-    },
-    "Trond-Haugland": {
-        "id": "554ba7aa",
-        "nationality": ["no"],
-        "position": ["DF"],
-        "birth_year": 1976,
-    },
-    "Altin-Haxhi": {
-        "id": "8b8ff130",
-        "nationality": ["al"],
-        "position": ["DF", "MF"],
-        "birth_year": 1975,
-    },
-    "Ren\u00e9-Henriksen": {
-        "id": "3936c2b0",
-        "nationality": ["dk"],
-        "position": ["DF"],
-        "birth_year": 1969,
-    },
-    "Dimitris-Ioannou": {"id": ""},
-    "Nikos-Iordanidis": {
-        "id": "8278bd1f",
-        "nationality": ["gr"],
-        "position": ["FW"],
-        "birth_year": 1980,
-    },
-    "Ilija-Ivi\u0107": {
-        "id": "8c3073a2",
-        "nationality": ["rs"],
-        "position": ["FW"],
-        "birth_year": 1971,
-    },
-    "Vladim\u00edr-Jano\u010dko": {
-        "id": "c68e9a68",
-        "nationality": ["sk"],
-        "position": ["MF"],
-        "birth_year": 1976,
-    },
-    "Du\u0161an-Jovanovi\u0107": {
-        "id": "64d4e64a",
-        "nationality": ["rs"],
-        "position": ["FW"],
-        "birth_year": 1971,
-    },
-    "Sa\u0161a-Jovanovi\u0107": {
-        "id": "35e70460",
-        "nationality": ["rs"],
-        "position": ["FW"],
-        "birth_year": 1974,
-    },
-    "Pantelis-Kafes": {
-        "id": "190cde49",
-        "nationality": ["gr"],
-        "position": ["FW", "MF"],
-        "birth_year": 1978,
-    },
-    "Christos-Kalantzis": {
-        "id": "76f7da9d",
-        "nationality": ["gr"],
-        "position": ["FW"],
-        "birth_year": 1982,
-    },
-    "Ioannis-Kalitzakis": {
-        "id": "b2e940ba",
-        "nationality": ["gr"],
-        "position": ["DF"],
-        "birth_year": 1966,
-    },
-    "Vaggelis-Kaounos": {
-        "id": "ffa39533",
-        "nationality": ["gr"],
-        "position": ["FW"],
-        "birth_year": 1977,
-    },
-    "Stathis-Kappos": {
-        "id": "4c85c020",
-        "nationality": ["ca"],
-        "position": ["DF"],
-        "birth_year": 1979,
-    },
-    "Michalis-Kapsis": {
-        "id": "6f2542ad",
-        "nationality": ["gr"],
-        "position": ["DF"],
-        "birth_year": 1973,
-    },
-    "Loukas-Karadimos": {
-        "id": "bf702f39",
-        "nationality": ["gr"],
-        "position": ["MF"],
-        "birth_year": 1974,
-    },
-    "Vaios-Karagiannis": {
-        "id": "17f2b274",
-        "nationality": ["gr"],
-        "position": ["DF"],
-        "birth_year": 1968,
-    },
-    "Giorgos-Karagounis": {
-        "id": "ed2192d0",
-        "nationality": ["gr"],
-        "position": ["MF"],
-        "birth_year": 1977,
-    },
-    "Kyriakos-Karataidis": {
-        "id": "4c10bba4",
-        "nationality": ["gr"],
-        "position": ["DF"],
-        "birth_year": 1965,
-    },
-    "Michalis-Kasapis": {
-        "id": "13b76237",
-        "nationality": ["gr"],
-        "position": ["DF"],
-        "birth_year": 1971,
-    },
-    "Fanis-Katergiannakis": {
-        "id": "517134d0",
-        "nationality": ["gr"],
-        "position": ["GK"],
-        "birth_year": 1974,
-    },
-    "Anastasios-Katsabis": {
-        "id": "c725cad3",
-        "nationality": ["gr"],
-        "position": ["DF"],
-        "birth_year": 1973,
-    },
-    "Evripidis-Katsavos": {
-        "id": "d46ac4ed",
-        "nationality": ["gr"],
-        "position": ["MF"],
-        "birth_year": 1973,
-    },
-    "Panagiotis-Katsiaros": {
-        "id": "f7353c4d",
-        "nationality": ["gr"],
-        "position": ["DF"],
-        "birth_year": 1978,
-    },
-    "Kostas-Katsouranis": {
-        "id": "46ee1669",
-        "nationality": ["gr"],
-        "position": ["DF", "MF"],
-        "birth_year": 1979,
-    },
-    "Orhan-Kaynak": {
-        "id": "6b7edaae",
-        "nationality": ["tr"],
-        "position": ["FW"],
-        "birth_year": 1970,
-    },
-    "Levan-Kebadze": {
-        "id": "5502a4ba",
-        "nationality": ["ge"],
-        "position": ["FW"],
-        "birth_year": 1975,
-    },
-    "Nikos-Kehagias": {
-        "id": "4925b5e9",
-        "nationality": ["gr"],
-        "position": ["DF"],
-        "birth_year": 1969,
-    },
-    "Kostas-Kiassos": {
-        "id": "2bddd706",
-        "nationality": ["gr"],
-        "position": ["MF"],
-        "birth_year": 1975,
-    },
-    "Paulinho-Kobayashi": {
-        "id": "82604c5f",
-        "nationality": ["br"],
-        "position": ["FW"],
-        "birth_year": 1970,
-    },
-    "Bledar-Kola": {
-        "id": "45516fa6",
-        "nationality": ["al"],
-        "position": ["MF"],
-        "birth_year": 1972,
-    },
-    "Thanasis-Kolitsidakis": {
-        "id": "131f71d4",
-        "nationality": ["gr"],
-        "position": ["DF"],
-        "birth_year": 1966,
-    },
-    "Giorgos-Koltsidas": {
-        "id": "22e5ef06",
-        "nationality": ["gr"],
-        "position": ["DF"],
-        "birth_year": 1970,
-    },
-    "Giorgos-Koltzos": {"id": ""},
-    "Pantelis-Konstantinidis": {
-        "id": "21b6e8c7",
-        "nationality": ["gr"],
-        "position": ["DF", "FW"],
-        "birth_year": 1975,
-    },
-    "Sotiris-Konstantinidis": {
-        "id": "e350cd32",
-        "nationality": ["gr"],
-        "position": ["FW"],
-        "birth_year": 1977,
-    },
-    "Michalis-Konstantinou": {
-        "id": "856b3752",
-        "nationality": ["cy"],
-        "position": ["FW"],
-        "birth_year": 1978,
-    },
-    "Christos-Kontis": {
-        "id": "fc37944a",
-        "nationality": ["gr"],
-        "position": ["DF"],
-        "birth_year": 1975,
-    },
-    "Charis-Kopitsis": {
-        "id": "41900f8f",
-        "nationality": ["gr"],
-        "position": ["DF"],
-        "birth_year": 1969,
-    },
-    "Panagiotis-Kordonouris": {
-        "id": "693ad99b",
-        "nationality": ["gr"],
-        "position": ["DF"],
-        "birth_year": 1975,
-    },
-    "Nikos-Kostenoglou": {
-        "id": "f42ba6d5",
-        "nationality": ["gr"],
-        "position": ["DF"],
-        "birth_year": 1970,
-    },
-    "Christos-Kostis": {
-        "id": "5dc66ece",
-        "nationality": ["gr"],
-        "position": ["FW"],
-        "birth_year": 1972,
-    },
-    "Athanasios-Kostoulas": {
-        "id": "af063ae7",
-        "nationality": ["gr"],
-        "position": ["DF"],
-        "birth_year": 1976,
-    },
-    "Ilias-Kotsios": {
-        "id": "48770003",
-        "nationality": ["gr"],
-        "position": ["DF"],
-        "birth_year": 1977,
-    },
-    "Stefanos-Kotsolis": {
-        "id": "9f29042b",
-        "nationality": ["gr"],
-        "position": ["GK"],
-        "birth_year": 1979,
-    },
-    "Georgios-Koulakiotis": {
-        "id": "fd76f0e4",
-        "nationality": ["gr"],
-        "position": ["DF"],
-        "birth_year": 1977,
-    },
-    "Giorgos-Koutsis": {
-        "id": "c208970e",
-        "nationality": ["gr"],
-        "position": ["MF"],
-        "birth_year": 1973,
-    },
-    "Vaggelis-Koutsoures": {
-        "id": "49f6c2e3",
-        "nationality": ["gr"],
-        "position": ["MF"],
-        "birth_year": 1975,
-    },
-    "Thomas-Kyparissis": {
-        "id": "3d5b1ae8",
-        "nationality": ["gr"],
-        "position": ["FW"],
-        "birth_year": 1970,
-    },
-    "Georgios-Kyriazis": {
-        "id": "07622ca2",
-        "nationality": ["gr"],
-        "position": ["DF"],
-        "birth_year": 1980,
-    },
-    "Nikos-Kyzeridis": {
-        "id": "529a4f0b",
-        "nationality": ["gr"],
-        "position": ["FW", "MF"],
-        "birth_year": 1971,
-    },
-    "Vasilis-Lakis": {
-        "id": "b0517083",
-        "nationality": ["gr"],
-        "position": ["FW", "MF"],
-        "birth_year": 1976,
-    },
-    "Marcelo-Leopaldi": {
-        "id": "a9c3387d",
-        "nationality": ["ar"],
-        "position": ["MF"],
-        "birth_year": 1972,
-    },
-    "Peter-L\u00e9rant": {
-        "id": "1677579a",
-        "nationality": ["sk"],
-        "position": ["DF"],
-        "birth_year": 1977,
-    },
-    "Nikos-Liberopoulos": {
-        "id": "2c9b4baa",
-        "nationality": ["gr"],
-        "position": ["FW", "MF"],
-        "birth_year": 1975,
-    },
-    "Sotiris-Liberopoulos": {
-        "id": "b18af81b",
-        "nationality": ["gr"],
-        "position": ["GK"],
-        "birth_year": 1977,
-    },
-    "Apostolos-Liolidis": {
-        "id": "ba3b418a",
-        "nationality": ["gr"],
-        "position": ["FW"],
-        "birth_year": 1977,
-    },
-    "Giannis-Liourdis": {
-        "id": "ec4b91fe",
-        "nationality": ["gr"],
-        "position": ["GK"],
-        "birth_year": 1979,
-    },
-    "Marcelo-Lipat\u00edn": {
-        "id": "a541d06a",
-        "nationality": ["uy"],
-        "position": ["FW"],
-        "birth_year": 1977,
-    },
-    "Kostas-Louboutis": {
-        "id": "9d3f5895",
-        "nationality": ["gr"],
-        "position": ["DF"],
-        "birth_year": 1979,
-    },
-    "Triantafyllos-Machairidis": {
-        "id": "5c5c9684",
-        "nationality": ["gr"],
-        "position": ["MF"],
-        "birth_year": 1973,
-    },
-    "Jens-Madsen": {
-        "id": "051f0862",
-        "nationality": ["dk"],
-        "position": ["MF"],
-        "birth_year": 1970,
-    },
-    "Christos-Maladenis": {
-        "id": "96aa112d",
-        "nationality": ["gr"],
-        "position": ["MF"],
-        "birth_year": 1974,
-    },
-    "Giannis-Mallous": {
-        "id": "401f3a7a",
-        "nationality": ["gr"],
-        "position": ["DF"],
-        "birth_year": 1974,
-    },
-    "Mart\u00edn-Mandra": {
-        "id": "6c56fb83",
-        "nationality": ["ar"],
-        "position": ["FW"],
-        "birth_year": 1975,
-    },
-    "Apostolos-Mantzios": {
-        "id": "6f27f2a9",
-        "nationality": ["gr"],
-        "position": ["DF"],
-        "birth_year": 1969,
-    },
-    "Dimitris-Markos": {
-        "id": "cadb41fb",
-        "nationality": ["gr"],
-        "position": ["MF"],
-        "birth_year": 1971,
-    },
-    "Dimitris-Mavrogenidis": {
-        "id": "66ecfbc2",
-        "nationality": ["gr"],
-        "position": ["DF"],
-        "birth_year": 1976,
-    },
-    "Hern\u00e1n-Medina": {
-        "id": "8624ae1f",
-        "nationality": ["ar"],
-        "position": ["MF"],
-        "birth_year": 1974,
-    },
-    "Chrisostomos-Michailidis": {
-        "id": "4f14b414",
-        "nationality": ["gr"],
-        "position": ["GK"],
-        "birth_year": 1975,
-    },
-    "Christos-Mikes": {
-        "id": "62d452f6",
-        "nationality": ["gr"],
-        "position": ["DF"],
-        "birth_year": 1971,
-    },
-    "Vladan-Milojevi\u0107": {
-        "id": "f62d44d4",
-        "nationality": ["rs"],
-        "position": ["DF"],
-        "birth_year": 1970,
-    },
-    "Serge-Mimpo": {
-        "id": "5fe8f01f",
-        "nationality": ["cm"],
-        "position": ["DF", "MF"],
-        "birth_year": 1974,
-    },
-    "Xenophontas-Moschogiannis": {
-        "id": "7c513b73",
-        "nationality": ["gr"],
-        "position": ["DF"],
-        "birth_year": 1977,
-    },
-    "Dar\u00edo-Muchotrigo": {
-        "id": "bd1e4e5d",
-        "nationality": ["pe"],
-        "position": ["FW"],
-        "birth_year": 1970,
-    },
-    "Joe-Nagbe": {
-        "id": "39881cd1",
-        "nationality": ["lr"],
-        "position": ["MF"],
-        "birth_year": 1968,
-    },
-    "Kennedy-Nagoli": {
-        "id": "9b98b213",
-        "nationality": ["zw"],
-        "position": ["MF"],
-        "birth_year": 1973,
-    },
-    "Dimitris-Nalitzis": {
-        "id": "3964cede",
-        "nationality": ["gr"],
-        "position": ["FW"],
-        "birth_year": 1976,
-    },
-    "Giorgios-Nasiopoulos": {
-        "id": "efa0b4cc",
-        "nationality": ["gr"],
-        "position": ["FW"],
-        "birth_year": 1973,
-    },
-    "Vaggelis-Nastos": {
-        "id": "f929aced",
-        "nationality": ["gr"],
-        "position": ["DF"],
-        "birth_year": 1980,
-    },
-    "Fernando-Navas": {
-        "id": "7344ef40",
-        "nationality": ["ar"],
-        "position": ["MF"],
-        "birth_year": 1977,
-    },
-    "Konstantinos-Nebegleras": {
-        "id": "8628ec73",
-        "nationality": ["gr"],
-        "position": ["MF"],
-        "birth_year": 1975,
-    },
-    "Ivan-Nedeljkovi\u0107": {
-        "id": "1eadc8a1",
-        "nationality": ["rs"],
-        "position": ["FW"],
-        "birth_year": 1978,
-    },
-    "Robert-Niestroj": {
-        "id": "1cb127eb",
-        "nationality": ["de"],
-        "position": ["MF"],
-        "birth_year": 1976,
-    },
-    "Demis-Nikolaidis": {
-        "id": "7bb7562d",
-        "nationality": ["gr"],
-        "position": ["FW"],
-        "birth_year": 1973,
-    },
-    "Theofilaktos-Nikolaidis": {
-        "id": "b9a1d177",
-        "nationality": ["gr"],
-        "position": ["MF"],
-        "birth_year": 1973,
-    },
-    "Antonios-Nikopolidis": {
-        "id": "0f67f4bb",
-        "nationality": ["gr"],
-        "position": ["GK"],
-        "birth_year": 1971,
-    },
-    "Andreas-Niniadis": {
-        "id": "10efc1c4",
-        "nationality": ["gr"],
-        "position": ["DF", "MF"],
-        "birth_year": 1971,
-    },
-    "Nikos-Nioplias": {
-        "id": "acc25a26",
-        "nationality": ["gr"],
-        "position": ["MF"],
-        "birth_year": 1965,
-    },
-    "Peter-Ofori-Quaye": {
-        "id": "d56450fa",
-        "nationality": ["gh"],
-        "position": ["FW"],
-        "birth_year": 1980,
-    },
-    "Ioannis-Okkas": {
-        "id": "a2d9544d",
-        "nationality": ["cy"],
-        "position": ["FW"],
-        "birth_year": 1977,
-    },
-    "Emmanuel-Olisadebe": {
-        "id": "abb6edb2",
-        "nationality": ["pl"],
-        "position": ["FW"],
-        "birth_year": 1978,
-    },
-    "Percy-Olivares": {
-        "id": "34a81c89",
-        "nationality": ["pe"],
-        "position": ["DF", "MF"],
-        "birth_year": 1968,
-    },
-    "Dimitrios-Orfanos": {
-        "id": "dcad19f7",
-        "nationality": ["gr"],
-        "position": ["MF"],
-        "birth_year": 1982,
-    },
-    "Marinos-Ouzounidis": {
-        "id": "eb6a65d4",
-        "nationality": ["gr"],
-        "position": ["DF"],
-        "birth_year": 1968,
-    },
-    "Theodoros-Pahatouridis": {
-        "id": "1482beae",
-        "nationality": ["gr"],
-        "position": ["DF"],
-        "birth_year": 1967,
-    },
-    "Giannis-Papadimitriou": {
-        "id": "d21774ed",
-        "nationality": ["gr"],
-        "position": ["DF"],
-        "birth_year": 1976,
-    },
-    "Nikos-Papadopoulos": {"id": ""},
-    "Giorgos-Papandreou": {
-        "id": "36799657",
-        "nationality": ["gr"],
-        "position": ["FW"],
-        "birth_year": 1969,
-    },
-    "Petros-Passalis": {
-        "id": "a965df49",
-        "nationality": ["gr"],
-        "position": ["MF"],
-        "birth_year": 1974,
-    },
-    "Christos-Patsatzoglou": {
-        "id": "9d47a152",
-        "nationality": ["gr"],
-        "position": ["DF", "MF"],
-        "birth_year": 1979,
-    },
-    "Milan-Pavlovi\u0107": {
-        "id": "38f794ef",
-        "nationality": ["yu"],
-        "position": ["DF"],
-        "birth_year": 1970,
-    },
-    "Sr\u0111an-Pecelj": {
-        "id": "5d1c4e96",
-        "nationality": ["ba"],
-        "position": ["DF"],
-        "birth_year": 1975,
-    },
-    "Milen-Petkov": {
-        "id": "01b9651c",
-        "nationality": ["bg"],
-        "position": ["MF"],
-        "birth_year": 1974,
-    },
-    "Sokratis-Petrou": {
-        "id": "aa55e34e",
-        "nationality": ["gr"],
-        "position": ["MF"],
-        "birth_year": 1979,
-    },
-    "Karlheinz-Pflipsen": {
-        "id": "f80cd8e8",
-        "nationality": ["de"],
-        "position": ["MF"],
-        "birth_year": 1970,
-    },
-    "Rub\u00e9n-Piaggio": {
-        "id": "67367c62",
-        "nationality": ["ar"],
-        "position": ["MF"],
-        "birth_year": 1970,
-    },
-    "Leszek-Pisz": {
-        "id": "9a57d37b",
-        "nationality": ["pl"],
-        "position": ["MF"],
-        "birth_year": 1966,
-    },
-    "Minas-Pitsos": {
-        "id": "f55e4a05",
-        "nationality": ["gr"],
-        "position": ["DF"],
-        "birth_year": 1980,
-    },
-    "Georgios-Poulopoulos": {
-        "id": "5abfa562",
-        "nationality": ["gr"],
-        "position": ["DF"],
-        "birth_year": 1975,
-    },
-    "Vangelis-Pourliotopoulos": {
-        "id": "c25f349c",
-        "nationality": ["gr"],
-        "position": ["GK"],
-        "birth_year": 1969,
-    },
-    "Savvas-Poursaitidis": {
-        "id": "b3f1671d",
-        "nationality": ["cy"],
-        "position": ["DF", "MF"],
-        "birth_year": 1976,
-    },
-    "Ilias-Poursanidis": {
-        "id": "6f6d2cc2",
-        "nationality": ["gr"],
-        "position": ["DF", "MF"],
-        "birth_year": 1972,
-    },
-    "Antoine-Pr\u00e9get": {
-        "id": "eda1ae9d",
-        "nationality": ["fr"],
-        "position": ["MF"],
-        "birth_year": 1972,
-    },
-    "Athanassios-Prittas": {
-        "id": "5530a386",
-        "nationality": ["gr"],
-        "position": ["MF"],
-        "birth_year": 1979,
-    },
-    "Alain-Raguel": {
-        "id": "81e8c9b8",
-        "nationality": ["fr"],
-        "position": ["MF"],
-        "birth_year": 1976,
-    },
-    "Guillermo-Ram\u00edrez": {
-        "id": "23de758d",
-        "nationality": ["gt"],
-        "position": ["MF"],
-        "birth_year": 1978,
-    },
-    "Alekos-Rantos": {
-        "id": "33792e13",
-        "nationality": ["gr"],
-        "position": ["GK"],
-        "birth_year": 1966,
-    },
-    "Andreas-Reinke": {
-        "id": "e0adfb87",
-        "nationality": ["de"],
-        "position": ["GK"],
-        "birth_year": 1969,
-    },
-    "Zizi-Roberts": {
-        "id": "d6e64054",
-        "nationality": ["lr"],
-        "position": ["FW"],
-        "birth_year": 1979,
-    },
-    "Rodrigo": {
-        "id": "56393c87",
-        "nationality": ["br"],
-        "position": ["MF"],
-        "birth_year": 1980,
-    },
-    "Carlos-Ru\u00edz": {
-        "id": "6608a30a",
-        "nationality": ["gt"],
-        "position": ["FW"],
-        "birth_year": 1979,
-    },
-    "Emanuel-Ruiz": {
-        "id": "e02f77ff",
-        "nationality": ["ar"],
-        "position": ["FW"],
-        "birth_year": 1978,
-    },
-    "Ivan-Rusev": {
-        "id": "dc702d2d",
-        "nationality": ["bg"],
-        "position": ["MF"],
-        "birth_year": 1979,
-    },
-    "Vasilis-Samaras": {
-        "id": "347fc313",
-        "nationality": ["gr"],
-        "position": ["MF"],
-        "birth_year": 1974,
-    },
-    "Charles-Sampson": {
-        "id": "d3234023",
-        "nationality": ["gh"],
-        "position": ["MF"],
-        "birth_year": 1980,
-    },
-    "Miltiadis-Sapanis": {
-        "id": "73e13d30",
-        "nationality": ["gr"],
-        "position": ["MF"],
-        "birth_year": 1976,
-    },
-    "Antonis-Sapountzis": {
-        "id": "23fcab78",
-        "nationality": ["gr"],
-        "position": ["MF"],
-        "birth_year": 1971,
-    },
-    "Daniel-\u0160ari\u0107": {
-        "id": "62fd0521",
-        "nationality": ["hr"],
-        "position": ["DF", "MF"],
-        "birth_year": 1972,
-    },
-    "Toni-Savevski": {
-        "id": "01b3f8a2",
-        "nationality": ["mk"],
-        "position": ["MF"],
-        "birth_year": 1963,
-    },
-    "Kelvin-Sebwe": {
-        "id": "bcea32da",
-        "nationality": ["lr"],
-        "position": ["MF"],
-        "birth_year": 1972,
-    },
-    "Giourkas-Seitaridis": {
-        "id": "2dd41560",
-        "nationality": ["gr"],
-        "position": ["DF"],
-        "birth_year": 1981,
-    },
-    "Thanasis-Sentementes": {
-        "id": "0b56ae34",
-        "nationality": ["gr"],
-        "position": ["DF"],
-        "birth_year": 1975,
-    },
-    "Giannis-Sfakianakis": {
-        "id": "7e062679",
-        "nationality": ["gr"],
-        "position": ["DF"],
-        "birth_year": 1976,
-    },
-    "Stelios-Sfakianakis": {
-        "id": "91ebafbf",
-        "nationality": ["gr"],
-        "position": ["MF"],
-        "birth_year": 1976,
-    },
-    "Helgi-Sigur\u00f0sson": {
-        "id": "9dd45fd5",
-        "nationality": ["is"],
-        "position": ["FW"],
-        "birth_year": 1974,
-    },
-    "Carlos-Mauro-Pereira-da-Silva": {
-        "id": "c7af64ea",
-        "nationality": ["br"],
-        "position": ["FW"],
-        "birth_year": 1978,
-    },
-    "Jerry-Simons": {
-        "id": "645bdef2",
-        "nationality": ["nl"],
-        "position": ["MF"],
-        "birth_year": 1969,
-    },
-    "Georgios-Simos": {
-        "id": "2b031996",
-        "nationality": ["gr"],
-        "position": ["DF"],
-        "birth_year": 1978,
-    },
-    "Jimmy-Smet": {
-        "id": "c716a5da",
-        "nationality": ["be"],
-        "position": ["DF"],
-        "birth_year": 1977,
-    },
-    "Alexandre-Soares": {
-        "id": "adca7ab2",
-        "nationality": ["br"],
-        "position": ["FW"],
-        "birth_year": 1973,
-    },
-    "Denys-Sokolovskyi": {
-        "id": "597b92ef",
-        "nationality": ["ua"],
-        "position": ["FW", "MF"],
-        "birth_year": 1979,
-    },
-    "Ilias-Solakis": {
-        "id": "0afe295d",
-        "nationality": ["gr"],
-        "position": ["FW"],
-        "birth_year": 1974,
-    },
-    "Alonso-Sol\u00eds": {
-        "id": "016c50f4",
-        "nationality": ["cr"],
-        "position": ["FW", "MF"],
-        "birth_year": 1978,
-    },
-    "Luciano-de-Souza": {
-        "id": "86e0a3ff",
-        "nationality": ["br"],
-        "position": ["MF"],
-        "birth_year": 1972,
-    },
-    "Sla\u0111an-Spasi\u0107": {
-        "id": "62542e2c",
-        "nationality": ["rs"],
-        "position": ["MF"],
-        "birth_year": 1973,
-    },
-    "Kyriakos-Stamatopoulos": {
-        "id": "0be1b70f",
-        "nationality": ["ca"],
-        "position": ["GK"],
-        "birth_year": 1979,
-    },
-    "Konstantinos-Stavrakakis": {
-        "id": "6589dcbf",
-        "nationality": ["gr"],
-        "position": ["DF"],
-        "birth_year": 1979,
-    },
-    "Babis-Stefanidis": {
-        "id": "244a4064",
-        "nationality": ["se"],
-        "position": ["FW", "MF"],
-        "birth_year": 1981,
-    },
-    "Ilias-Stogiannis": {
-        "id": "5ebb3000",
-        "nationality": ["gr"],
-        "position": ["GK"],
-        "birth_year": 1976,
-    },
-    "Ieroklis-Stoltidis": {
-        "id": "5d344799",
-        "nationality": ["gr"],
-        "position": ["MF"],
-        "birth_year": 1975,
-    },
-    "Foto-Strakosha": {
-        "id": "34e376d2",
-        "nationality": ["al"],
-        "position": ["GK"],
-        "birth_year": 1965,
-    },
-    "Igor-Sypniewski": {
-        "id": "21e9b8b5",
-        "nationality": ["pl"],
-        "position": ["FW", "MF"],
-        "birth_year": 1974,
-    },
-    "Giannis-Taralidis": {
-        "id": "38492c46",
-        "nationality": ["gr"],
-        "position": ["DF", "MF"],
-        "birth_year": 1981,
-    },
-    "Tasos-Tasiopoulos": {
-        "id": "f4d36917",
-        "nationality": ["gr"],
-        "position": ["DF"],
-        "birth_year": 1968,
-    },
-    "Alexandros-Tatsis": {
-        "id": "d8e9d71b",
-        "nationality": ["gr"],
-        "position": ["FW"],
-        "birth_year": 1979,
-    },
-    "Stathis-Tavlaridis": {
-        "id": "8be432df",
-        "nationality": ["gr"],
-        "position": ["DF"],
-        "birth_year": 1980,
-    },
-    "Darko-Te\u0161ovi\u0107": {
-        "id": "6c08cc9f",
-        "nationality": ["rs"],
-        "position": ["MF"],
-        "birth_year": 1970,
-    },
-    "Omari-Tetradze": {
-        "id": "e71216f5",
-        "nationality": ["xc"],
-        "position": ["DF", "MF"],
-        "birth_year": 1969,
-    },
-    "Giorgos-Theodoridis": {
-        "id": "8fc6efa2",
-        "nationality": ["gr"],
-        "position": ["MF"],
-        "birth_year": 1980,
-    },
-    "Kyriakos-Tohouroglou": {
-        "id": "24b3789d",
-        "nationality": ["au"],
-        "position": ["GK"],
-        "birth_year": 1972,
-    },
-    "Bassala-Tour\u00e9": {
-        "id": "8d5ae705",
-        "nationality": ["ml"],
-        "position": ["MF"],
-        "birth_year": 1976,
-    },
-    "Giorgos-Toursounidis": {
-        "id": "a7f138d2",
-        "nationality": ["gr"],
-        "position": ["MF"],
-        "birth_year": 1970,
-    },
-    "Vasilios-Tsiartas": {
-        "id": "81528813",
-        "nationality": ["gr"],
-        "position": ["MF"],
-        "birth_year": 1972,
-    },
-    "Athanasios-Tsigas": {
-        "id": "b735829e",
-        "nationality": ["gr"],
-        "position": ["DF", "FW"],
-        "birth_year": 1982,
-    },
-    "Stavros-Tziortziopoulos": {
-        "id": "ec2fd36e",
-        "nationality": ["gr"],
-        "position": ["DF"],
-        "birth_year": 1978,
-    },
-    "Ifeanyi-Udeze": {
-        "id": "62067577",
-        "nationality": ["ng"],
-        "position": ["DF"],
-        "birth_year": 1980,
-    },
-    "Martin-Urban": {"id": "b4091546", "position": ["DF"], "birth_year": 1972},
-    "Ville-V\u00e4is\u00e4nen": {
-        "id": "037ae592",
-        "nationality": ["fi"],
-        "position": ["DF"],
-        "birth_year": 1977,
-    },
-    "Spyros-Vallas": {
-        "id": "2755e25a",
-        "nationality": ["gr"],
-        "position": ["DF"],
-        "birth_year": 1981,
-    },
-    "Jude-Vandelannoite": {
-        "id": "39acaa03",
-        "nationality": ["be"],
-        "position": ["DF", "MF"],
-        "birth_year": 1973,
-    },
-    "Stylianos-Venetidis": {
-        "id": "10019ee1",
-        "nationality": ["gr"],
-        "position": ["DF"],
-        "birth_year": 1976,
-    },
-    "Polychronis-Vezyridis": {
-        "id": "a2c6afac",
-        "nationality": ["gr"],
-        "position": ["GK"],
-        "birth_year": 1974,
-    },
-    "Marco-Villa": {
-        "id": "0cbd4034",
-        "nationality": ["de"],
-        "position": ["FW"],
-        "birth_year": 1978,
-    },
-    "Michalis-Vlachos": {
-        "id": "7759de38",
-        "nationality": ["gr"],
-        "position": ["DF"],
-        "birth_year": 1967,
-    },
-    "Goran-Vlaovi\u0107": {
-        "id": "f0466c1c",
-        "nationality": ["hr"],
-        "position": ["FW"],
-        "birth_year": 1972,
-    },
-    "Leonidas-Vokolos": {
-        "id": "8b4bd03a",
-        "nationality": ["gr"],
-        "position": ["DF"],
-        "birth_year": 1970,
-    },
-    "Stefanos-Voskaridis": {
-        "id": "af954b2e",
-        "nationality": ["cy"],
-        "position": ["FW"],
-        "birth_year": 1980,
-    },
-    "Nenad-Vuk\u010devi\u0107": {
-        "id": "71708059",
-        "nationality": ["me"],
-        "position": ["FW"],
-        "birth_year": 1974,
-    },
-    "Dragan-Vulevi\u0107": {
-        "id": "7a176e6f",
-        "nationality": ["rs"],
-        "position": ["FW"],
-        "birth_year": 1970,
-    },
-    "J\u00f3zef-Wandzik": {
-        "id": "d71922f6",
-        "nationality": ["pl"],
-        "position": ["GK"],
-        "birth_year": 1963,
-    },
-    "Krzysztof-Warzycha": {
-        "id": "7c372e0e",
-        "nationality": ["pl"],
-        "position": ["FW"],
-        "birth_year": 1964,
-    },
-    "Giannis-Xanthopoulos": {
-        "id": "08f87cb9",
-        "nationality": ["gr"],
-        "position": ["DF"],
-        "birth_year": 1967,
-    },
-    "Georgios-Xenidis": {
-        "id": "b6569662",
-        "nationality": ["gr"],
-        "position": ["DF"],
-        "birth_year": 1974,
-    },
-    "Arjan-Xhumba": {
-        "id": "fa9d23b1",
-        "nationality": ["al"],
-        "position": ["DF"],
-        "birth_year": 1968,
-    },
-    "Theodoros-Zagorakis": {
-        "id": "d3397c3e",
-        "nationality": ["gr"],
-        "position": ["MF"],
-        "birth_year": 1971,
-    },
-    "Nikos-Zapropoulos": {
-        "id": "c45e2950",
-        "nationality": ["gr"],
-        "position": ["DF"],
-        "birth_year": 1978,
-    },
-    "P\u00e4r-Zetterberg": {
-        "id": "fe67ca14",
-        "nationality": ["se"],
-        "position": ["MF"],
-        "birth_year": 1970,
-    },
-    "Akis-Zikos": {
-        "id": "9965b634",
-        "nationality": ["gr"],
-        "position": ["MF"],
-        "birth_year": 1974,
-    },
-    "Dimitrios-Zografakis": {
-        "id": "1044bac0",
-        "nationality": ["gr"],
-        "position": ["MF"],
-        "birth_year": 1978,
-    },
-    "Predrag-\u0110or\u0111evi\u0107": {
-        "id": "74137544",
-        "nationality": ["rs"],
-        "position": ["MF"],
-        "birth_year": 1972,
-    },
-    "Agapitos-Abelas": {"id": ""},
-    "Alekos-Dellios": {"id": ""},
-    "Alexandros-Drimalas": {"id": ""},
-    "Alexandros-Karidis": {"id": ""},
-    "Alexis-Dedes": {"id": ""},
-    "Andreas-Skentzos": {"id": ""},
-    "Angelos-Vilanakis": {"id": ""},
-    "Angelos-Zafeirakis": {"id": ""},
-    "Antonis-Papadimitrou": {"id": ""},
-    "Arian-Belaj": {"id": ""},
-    "Aris-Tsalikis": {"id": ""},
-    "Assis-Hilton": {"id": ""},
-    "Athanasios-Moutsios": {"id": ""},
-    "Athanassis-Demirtzoglou": {"id": ""},
-    "Bosindar-Bandovic": {"id": ""},
-    "Charalambos-Charalambakis": {"id": ""},
-    "Chrisostomos-Veniamin": {"id": ""},
-    "Christos-Gantzoudis": {"id": ""},
-    "Christos-Kelpekis": {"id": ""},
-    "Christos-Kiourkos": {"id": ""},
-    "Christos-Moraitis": {"id": ""},
-    "Christos-Pittos": {"id": ""},
-    "Christos-Velis": {"id": ""},
-    "Costas-Ipirotis": {"id": ""},
-    "Costas-Tsironis": {"id": ""},
-    "Demetris-Daskalakis": {"id": ""},
-    "Dimitris-Athanasiou": {"id": ""},
-    "Dimitris-Deligiannis": {"id": ""},
-    "Dimitris-Kalambakas": {"id": ""},
-    "Dimitris-Kapetanopoulos": {"id": ""},
-    "Dimitris-Koutivas": {"id": ""},
-    "Dimitris-Markomichalis": {"id": ""},
-    "Dimitris-Zavadias": {"id": ""},
-    "Dimosthenis-Papathanasious": {"id": ""},
-    "Eduard-Stojanov": {"id": ""},
-    "Elias-Botaitis": {"id": ""},
-    "Elias-Ioannou": {"id": ""},
-    "Elias-Sapanis": {"id": ""},
-    "Evangelos-Psarris": {"id": ""},
-    "Fotis-Gouziotis": {"id": ""},
-    "Fotis-Lagos": {"id": ""},
-    "Fotis-Papadopoulos": {"id": ""},
-    "Giancorrado-Monteneri": {"id": ""},
-    "Giannis-Baltimas": {"id": ""},
-    "Giannis-Dimitriadis": {"id": ""},
-    "Giannis-Girichidis": {"id": ""},
-    "Giannis-Katsaros": {"id": ""},
-    "Giannis-Neofitidis": {"id": ""},
-    "Giannis-Tatsis": {"id": ""},
-    "Giannis-Thomaidis": {"id": ""},
-    "Giannis-Tsagaris": {"id": ""},
-    "Giannis-Tsakonakis": {"id": ""},
-    "Giorgios-Abadiotakis": {"id": ""},
-    "Giorgios-Papagiannakis": {"id": ""},
-    "Giorgos-Daraklitsas": {"id": ""},
-    "Giorgos-Dinopoulos": {"id": ""},
-    "Giorgos-Kakos": {"id": ""},
-    "Giorgos-Karaisaridis": {"id": ""},
-    "Giorgos-Kavazis": {"id": ""},
-    "Giorgos-Kiourkos": {"id": ""},
-    "Giorgos-Kontopoulos": {"id": ""},
-    "Giorgos-Kostis": {"id": ""},
-    "Giorgos-Kravaris": {"id": ""},
-    "Giorgos-Mitkos": {"id": ""},
-    "Giorgos-Mitsiopoulos": {"id": ""},
-    "Giorgos-Papadopoulos": {"id": ""},
-    "Giorgos-Paraskevaidis": {"id": ""},
-    "Giorgos-Podaras": {"id": ""},
-    "Giorgos-Provatas": {"id": ""},
-    "Giorgos-Tasidis": {"id": ""},
-    "Gustavo-Dobrik": {"id": ""},
-    "Haralambos-Nikolaou": {"id": ""},
-    "Ilias-Triantafilou": {"id": ""},
-    "Ilias-Tsimopoulos": {"id": ""},
-    "Isaak-Almanidis": {"id": ""},
-    "Jorge-Pulja": {"id": ""},
-    "Konterzi-Natrosvili": {"id": ""},
-    "Kostas-Angos": {"id": ""},
-    "Kostas-Cheliotis": {"id": ""},
-    "Kostas-Detsikas": {"id": ""},
-    "Kostas-Kafalis": {"id": ""},
-    "Kostas-Kakoglou": {"id": ""},
-    "Kostas-Kalogiannidis": {"id": ""},
-    "Kostas-Kormaris": {"id": ""},
-    "Kostas-Palamaras": {"id": ""},
-    "Kostas-Papadopoulos": {"id": ""},
-    "Kostas-Pavlopoulos": {"id": ""},
-    "Kostas-Taksiarchis": {"id": ""},
-    "Kostas-Tsalikis": {"id": ""},
-    "Lazaros-Semos": {"id": ""},
-    "Loukas-Galamelos": {"id": ""},
-    "Luis-Yordan": {"id": ""},
-    "Manolis-Mitsopoulos": {"id": ""},
-    "Manolis-Skivalos": {"id": ""},
-    "Manthos-Platakis": {"id": ""},
-    "Marios-Segos": {"id": ""},
-    "Merkourios-Karaliopoulos": {"id": ""},
-    "Michalis-Alvertis": {"id": ""},
-    "Michalis-Berneanou": {"id": ""},
-    "Michalis-Kakiouzis": {"id": ""},
-    "Michalis-Lignos": {"id": ""},
-    "Miloje-Klaevic": {"id": ""},
-    "Nenad-Milikovic": {"id": ""},
-    "Nikola-Dicoume": {"id": ""},
-    "Nikos-Adamidis": {"id": ""},
-    "Nikos-Arganis": {"id": ""},
-    "Nikos-Kolpakidis": {"id": ""},
-    "Nikos-Manoos": {"id": ""},
-    "Nikos-Sakellaridis": {"id": ""},
-    "Nikos-Tzanetis": {"id": ""},
-    "Nikos-Vavilis": {"id": ""},
-    "Panagiotis-Bartzokas": {"id": ""},
-    "Panagiotis-Dilberis": {"id": ""},
-    "Panagiotis-Efthimiadis": {"id": ""},
-    "Panagiotis-Gitsis": {"id": ""},
-    "Panagiotis-Kourdakis": {"id": ""},
-    "Panagiotis-Logaras": {"id": ""},
-    "Panagiotis-Ziakas": {"id": ""},
-    "Panayiotis-Konstantinidis": {"id": ""},
-    "Parashos-Zouboulis": {"id": ""},
-    "Pavlos-Adamos": {"id": ""},
-    "Petros-Arganis": {"id": ""},
-    "Petros-Marinakis": {"id": ""},
-    "Predrag-Mitic": {"id": ""},
-    "Prokopis-Kartalis": {"id": ""},
-    "Santos-Alves": {"id": ""},
-    "Savvas-Giannakidis": {"id": ""},
-    "Serge-Chironval": {"id": ""},
-    "Sokratis-Kopsachilis": {"id": ""},
-    "Sokratis-Ofridopoulos": {"id": ""},
-    "Sotiris-Katribuzas": {"id": ""},
-    "Spiros-Nousias": {"id": ""},
-    "Stefanos-Basinas": {"id": ""},
-    "Stefanos-Karkanis": {"id": ""},
-    "Stelios-Chadouris": {"id": ""},
-    "Stelios-Chasiotis": {"id": ""},
-    "Stelios-Kozanidis": {"id": ""},
-    "Stergios-Noulis": {"id": ""},
-    "Stratos-Garozis": {"id": ""},
-    "Tasos-Karamanos": {"id": ""},
-    "Tassos-Ferekidis": {"id": ""},
-    "Thanadise-Papavasileu": {"id": ""},
-    "Thanassis-Ioannou": {"id": ""},
-    "Themis-Tzanetis": {"id": ""},
-    "Theodoris-Kikidakis": {"id": ""},
-    "Theodoros-Gitkos": {"id": ""},
-    "Thomas-Troupkos": {"id": ""},
-    "Vangelis-Hosadas": {"id": ""},
-    "Vangelis-Kefalas": {"id": ""},
-    "Vassilis-Alevizos": {"id": ""},
-    "Vassilis-Bletsas": {"id": ""},
-    "Vassilis-Kastaniotis": {"id": ""},
-    "Vassilis-Kosifologos": {"id": ""},
-    "Vassilis-Xanthis": {"id": ""},
-    "Willian-Lima": {"id": ""},
-    "Wilson-Munioz": {"id": ""},
-    "Taha-Abdi-Ali": {
-        "id": "da4b8a4e",
-        "nationality": ["se"],
-        "position": ["FW", "MF"],
-        "birth_year": 1998,
-    },
-    "Yusuf-Abdulazeez": {
-        "id": "93d0fa66",
-        "nationality": ["ng"],
-        "position": ["FW"],
-        "birth_year": 2002,
-    },
-    "Suleiman-Abdullahi": {
-        "id": "abf0cad0",
-        "nationality": ["ng"],
-        "position": ["FW", "MF"],
-        "birth_year": 1996,
-    },
-    "Ishaq-Abdulrazak": {
-        "id": "4d2d7ea5",
-        "nationality": ["ng"],
-        "position": ["MF"],
-        "birth_year": 2002,
-    },
-    "Peter-Abrahamsson": {
-        "id": "40e57039",
-        "nationality": ["se"],
-        "position": ["GK"],
-        "birth_year": 1988,
-    },
-    "Malik-Abubakari": {
-        "id": "47aaf574",
-        "nationality": ["gh"],
-        "position": ["FW"],
-        "birth_year": 2000,
-    },
-    "Benjamin-Acquah": {
-        "id": "75f4d389",
-        "nationality": ["gh"],
-        "position": ["MF"],
-        "birth_year": 2000,
-    },
-    "Albion-Ademi": {
-        "id": "424471b0",
-        "nationality": ["al"],
-        "position": ["FW"],
-        "birth_year": 1999,
-    },
-    "Nathaniel-Adjei": {
-        "id": "c55de1f5",
-        "nationality": ["gh"],
-        "position": ["DF"],
-        "birth_year": 2002,
-    },
-    "Simon-Adjei": {
-        "id": "f77dcf95",
-        "nationality": ["se"],
-        "position": ["FW"],
-        "birth_year": 1993,
-    },
-    "Samuel-Adrian": {
-        "id": "62bb35cb",
-        "nationality": ["se"],
-        "position": ["MF"],
-        "birth_year": 1998,
-    },
-    "Oscar-Aga": {
-        "id": "6e570422",
-        "nationality": ["no"],
-        "position": ["FW"],
-        "birth_year": 2001,
-    },
-    "Viktor-Agardius": {
-        "id": "111d66b2",
-        "nationality": ["se"],
-        "position": ["DF"],
-        "birth_year": 1989,
-    },
-    "Amar-Ahmed": {
-        "id": "22396615",
-        "nationality": ["se"],
-        "position": ["MF", "FW"],
-        "birth_year": 2004,
-    },
-    "Hosam-Aiesh": {
-        "id": "9d01ec0f",
-        "nationality": ["sy"],
-        "position": ["MF", "FW"],
-        "birth_year": 1995,
-    },
-    "Oliver-Alfonsi": {
-        "id": "63cf1a8a",
-        "nationality": ["se"],
-        "position": ["MF", "FW"],
-        "birth_year": 2003,
-    },
-    "Papa-Alioune-Diouf": {
-        "id": "8715c8cd",
-        "nationality": ["sn"],
-        "position": ["FW"],
-        "birth_year": 1989,
-    },
-    "Rasmus-Alm": {
-        "id": "78506575",
-        "nationality": ["se"],
-        "position": ["FW", "MF"],
-        "birth_year": 1995,
-    },
-    "Filip-Ambroz": {
-        "id": "493dff05",
-        "nationality": ["hr"],
-        "position": ["MF"],
-        "birth_year": 2003,
-    },
-    "Amir-Al-Ammari": {
-        "id": "9f65be73",
-        "nationality": ["iq"],
-        "position": ["MF"],
-        "birth_year": 1997,
-    },
-    "Joseph-Amoako": {
-        "id": "ff2a20a7",
-        "nationality": ["gh"],
-        "position": ["MF"],
-        "birth_year": 2002,
-    },
-    "Jeppe-Andersen": {
-        "id": "aadbb7bc",
-        "nationality": ["dk"],
-        "position": ["MF"],
-        "birth_year": 1992,
-    },
-    "Andreas-Andersson": {
-        "id": "92d68fdf",
-        "nationality": ["se"],
-        "position": ["GK"],
-        "birth_year": 1991,
-    },
-    "Elias-Andersson": {
-        "id": "d0d3bcc7",
-        "nationality": ["se"],
-        "position": ["DF", "MF"],
-        "birth_year": 1996,
-    },
-    "Erik-Andersson": {
-        "id": "401b50bd",
-        "nationality": ["se"],
-        "position": ["MF", "FW"],
-        "birth_year": 1997,
-    },
-    "Fredrik-Andersson": {
-        "id": "5419ff83",
-        "nationality": ["se"],
-        "position": ["GK"],
-        "birth_year": 1988,
-    },
-    "Victor-Andersson": {
-        "id": "1cedf8d8",
-        "nationality": ["se"],
-        "position": ["MF"],
-        "birth_year": 2004,
-    },
-    "Marcus-Antonsson": {
-        "id": "ba3378a5",
-        "nationality": ["se"],
-        "position": ["FW"],
-        "birth_year": 1991,
-    },
-    "Joel-Asoro": {
-        "id": "13e827f8",
-        "nationality": ["se"],
-        "position": ["FW"],
-        "birth_year": 1999,
-    },
-    "Tim-van-Assema": {
-        "id": "9b9b6f04",
-        "nationality": ["nl"],
-        "position": ["MF"],
-        "birth_year": 2002,
-    },
-    "Henry-Atola": {
-        "id": "fc1a8da9",
-        "nationality": ["ke"],
-        "position": ["FW"],
-        "birth_year": 2001,
-    },
-    "Haris-Avdiu": {
-        "id": "fb3dcbaa",
-        "nationality": ["se"],
-        "position": ["FW"],
-        "birth_year": 1997,
-    },
-    "Taha-Ayari": {
-        "id": "924a6d17",
-        "nationality": ["se"],
-        "position": ["MF"],
-        "birth_year": 2005,
-    },
-    "Yasin-Ayari": {
-        "id": "f173303a",
-        "nationality": ["se"],
-        "position": ["MF"],
-        "birth_year": 2003,
-    },
-    "Victor-Backman": {
-        "id": "cc9bac69",
-        "nationality": ["se"],
-        "position": ["MF"],
-        "birth_year": 2001,
-    },
-    "Nabil-Bahoui": {
-        "id": "8689dccc",
-        "nationality": ["se"],
-        "position": ["FW", "MF"],
-        "birth_year": 1991,
-    },
-    "Michael-Baidoo": {
-        "id": "467553cf",
-        "nationality": ["gh"],
-        "position": ["MF"],
-        "birth_year": 1999,
-    },
-    "Emmanuel-Banda": {
-        "id": "e0fdefca",
-        "nationality": ["zm"],
-        "position": ["MF"],
-        "birth_year": 1997,
-    },
-    "Johan-B\u00e5ngsbo": {
-        "id": "9ab985c7",
-        "nationality": ["se"],
-        "position": ["DF"],
-        "birth_year": 2003,
-    },
-    "Edvin-Becirovic": {
-        "id": "d189eba5",
-        "nationality": ["se"],
-        "position": ["FW"],
-        "birth_year": 2000,
-    },
-    "Felix-Beijmo": {
-        "id": "71115017",
-        "nationality": ["se"],
-        "position": ["DF", "MF"],
-        "birth_year": 1998,
-    },
-    "Johan-Bengtsson": {
-        "id": "fb975309",
-        "nationality": ["se"],
-        "position": ["FW"],
-        "birth_year": 2004,
-    },
-    "Leo-Bengtsson": {
-        "id": "25cde772",
-        "nationality": ["se"],
-        "position": ["FW"],
-        "birth_year": 1998,
-    },
-    "Pierre-Bengtsson": {
-        "id": "d1992a3b",
-        "nationality": ["se"],
-        "position": ["DF"],
-        "birth_year": 1988,
-    },
-    "Simon-Bengtsson": {
-        "id": "b7d4efda",
-        "nationality": ["se"],
-        "position": ["DF"],
-        "birth_year": 2004,
-    },
-    "Marcus-Berg": {
-        "id": "b39bf63f",
-        "nationality": ["se"],
-        "position": ["FW"],
-        "birth_year": 1986,
-    },
-    "Oliver-Berg": {
-        "id": "6053df96",
-        "nationality": ["no"],
-        "position": ["FW", "MF"],
-        "birth_year": 1993,
-    },
-    "Gustav-Berggren": {
-        "id": "b8103669",
-        "nationality": ["se"],
-        "position": ["MF"],
-        "birth_year": 1997,
-    },
-    "Doug-Bergqvist": {
-        "id": "73221bb0",
-        "nationality": ["se"],
-        "position": ["DF"],
-        "birth_year": 1993,
-    },
-    "Jacob-Bergstr\u00f6m": {
-        "id": "665d3deb",
-        "nationality": ["se"],
-        "position": ["FW"],
-        "birth_year": 1995,
-    },
-    "Alexander-Bernhardsson": {
-        "id": "dea1d183",
-        "nationality": ["se"],
-        "position": ["FW", "MF"],
-        "birth_year": 1998,
-    },
-    "Johan-Bertilsson": {
-        "id": "52c3464a",
-        "nationality": ["se"],
-        "position": ["MF", "FW"],
-        "birth_year": 1988,
-    },
-    "Nahir-Besara": {
-        "id": "2fadcd15",
-        "nationality": ["se"],
-        "position": ["MF", "FW"],
-        "birth_year": 1991,
-    },
-    "Egzon-Binaku": {
-        "id": "63a304f3",
-        "nationality": ["al"],
-        "position": ["MF"],
-        "birth_year": 1995,
-    },
-    "Jon-Birkfeldt": {
-        "id": "c0ded652",
-        "nationality": ["se"],
-        "position": ["DF"],
-        "birth_year": 1996,
-    },
-    "Veljko-Birman\u010devi\u0107": {
-        "id": "636247ca",
-        "nationality": ["rs"],
-        "position": ["FW", "MF"],
-        "birth_year": 1998,
-    },
-    "Aron-Bjarnason": {
-        "id": "a6e092ea",
-        "nationality": ["is"],
-        "position": ["MF", "DF"],
-        "birth_year": 1995,
-    },
-    "Mattias-Bj\u00e4rsmyr": {
-        "id": "15927d77",
-        "nationality": ["se"],
-        "position": ["DF"],
-        "birth_year": 1986,
-    },
-    "Isak-Bjerkebo": {
-        "id": "5e4020f5",
-        "nationality": ["se"],
-        "position": ["FW"],
-        "birth_year": 2003,
-    },
-    "Tim-Bj\u00f6rkstr\u00f6m": {
-        "id": "d95042fd",
-        "nationality": ["se"],
-        "position": ["DF"],
-        "birth_year": 1991,
-    },
-    "Axel-Bj\u00f6rnstr\u00f6m": {
-        "id": "8db38187",
-        "nationality": ["se"],
-        "position": ["DF", "MF"],
-        "birth_year": 1995,
-    },
-    "Davor-Bla\u017eevi\u0107": {
-        "id": "afbb68eb",
-        "nationality": ["se"],
-        "position": ["GK"],
-        "birth_year": 1993,
-    },
-    "Alexander-Blomqvist": {
-        "id": "66bcd7fa",
-        "nationality": ["se"],
-        "position": ["DF"],
-        "birth_year": 1994,
-    },
-    "Andreas-Blomqvist": {
-        "id": "ad454818",
-        "nationality": ["se"],
-        "position": ["MF"],
-        "birth_year": 1992,
-    },
-    "Filip-Bohman": {
-        "id": "ca251cd9",
-        "nationality": ["se"],
-        "position": ["MF", "FW"],
-        "birth_year": 1996,
-    },
-    "Darijan-Bojani\u0107": {
-        "id": "aa09d373",
-        "nationality": ["se"],
-        "position": ["MF"],
-        "birth_year": 1994,
-    },
-    "Andr\u00e9-Boman": {
-        "id": "5f58ba26",
-        "nationality": ["se"],
-        "position": ["MF", "DF"],
-        "birth_year": 2001,
-    },
-    "Elyas-Bouzaiene": {
-        "id": "f5bbb514",
-        "nationality": ["se"],
-        "position": ["MF", "DF"],
-        "birth_year": 1997,
-    },
-    "Johan-Brattberg": {
-        "id": "3906ff9b",
-        "nationality": ["se"],
-        "position": ["GK"],
-        "birth_year": 1996,
-    },
-    "Samuel-Brolin": {
-        "id": "82fdcbec",
-        "nationality": ["se"],
-        "position": ["GK"],
-        "birth_year": 2000,
-    },
-    "Jaheem-Burke": {
-        "id": "5fe0a3c7",
-        "nationality": ["se"],
-        "position": ["DF"],
-        "birth_year": 2001,
-    },
-    "Marcus-Burman": {
-        "id": "a188f5f0",
-        "nationality": ["se"],
-        "position": ["MF"],
-        "birth_year": 1996,
-    },
-    "Mohamed-Buya-Turay": {
-        "id": "8e456005",
-        "nationality": ["sl"],
-        "position": ["FW", "MF"],
-        "birth_year": 1995,
-    },
-    "Diego-Campos": {
-        "id": "fcfb671e",
-        "nationality": ["cr"],
-        "position": ["FW", "MF"],
-        "birth_year": 1995,
-    },
-    "Adam-Carl\u00e9n": {
-        "id": "5d2dd3fd",
-        "nationality": ["se"],
-        "position": ["MF"],
-        "birth_year": 2000,
-    },
-    "Linus-Carlstrand": {
-        "id": "36b9ab20",
-        "nationality": ["se"],
-        "position": ["FW"],
-        "birth_year": 2004,
-    },
-    "Hussein-Carneil": {
-        "id": "0cc5e712",
-        "nationality": ["se"],
-        "position": ["MF", "FW"],
-        "birth_year": 2003,
-    },
-    "Jesper-Carstr\u00f6m": {
-        "id": "a6a417f0",
-        "nationality": ["se"],
-        "position": ["MF"],
-        "birth_year": 2002,
-    },
-    "Gabriel-Castro": {
-        "id": "ae1f9ebd",
-        "nationality": ["pt"],
-        "position": ["MF", "DF"],
-        "birth_year": 2000,
-    },
-    "Jesper-Ceesay": {
-        "id": "606c9990",
-        "nationality": ["gm"],
-        "position": ["MF"],
-        "birth_year": 2001,
-    },
-    "Joseph-Ceesay": {
-        "id": "350ad032",
-        "nationality": ["se"],
-        "position": ["MF", "FW"],
-        "birth_year": 1998,
-    },
-    "Mat\u011bj-Chalu\u0161": {
-        "id": "254b831b",
-        "nationality": ["cz"],
-        "position": ["DF"],
-        "birth_year": 1998,
-    },
-    "Anders-Christiansen": {
-        "id": "770ebf00",
-        "nationality": ["dk"],
-        "position": ["MF", "FW"],
-        "birth_year": 1990,
-    },
-    "Dennis-Collander": {
-        "id": "9b6a4927",
-        "nationality": ["se"],
-        "position": ["MF"],
-        "birth_year": 2002,
-    },
-    "David-Concha": {
-        "id": "c8355268",
-        "nationality": ["es"],
-        "position": ["FW"],
-        "birth_year": 1996,
-    },
-    "Jack-Cooper-Love": {
-        "id": "0b6360b0",
-        "nationality": ["se"],
-        "position": ["FW"],
-        "birth_year": 2001,
-    },
-    "Joe-Corona": {
-        "id": "470cd24b",
-        "nationality": ["us"],
-        "position": ["MF"],
-        "birth_year": 1990,
-    },
-    "Kristopher-Da-Graca": {
-        "id": "3996e5be",
-        "nationality": ["cv"],
-        "position": ["DF"],
-        "birth_year": 1998,
-    },
-    "Filip-Dagerst\u00e5l": {
-        "id": "1456a596",
-        "nationality": ["se"],
-        "position": ["DF"],
-        "birth_year": 1997,
-    },
-    "Pontus-Dahlberg": {
-        "id": "2475b06e",
-        "nationality": ["se"],
-        "position": ["GK"],
-        "birth_year": 1999,
-    },
-    "Johan-Dahlin": {
-        "id": "a04e2dd2",
-        "nationality": ["se"],
-        "position": ["GK"],
-        "birth_year": 1986,
-    },
-    "Niklas-Dahlstr\u00f6m": {
-        "id": "052a968e",
-        "nationality": ["se"],
-        "position": ["DF"],
-        "birth_year": 1997,
-    },
-    "Ronaldo-Damus": {
-        "id": "4bf9347c",
-        "nationality": ["ht"],
-        "position": ["FW"],
-        "birth_year": 1999,
-    },
-    "Marcus-Danielsson": {
-        "id": "aae48df1",
-        "nationality": ["se"],
-        "position": ["DF"],
-        "birth_year": 1989,
-    },
-    "Viljormur-Davidsen": {
-        "id": "ab7c9060",
-        "nationality": ["fo"],
-        "position": ["DF"],
-        "birth_year": 1991,
-    },
-    "Edwin-Dellkrans": {
-        "id": "82b27045",
-        "nationality": ["se"],
-        "position": ["DF"],
-        "birth_year": 2003,
-    },
-    "Alper-Demirol": {
-        "id": "57ec893b",
-        "nationality": ["se"],
-        "position": ["MF"],
-        "birth_year": 2002,
-    },
-    "Anthony-van-den-Hurk": {
-        "id": "e7fe42d6",
-        "nationality": ["cw"],
-        "position": ["FW"],
-        "birth_year": 1993,
-    },
-    "Ismael-Diawara": {
-        "id": "a9107589",
-        "nationality": ["ml"],
-        "position": ["GK"],
-        "birth_year": 1994,
-    },
-    "Jesper-Dickman": {
-        "id": "3c1fe19e",
-        "nationality": ["se"],
-        "position": ["MF"],
-        "birth_year": 2001,
-    },
-    "Amadou-Doumbouya": {
-        "id": "4cc98057",
-        "nationality": ["gn"],
-        "position": ["FW"],
-        "birth_year": 2002,
-    },
-    "Oliver-Dovin": {
-        "id": "9f12e0f8",
-        "nationality": ["se"],
-        "position": ["GK"],
-        "birth_year": 2002,
-    },
-    "Flamur-Dzelili": {
-        "id": "6d49b095",
-        "nationality": ["se"],
-        "position": ["FW"],
-        "birth_year": 1999,
-    },
-    "Victor-Edvardsen": {
-        "id": "817f3a14",
-        "nationality": ["se"],
-        "position": ["FW"],
-        "birth_year": 1996,
-    },
-    "David-Edvardsson": {
-        "id": "558e1c93",
-        "nationality": ["se"],
-        "position": ["MF"],
-        "birth_year": 2002,
-    },
-    "Daniel-Eid": {
-        "id": "9a12e666",
-        "nationality": ["no"],
-        "position": ["MF", "DF"],
-        "birth_year": 1998,
-    },
-    "Noah-Eile": {
-        "id": "e1574c2d",
-        "nationality": ["se"],
-        "position": ["DF"],
-        "birth_year": 2002,
-    },
-    "Albert-Ejupi": {
-        "id": "aae04d1c",
-        "nationality": ["se"],
-        "position": ["MF"],
-        "birth_year": 1992,
-    },
-    "Hjalmar-Ekdal": {
-        "id": "3d554589",
-        "nationality": ["se"],
-        "position": ["DF"],
-        "birth_year": 1998,
-    },
-    "Godswill-Ekpolo": {
-        "id": "9f74c39b",
-        "nationality": ["ng"],
-        "position": ["DF"],
-        "birth_year": 1995,
-    },
-    "Zachary-Elbouzedi": {
-        "id": "1a5ed92d",
-        "nationality": ["ie"],
-        "position": ["MF"],
-        "birth_year": 1998,
-    },
-    "Pontus-Engblom": {
-        "id": "6894e40a",
-        "nationality": ["se"],
-        "position": ["FW"],
-        "birth_year": 1991,
-    },
-    "Jusef-Erabi": {
-        "id": "5106b69d",
-        "nationality": ["se"],
-        "position": ["FW"],
-        "birth_year": 2003,
-    },
-    "Erick": {
-        "id": "3de87a61",
-        "nationality": ["br"],
-        "position": ["MF"],
-        "birth_year": 1995,
-    },
-    "Anton-Eriksson": {
-        "id": "0c508057",
-        "nationality": ["se"],
-        "position": ["DF"],
-        "birth_year": 2000,
-    },
-    "Felix-Eriksson": {
-        "id": "dd1de85c",
-        "nationality": ["se"],
-        "position": ["DF"],
-        "birth_year": 2002,
-    },
-    "Magnus-Eriksson": {
-        "id": "5571f8b5",
-        "nationality": ["se"],
-        "position": ["MF"],
-        "birth_year": 1990,
-    },
-    "Sebastian-Eriksson": {
-        "id": "35d76360",
-        "nationality": ["se"],
-        "position": ["MF"],
-        "birth_year": 1989,
-    },
-    "Victor-Eriksson": {
-        "id": "b567c8ff",
-        "nationality": ["se"],
-        "position": ["DF"],
-        "birth_year": 2000,
-    },
-    "Alexander-Faltsetas": {
-        "id": "55fe5670",
-        "nationality": ["se"],
-        "position": ["MF"],
-        "birth_year": 1987,
-    },
-    "Omar-Faraj": {
-        "id": "de627c8a",
-        "nationality": ["se"],
-        "position": ["FW"],
-        "birth_year": 2002,
-    },
-    "Mads-Fenger": {
-        "id": "df894060",
-        "nationality": ["dk"],
-        "position": ["DF"],
-        "birth_year": 1990,
-    },
-    "Josip-Filipovic": {
-        "id": "28a57f0e",
-        "nationality": ["hr"],
-        "position": ["DF"],
-        "birth_year": 1996,
-    },
-    "Hampus-Finndell": {
-        "id": "5afc236c",
-        "nationality": ["se"],
-        "position": ["MF"],
-        "birth_year": 2000,
-    },
-    "Ari-Freyr-Sk\u00falason": {
-        "id": "cce93ecd",
-        "nationality": ["is"],
-        "position": ["MF"],
-        "birth_year": 1987,
-    },
-    "Erik-Friberg": {
-        "id": "3eaa3f36",
-        "nationality": ["se"],
-        "position": ["MF"],
-        "birth_year": 1986,
-    },
-    "Per-Frick": {
-        "id": "374368f1",
-        "nationality": ["se"],
-        "position": ["FW"],
-        "birth_year": 1992,
-    },
-    "Diego-Fumaca": {
-        "id": "5c308aa7",
-        "nationality": ["br"],
-        "position": ["MF"],
-        "birth_year": 1994,
-    },
-    "Jeffrey-Gal": {
-        "id": "a689bb06",
-        "nationality": ["se"],
-        "position": ["GK"],
-        "birth_year": 1993,
-    },
-    "Romain-Gall": {
-        "id": "3da8cba0",
-        "nationality": ["us"],
-        "position": ["FW"],
-        "birth_year": 1995,
-    },
-    "Hussain-Ghasem": {"id": "baf67112", "nationality": ["iq"], "position": ["DF"]},
-    "Armin-Gigovic": {
-        "id": "d0a0858e",
-        "nationality": ["se"],
-        "position": ["MF"],
-        "birth_year": 2002,
-    },
-    "Ervin-Gigovic": {
-        "id": "ec9dea73",
-        "nationality": ["se"],
-        "position": ["MF"],
-        "birth_year": 2003,
-    },
-    "Gustav-Granath": {
-        "id": "52cf894f",
-        "nationality": ["se"],
-        "position": ["DF"],
-        "birth_year": 1997,
-    },
-    "Christos-Gravius": {
-        "id": "9f10b799",
-        "nationality": ["se"],
-        "position": ["MF"],
-        "birth_year": 1997,
-    },
-    "John-Guidetti": {
-        "id": "99bebd12",
-        "nationality": ["se"],
-        "position": ["FW"],
-        "birth_year": 1992,
-    },
-    "Samuel-Gustafson": {
-        "id": "b1e61f23",
-        "nationality": ["se"],
-        "position": ["MF"],
-        "birth_year": 1995,
-    },
-    "Simon-Gustafson": {
-        "id": "d7556379",
-        "nationality": ["se"],
-        "position": ["MF"],
-        "birth_year": 1995,
-    },
-    "Carl-Gustafsson": {
-        "id": "c7834633",
-        "nationality": ["se"],
-        "position": ["MF"],
-        "birth_year": 2000,
-    },
-    "Hampus-Gustafsson": {
-        "id": "539ff6b4",
-        "nationality": ["se"],
-        "position": ["GK"],
-        "birth_year": 2001,
-    },
-    "Viktor-Gustafsson": {
-        "id": "385c6006",
-        "nationality": ["se"],
-        "position": ["MF"],
-        "birth_year": 1995,
-    },
-    "Jesper-Gustavsson": {
-        "id": "34376913",
-        "nationality": ["se"],
-        "position": ["MF"],
-        "birth_year": 1994,
-    },
-    "Sveinn-Gu\u00f0johnsen": {
-        "id": "6a7bdb3f",
-        "nationality": ["is"],
-        "position": ["FW", "MF"],
-        "birth_year": 1998,
-    },
-    "Joe-Gyau": {
-        "id": "3511b4f8",
-        "nationality": ["us"],
-        "position": ["MF", "DF"],
-        "birth_year": 1992,
-    },
-    "Dennis-Hadzikadunic": {
-        "id": "82cfae2a",
-        "nationality": ["ba"],
-        "position": ["DF"],
-        "birth_year": 1998,
-    },
-    "Warner-Hahn": {
-        "id": "4117e3f3",
-        "nationality": ["sr"],
-        "position": ["GK"],
-        "birth_year": 1992,
-    },
-    "Sead-Haksabanovi\u0107": {
-        "id": "d2fd7c14",
-        "nationality": ["me"],
-        "position": ["FW"],
-        "birth_year": 1999,
-    },
-    "Jetmir-Haliti": {
-        "id": "7a381b1f",
-        "nationality": ["xk"],
-        "position": ["DF"],
-        "birth_year": 1996,
-    },
-    "Assad-Al-Islam-Al-Hamlawi": {
-        "id": "4dd7212c",
-        "nationality": ["se"],
-        "position": ["FW", "MF"],
-        "birth_year": 2000,
-    },
-    "Johan-Hammar": {
-        "id": "9dc0fa97",
-        "nationality": ["se"],
-        "position": ["DF"],
-        "birth_year": 1994,
-    },
-    "Fredrik-Hammer": {
-        "id": "78eac916",
-        "nationality": ["se"],
-        "position": ["MF"],
-        "birth_year": 2001,
-    },
-    "Kristoffer-Hansen": {
-        "id": "9e3e5d05",
-        "nationality": ["dk"],
-        "position": ["DF"],
-        "birth_year": 2002,
-    },
-    "Adam-Hellborg": {
-        "id": "19bb1ad8",
-        "nationality": ["se"],
-        "position": ["MF"],
-        "birth_year": 1998,
-    },
-    "Fritiof-Hellichius": {
-        "id": "443789e1",
-        "nationality": ["se"],
-        "position": ["MF"],
-        "birth_year": 2003,
-    },
-    "Emil-Hellman": {
-        "id": "ea457087",
-        "nationality": ["se"],
-        "position": ["DF"],
-        "birth_year": 2001,
-    },
-    "Gustav-Henriksson": {
-        "id": "c34824b1",
-        "nationality": ["se"],
-        "position": ["DF"],
-        "birth_year": 1998,
-    },
-    "Isak-Hien": {
-        "id": "12806697",
-        "nationality": ["se"],
-        "position": ["DF"],
-        "birth_year": 1999,
-    },
-    "Kadir-Hodzic": {
-        "id": "2cf7a1e8",
-        "nationality": ["se"],
-        "position": ["DF"],
-        "birth_year": 1994,
-    },
-    "Kalle-Holmberg": {
-        "id": "1b7acd94",
-        "nationality": ["se"],
-        "position": ["FW"],
-        "birth_year": 1993,
-    },
-    "Kevin-Holm\u00e9n": {
-        "id": "fdd39574",
-        "nationality": ["se"],
-        "position": ["MF"],
-        "birth_year": 2001,
-    },
-    "Sebastian-Holm\u00e9n": {
-        "id": "17138f9d",
-        "nationality": ["se"],
-        "position": ["DF"],
-        "birth_year": 1992,
-    },
-    "Even-Hovland": {
-        "id": "d1fea02e",
-        "nationality": ["no"],
-        "position": ["DF"],
-        "birth_year": 1989,
-    },
-    "Niklas-Hult": {
-        "id": "497228f9",
-        "nationality": ["se"],
-        "position": ["DF"],
-        "birth_year": 1990,
-    },
-    "Bilal-Hussein": {
-        "id": "aff07507",
-        "nationality": ["se"],
-        "position": ["MF"],
-        "birth_year": 2000,
-    },
-    "Jo-Inge-Berget": {
-        "id": "f512a009",
-        "nationality": ["no"],
-        "position": ["FW", "MF"],
-        "birth_year": 1990,
-    },
-    "Leon-Isa": {
-        "id": "39655292",
-        "nationality": ["se"],
-        "position": ["MF"],
-        "birth_year": 2005,
-    },
-    "Erik-Israelsson": {
-        "id": "e8ce206e",
-        "nationality": ["se"],
-        "position": ["MF"],
-        "birth_year": 1989,
-    },
-    "Alexander-Jallow": {
-        "id": "b04dff15",
-        "nationality": ["se"],
-        "position": ["DF"],
-        "birth_year": 1998,
-    },
-    "Budimir-Jano\u0161evi\u0107": {
-        "id": "26d26396",
-        "nationality": ["rs"],
-        "position": ["GK"],
-        "birth_year": 1989,
-    },
-    "Isak-Jansson": {
-        "id": "a7664548",
-        "nationality": ["se"],
-        "position": ["FW", "MF"],
-        "birth_year": 2002,
-    },
-    "Oscar-Jansson": {
-        "id": "a33c4ee2",
-        "nationality": ["se"],
-        "position": ["GK"],
-        "birth_year": 1990,
-    },
-    "Maudo-Jarju\u00e9": {
-        "id": "d4945a62",
-        "nationality": ["gm"],
-        "position": ["DF"],
-        "birth_year": 1997,
-    },
-    "Mohanad-Jeahze": {
-        "id": "ea93bcd9",
-        "nationality": ["iq"],
-        "position": ["DF"],
-        "birth_year": 1997,
-    },
-    "Jean": {
-        "id": "50b5a935",
-        "nationality": ["br"],
-        "position": ["MF"],
-        "birth_year": 1995,
-    },
-    "Kevin-Jensen": {
-        "id": "40140ea3",
-        "nationality": ["se"],
-        "position": ["FW"],
-        "birth_year": 2001,
-    },
-    "Alexander-Jeremejeff": {
-        "id": "54394643",
-        "nationality": ["se"],
-        "position": ["FW"],
-        "birth_year": 1993,
-    },
-    "Bernardo-Jeronimo": {
-        "id": "b611d0d6",
-        "nationality": ["br"],
-        "position": ["DF"],
-        "birth_year": 1998,
-    },
-    "Kalle-Joelsson": {
-        "id": "69ba128d",
-        "nationality": ["se"],
-        "position": ["GK"],
-        "birth_year": 1998,
-    },
-    "Alexander-Johansson": {
-        "id": "94180993",
-        "nationality": ["se"],
-        "position": ["MF", "FW"],
-        "birth_year": 1995,
-    },
-    "Carl-Johansson": {
-        "id": "02f7a79a",
-        "nationality": ["se"],
-        "position": ["DF"],
-        "birth_year": 1994,
-    },
-    "Herman-Johansson": {
-        "id": "6f864562",
-        "nationality": ["se"],
-        "position": ["MF", "FW"],
-        "birth_year": 1997,
-    },
-    "Oscar-Johansson": {
-        "id": "0db3fcba",
-        "nationality": ["se"],
-        "position": ["FW", "MF"],
-        "birth_year": 1995,
-    },
-    "Piotr-Johansson": {
-        "id": "5a471a3e",
-        "nationality": ["se"],
-        "position": ["DF"],
-        "birth_year": 1995,
-    },
-    "Melker-Jonsson": {
-        "id": "00ac1b19",
-        "nationality": ["se"],
-        "position": ["DF"],
-        "birth_year": 2002,
-    },
-    "Oscar-Jonsson": {
-        "id": "84b6d7ca",
-        "nationality": ["se"],
-        "position": ["GK"],
-        "birth_year": 1997,
-    },
-    "Rasmus-J\u00f6nsson": {
-        "id": "bc7f2706",
-        "nationality": ["se"],
-        "position": ["MF", "FW"],
-        "birth_year": 1990,
-    },
-    "Eliton-Junior": {
-        "id": "31ac9454",
-        "nationality": ["br"],
-        "position": ["MF", "FW"],
-        "birth_year": 1998,
-    },
-    "Arian-Kabashi": {
-        "id": "ce415d88",
-        "nationality": ["xk"],
-        "position": ["DF"],
-        "birth_year": 1996,
-    },
-    "Elliot-K\u00e4ck": {
-        "id": "e8f80c49",
-        "nationality": ["se"],
-        "position": ["DF"],
-        "birth_year": 1989,
-    },
-    "Adam-Kaied": {
-        "id": "b15151d5",
-        "nationality": ["se"],
-        "position": ["FW"],
-        "birth_year": 2002,
-    },
-    "Rasmus-Karjalainen": {
-        "id": "ee016483",
-        "nationality": ["fi"],
-        "position": ["MF"],
-        "birth_year": 1996,
-    },
-    "Johan-Karlsson": {
-        "id": "03ee1876",
-        "nationality": ["se"],
-        "position": ["MF", "FW"],
-        "birth_year": 1997,
-    },
-    "Patrik-Karlsson-Lagemyr": {
-        "id": "177bc5c2",
-        "nationality": ["se"],
-        "position": ["FW", "MF"],
-        "birth_year": 1996,
-    },
-    "Per-Karlsson": {
-        "id": "766caf38",
-        "nationality": ["se"],
-        "position": ["DF"],
-        "birth_year": 1986,
-    },
-    "Tobias-Karlsson": {
-        "id": "29f54da0",
-        "nationality": ["se"],
-        "position": ["DF"],
-        "birth_year": 1995,
-    },
-    "Victor-Karlsson": {
-        "id": "a1e70080",
-        "nationality": ["se"],
-        "position": ["MF", "FW"],
-        "birth_year": 2001,
-    },
-    "William-Kenndal": {
-        "id": "220b4575",
-        "nationality": ["se"],
-        "position": ["MF"],
-        "birth_year": 1996,
-    },
-    "Abdul-Khalili": {
-        "id": "668c0227",
-        "nationality": ["se"],
-        "position": ["MF"],
-        "birth_year": 1992,
-    },
-    "Isaac-Kiese-Thelin": {
-        "id": "b956af7d",
-        "nationality": ["se"],
-        "position": ["FW"],
-        "birth_year": 1992,
-    },
-    "Jakob-Kindberg": {
-        "id": "cfdf1bfe",
-        "nationality": ["se"],
-        "position": ["GK"],
-        "birth_year": 1994,
-    },
-    "Jonas-Knudsen": {
-        "id": "ec48abb1",
-        "nationality": ["dk"],
-        "position": ["DF"],
-        "birth_year": 1992,
-    },
-    "Christian-Kouakou": {
-        "id": "32f1bc0f",
-        "nationality": ["se"],
-        "position": ["FW"],
-        "birth_year": 1995,
-    },
-    "Anton-Kralj": {
-        "id": "d935c83b",
-        "nationality": ["se"],
-        "position": ["DF", "MF"],
-        "birth_year": 1998,
-    },
-    "Dion-Krasniqi": {"id": "5a290e60", "position": ["FW"]},
-    "Daniel-Krezic": {
-        "id": "1fdbc6b7",
-        "nationality": ["mk"],
-        "position": ["MF"],
-        "birth_year": 1996,
-    },
-    "Ivan-Kri\u010dak": {
-        "id": "1f490a0c",
-        "nationality": ["rs"],
-        "position": ["DF"],
-        "birth_year": 1996,
-    },
-    "Des-Kunst": {
-        "id": "a53e8fce",
-        "nationality": ["nl"],
-        "position": ["MF", "FW"],
-        "birth_year": 1999,
-    },
-    "Edvin-Kurtulus": {
-        "id": "5b136c33",
-        "nationality": ["se"],
-        "position": ["DF"],
-        "birth_year": 2000,
-    },
-    "Gustaf-Lagerbielke": {
-        "id": "9e39fa2d",
-        "nationality": ["se"],
-        "position": ["DF"],
-        "birth_year": 2000,
-    },
-    "Sebastian-Lagerlund": {
-        "id": "3de5c9a7",
-        "nationality": ["se"],
-        "position": ["MF"],
-        "birth_year": 2002,
-    },
-    "Mayckel-Lahdo": {
-        "id": "6b390f32",
-        "nationality": ["se"],
-        "position": ["FW"],
-        "birth_year": 2002,
-    },
-    "Andreas-Landgren": {
-        "id": "6fe18a46",
-        "nationality": ["se"],
-        "position": ["DF", "MF"],
-        "birth_year": 1989,
-    },
-    "Karl-Larson": {
-        "id": "5329a699",
-        "nationality": ["se"],
-        "position": ["MF", "DF"],
-        "birth_year": 1991,
-    },
-    "Alexander-Larsson": {"id": "485a7f01", "position": ["MF"]},
-    "Eric-Larsson": {
-        "id": "8474cb83",
-        "nationality": ["se"],
-        "position": ["DF"],
-        "birth_year": 1991,
-    },
-    "Hugo-Larsson": {
-        "id": "00c9a283",
-        "nationality": ["se"],
-        "position": ["MF"],
-        "birth_year": 2004,
-    },
-    "Johan-Larsson": {
-        "id": "fe006f82",
-        "nationality": ["se"],
-        "position": ["DF"],
-        "birth_year": 1990,
-    },
-    "Jordan-Larsson": {
-        "id": "72984eee",
-        "nationality": ["se"],
-        "position": ["FW"],
-        "birth_year": 1997,
-    },
-    "Seb-Larsson": {
-        "id": "b26efc36",
-        "nationality": ["se"],
-        "position": ["MF"],
-        "birth_year": 1985,
-    },
-    "Victor-Larsson": {"id": "9771da8c", "position": ["DF", "MF"]},
-    "Forrest-Lasso": {
-        "id": "f4720161",
-        "nationality": ["us"],
-        "position": ["DF"],
-        "birth_year": 1993,
-    },
-    "Luke-Le-Roux": {
-        "id": "e30117aa",
-        "nationality": ["za"],
-        "position": ["MF"],
-        "birth_year": 2000,
-    },
-    "Jonathan-Levi": {
-        "id": "abcfaa50",
-        "nationality": ["se"],
-        "position": ["FW", "MF"],
-        "birth_year": 1996,
-    },
-    "Oscar-Lewicki": {
-        "id": "0c09c984",
-        "nationality": ["se"],
-        "position": ["MF", "DF"],
-        "birth_year": 1992,
-    },
-    "Anton-Liljenb\u00e4ck": {
-        "id": "bbc47841",
-        "nationality": ["se"],
-        "position": ["DF", "MF"],
-        "birth_year": 1995,
-    },
-    "Lucas-Lima": {
-        "id": "e6d8cd15",
-        "nationality": ["se"],
-        "position": ["FW"],
-        "birth_year": 2002,
-    },
-    "Axel-Lindahl": {
-        "id": "eee8bff2",
-        "nationality": ["se"],
-        "position": ["DF", "MF"],
-        "birth_year": 1995,
-    },
-    "Anders-Lindegaard": {
-        "id": "636f1a28",
-        "nationality": ["dk"],
-        "position": ["GK"],
-        "birth_year": 1984,
-    },
-    "Erik-Lindell": {
-        "id": "d2f41096",
-        "nationality": ["se"],
-        "position": ["DF", "MF"],
-        "birth_year": 1996,
-    },
-    "Rasmus-Lindkvist": {
-        "id": "5004770a",
-        "nationality": ["se"],
-        "position": ["DF", "MF"],
-        "birth_year": 1990,
-    },
-    "Joakim-Lindner": {
-        "id": "62d86cad",
-        "nationality": ["se"],
-        "position": ["DF"],
-        "birth_year": 1991,
-    },
-    "Lucas-Lingman": {
-        "id": "f99360b9",
-        "nationality": ["fi"],
-        "position": ["MF"],
-        "birth_year": 1998,
-    },
-    "Wilhelm-Loeper": {
-        "id": "f0bbdbfe",
-        "nationality": ["se"],
-        "position": ["FW", "MF"],
-        "birth_year": 1998,
-    },
-    "Jesper-L\u00f6fgren": {
-        "id": "c02fedde",
-        "nationality": ["se"],
-        "position": ["DF"],
-        "birth_year": 1997,
-    },
-    "David-L\u00f6fquist": {
-        "id": "ccbf0746",
-        "nationality": ["se"],
-        "position": ["FW", "MF"],
-        "birth_year": 1986,
-    },
-    "Albin-Lohikangas": {
-        "id": "cd0c4265",
-        "nationality": ["se"],
-        "position": ["DF"],
-        "birth_year": 1998,
-    },
-    "Emmanuel-Lomotey": {
-        "id": "184ea16a",
-        "nationality": ["gh"],
-        "position": ["DF"],
-        "birth_year": 1997,
-    },
-    "Andri-Lucas-Gu\u00f0johnsen": {
-        "id": "25e60861",
-        "nationality": ["is"],
-        "position": ["FW"],
-        "birth_year": 2002,
-    },
-    "Gustav-Ludwigson": {
-        "id": "585fe2f8",
-        "nationality": ["se"],
-        "position": ["FW"],
-        "birth_year": 1993,
-    },
-    "Stojan-Luki\u0107": {
-        "id": "02dd033c",
-        "nationality": ["ba"],
-        "position": ["GK"],
-        "birth_year": 1979,
-    },
-    "Marco-Lund": {
-        "id": "9841dc99",
-        "nationality": ["dk"],
-        "position": ["DF"],
-        "birth_year": 1996,
-    },
-    "Viktor-Lundberg": {
-        "id": "c6b117f7",
-        "nationality": ["se"],
-        "position": ["FW", "MF"],
-        "birth_year": 1991,
-    },
-    "Valgeir-Lunddal-Fri\u00f0riksson": {
-        "id": "3945764e",
-        "nationality": ["is"],
-        "position": ["DF"],
-        "birth_year": 2001,
-    },
-    "Robert-Lundstr\u00f6m": {
-        "id": "ae412e9c",
-        "nationality": ["se"],
-        "position": ["DF", "MF"],
-        "birth_year": 1989,
-    },
-    "Ismet-Lushaku": {
-        "id": "94a51661",
-        "nationality": ["xk"],
-        "position": ["MF", "FW"],
-        "birth_year": 2000,
-    },
-    "Mikael-Lustig": {
-        "id": "54c9ed15",
-        "nationality": ["se"],
-        "position": ["DF"],
-        "birth_year": 1986,
-    },
-    "Montader-Madjed": {
-        "id": "048293db",
-        "nationality": ["se"],
-        "position": ["MF"],
-        "birth_year": 2005,
-    },
-    "Abdussalam-Magashy": {
-        "id": "5bd35cff",
-        "nationality": ["se"],
-        "position": ["MF"],
-        "birth_year": 1998,
-    },
-    "Richard-Magyar": {
-        "id": "61e6f01e",
-        "nationality": ["se"],
-        "position": ["DF"],
-        "birth_year": 1991,
-    },
-    "Peter-Makrillos": {
-        "id": "b3d4d065",
-        "nationality": ["au"],
-        "position": ["MF", "FW"],
-        "birth_year": 1995,
-    },
-    "Eman-Markovi\u0107": {
-        "id": "a091311f",
-        "nationality": ["no"],
-        "position": ["FW", "MF"],
-        "birth_year": 1999,
-    },
-    "Marcus-Mathisen": {
-        "id": "221a1641",
-        "nationality": ["dk"],
-        "position": ["DF"],
-        "birth_year": 1996,
-    },
-    "Tashreeq-Matthews": {
-        "id": "fd18e7a1",
-        "nationality": ["za"],
-        "position": ["FW", "MF"],
-        "birth_year": 2000,
-    },
-    "Benjamin-Mbunga-Kimpioka": {
-        "id": "6a3579d9",
-        "nationality": ["se"],
-        "position": ["FW"],
-        "birth_year": 2000,
-    },
-    "Joe-Mendes": {
-        "id": "f882b0a1",
-        "nationality": ["se"],
-        "position": ["DF"],
-        "birth_year": 2002,
-    },
-    "Gideon-Mensah": {
-        "id": "708ee0c0",
-        "nationality": ["gh"],
-        "position": ["MF", "DF"],
-        "birth_year": 2000,
-    },
-    "Jesper-Merbom-Adolfsson": {
-        "id": "8ffd9104",
-        "nationality": ["se"],
-        "position": ["DF"],
-        "birth_year": 1999,
-    },
-    "Alexander-Milo\u0161evi\u0107": {
-        "id": "2f065e3a",
-        "nationality": ["se"],
-        "position": ["DF"],
-        "birth_year": 1992,
-    },
-    "David-Mitov-Nilsson": {
-        "id": "34829444",
-        "nationality": ["mk"],
-        "position": ["GK"],
-        "birth_year": 1991,
-    },
-    "Niklas-Moisander": {
-        "id": "00844823",
-        "nationality": ["fi"],
-        "position": ["DF"],
-        "birth_year": 1985,
-    },
-    "Gustav-Molin": {
-        "id": "677fcc50",
-        "nationality": ["se"],
-        "position": ["GK"],
-        "birth_year": 2002,
-    },
-    "Albin-M\u00f6rfelt": {
-        "id": "885b817b",
-        "nationality": ["se"],
-        "position": ["MF", "FW"],
-        "birth_year": 2000,
-    },
-    "Mamudo-Moro": {
-        "id": "79c65b89",
-        "nationality": ["gh"],
-        "position": ["FW"],
-        "birth_year": 1995,
-    },
-    "Carlos-Moros-Garcia": {
-        "id": "defa2ae9",
-        "nationality": ["es"],
-        "position": ["DF"],
-        "birth_year": 1993,
-    },
-    "Christian-Moses": {
-        "id": "c9ce5935",
-        "nationality": ["sl"],
-        "position": ["FW"],
-        "birth_year": 1993,
-    },
-    "Amar-Muhsin": {
-        "id": "efb2c836",
-        "nationality": ["iq"],
-        "position": ["FW"],
-        "birth_year": 1997,
-    },
-    "Ronald-Mukiibi": {
-        "id": "b2f1fbd5",
-        "nationality": ["ug"],
-        "position": ["DF"],
-        "birth_year": 1991,
-    },
-    "Isak-Mulugeta": {
-        "id": "d339c444",
-        "nationality": ["se"],
-        "position": ["MF"],
-        "birth_year": 2006,
-    },
-    "Adi-Nalic": {
-        "id": "ad597bf7",
-        "nationality": ["ba"],
-        "position": ["MF"],
-        "birth_year": 1997,
-    },
-    "Sebastian-Nanasi": {
-        "id": "ce747d2a",
-        "nationality": ["se"],
-        "position": ["MF", "FW"],
-        "birth_year": 2002,
-    },
-    "Hampus-N\u00e4sstr\u00f6m": {
-        "id": "687b2185",
-        "nationality": ["se"],
-        "position": ["MF"],
-        "birth_year": 1994,
-    },
-    "Ludvig-N\u00e5vik": {
-        "id": "2818e13b",
-        "nationality": ["se"],
-        "position": ["MF"],
-        "birth_year": 2003,
-    },
-    "Nahom-Netabay": {
-        "id": "fc5e209e",
-        "nationality": ["se"],
-        "position": ["MF", "FW"],
-        "birth_year": 1994,
-    },
-    "Netinho": {
-        "id": "09093448",
-        "nationality": ["br"],
-        "position": ["DF", "FW"],
-        "birth_year": 1994,
-    },
-    "Lasse-Nielsen": {
-        "id": "06e5b0e4",
-        "nationality": ["dk"],
-        "position": ["DF"],
-        "birth_year": 1988,
-    },
-    "Anton-Nilsson": {
-        "id": "2f84cbcb",
-        "nationality": ["se"],
-        "position": ["FW"],
-        "birth_year": 2004,
-    },
-    "Joel-Nilsson": {
-        "id": "6e5e4890",
-        "nationality": ["se"],
-        "position": ["FW"],
-        "birth_year": 1994,
-    },
-    "Sebastian-Nilsson": {
-        "id": "03a040bc",
-        "nationality": ["se"],
-        "position": ["MF"],
-        "birth_year": 2003,
-    },
-    "William-Nilsson": {
-        "id": "bad1b99a",
-        "nationality": ["se"],
-        "position": ["FW"],
-        "birth_year": 2004,
-    },
-    "Kristoffer-Nordfeldt": {
-        "id": "78549904",
-        "nationality": ["se"],
-        "position": ["GK"],
-        "birth_year": 1989,
-    },
-    "Gustaf-Norlin": {
-        "id": "f4b1ae84",
-        "nationality": ["se"],
-        "position": ["FW", "MF"],
-        "birth_year": 1997,
-    },
-    "Patrick-Nwadike": {
-        "id": "b2cbe3ad",
-        "nationality": ["se"],
-        "position": ["DF"],
-        "birth_year": 1998,
-    },
-    "Silas-Nwankwo": {
-        "id": "8cd6e788",
-        "nationality": ["ng"],
-        "position": ["FW"],
-        "birth_year": 2003,
-    },
-    "Alfons-Nygaard": {
-        "id": "18ea772e",
-        "nationality": ["se"],
-        "position": ["FW"],
-        "birth_year": 2002,
-    },
-    "Christoffer-Nyman": {
-        "id": "f9e3ef15",
-        "nationality": ["se"],
-        "position": ["FW"],
-        "birth_year": 1992,
-    },
-    "Sebastian-Ohlsson": {
-        "id": "335278f4",
-        "nationality": ["se"],
-        "position": ["DF"],
-        "birth_year": 1992,
-    },
-    "Jeppe-Okkels": {
-        "id": "c3b0f15f",
-        "nationality": ["dk"],
-        "position": ["FW", "MF"],
-        "birth_year": 1999,
-    },
-    "Dav\u00ed\u00f0-\u00d3lafsson": {
-        "id": "23310e9f",
-        "nationality": ["is"],
-        "position": ["DF", "MF"],
-        "birth_year": 1995,
-    },
-    "Lars-Olden-Larsen": {
-        "id": "9e4df3ba",
-        "nationality": ["no"],
-        "position": ["FW", "MF"],
-        "birth_year": 1998,
-    },
-    "Dennis-Olsson": {
-        "id": "5e1883dd",
-        "nationality": ["se"],
-        "position": ["FW", "MF"],
-        "birth_year": 1999,
-    },
-    "Filip-Olsson": {
-        "id": "03083eb8",
-        "nationality": ["se"],
-        "position": ["MF", "FW"],
-        "birth_year": 1999,
-    },
-    "Martin-Olsson": {
-        "id": "2f72f79e",
-        "nationality": ["se"],
-        "position": ["DF", "MF"],
-        "birth_year": 1988,
-    },
-    "Simon-Olsson": {
-        "id": "0a4a1821",
-        "nationality": ["se"],
-        "position": ["MF"],
-        "birth_year": 1997,
-    },
-    "Jacob-Ondrejka": {
-        "id": "752e09ed",
-        "nationality": ["se"],
-        "position": ["FW", "MF"],
-        "birth_year": 2002,
-    },
-    "Rasmus-\u00d6rqvist": {
-        "id": "d2f11b42",
-        "nationality": ["se"],
-        "position": ["MF", "FW"],
-        "birth_year": 1998,
-    },
-    "Jacob-Ortmark": {
-        "id": "e8f5c328",
-        "nationality": ["se"],
-        "position": ["MF"],
-        "birth_year": 1997,
-    },
-    "Eric-Ouma": {
-        "id": "0c9b07a7",
-        "nationality": ["ke"],
-        "position": ["DF", "MF"],
-        "birth_year": 1996,
-    },
-    "Timothy-Ouma": {
-        "id": "c76c4e99",
-        "nationality": ["ke"],
-        "position": ["MF"],
-        "birth_year": 2004,
-    },
-    "Sotirios-Papagiannopoulos": {
-        "id": "da617483",
-        "nationality": ["se"],
-        "position": ["DF"],
-        "birth_year": 1990,
-    },
-    "Bj\u00f8rn-Paulsen": {
-        "id": "3f88e797",
-        "nationality": ["dk"],
-        "position": ["MF", "DF"],
-        "birth_year": 1991,
-    },
-    "Sergio-Pe\u00f1a": {
-        "id": "eda8506a",
-        "nationality": ["pe"],
-        "position": ["MF"],
-        "birth_year": 1995,
-    },
-    "Noah-Persson": {
-        "id": "8830d81d",
-        "nationality": ["se"],
-        "position": ["MF"],
-        "birth_year": 2003,
-    },
-    "Paya-Pichkah": {
-        "id": "cbdaa6cf",
-        "nationality": ["se"],
-        "position": ["MF", "FW"],
-        "birth_year": 2000,
-    },
-    "Shaquille-Pinas": {
-        "id": "1fd1df9c",
-        "nationality": ["sr"],
-        "position": ["DF"],
-        "birth_year": 1998,
-    },
-    "Ahmed-Qasem": {
-        "id": "27219ecb",
-        "nationality": ["se"],
-        "position": ["MF"],
-        "birth_year": 2003,
-    },
-    "Amin-Raafat": {
-        "id": "f7e70950",
-        "nationality": ["iq"],
-        "position": ["FW", "MF"],
-        "birth_year": 2003,
-    },
-    "Haris-Radetinac": {
-        "id": "76c24535",
-        "nationality": ["ba"],
-        "position": ["FW", "DF"],
-        "birth_year": 1985,
-    },
-    "H\u00e1kon-Rafn-Valdimarsson": {
-        "id": "57a34cf4",
-        "nationality": ["is"],
-        "position": ["GK"],
-        "birth_year": 2001,
-    },
-    "Adhavan-Rajamohan": {
-        "id": "8282fc56",
-        "nationality": ["se"],
-        "position": ["FW", "MF"],
-        "birth_year": 1993,
-    },
-    "Erdal-Rakip": {
-        "id": "e150254d",
-        "nationality": ["mk"],
-        "position": ["MF"],
-        "birth_year": 1996,
-    },
-    "Jonathan-Rasheed": {
-        "id": "30b7d942",
-        "nationality": ["no"],
-        "position": ["GK"],
-        "birth_year": 1991,
-    },
-    "Heradi-Rashidi": {
-        "id": "8f120228",
-        "nationality": ["se"],
-        "position": ["MF"],
-        "birth_year": 1994,
-    },
-    "Theodore-Rask": {
-        "id": "d73d430b",
-        "nationality": ["se"],
-        "position": ["MF"],
-        "birth_year": 2000,
-    },
-    "Jacob-Redenfors": {"id": "3e20cdb8", "position": ["MF"]},
-    "Philip-Rejnhold": {
-        "id": "c966c8a2",
-        "nationality": ["dk"],
-        "position": ["DF"],
-        "birth_year": 1996,
-    },
-    "S\u00f8ren-Rieks": {
-        "id": "572498c7",
-        "nationality": ["dk"],
-        "position": ["MF", "FW"],
-        "birth_year": 1987,
-    },
-    "Erik-Ring": {
-        "id": "9bc48002",
-        "nationality": ["se"],
-        "position": ["MF"],
-        "birth_year": 2002,
-    },
-    "Jamie-Roche": {
-        "id": "dbdbddb0",
-        "nationality": ["se"],
-        "position": ["MF"],
-        "birth_year": 2001,
-    },
-    "Filip-Rogi\u0107": {
-        "id": "57abcd1a",
-        "nationality": ["se"],
-        "position": ["MF", "DF"],
-        "birth_year": 1993,
-    },
-    "Thomas-Rogne": {
-        "id": "86b3d4cc",
-        "nationality": ["no"],
-        "position": ["DF"],
-        "birth_year": 1990,
-    },
-    "Rom\u00e1rio": {
-        "id": "596e48ce",
-        "nationality": ["br"],
-        "position": ["MF"],
-        "birth_year": 1985,
-    },
-    "Amane-Romeo": {"id": "e134b9f9", "position": ["MF"]},
-    "Tim-R\u00f6nning": {
-        "id": "8e833ce2",
-        "nationality": ["se"],
-        "position": ["GK"],
-        "birth_year": 1999,
-    },
-    "Otto-Rosengren": {"id": "1c6f0559", "position": ["MF"]},
-    "Mikkel-Rygaard-Jensen": {
-        "id": "5f3a46fb",
-        "nationality": ["eng"],
-        "position": ["MF"],
-        "birth_year": 1990,
-    },
-    "Andr\u00e9-R\u00f8mer": {
-        "id": "fa6d26d9",
-        "nationality": ["dk"],
-        "position": ["MF"],
-        "birth_year": 1993,
-    },
-    "Sean-Sabetkar": {
-        "id": "bdc92001",
-        "nationality": ["se"],
-        "position": ["DF"],
-        "birth_year": 1995,
-    },
-    "Besard-Sabovic": {
-        "id": "6fde84aa",
-        "nationality": ["se"],
-        "position": ["MF"],
-        "birth_year": 1998,
-    },
-    "Filip-Sachpekidis": {
-        "id": "08252569",
-        "nationality": ["se"],
-        "position": ["FW", "DF"],
-        "birth_year": 1997,
-    },
-    "Loret-Sadiku": {
-        "id": "ec5867a5",
-        "nationality": ["al"],
-        "position": ["MF"],
-        "birth_year": 1991,
-    },
-    "Ibrahim-Sadiq": {
-        "id": "9200d432",
-        "nationality": ["gh"],
-        "position": ["FW"],
-        "birth_year": 2000,
-    },
-    "Abdelrahman-Saidi": {
-        "id": "c456358e",
-        "nationality": ["se"],
-        "position": ["FW"],
-        "birth_year": 1999,
-    },
-    "Abundance-Salaou": {"id": "cfc794fb", "position": ["MF"]},
-    "Dino-Salihovic": {
-        "id": "3be274de",
-        "nationality": ["se"],
-        "position": ["MF"],
-        "birth_year": 2002,
-    },
-    "Saidu-Salisu": {"id": "cf5e0d15", "position": ["FW"]},
-    "Justin-Salmon": {
-        "id": "7edc50a0",
-        "nationality": ["lr"],
-        "position": ["MF"],
-        "birth_year": 1999,
-    },
-    "Emil-Salomonsson": {
-        "id": "9e092a09",
-        "nationality": ["se"],
-        "position": ["DF"],
-        "birth_year": 1989,
-    },
-    "Tobias-Sana": {
-        "id": "52a7bcfe",
-        "nationality": ["se"],
-        "position": ["MF"],
-        "birth_year": 1989,
-    },
-    "Simon-Sandberg": {
-        "id": "05b00fef",
-        "nationality": ["se"],
-        "position": ["DF"],
-        "birth_year": 1994,
-    },
-    "Rasmus-Sch\u00fcller": {
-        "id": "0e624c72",
-        "nationality": ["fi"],
-        "position": ["MF"],
-        "birth_year": 1991,
-    },
-    "Patriot-Sejdiu": {
-        "id": "57d9707f",
-        "nationality": ["xk"],
-        "position": ["FW", "MF"],
-        "birth_year": 2000,
-    },
-    "Astrit-Seljmani": {
-        "id": "830a34ec",
-        "nationality": ["xk"],
-        "position": ["FW"],
-        "birth_year": 1997,
-    },
-    "Maic-Sema": {
-        "id": "de78cee4",
-        "nationality": ["se"],
-        "position": ["MF", "FW"],
-        "birth_year": 1988,
-    },
-    "Laorent-Shabani": {
-        "id": "4c8ad16c",
-        "nationality": ["se"],
-        "position": ["MF"],
-        "birth_year": 1999,
-    },
-    "Noah-Shamoun": {
-        "id": "cb75ed1e",
-        "nationality": ["se"],
-        "position": ["FW", "MF"],
-        "birth_year": 2002,
-    },
-    "Collins-Shichenje": {
-        "id": "2934dd4e",
-        "nationality": ["ke"],
-        "position": ["DF"],
-        "birth_year": 2003,
-    },
-    "Mahame-Siby": {
-        "id": "6d075c67",
-        "nationality": ["ml"],
-        "position": ["MF"],
-        "birth_year": 1996,
-    },
-    "Arn\u00f3r-Sigur\u00f0sson": {
-        "id": "f209b81e",
-        "nationality": ["is"],
-        "position": ["MF", "FW"],
-        "birth_year": 1999,
-    },
-    "Pontus-Silfwer": {
-        "id": "47d4d6ee",
-        "nationality": ["se"],
-        "position": ["MF"],
-        "birth_year": 1991,
-    },
-    "Taylor-Silverholt": {
-        "id": "868b9f43",
-        "nationality": ["se"],
-        "position": ["FW"],
-        "birth_year": 2001,
-    },
-    "Moonga-Simba": {
-        "id": "651ebf75",
-        "nationality": ["se"],
-        "position": ["MF"],
-        "birth_year": 2000,
-    },
-    "Robin-Simovi\u0107": {
-        "id": "4a4d38ca",
-        "nationality": ["se"],
-        "position": ["FW"],
-        "birth_year": 1991,
-    },
-    "Filipe-Siss\u00e9": {
-        "id": "669ad1c2",
-        "nationality": ["pt"],
-        "position": ["MF"],
-        "birth_year": 2001,
-    },
-    "Rasmus-Sj\u00f6stedt": {
-        "id": "b8b8b314",
-        "nationality": ["se"],
-        "position": ["DF"],
-        "birth_year": 1992,
-    },
-    "Simon-Skrabb": {
-        "id": "45af5134",
-        "nationality": ["fi"],
-        "position": ["FW", "MF"],
-        "birth_year": 1995,
-    },
-    "Noah-S\u00f6derberg": {
-        "id": "23562628",
-        "nationality": ["se"],
-        "position": ["MF"],
-        "birth_year": 2001,
-    },
-    "Momodou-Sonko": {
-        "id": "fd0a98c8",
-        "nationality": ["se"],
-        "position": ["FW"],
-        "birth_year": 2005,
-    },
-    "Erik-Sorga": {
-        "id": "02ba67a2",
-        "nationality": ["ee"],
-        "position": ["FW"],
-        "birth_year": 1999,
-    },
-    "Isak-Ssewankambo": {
-        "id": "d457def7",
-        "nationality": ["se"],
-        "position": ["DF"],
-        "birth_year": 1996,
-    },
-    "Adam-St\u00e5hl": {
-        "id": "840207c9",
-        "nationality": ["se"],
-        "position": ["MF"],
-        "birth_year": 1994,
-    },
-    "Oliver-Stanisic": {
-        "id": "b884c338",
-        "nationality": ["se"],
-        "position": ["DF"],
-        "birth_year": 1994,
-    },
-    "Nicol\u00e1s-Stefanelli": {
-        "id": "21a529cf",
-        "nationality": ["ar"],
-        "position": ["MF", "FW"],
-        "birth_year": 1994,
-    },
-    "Johan-Stenmark": {
-        "id": "a5a1a033",
-        "nationality": ["se"],
-        "position": ["DF"],
-        "birth_year": 1999,
-    },
-    "Teodor-Stenshagen": {
-        "id": "8c3c58e3",
-        "nationality": ["se"],
-        "position": ["DF"],
-        "birth_year": 2001,
-    },
-    "Daniel-Stensson": {
-        "id": "89baf4bf",
-        "nationality": ["se"],
-        "position": ["MF"],
-        "birth_year": 1997,
-    },
-    "Simon-Strand": {
-        "id": "2df964cf",
-        "nationality": ["se"],
-        "position": ["DF"],
-        "birth_year": 1993,
-    },
-    "Tom-Strannegard": {
-        "id": "e2da3e4e",
-        "nationality": ["se"],
-        "position": ["MF"],
-        "birth_year": 2002,
-    },
-    "Yukiya-Sugita": {
-        "id": "8f7e132f",
-        "nationality": ["jp"],
-        "position": ["FW", "MF"],
-        "birth_year": 1993,
-    },
-    "Ali-Suljic": {
-        "id": "412b8ab6",
-        "nationality": ["se"],
-        "position": ["DF"],
-        "birth_year": 1997,
-    },
-    "Joel-Sundstr\u00f6m": {
-        "id": "b7df260f",
-        "nationality": ["se"],
-        "position": ["MF"],
-        "birth_year": 2001,
-    },
-    "Hannes-Sveijer": {
-        "id": "3df2d5aa",
-        "nationality": ["se"],
-        "position": ["GK"],
-        "birth_year": 2002,
-    },
-    "Gustav-Svensson": {
-        "id": "733713ef",
-        "nationality": ["se"],
-        "position": ["MF"],
-        "birth_year": 1987,
-    },
-    "Oskar-Sverrisson": {
-        "id": "5354a2a3",
-        "nationality": ["is"],
-        "position": ["DF", "MF"],
-        "birth_year": 1992,
-    },
-    "Williot-Swedberg": {
-        "id": "184fe4b2",
-        "nationality": ["se"],
-        "position": ["FW"],
-        "birth_year": 2004,
-    },
-    "Edi-Sylisufaj": {
-        "id": "dc84aa79",
-        "nationality": ["se"],
-        "position": ["FW"],
-        "birth_year": 2000,
-    },
-    "Lars-S\u00e6tra": {
-        "id": "40134a35",
-        "nationality": ["no"],
-        "position": ["DF"],
-        "birth_year": 1991,
-    },
-    "Franklin-Tebo": {
-        "id": "b37c5951",
-        "nationality": ["ng"],
-        "position": ["DF"],
-        "birth_year": 2000,
-    },
-    "Christopher-Telo": {
-        "id": "35e05d5b",
-        "nationality": ["se"],
-        "position": ["MF"],
-        "birth_year": 1989,
-    },
-    "Simon-Thern": {
-        "id": "3933becd",
-        "nationality": ["se"],
-        "position": ["MF"],
-        "birth_year": 1992,
-    },
-    "Vincent-Thill": {
-        "id": "7de29631",
-        "nationality": ["lu"],
-        "position": ["MF", "FW"],
-        "birth_year": 2000,
-    },
-    "Darrell-Tibell": {
-        "id": "e3da33fd",
-        "nationality": ["se"],
-        "position": ["MF"],
-        "birth_year": 2002,
-    },
-    "Robin-Tihi": {
-        "id": "0dc1390f",
-        "nationality": ["fi"],
-        "position": ["DF"],
-        "birth_year": 2002,
-    },
-    "Ola-Toivonen": {
-        "id": "de4fe7a2",
-        "nationality": ["se"],
-        "position": ["FW", "MF"],
-        "birth_year": 1986,
-    },
-    "Noel-T\u00f6rnqvist": {
-        "id": "6bf54cff",
-        "nationality": ["se"],
-        "position": ["GK"],
-        "birth_year": 2002,
-    },
-    "Tomas-Totland": {
-        "id": "8bb174fc",
-        "nationality": ["no"],
-        "position": ["DF"],
-        "birth_year": 1998,
-    },
-    "Robin-Tranberg": {
-        "id": "c1ba89bf",
-        "nationality": ["se"],
-        "position": ["MF"],
-        "birth_year": 1993,
-    },
-    "Bubacarr-Trawally": {
-        "id": "bfec24e0",
-        "nationality": ["gm"],
-        "position": ["MF", "FW"],
-        "birth_year": 1994,
-    },
-    "Filip-Trpchevski": {
-        "id": "b787f0aa",
-        "nationality": ["mk"],
-        "position": ["FW"],
-        "birth_year": 2003,
-    },
-    "Alexandros-Tsotidis": {
-        "id": "a6b0e600",
-        "nationality": ["se"],
-        "position": ["FW"],
-        "birth_year": 2004,
-    },
-    "Ravy-Tsouka": {
-        "id": "fb021e4c",
-        "nationality": ["cg"],
-        "position": ["DF"],
-        "birth_year": 1994,
-    },
-    "Blair-Turgott": {
-        "id": "2c272afa",
-        "nationality": ["jm"],
-        "position": ["FW"],
-        "birth_year": 1994,
-    },
-    "Oscar-Udden\u00e4s": {
-        "id": "b343386d",
-        "nationality": ["se"],
-        "position": ["FW"],
-        "birth_year": 2002,
-    },
-    "Tommi-Vaiho": {
-        "id": "8610da59",
-        "nationality": ["se"],
-        "position": ["GK"],
-        "birth_year": 1988,
-    },
-    "Leo-V\u00e4is\u00e4nen": {
-        "id": "93b56ba5",
-        "nationality": ["fi"],
-        "position": ["DF"],
-        "birth_year": 1997,
-    },
-    "Pilip-Vajciachovi\u010d": {
-        "id": "dc715d25",
-        "nationality": ["by"],
-        "position": ["GK"],
-        "birth_year": 1990,
-    },
-    "\u00d3li-Valur-\u00d3marsson": {
-        "id": "3e4fd3a8",
-        "nationality": ["is"],
-        "position": ["MF"],
-        "birth_year": 2003,
-    },
-    "Aleksandr-Vasyutin": {
-        "id": "61911828",
-        "nationality": ["ru"],
-        "position": ["GK"],
-        "birth_year": 1995,
-    },
-    "Adam-Vikman": {
-        "id": "677889a9",
-        "nationality": ["se"],
-        "position": ["MF"],
-        "birth_year": 2003,
-    },
-    "Oscar-Vilhelmsson": {
-        "id": "e7f4869a",
-        "nationality": ["se"],
-        "position": ["FW"],
-        "birth_year": 2003,
-    },
-    "Charlie-Vindehall": {
-        "id": "7a9d75c6",
-        "nationality": ["se"],
-        "position": ["MF", "DF"],
-        "birth_year": 1996,
-    },
-    "Jakob-Voelkerling": {
-        "id": "380e2a1d",
-        "nationality": ["se"],
-        "position": ["DF"],
-        "birth_year": 2000,
-    },
-    "Francis-de-Vries": {
-        "id": "90a63dda",
-        "nationality": ["nz"],
-        "position": ["DF"],
-        "birth_year": 1994,
-    },
-    "Dijan-Vukojevic": {
-        "id": "8e2d1c7a",
-        "nationality": ["se"],
-        "position": ["FW"],
-        "birth_year": 1995,
-    },
-    "Linus-Wahlqvist": {
-        "id": "15a7b2f3",
-        "nationality": ["se"],
-        "position": ["DF"],
-        "birth_year": 1996,
-    },
-    "Charlie-Weberg": {
-        "id": "a8182585",
-        "nationality": ["se"],
-        "position": ["DF"],
-        "birth_year": 1998,
-    },
-    "Wenderson": {
-        "id": "028c5f06",
-        "nationality": ["br"],
-        "position": ["MF", "FW"],
-        "birth_year": 1999,
-    },
-    "Oscar-Wendt": {
-        "id": "b69261a0",
-        "nationality": ["se"],
-        "position": ["DF"],
-        "birth_year": 1985,
-    },
-    "Felix-Wennergrund": {
-        "id": "9e9f2be2",
-        "nationality": ["se"],
-        "position": ["MF"],
-        "birth_year": 2001,
-    },
-    "Alfie-Whiteman": {
-        "id": "3f2587ee",
-        "nationality": ["eng"],
-        "position": ["GK"],
-        "birth_year": 1998,
-    },
-    "Casper-Widell": {
-        "id": "3d7f0ce3",
-        "nationality": ["se"],
-        "position": ["DF"],
-        "birth_year": 2003,
-    },
-    "Jacob-Widell-Zetterstr\u00f6m": {
-        "id": "ac5120d8",
-        "nationality": ["se"],
-        "position": ["GK"],
-        "birth_year": 1998,
-    },
-    "Dennis-Widgren": {
-        "id": "512a52c6",
-        "nationality": ["se"],
-        "position": ["MF", "DF"],
-        "birth_year": 1994,
-    },
-    "Rasmus-Wiedesheim": {
-        "id": "e23db68b",
-        "nationality": ["se"],
-        "position": ["FW", "MF"],
-        "birth_year": 1999,
-    },
-    "Gustav-Wikheim": {
-        "id": "063ae595",
-        "nationality": ["no"],
-        "position": ["FW"],
-        "birth_year": 1993,
-    },
-    "Freddy-Winsth": {
-        "id": "95c840ac",
-        "nationality": ["se"],
-        "position": ["DF"],
-        "birth_year": 1990,
-    },
-    "Kevin-Wright": {
-        "id": "7aea4231",
-        "nationality": ["sl"],
-        "position": ["MF"],
-        "birth_year": 1995,
-    },
-    "Magnus-W\u00f8rts": {
-        "id": "d9a29c01",
-        "nationality": ["dk"],
-        "position": ["MF", "DF"],
-        "birth_year": 1999,
-    },
-    "Kevin-Yakob": {
-        "id": "18d3b8df",
-        "nationality": ["se"],
-        "position": ["MF", "FW"],
-        "birth_year": 2000,
-    },
-    "Antonio-Yakoub": {
-        "id": "0169e670",
-        "nationality": ["se"],
-        "position": ["FW"],
-        "birth_year": 2002,
-    },
-    "Saku-Yl\u00e4tupa": {
-        "id": "ed87c761",
-        "nationality": ["fi"],
-        "position": ["MF", "FW"],
-        "birth_year": 1999,
-    },
-    "Ali-Youssef": {
-        "id": "2e820983",
-        "nationality": ["tn"],
-        "position": ["FW"],
-        "birth_year": 2000,
-    },
-    "Hampus-Zackrisson": {
-        "id": "6e784c33",
-        "nationality": ["se"],
-        "position": ["DF"],
-        "birth_year": 1994,
-    },
-    "Oliver-Zand\u00e9n": {
-        "id": "72d4922b",
-        "nationality": ["se"],
-        "position": ["DF"],
-        "birth_year": 2001,
-    },
-    "Moustafa-Zeidan": {
-        "id": "eca2b6b8",
-        "nationality": ["se"],
-        "position": ["MF"],
-        "birth_year": 1998,
-    },
-    "Ajdin-Zeljkovic": {
-        "id": "bbbf30ad",
-        "nationality": ["se"],
-        "position": ["FW", "MF"],
-        "birth_year": 1997,
-    },
-    "Besfort-Zeneli": {
-        "id": "6be253bf",
-        "nationality": ["se"],
-        "position": ["MF"],
-        "birth_year": 2002,
-    },
-    "Nikola-\u0110ur\u0111i\u0107": {
-        "id": "e61406e4",
-        "nationality": ["rs"],
-        "position": ["FW", "MF"],
-        "birth_year": 1986,
-    },
-    "Diego-Acosta": {
-        "id": "483efaae",
-        "nationality": ["py"],
-        "position": ["FW"],
-        "birth_year": 2002,
-    },
-    "Arsen-Adamov": {
-        "id": "dd95be96",
-        "nationality": ["ru"],
-        "position": ["DF"],
-        "birth_year": 1999,
-    },
-    "Denis-Adamov": {
-        "id": "dbc74497",
-        "nationality": ["ru"],
-        "position": ["GK"],
-        "birth_year": 1998,
-    },
-    "Kemal-Ademi": {
-        "id": "b3c14bff",
-        "nationality": ["ch"],
-        "position": ["FW"],
-        "birth_year": 1996,
-    },
-    "Gamid-Agalarov": {
-        "id": "50c75a7b",
-        "nationality": ["ru"],
-        "position": ["FW"],
-        "birth_year": 2000,
-    },
-    "Ilya-Agapov": {
-        "id": "c4185b88",
-        "nationality": ["ru"],
-        "position": ["DF"],
-        "birth_year": 2001,
-    },
-    "Roman-Akbashev": {
-        "id": "212d25d9",
-        "nationality": ["ru"],
-        "position": ["MF"],
-        "birth_year": 1991,
-    },
-    "Ilzat-Akhmetov": {
-        "id": "e0d3e18d",
-        "nationality": ["ru"],
-        "position": ["FW"],
-        "birth_year": 1997,
-    },
-    "Igor-Akinfeev": {
-        "id": "42ec696a",
-        "nationality": ["ru"],
-        "position": ["GK"],
-        "birth_year": 1986,
-    },
-    "Viktor-Aleksandrov": {
-        "id": "92d505de",
-        "nationality": ["ru"],
-        "position": ["DF"],
-        "birth_year": 2002,
-    },
-    "Nikita-Alekseev": {
-        "id": "3d5e8206",
-        "nationality": ["ru"],
-        "position": ["GK"],
-        "birth_year": 2002,
-    },
-    "Nuraly-Alip": {
-        "id": "870df7ae",
-        "nationality": ["kz"],
-        "position": ["DF"],
-        "birth_year": 1999,
-    },
-    "Ilnur-Alshin": {
-        "id": "afb57989",
-        "nationality": ["ru"],
-        "position": ["MF"],
-        "birth_year": 1993,
-    },
-    "Victorien-Angban": {
-        "id": "d8992b84",
-        "nationality": ["ci"],
-        "position": ["MF"],
-        "birth_year": 1996,
-    },
-    "Ruslan-Apekov": {
-        "id": "72c598bc",
-        "nationality": ["ru"],
-        "position": ["FW"],
-        "birth_year": 2000,
-    },
-    "Khyzyr-Appayev": {
-        "id": "33179518",
-        "nationality": ["ru"],
-        "position": ["FW"],
-        "birth_year": 1990,
-    },
-    "Timur-Ayupov": {
-        "id": "344a7f68",
-        "nationality": ["ru"],
-        "position": ["MF"],
-        "birth_year": 1993,
-    },
-    "Sergey-Babkin": {
-        "id": "93e368f9",
-        "nationality": ["ru"],
-        "position": ["MF"],
-        "birth_year": 2002,
-    },
-    "Yegor-Baburin": {
-        "id": "c26c2e62",
-        "nationality": ["ru"],
-        "position": ["GK"],
-        "birth_year": 1993,
-    },
-    "Abdulla-Bagamaev": {
-        "id": "40319109",
-        "nationality": ["ru"],
-        "position": ["FW"],
-        "birth_year": 2004,
-    },
-    "Zelimkhan-Bakayev": {
-        "id": "ab2a6ae8",
-        "nationality": ["ru"],
-        "position": ["MF"],
-        "birth_year": 1996,
-    },
-    "Keita-Bald\u00e9": {
-        "id": "509a4ccb",
-        "nationality": ["sn"],
-        "position": ["FW", "MF"],
-        "birth_year": 1995,
-    },
-    "Mihajlo-Banjac": {
-        "id": "dc955ff9",
-        "nationality": ["rs"],
-        "position": ["MF"],
-        "birth_year": 1999,
-    },
-    "Mateo-Bara\u0107": {
-        "id": "ebdc9c7e",
-        "nationality": ["hr"],
-        "position": ["DF", "MF"],
-        "birth_year": 1994,
-    },
-    "Dmitri-Barinov": {
-        "id": "d7c09951",
-        "nationality": ["ru"],
-        "position": ["MF", "DF"],
-        "birth_year": 1996,
-    },
-    "W\u00edlmar-Barrios": {
-        "id": "8e7f49d3",
-        "nationality": ["co"],
-        "position": ["MF"],
-        "birth_year": 1993,
-    },
-    "Ivan-Ba\u0161i\u0107": {
-        "id": "9b0a0d51",
-        "nationality": ["ba"],
-        "position": ["MF"],
-        "birth_year": 2002,
-    },
-    "Batxi": {
-        "id": "eca0eede",
-        "nationality": ["ao"],
-        "position": ["FW"],
-        "birth_year": 1998,
-    },
-    "Amir-Batyrev": {
-        "id": "bd986210",
-        "nationality": ["ru"],
-        "position": ["MF"],
-        "birth_year": 2002,
-    },
-    "Khoren-Bayramyan": {
-        "id": "efd6754c",
-        "nationality": ["am"],
-        "position": ["FW", "MF"],
-        "birth_year": 1992,
-    },
-    "Silvije-Begi\u0107": {
-        "id": "bef20b01",
-        "nationality": ["hr"],
-        "position": ["DF"],
-        "birth_year": 1993,
-    },
-    "Alexis-Beka-Beka": {
-        "id": "4a5e83ad",
-        "nationality": ["fr"],
-        "position": ["MF"],
-        "birth_year": 2001,
-    },
-    "Bernard-Berisha": {
-        "id": "4a422ed1",
-        "nationality": ["xk"],
-        "position": ["MF"],
-        "birth_year": 1991,
-    },
-    "Iliya-Berkovskiy": {
-        "id": "d9f8a975",
-        "nationality": ["ru"],
-        "position": ["MF"],
-        "birth_year": 2000,
-    },
-    "Mingiyan-Beveyev": {
-        "id": "a1808b31",
-        "nationality": ["ru"],
-        "position": ["DF"],
-        "birth_year": 1995,
-    },
-    "Eric-Bicfalvi": {
-        "id": "26d8b002",
-        "nationality": ["ro"],
-        "position": ["FW", "MF"],
-        "birth_year": 1988,
-    },
-    "Glenn-Bijl": {
-        "id": "c2b3fd82",
-        "nationality": ["nl"],
-        "position": ["DF"],
-        "birth_year": 1995,
-    },
-    "Miroslav-Bogosavac": {
-        "id": "4efdc3f9",
-        "nationality": ["rs"],
-        "position": ["DF", "MF"],
-        "birth_year": 1996,
-    },
-    "Sergei-Borodin": {
-        "id": "6a3bcb82",
-        "nationality": ["ru"],
-        "position": ["DF"],
-        "birth_year": 1999,
-    },
-    "Vitalii-Botnar": {
-        "id": "657befb3",
-        "nationality": ["ru"],
-        "position": ["GK"],
-        "birth_year": 2001,
-    },
-    "Kirill-Bozhenov": {
-        "id": "f08a9df7",
-        "nationality": ["ru"],
-        "position": ["MF", "DF"],
-        "birth_year": 2000,
-    },
-    "Sergei-Bozhin": {
-        "id": "f1d78679",
-        "nationality": ["ru"],
-        "position": ["DF"],
-        "birth_year": 1994,
-    },
-    "Sergei-Bryzgalov": {
-        "id": "add19e21",
-        "nationality": ["ru"],
-        "position": ["DF"],
-        "birth_year": 1992,
-    },
-    "Nikita-Burmistrov": {
-        "id": "e4ea0bef",
-        "nationality": ["ru"],
-        "position": ["MF", "FW"],
-        "birth_year": 1989,
-    },
-    "Ilia-Bykovskii": {
-        "id": "db574fa6",
-        "nationality": ["ru"],
-        "position": ["DF"],
-        "birth_year": 2001,
-    },
-    "Marat-Bystrov": {
-        "id": "41bc55ef",
-        "nationality": ["kz"],
-        "position": ["DF"],
-        "birth_year": 1992,
-    },
-    "Mihail-Caimacov": {
-        "id": "623220d6",
-        "nationality": ["md"],
-        "position": ["MF"],
-        "birth_year": 1998,
-    },
-    "Jorge-Carrascal": {
-        "id": "3f9f0d62",
-        "nationality": ["co"],
-        "position": ["FW", "MF"],
-        "birth_year": 1998,
-    },
-    "Mateo-Cassierra": {
-        "id": "0f714df2",
-        "nationality": ["co"],
-        "position": ["FW"],
-        "birth_year": 1997,
-    },
-    "Maximiliano-Caufriez": {
-        "id": "c92c24f0",
-        "nationality": ["be"],
-        "position": ["DF"],
-        "birth_year": 1997,
-    },
-    "Fyodor-Chalov": {
-        "id": "042d286e",
-        "nationality": ["ru"],
-        "position": ["FW"],
-        "birth_year": 1998,
-    },
-    "Aleksandr-Chernikov": {
-        "id": "32e741af",
-        "nationality": ["ru"],
-        "position": ["MF"],
-        "birth_year": 2000,
-    },
-    "Nikita-Chernov": {
-        "id": "96b03fe2",
-        "nationality": ["ru"],
-        "position": ["DF"],
-        "birth_year": 1996,
-    },
-    "Yevgeni-Chernov": {
-        "id": "15975a3c",
-        "nationality": ["ru"],
-        "position": ["DF"],
-        "birth_year": 1992,
-    },
-    "Daniil-Chernyakov": {
-        "id": "dabf5d69",
-        "nationality": ["ru"],
-        "position": ["MF"],
-        "birth_year": 2001,
-    },
-    "Vasili-Cherov": {
-        "id": "af2e1967",
-        "nationality": ["ru"],
-        "position": ["MF", "DF"],
-        "birth_year": 1996,
-    },
-    "Irakli-Chezhiya": {
-        "id": "67eab0e2",
-        "nationality": ["ru"],
-        "position": ["DF"],
-        "birth_year": 1992,
-    },
-    "Dmitri-Chistyakov": {
-        "id": "bec8a4ba",
-        "nationality": ["ru"],
-        "position": ["DF"],
-        "birth_year": 1994,
-    },
-    "Artur-Chyorny": {
-        "id": "6f21c06f",
-        "nationality": ["ru"],
-        "position": ["MF", "DF"],
-        "birth_year": 2000,
-    },
-    "Aleksandar-\u0106irkovi\u0107": {
-        "id": "7ff1c729",
-        "nationality": ["rs"],
-        "position": ["MF"],
-        "birth_year": 2001,
-    },
-    "Ibrahima-Ciss\u00e9": {
-        "id": "be4fede9",
-        "nationality": ["gn"],
-        "position": ["MF"],
-        "birth_year": 1994,
-    },
-    "Claudinho": {
-        "id": "8d46713e",
-        "nationality": ["br"],
-        "position": ["FW", "MF"],
-        "birth_year": 1997,
-    },
-    "Jhon-C\u00f3rdoba": {
-        "id": "9f381d8b",
-        "nationality": ["co"],
-        "position": ["FW"],
-        "birth_year": 1993,
-    },
-    "Mario-\u0106uri\u0107": {
-        "id": "4bcf9efa",
-        "nationality": ["hr"],
-        "position": ["MF"],
-        "birth_year": 1998,
-    },
-    "Yegor-Danilkin": {
-        "id": "9f718fe7",
-        "nationality": ["ru"],
-        "position": ["DF"],
-        "birth_year": 1995,
-    },
-    "Eli-Dasa": {
-        "id": "12947ab7",
-        "nationality": ["il"],
-        "position": ["DF"],
-        "birth_year": 1992,
-    },
-    "Aslan-Dashayev": {
-        "id": "2bd04d3d",
-        "nationality": ["ru"],
-        "position": ["DF"],
-        "birth_year": 1989,
-    },
-    "Daniil-Denisov": {
-        "id": "5d2f1989",
-        "nationality": ["ru"],
-        "position": ["DF", "MF"],
-        "birth_year": 2002,
-    },
-    "Igor-Diveev": {
-        "id": "65ad4d98",
-        "nationality": ["ru"],
-        "position": ["DF"],
-        "birth_year": 1999,
-    },
-    "Oleg-Dmitriyev": {
-        "id": "35c4126d",
-        "nationality": ["ru"],
-        "position": ["MF"],
-        "birth_year": 1995,
-    },
-    "Aleksandr-Dolgov": {
-        "id": "96dde941",
-        "nationality": ["ru"],
-        "position": ["FW"],
-        "birth_year": 1998,
-    },
-    "Aleksandr-Dovbnya": {
-        "id": "33973889",
-        "nationality": ["ru"],
-        "position": ["GK"],
-        "birth_year": 1987,
-    },
-    "Vanja-Drku\u0161i\u010d": {
-        "id": "e2e816b9",
-        "nationality": ["si"],
-        "position": ["DF"],
-        "birth_year": 1999,
-    },
-    "Dzhambulat-Dulayev": {
-        "id": "f5b741cb",
-        "nationality": ["ru"],
-        "position": ["FW"],
-        "birth_year": 1998,
-    },
-    "Soslan-Dzhanayev": {
-        "id": "fcae8ad3",
-        "nationality": ["ru"],
-        "position": ["GK"],
-        "birth_year": 1987,
-    },
-    "Georgi-Dzhikiya": {
-        "id": "e7ef333b",
-        "nationality": ["ru"],
-        "position": ["DF"],
-        "birth_year": 1993,
-    },
-    "Aleksandr-Ektov": {
-        "id": "db89af27",
-        "nationality": ["ru"],
-        "position": ["DF", "MF"],
-        "birth_year": 1996,
-    },
-    "Emmers\u00f3n": {
-        "id": "e9e26fc8",
-        "nationality": ["cg"],
-        "position": ["DF"],
-        "birth_year": 1995,
-    },
-    "Xojimat-Erkinov": {
-        "id": "88e92a18",
-        "nationality": ["uz"],
-        "position": ["MF"],
-        "birth_year": 2001,
-    },
-    "Nikita-Ermakov": {
-        "id": "03648588",
-        "nationality": ["ru"],
-        "position": ["MF"],
-        "birth_year": 2003,
-    },
-    "Aleksandr-Erokhin": {
-        "id": "1c78737d",
-        "nationality": ["ru"],
-        "position": ["MF"],
-        "birth_year": 1989,
-    },
-    "Lucas-Fasson": {
-        "id": "31ecbf29",
-        "nationality": ["br"],
-        "position": ["DF"],
-        "birth_year": 2001,
-    },
-    "Roberto-Fern\u00e1ndez": {
-        "id": "cf0a822d",
-        "nationality": ["py"],
-        "position": ["DF"],
-        "birth_year": 2000,
-    },
-    "Oleksandr-Filin": {
-        "id": "9372f797",
-        "nationality": ["ru"],
-        "position": ["DF"],
-        "birth_year": 1996,
-    },
-    "Egor-Filipenko": {
-        "id": "1321d6f0",
-        "nationality": ["by"],
-        "position": ["DF"],
-        "birth_year": 1988,
-    },
-    "Gabriel-Florent\u00edn": {
-        "id": "9e809ff4",
-        "nationality": ["ar"],
-        "position": ["MF", "FW"],
-        "birth_year": 1999,
-    },
-    "Kirill-Folmer": {
-        "id": "1aa59524",
-        "nationality": ["ru"],
-        "position": ["MF"],
-        "birth_year": 2000,
-    },
-    "Daniil-Fomin": {
-        "id": "7383e6e9",
-        "nationality": ["ru"],
-        "position": ["MF"],
-        "birth_year": 1997,
-    },
-    "Bruno-Fuchs": {
-        "id": "ee89e28d",
-        "nationality": ["br"],
-        "position": ["DF"],
-        "birth_year": 1999,
-    },
-    "Ramazan-Gadzhimuradov": {
-        "id": "9935dfc9",
-        "nationality": ["ru"],
-        "position": ["MF"],
-        "birth_year": 1998,
-    },
-    "Luka-Gagnidze": {
-        "id": "4737ab0f",
-        "nationality": ["ge"],
-        "position": ["MF"],
-        "birth_year": 2003,
-    },
-    "Adolfo-Gaich": {
-        "id": "8dfed6e9",
-        "nationality": ["ar"],
-        "position": ["FW"],
-        "birth_year": 1999,
-    },
-    "Milan-Gaji\u0107": {
-        "id": "9f6325f9",
-        "nationality": ["rs"],
-        "position": ["MF"],
-        "birth_year": 1996,
-    },
-    "Ilya-Gaponov": {
-        "id": "4ae3f059",
-        "nationality": ["ru"],
-        "position": ["DF"],
-        "birth_year": 1997,
-    },
-    "Yuri-Gazinskiy": {
-        "id": "ecb68eea",
-        "nationality": ["ru"],
-        "position": ["MF"],
-        "birth_year": 1989,
-    },
-    "Mory-Gbane": {
-        "id": "ab8b392c",
-        "nationality": ["ci"],
-        "position": ["MF"],
-        "birth_year": 2000,
-    },
-    "Aleksei-Gerasimov": {
-        "id": "a20c7d8c",
-        "nationality": ["ru"],
-        "position": ["DF"],
-        "birth_year": 1993,
-    },
-    "Yaroslav-Gladyshev": {
-        "id": "91764139",
-        "nationality": ["ru"],
-        "position": ["FW"],
-        "birth_year": 2003,
-    },
-    "Nemanja-Glav\u010di\u0107": {
-        "id": "1a6ec79a",
-        "nationality": ["rs"],
-        "position": ["MF", "FW"],
-        "birth_year": 1997,
-    },
-    "Danil-Glebov": {
-        "id": "8a96b8d8",
-        "nationality": ["ru"],
-        "position": ["MF"],
-        "birth_year": 1999,
-    },
-    "Denis-Glushakov": {
-        "id": "c67b8590",
-        "nationality": ["ru"],
-        "position": ["MF", "FW"],
-        "birth_year": 1987,
-    },
-    "Maksim-Glushenkov": {
-        "id": "b856aff5",
-        "nationality": ["ru"],
-        "position": ["FW", "MF"],
-        "birth_year": 1999,
-    },
-    "Leo-Goglichidze": {
-        "id": "620578c5",
-        "nationality": ["ru"],
-        "position": ["DF"],
-        "birth_year": 1997,
-    },
-    "Nikita-Goilo": {
-        "id": "b2bcc75a",
-        "nationality": ["ru"],
-        "position": ["GK"],
-        "birth_year": 1998,
-    },
-    "Renato-Gojkovi\u0107": {
-        "id": "2548f793",
-        "nationality": ["ba"],
-        "position": ["DF"],
-        "birth_year": 1995,
-    },
-    "Yegor-Golenkov": {
-        "id": "52fe89ed",
-        "nationality": ["ru"],
-        "position": ["FW"],
-        "birth_year": 1999,
-    },
-    "Georgi-Gongadze": {
-        "id": "f6545803",
-        "nationality": ["ru"],
-        "position": ["FW"],
-        "birth_year": 1996,
-    },
-    "Aleksei-Gorodovoy": {
-        "id": "449422c7",
-        "nationality": ["ru"],
-        "position": ["GK"],
-        "birth_year": 1993,
-    },
-    "Yuri-Gorshkov": {
-        "id": "c539eb26",
-        "nationality": ["ru"],
-        "position": ["DF"],
-        "birth_year": 1999,
-    },
-    "Yevgeni-Goshev": {
-        "id": "36e39cd9",
-        "nationality": ["ru"],
-        "position": ["GK"],
-        "birth_year": 1997,
-    },
-    "Kirill-Gotsuk": {
-        "id": "7dd029da",
-        "nationality": ["ru"],
-        "position": ["DF"],
-        "birth_year": 1992,
-    },
-    "Vyacheslav-Grulyov": {
-        "id": "a84f1fe5",
-        "nationality": ["ru"],
-        "position": ["FW", "MF"],
-        "birth_year": 1999,
-    },
-    "Vitali-Gudiyev": {
-        "id": "af92c0f3",
-        "nationality": ["ru"],
-        "position": ["GK"],
-        "birth_year": 1995,
-    },
-    "Ayaz-Guliyev": {
-        "id": "c3080320",
-        "nationality": ["ru"],
-        "position": ["MF"],
-        "birth_year": 1996,
-    },
-    "Batraz-Gurtsiyev": {
-        "id": "4d631db1",
-        "nationality": ["ru"],
-        "position": ["MF", "FW"],
-        "birth_year": 1998,
-    },
-    "Brian-Idowu": {
-        "id": "8387afe6",
-        "nationality": ["ng"],
-        "position": ["MF", "DF"],
-        "birth_year": 1992,
-    },
-    "Mikhail-Ignatov": {
-        "id": "42a55711",
-        "nationality": ["ru"],
-        "position": ["MF", "FW"],
-        "birth_year": 2000,
-    },
-    "Ivan-Ignatyev": {
-        "id": "bab077a4",
-        "nationality": ["ru"],
-        "position": ["FW"],
-        "birth_year": 1999,
-    },
-    "Vladimir-Ilyin": {
-        "id": "b5e41ebb",
-        "nationality": ["ru"],
-        "position": ["FW", "MF"],
-        "birth_year": 1992,
-    },
-    "Aleksei-Ionov": {
-        "id": "359a9fb4",
-        "nationality": ["ru"],
-        "position": ["FW", "MF"],
-        "birth_year": 1989,
-    },
-    "Oleg-Isaenko": {
-        "id": "65028e23",
-        "nationality": ["ru"],
-        "position": ["DF"],
-        "birth_year": 2000,
-    },
-    "Wilson-Isidor": {
-        "id": "a671316d",
-        "nationality": ["fr"],
-        "position": ["MF", "FW"],
-        "birth_year": 2000,
-    },
-    "Dmytro-Ivanisenya": {
-        "id": "b7139e01",
-        "nationality": ["ua"],
-        "position": ["MF"],
-        "birth_year": 1994,
-    },
-    "Tin-Jedvaj": {
-        "id": "f820504e",
-        "nationality": ["hr"],
-        "position": ["DF"],
-        "birth_year": 1995,
-    },
-    "Jo\u00e3ozinho": {
-        "id": "bce47a46",
-        "nationality": ["br"],
-        "position": ["FW", "MF"],
-        "birth_year": 1988,
-    },
-    "Nikita-Kakkoyev": {
-        "id": "0e2c6d2c",
-        "nationality": ["ru"],
-        "position": ["DF", "MF"],
-        "birth_year": 1999,
-    },
-    "Ihor-Kalinin": {
-        "id": "7075c1d8",
-        "nationality": ["ua"],
-        "position": ["MF"],
-        "birth_year": 1995,
-    },
-    "Nikolay-Kalinsky": {
-        "id": "ead1cd33",
-        "nationality": ["ru"],
-        "position": ["MF"],
-        "birth_year": 1993,
-    },
-    "Amur-Kalmykov": {
-        "id": "ecd57efb",
-        "nationality": ["ru"],
-        "position": ["FW"],
-        "birth_year": 1994,
-    },
-    "Fran\u00e7ois-Kamano": {
-        "id": "81d3318f",
-        "nationality": ["gn"],
-        "position": ["MF", "FW"],
-        "birth_year": 1996,
-    },
-    "Vladislav-Kamilov": {
-        "id": "670575ae",
-        "nationality": ["ru"],
-        "position": ["MF", "FW"],
-        "birth_year": 1995,
-    },
-    "Ilya-Kamyshev": {
-        "id": "70f03444",
-        "nationality": ["ru"],
-        "position": ["MF"],
-        "birth_year": 1997,
-    },
-    "Kirill-Kaplenko": {
-        "id": "6084493d",
-        "nationality": ["by"],
-        "position": ["MF"],
-        "birth_year": 1999,
-    },
-    "Vladislav-Karapuzov": {
-        "id": "b8204f23",
-        "nationality": ["ru"],
-        "position": ["DF"],
-        "birth_year": 2000,
-    },
-    "Vyacheslav-Karavayev": {
-        "id": "b0b902c8",
-        "nationality": ["ru"],
-        "position": ["DF"],
-        "birth_year": 1995,
-    },
-    "David-Karayev": {
-        "id": "df0a8cf2",
-        "nationality": ["az"],
-        "position": ["MF", "FW"],
-        "birth_year": 1995,
-    },
-    "Artem-Karpukas": {
-        "id": "af056b84",
-        "nationality": ["ru"],
-        "position": ["MF"],
-        "birth_year": 2002,
-    },
-    "Aleksei-Kashtanov": {
-        "id": "67042993",
-        "nationality": ["ru"],
-        "position": ["FW"],
-        "birth_year": 1996,
-    },
-    "Yury-Kavalyow": {
-        "id": "2ebe6291",
-        "nationality": ["by"],
-        "position": ["MF"],
-        "birth_year": 1993,
-    },
-    "Danil-Kazantsev": {
-        "id": "7a695cd8",
-        "nationality": ["ru"],
-        "position": ["MF"],
-        "birth_year": 2001,
-    },
-    "\u00c1kos-Kecsk\u00e9s": {
-        "id": "8fb2cd60",
-        "nationality": ["hu"],
-        "position": ["DF"],
-        "birth_year": 1996,
-    },
-    "Aleksei-Kenyaikin": {
-        "id": "d28e3b76",
-        "nationality": ["ru"],
-        "position": ["GK"],
-        "birth_year": 1998,
-    },
-    "Gyrano-Kerk": {
-        "id": "eb907bfc",
-        "nationality": ["nl"],
-        "position": ["MF"],
-        "birth_year": 1995,
-    },
-    "Mikhail-Kerzhakov": {
-        "id": "2fabebc0",
-        "nationality": ["ru"],
-        "position": ["GK"],
-        "birth_year": 1987,
-    },
-    "Rustam-Khalnazarov": {
-        "id": "7a8a8502",
-        "nationality": ["ru"],
-        "position": ["FW"],
-        "birth_year": 2000,
-    },
-    "Evgenii-Kharin": {
-        "id": "6f5a4525",
-        "nationality": ["ee"],
-        "position": ["MF", "DF"],
-        "birth_year": 1995,
-    },
-    "Daniil-Khlusevich": {
-        "id": "0603172a",
-        "nationality": ["ru"],
-        "position": ["DF"],
-        "birth_year": 2001,
-    },
-    "Danila-Khotulev": {
-        "id": "fe302f35",
-        "nationality": ["ru"],
-        "position": ["DF"],
-        "birth_year": 2002,
-    },
-    "Vladimir-Khubulov": {
-        "id": "15e2bda4",
-        "nationality": ["ru"],
-        "position": ["MF"],
-        "birth_year": 2001,
-    },
-    "Daniil-Khudyakov": {
-        "id": "4980c6be",
-        "nationality": ["ru"],
-        "position": ["GK"],
-        "birth_year": 2004,
-    },
-    "Leon-Klassen": {
-        "id": "570af22f",
-        "nationality": ["ru"],
-        "position": ["DF"],
-        "birth_year": 2000,
-    },
-    "David-Kobesov": {
-        "id": "e7744341",
-        "nationality": ["ru"],
-        "position": ["MF"],
-        "birth_year": 2000,
-    },
-    "David-Kokoev": {
-        "id": "a7e564a4",
-        "nationality": ["ru"],
-        "position": ["MF"],
-        "birth_year": 2002,
-    },
-    "Aleksandr-Koksharov": {
-        "id": "37de4f2d",
-        "nationality": ["ru"],
-        "position": ["FW"],
-        "birth_year": 2004,
-    },
-    "Nikolay-Komlichenko": {
-        "id": "d2a69aad",
-        "nationality": ["ru"],
-        "position": ["FW"],
-        "birth_year": 1995,
-    },
-    "Mohamed-Konat\u00e9": {
-        "id": "76b9fe27",
-        "nationality": ["bf"],
-        "position": ["FW"],
-        "birth_year": 1997,
-    },
-    "Igor-Konovalov": {
-        "id": "163f382a",
-        "nationality": ["ru"],
-        "position": ["MF"],
-        "birth_year": 1996,
-    },
-    "Daniil-Kornyushin": {
-        "id": "78e6719d",
-        "nationality": ["ru"],
-        "position": ["MF"],
-        "birth_year": 2001,
-    },
-    "M\u00e1rk-Koszta": {
-        "id": "a5ecefa2",
-        "nationality": ["hu"],
-        "position": ["FW"],
-        "birth_year": 1996,
-    },
-    "Aleksandr-Kovalenko": {
-        "id": "d18c0e54",
-        "nationality": ["ru"],
-        "position": ["MF"],
-        "birth_year": 2003,
-    },
-    "Oleg-Kozhemyakin": {
-        "id": "76920758",
-        "nationality": ["ru"],
-        "position": ["DF"],
-        "birth_year": 1995,
-    },
-    "Dmitri-Kratkov": {
-        "id": "c0a1e803",
-        "nationality": ["ru"],
-        "position": ["MF"],
-        "birth_year": 2002,
-    },
-    "Kirill-Kravtsov": {
-        "id": "a2c51161",
-        "nationality": ["ru"],
-        "position": ["MF"],
-        "birth_year": 2002,
-    },
-    "Nikita-Krivtsov": {
-        "id": "f3bc41b5",
-        "nationality": ["ru"],
-        "position": ["MF"],
-        "birth_year": 2002,
-    },
-    "Vyacheslav-Krotov": {
-        "id": "b05afb0a",
-        "nationality": ["ru"],
-        "position": ["MF", "FW"],
-        "birth_year": 1993,
-    },
-    "Danil-Krugovoy": {
-        "id": "a802405e",
-        "nationality": ["ru"],
-        "position": ["DF"],
-        "birth_year": 1998,
-    },
-    "Konstantin-Kuchayev": {
-        "id": "ccc66d00",
-        "nationality": ["ru"],
-        "position": ["MF", "FW"],
-        "birth_year": 1998,
-    },
-    "Ilya-Kukharchuk": {
-        "id": "42005934",
-        "nationality": ["ru"],
-        "position": ["FW", "MF"],
-        "birth_year": 1990,
-    },
-    "Denys-Kulakov": {
-        "id": "0c069a90",
-        "nationality": ["ua"],
-        "position": ["DF"],
-        "birth_year": 1986,
-    },
-    "Daniil-Kulikov": {
-        "id": "c01f247a",
-        "nationality": ["ru"],
-        "position": ["MF"],
-        "birth_year": 1998,
-    },
-    "Ilya-Kutepov": {
-        "id": "ef8cafeb",
-        "nationality": ["ru"],
-        "position": ["DF"],
-        "birth_year": 1993,
-    },
-    "Aleksandr-Kutitskiy": {
-        "id": "125f44b3",
-        "nationality": ["ru"],
-        "position": ["MF", "DF"],
-        "birth_year": 2002,
-    },
-    "Maksim-Kutovoi": {
-        "id": "adbd05a3",
-        "nationality": ["ru"],
-        "position": ["FW"],
-        "birth_year": 2001,
-    },
-    "Ivan-Kuzmichev": {
-        "id": "189454b1",
-        "nationality": ["ru"],
-        "position": ["DF"],
-        "birth_year": 2000,
-    },
-    "Daler-Kuzyaev": {
-        "id": "d4e93bab",
-        "nationality": ["ru"],
-        "position": ["MF"],
-        "birth_year": 1993,
-    },
-    "Irakli-Kvekveskiri": {
-        "id": "71f34c11",
-        "nationality": ["ge"],
-        "position": ["MF"],
-        "birth_year": 1990,
-    },
-    "Andrey-Langovich": {
-        "id": "09f3b386",
-        "nationality": ["ru"],
-        "position": ["DF"],
-        "birth_year": 2003,
-    },
-    "Ilya-Lantratov": {
-        "id": "82580379",
-        "nationality": ["ru"],
-        "position": ["GK"],
-        "birth_year": 1995,
-    },
-    "Dzyanis-Laptsew": {
-        "id": "5d8bea0d",
-        "nationality": ["by"],
-        "position": ["FW"],
-        "birth_year": 1991,
-    },
-    "Diego-Laxalt": {
-        "id": "f26e3c59",
-        "nationality": ["uy"],
-        "position": ["DF"],
-        "birth_year": 1993,
-    },
-    "Damien-Le-Tallec": {
-        "id": "8f4d116f",
-        "nationality": ["fr"],
-        "position": ["DF"],
-        "birth_year": 1990,
-    },
-    "Igor-Lebedenko": {
-        "id": "610e5afb",
-        "nationality": ["ru"],
-        "position": ["FW", "MF"],
-        "birth_year": 1983,
-    },
-    "Igor-Leshchuk": {
-        "id": "65e63ed9",
-        "nationality": ["ru"],
-        "position": ["GK"],
-        "birth_year": 1996,
-    },
-    "Daniil-Lesovoy": {
-        "id": "dd81f38d",
-        "nationality": ["ru"],
-        "position": ["MF"],
-        "birth_year": 1998,
-    },
-    "Danil-Lipovoy": {
-        "id": "6053921c",
-        "nationality": ["ru"],
-        "position": ["MF"],
-        "birth_year": 1999,
-    },
-    "Ruslan-Litvinov": {
-        "id": "0ceb43f6",
-        "nationality": ["ru"],
-        "position": ["DF", "MF"],
-        "birth_year": 2001,
-    },
-    "Vyacheslav-Litvinov": {
-        "id": "9d2a17ab",
-        "nationality": ["ru"],
-        "position": ["DF"],
-        "birth_year": 2001,
-    },
-    "Ivan-Lomaev": {
-        "id": "41a59448",
-        "nationality": ["ru"],
-        "position": ["GK"],
-        "birth_year": 1999,
-    },
-    "Aleksandr-Lomovitskiy": {
-        "id": "43b23d3a",
-        "nationality": ["ru"],
-        "position": ["MF", "FW"],
-        "birth_year": 1998,
-    },
-    "Dejan-Lovren": {
-        "id": "1a2935f6",
-        "nationality": ["hr"],
-        "position": ["DF"],
-        "birth_year": 1989,
-    },
-    "Matvey-Lukin": {
-        "id": "89604e21",
-        "nationality": ["ru"],
-        "position": ["DF"],
-        "birth_year": 2004,
-    },
-    "Ruslan-Magal": {
-        "id": "bc260f5f",
-        "nationality": ["ru"],
-        "position": ["MF"],
-        "birth_year": 1991,
-    },
-    "Stanislav-Magkeev": {
-        "id": "b088363d",
-        "nationality": ["ru"],
-        "position": ["DF", "MF"],
-        "birth_year": 1999,
-    },
-    "Butta-Magomedov": {
-        "id": "97071ba9",
-        "nationality": ["ru"],
-        "position": ["MF"],
-        "birth_year": 1997,
-    },
-    "Mamadou-Maiga": {
-        "id": "a1bc5c36",
-        "nationality": ["ml"],
-        "position": ["MF"],
-        "birth_year": 1995,
-    },
-    "Artyom-Makarchuk": {
-        "id": "bf2d3ebc",
-        "nationality": ["ru"],
-        "position": ["MF"],
-        "birth_year": 1995,
-    },
-    "Denis-Makarov": {
-        "id": "a164acc1",
-        "nationality": ["ru"],
-        "position": ["FW", "MF"],
-        "birth_year": 1998,
-    },
-    "Aleksandr-Maksimenko": {
-        "id": "6f4e1c93",
-        "nationality": ["ru"],
-        "position": ["GK"],
-        "birth_year": 1998,
-    },
-    "Maksim-Maksimov": {
-        "id": "058ca1a3",
-        "nationality": ["ru"],
-        "position": ["FW"],
-        "birth_year": 1995,
-    },
-    "Malcom": {
-        "id": "6853490f",
-        "nationality": ["br"],
-        "position": ["FW", "MF"],
-        "birth_year": 1997,
-    },
-    "Andrei-Malykh": {
-        "id": "cfd1a6f7",
-        "nationality": ["ru"],
-        "position": ["DF"],
-        "birth_year": 1988,
-    },
-    "Artyom-Mamin": {
-        "id": "2421b41d",
-        "nationality": ["ru"],
-        "position": ["DF"],
-        "birth_year": 1997,
-    },
-    "Mark-Mampasi": {
-        "id": "a3475c65",
-        "nationality": ["ua"],
-        "position": ["DF"],
-        "birth_year": 2003,
-    },
-    "Irakly-Manelov": {
-        "id": "aa1a88d8",
-        "nationality": ["ru"],
-        "position": ["FW"],
-        "birth_year": 2002,
-    },
-    "Braian-Mansilla": {
-        "id": "e4c37819",
-        "nationality": ["ar"],
-        "position": ["FW"],
-        "birth_year": 1997,
-    },
-    "Gustavo-Mantuan": {
-        "id": "0d717632",
-        "nationality": ["br"],
-        "position": ["MF"],
-        "birth_year": 2001,
-    },
-    "Konstantin-Maradishvili": {
-        "id": "e8796ba6",
-        "nationality": ["ru"],
-        "position": ["MF"],
-        "birth_year": 2000,
-    },
-    "Timofei-Margasov": {
-        "id": "3a5ba464",
-        "nationality": ["ru"],
-        "position": ["MF", "DF"],
-        "birth_year": 1992,
-    },
-    "Nicolas-Marichal": {
-        "id": "bc441ed3",
-        "nationality": ["uy"],
-        "position": ["DF"],
-        "birth_year": 2001,
-    },
-    "Jimmy-Mar\u00edn": {
-        "id": "dc8a938f",
-        "nationality": ["cr"],
-        "position": ["FW", "MF"],
-        "birth_year": 1997,
-    },
-    "Guilherme-Marinato": {
-        "id": "a3b0ed18",
-        "nationality": ["ru"],
-        "position": ["GK"],
-        "birth_year": 1985,
-    },
-    "Christopher-Martins": {
-        "id": "0e96a5e1",
-        "nationality": ["lu"],
-        "position": ["MF"],
-        "birth_year": 1997,
-    },
-    "Daniil-Martovoy": {
-        "id": "df25864d",
-        "nationality": ["ru"],
-        "position": ["MF"],
-        "birth_year": 2003,
-    },
-    "Pavel-Maslov": {
-        "id": "64da3033",
-        "nationality": ["ru"],
-        "position": ["DF"],
-        "birth_year": 2000,
-    },
-    "Lucas-Masoero": {
-        "id": "2c260eb7",
-        "nationality": ["ar"],
-        "position": ["DF"],
-        "birth_year": 1995,
-    },
-    "Vladislav-Masternoy": {
-        "id": "bd93fa4a",
-        "nationality": ["ru"],
-        "position": ["MF"],
-        "birth_year": 1995,
-    },
-    "Aleks-Matsukatov": {
-        "id": "c9ee3008",
-        "nationality": ["ru"],
-        "position": ["MF"],
-        "birth_year": 1999,
-    },
-    "Jes\u00fas-Medina": {
-        "id": "7c4628c4",
-        "nationality": ["py"],
-        "position": ["FW", "MF"],
-        "birth_year": 1997,
-    },
-    "Viktor-Melekhin": {
-        "id": "bee25ed6",
-        "nationality": ["ru"],
-        "position": ["DF"],
-        "birth_year": 2003,
-    },
-    "Pavel-Meleshin": {
-        "id": "b597ab9f",
-        "nationality": ["ru"],
-        "position": ["FW"],
-        "birth_year": 2004,
-    },
-    "Georgi-Melkadze": {
-        "id": "f11b1937",
-        "nationality": ["ru"],
-        "position": ["FW"],
-        "birth_year": 1997,
-    },
-    "Stepan-Melnikov": {
-        "id": "bb41ad6d",
-        "nationality": ["ru"],
-        "position": ["FW"],
-        "birth_year": 2002,
-    },
-    "Andrei-Mendel": {
-        "id": "1bd506c3",
-        "nationality": ["ru"],
-        "position": ["MF"],
-        "birth_year": 1995,
-    },
-    "Felipe-M\u00e9ndez": {
-        "id": "963706d2",
-        "nationality": ["cl"],
-        "position": ["MF", "FW"],
-        "birth_year": 1999,
-    },
-    "Artyom-Meshchaninov": {
-        "id": "2916f2dd",
-        "nationality": ["ru"],
-        "position": ["DF"],
-        "birth_year": 1996,
-    },
-    "Miha-Mevlja": {
-        "id": "8229a21c",
-        "nationality": ["si"],
-        "position": ["DF"],
-        "birth_year": 1990,
-    },
-    "Iaroslav-Mikhailov": {
-        "id": "a61597d4",
-        "nationality": ["ru"],
-        "position": ["MF"],
-        "birth_year": 2003,
-    },
-    "Vladimir-Mikhaylov": {
-        "id": "3c078bfb",
-        "nationality": ["ru"],
-        "position": ["MF"],
-        "birth_year": 1996,
-    },
-    "Ivan-Miladinovi\u0107": {
-        "id": "5105522c",
-        "nationality": ["rs"],
-        "position": ["DF"],
-        "birth_year": 1994,
-    },
-    "Milson": {
-        "id": "690f6e40",
-        "nationality": ["ao"],
-        "position": ["MF"],
-        "birth_year": 1999,
-    },
-    "Anton-Miranchuk": {
-        "id": "807e869a",
-        "nationality": ["ru"],
-        "position": ["MF"],
-        "birth_year": 1995,
-    },
-    "Aleksey-Mironov": {
-        "id": "6f2af737",
-        "nationality": ["ru"],
-        "position": ["MF"],
-        "birth_year": 2000,
-    },
-    "Reziuan-Mirzov": {
-        "id": "aa5aa220",
-        "nationality": ["ru"],
-        "position": ["MF", "FW"],
-        "birth_year": 1993,
-    },
-    "Danijel-Mi\u0161ki\u0107": {
-        "id": "011b1823",
-        "nationality": ["hr"],
-        "position": ["MF"],
-        "birth_year": 1993,
-    },
-    "Mario-Mitaj": {
-        "id": "0bf123b6",
-        "nationality": ["al"],
-        "position": ["DF"],
-        "birth_year": 2003,
-    },
-    "Nikola-Moro": {
-        "id": "ff579c7e",
-        "nationality": ["hr"],
-        "position": ["MF"],
-        "birth_year": 1998,
-    },
-    "Evgeni-Morozov": {
-        "id": "8162a443",
-        "nationality": ["ru"],
-        "position": ["DF"],
-        "birth_year": 2001,
-    },
-    "Victor-Moses": {
-        "id": "e726e11e",
-        "nationality": ["ng"],
-        "position": ["FW", "MF"],
-        "birth_year": 1990,
-    },
-    "Andrei-Mostovoy": {
-        "id": "dfb50e5c",
-        "nationality": ["ru"],
-        "position": ["FW", "MF"],
-        "birth_year": 1997,
-    },
-    "Maksim-Mukhin": {
-        "id": "90463dba",
-        "nationality": ["ru"],
-        "position": ["MF"],
-        "birth_year": 2001,
-    },
-    "Kirill-Nababkin": {
-        "id": "79019bf4",
-        "nationality": ["ru"],
-        "position": ["DF"],
-        "birth_year": 1986,
-    },
-    "Elmir-Nabiullin": {
-        "id": "60c81972",
-        "nationality": ["ru"],
-        "position": ["MF"],
-        "birth_year": 1995,
-    },
-    "Maksim-Nenakhov": {
-        "id": "08c982a0",
-        "nationality": ["ru"],
-        "position": ["DF"],
-        "birth_year": 1998,
-    },
-    "Ravil-Netfullin": {
-        "id": "aaa4b23c",
-        "nationality": ["ru"],
-        "position": ["DF"],
-        "birth_year": 1993,
-    },
-    "Moumi-Ngamaleu": {
-        "id": "0193a8bf",
-        "nationality": ["cm"],
-        "position": ["MF", "FW"],
-        "birth_year": 1994,
-    },
-    "Shamar-Nicholson": {
-        "id": "e33fb79d",
-        "nationality": ["jm"],
-        "position": ["FW", "MF"],
-        "birth_year": 1997,
-    },
-    "Artur-Nigmatullin": {
-        "id": "c0e106dc",
-        "nationality": ["ru"],
-        "position": ["GK"],
-        "birth_year": 1991,
-    },
-    "Ershov-Nikita": {
-        "id": "b173fed2",
-        "nationality": ["ru"],
-        "position": ["FW"],
-        "birth_year": 2002,
-    },
-    "Aleksei-Nikitin": {
-        "id": "6eecc203",
-        "nationality": ["ru"],
-        "position": ["DF"],
-        "birth_year": 1992,
-    },
-    "Zoran-Ni\u017ei\u0107": {
-        "id": "02a3ac43",
-        "nationality": ["hr"],
-        "position": ["DF"],
-        "birth_year": 1989,
-    },
-    "Christian-Noboa": {
-        "id": "9d1e8e76",
-        "nationality": ["ec"],
-        "position": ["MF"],
-        "birth_year": 1985,
-    },
-    "Mathias-Normann": {
-        "id": "8996350d",
-        "nationality": ["no"],
-        "position": ["MF"],
-        "birth_year": 1996,
-    },
-    "Artem-Ntumba": {
-        "id": "c9a489ca",
-        "nationality": ["ru"],
-        "position": ["FW"],
-        "birth_year": 2003,
-    },
-    "Ivan-Oblyakov": {
-        "id": "15eb04ec",
-        "nationality": ["ru"],
-        "position": ["MF", "FW"],
-        "birth_year": 1998,
-    },
-    "Daniil-Odoevski": {
-        "id": "118b60ce",
-        "nationality": ["ru"],
-        "position": ["GK"],
-        "birth_year": 2003,
-    },
-    "Stepan-Oganesyan": {
-        "id": "69225d89",
-        "nationality": ["ru"],
-        "position": ["MF", "FW"],
-        "birth_year": 2001,
-    },
-    "Jonathan-Okoronkwo": {
-        "id": "3b192ae1",
-        "nationality": ["ng"],
-        "position": ["FW"],
-        "birth_year": 2003,
-    },
-    "Mikhail-Olegovich-Smirnov": {
-        "id": "2eecf69a",
-        "nationality": ["ru"],
-        "position": ["DF"],
-        "birth_year": 1990,
-    },
-    "Ivan-Oleinikov": {
-        "id": "33baf857",
-        "nationality": ["ru"],
-        "position": ["MF"],
-        "birth_year": 1998,
-    },
-    "Olakunle-Olusegun": {
-        "id": "9bf6adb0",
-        "nationality": ["ng"],
-        "position": ["FW"],
-        "birth_year": 2002,
-    },
-    "Mikhail-Oparin": {
-        "id": "8aded2b9",
-        "nationality": ["ru"],
-        "position": ["GK"],
-        "birth_year": 1993,
-    },
-    "Maksim-Osipenko": {
-        "id": "bd8a22da",
-        "nationality": ["ru"],
-        "position": ["DF"],
-        "birth_year": 1994,
-    },
-    "Bogdan-Ovsyannikov": {
-        "id": "3cde34ed",
-        "nationality": ["ru"],
-        "position": ["GK"],
-        "birth_year": 1999,
-    },
-    "Kaio-Pantale\u00e3o": {
-        "id": "a9be27f2",
-        "nationality": ["br"],
-        "position": ["DF"],
-        "birth_year": 1995,
-    },
-    "Sergei-Parshivlyuk": {
-        "id": "8c94f4ee",
-        "nationality": ["ru"],
-        "position": ["DF"],
-        "birth_year": 1989,
-    },
-    "Aleksandr-Pavlovets": {
-        "id": "c8e82f34",
-        "nationality": ["by"],
-        "position": ["DF"],
-        "birth_year": 1996,
-    },
-    "Pedrinho": {
-        "id": "035341ba",
-        "nationality": ["br"],
-        "position": ["MF"],
-        "birth_year": 1999,
-    },
-    "Daniil-Penchikov": {
-        "id": "457f4318",
-        "nationality": ["ru"],
-        "position": ["MF"],
-        "birth_year": 1998,
-    },
-    "Sergei-Pesyakov": {
-        "id": "9f575e96",
-        "nationality": ["ru"],
-        "position": ["GK"],
-        "birth_year": 1988,
-    },
-    "Maksim-Petrov": {
-        "id": "9719d14f",
-        "nationality": ["ru"],
-        "position": ["MF"],
-        "birth_year": 2001,
-    },
-    "Sergei-Petrov": {
-        "id": "17145c90",
-        "nationality": ["ru"],
-        "position": ["DF"],
-        "birth_year": 1991,
-    },
-    "Kevin-Pina": {
-        "id": "296026ae",
-        "nationality": ["cv"],
-        "position": ["MF"],
-        "birth_year": 1997,
-    },
-    "Sergey-Pinyaev": {
-        "id": "3d597fe3",
-        "nationality": ["ru"],
-        "position": ["MF"],
-        "birth_year": 2004,
-    },
-    "Dmitri-Pivovarov": {
-        "id": "fe5f7315",
-        "nationality": ["ru"],
-        "position": ["DF"],
-        "birth_year": 2000,
-    },
-    "Vyacheslav-Podberyozkin": {
-        "id": "142afbb0",
-        "nationality": ["ru"],
-        "position": ["MF"],
-        "birth_year": 1992,
-    },
-    "Egor-Pogostnov": {
-        "id": "65fa304d",
-        "nationality": ["ru"],
-        "position": ["DF"],
-        "birth_year": 2004,
-    },
-    "Dmitry-Poloz": {
-        "id": "2deaf8b2",
-        "nationality": ["ru"],
-        "position": ["FW", "MF"],
-        "birth_year": 1991,
-    },
-    "Vladimir-Poluyakhtov": {
-        "id": "a4051f87",
-        "nationality": ["ru"],
-        "position": ["MF"],
-        "birth_year": 1989,
-    },
-    "Ilya-Pomazun": {
-        "id": "6bd05d38",
-        "nationality": ["ru"],
-        "position": ["GK"],
-        "birth_year": 1996,
-    },
-    "Aleksei-Pomerko": {
-        "id": "3e86f280",
-        "nationality": ["ru"],
-        "position": ["MF"],
-        "birth_year": 1990,
-    },
-    "Danila-Prokhin": {
-        "id": "256ac8f4",
-        "nationality": ["ru"],
-        "position": ["DF"],
-        "birth_year": 2001,
-    },
-    "Quincy-Promes": {
-        "id": "b182a240",
-        "nationality": ["nl"],
-        "position": ["FW", "MF"],
-        "birth_year": 1992,
-    },
-    "Egor-Proshkin": {
-        "id": "a6ec7fac",
-        "nationality": ["ru"],
-        "position": ["DF", "MF"],
-        "birth_year": 1999,
-    },
-    "Danil-Prutsev": {
-        "id": "157ae8f5",
-        "nationality": ["ru"],
-        "position": ["MF", "DF"],
-        "birth_year": 2000,
-    },
-    "Kiryl-Pyachenin": {
-        "id": "b4727253",
-        "nationality": ["by"],
-        "position": ["DF", "MF"],
-        "birth_year": 1997,
-    },
-    "Amar-Rahmanovi\u0107": {
-        "id": "3cbc3982",
-        "nationality": ["ba"],
-        "position": ["FW", "MF"],
-        "birth_year": 1994,
-    },
-    "Marko-Rakonjac": {
-        "id": "53a13f51",
-        "nationality": ["me"],
-        "position": ["FW"],
-        "birth_year": 2000,
-    },
-    "Vadim-Rakov": {
-        "id": "86f22ad5",
-        "nationality": ["ru"],
-        "position": ["FW"],
-        "birth_year": 2005,
-    },
-    "Cristian-Ram\u00edrez": {
-        "id": "8a1d7b51",
-        "nationality": ["ec"],
-        "position": ["DF"],
-        "birth_year": 1994,
-    },
-    "Lazar-Ran\u0111elovi\u0107": {
-        "id": "1dbfae2d",
-        "nationality": ["rs"],
-        "position": ["MF", "FW"],
-        "birth_year": 1997,
-    },
-    "Nikolai-Rasskazov": {
-        "id": "24d9435b",
-        "nationality": ["ru"],
-        "position": ["DF"],
-        "birth_year": 1998,
-    },
-    "Bogdan-Reikhmen": {
-        "id": "1bec4a61",
-        "nationality": ["ru"],
-        "position": ["MF"],
-        "birth_year": 2002,
-    },
-    "Artur-Rimovi\u010d-Jusupov": {
-        "id": "2dc3a11c",
-        "nationality": ["ru"],
-        "position": ["MF", "FW"],
-        "birth_year": 1989,
-    },
-    "Viniana-Riwai": {
-        "id": "20993c9d",
-        "nationality": ["fj"],
-        "position": ["FW"],
-        "birth_year": 1991,
-    },
-    "Bojan-Roganovi\u0107": {
-        "id": "df88536b",
-        "nationality": ["me"],
-        "position": ["MF"],
-        "birth_year": 2000,
-    },
-    "Aleksandr-Rudenko": {
-        "id": "bf4968e0",
-        "nationality": ["ru"],
-        "position": ["FW"],
-        "birth_year": 1999,
-    },
-    "Aleksandr-Ryazantsev": {
-        "id": "7836398b",
-        "nationality": ["ru"],
-        "position": ["MF"],
-        "birth_year": 1986,
-    },
-    "Dmitrii-Rybchinskii": {
-        "id": "32314605",
-        "nationality": ["ru"],
-        "position": ["MF"],
-        "birth_year": 1998,
-    },
-    "Maciej-Rybus": {
-        "id": "86dd16a8",
-        "nationality": ["pl"],
-        "position": ["DF"],
-        "birth_year": 1989,
-    },
-    "Lechii-Sadulaev": {
-        "id": "c28f8126",
-        "nationality": ["ru"],
-        "position": ["MF"],
-        "birth_year": 2000,
-    },
-    "Ilya-Sadygov": {
-        "id": "52e1de79",
-        "nationality": ["ru"],
-        "position": ["FW"],
-        "birth_year": 2000,
-    },
-    "Matvei-Safonov": {
-        "id": "d97b252e",
-        "nationality": ["ru"],
-        "position": ["GK"],
-        "birth_year": 1999,
-    },
-    "Vladislav-Samko": {
-        "id": "e9c7fab5",
-        "nationality": ["ru"],
-        "position": ["FW"],
-        "birth_year": 2002,
-    },
-    "Artyom-Samsonov": {
-        "id": "ca74ce8e",
-        "nationality": ["ru"],
-        "position": ["DF", "MF"],
-        "birth_year": 1989,
-    },
-    "Douglas-Santos": {
-        "id": "c50e5bba",
-        "nationality": ["br"],
-        "position": ["DF"],
-        "birth_year": 1994,
-    },
-    "Stefan-\u0160api\u0107": {
-        "id": "ea483e68",
-        "nationality": ["rs"],
-        "position": ["DF"],
-        "birth_year": 1997,
-    },
-    "Vladislav-Sarveli": {
-        "id": "19d0162e",
-        "nationality": ["ru"],
-        "position": ["MF", "FW"],
-        "birth_year": 1997,
-    },
-    "Igor-Savi\u0107": {
-        "id": "f946b0c3",
-        "nationality": ["ba"],
-        "position": ["MF"],
-        "birth_year": 2000,
-    },
-    "Saba-Sazonov": {
-        "id": "645dffbf",
-        "nationality": ["ge"],
-        "position": ["DF"],
-        "birth_year": 2002,
-    },
-    "Aleksandr-Selikhov": {
-        "id": "972d595a",
-        "nationality": ["ru"],
-        "position": ["GK"],
-        "birth_year": 1994,
-    },
-    "Aleksandr-Selyava": {
-        "id": "d8328bba",
-        "nationality": ["by"],
-        "position": ["MF"],
-        "birth_year": 1992,
-    },
-    "Andrei-Semyonov": {
-        "id": "4f2f150e",
-        "nationality": ["ru"],
-        "position": ["DF"],
-        "birth_year": 1989,
-    },
-    "Ivan-Sergeyev": {
-        "id": "9d804092",
-        "nationality": ["ru"],
-        "position": ["FW"],
-        "birth_year": 1995,
-    },
-    "Edgar-Sevikyan": {
-        "id": "3e8bb8ce",
-        "nationality": ["ru"],
-        "position": ["MF"],
-        "birth_year": 2001,
-    },
-    "Albert-Sharipov": {
-        "id": "5913a8a6",
-        "nationality": ["ru"],
-        "position": ["MF"],
-        "birth_year": 1993,
-    },
-    "Oleg-Shatov": {
-        "id": "8ce063f9",
-        "nationality": ["ru"],
-        "position": ["MF"],
-        "birth_year": 1990,
-    },
-    "Alikhan-Shavayev": {
-        "id": "1716c29a",
-        "nationality": ["ru"],
-        "position": ["MF"],
-        "birth_year": 1993,
-    },
-    "Georgi-Shchennikov": {
-        "id": "ab6928f2",
-        "nationality": ["ru"],
-        "position": ["DF"],
-        "birth_year": 1991,
-    },
-    "Kirill-Shchetinin": {
-        "id": "3f9dcf2e",
-        "nationality": ["ru"],
-        "position": ["MF"],
-        "birth_year": 2002,
-    },
-    "Giorgi-Shelia": {
-        "id": "a8c2f477",
-        "nationality": ["ru"],
-        "position": ["GK"],
-        "birth_year": 1988,
-    },
-    "Konstantin-Shiltsov": {
-        "id": "4d2c0893",
-        "nationality": ["ru"],
-        "position": ["MF"],
-        "birth_year": 2002,
-    },
-    "Timofey-Shipunov": {
-        "id": "ec9f89f5",
-        "nationality": ["ru"],
-        "position": ["MF", "FW"],
-        "birth_year": 2003,
-    },
-    "Vitaly-Shitov": {
-        "id": "e4da0b96",
-        "nationality": ["ru"],
-        "position": ["FW"],
-        "birth_year": 2003,
-    },
-    "Vladislav-Shitov": {
-        "id": "fe61ef7d",
-        "nationality": ["ru"],
-        "position": ["FW"],
-        "birth_year": 2003,
-    },
-    "Yevgeni-Shlyakov": {
-        "id": "749d4826",
-        "nationality": ["ru"],
-        "position": ["MF", "DF"],
-        "birth_year": 1991,
-    },
-    "Aleksei-Shumskikh": {
-        "id": "421f9d36",
-        "nationality": ["ru"],
-        "position": ["DF"],
-        "birth_year": 1990,
-    },
-    "Anton-Shunin": {
-        "id": "5ab84204",
-        "nationality": ["ru"],
-        "position": ["GK"],
-        "birth_year": 1987,
-    },
-    "Anton-Shvets": {
-        "id": "de5c4781",
-        "nationality": ["ru"],
-        "position": ["MF", "DF"],
-        "birth_year": 1993,
-    },
-    "Aleksandr-Silyanov": {
-        "id": "2690dffa",
-        "nationality": ["ru"],
-        "position": ["DF"],
-        "birth_year": 2001,
-    },
-    "Artem-Simonyan": {
-        "id": "1fafb627",
-        "nationality": ["am"],
-        "position": ["MF"],
-        "birth_year": 1995,
-    },
-    "Moussa-Sissako": {
-        "id": "5ba9d393",
-        "nationality": ["ml"],
-        "position": ["DF"],
-        "birth_year": 2000,
-    },
-    "Mikhail-Sivakow": {
-        "id": "55be2bf5",
-        "nationality": ["by"],
-        "position": ["DF"],
-        "birth_year": 1988,
-    },
-    "Dmitri-Skopintsev": {
-        "id": "eaf645bf",
-        "nationality": ["ru"],
-        "position": ["DF"],
-        "birth_year": 1997,
-    },
-    "Igor-Smolnikov": {
-        "id": "76d5857d",
-        "nationality": ["ru"],
-        "position": ["DF", "MF"],
-        "birth_year": 1988,
-    },
-    "Fyodor-Smolov": {
-        "id": "cbbfa2e7",
-        "nationality": ["ru"],
-        "position": ["FW"],
-        "birth_year": 1990,
-    },
-    "Aleksandr-Sobolev": {
-        "id": "5a068ec6",
-        "nationality": ["ru"],
-        "position": ["FW"],
-        "birth_year": 1997,
-    },
-    "Artem-Sokolov": {
-        "id": "fb8101bb",
-        "nationality": ["ru"],
-        "position": ["MF"],
-        "birth_year": 2003,
-    },
-    "Aleksandr-Soldatenkov": {
-        "id": "0259de1a",
-        "nationality": ["ru"],
-        "position": ["DF"],
-        "birth_year": 1996,
-    },
-    "Yegor-Sorokin": {
-        "id": "2fd337af",
-        "nationality": ["ru"],
-        "position": ["DF"],
-        "birth_year": 1995,
-    },
-    "Eduard-Spertsyan": {
-        "id": "8e8f40e0",
-        "nationality": ["am"],
-        "position": ["MF"],
-        "birth_year": 2000,
-    },
-    "Mateo-Stamatov": {
-        "id": "072d8d80",
-        "nationality": ["bg"],
-        "position": ["MF"],
-        "birth_year": 1999,
-    },
-    "Dmitry-Stotsky": {
-        "id": "4fe7e935",
-        "nationality": ["ru"],
-        "position": ["MF"],
-        "birth_year": 1989,
-    },
-    "Timur-Suleimanov": {
-        "id": "63b0a342",
-        "nationality": ["ru"],
-        "position": ["FW"],
-        "birth_year": 2000,
-    },
-    "Magomed-Shapi-Suleymanov": {
-        "id": "d94653be",
-        "nationality": ["ru"],
-        "position": ["MF"],
-        "birth_year": 1999,
-    },
-    "Mukhammad-Sultonov": {
-        "id": "583c0abf",
-        "nationality": ["ru"],
-        "position": ["MF"],
-        "birth_year": 1992,
-    },
-    "Fanil-Sungatulin": {
-        "id": "18d4d9e8",
-        "nationality": ["ru"],
-        "position": ["MF"],
-        "birth_year": 2001,
-    },
-    "Kirill-Suslov": {
-        "id": "29b87e88",
-        "nationality": ["ru"],
-        "position": ["DF"],
-        "birth_year": 1991,
-    },
-    "Aleksei-Sutormin": {
-        "id": "bd20f4eb",
-        "nationality": ["ru"],
-        "position": ["DF"],
-        "birth_year": 1994,
-    },
-    "Ilja-Svinov": {
-        "id": "f127596a",
-        "nationality": ["ru"],
-        "position": ["GK"],
-        "birth_year": 2000,
-    },
-    "Vladimir-Sychevoy": {
-        "id": "79fe8424",
-        "nationality": ["ru"],
-        "position": ["FW"],
-        "birth_year": 1996,
-    },
-    "Rizvan-Tashaev": {
-        "id": "f61dac14",
-        "nationality": ["ru"],
-        "position": ["GK"],
-        "birth_year": 2003,
-    },
-    "Evgenii-Tatarinov": {
-        "id": "aad34a2a",
-        "nationality": ["ru"],
-        "position": ["FW"],
-        "birth_year": 1999,
-    },
-    "Ivan-Temnikov": {
-        "id": "40679785",
-        "nationality": ["ru"],
-        "position": ["DF"],
-        "birth_year": 1989,
-    },
-    "Sergei-Terekhov": {
-        "id": "ad2e5c8d",
-        "nationality": ["ru"],
-        "position": ["DF", "MF"],
-        "birth_year": 1990,
-    },
-    "Denis-Terentyev": {
-        "id": "120c594d",
-        "nationality": ["ru"],
-        "position": ["DF"],
-        "birth_year": 1992,
-    },
-    "Dmitri-Tikhiy": {
-        "id": "ba5ceb70",
-        "nationality": ["ru"],
-        "position": ["DF"],
-        "birth_year": 1992,
-    },
-    "Nair-Tiknizyan": {
-        "id": "0c5c94d0",
-        "nationality": ["ru"],
-        "position": ["DF", "MF"],
-        "birth_year": 1999,
-    },
-    "Artyom-Timofeyev": {
-        "id": "66e86f2e",
-        "nationality": ["ru"],
-        "position": ["MF"],
-        "birth_year": 1994,
-    },
-    "Nikolai-Titkov": {
-        "id": "4c0dac1b",
-        "nationality": ["ru"],
-        "position": ["MF"],
-        "birth_year": 2000,
-    },
-    "Darko-Todorovi\u0107": {
-        "id": "9f375e8e",
-        "nationality": ["ba"],
-        "position": ["MF", "DF"],
-        "birth_year": 1997,
-    },
-    "Aleksandr-Troshechkin": {
-        "id": "c3ddad8d",
-        "nationality": ["ru"],
-        "position": ["MF"],
-        "birth_year": 1996,
-    },
-    "Dzambolat-Tsallagov": {
-        "id": "715b0c3a",
-        "nationality": ["ru"],
-        "position": ["MF"],
-        "birth_year": 2000,
-    },
-    "Ibragim-Tsallagov": {
-        "id": "516fedb9",
-        "nationality": ["ru"],
-        "position": ["MF"],
-        "birth_year": 1990,
-    },
-    "Dmitri-Tsypchenko": {
-        "id": "f00280a1",
-        "nationality": ["ru"],
-        "position": ["FW"],
-        "birth_year": 1999,
-    },
-    "Roman-Tugarev": {
-        "id": "80347560",
-        "nationality": ["ru"],
-        "position": ["FW", "MF"],
-        "birth_year": 1998,
-    },
-    "Maksim-Turischev": {
-        "id": "60d9b5ce",
-        "nationality": ["ru"],
-        "position": ["FW"],
-        "birth_year": 2002,
-    },
-    "Konstantin-Tyukavin": {
-        "id": "ee4c5ff7",
-        "nationality": ["ru"],
-        "position": ["FW"],
-        "birth_year": 2002,
-    },
-    "Nail-Umyarov": {
-        "id": "444940e2",
-        "nationality": ["ru"],
-        "position": ["MF"],
-        "birth_year": 2000,
-    },
-    "Oston-Urunov": {
-        "id": "56521adf",
-        "nationality": ["uz"],
-        "position": ["MF"],
-        "birth_year": 2000,
-    },
-    "Egor-Ushakov": {
-        "id": "8a2f00a8",
-        "nationality": ["ru"],
-        "position": ["MF"],
-        "birth_year": 2002,
-    },
-    "Kirill-Ushatov": {
-        "id": "79845e3a",
-        "nationality": ["ru"],
-        "position": ["MF"],
-        "birth_year": 2000,
-    },
-    "Daniil-Utkin": {
-        "id": "9ddb85e8",
-        "nationality": ["ru"],
-        "position": ["MF"],
-        "birth_year": 1999,
-    },
-    "Rizvan-Utsiyev": {
-        "id": "6b2310f8",
-        "nationality": ["ru"],
-        "position": ["DF"],
-        "birth_year": 1988,
-    },
-    "Guillermo-Varela": {
-        "id": "5c961282",
-        "nationality": ["uy"],
-        "position": ["DF"],
-        "birth_year": 1993,
-    },
-    "Lucas-Vera-Piris": {
-        "id": "1fee104e",
-        "nationality": ["ar"],
-        "position": ["MF"],
-        "birth_year": 1994,
-    },
-    "Maksim-Vityugov": {
-        "id": "46f9e64e",
-        "nationality": ["ru"],
-        "position": ["MF"],
-        "birth_year": 1998,
-    },
-    "Rai-Vloet": {
-        "id": "b32e8c5f",
-        "nationality": ["nl"],
-        "position": ["FW", "MF"],
-        "birth_year": 1995,
-    },
-    "Sergey-Volkov": {
-        "id": "72f5982d",
-        "nationality": ["ru"],
-        "position": ["DF"],
-        "birth_year": 2002,
-    },
-    "Zakhar-Volkov": {
-        "id": "fcda82c7",
-        "nationality": ["by"],
-        "position": ["DF"],
-        "birth_year": 1997,
-    },
-    "Dmitry-Vorobyev": {
-        "id": "cfe90f87",
-        "nationality": ["ru"],
-        "position": ["FW", "MF"],
-        "birth_year": 1997,
-    },
-    "Wendel": {
-        "id": "33b11df6",
-        "nationality": ["br"],
-        "position": ["MF"],
-        "birth_year": 1997,
-    },
-    "Willyan": {
-        "id": "577d7bf9",
-        "nationality": ["br"],
-        "position": ["DF"],
-        "birth_year": 1995,
-    },
-    "Vyacheslav-Yakimov": {
-        "id": "5fd99401",
-        "nationality": ["ru"],
-        "position": ["MF"],
-        "birth_year": 1998,
-    },
-    "Vladislav-Yakovlev": {
-        "id": "e522c542",
-        "nationality": ["ru"],
-        "position": ["FW"],
-        "birth_year": 2002,
-    },
-    "Denis-Yakuba": {
-        "id": "e2816234",
-        "nationality": ["ru"],
-        "position": ["MF", "FW"],
-        "birth_year": 1996,
-    },
-    "Momo-Yansan\u00e9": {
-        "id": "683a8f5f",
-        "nationality": ["gn"],
-        "position": ["MF", "FW"],
-        "birth_year": 1997,
-    },
-    "Andrei-Yegorychev": {
-        "id": "ca81d4df",
-        "nationality": ["ru"],
-        "position": ["DF", "MF"],
-        "birth_year": 1993,
-    },
-    "Roman-Yemelyanov": {
-        "id": "ed110674",
-        "nationality": ["ru"],
-        "position": ["DF", "MF"],
-        "birth_year": 1992,
-    },
-    "Ivan-Yenin": {
-        "id": "116cec62",
-        "nationality": ["lv"],
-        "position": ["MF"],
-        "birth_year": 1994,
-    },
-    "Roman-Yevgenyev": {
-        "id": "d58f7a4e",
-        "nationality": ["ru"],
-        "position": ["DF"],
-        "birth_year": 1999,
-    },
-    "Alexey-Yevseyev": {
-        "id": "82dbaea5",
-        "nationality": ["ru"],
-        "position": ["MF"],
-        "birth_year": 1994,
-    },
-    "Roman-Yezhov": {
-        "id": "0871842a",
-        "nationality": ["ru"],
-        "position": ["MF"],
-        "birth_year": 1997,
-    },
-    "Ibrohimxalil-Yo\u02bbldoshev": {
-        "id": "e4141883",
-        "nationality": ["uz"],
-        "position": ["MF"],
-        "birth_year": 2001,
-    },
-    "Artem-Yuran": {
-        "id": "3195ecfb",
-        "nationality": ["ru"],
-        "position": ["DF"],
-        "birth_year": 1997,
-    },
-    "Igor-Yurganov": {
-        "id": "494a7681",
-        "nationality": ["ru"],
-        "position": ["DF"],
-        "birth_year": 1993,
-    },
-    "Aleksandr-Yushin": {
-        "id": "4fd59e48",
-        "nationality": ["ru"],
-        "position": ["MF", "FW"],
-        "birth_year": 1995,
-    },
-    "Anton-Zabolotny": {
-        "id": "5a969ba8",
-        "nationality": ["ru"],
-        "position": ["FW"],
-        "birth_year": 1991,
-    },
-    "Nikolai-Zabolotny": {
-        "id": "d48f69b5",
-        "nationality": ["ru"],
-        "position": ["GK"],
-        "birth_year": 1990,
-    },
-    "Kirill-Zaika": {
-        "id": "93892a08",
-        "nationality": ["ru"],
-        "position": ["MF"],
-        "birth_year": 1992,
-    },
-    "Baktiyor-Zainutdinov": {
-        "id": "b8441408",
-        "nationality": ["kz"],
-        "position": ["DF"],
-        "birth_year": 1998,
-    },
-    "Arsen-Zakharian": {
-        "id": "7f14ec2a",
-        "nationality": ["ru"],
-        "position": ["MF", "FW"],
-        "birth_year": 2003,
-    },
-    "Sa\u0161a-Zdjelar": {
-        "id": "bbddc31f",
-        "nationality": ["rs"],
-        "position": ["MF"],
-        "birth_year": 1995,
-    },
-    "Yuri-Zheleznov": {
-        "id": "be23a83b",
-        "nationality": ["ru"],
-        "position": ["MF"],
-        "birth_year": 2002,
-    },
-    "Ilya-Zhigulyov": {
-        "id": "ad9b3503",
-        "nationality": ["ru"],
-        "position": ["MF"],
-        "birth_year": 1996,
-    },
-    "Dmitri-Zhivoglyadov": {
-        "id": "833a8fbc",
-        "nationality": ["ru"],
-        "position": ["DF", "MF"],
-        "birth_year": 1994,
-    },
-    "Yuri-Zhuravlyov": {
-        "id": "5b586803",
-        "nationality": ["ru"],
-        "position": ["DF"],
-        "birth_year": 1996,
-    },
-    "Anton-Zinkovskiy": {
-        "id": "bffeb380",
-        "nationality": ["ru"],
-        "position": ["MF", "FW"],
-        "birth_year": 1996,
-    },
-    "Roman-Zobnin": {
-        "id": "0a215326",
-        "nationality": ["ru"],
-        "position": ["MF"],
-        "birth_year": 1994,
-    },
-    "Daniil-Zorin": {
-        "id": "20f9bdfa",
-        "nationality": ["ru"],
-        "position": ["FW"],
-        "birth_year": 2004,
-    },
-    "Georgi-Zotov": {
-        "id": "d83e460b",
-        "nationality": ["ru"],
-        "position": ["DF"],
-        "birth_year": 1990,
-    },
-    "Aleksandr-Zuyev": {
-        "id": "fe0d5272",
-        "nationality": ["ru"],
-        "position": ["MF", "DF"],
-        "birth_year": 1996,
-    },
-    "Luka-\u0110or\u0111evi\u0107": {
-        "id": "ea0cc5c5",
-        "nationality": ["me"],
-        "position": ["FW"],
-        "birth_year": 1994,
-    },
-    "Henri-Aalto": {
-        "id": "690acb29",
-        "nationality": ["fi"],
-        "position": ["DF"],
-        "birth_year": 1989,
-    },
-    "Mohammed-Abubakari": {
-        "id": "a73cc5ee",
-        "nationality": ["gh"],
-        "position": ["MF"],
-        "birth_year": 1986,
-    },
-    "David-Accam": {
-        "id": "f5220ece",
-        "nationality": ["gh"],
-        "position": ["FW", "MF"],
-        "birth_year": 1990,
-    },
-    "Donaldo-A\u00e7ka": {
-        "id": "f6955717",
-        "nationality": ["al"],
-        "position": ["DF"],
-        "birth_year": 1997,
-    },
-    "Mohammed-Adams": {
-        "id": "295fc22b",
-        "nationality": ["gh"],
-        "position": ["DF"],
-        "birth_year": 2000,
-    },
-    "Mosawer-Ahadi": {
-        "id": "f40d47e2",
-        "nationality": ["fi"],
-        "position": ["FW"],
-        "birth_year": 2000,
-    },
-    "Elias-\u00c4ij\u00e4l\u00e4": {
-        "id": "5ceef1ab",
-        "nationality": ["fi"],
-        "position": ["DF"],
-        "birth_year": 2003,
-    },
-    "Samu-Alanko": {
-        "id": "9492a112",
-        "nationality": ["fi"],
-        "position": ["FW"],
-        "birth_year": 1998,
-    },
-    "Jusif-Ali": {
-        "id": "d0c5a197",
-        "nationality": ["fi"],
-        "position": ["FW"],
-        "birth_year": 2000,
-    },
-    "Mikael-Almen": {
-        "id": "cf9b4a74",
-        "nationality": ["fi"],
-        "position": ["DF"],
-        "birth_year": 2000,
-    },
-    "Thadee-Alvaro-Ngamba": {
-        "id": "1008c87d",
-        "nationality": ["fr"],
-        "position": ["MF"],
-        "birth_year": 1998,
-    },
-    "Leo-Andersson": {"id": "5737e90d", "position": ["FW"]},
-    "Pablo-Andrade": {
-        "id": "bb0cd4d3",
-        "nationality": ["br"],
-        "position": ["MF"],
-        "birth_year": 1994,
-    },
-    "Ifeanyi-Ani": {
-        "id": "ba907b96",
-        "nationality": ["ng"],
-        "position": ["MF"],
-        "birth_year": 2002,
-    },
-    "An\u00edbal": {
-        "id": "11db6ab6",
-        "nationality": ["pt"],
-        "position": ["DF"],
-        "birth_year": 1996,
-    },
-    "Samuel-Anini-Jr": {
-        "id": "437e7fc9",
-        "nationality": ["fi"],
-        "position": ["MF"],
-        "birth_year": 2002,
-    },
-    "Clinton-Antwi": {
-        "id": "1230f564",
-        "nationality": ["gh"],
-        "position": ["DF"],
-        "birth_year": 1999,
-    },
-    "Paulus-Arajuuri": {
-        "id": "7e6b3664",
-        "nationality": ["fi"],
-        "position": ["DF"],
-        "birth_year": 1988,
-    },
-    "Rodrigo-Arciero": {
-        "id": "f9240252",
-        "nationality": ["ar"],
-        "position": ["DF"],
-        "birth_year": 1993,
-    },
-    "Doni-Arifi": {
-        "id": "90705eb3",
-        "nationality": ["fi"],
-        "position": ["MF"],
-        "birth_year": 2002,
-    },
-    "Edmund-Arko-Mensah": {
-        "id": "5ec20548",
-        "nationality": ["gh"],
-        "position": ["DF"],
-        "birth_year": 2001,
-    },
-    "Markus-Arsalo": {
-        "id": "29c50f71",
-        "nationality": ["fi"],
-        "position": ["DF"],
-        "birth_year": 2002,
-    },
-    "Jude-Arthur-Ekow": {
-        "id": "3c08a7dc",
-        "nationality": ["gh"],
-        "position": ["DF"],
-        "birth_year": 1999,
-    },
-    "Felipe-Aspegren": {
-        "id": "d6bd1ed7",
-        "nationality": ["fi"],
-        "position": ["DF"],
-        "birth_year": 1994,
-    },
-    "Serge-Atakayi": {
-        "id": "cde69174",
-        "nationality": ["fi"],
-        "position": ["FW"],
-        "birth_year": 1999,
-    },
-    "Eero-Matti-Auvinen": {
-        "id": "fca60793",
-        "nationality": ["fi"],
-        "position": ["DF"],
-        "birth_year": 1996,
-    },
-    "Florian-Baak": {
-        "id": "150d5992",
-        "nationality": ["de"],
-        "position": ["DF"],
-        "birth_year": 1999,
-    },
-    "Gustaf-Backaliden": {
-        "id": "e1ca6783",
-        "nationality": ["se"],
-        "position": ["MF"],
-        "birth_year": 1997,
-    },
-    "Jani-B\u00e4ckman": {
-        "id": "88b82fb3",
-        "nationality": ["fi"],
-        "position": ["DF", "FW"],
-        "birth_year": 1988,
-    },
-    "Dra\u017een-Bagari\u0107": {
-        "id": "3de559ea",
-        "nationality": ["hr"],
-        "position": ["FW"],
-        "birth_year": 1992,
-    },
-    "Michael-Bakare": {
-        "id": "c87cfb5e",
-        "nationality": ["eng"],
-        "position": ["FW", "MF"],
-        "birth_year": 1986,
-    },
-    "Yanga-Baliso": {
-        "id": "c5b4a2d3",
-        "nationality": ["za"],
-        "position": ["MF"],
-        "birth_year": 1997,
-    },
-    "Enoch-Banza": {
-        "id": "fe12279c",
-        "nationality": ["fi"],
-        "position": ["FW"],
-        "birth_year": 2000,
-    },
-    "Alfie-Bates": {
-        "id": "03d7cf5d",
-        "nationality": ["eng"],
-        "position": ["MF"],
-        "birth_year": 2001,
-    },
-    "Gabriel-Bispo": {
-        "id": "427c6ce5",
-        "nationality": ["br"],
-        "position": ["MF"],
-        "birth_year": 1997,
-    },
-    "Nemanja-Bosan\u010di\u0107": {
-        "id": "72e8e930",
-        "nationality": ["rs"],
-        "position": ["MF"],
-        "birth_year": 1995,
-    },
-    "Nassim-Boujellab": {
-        "id": "541127d5",
-        "nationality": ["ma"],
-        "position": ["MF"],
-        "birth_year": 1999,
-    },
-    "Magnus-Breitenmoser": {
-        "id": "36ae5d20",
-        "nationality": ["ch"],
-        "position": ["MF"],
-        "birth_year": 1998,
-    },
-    "David-Browne": {
-        "id": "582beb9d",
-        "nationality": ["pg"],
-        "position": ["FW"],
-        "birth_year": 1995,
-    },
-    "Badreddine-Bushara": {
-        "id": "9eacfd37",
-        "nationality": ["fi"],
-        "position": ["FW"],
-        "birth_year": 2004,
-    },
-    "Luis-Carlos-Murillo": {
-        "id": "e37bfa7a",
-        "nationality": ["co"],
-        "position": ["DF"],
-        "birth_year": 1990,
-    },
-    "Daniel-Carrillo": {
-        "id": "02e2ddc7",
-        "nationality": ["ve"],
-        "position": ["DF"],
-        "birth_year": 1995,
-    },
-    "Geoffrey-Chinedu": {
-        "id": "2977e65b",
-        "nationality": ["ng"],
-        "position": ["FW"],
-        "birth_year": 1997,
-    },
-    "Martinos-Christofi": {
-        "id": "92df425d",
-        "nationality": ["cy"],
-        "position": ["MF"],
-        "birth_year": 1993,
-    },
-    "D\u00e9-Cledson": {
-        "id": "a640707b",
-        "nationality": ["br"],
-        "position": ["FW"],
-        "birth_year": 1998,
-    },
-    "Elias-Collin": {
-        "id": "cfd359b1",
-        "nationality": ["fi"],
-        "position": ["DF"],
-        "birth_year": 2003,
-    },
-    "Jean-Christophe-Coubronne": {
-        "id": "b0c26a1d",
-        "nationality": ["fr"],
-        "position": ["DF"],
-        "birth_year": 1989,
-    },
-    "Sebastian-Dahlstr\u00f6m": {
-        "id": "28313052",
-        "nationality": ["fi"],
-        "position": ["MF"],
-        "birth_year": 1996,
-    },
-    "Yussif-Daouda-Moussa": {
-        "id": "645597ee",
-        "nationality": ["ne"],
-        "position": ["MF"],
-        "birth_year": 1998,
-    },
-    "Prosper-Deyegbe": {
-        "id": "e1fead6d",
-        "nationality": ["gh"],
-        "position": ["MF"],
-        "birth_year": 1999,
-    },
-    "Bradley-Diallo": {
-        "id": "f99722f8",
-        "nationality": ["fr"],
-        "position": ["DF"],
-        "birth_year": 1990,
-    },
-    "Jake-Dunwoody": {
-        "id": "b007e482",
-        "nationality": ["nir"],
-        "position": ["MF"],
-        "birth_year": 1998,
-    },
-    "Eduards-Emsis": {
-        "id": "3725f4f5",
-        "nationality": ["lv"],
-        "position": ["MF"],
-        "birth_year": 1996,
-    },
-    "Jesper-Engstr\u00f6m": {
-        "id": "91ff6fbe",
-        "nationality": ["fi"],
-        "position": ["DF"],
-        "birth_year": 1992,
-    },
-    "Roman-Eremenko": {
-        "id": "b220064a",
-        "nationality": ["fi"],
-        "position": ["MF"],
-        "birth_year": 1987,
-    },
-    "Sergei-Eremenko": {
-        "id": "e9a549af",
-        "nationality": ["fi"],
-        "position": ["MF"],
-        "birth_year": 1999,
-    },
-    "Lee-Erwin": {
-        "id": "3972a2eb",
-        "nationality": ["sct"],
-        "position": ["FW"],
-        "birth_year": 1994,
-    },
-    "Tobias-Fagerstr\u00f6m": {
-        "id": "cd9067ae",
-        "nationality": ["fi"],
-        "position": ["MF"],
-        "birth_year": 2000,
-    },
-    "Babacar-Fati": {
-        "id": "0d355eb7",
-        "nationality": ["pt"],
-        "position": ["FW"],
-        "birth_year": 2000,
-    },
-    "Felix-Ferahyan": {
-        "id": "99fe775a",
-        "nationality": ["de"],
-        "position": ["GK"],
-        "birth_year": 1998,
-    },
-    "Yann-Alexandre-Fillion": {
-        "id": "2f9592b0",
-        "nationality": ["ca"],
-        "position": ["GK"],
-        "birth_year": 1996,
-    },
-    "Rafael-Floro": {
-        "id": "875d9ae9",
-        "nationality": ["pt"],
-        "position": ["DF"],
-        "birth_year": 1994,
-    },
-    "Petteri-Forsell": {
-        "id": "7df6ffdf",
-        "nationality": ["fi"],
-        "position": ["FW", "MF"],
-        "birth_year": 1990,
-    },
-    "Oskari-Forsman": {
-        "id": "9f7b9c00",
-        "nationality": ["fi"],
-        "position": ["GK"],
-        "birth_year": 1988,
-    },
-    "Niklas-Friberg": {
-        "id": "a239833a",
-        "nationality": ["fi"],
-        "position": ["DF"],
-        "birth_year": 1996,
-    },
-    "Valent\u00edn-Gasc": {
-        "id": "2f6986a1",
-        "nationality": ["ar"],
-        "position": ["MF"],
-        "birth_year": 2000,
-    },
-    "Albin-Granlund": {
-        "id": "7b05c973",
-        "nationality": ["fi"],
-        "position": ["DF", "MF"],
-        "birth_year": 1989,
-    },
-    "Santeri-Haarala": {
-        "id": "2e18f55b",
-        "nationality": ["fi"],
-        "position": ["MF"],
-        "birth_year": 1999,
-    },
-    "Aatu-Hakala": {
-        "id": "da1db4b0",
-        "nationality": ["fi"],
-        "position": ["GK"],
-        "birth_year": 2000,
-    },
-    "Aapo-Halme": {
-        "id": "02b952ce",
-        "nationality": ["fi"],
-        "position": ["DF"],
-        "birth_year": 1998,
-    },
-    "Jukka-Halme": {
-        "id": "8f4dcaa1",
-        "nationality": ["fi"],
-        "position": ["MF"],
-        "birth_year": 1985,
-    },
-    "Juuso-H\u00e4m\u00e4l\u00e4inen": {
-        "id": "81733bb9",
-        "nationality": ["fi"],
-        "position": ["DF"],
-        "birth_year": 1993,
-    },
-    "Taneli-H\u00e4m\u00e4l\u00e4inen": {
-        "id": "d2bdf86c",
-        "nationality": ["fi"],
-        "position": ["DF"],
-        "birth_year": 2001,
-    },
-    "Vahid-Hambo": {
-        "id": "bc93a41c",
-        "nationality": ["fi"],
-        "position": ["FW"],
-        "birth_year": 1995,
-    },
-    "Onni-H\u00e4nninen": {
-        "id": "1b0e7cbe",
-        "nationality": ["fi"],
-        "position": ["FW"],
-        "birth_year": 2005,
-    },
-    "Vertti-H\u00e4nninen": {
-        "id": "4434d67d",
-        "nationality": ["fi"],
-        "position": ["MF"],
-        "birth_year": 2002,
-    },
-    "Pyry-Hannola": {
-        "id": "f8f687e1",
-        "nationality": ["fi"],
-        "position": ["MF"],
-        "birth_year": 2001,
-    },
-    "David-Haro": {
-        "id": "f607cace",
-        "nationality": ["es"],
-        "position": ["FW", "MF"],
-        "birth_year": 1990,
-    },
-    "Noel-Hasa": {
-        "id": "ffef9d59",
-        "nationality": ["fi"],
-        "position": ["MF"],
-        "birth_year": 2003,
-    },
-    "Martti-Haukioja": {
-        "id": "7f0b8b5d",
-        "nationality": ["fi"],
-        "position": ["DF"],
-        "birth_year": 1999,
-    },
-    "Conor-Hazard": {
-        "id": "10161491",
-        "nationality": ["nir"],
-        "position": ["GK"],
-        "birth_year": 1998,
-    },
-    "Aapo-Heikkil\u00e4": {
-        "id": "7a6469df",
-        "nationality": ["fi"],
-        "position": ["MF"],
-        "birth_year": 1994,
-    },
-    "Daniel-Heikkinen": {"id": "99543b59", "position": ["MF"]},
-    "Artuu-Heinonen": {
-        "id": "335ca491",
-        "nationality": ["fi"],
-        "position": ["MF"],
-        "birth_year": 1999,
-    },
-    "Saku-Heiskanen": {
-        "id": "8107ce93",
-        "nationality": ["fi"],
-        "position": ["MF"],
-        "birth_year": 2001,
-    },
-    "Elmo-Henriksson": {
-        "id": "93467324",
-        "nationality": ["fi"],
-        "position": ["GK"],
-        "birth_year": 2003,
-    },
-    "Alan-Henrique": {
-        "id": "c15f666c",
-        "nationality": ["br"],
-        "position": ["DF"],
-        "birth_year": 1991,
-    },
-    "Anthony-Herbert": {
-        "id": "2f602ca2",
-        "nationality": ["tt"],
-        "position": ["DF"],
-        "birth_year": 1998,
-    },
-    "Aldayr-Hern\u00e1ndez": {
-        "id": "0e89355f",
-        "nationality": ["co"],
-        "position": ["DF"],
-        "birth_year": 1995,
-    },
-    "Loorents-Hertsi": {
-        "id": "690341e9",
-        "nationality": ["fi"],
-        "position": ["MF"],
-        "birth_year": 1992,
-    },
-    "Mehdi-Hetemaj": {
-        "id": "242f33e5",
-        "nationality": ["at"],
-        "position": ["DF"],
-        "birth_year": 1997,
-    },
-    "Mehmet-Hetemaj": {
-        "id": "bcd491be",
-        "nationality": ["fi"],
-        "position": ["DF", "MF"],
-        "birth_year": 1987,
-    },
-    "P\u00ebrparim-Hetemaj": {
-        "id": "90b70194",
-        "nationality": ["fi"],
-        "position": ["MF"],
-        "birth_year": 1986,
-    },
-    "Mika-Hilander": {
-        "id": "53e32365",
-        "nationality": ["fi"],
-        "position": ["GK"],
-        "birth_year": 1983,
-    },
-    "Macario-Hing-Glover": {
-        "id": "39d0f760",
-        "nationality": ["us"],
-        "position": ["MF"],
-        "birth_year": 1995,
-    },
-    "Eemeli-Honkola": {
-        "id": "c063d769",
-        "nationality": ["fi"],
-        "position": ["FW"],
-        "birth_year": 2005,
-    },
-    "Jamie-Hopcutt": {
-        "id": "d2ee6d5b",
-        "nationality": ["eng"],
-        "position": ["FW", "MF"],
-        "birth_year": 1992,
-    },
-    "Arttu-Hoskonen": {
-        "id": "d5efd527",
-        "nationality": ["fi"],
-        "position": ["MF"],
-        "birth_year": 1997,
-    },
-    "Santeri-Hostikka": {
-        "id": "73b1d487",
-        "nationality": ["fi"],
-        "position": ["DF", "MF"],
-        "birth_year": 1997,
-    },
-    "Matej-Hradeck\u00fd": {
-        "id": "962993e3",
-        "nationality": ["fi"],
-        "position": ["MF"],
-        "birth_year": 1995,
-    },
-    "Roni-Hudd": {
-        "id": "2db3c05f",
-        "nationality": ["fi"],
-        "position": ["FW"],
-        "birth_year": 2005,
-    },
-    "Eetu-Huuhtanen": {
-        "id": "d661c31f",
-        "nationality": ["fi"],
-        "position": ["GK"],
-        "birth_year": 2003,
-    },
-    "Juho-Hyv\u00e4rinen": {
-        "id": "14c11fb6",
-        "nationality": ["fi"],
-        "position": ["MF"],
-        "birth_year": 2000,
-    },
-    "J\u0101nis-Ikaunieks": {
-        "id": "2d319b80",
-        "nationality": ["lv"],
-        "position": ["MF"],
-        "birth_year": 1995,
-    },
-    "Keaton-Isaksson": {
-        "id": "fed33753",
-        "nationality": ["fi"],
-        "position": ["MF"],
-        "birth_year": 1994,
-    },
-    "Riku-J\u00e4\u00e4sk\u00e4": {
-        "id": "eab0c901",
-        "nationality": ["fi"],
-        "position": ["FW"],
-        "birth_year": 1998,
-    },
-    "Jair": {
-        "id": "7707d109",
-        "nationality": ["br"],
-        "position": ["MF"],
-        "birth_year": 1994,
-    },
-    "Kevin-Jansen": {
-        "id": "f2a7e0d4",
-        "nationality": ["nl"],
-        "position": ["MF"],
-        "birth_year": 1992,
-    },
-    "Teemu-J\u00e4ntti": {
-        "id": "8ecc3649",
-        "nationality": ["fi"],
-        "position": ["MF"],
-        "birth_year": 2000,
-    },
-    "Lassi-J\u00e4rvenp\u00e4\u00e4": {
-        "id": "b7b2f30a",
-        "nationality": ["fi"],
-        "position": ["DF"],
-        "birth_year": 1996,
-    },
-    "Iiro-J\u00e4rvinen": {
-        "id": "5ac5330b",
-        "nationality": ["fi"],
-        "position": ["MF"],
-        "birth_year": 1996,
-    },
-    "Jake-Jervis": {
-        "id": "7ebbee55",
-        "nationality": ["eng"],
-        "position": ["FW", "MF"],
-        "birth_year": 1991,
-    },
-    "Niklas-Jokelainen": {"id": "f9561e4e", "nationality": ["fi"], "position": ["FW"]},
-    "Oiva-Jukkola": {"id": "8e0b3812", "position": ["MF"]},
-    "Tommi-Jyry": {
-        "id": "bf09b219",
-        "nationality": ["fi"],
-        "position": ["MF"],
-        "birth_year": 1999,
-    },
-    "Armend-Kabashi": {
-        "id": "2a38ab19",
-        "nationality": ["fi"],
-        "position": ["MF"],
-        "birth_year": 1995,
-    },
-    "Melvin-Kahnberg": {
-        "id": "d9a2321b",
-        "nationality": ["fi"],
-        "position": ["DF"],
-        "birth_year": 2003,
-    },
-    "Nuutti-Kaikkonen": {
-        "id": "cf0a2885",
-        "nationality": ["fi"],
-        "position": ["GK"],
-        "birth_year": 2003,
-    },
-    "Jere-Kallinen": {
-        "id": "3243f59f",
-        "nationality": ["fi"],
-        "position": ["MF"],
-        "birth_year": 2002,
-    },
-    "Benjamin-K\u00e4llman": {
-        "id": "fd61c74d",
-        "nationality": ["fi"],
-        "position": ["FW"],
-        "birth_year": 1998,
-    },
-    "Wilson-Kamavuaka": {
-        "id": "5ee5ef41",
-        "nationality": ["cd"],
-        "position": ["DF", "MF"],
-        "birth_year": 1990,
-    },
-    "Macoumba-Kandji": {
-        "id": "01edbfa1",
-        "nationality": ["gm"],
-        "position": ["FW", "MF"],
-        "birth_year": 1985,
-    },
-    "Oliver-Kangaslahti": {
-        "id": "b4073c46",
-        "nationality": ["fi"],
-        "position": ["DF"],
-        "birth_year": 2000,
-    },
-    "Wilfried-Kanon": {
-        "id": "47dfdc74",
-        "nationality": ["ci"],
-        "position": ["DF"],
-        "birth_year": 1993,
-    },
-    "Roope-Kantola": {
-        "id": "228b2246",
-        "nationality": ["fi"],
-        "position": ["MF"],
-        "birth_year": 2002,
-    },
-    "Pauli-Katajam\u00e4ki": {
-        "id": "861ac6a8",
-        "nationality": ["fi"],
-        "position": ["MF"],
-        "birth_year": 2002,
-    },
-    "Aleksandar-Katanic": {
-        "id": "1528317f",
-        "nationality": ["rs"],
-        "position": ["FW"],
-        "birth_year": 1995,
-    },
-    "Kalle-Katz": {
-        "id": "fa4d9520",
-        "nationality": ["fi"],
-        "position": ["DF"],
-        "birth_year": 2000,
-    },
-    "Lucas-Kaufmann": {
-        "id": "38d6b05b",
-        "nationality": ["br"],
-        "position": ["FW"],
-        "birth_year": 1991,
-    },
-    "Tuomas-Kaukua": {
-        "id": "3ffbe7d1",
-        "nationality": ["fi"],
-        "position": ["MF"],
-        "birth_year": 2000,
-    },
-    "Rick-Ketting": {
-        "id": "aa90a746",
-        "nationality": ["nl"],
-        "position": ["DF"],
-        "birth_year": 1996,
-    },
-    "Matti-Klinga": {
-        "id": "ba58e181",
-        "nationality": ["fi"],
-        "position": ["MF"],
-        "birth_year": 1994,
-    },
-    "Daan-Klinkenberg": {
-        "id": "5c48912b",
-        "nationality": ["nl"],
-        "position": ["DF"],
-        "birth_year": 1996,
-    },
-    "Marius-K\u00f6nkk\u00f6l\u00e4": {
-        "id": "71f15e2c",
-        "nationality": ["fi"],
-        "position": ["FW"],
-        "birth_year": 2003,
-    },
-    "Berat-K\u00f6se": {
-        "id": "86c0d7c6",
-        "nationality": ["fi"],
-        "position": ["MF"],
-        "birth_year": 1999,
-    },
-    "Miika-Koskela": {
-        "id": "9eb4e4ee",
-        "nationality": ["fi"],
-        "position": ["MF"],
-        "birth_year": 2003,
-    },
-    "Ville-Koski": {
-        "id": "57c151e4",
-        "nationality": ["fi"],
-        "position": ["DF"],
-        "birth_year": 2002,
-    },
-    "Otso-Koskinen": {
-        "id": "602aaa23",
-        "nationality": ["fi"],
-        "position": ["MF"],
-        "birth_year": 2003,
-    },
-    "Daniel-Koskipalo": {
-        "id": "64d9c278",
-        "nationality": ["fi"],
-        "position": ["DF"],
-        "birth_year": 2003,
-    },
-    "Kevin-Kouassivi-Benissan": {
-        "id": "e71948be",
-        "nationality": ["fi"],
-        "position": ["DF"],
-        "birth_year": 1999,
-    },
-    "Florian-Krebs": {
-        "id": "ea714e70",
-        "nationality": ["de"],
-        "position": ["MF"],
-        "birth_year": 1999,
-    },
-    "Johannes-Kreidl": {
-        "id": "bfcf986d",
-        "nationality": ["at"],
-        "position": ["GK"],
-        "birth_year": 1996,
-    },
-    "Luka-Kuittinen": {
-        "id": "211931d6",
-        "nationality": ["fi"],
-        "position": ["DF"],
-        "birth_year": 2003,
-    },
-    "Aatu-Kujanp\u00e4\u00e4": {
-        "id": "97cf2d51",
-        "nationality": ["fi"],
-        "position": ["MF"],
-        "birth_year": 1998,
-    },
-    "Leo-Kyll\u00f6nen": {
-        "id": "a921ad8e",
-        "nationality": ["fi"],
-        "position": ["MF"],
-        "birth_year": 2004,
-    },
-    "Oiva-Laaksonen": {
-        "id": "0d5f9fab",
-        "nationality": ["fi"],
-        "position": ["FW"],
-        "birth_year": 2003,
-    },
-    "Timi-Lahti": {
-        "id": "48c07357",
-        "nationality": ["fi"],
-        "position": ["DF"],
-        "birth_year": 1990,
-    },
-    "Janne-Pekka-Laine": {
-        "id": "ce67c769",
-        "nationality": ["fi"],
-        "position": ["MF"],
-        "birth_year": 2001,
-    },
-    "Lauri-Laine": {
-        "id": "99d048f1",
-        "nationality": ["fi"],
-        "position": ["MF"],
-        "birth_year": 2005,
-    },
-    "Nooa-Laine": {
-        "id": "51492fd1",
-        "nationality": ["fi"],
-        "position": ["MF"],
-        "birth_year": 2002,
-    },
-    "Pyry-Lampinen": {
-        "id": "91cc1d1d",
-        "nationality": ["fi"],
-        "position": ["FW"],
-        "birth_year": 2002,
-    },
-    "Adam-Larsson": {
-        "id": "33064bf6",
-        "nationality": ["se"],
-        "position": ["DF"],
-        "birth_year": 1999,
-    },
-    "Joakim-Latonen": {
-        "id": "ae01ae2b",
-        "nationality": ["fi"],
-        "position": ["MF"],
-        "birth_year": 1998,
-    },
-    "Otto-Lehtisalo": {
-        "id": "43fa20b8",
-        "nationality": ["fi"],
-        "position": ["FW"],
-        "birth_year": 2004,
-    },
-    "Rasmus-Leislahti": {
-        "id": "652afb4e",
-        "nationality": ["fi"],
-        "position": ["GK"],
-        "birth_year": 2000,
-    },
-    "Joonas-Lepist\u00f6": {
-        "id": "6ac2f72c",
-        "nationality": ["fi"],
-        "position": ["MF"],
-        "birth_year": 1998,
-    },
-    "Jonas-Lev\u00e4nen": {
-        "id": "7ca95814",
-        "nationality": ["fi"],
-        "position": ["MF"],
-        "birth_year": 1994,
-    },
-    "Otso-Liimatta": {
-        "id": "1d932cbe",
-        "nationality": ["fi"],
-        "position": ["MF"],
-        "birth_year": 2004,
-    },
-    "Samuel-Lindeman": {
-        "id": "7ade52d4",
-        "nationality": ["fi"],
-        "position": ["MF"],
-        "birth_year": 1997,
-    },
-    "Patrick-Loa-Loa": {
-        "id": "7e0eccef",
-        "nationality": ["cm"],
-        "position": ["FW"],
-        "birth_year": 1999,
-    },
-    "Michael-L\u00f3pez": {
-        "id": "9998f968",
-        "nationality": ["ar"],
-        "position": ["FW"],
-        "birth_year": 1997,
-    },
-    "Luiyi-de-Lucas": {
-        "id": "4968de41",
-        "nationality": ["do"],
-        "position": ["DF"],
-        "birth_year": 1994,
-    },
-    "Aapo-M\u00e4enp\u00e4\u00e4": {
-        "id": "f716eed1",
-        "nationality": ["fi"],
-        "position": ["DF"],
-        "birth_year": 1998,
-    },
-    "Ryan-Mahuta": {
-        "id": "304154d7",
-        "nationality": ["fi"],
-        "position": ["DF"],
-        "birth_year": 2002,
-    },
-    "Obed-Malolo": {
-        "id": "a7c84c43",
-        "nationality": ["fi"],
-        "position": ["MF"],
-        "birth_year": 1997,
-    },
-    "Henri-Malundama": {
-        "id": "7c56140e",
-        "nationality": ["fi"],
-        "position": ["MF"],
-        "birth_year": 1995,
-    },
-    "Eero-Markkanen": {
-        "id": "802f38cb",
-        "nationality": ["fi"],
-        "position": ["FW"],
-        "birth_year": 1991,
-    },
-    "Niko-Markkula": {
-        "id": "76a2d06a",
-        "nationality": ["fi"],
-        "position": ["DF", "MF"],
-        "birth_year": 1990,
-    },
-    "Manuel-Martic": {
-        "id": "af8ccfb1",
-        "nationality": ["at"],
-        "position": ["MF"],
-        "birth_year": 1995,
-    },
-    "Teppo-Marttinen": {
-        "id": "b1bd4f13",
-        "nationality": ["fi"],
-        "position": ["GK"],
-        "birth_year": 1997,
-    },
-    "Elias-Mastokangas": {
-        "id": "8af4033a",
-        "nationality": ["fi"],
-        "position": ["MF"],
-        "birth_year": 2001,
-    },
-    "Sakari-Mattila": {
-        "id": "31369209",
-        "nationality": ["fi"],
-        "position": ["DF", "MF"],
-        "birth_year": 1989,
-    },
-    "Hysen-Memolla": {
-        "id": "1ea362f0",
-        "nationality": ["al"],
-        "position": ["DF"],
-        "birth_year": 1992,
-    },
-    "Baba-Mensah": {
-        "id": "533ab632",
-        "nationality": ["gh"],
-        "position": ["DF"],
-        "birth_year": 1994,
-    },
-    "Kai-Meriluoto": {
-        "id": "aa889990",
-        "nationality": ["fi"],
-        "position": ["FW"],
-        "birth_year": 2003,
-    },
-    "Konsta-Mervel\u00e4": {
-        "id": "c202cfeb",
-        "nationality": ["fi"],
-        "position": ["DF"],
-        "birth_year": 2004,
-    },
-    "Samuli-Miettinen": {
-        "id": "ad55b765",
-        "nationality": ["fi"],
-        "position": ["DF"],
-        "birth_year": 2004,
-    },
-    "Tony-Miettinen": {
-        "id": "583e89cf",
-        "nationality": ["fi"],
-        "position": ["DF"],
-        "birth_year": 2002,
-    },
-    "Tatu-Miettunen": {
-        "id": "5d8301f3",
-        "nationality": ["fi"],
-        "position": ["DF"],
-        "birth_year": 1995,
-    },
-    "Rui-Modesto": {
-        "id": "4f9c2d8c",
-        "nationality": ["pt"],
-        "position": ["FW"],
-        "birth_year": 1999,
-    },
-    "Josepablo-Monreal": {
-        "id": "4588b72c",
-        "nationality": ["cl"],
-        "position": ["FW"],
-        "birth_year": 1996,
-    },
-    "Valtteri-Moren": {
-        "id": "a611cc92",
-        "nationality": ["fi"],
-        "position": ["DF"],
-        "birth_year": 1991,
-    },
-    "Steven-Morrissey": {
-        "id": "2e8c0283",
-        "nationality": ["jm"],
-        "position": ["FW"],
-        "birth_year": 1986,
-    },
-    "Kareem-Moses": {
-        "id": "8a688161",
-        "nationality": ["tt"],
-        "position": ["DF"],
-        "birth_year": 1990,
-    },
-    "Kalle-Multanen": {
-        "id": "f1c119d0",
-        "nationality": ["fi"],
-        "position": ["FW"],
-        "birth_year": 1989,
-    },
-    "Murilo": {
-        "id": "1d438d6c",
-        "nationality": ["br"],
-        "position": ["DF"],
-        "birth_year": 1995,
-    },
-    "Jonathan-Muzinga": {
-        "id": "aea84652",
-        "nationality": ["fi"],
-        "position": ["FW"],
-        "birth_year": 2002,
-    },
-    "Dario-Naamo": {
-        "id": "24208c06",
-        "nationality": ["fi"],
-        "position": ["DF"],
-        "birth_year": 2005,
-    },
-    "Fortuna-Namputu": {
-        "id": "a3862dc6",
-        "nationality": ["cd"],
-        "position": ["MF"],
-        "birth_year": 1996,
-    },
-    "Miguel-Nazarit": {
-        "id": "49d6d3ce",
-        "nationality": ["co"],
-        "position": ["DF"],
-        "birth_year": 1997,
-    },
-    "Okko-Nenonen": {
-        "id": "57844df5",
-        "nationality": ["fi"],
-        "position": ["FW"],
-        "birth_year": 2004,
-    },
-    "Ariel-Ngueukam": {
-        "id": "3e589a7c",
-        "nationality": ["cm"],
-        "position": ["FW"],
-        "birth_year": 1988,
-    },
-    "Miika-Niemi": {
-        "id": "8d0743b8",
-        "nationality": ["fi"],
-        "position": ["DF"],
-        "birth_year": 1994,
-    },
-    "Jesse-Nikki": {
-        "id": "395fd0a4",
-        "nationality": ["fi"],
-        "position": ["DF"],
-        "birth_year": 2003,
-    },
-    "Jussi-Niska": {
-        "id": "b423700c",
-        "nationality": ["fi"],
-        "position": ["DF"],
-        "birth_year": 2002,
-    },
-    "Jiri-Nissinen": {
-        "id": "052e75d7",
-        "nationality": ["fi"],
-        "position": ["MF"],
-        "birth_year": 1997,
-    },
-    "Raymond-Nogha": {
-        "id": "6fc1abc2",
-        "nationality": ["cm"],
-        "position": ["MF"],
-        "birth_year": 2004,
-    },
-    "Atska-Ntonalnto": {"id": "59d64b0f", "position": ["MF"]},
-    "Musah-Nuhu": {
-        "id": "d463d94c",
-        "nationality": ["gh"],
-        "position": ["DF"],
-        "birth_year": 1997,
-    },
-    "Josep-Nuorela": {"id": "80f89cfe", "position": ["DF"]},
-    "Noah-Nurmi": {
-        "id": "51ecb8f4",
-        "nationality": ["fi"],
-        "position": ["DF"],
-        "birth_year": 2001,
-    },
-    "Arttu-Nuutinen": {
-        "id": "28539895",
-        "nationality": ["fi"],
-        "position": ["MF"],
-        "birth_year": 1995,
-    },
-    "Kingsley-Ofori": {
-        "id": "ae481690",
-        "nationality": ["gh"],
-        "position": ["FW"],
-        "birth_year": 2002,
-    },
-    "Matias-Ojala": {
-        "id": "7630423c",
-        "nationality": ["fi"],
-        "position": ["MF"],
-        "birth_year": 1995,
-    },
-    "Salomo-Ojala": {
-        "id": "21cb6e08",
-        "nationality": ["fi"],
-        "position": ["FW"],
-        "birth_year": 1997,
-    },
-    "Jaakko-Oksanen": {
-        "id": "82b13dde",
-        "nationality": ["fi"],
-        "position": ["MF"],
-        "birth_year": 2000,
-    },
-    "Denys-Oliynyk": {
-        "id": "8d344a00",
-        "nationality": ["ua"],
-        "position": ["MF"],
-        "birth_year": 1987,
-    },
-    "Tuomas-Ollila": {
-        "id": "3791693f",
-        "nationality": ["fi"],
-        "position": ["DF"],
-        "birth_year": 2000,
-    },
-    "Anthony-Olusanya": {
-        "id": "095ec83c",
-        "nationality": ["fi"],
-        "position": ["FW"],
-        "birth_year": 2000,
-    },
-    "David-Onyeanula": {
-        "id": "efca8eaa",
-        "nationality": ["ng"],
-        "position": ["FW"],
-        "birth_year": 2000,
-    },
-    "Jesse-\u00d6st": {
-        "id": "4189fccc",
-        "nationality": ["fi"],
-        "position": ["GK"],
-        "birth_year": 1990,
-    },
-    "Eric-Oteng": {
-        "id": "4666de19",
-        "nationality": ["gh"],
-        "position": ["MF"],
-        "birth_year": 2001,
-    },
-    "John-Owoeri": {
-        "id": "ba80a794",
-        "nationality": ["ng"],
-        "position": ["FW"],
-        "birth_year": 1987,
-    },
-    "Aleksi-Paananen": {
-        "id": "716d1a59",
-        "nationality": ["fi"],
-        "position": ["FW", "MF"],
-        "birth_year": 1993,
-    },
-    "Aleksi-Pahkasalo": {
-        "id": "095c27ce",
-        "nationality": ["fi"],
-        "position": ["MF"],
-        "birth_year": 1992,
-    },
-    "Noah-Pallas": {
-        "id": "dcef4788",
-        "nationality": ["fi"],
-        "position": ["DF"],
-        "birth_year": 2001,
-    },
-    "Djair-Parfitt-Williams": {
-        "id": "060bc64c",
-        "nationality": ["bm"],
-        "position": ["FW"],
-        "birth_year": 1996,
-    },
-    "Samuel-Pasanen": {
-        "id": "b697aeaf",
-        "nationality": ["fi"],
-        "position": ["MF"],
-        "birth_year": 2006,
-    },
-    "Emmanuel-Patut": {
-        "id": "37f42cff",
-        "nationality": ["fi"],
-        "position": ["MF"],
-        "birth_year": 2003,
-    },
-    "Roope-Paunio": {
-        "id": "6a782f71",
-        "nationality": ["fi"],
-        "position": ["GK"],
-        "birth_year": 2002,
-    },
-    "Matti-Peltola": {
-        "id": "7af31216",
-        "nationality": ["fi"],
-        "position": ["DF"],
-        "birth_year": 2002,
-    },
-    "Juhani-Pennanen": {
-        "id": "98ebfe33",
-        "nationality": ["fi"],
-        "position": ["GK"],
-        "birth_year": 1993,
-    },
-    "Petteri-Pennanen": {
-        "id": "faf0a2f2",
-        "nationality": ["fi"],
-        "position": ["MF"],
-        "birth_year": 1990,
-    },
-    "Teemu-Penninkangas": {
-        "id": "92f87cd9",
-        "nationality": ["fi"],
-        "position": ["DF"],
-        "birth_year": 1992,
-    },
-    "Juhani-Pikkarainen": {
-        "id": "7e30f78c",
-        "nationality": ["fi"],
-        "position": ["DF"],
-        "birth_year": 1998,
-    },
-    "Juho-Pirttijoki": {
-        "id": "ad65975d",
-        "nationality": ["fi"],
-        "position": ["DF"],
-        "birth_year": 1996,
-    },
-    "Didis-Pitah": {
-        "id": "f7911a69",
-        "nationality": ["fi"],
-        "position": ["FW"],
-        "birth_year": 1998,
-    },
-    "Mikko-Pitk\u00e4nen": {
-        "id": "8088a12b",
-        "nationality": ["fi"],
-        "position": ["DF"],
-        "birth_year": 1997,
-    },
-    "Anton-Popovitch": {
-        "id": "41ab24a2",
-        "nationality": ["fi"],
-        "position": ["MF"],
-        "birth_year": 1996,
-    },
-    "Tino-Purme": {
-        "id": "22d5b436",
-        "nationality": ["fi"],
-        "position": ["MF"],
-        "birth_year": 1998,
-    },
-    "Eetu-Puro": {
-        "id": "f5224d89",
-        "nationality": ["fi"],
-        "position": ["MF"],
-        "birth_year": 1997,
-    },
-    "Akseli-Puukko": {
-        "id": "33309b03",
-        "nationality": ["fi"],
-        "position": ["DF"],
-        "birth_year": 2006,
-    },
-    "Bojan-Radulovic": {
-        "id": "cbeed9e6",
-        "nationality": ["rs"],
-        "position": ["FW"],
-        "birth_year": 1999,
-    },
-    "Rafinha": {
-        "id": "fd3c9b6e",
-        "nationality": ["br"],
-        "position": ["DF", "FW"],
-        "birth_year": 1982,
-    },
-    "Antti-Ville-R\u00e4is\u00e4nen": {
-        "id": "eb87482c",
-        "nationality": ["fi"],
-        "position": ["MF"],
-        "birth_year": 1998,
-    },
-    "Jukka-Raitala": {
-        "id": "67b054d1",
-        "nationality": ["fi"],
-        "position": ["DF"],
-        "birth_year": 1988,
-    },
-    "Patrik-Raitanen": {
-        "id": "7e3fa851",
-        "nationality": ["fi"],
-        "position": ["DF"],
-        "birth_year": 2001,
-    },
-    "Matias-Rale": {
-        "id": "adf51131",
-        "nationality": ["fi"],
-        "position": ["DF"],
-        "birth_year": 2001,
-    },
-    "Ramilson": {
-        "id": "96579e6e",
-        "nationality": ["br"],
-        "position": ["GK"],
-        "birth_year": 1999,
-    },
-    "Konsta-Rasimus": {
-        "id": "1ce12fdf",
-        "nationality": ["fi"],
-        "position": ["MF"],
-        "birth_year": 1990,
-    },
-    "Antonio-Reguero": {
-        "id": "c698c3f3",
-        "nationality": ["es"],
-        "position": ["GK"],
-        "birth_year": 1982,
-    },
-    "Tyler-Reid": {
-        "id": "bbdd9e40",
-        "nationality": ["eng"],
-        "position": ["DF"],
-        "birth_year": 1997,
-    },
-    "Paulo-Ricardo": {
-        "id": "d518a829",
-        "nationality": ["br"],
-        "position": ["DF"],
-        "birth_year": 1994,
-    },
-    "Matias-Riikonen": {
-        "id": "f7c20b55",
-        "nationality": ["fi"],
-        "position": ["GK"],
-        "birth_year": 2002,
-    },
-    "Jere-Riissanen": {
-        "id": "f7ec9c9d",
-        "nationality": ["fi"],
-        "position": ["DF"],
-        "birth_year": 2005,
-    },
-    "Riku-Riski": {
-        "id": "62122118",
-        "nationality": ["fi"],
-        "position": ["FW", "MF"],
-        "birth_year": 1989,
-    },
-    "Roope-Riski": {
-        "id": "72dacad9",
-        "nationality": ["fi"],
-        "position": ["FW"],
-        "birth_year": 1991,
-    },
-    "Joel-Rodr\u00edguez": {
-        "id": "9cf4ffa9",
-        "nationality": ["es"],
-        "position": ["FW"],
-        "birth_year": 1998,
-    },
-    "Logan-Rogerson": {
-        "id": "9538d1a4",
-        "nationality": ["nz"],
-        "position": ["FW"],
-        "birth_year": 1998,
-    },
-    "Diego-Rojas": {
-        "id": "5af7c6c8",
-        "nationality": ["cl"],
-        "position": ["MF"],
-        "birth_year": 1995,
-    },
-    "Maksim-Rudakov": {
-        "id": "409eec21",
-        "nationality": ["ru"],
-        "position": ["GK"],
-        "birth_year": 1996,
-    },
-    "Ruxi": {
-        "id": "bf0a02be",
-        "nationality": ["es"],
-        "position": ["DF"],
-        "birth_year": 1995,
-    },
-    "Niilo-Saarikivi": {
-        "id": "3dfdc28f",
-        "nationality": ["fi"],
-        "position": ["FW"],
-        "birth_year": 2003,
-    },
-    "Seth-Saarinen": {
-        "id": "93a2f867",
-        "nationality": ["fi"],
-        "position": ["DF"],
-        "birth_year": 2001,
-    },
-    "Thomas-Saarinen": {
-        "id": "ea2cb4d9",
-        "nationality": ["fi"],
-        "position": ["DF"],
-        "birth_year": 2004,
-    },
-    "Agon-Sadiku": {
-        "id": "8b1960f4",
-        "nationality": ["fi"],
-        "position": ["FW"],
-        "birth_year": 2003,
-    },
-    "Janne-Saksela": {
-        "id": "8e0e6432",
-        "nationality": ["fi"],
-        "position": ["DF"],
-        "birth_year": 1993,
-    },
-    "Dennis-Salanovi\u0107": {
-        "id": "7dab1242",
-        "nationality": ["li"],
-        "position": ["FW", "MF"],
-        "birth_year": 1996,
-    },
-    "Ebuka-Samson": {
-        "id": "248e9363",
-        "nationality": ["ng"],
-        "position": ["MF"],
-        "birth_year": 1999,
-    },
-    "Momodou-Sarr": {
-        "id": "787dc5fe",
-        "nationality": ["fi"],
-        "position": ["FW"],
-        "birth_year": 2000,
-    },
-    "Savio": {
-        "id": "57ff3df8",
-        "nationality": ["br"],
-        "position": ["MF"],
-        "birth_year": 1996,
-    },
-    "Saku-Savolainen": {
-        "id": "57cea68c",
-        "nationality": ["fi"],
-        "position": ["FW"],
-        "birth_year": 1996,
-    },
-    "Arlind-Sejdiu": {
-        "id": "fb6974d8",
-        "nationality": ["xk"],
-        "position": ["MF"],
-        "birth_year": 2001,
-    },
-    "Ibra-Sekajja": {
-        "id": "b1bfebc3",
-        "nationality": ["eng"],
-        "position": ["FW"],
-        "birth_year": 1992,
-    },
-    "Riku-Selander": {
-        "id": "e1eb5878",
-        "nationality": ["fi"],
-        "position": ["MF"],
-        "birth_year": 1994,
-    },
-    "Fabian-Serrarens": {
-        "id": "00899db5",
-        "nationality": ["nl"],
-        "position": ["FW"],
-        "birth_year": 1991,
-    },
-    "Robin-Sid": {
-        "id": "b4154e4a",
-        "nationality": ["fi"],
-        "position": ["MF"],
-        "birth_year": 1994,
-    },
-    "Rober-Sierra": {
-        "id": "7ce4ff4e",
-        "nationality": ["es"],
-        "position": ["MF"],
-        "birth_year": 1996,
-    },
-    "Atte-Sihvonen": {
-        "id": "bc7c6147",
-        "nationality": ["fi"],
-        "position": ["DF"],
-        "birth_year": 1996,
-    },
-    "Tuure-Siira": {
-        "id": "7215334d",
-        "nationality": ["fi"],
-        "position": ["MF"],
-        "birth_year": 1994,
-    },
-    "Samba-Sillah": {
-        "id": "076d9ed6",
-        "nationality": ["fi"],
-        "position": ["DF"],
-        "birth_year": 1999,
-    },
-    "Gabriel-Sillanp\u00e4\u00e4": {"id": "19b3eda8", "position": ["DF"]},
-    "Nikoloz-Sitchinava": {
-        "id": "32597f6e",
-        "nationality": ["ge"],
-        "position": ["FW"],
-        "birth_year": 1994,
-    },
-    "Riku-Sj\u00f6roos": {
-        "id": "dac00e1f",
-        "nationality": ["fi"],
-        "position": ["MF"],
-        "birth_year": 1995,
-    },
-    "Pyry-Soiri": {
-        "id": "59671448",
-        "nationality": ["fi"],
-        "position": ["MF"],
-        "birth_year": 1994,
-    },
-    "Guillermo-Sotelo": {
-        "id": "2434e7ee",
-        "nationality": ["ar"],
-        "position": ["DF"],
-        "birth_year": 1991,
-    },
-    "St\u00e5le-Steen-S\u00e6thre": {
-        "id": "ceeb86e3",
-        "nationality": ["no"],
-        "position": ["FW"],
-        "birth_year": 1993,
-    },
-    "Sebastian-Strandvall": {
-        "id": "ea878616",
-        "nationality": ["fi"],
-        "position": ["MF"],
-        "birth_year": 1986,
-    },
-    "Mikko-Sumusalo": {
-        "id": "de25754c",
-        "nationality": ["fi"],
-        "position": ["DF"],
-        "birth_year": 1990,
-    },
-    "Onni-Suutari": {"id": "daf363ba", "position": ["FW"], "birth_year": 2022},
-    "Luc-Tabi-Manga": {
-        "id": "710f2eee",
-        "nationality": ["cm"],
-        "position": ["DF"],
-        "birth_year": 1994,
-    },
-    "Maximus-Tainio": {
-        "id": "5af2a4ce",
-        "nationality": ["fi"],
-        "position": ["DF"],
-        "birth_year": 2001,
-    },
-    "Talles": {
-        "id": "b1bcda48",
-        "nationality": ["br"],
-        "position": ["MF"],
-        "birth_year": 1998,
-    },
-    "Duarte-Tammilehto": {
-        "id": "833e11d2",
-        "nationality": ["fi"],
-        "position": ["MF"],
-        "birth_year": 1990,
-    },
-    "Eero-Tamminen": {
-        "id": "3c989a93",
-        "nationality": ["fi"],
-        "position": ["MF"],
-        "birth_year": 1995,
-    },
-    "Matias-Tamminen": {
-        "id": "e076aa9d",
-        "nationality": ["fi"],
-        "position": ["FW"],
-        "birth_year": 2001,
-    },
-    "Atomu-Tanaka": {
-        "id": "031ebd52",
-        "nationality": ["jp"],
-        "position": ["MF"],
-        "birth_year": 1987,
-    },
-    "Jakob-T\u00e5nnander": {
-        "id": "c631ba63",
-        "nationality": ["se"],
-        "position": ["GK"],
-        "birth_year": 2000,
-    },
-    "Muhamed-Tehe-Olawale": {
-        "id": "493e48c9",
-        "nationality": ["ci"],
-        "position": ["FW"],
-        "birth_year": 1999,
-    },
-    "Miro-Tenho": {
-        "id": "2ca35213",
-        "nationality": ["fi"],
-        "position": ["DF"],
-        "birth_year": 1995,
-    },
-    "Casper-Terho": {
-        "id": "bd2f622a",
-        "nationality": ["fi"],
-        "position": ["MF"],
-        "birth_year": 2003,
-    },
-    "Joona-Tiainen": {
-        "id": "d7552077",
-        "nationality": ["fi"],
-        "position": ["GK"],
-        "birth_year": 2000,
-    },
-    "Ville-Tikkanen": {
-        "id": "f3e3d488",
-        "nationality": ["fi"],
-        "position": ["MF"],
-        "birth_year": 1999,
-    },
-    "Joona-Toivio": {
-        "id": "2794a536",
-        "nationality": ["fi"],
-        "position": ["DF"],
-        "birth_year": 1988,
-    },
-    "Henri-Toivom\u00e4ki": {
-        "id": "a8bf43e8",
-        "nationality": ["fi"],
-        "position": ["DF"],
-        "birth_year": 1991,
-    },
-    "Aaro-Toivonen": {
-        "id": "34724b3b",
-        "nationality": ["fi"],
-        "position": ["MF"],
-        "birth_year": 2005,
-    },
-    "Diogo-Tomas": {
-        "id": "09f961b5",
-        "nationality": ["fi"],
-        "position": ["DF"],
-        "birth_year": 1997,
-    },
-    "Christian-Tue-Jensen": {
-        "id": "77d26896",
-        "nationality": ["dk"],
-        "position": ["MF"],
-        "birth_year": 2000,
-    },
-    "Markus-Uusitalo": {
-        "id": "1b8768b5",
-        "nationality": ["fi"],
-        "position": ["GK"],
-        "birth_year": 1997,
-    },
-    "Henry-Uzochokwu": {
-        "id": "807c2c71",
-        "nationality": ["ng"],
-        "position": ["DF"],
-        "birth_year": 1999,
-    },
-    "Santeri-V\u00e4\u00e4n\u00e4nen": {
-        "id": "63567ebc",
-        "nationality": ["fi"],
-        "position": ["MF"],
-        "birth_year": 2002,
-    },
-    "Joonas-Vahtera": {
-        "id": "7fafd636",
-        "nationality": ["fi"],
-        "position": ["MF"],
-        "birth_year": 1996,
-    },
-    "Matias-Vainionp\u00e4\u00e4": {
-        "id": "96e12d9e",
-        "nationality": ["fi"],
-        "position": ["DF"],
-        "birth_year": 2001,
-    },
-    "Cristian-Valencia": {
-        "id": "4d8fef83",
-        "nationality": ["co"],
-        "position": ["DF"],
-        "birth_year": 1991,
-    },
-    "Filip-Valen\u010di\u010d": {
-        "id": "e5c0909b",
-        "nationality": ["si"],
-        "position": ["FW"],
-        "birth_year": 1992,
-    },
-    "Jorn-Vancamp": {
-        "id": "5be0ef77",
-        "nationality": ["be"],
-        "position": ["FW"],
-        "birth_year": 1998,
-    },
-    "Tim-V\u00e4yrynen": {
-        "id": "a2544081",
-        "nationality": ["fi"],
-        "position": ["FW"],
-        "birth_year": 1993,
-    },
-    "Joona-Veteli": {
-        "id": "0205f98e",
-        "nationality": ["fi"],
-        "position": ["MF"],
-        "birth_year": 1995,
-    },
-    "Axel-Vidjeskog": {
-        "id": "c0adcd6c",
-        "nationality": ["fi"],
-        "position": ["FW"],
-        "birth_year": 2001,
-    },
-    "Jean-Jaur\u00e8s-Vigori": {
-        "id": "c428cfdb",
-        "nationality": ["ci"],
-        "position": ["DF"],
-        "birth_year": 2002,
-    },
-    "Walter-Viitala": {
-        "id": "6d289267",
-        "nationality": ["fi"],
-        "position": ["GK"],
-        "birth_year": 1992,
-    },
-    "ViljamiJokiranta": {
-        "id": "0ddbfedb",
-        "nationality": ["fi"],
-        "position": ["MF"],
-        "birth_year": 2006,
-    },
-    "Eemeli-Virta": {
-        "id": "6e074de7",
-        "nationality": ["fi"],
-        "position": ["MF"],
-        "birth_year": 2000,
-    },
-    "Otso-Virtanen": {
-        "id": "d899ef92",
-        "nationality": ["fi"],
-        "position": ["GK"],
-        "birth_year": 1994,
-    },
-    "Jerry-Voutilainen": {
-        "id": "e297ca78",
-        "nationality": ["fi"],
-        "position": ["MF"],
-        "birth_year": 1995,
-    },
-    "Calum-Ward": {
-        "id": "6b68180b",
-        "nationality": ["eng"],
-        "position": ["GK"],
-        "birth_year": 2000,
-    },
-    "Ollie-Whyte": {
-        "id": "50cc7ab2",
-        "nationality": ["nz"],
-        "position": ["MF"],
-        "birth_year": 2000,
-    },
-    "Oscar-Wikl\u00f6f": {
-        "id": "d94782e6",
-        "nationality": ["fi"],
-        "position": ["FW"],
-        "birth_year": 2003,
-    },
-    "Rafa\u0142-Wolszty\u0144ski": {
-        "id": "661c3068",
-        "nationality": ["pl"],
-        "position": ["FW"],
-        "birth_year": 1994,
-    },
-    "Moshtagh-Yaghoubi": {
-        "id": "4339b991",
-        "nationality": ["fi"],
-        "position": ["MF"],
-        "birth_year": 1994,
-    },
-    "Najeeb-Yakubu": {
-        "id": "f80f8e10",
-        "nationality": ["ne"],
-        "position": ["DF", "MF"],
-        "birth_year": 2000,
-    },
-    "Tete-Yengi": {"id": "1c215c70", "position": ["FW"]},
-    "Johannes-Yli-Kokko": {
-        "id": "ca3478f9",
-        "nationality": ["fi"],
-        "position": ["MF"],
-        "birth_year": 2001,
-    },
-    "Miska-Ylitolva": {
-        "id": "161e0b9f",
-        "nationality": ["fi"],
-        "position": ["DF"],
-        "birth_year": 2004,
-    },
-    "Stavros-Zarokostas": {
-        "id": "7f3117a8",
-        "nationality": ["gr"],
-        "position": ["FW"],
-        "birth_year": 1997,
-    },
-    "Altin-Zeqiri": {
-        "id": "314898fd",
-        "nationality": ["xk"],
-        "position": ["FW"],
-        "birth_year": 2000,
-    },
-}
+
+@lru_cache(maxsize=None)
+def _players() -> dict:
+    from footballdata.players import player_registry
+
+    return player_registry.to_dict()
+
+
+def __getattr__(name: str):
+    # settings.players used to be a dict literal, build it once, when asked for
+    if name == "players":
+        return _players()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,809 @@
+# Storage backends for the season tables
+import json
+import logging
+import os
+from itertools import groupby
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
+import xlsxwriter
+
+from footballdata.columns import TableView, column_key, column_metadata
+from footballdata.settings import FRAMES_DIR, SEASON_WORKBOOK
+from footballdata.teams import TEAM_ID, TeamIndex
+
+logger = logging.getLogger(__name__)
+
+# Separator of the flat column names of the files written before the
+# canonical keys of columns.column_key, None of the fbref stat names contain it
+LEGACY_COLUMN_SEP = "|"
+# Name given to an unnamed (Squad) index so it can be filtered on.
+INDEX_NAME = "Squad"
+METADATA_KEY = b"footballdata"
+# Columns the SeasonStore adds from the {country}/{tier}/{season}/ directories
+PARTITIONING = ds.partitioning(
+    pa.schema([("Country", pa.string()), ("Tier", pa.int32()), ("Season", pa.string())])
+)
+# Names of the squad column, the home / away tables name their index Squads
+SQUAD_NAMES = {"Squad", "Squads"}
+# Sheet of a table in its own .xlsx file, df.to_excel's default
+XLSX_SHEET = "Sheet1"
+# The header pandas gives the empty cells of a two level header
+UNNAMED = "Unnamed: "
+
+OPERATORS = {
+    "==": lambda col, val: col == val,
+    "=": lambda col, val: col == val,
+    "!=": lambda col, val: col != val,
+    "<": lambda col, val: col < val,
+    "<=": lambda col, val: col <= val,
+    ">": lambda col, val: col > val,
+    ">=": lambda col, val: col >= val,
+    "in": lambda col, val: col.isin(val),
+    "not in": lambda col, val: ~col.isin(val),
+}
+
+
+def legacy_column_name(col) -> str:
+    """("Advanced_Passing", "KP_Opp") -> "Advanced_Passing|KP_Opp"."""
+    if isinstance(col, tuple):
+        return LEGACY_COLUMN_SEP.join(str(level) for level in col)
+    return str(col)
+
+
+def _original(col):
+    return tuple(col) if isinstance(col, list) else col
+
+
+def stored_names(schema: pa.Schema) -> dict:
+    """{column: its name in the file} of a table written by to_arrow.
+
+    Files written before the canonical keys have legacy_column_name names.
+    """
+    raw_metadata = (schema.metadata or {}).get(METADATA_KEY)
+    if raw_metadata is None:
+        return {}
+    metadata = json.loads(raw_metadata)
+    columns = [_original(col) for col in metadata["columns"]]
+    names = metadata.get("keys") or [legacy_column_name(col) for col in columns]
+    return dict(zip(columns, names))
+
+
+def stored_name(col, names: dict = None) -> str:
+    """The name of col in a file with the stored_names names.
+
+    Index and partition columns, which aren't in names, keep their name.
+    """
+    if names and col in names:
+        return names[col]
+    return column_key(col) if isinstance(col, tuple) else col
+
+
+def flat_filters(filters: list, names: dict = None) -> list:
+    """Filters on two level headers -> filters on the flattened columns."""
+    return [
+        [(stored_name(col, names), op, val) for col, op, val in conjunction]
+        if isinstance(conjunction, list)
+        else (stored_name(conjunction[0], names), *conjunction[1:])
+        for conjunction in filters
+    ]
+
+
+def apply_filters(df: pd.DataFrame, filters: list) -> pd.DataFrame:
+    """Filter a df in memory with pyarrow style filters.
+
+    :filters: [(column, op, value), ...] all of them have to hold, or a list of
+        such lists where at least one of them has to hold.
+    """
+    if not filters:
+        return df
+    if isinstance(filters[0], tuple):
+        filters = [filters]
+
+    mask = pd.Series(False, index=df.index)
+    for conjunction in filters:
+        conj_mask = pd.Series(True, index=df.index)
+        for column, op, value in conjunction:
+            if column in df.columns:
+                values = df[column]
+            elif column in df.index.names:
+                values = pd.Series(df.index.get_level_values(column), index=df.index)
+            else:
+                raise KeyError(f"Can't filter on {column}, no such column.")
+            conj_mask &= OPERATORS[op](values, value)
+        mask |= conj_mask
+
+    return df[mask]
+
+
+def partition_filters(filters: list, partition: dict) -> list:
+    """The filters left for the rows of a partition once the predicates on its
+    Country, Tier and Season are evaluated, None when none of its rows match.
+    """
+    if not filters:
+        return []
+    if isinstance(filters[0], tuple):
+        filters = [filters]
+
+    left = []
+    for conjunction in filters:
+        if all(
+            OPERATORS[op](pd.Series([partition[column]]), value).all()
+            for column, op, value in conjunction
+            if column in partition
+        ):
+            rest = [
+                predicate for predicate in conjunction if predicate[0] not in partition
+            ]
+            if not rest:
+                return []
+            left.append(rest)
+
+    return left or None
+
+
+def _cells(values) -> list:
+    """The values as python objects, None where they're missing."""
+    values = np.asarray(values, dtype=object)
+    cells = values.tolist()
+    for position in np.flatnonzero(pd.isna(values)):
+        cells[position] = None
+    return cells
+
+
+def _write_sheet(worksheet, df: pd.DataFrame, header_format) -> None:
+    """df in the layout of df.to_excel, with the index for two level headers."""
+    columns = [_cells(df.iloc[:, position]) for position in range(df.shape[1])]
+    if df.columns.nlevels > 1:
+        n_index = df.index.nlevels
+        col = n_index
+        for group, stats in groupby(df.columns.get_level_values(0)):
+            span = len(list(stats))
+            if span > 1:
+                worksheet.merge_range(0, col, 0, col + span - 1, group, header_format)
+            else:
+                worksheet.write(0, col, group, header_format)
+            col += span
+        worksheet.write_row(
+            1, n_index, list(df.columns.get_level_values(-1)), header_format
+        )
+        for col, name in enumerate(df.index.names):
+            if name is not None:
+                worksheet.write(2, col, name, header_format)
+        columns = [
+            _cells(df.index.get_level_values(level)) for level in range(n_index)
+        ] + columns
+        first_row = 3
+    else:
+        n_index = 0
+        worksheet.write_row(0, 0, [str(col) for col in df.columns], header_format)
+        first_row = 1
+
+    for row, values in enumerate(zip(*columns), start=first_row):
+        for col, value in enumerate(values):
+            if value is not None:
+                worksheet.write(
+                    row, col, value, header_format if col < n_index else None
+                )
+
+
+def write_xlsx(path: Path, sheets: dict[str, pd.DataFrame]) -> None:
+    """Write the dfs to path, one sheet each.
+
+    The rows are streamed to the file one at a time (xlsxwriter's
+    constant_memory mode) so memory doesn't grow with the workbook. The
+    workbook is written to a temp file and renamed over path.
+    """
+    path = Path(path)
+    tmp_path = path.with_name(f".{path.name}.tmp")
+    workbook = xlsxwriter.Workbook(
+        tmp_path,
+        {
+            "constant_memory": True,
+            "strings_to_formulas": False,
+            "strings_to_urls": False,
+        },
+    )
+    header_format = workbook.add_format(
+        {"bold": True, "border": 1, "align": "center", "valign": "top"}
+    )
+    try:
+        for sheet, df in sheets.items():
+            _write_sheet(workbook.add_worksheet(sheet), df, header_format)
+        workbook.close()
+        os.replace(tmp_path, path)
+    finally:
+        tmp_path.unlink(missing_ok=True)
+
+
+class StorageBackend:
+    """Reads and writes the season tables under {root}/{country}/{tier}/{season}/"""
+
+    suffix = ""
+
+    def __init__(self, root: Path = FRAMES_DIR):
+        self.root = Path(root)
+
+    def path(self, country: str, tier: int, season: str, table: str) -> Path:
+        return Path(self.root, country, str(tier), season, f"{table}{self.suffix}")
+
+    def exists(self, country: str, tier: int, season: str, table: str) -> bool:
+        return self.path(country, tier, season, table).exists()
+
+    def stored_tables(self, country: str, tier: int, season: str) -> set:
+        """The names of the season's stored tables, listed once."""
+        directory = Path(self.root, country, str(tier), season)
+        return {path.stem for path in directory.glob(f"*{self.suffix}")}
+
+    def write(
+        self,
+        country: str,
+        tier: int,
+        season: str,
+        table: str,
+        df: pd.DataFrame,
+        overwrite: bool = False,
+    ) -> Path:
+        path = self.path(country, tier, season, table)
+        if path.exists() and not overwrite:
+            logger.warning("%s exists", path.name)
+            return path
+        os.makedirs(path.parent, exist_ok=True)
+        logger.info("Creating %s", path)
+        self._write(path, df)
+
+        return path
+
+    def write_tables(
+        self,
+        country: str,
+        tier: int,
+        season: str,
+        tables: dict[str, pd.DataFrame],
+        overwrite: bool = False,
+    ) -> list:
+        """write each of {table: df}, returns their paths."""
+        return [
+            self.write(country, tier, season, table, df, overwrite)
+            for table, df in tables.items()
+        ]
+
+    def read(
+        self,
+        country: str,
+        tier: int,
+        season: str,
+        table: str,
+        columns: list = None,
+        filters: list = None,
+    ) -> pd.DataFrame:
+        """Read a table back.
+
+        :columns: Only return those columns. Tuples for two level headers.
+        :filters: pyarrow style predicates e.g. [("Rk", "<=", 5)]
+        """
+        path = self.path(country, tier, season, table)
+        if not path.exists():
+            raise FileNotFoundError(f"No {table} table for {country} {tier} {season}")
+
+        return self._read(path, columns=columns, filters=filters)
+
+    def read_view(
+        self,
+        country: str,
+        tier: int,
+        season: str,
+        table: str,
+        columns: list = None,
+        filters: list = None,
+    ) -> TableView:
+        """read, as a TableView with the canonical keys of the columns."""
+        df = self.read(country, tier, season, table, columns, filters)
+        return TableView.from_frame(df, table)
+
+    def _write(self, path: Path, df: pd.DataFrame) -> None:
+        raise NotImplementedError
+
+    def _read(self, path: Path, columns: list, filters: list) -> pd.DataFrame:
+        raise NotImplementedError
+
+
+def is_two_level_sheet(path: Path, sheet=0) -> bool:
+    """The sheet has a two level header, written with the squad index in its
+    first column, whose cell is empty in both header rows.
+
+    A flat table written with its unnamed index has an empty A1 as well, but
+    its second row starts with the first index value.
+    """
+    first_rows = pd.read_excel(path, sheet_name=sheet, header=None, nrows=2)
+    return (
+        first_rows.shape[0] > 1
+        and pd.isna(first_rows.iat[0, 0])
+        and pd.isna(first_rows.iat[1, 0])
+    )
+
+
+class ExcelBackend(StorageBackend):
+    """The original one file per table .xlsx layout.
+
+    A season can be packed in one SEASON_WORKBOOK instead, a sheet per table
+    (create_xlsx_from_dict(..., workbook=True)). Its tables are read from and
+    rewritten in their sheets, the tables it doesn't have get files of their
+    own.
+    """
+
+    suffix = ".xlsx"
+
+    def workbook_path(self, country: str, tier: int, season: str) -> Path:
+        return Path(self.root, country, str(tier), season, SEASON_WORKBOOK)
+
+    def sheets(self, country: str, tier: int, season: str) -> list:
+        """The tables packed in the season's workbook, none without one."""
+        path = self.workbook_path(country, tier, season)
+        if not path.exists():
+            return []
+        with pd.ExcelFile(path) as xlsx:
+            return xlsx.sheet_names
+
+    def _packed(self, country: str, tier: int, season: str, table: str) -> bool:
+        return not self.path(country, tier, season, table).exists() and (
+            table in self.sheets(country, tier, season)
+        )
+
+    def exists(self, country: str, tier: int, season: str, table: str) -> bool:
+        return super().exists(country, tier, season, table) or self._packed(
+            country, tier, season, table
+        )
+
+    def stored_tables(self, country: str, tier: int, season: str) -> set:
+        tables = super().stored_tables(country, tier, season)
+        tables.discard(Path(SEASON_WORKBOOK).stem)
+        return tables | set(self.sheets(country, tier, season))
+
+    def read(
+        self,
+        country: str,
+        tier: int,
+        season: str,
+        table: str,
+        columns: list = None,
+        filters: list = None,
+    ) -> pd.DataFrame:
+        if self._packed(country, tier, season, table):
+            path = self.workbook_path(country, tier, season)
+            return self._read(path, columns, filters, sheet=table)
+
+        return super().read(country, tier, season, table, columns, filters)
+
+    def write(
+        self,
+        country: str,
+        tier: int,
+        season: str,
+        table: str,
+        df: pd.DataFrame,
+        overwrite: bool = False,
+    ) -> Path:
+        return self.write_tables(country, tier, season, {table: df}, overwrite)[0]
+
+    def write_tables(
+        self,
+        country: str,
+        tier: int,
+        season: str,
+        tables: dict[str, pd.DataFrame],
+        overwrite: bool = False,
+    ) -> list:
+        """write, the tables packed in the season's workbook are replaced in
+        their sheets by one rewrite of it.
+        """
+        sheets = self.sheets(country, tier, season)
+        packed = {}
+        paths = []
+        for table, df in tables.items():
+            if table in sheets and not self.path(country, tier, season, table).exists():
+                packed[table] = df
+            else:
+                paths.append(super().write(country, tier, season, table, df, overwrite))
+        if not packed:
+            return paths
+
+        path = self.workbook_path(country, tier, season)
+        if not overwrite:
+            logger.warning("%s has %s", path.name, list(packed))
+            return paths + [path]
+        logger.info("Updating %s of %s", list(packed), path)
+        write_xlsx(
+            path,
+            {
+                sheet: packed[sheet]
+                if sheet in packed
+                else self._read(path, None, None, sheet=sheet)
+                for sheet in sheets
+            },
+        )
+
+        return paths + [path]
+
+    def _write(self, path: Path, df: pd.DataFrame) -> None:
+        write_xlsx(path, {XLSX_SHEET: df})
+
+    def _read(self, path: Path, columns: list, filters: list, sheet=0) -> pd.DataFrame:
+        if is_two_level_sheet(path, sheet):
+            df = pd.read_excel(path, sheet_name=sheet, header=[0, 1], index_col=0)
+            df.columns = pd.MultiIndex.from_tuples(
+                [
+                    (str(group), "" if str(stat).startswith(UNNAMED) else str(stat))
+                    for group, stat in df.columns
+                ]
+            )
+            df.index.name = None
+        else:
+            df = pd.read_excel(path, sheet_name=sheet)
+            if "Unnamed: 0" in df.columns:
+                df.drop(columns="Unnamed: 0", inplace=True)
+        df = apply_filters(df, filters)
+        if columns is not None:
+            df = df[list(columns)]
+
+        return df
+
+
+class ParquetBackend(StorageBackend):
+    """Parquet files that keep the two level headers and the squad index.
+
+    Two level headers are flattened to their columns.column_key, e.g.
+    "advanced_passing.kp_opp", in the file and the original headers are kept in
+    the schema metadata, so reading a table gives back the same df. Column
+    projection and filters are pushed down to pyarrow.
+    """
+
+    suffix = ".parquet"
+
+    def __init__(self, root: Path = FRAMES_DIR, compression: str = "zstd"):
+        super().__init__(root)
+        self.compression = compression
+
+    def _write(self, path: Path, df: pd.DataFrame) -> None:
+        pq.write_table(to_arrow(df), path, compression=self.compression)
+
+    def _read(self, path: Path, columns: list, filters: list) -> pd.DataFrame:
+        if columns is not None or filters:
+            names = stored_names(pq.read_schema(path))
+        if columns is not None:
+            columns = [stored_name(col, names) for col in columns]
+        if filters:
+            filters = flat_filters(filters, names)
+        table = pq.read_table(
+            path, columns=columns, filters=filters, use_pandas_metadata=True
+        )
+
+        return from_arrow(table)
+
+
+def to_arrow(df: pd.DataFrame) -> pa.Table:
+    """df -> arrow table with the canonical keys of its columns as names, and the
+    headers in the metadata.
+    """
+    keys = list(column_metadata(df.columns).index)
+    flat = df.copy(deep=False)
+    flat.columns = keys
+    index_names = list(df.index.names)
+    if (
+        not isinstance(df.index, pd.RangeIndex)
+        and index_names == [None]
+        and INDEX_NAME not in flat.columns
+    ):
+        flat.index = flat.index.rename(INDEX_NAME)
+
+    table = pa.Table.from_pandas(flat)
+    metadata = {
+        "columns": [list(col) if isinstance(col, tuple) else col for col in df.columns],
+        "keys": keys,
+        "column_names": list(df.columns.names),
+        "index_names": index_names,
+    }
+    schema_metadata = dict(table.schema.metadata or {})
+    schema_metadata[METADATA_KEY] = json.dumps(metadata).encode()
+
+    return table.replace_schema_metadata(schema_metadata)
+
+
+def from_arrow(table: pa.Table) -> pd.DataFrame:
+    """Inverse of to_arrow, works on projections of the original table as well."""
+    df = table.to_pandas()
+    raw_metadata = (table.schema.metadata or {}).get(METADATA_KEY)
+    if raw_metadata is None:
+        return df
+
+    metadata = json.loads(raw_metadata)
+    originals = {name: col for col, name in stored_names(table.schema).items()}
+    columns = [originals.get(col, col) for col in df.columns]
+    if columns and all(isinstance(col, tuple) for col in columns):
+        df.columns = pd.MultiIndex.from_tuples(columns, names=metadata["column_names"])
+    else:
+        df.columns = pd.Index(columns, name=metadata["column_names"][0])
+    if metadata["index_names"] == [None] and df.index.names == [INDEX_NAME]:
+        df.index = df.index.rename(None)
+
+    return df
+
+
+def write_ipc(path: Path, df: pd.DataFrame) -> Path:
+    """Write the df to path as an Arrow IPC file, see to_arrow.
+
+    Written to a temp file and renamed over path, so a reader never sees half
+    a table.
+    """
+    path = Path(path)
+    tmp_path = path.with_name(f".{path.name}.tmp")
+    table = to_arrow(df)
+    try:
+        with pa.OSFile(str(tmp_path), "wb") as sink:
+            with pa.ipc.new_file(sink, table.schema) as writer:
+                writer.write_table(table)
+        os.replace(tmp_path, path)
+    finally:
+        tmp_path.unlink(missing_ok=True)
+
+    return path
+
+
+def read_arrow_ipc(path: Path) -> pa.Table:
+    """The Arrow table of an IPC file, memory mapped rather than read.
+
+    The table's buffers point into the mapped file, nothing is deserialized.
+    """
+    with pa.memory_map(str(path)) as source:
+        return pa.ipc.open_file(source).read_all()
+
+
+def read_ipc(path: Path) -> pd.DataFrame:
+    """Inverse of write_ipc."""
+    return from_arrow(read_arrow_ipc(path))
+
+
+def _promote(types: list) -> pa.DataType:
+    """A type every one of types can be cast to."""
+    if all(pa.types.is_integer(dtype) for dtype in types):
+        return max(types, key=lambda dtype: dtype.bit_width)
+    if all(
+        pa.types.is_integer(dtype) or pa.types.is_floating(dtype) for dtype in types
+    ):
+        return pa.float64()
+    if any(pa.types.is_dictionary(dtype) for dtype in types):
+        return pa.string()
+    return types[0]
+
+
+def unify_schemas(schemas: list) -> pa.Schema:
+    """One schema for the files of a table stored over many seasons.
+
+    Columns missing from some files are kept and columns stored with different
+    types (e.g. int16 in one season, int32 in another) get a common one. The
+    metadata is the first schema's.
+    """
+    fields = {}
+    for schema in schemas:
+        for field in schema:
+            fields.setdefault(field.name, []).append(field.type)
+    return pa.schema(
+        [
+            pa.field(name, types[0] if len(set(types)) == 1 else _promote(types))
+            for name, types in fields.items()
+        ],
+        metadata=schemas[0].metadata,
+    )
+
+
+class SeasonStore:
+    """Every season, league and table a ParquetBackend wrote under root, queried
+    as one dataset partitioned by country/tier/season/table.
+
+    Only the files of the requested table, seasons and leagues are opened and
+    the column projection and the filters are pushed down to them, so a query
+    across many seasons reads just what it returns.
+    """
+
+    def __init__(self, root: Path = FRAMES_DIR):
+        self.root = Path(root)
+
+    def tables(self) -> list:
+        return sorted({path.stem for path in self.root.glob("*/*/*/*.parquet")})
+
+    def columns(self, table: str) -> pd.DataFrame:
+        """The metadata table of a stored table's columns, see
+        columns.column_metadata.
+        """
+        paths = self._paths(table, None, None)
+        if not paths:
+            raise FileNotFoundError(f"No stored {table} table")
+        names = stored_names(pq.read_schema(paths[0]))
+        return column_metadata(names, table, keys=names.values())
+
+    def _paths(
+        self, table: str, seasons: list, leagues: list, partitions: set = None
+    ) -> list:
+        if partitions is None:
+            candidates = self.root.glob(f"*/*/*/{table}.parquet")
+        else:
+            # Only the partitions' directories, not every season under root
+            candidates = [
+                Path(self.root, country, str(tier), season, f"{table}.parquet")
+                for country, tier, season in partitions
+            ]
+        paths = []
+        for path in sorted(candidates):
+            if not path.exists():
+                continue
+            country, tier, season = path.parts[-4:-1]
+            if seasons is not None and season not in seasons:
+                continue
+            if leagues is not None and not (
+                country in leagues or (country, int(tier)) in leagues
+            ):
+                continue
+            paths.append(path)
+        return paths
+
+    def select(
+        self,
+        table: str,
+        columns: list = None,
+        where: list = None,
+        seasons=None,
+        leagues: list = None,
+        teams: list = None,
+    ) -> pd.DataFrame:
+        """One df with the table of every matching season and league.
+
+        :table: e.g. "standings_table", or one of the DERIVED_TABLES e.g. "h-a"
+            computed from their stored table
+        :columns: Only return those columns. Tuples for two level headers.
+        :where: pyarrow style predicates e.g. [("Rk", "<=", 5)], on the table's
+            columns as well as Country, Tier and Season
+        :seasons: A year range e.g. "2017-2023" or a list of seasons
+            e.g. ["2021-2022", "2022-2023"], all of them by default
+        :leagues: A list of countries or (country, tier) pairs, all by default
+        :teams: team_ids or names of the registry of root, only their rows.
+            Only the partitions the TeamIndex has them in are read.
+
+        The squad index becomes a column and Country, Tier and Season columns
+        are added. Squad, Country and Season are categoricals.
+        """
+        # library builds on this module
+        from footballdata.library import DERIVED_TABLES
+
+        if isinstance(seasons, str):
+            start_year, end_year = (int(year) for year in seasons.split("-"))
+            seasons = [f"{year}-{year + 1}" for year in range(start_year, end_year)]
+        partitions = None
+        if teams is not None:
+            index = TeamIndex(self.root)
+            try:
+                team_ids = [index.team_id(team) for team in teams]
+                partitions = set(index.partitions(team_ids))
+            finally:
+                index.close()
+            team_filter = (TEAM_ID, "in", team_ids)
+            if where and isinstance(where[0], list):
+                where = [conjunction + [team_filter] for conjunction in where]
+            else:
+                where = list(where or []) + [team_filter]
+        derived = DERIVED_TABLES.get(table)
+        source = table if derived is None else derived.source
+        paths = self._paths(source, seasons, leagues, partitions)
+        if not paths:
+            raise FileNotFoundError(f"No stored {table} table matches the query")
+
+        if derived is None:
+            df, partitions = self._scan(paths, columns, where)
+        else:
+            df, partitions = self._derive(derived, paths, columns, where)
+        if isinstance(df.index, pd.RangeIndex):
+            df = df.reset_index(drop=True)
+        else:
+            if df.index.names == [None]:
+                df.index = df.index.rename(INDEX_NAME)
+            df = df.reset_index()
+        for col in df.columns:
+            name = col[0] if isinstance(col, tuple) else col
+            if name in SQUAD_NAMES:
+                df[col] = df[col].astype("category")
+        df["Country"] = partitions["Country"].astype("category")
+        df["Tier"] = partitions["Tier"]
+        df["Season"] = pd.Categorical(
+            partitions["Season"],
+            categories=sorted(partitions["Season"].unique()),
+            ordered=True,
+        )
+
+        return df
+
+    def _scan(self, paths: list, columns: list, where: list) -> tuple:
+        """The table of the files, read as one dataset, and the partitions of
+        its rows.
+        """
+        first_schema = pq.read_schema(paths[0])
+        schema = unify_schemas(
+            [first_schema] + [pq.read_schema(path) for path in paths[1:]]
+        )
+        for field in PARTITIONING.schema:
+            schema = schema.append(field)
+        dataset = ds.dataset(
+            [str(path) for path in paths],
+            schema=schema,
+            format="parquet",
+            partitioning=PARTITIONING,
+            partition_base_dir=str(self.root),
+        )
+
+        partition_names = PARTITIONING.schema.names
+        names = stored_names(first_schema)
+        if columns is not None:
+            pandas_metadata = json.loads(first_schema.metadata.get(b"pandas", b"{}"))
+            index_columns = [
+                col
+                for col in pandas_metadata.get("index_columns", [])
+                if isinstance(col, str)
+            ]
+            columns = index_columns + [stored_name(col, names) for col in columns]
+            columns += [name for name in partition_names if name not in columns]
+        expression = None
+        if where:
+            expression = pq.filters_to_expression(flat_filters(where, names))
+        result = dataset.to_table(columns=columns, filter=expression)
+
+        partitions = result.select(partition_names).to_pandas()
+        return from_arrow(result.drop(partition_names)), partitions
+
+    def _derive(self, derived, paths: list, columns: list, where: list) -> tuple:
+        """The DerivedTable of each file's table, filtered in memory, and the
+        partitions of its rows.
+        """
+        frames = []
+        partitions = []
+        for path in paths:
+            country, tier, season = path.parts[-4:-1]
+            partition = {"Country": country, "Tier": int(tier), "Season": season}
+            source = from_arrow(pq.read_table(path, use_pandas_metadata=True))
+            df = derived.build(source)
+            filters = partition_filters(where, partition)
+            df = df.iloc[:0] if filters is None else apply_filters(df, filters)
+            if columns is not None:
+                df = df[columns]
+            frames.append(df)
+            partitions.append(
+                pd.DataFrame(partition, index=range(len(df))).astype({"Tier": "int32"})
+            )
+
+        return pd.concat(frames), pd.concat(partitions, ignore_index=True)
+
+    def view(
+        self,
+        table: str,
+        columns: list = None,
+        where: list = None,
+        seasons=None,
+        leagues: list = None,
+        teams: list = None,
+    ) -> TableView:
+        """select, as a TableView with the canonical keys of the columns."""
+        df = self.select(table, columns, where, seasons, leagues, teams)
+        return TableView.from_frame(df, table)
+
+
+backends = {"xlsx": ExcelBackend, "parquet": ParquetBackend}
+
+
+def get_backend(name: str, root: Path = FRAMES_DIR) -> StorageBackend:
+    try:
+        return backends[name](root)
+    except KeyError as exc:
+        raise KeyError(
+            f"No storage backend named {name}, choose one of {list(backends)}"
+        ) from exc
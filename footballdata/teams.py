@@ -0,0 +1,365 @@
+# Team registry stored in an SQLite file, a stable integer id per squad
+import html as html_entities
+import os
+import re
+import sqlite3
+import threading
+from pathlib import Path
+from typing import NamedTuple
+
+import numpy as np
+import pandas as pd
+
+from footballdata.settings import FRAMES_DIR
+
+# Written under the root of the stored frames, see registry_at and TeamIndex
+TEAMS_DB_NAME = "teams.sqlite"
+TEAM_INDEX_NAME = "team_index.sqlite"
+TEAM_ID = "team_id"
+TEAM_ID_DTYPE = "int32"
+# The squad links of a season's page, e.g. <a href="/en/squads/18bb7c10/
+# 2022-2023/Arsenal-Stats">Arsenal</a>, in its commented out tables as well
+SQUAD_LINK = re.compile(r'href="/en/squads/([0-9a-f]{8})/[^"]*">([^<]+)</a>')
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS teams (
+    team_id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL,
+    fbref_id TEXT UNIQUE
+);
+CREATE TABLE IF NOT EXISTS aliases (
+    alias TEXT NOT NULL,
+    team_id INTEGER NOT NULL REFERENCES teams(team_id),
+    PRIMARY KEY (alias, team_id)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS aliases_team_id ON aliases(team_id);
+"""
+
+INDEX_SCHEMA = """
+CREATE TABLE IF NOT EXISTS partitions (
+    team_id INTEGER NOT NULL,
+    country TEXT NOT NULL,
+    tier INTEGER NOT NULL,
+    season TEXT NOT NULL,
+    PRIMARY KEY (team_id, country, tier, season)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS partitions_partition ON partitions(country, tier, season);
+"""
+
+
+class Partition(NamedTuple):
+    """A league's season, a directory of the stored frames."""
+
+    country: str
+    tier: int
+    season: str
+
+
+class Team(NamedTuple):
+    team_id: int
+    name: str  # the first name the team was seen with
+    fbref_id: str  # fbref's squad id, None for teams only known by name
+
+
+def parse_squads(html: str) -> dict[str, str]:
+    """{squad name: fbref squad id} of the squads linked from a page."""
+    return {
+        html_entities.unescape(name): fbref_id
+        for fbref_id, name in SQUAD_LINK.findall(html)
+    }
+
+
+class TeamRegistry:
+    """Every squad seen in any league or season, by a stable integer id.
+
+    A team is its fbref squad id, the names it had on fbref are its aliases,
+    so "Manchester United" and "Manchester Utd" are the same team_id. Names
+    registered without an fbref id get a team of their own, which takes the
+    fbref id once the name is seen with one.
+    Ids are never reassigned, the lookups are cached. The ids belong to the
+    frames they're stored in, registry_at gives the registry of a root.
+    """
+
+    def __init__(self, path: Path = FRAMES_DIR / TEAMS_DB_NAME):
+        self.path = Path(path)
+        self._connection = None
+        self._pid = None
+        self._lock = threading.RLock()
+        self._ids = {}
+
+    @property
+    def connection(self) -> sqlite3.Connection:
+        # A connection isn't shared with the processes forked after opening it
+        if self._connection is None or self._pid != os.getpid():
+            with self._lock:
+                if self._connection is None or self._pid != os.getpid():
+                    os.makedirs(self.path.parent, exist_ok=True)
+                    connection = sqlite3.connect(
+                        self.path,
+                        timeout=30,
+                        isolation_level=None,
+                        check_same_thread=False,
+                    )
+                    connection.executescript(SCHEMA)
+                    self._connection = connection
+                    self._pid = os.getpid()
+        return self._connection
+
+    def __reduce__(self):
+        # Pickled by path, a process pool's worker opens its own connection
+        return TeamRegistry, (self.path,)
+
+    def _query(self, sql: str, params: tuple = ()) -> list:
+        with self._lock:
+            return self.connection.execute(sql, params).fetchall()
+
+    def register(self, squads: dict[str, str]) -> dict[str, int]:
+        """Add {name: fbref id} of the squads of a page, returns {name: team_id}.
+
+        The fbref id decides the team, the name becomes one of its aliases.
+        """
+        with self._lock:
+            connection = self.connection
+            # Other processes ingesting seasons wait for the transaction
+            connection.execute("BEGIN IMMEDIATE")
+            try:
+                ids = {
+                    name: self._register(connection, name, fbref_id)
+                    for name, fbref_id in squads.items()
+                }
+                connection.execute("COMMIT")
+            except BaseException:
+                connection.execute("ROLLBACK")
+                raise
+
+        return ids
+
+    @staticmethod
+    def _register(connection: sqlite3.Connection, name: str, fbref_id: str) -> int:
+        row = None
+        if fbref_id is not None:
+            row = connection.execute(
+                "SELECT team_id FROM teams WHERE fbref_id = ?", (fbref_id,)
+            ).fetchone()
+            if row is None:
+                # A team registered by name only takes the fbref id
+                row = connection.execute(
+                    "SELECT team_id FROM aliases JOIN teams USING (team_id) "
+                    "WHERE alias = ? AND fbref_id IS NULL ORDER BY team_id LIMIT 1",
+                    (name,),
+                ).fetchone()
+                if row is not None:
+                    connection.execute(
+                        "UPDATE teams SET fbref_id = ? WHERE team_id = ?",
+                        (fbref_id, row[0]),
+                    )
+        else:
+            row = connection.execute(
+                "SELECT MIN(team_id) FROM aliases WHERE alias = ?", (name,)
+            ).fetchone()
+            row = None if row[0] is None else row
+        if row is None:
+            row = connection.execute(
+                "INSERT INTO teams (name, fbref_id) VALUES (?, ?) RETURNING team_id",
+                (name, fbref_id),
+            ).fetchone()
+        connection.execute(
+            "INSERT OR IGNORE INTO aliases (alias, team_id) VALUES (?, ?)",
+            (name, row[0]),
+        )
+        return row[0]
+
+    def add(self, name: str, fbref_id: str = None) -> int:
+        """The team_id of a squad, registering it if it's new."""
+        return self.register({name: fbref_id})[name]
+
+    def add_alias(self, alias: str, team_id: int) -> None:
+        """Another name of a team, e.g. a name fbref doesn't link."""
+        with self._lock:
+            self.connection.execute(
+                "INSERT OR IGNORE INTO aliases (alias, team_id) VALUES (?, ?)",
+                (alias, team_id),
+            )
+        self._ids.pop(alias, None)
+
+    def id(self, name: str) -> int:
+        """The team_id of a name, None if it was never seen.
+
+        A name shared by several teams, e.g. a men's and a women's squad, is
+        the one registered first.
+        """
+        if name not in self._ids:
+            row = self._query(
+                "SELECT MIN(team_id) FROM aliases WHERE alias = ?", (name,)
+            )[0]
+            if row[0] is None:
+                return None
+            self._ids[name] = row[0]
+        return self._ids[name]
+
+    def ids(self, names, squads: dict[str, int] = None) -> np.ndarray:
+        """The team_ids of the names as an int32 array, new names registered.
+
+        :squads: {name: team_id} looked up before the registry, register's of
+            the season's page
+        """
+        names = np.asarray(names, dtype=object)
+        uniques, first, codes = np.unique(names, return_index=True, return_inverse=True)
+        squads = squads or {}
+        known = {
+            name: squads[name] if name in squads else self.id(name) for name in uniques
+        }
+        # New names get their ids in the order they come in
+        new = [
+            uniques[unique]
+            for unique in np.argsort(first)
+            if known[uniques[unique]] is None
+        ]
+        if new:
+            known.update(self.register(dict.fromkeys(new)))
+
+        return np.array([known[name] for name in uniques], dtype=TEAM_ID_DTYPE)[codes]
+
+    def get(self, team_id: int) -> Team:
+        """The team, None if there is no such team."""
+        rows = self._query(
+            "SELECT team_id, name, fbref_id FROM teams WHERE team_id = ?", (team_id,)
+        )
+        return Team(*rows[0]) if rows else None
+
+    def by_fbref_id(self, fbref_id: str) -> Team:
+        rows = self._query(
+            "SELECT team_id, name, fbref_id FROM teams WHERE fbref_id = ?", (fbref_id,)
+        )
+        return Team(*rows[0]) if rows else None
+
+    def aliases(self, team_id: int) -> list:
+        rows = self._query(
+            "SELECT alias FROM aliases WHERE team_id = ? ORDER BY alias", (team_id,)
+        )
+        return [row[0] for row in rows]
+
+    def names(self) -> list:
+        """Every name and alias."""
+        rows = self._query("SELECT DISTINCT alias FROM aliases ORDER BY alias")
+        return [row[0] for row in rows]
+
+    def __getitem__(self, name: str) -> Team:
+        team_id = self.id(name)
+        if team_id is None:
+            raise KeyError(name)
+        return self.get(team_id)
+
+    def __contains__(self, name: str) -> bool:
+        return self.id(name) is not None
+
+    def __iter__(self):
+        return iter(self.names())
+
+    def __len__(self) -> int:
+        """The number of teams, not of names."""
+        return self._query("SELECT COUNT(*) FROM teams")[0][0]
+
+    def close(self) -> None:
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
+        self._ids.clear()
+
+
+_registries = {}
+
+
+def registry_at(root: Path) -> TeamRegistry:
+    """The TeamRegistry of the frames stored under root, <root>/TEAMS_DB_NAME.
+
+    One per root, so the ids written to a root's tables are the ones its
+    TeamIndex and SeasonStore look names up in.
+    """
+    root = Path(root)
+    if root not in _registries:
+        _registries[root] = TeamRegistry(root / TEAMS_DB_NAME)
+    return _registries[root]
+
+
+# The registry of the default FRAMES_DIR
+team_registry = registry_at(FRAMES_DIR)
+
+
+def team_ids(df: pd.DataFrame) -> np.ndarray:
+    """The distinct team_ids of a table, empty when it has none."""
+    for col in (TEAM_ID, (TEAM_ID, "")):
+        if col in df.columns:
+            return pd.unique(df[col])
+    return np.array([], dtype=TEAM_ID_DTYPE)
+
+
+class TeamIndex:
+    """Inverted index of the stored frames, the partitions each team is in.
+
+    save_season_tables updates it when it writes a season, so the seasons
+    a club played, and in which tier, are a lookup rather than a scan of
+    every standings_table under root.
+    Teams are team_ids or names of the registry, the one of root by default.
+    """
+
+    def __init__(self, root: Path, registry: TeamRegistry = None):
+        self.path = Path(root) / TEAM_INDEX_NAME
+        self.registry = registry or registry_at(root)
+        os.makedirs(self.path.parent, exist_ok=True)
+        self.connection = sqlite3.connect(self.path, timeout=30)
+        self.connection.executescript(INDEX_SCHEMA)
+
+    def update(self, country: str, tier: int, season: str, teams) -> None:
+        """Set the teams of a partition, the ones it had before are replaced."""
+        with self.connection:
+            self.connection.execute(
+                "DELETE FROM partitions WHERE country = ? AND tier = ? AND season = ?",
+                (country, tier, season),
+            )
+            self.connection.executemany(
+                "INSERT INTO partitions (team_id, country, tier, season) "
+                "VALUES (?, ?, ?, ?)",
+                [(int(team_id), country, tier, season) for team_id in teams],
+            )
+
+    def team_id(self, team) -> int:
+        if isinstance(team, (int, np.integer)):
+            return int(team)
+        team_id = self.registry.id(team)
+        if team_id is None:
+            raise KeyError(f"No team named {team}")
+        return team_id
+
+    def partitions(self, teams) -> list[Partition]:
+        """The partitions of a team, or of any of a list of teams, by season."""
+        if isinstance(teams, (str, int, np.integer)):
+            teams = [teams]
+        ids = [self.team_id(team) for team in teams]
+        rows = self.connection.execute(
+            "SELECT DISTINCT country, tier, season FROM partitions "
+            f"WHERE team_id IN ({', '.join('?' * len(ids))}) "
+            "ORDER BY season, country, tier",
+            ids,
+        ).fetchall()
+        return [Partition(*row) for row in rows]
+
+    def teams(self, country: str, tier: int, season: str) -> list:
+        """The team_ids of a partition."""
+        rows = self.connection.execute(
+            "SELECT team_id FROM partitions "
+            "WHERE country = ? AND tier = ? AND season = ? ORDER BY team_id",
+            (country, tier, season),
+        ).fetchall()
+        return [row[0] for row in rows]
+
+    def history(self, team) -> pd.DataFrame:
+        """Country, Tier and Season of every season of a team, e.g. to follow
+        its promotions and relegations.
+        """
+        return pd.DataFrame(
+            self.partitions(team), columns=["Country", "Tier", "Season"]
+        )
+
+    def close(self) -> None:
+        self.connection.close()
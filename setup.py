@@ -5,4 +5,5 @@ setup(
     version="0.0.1",
     description="Creation of Football Dfs and more",
     packages=find_packages(),
+    package_data={"footballdata": ["assets/*.sqlite"]},
 )
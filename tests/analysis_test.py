@@ -0,0 +1,30 @@
+from pathlib import Path
+
+import pandas as pd
+
+from footballdata.analysis import library
+from footballdata.analysis.library import n_season_standings
+from footballdata.storage import ExcelBackend
+
+COMMITTED_FRAMES = Path(__file__).parents[1] / "footballdata" / "frames"
+
+
+class Test_n_season_standings:
+    def test_committed_frames(self, monkeypatch):
+        monkeypatch.setattr(library, "frames_root", COMMITTED_FRAMES)
+        dfs = n_season_standings("England", 1, "2017-2019")
+
+        assert list(dfs) == ["2017-2018", "2018-2019"]
+        assert list(dfs["2017-2018"].columns[:2]) == ["Rk", "Squad"]
+        assert "Unnamed: 0" not in dfs["2017-2018"].columns
+
+    def test_written_by_write_xlsx(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(library, "frames_root", tmp_path)
+        standings = pd.DataFrame({"Rk": [1, 2], "Squad": ["Arsenal", "Chelsea"]})
+        ExcelBackend(tmp_path).write(
+            "England", 1, "2022-2023", "standings_table", standings
+        )
+        dfs = n_season_standings("England", 1, "2022-2023")
+
+        assert list(dfs["2022-2023"]["Squad"]) == ["Arsenal", "Chelsea"]
+        assert list(dfs["2022-2023"]["Season"]) == ["2022-2023"] * 2
@@ -0,0 +1,229 @@
+"""Benchmarks of the season ingestion and transform pipeline.
+
+Every stage runs against the recorded league page in tests/fixtures (and the
+stored EPL frames for n_season_standings), its wall time is measured by
+pytest-benchmark and its peak memory by tracemalloc.
+
+Peak memory is checked against tests/fixtures/benchmark_budgets.json, a stage
+fails when it allocates MEMORY_TOLERANCE more than its budget. For wall time
+save a baseline and compare the next runs against it:
+
+    python -m pytest tests/benchmark_test.py --benchmark-autosave
+    python -m pytest tests/benchmark_test.py --benchmark-compare \
+        --benchmark-compare-fail=mean:20%
+
+Update the budgets after an intended change with
+    FOOTBALLDATA_UPDATE_BUDGETS=1 python -m pytest tests/benchmark_test.py
+"""
+import json
+import os
+import shutil
+import tracemalloc
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+from footballdata import library
+from footballdata.analysis.library import n_season_standings
+from footballdata.library import (
+    create_xlsx_from_dict,
+    edit_gk_tables,
+    edit_home_away_table,
+    edit_regular_season_table,
+    edit_season_tables,
+    edit_standard_stats_table,
+    get_single_season_league_data,
+    merge_dfs,
+    read_season_tables,
+)
+from footballdata.storage import ParquetBackend
+
+FIXTURES = Path(__file__).parent / "fixtures"
+FIXTURE = FIXTURES / "England-1-2022-2023.html"
+BUDGETS = FIXTURES / "benchmark_budgets.json"
+ANALYSIS_DIR = Path(__file__).parent.parent / "footballdata" / "analysis"
+MEMORY_TOLERANCE = 0.25
+ROUNDS = 5
+
+budgets = json.loads(BUDGETS.read_text()) if BUDGETS.exists() else {}
+measured = {}
+
+
+def peak_memory_kb(func, *args) -> float:
+    tracemalloc.start()
+    try:
+        func(*args)
+        return tracemalloc.get_traced_memory()[1] / 1024
+    finally:
+        tracemalloc.stop()
+
+
+def run_stage(benchmark, stage: str, func, *args, setup=None):
+    """Benchmark func(*args) and check its peak memory against the budget."""
+    if setup is not None:
+        setup()
+    peak = peak_memory_kb(func, *args)
+    benchmark.extra_info["peak_memory_kb"] = round(peak)
+    measured[stage] = round(peak)
+    if setup is None:
+        benchmark.pedantic(func, args=args, rounds=ROUNDS)
+    else:
+
+        def round_setup():
+            setup()
+            return args, {}
+
+        benchmark.pedantic(func, setup=round_setup, rounds=ROUNDS)
+    if os.environ.get("FOOTBALLDATA_UPDATE_BUDGETS"):
+        return
+    budget = budgets.get(stage)
+    assert budget is not None, f"No memory budget for {stage}"
+    assert peak <= budget * (
+        1 + MEMORY_TOLERANCE
+    ), f"{stage} peak memory {peak:.0f}KB is over its {budget}KB budget"
+
+
+@pytest.fixture(scope="module", autouse=True)
+def update_budgets():
+    yield
+    if os.environ.get("FOOTBALLDATA_UPDATE_BUDGETS"):
+        BUDGETS.write_text(json.dumps(dict(sorted(measured.items())), indent=4) + "\n")
+
+
+@pytest.fixture(scope="module")
+def html() -> str:
+    return FIXTURE.read_text(encoding="utf-8")
+
+
+@pytest.fixture(scope="module")
+def season_tables(html) -> dict:
+    return read_season_tables(html)
+
+
+@pytest.fixture(scope="module")
+def season_data(season_tables) -> dict:
+    return edit_season_tables(season_tables)
+
+
+def test_read_season_tables(benchmark, html):
+    run_stage(benchmark, "read_season_tables", read_season_tables, html)
+
+
+def every_table(*args, **kwargs) -> dict:
+    return dict(get_single_season_league_data(*args, **kwargs))
+
+
+def standings(*args) -> pd.DataFrame:
+    return get_single_season_league_data(*args, tables=["standings_table"])[
+        "standings_table"
+    ]
+
+
+def test_get_single_season_league_data(benchmark, html, monkeypatch):
+    monkeypatch.setattr(library, "get_season_html", lambda **kwargs: html)
+    run_stage(
+        benchmark, "get_single_season_league_data", every_table, "England", 1, 2022
+    )
+
+
+def test_get_single_season_standings(benchmark, html, monkeypatch):
+    monkeypatch.setattr(library, "get_season_html", lambda **kwargs: html)
+    run_stage(benchmark, "get_single_season_standings", standings, "England", 1, 2022)
+
+
+def test_edit_regular_season_table(benchmark, season_tables):
+    run_stage(
+        benchmark,
+        "edit_regular_season_table",
+        edit_regular_season_table,
+        season_tables["standings"],
+    )
+
+
+def test_edit_home_away_table(benchmark, season_tables):
+    run_stage(
+        benchmark,
+        "edit_home_away_table",
+        edit_home_away_table,
+        season_tables["home_away"],
+    )
+
+
+def test_edit_standard_stats_table(benchmark, season_tables):
+    run_stage(
+        benchmark,
+        "edit_standard_stats_table",
+        edit_standard_stats_table,
+        season_tables["standard_for"],
+        season_tables["standard_against"],
+    )
+
+
+def test_edit_gk_tables(benchmark, season_tables):
+    run_stage(
+        benchmark,
+        "edit_gk_tables",
+        edit_gk_tables,
+        season_tables["keeper_for"],
+        season_tables["keeper_against"],
+    )
+
+
+def test_merge_dfs(benchmark, season_tables):
+    run_stage(
+        benchmark,
+        "merge_dfs",
+        merge_dfs,
+        season_tables["passing_for"],
+        season_tables["passing_against"],
+    )
+
+
+def test_edit_season_tables(benchmark, season_tables):
+    run_stage(benchmark, "edit_season_tables", edit_season_tables, season_tables)
+
+
+def test_create_xlsx_from_dict(benchmark, season_data, tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+
+    def setup():
+        shutil.rmtree(tmp_path / "frames", ignore_errors=True)
+
+    run_stage(
+        benchmark,
+        "create_xlsx_from_dict",
+        create_xlsx_from_dict,
+        "England",
+        1,
+        "2022-2023",
+        season_data,
+        setup=setup,
+    )
+
+
+def test_n_season_standings_xlsx(benchmark, monkeypatch):
+    monkeypatch.chdir(ANALYSIS_DIR)
+    run_stage(
+        benchmark,
+        "n_season_standings_xlsx",
+        n_season_standings,
+        "England",
+        1,
+        "2017-2023",
+    )
+
+
+def test_n_season_standings_parquet(benchmark, season_data, tmp_path):
+    backend = ParquetBackend(tmp_path)
+    for season in ("2020-2021", "2021-2022", "2022-2023"):
+        backend.write(
+            "England", 1, season, "standings_table", season_data["standings_table"]
+        )
+    run_stage(
+        benchmark,
+        "n_season_standings_parquet",
+        lambda: n_season_standings("England", 1, "2020-2023", backend=backend),
+    )
@@ -0,0 +1,55 @@
+from datetime import datetime
+
+from footballdata.cache import CURRENT_SEASON_TTL, HTMLCache, season_ttl
+
+
+class Test_HTMLCache:
+    def test_store_and_read(self, tmp_path):
+        cache = HTMLCache(tmp_path)
+        cache.store("https://fbref.com/a", "<html>a</html>", etag='"1"')
+        entry = cache.lookup("https://fbref.com/a")
+
+        assert entry.fresh
+        assert entry.revalidation_headers() == {"If-None-Match": '"1"'}
+        assert cache.read(entry) == "<html>a</html>"
+        assert cache.lookup("https://fbref.com/b") is None
+
+    def test_content_addressed(self, tmp_path):
+        cache = HTMLCache(tmp_path)
+        first = cache.store("https://fbref.com/a", "<html>same</html>")
+        second = cache.store("https://fbref.com/b", "<html>same</html>")
+
+        assert first.digest == second.digest
+        assert len(list((tmp_path / "objects").rglob("*.gz"))) == 1
+        cache.delete("https://fbref.com/a")
+        assert cache.read(cache.lookup("https://fbref.com/b")) == "<html>same</html>"
+
+    def test_expiry_and_refresh(self, tmp_path):
+        cache = HTMLCache(tmp_path)
+        cache.store("https://fbref.com/a", "<html>a</html>", ttl=-1)
+        assert not cache.lookup("https://fbref.com/a").fresh
+
+        cache.refresh("https://fbref.com/a", ttl=60)
+        assert cache.lookup("https://fbref.com/a").fresh
+
+    def test_lru_eviction(self, tmp_path):
+        cache = HTMLCache(tmp_path)
+        for page in "abc":
+            cache.store(f"https://fbref.com/{page}", f"<html>{page * 1000}</html>")
+        cache.read(cache.lookup("https://fbref.com/a"))
+        cache.max_bytes = cache.total_bytes() - 1
+        cache.evict()
+
+        assert cache.lookup("https://fbref.com/a") is not None
+        assert cache.lookup("https://fbref.com/b") is None
+        assert cache.lookup("https://fbref.com/c") is not None
+        assert cache.total_bytes() <= cache.max_bytes
+
+
+class Test_season_ttl:
+    def test_closed_season(self):
+        assert season_ttl(2021, now=datetime(2023, 1, 1)) is None
+        assert season_ttl(2021, now=datetime(2022, 7, 1)) is None
+
+    def test_current_season(self):
+        assert season_ttl(2022, now=datetime(2023, 1, 1)) == CURRENT_SEASON_TTL
@@ -0,0 +1,117 @@
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+from footballdata.columns import (
+    TableView,
+    canonical_key,
+    column_key,
+    column_metadata,
+    split_column,
+)
+from footballdata.library import parse_season_data
+
+FIXTURE = Path(__file__).parent / "fixtures" / "England-1-2022-2023.html"
+
+
+def passing_df() -> pd.DataFrame:
+    columns = pd.MultiIndex.from_tuples(
+        [
+            ("Total", "Cmp"),
+            ("Total", "Cmp%"),
+            ("Advanced_Passing", "KP"),
+            ("Total", "Cmp_Opp"),
+            ("Advanced_Passing", "KP_Opp"),
+        ]
+    )
+    return pd.DataFrame(
+        [[100, 80.5, 10, 90, 7], [200, 85.0, 20, 95, 3]],
+        index=["Arsenal", "Chelsea"],
+        columns=columns,
+    )
+
+
+class Test_column_key:
+    @pytest.mark.parametrize(
+        "col, key",
+        [
+            (("Advanced_Passing", "KP_Opp"), "advanced_passing.kp_opp"),
+            (("Total", "Cmp%"), "total.cmp_pct"),
+            (("Details", "#OPA/90"), "details.num_opa_per_90"),
+            (("Expected", "np:G-xG"), "expected.np_g_minus_xg"),
+            (("Expected", "PSxG+/-"), "expected.psxg_plus_minus"),
+            (("Standard", "# Pl"), "standard.num_pl"),
+            ("Pts/MP", "pts_per_mp"),
+            (("Squad", ""), "squad"),
+        ],
+    )
+    def test_keys(self, col, key):
+        assert column_key(col) == key
+
+    def test_canonical_key(self):
+        assert (
+            canonical_key("passing", ("Advanced_Passing", "KP_Opp"))
+            == "passing.advanced_passing.kp_opp"
+        )
+
+    def test_split_column(self):
+        assert split_column(("Total", "Cmp")) == ("Total", "Cmp")
+        assert split_column(("Season", "")) == (None, "Season")
+        assert split_column("Rk") == (None, "Rk")
+
+    def test_unique_for_every_table(self):
+        for table, df in parse_season_data(FIXTURE.read_text()).items():
+            metadata = column_metadata(df.columns, table)
+            assert len(metadata) == len(df.columns)
+
+
+class Test_column_metadata:
+    def test_maps_back(self):
+        metadata = column_metadata(passing_df().columns, "passing")
+
+        assert metadata.loc["total.cmp_pct"].tolist() == ["passing", "Total", "Cmp%"]
+
+    def test_duplicate_keys(self):
+        with pytest.raises(ValueError):
+            column_metadata([("Total", "Cmp%"), ("total", "cmp_pct")])
+
+
+class Test_TableView:
+    def test_flat_columns(self):
+        view = TableView.from_frame(passing_df(), "passing")
+
+        assert view.columns == [
+            "total.cmp",
+            "total.cmp_pct",
+            "advanced_passing.kp",
+            "total.cmp_opp",
+            "advanced_passing.kp_opp",
+        ]
+        assert list(view["total.cmp"]) == [100, 200]
+        assert view.key(("Advanced_Passing", "KP")) == "advanced_passing.kp"
+        assert len(view) == 2
+
+    def test_groups(self):
+        view = TableView.from_frame(passing_df(), "passing")
+
+        assert view.groups == ["Total", "Advanced_Passing"]
+        assert list(view.group("Advanced_Passing").columns) == [
+            "advanced_passing.kp",
+            "advanced_passing.kp_opp",
+        ]
+        with pytest.raises(KeyError):
+            view.group("Shooting")
+
+    def test_to_frame(self):
+        df = passing_df()
+        pd.testing.assert_frame_equal(TableView.from_frame(df).to_frame(), df)
+
+        keyed = df.copy()
+        keyed.insert(0, ("team_id", ""), [1, 2])
+        pd.testing.assert_frame_equal(TableView.from_frame(keyed).to_frame(), keyed)
+
+        standings = pd.DataFrame({"Rk": [1, 2], "Squad": ["Arsenal", "Chelsea"]})
+        pd.testing.assert_frame_equal(
+            TableView.from_frame(standings).to_frame(), standings
+        )
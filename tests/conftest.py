@@ -0,0 +1,23 @@
+import pytest
+
+from footballdata.teams import team_registry
+
+
+@pytest.fixture(scope="session", autouse=True)
+def session_teams_db(tmp_path_factory):
+    """Module fixtures building tables register their teams away from ./frames"""
+    path = team_registry.path
+    team_registry.close()
+    team_registry.path = tmp_path_factory.mktemp("teams") / "teams.sqlite"
+    yield team_registry.path
+    team_registry.close()
+    team_registry.path = path
+
+
+@pytest.fixture(autouse=True)
+def teams_db(tmp_path, monkeypatch):
+    """Every test registers its teams in a registry of its own."""
+    team_registry.close()
+    monkeypatch.setattr(team_registry, "path", tmp_path / "teams.sqlite")
+    yield team_registry.path
+    team_registry.close()
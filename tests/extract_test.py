@@ -0,0 +1,72 @@
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from footballdata.extract import extract_tables
+from footballdata.library import read_season_tables
+from footballdata.settings import SEASON_TABLE_IDS
+
+FIXTURE = Path(__file__).parent / "fixtures" / "England-1-2022-2023.html"
+
+COMMENTED_PAGE = """
+<html><body>
+<table id="visible"><thead><tr><th>Squad</th><th>Pts</th></tr></thead>
+<tbody><tr><th>Arsenal</th><td>84</td></tr></tbody></table>
+<div class="placeholder"></div>
+<!--
+<div class="table_container"><table id="hidden">
+<thead>
+<tr class="over_header"><th colspan="2"></th><th colspan="2">Performance</th></tr>
+<tr><th>Squad</th><th>Min</th><th>Save%</th><th>Notes</th></tr>
+</thead>
+<tbody>
+<tr><th><a href="/en/squads/18bb7c10/Arsenal-Stats">Arsenal</a></th>
+<td>3,420</td><td>75.9</td><td>Champions</td></tr>
+<tr class="thead"><th>Squad</th><th>Min</th><th>Save%</th><th>Notes</th></tr>
+<tr><th>vs Chelsea</th><td>3,420</td><td></td><td></td></tr>
+</tbody></table></div>
+-->
+</body></html>
+"""
+
+
+class Test_extract_tables:
+    def test_same_as_read_html(self):
+        html = FIXTURE.read_text(encoding="utf-8")
+        tables = extract_tables(html, SEASON_TABLE_IDS)
+        expected = pd.read_html(str(FIXTURE), encoding="utf-8")
+        positions = [*range(20), 22, 23]
+
+        assert list(tables) == list(SEASON_TABLE_IDS)
+        for name, position in zip(SEASON_TABLE_IDS, positions):
+            pd.testing.assert_frame_equal(tables[name], expected[position])
+
+    def test_commented_tables(self):
+        tables = extract_tables(COMMENTED_PAGE, {"hidden": "hidden"})
+        hidden = tables["hidden"]
+
+        assert list(hidden.columns) == [
+            ("Unnamed: 0_level_0", "Squad"),
+            ("Unnamed: 1_level_0", "Min"),
+            ("Performance", "Save%"),
+            ("Performance", "Notes"),
+        ]
+        assert list(hidden.iloc[:, 0]) == ["Arsenal", "vs Chelsea"]
+        assert hidden.iloc[:, 1].dtype == np.int64
+        assert hidden.iloc[:, 1].tolist() == [3420, 3420]
+        assert hidden.iloc[:, 2].dtype == np.float64
+        assert np.isnan(hidden.iloc[1, 2])
+        assert hidden.iloc[1, 3] is np.nan
+
+    def test_only_wanted_tables(self):
+        tables = extract_tables(COMMENTED_PAGE, {"a": "visible", "b": "missing"})
+
+        assert list(tables) == ["a"]
+        assert tables["a"]["Pts"].tolist() == [84]
+
+
+def test_read_season_tables_missing():
+    with pytest.raises(KeyError):
+        read_season_tables(COMMENTED_PAGE)
@@ -0,0 +1,236 @@
+import time
+from email.utils import formatdate
+
+import pytest
+import requests
+
+from footballdata import fetch
+from footballdata.cache import HTMLCache
+from footballdata.fetch import (
+    FailedRequests,
+    HostRateLimiter,
+    RequestScheduler,
+    get_html,
+    new_session,
+    parse_retry_after,
+)
+
+
+class FakeResponse:
+    def __init__(self, status_code: int, text: str = "", headers: dict = None):
+        self.status_code = status_code
+        self.text = text
+        self.headers = headers or {}
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise requests.HTTPError(str(self.status_code))
+
+
+class Test_HostRateLimiter:
+    def test_spaces_requests_to_the_same_host(self):
+        limiter = HostRateLimiter(min_interval=0.05)
+        start = time.monotonic()
+        for _ in range(3):
+            limiter.wait("https://fbref.com/en/comps/9/")
+
+        assert time.monotonic() - start >= 0.1
+
+    def test_hosts_are_independent(self):
+        limiter = HostRateLimiter(min_interval=10)
+        start = time.monotonic()
+        limiter.wait("https://fbref.com/en/comps/9/")
+        limiter.wait("https://example.com/")
+
+        assert time.monotonic() - start < 1
+
+    def test_penalize(self):
+        limiter = HostRateLimiter(min_interval=0, default_backoff=0.1)
+        assert limiter.penalize("https://fbref.com/") == 0.1
+        start = time.monotonic()
+        limiter.wait("https://fbref.com/")
+
+        assert time.monotonic() - start >= 0.05
+
+
+class Test_get_html:
+    def test_retries_after_429(self, monkeypatch):
+        responses = [
+            FakeResponse(429, headers={"Retry-After": "0"}),
+            FakeResponse(200, text="<html></html>"),
+        ]
+        monkeypatch.setattr(
+            fetch.http_session, "get", lambda url, **kwargs: responses.pop(0)
+        )
+        scheduler = RequestScheduler(min_interval=0)
+
+        assert get_html("https://fbref.com/", scheduler=scheduler) == "<html></html>"
+        assert not responses
+
+    def test_gives_up(self, monkeypatch):
+        monkeypatch.setattr(
+            fetch.http_session,
+            "get",
+            lambda url, **kwargs: FakeResponse(429, headers={"Retry-After": "0"}),
+        )
+        scheduler = RequestScheduler(min_interval=0)
+        with pytest.raises(requests.HTTPError):
+            get_html("https://fbref.com/", scheduler=scheduler, max_retries=2)
+
+    def test_http_error(self, monkeypatch):
+        monkeypatch.setattr(
+            fetch.http_session, "get", lambda url, **kwargs: FakeResponse(404)
+        )
+        with pytest.raises(requests.HTTPError):
+            get_html("https://fbref.com/", scheduler=RequestScheduler(min_interval=0))
+
+
+def test_parse_retry_after():
+    assert parse_retry_after("120") == 120
+    assert parse_retry_after(None) is None
+    assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0
+    assert 50 < parse_retry_after(formatdate(time.time() + 60, usegmt=True)) <= 60
+    assert parse_retry_after("soon") is None
+
+
+class Test_RequestScheduler:
+    def test_backoff(self):
+        scheduler = RequestScheduler(backoff_base=2, backoff_cap=10)
+
+        assert 1 <= scheduler.backoff(0) <= 2
+        assert 4 <= scheduler.backoff(2) <= 8
+        assert 5 <= scheduler.backoff(10) <= 10
+
+    def test_requests_per_minute(self, monkeypatch):
+        sleeps = []
+        monkeypatch.setattr(fetch.time, "sleep", sleeps.append)
+        scheduler = RequestScheduler(min_interval=0, requests_per_minute=2)
+        for _ in range(3):
+            with scheduler.slot("https://fbref.com/"):
+                pass
+
+        # The third request waits for the first to leave the minute
+        assert len(sleeps) == 1 and 59 < sleeps[0] <= 60
+
+    def test_requests_per_host(self):
+        scheduler = RequestScheduler(min_interval=0, max_per_host=1)
+        with scheduler.slot("https://fbref.com/a"):
+            host_slots = scheduler._host_slots("https://fbref.com/b")
+            assert not host_slots.acquire(blocking=False)
+            assert scheduler._host_slots("https://example.com/").acquire(False)
+
+
+class Test_get_html_retries:
+    def test_server_errors_are_retried(self, monkeypatch):
+        responses = [FakeResponse(503), FakeResponse(200, text="<html></html>")]
+        monkeypatch.setattr(
+            fetch.http_session, "get", lambda url, **kwargs: responses.pop(0)
+        )
+        scheduler = RequestScheduler(min_interval=0, backoff_base=0.001)
+
+        assert get_html("https://fbref.com/", scheduler=scheduler) == "<html></html>"
+
+    def test_connection_errors_are_retried(self, monkeypatch):
+        calls = []
+
+        def get(url, **kwargs):
+            calls.append(url)
+            if len(calls) == 1:
+                raise requests.ConnectionError("reset")
+            return FakeResponse(200, text="<html></html>")
+
+        monkeypatch.setattr(fetch.http_session, "get", get)
+        scheduler = RequestScheduler(min_interval=0, backoff_base=0.001)
+
+        assert get_html("https://fbref.com/", scheduler=scheduler) == "<html></html>"
+
+    def test_failed_urls_are_recorded(self, tmp_path, monkeypatch):
+        failures = FailedRequests(tmp_path / "failed.sqlite")
+        scheduler = RequestScheduler(
+            min_interval=0, backoff_base=0.001, failures=failures
+        )
+        monkeypatch.setattr(
+            fetch.http_session, "get", lambda url, **kwargs: FakeResponse(502)
+        )
+        with pytest.raises(requests.HTTPError):
+            get_html("https://fbref.com/a", scheduler=scheduler, max_retries=1)
+        with pytest.raises(requests.HTTPError):
+            get_html("https://fbref.com/b", scheduler=scheduler, max_retries=0)
+        assert FailedRequests(tmp_path / "failed.sqlite").urls() == [
+            "https://fbref.com/a",
+            "https://fbref.com/b",
+        ]
+
+        monkeypatch.setattr(
+            fetch.http_session, "get", lambda url, **kwargs: FakeResponse(200)
+        )
+        get_html("https://fbref.com/a", scheduler=scheduler)
+        assert scheduler.failed_urls() == ["https://fbref.com/b"]
+
+
+class Test_get_html_cache:
+    def test_fresh_page_needs_no_request(self, tmp_path, monkeypatch):
+        cache = HTMLCache(tmp_path)
+        cache.store("https://fbref.com/", "<html>cached</html>")
+        monkeypatch.setattr(fetch.http_session, "get", None)
+
+        assert get_html("https://fbref.com/", cache=cache) == "<html>cached</html>"
+
+    def test_revalidation(self, tmp_path, monkeypatch):
+        cache = HTMLCache(tmp_path)
+        cache.store("https://fbref.com/", "<html>cached</html>", etag='"v1"', ttl=-1)
+        sent_headers = []
+
+        def get(url, headers, timeout):
+            sent_headers.append(headers)
+            return FakeResponse(304)
+
+        monkeypatch.setattr(fetch.http_session, "get", get)
+        scheduler = RequestScheduler(min_interval=0)
+        html = get_html("https://fbref.com/", scheduler=scheduler, cache=cache, ttl=60)
+
+        assert html == "<html>cached</html>"
+        assert sent_headers == [{"If-None-Match": '"v1"'}]
+        assert cache.lookup("https://fbref.com/").fresh
+
+    def test_stores_fetched_page(self, tmp_path, monkeypatch):
+        cache = HTMLCache(tmp_path)
+        monkeypatch.setattr(
+            fetch.http_session,
+            "get",
+            lambda url, **kwargs: FakeResponse(
+                200, text="<html>new</html>", headers={"ETag": '"v2"'}
+            ),
+        )
+        get_html(
+            "https://fbref.com/",
+            scheduler=RequestScheduler(min_interval=0),
+            cache=cache,
+        )
+        entry = cache.lookup("https://fbref.com/")
+
+        assert entry.etag == '"v2"'
+        assert entry.expires_at is None
+
+
+class Test_new_session:
+    def test_pooled(self):
+        session = new_session(pool_size=4)
+        adapter = session.get_adapter("https://fbref.com/")
+
+        assert adapter._pool_maxsize == 4
+        assert adapter is session.get_adapter("https://example.com/")
+        assert session.headers["Accept-Encoding"].startswith("gzip, deflate")
+
+    def test_get_html_uses_the_session(self):
+        class Session:
+            def get(self, url, **kwargs):
+                return FakeResponse(200, text="<html>pooled</html>")
+
+        html = get_html(
+            "https://fbref.com/",
+            scheduler=RequestScheduler(min_interval=0),
+            session=Session(),
+        )
+
+        assert html == "<html>pooled</html>"
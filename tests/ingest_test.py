@@ -0,0 +1,131 @@
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+from footballdata import ingest
+from footballdata.ingest import (
+    Job,
+    Progress,
+    ingest_all,
+    ingest_seasons,
+    league_pairs,
+    save_ipc_tables,
+    season_jobs,
+)
+from footballdata.library import parse_season_data, parse_season_to_ipc
+from footballdata.storage import ParquetBackend
+
+FIXTURE = Path(__file__).parent / "fixtures" / "England-1-2022-2023.html"
+
+
+class Test_ingest_seasons:
+    def test_stores_every_table(self, tmp_path, monkeypatch):
+        html = FIXTURE.read_text(encoding="utf-8")
+        monkeypatch.setattr(ingest, "get_season_html", lambda *args: html)
+        backend = ParquetBackend(tmp_path)
+
+        failed = ingest_seasons("England", 1, [2021, 2022], backend=backend)
+
+        assert failed == []
+        for season in ("2021-2022", "2022-2023"):
+            standings = backend.read("England", 1, season, "standings_table")
+            assert len(standings) == 20
+            assert backend.exists("England", 1, season, "passing")
+
+    def test_failed_fetch(self, tmp_path, monkeypatch):
+        html = FIXTURE.read_text(encoding="utf-8")
+
+        def get_season_html(country, tier, year, scheduler):
+            if year == 2021:
+                raise ConnectionError("no network")
+            return html
+
+        monkeypatch.setattr(ingest, "get_season_html", get_season_html)
+        backend = ParquetBackend(tmp_path)
+
+        assert ingest_seasons("England", 1, [2021, 2022], backend=backend) == [2021]
+        assert backend.exists("England", 1, "2022-2023", "other")
+        assert not backend.exists("England", 1, "2021-2022", "other")
+
+
+class Test_ipc_hand_off:
+    def test_same_tables(self, tmp_path):
+        html = FIXTURE.read_text(encoding="utf-8")
+        tables = ["standings_table", "home", "passing"]
+        paths = parse_season_to_ipc(html, tmp_path / "ipc", tables)
+        backend = ParquetBackend(tmp_path / "frames")
+
+        written = save_ipc_tables("England", 1, "2022-2023", paths, backend)
+
+        # home is derived from the stored home_away table
+        assert written == ["standings_table", "home_away", "passing"]
+        for table, df in parse_season_data(html, tables).items():
+            stored = backend.read("England", 1, "2022-2023", table)
+            pd.testing.assert_frame_equal(stored, df)
+        # The IPC files are removed once stored
+        assert not list((tmp_path / "ipc").iterdir())
+
+
+class Test_ingest_all:
+    def test_league_matrix(self, tmp_path, monkeypatch):
+        html = FIXTURE.read_text(encoding="utf-8")
+        fetched = []
+
+        def get_season_html(country, tier, year, scheduler):
+            fetched.append((country, tier, year))
+            return html
+
+        monkeypatch.setattr(ingest, "get_season_html", get_season_html)
+        backend = ParquetBackend(tmp_path)
+        leagues = [("England", 1), ("Germany", 2)]
+
+        assert ingest_all("2020-2022", leagues, backend=backend) == []
+        assert sorted(fetched) == [
+            ("England", 1, 2020),
+            ("England", 1, 2021),
+            ("Germany", 2, 2020),
+            ("Germany", 2, 2021),
+        ]
+        assert backend.exists("Germany", 2, "2021-2022", "gca")
+
+        # Stored (closed) seasons aren't fetched again
+        assert season_jobs("2020-2023", leagues, backend=backend) == [
+            Job("England", 1, 2022),
+            Job("Germany", 2, 2022),
+        ]
+
+
+def test_failed_seasons_first(tmp_path):
+    backend = ParquetBackend(tmp_path)
+    failed = Job("Italy", 1, 2021).url
+    jobs = season_jobs("2020-2022", ["Italy"], backend, failed_urls=[failed])
+
+    assert jobs[0] == Job("Italy", 1, 2021)
+    assert len(jobs) == 4
+
+
+def test_league_pairs():
+    assert league_pairs(["Italy", ("England", 2)]) == [
+        ("Italy", 1),
+        ("Italy", 2),
+        ("England", 2),
+    ]
+    with pytest.raises(KeyError):
+        league_pairs([("England", 9)])
+
+
+def test_progress():
+    progress = Progress(4)
+    progress.update("stored")
+    progress.update("failed")
+
+    assert progress.finished == 2
+    assert str(progress).startswith("2/4 seasons (1 stored, 0 unchanged, 1 failed)")
+    assert str(progress).endswith("s left")
+
+
+def test_progress_nothing_finished():
+    assert str(Progress(0)) == (
+        "0/0 seasons (0 stored, 0 unchanged, 0 failed), 0.0 seasons/min"
+    )
@@ -0,0 +1,27 @@
+import pytest
+
+from footballdata.leagues import League, LeagueRegistry, league_registry
+from footballdata.settings import leagues
+
+
+class Test_LeagueRegistry:
+    def test_lookups(self):
+        epl = League("England", 1, 9, "Premier League", "EPL", "M")
+
+        assert league_registry.get("England", 1) == epl
+        assert league_registry.by_id(9) is league_registry.get("England", 1)
+        assert league_registry.by_name("premier league") == epl
+        assert league_registry.by_name("EPL") == epl
+        assert [league.tier for league in league_registry.country("Italy")] == [1, 2]
+
+    def test_every_league(self):
+        assert len(league_registry) == sum(len(tiers) for tiers in leagues.values())
+        assert ("Germany", 3) in league_registry
+
+    def test_unknown(self):
+        registry = LeagueRegistry({"Wales": {1: {"id": 1, "name": "Cymru Premier"}}})
+        with pytest.raises(KeyError):
+            registry.get("Wales", 2)
+        with pytest.raises(KeyError):
+            registry.country("England")
+        assert registry.get("Wales", 1).abbrv is None
@@ -1,7 +1,51 @@
-﻿import numpy as np
+﻿from pathlib import Path
+
+import numpy as np
+import pandas as pd
 import pytest
 
-from footballdata.library import get_season_years, year_at_season_start_list
+from footballdata import library
+from footballdata.library import (
+    SEASON_TABLES,
+    TABLES,
+    SeasonTables,
+    column_plan,
+    create_xlsx_from_dict,
+    edit_home_away_table,
+    edit_season_tables,
+    edit_standard_stats_table,
+    get_season_years,
+    load_season_tables,
+    merge_dfs,
+    parse_season_data,
+    read_season_tables,
+    save_season_tables,
+    source_table_ids,
+    standard_stats_groups,
+    table_specs,
+    tables_exist,
+    year_at_season_start_list,
+)
+from footballdata.storage import ExcelBackend, ParquetBackend
+from footballdata.teams import team_registry
+
+FIXTURE = Path(__file__).parent / "fixtures" / "England-1-2022-2023.html"
+
+
+def raw_squad_table(squads: list) -> pd.DataFrame:
+    """A squad table as it comes out of fbref"""
+    columns = pd.MultiIndex.from_tuples(
+        [
+            ("Unnamed: 0_level_0", "Squad"),
+            ("Unnamed: 1_level_0", "# Pl"),
+            ("Tackles", "Tkl"),
+            ("Tackles", "Def 3rd"),
+            ("Blocks", "Blocks"),
+            ("Unnamed: 5_level_0", "Int"),
+        ]
+    )
+    data = [[squad, 25, 10 + i, 5 + i, 3 + i, 7 + i] for i, squad in enumerate(squads)]
+    return pd.DataFrame(data, columns=columns)
 
 
 class Test_get_season_years:
@@ -61,3 +105,284 @@ class Test_year_at_season_start_list:
         year_range = "2010/2015"
         with pytest.raises(KeyError):
             year_at_season_start_list(year_range=year_range)
+
+
+class Test_merge_dfs:
+    def test_normal_case(self):
+        df = raw_squad_table(["Arsenal", "Wolves"])
+        df_opp = raw_squad_table(["vs Wolves", "vs Arsenal"])
+        result = merge_dfs(df, df_opp)
+
+        assert list(result.columns) == [
+            ("Tackles", "Tkl"),
+            ("Tackles", "Def_3rd"),
+            ("Blocks", "Blocks"),
+            ("Details", "Int"),
+            ("Tackles", "Tkl_Opp"),
+            ("Tackles", "Def_3rd_Opp"),
+            ("Blocks_Opp", "Blocks_Opp"),
+            ("Details", "Int_Opp"),
+        ]
+        assert list(result.index) == ["Arsenal", "Wolves"]
+        assert result.loc["Wolves", ("Tackles", "Tkl_Opp")] == 10
+        assert result.loc["Arsenal", ("Tackles", "Tkl_Opp")] == 11
+
+    def test_inputs_unchanged(self):
+        df = raw_squad_table(["Arsenal"])
+        df_opp = raw_squad_table(["vs Arsenal"])
+        merge_dfs(df, df_opp)
+
+        assert df_opp.iloc[0, 0] == "vs Arsenal"
+        assert ("Tackles", "Def 3rd") in df_opp.columns
+
+    def test_no_squad(self):
+        df = raw_squad_table(["Arsenal"]).drop(columns="Squad", level=1)
+        with pytest.raises(KeyError):
+            merge_dfs(df, df)
+
+
+class Test_edit_standard_stats_table:
+    def test_groups(self):
+        raw = read_season_tables(FIXTURE.read_text(), ["standard_data"])
+        result = edit_standard_stats_table(raw["standard_for"], raw["standard_against"])
+
+        assert list(result.columns.get_level_values(0).unique()) == [
+            "Standard",
+            "Performance",
+            "Per_90_Minutes",
+            "Expected",
+        ]
+        assert list(result["Standard"].columns) == [
+            "# Pl",
+            "Age",
+            "Poss",
+            "Age_Opp",
+            "Poss_Opp",
+        ]
+        assert ("Performance", "Gls_Opp") in result.columns
+        assert not any(stat.endswith("_Opp_Opp") for _, stat in result.columns)
+        assert len(result) == 20
+        assert raw["standard_against"].iloc[0, 0].startswith("vs ")
+
+    def test_keeps_other_groups(self):
+        raw = read_season_tables(FIXTURE.read_text(), ["standard_data"])
+        squad_stats = raw["standard_for"].copy()
+        squad_opp_stats = raw["standard_against"].copy()
+        squad_stats["Progression", "PrgC"] = 1
+        squad_opp_stats["Progression", "PrgC"] = 2
+        result = edit_standard_stats_table(squad_stats, squad_opp_stats)
+
+        assert "Playing_Time" not in result.columns.get_level_values(0)
+        assert list(result["Progression"].columns) == ["PrgC", "PrgC_Opp"]
+        assert "Progression" in standard_stats_groups(result)
+
+    def test_groups_are_views(self):
+        data = parse_season_data(FIXTURE.read_text(), ["standard_data"])
+        standard_data = data["standard_data"]
+        groups = standard_stats_groups(standard_data)
+
+        assert sum(group.shape[1] for group in groups.values()) == len(
+            standard_data.columns.drop(("team_id", ""))
+        )
+        performance = groups["Performance"]
+        for column in performance.columns:
+            assert np.shares_memory(
+                performance[column].to_numpy(), standard_data[column].to_numpy()
+            )
+
+
+class Test_column_plan:
+    def test_cached_per_header(self):
+        columns = tuple(raw_squad_table(["Arsenal"]).columns)
+
+        assert column_plan(columns) is column_plan(columns)
+        assert column_plan(columns, opp=True) is not column_plan(columns)
+
+
+class Test_table_registry:
+    def test_only_requested_tables(self, monkeypatch):
+        built = []
+        spec = TABLES["passing"]
+        monkeypatch.setitem(
+            TABLES,
+            "passing",
+            spec._replace(
+                transform=lambda *dfs: built.append("passing") or spec.transform(*dfs)
+            ),
+        )
+        html = FIXTURE.read_text()
+        season_tables = read_season_tables(html, ["passing", "standings_table"])
+        result = edit_season_tables(season_tables, ["passing", "standings_table"])
+
+        assert set(season_tables) == {"passing_for", "passing_against", "standings"}
+        assert list(result) == ["passing", "standings_table"]
+        assert built == ["passing"]
+
+    def test_unknown_table(self):
+        with pytest.raises(KeyError):
+            source_table_ids(["passing", "xg_chain"])
+
+    def test_load_season_tables(self, tmp_path):
+        backend = ParquetBackend(tmp_path)
+        data = parse_season_data(FIXTURE.read_text(), ["gca", "home"])
+        save_season_tables("England", 1, "2022-2023", data, backend=backend)
+        result = load_season_tables(
+            "England", 1, "2022-2023", ["home", "gca"], backend=backend
+        )
+
+        assert list(result) == ["home", "gca"]
+        pd.testing.assert_frame_equal(result["gca"], data["gca"])
+        assert list(data) == ["gca", "home_away"]
+        assert not backend.exists("England", 1, "2022-2023", "home")
+        assert len(result["home"]) == 20
+
+    def test_load_season_tables_xlsx(self, tmp_path):
+        backend = ExcelBackend(tmp_path)
+        data = parse_season_data(FIXTURE.read_text(), ["passing"])
+        save_season_tables("England", 1, "2022-2023", data, backend=backend)
+        passing = load_season_tables(
+            "England", 1, "2022-2023", ["passing"], backend=backend
+        )["passing"]
+
+        assert len(passing) == 20
+        assert list(passing.columns) == list(data["passing"].columns)
+        assert passing.loc["Arsenal", ("Total", "Cmp")] == (
+            data["passing"].loc["Arsenal", ("Total", "Cmp")]
+        )
+
+    def test_legacy_home_away(self):
+        """The committed frames have home.xlsx ... h_div_a.xlsx, no home_away"""
+        frames = Path(__file__).parents[1] / "footballdata" / "frames"
+        backend = ExcelBackend(frames)
+        legacy = {
+            table: pd.read_excel(Path(frames, "England", "1", "2017-2018", table))
+            for table in ("home.xlsx", "h-a.xlsx")
+        }
+        result = load_season_tables(
+            "England", 1, "2017-2018", ["home", "h-a"], backend=backend
+        )
+
+        for table, df in zip(["home", "h-a"], legacy.values()):
+            np.testing.assert_allclose(
+                result[table].to_numpy(dtype=float),
+                df.drop(columns=["Rk", "Squads"]).to_numpy(dtype=float),
+                rtol=1e-5,
+            )
+        assert list(result["home"].index.names) == ["Rk", "Squads"]
+        assert len(load_season_tables("England", 1, "2017-2018", backend=backend)) == (
+            len(library.TABLES)
+        )
+        assert library.season_is_stored("England", 1, "2017-2018", backend)
+
+
+class Test_SeasonTables:
+    def test_built_on_access(self):
+        season_tables = read_season_tables(FIXTURE.read_text())
+        result = SeasonTables(season_tables)
+
+        assert list(result) == list(TABLES)
+        assert result.built() == []
+        standings = result["standings_table"]
+        assert result["standings_table"] is standings
+        assert result.built() == ["standings_table"]
+
+    def test_tables(self):
+        season_tables = read_season_tables(FIXTURE.read_text(), ["gca"])
+        result = SeasonTables(season_tables, ["gca"])
+
+        assert len(result) == 1
+        with pytest.raises(KeyError):
+            result["passing"]
+
+
+def raw_home_away_table(n_squads: int) -> pd.DataFrame:
+    """A home away table as it comes out of fbref"""
+    stats = ["MP", "W", "Pts", "xG"]
+    columns = pd.MultiIndex.from_tuples(
+        [("Unnamed: 0_level_0", "Rk"), ("Unnamed: 1_level_0", "Squad")]
+        + [(venue, stat) for venue in ("Home", "Away") for stat in stats]
+    )
+    data = [
+        [i + 1, f"Squad {i}", 17, 10, 30 - i, 1.5, 17, 5, 15 - i, 1.0]
+        for i in range(n_squads)
+    ]
+    return pd.DataFrame(data, columns=columns)
+
+
+class Test_home_away:
+    @pytest.mark.parametrize("n_squads", [18, 24])
+    def test_long_form(self, n_squads):
+        result = edit_home_away_table(raw_home_away_table(n_squads))
+
+        assert list(result.columns) == ["Rk", "Squad", "Venue", "MP", "W", "Pts", "xG"]
+        assert len(result) == 2 * n_squads
+        assert list(result["Venue"].unique()) == ["Home", "Away"]
+        assert list(result["Rk"][-2:]) == [n_squads - 1, n_squads]
+
+    def test_derived_tables(self):
+        season_tables = {"home_away": raw_home_away_table(18)}
+        result = SeasonTables(season_tables, ["h-a", "h_div_a"])
+
+        assert list(result) == ["home_away"]
+        h_a = result["h-a"]
+        assert list(h_a.index[0]) == [1, "Squad 0"]
+        assert list(h_a["Pts"]) == [15] * 18
+        assert list(result["h_div_a"]["W"]) == [2.0] * 18
+        assert list(h_a["team_id"]) == list(range(1, 19))
+        assert result["h-a"] is h_a
+        assert result.built() == ["home_away", "h-a", "h_div_a"]
+
+    def test_unknown_table(self):
+        with pytest.raises(KeyError):
+            table_specs(["home", "h+a"])
+        assert [spec.name for spec in table_specs(["home", "away"])] == ["home_away"]
+
+
+class Test_team_ids:
+    def test_every_table(self):
+        html = FIXTURE.read_text()
+        data = parse_season_data(html, SEASON_TABLES)
+        arsenal = team_registry.id("Arsenal")
+
+        assert team_registry.get(arsenal).fbref_id == "18bb7c10"
+        for table, df in data.items():
+            team_ids = df["team_id"]
+            assert team_ids.dtype == "int32", table
+            assert team_ids.nunique() == 20, table
+        standard_data = data["standard_data"]
+        assert standard_data.loc["Arsenal", ("team_id", "")] == arsenal
+        assert list(data["home_away"].columns[:4]) == [
+            "Rk",
+            "Squad",
+            "team_id",
+            "Venue",
+        ]
+
+    def test_stable_across_seasons(self):
+        html = FIXTURE.read_text()
+        first = parse_season_data(html, ["standings_table"])["standings_table"]
+        again = parse_season_data(html, ["standings_table"])["standings_table"]
+
+        assert list(first["team_id"]) == list(again["team_id"])
+        assert len(team_registry) == 20
+
+
+class Test_create_xlsx_from_dict:
+    def test_workbook(self, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        data = parse_season_data(FIXTURE.read_text(), ["standings_table", "gca"])
+        create_xlsx_from_dict("England", 1, "2022-2023", data, workbook=True)
+        directory = tmp_path / "frames" / "England" / "1" / "2022-2023"
+
+        assert [path.name for path in directory.iterdir()] == ["season.xlsx"]
+        sheets = pd.read_excel(directory / "season.xlsx", sheet_name=None)
+        assert list(sheets) == ["standings_table", "gca"]
+        assert len(sheets["standings_table"]) == 20
+
+    def test_frames_dir(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(library, "FRAMES_DIR", tmp_path / "store")
+        data = parse_season_data(FIXTURE.read_text(), ["standings_table"])
+        create_xlsx_from_dict("England", 1, "2022-2023", data)
+
+        assert (tmp_path / "store/England/1/2022-2023/standings_table.xlsx").exists()
+        assert tables_exist("England", 1, "2022-2023", tables=["standings_table"])
@@ -0,0 +1,182 @@
+from pathlib import Path
+
+import pandas as pd
+
+from footballdata import library
+from footballdata.library import (
+    TABLES,
+    create_multiple_season_dfs,
+    create_xlsx_from_dict,
+    frames_registry,
+    parse_season_data,
+    save_season_tables,
+    season_is_stored,
+    season_manifest_path,
+    source_changed,
+)
+from footballdata.manifest import (
+    load_manifest,
+    save_manifest,
+    source_hash,
+    table_checksum,
+)
+from footballdata.storage import ParquetBackend
+from footballdata.teams import TeamIndex, TeamRegistry
+
+FIXTURE = Path(__file__).parent / "fixtures" / "England-1-2022-2023.html"
+
+
+class Test_table_checksum:
+    def test_same_df(self):
+        df = pd.DataFrame({"Pts": [80, 75]}, index=["Arsenal", "Chelsea"])
+
+        assert table_checksum(df) == table_checksum(df.copy())
+
+    def test_changed_value(self):
+        df = pd.DataFrame({"Pts": [80, 75]}, index=["Arsenal", "Chelsea"])
+        changed = df.copy()
+        changed.loc["Chelsea", "Pts"] = 76
+
+        assert table_checksum(df) != table_checksum(changed)
+
+    def test_changed_dtype(self):
+        df = pd.DataFrame({"Pts": [80, 75]})
+
+        assert table_checksum(df) != table_checksum(df.astype("float64"))
+
+
+class Test_save_season_tables:
+    def test_writes_only_changed_tables(self, tmp_path):
+        html = FIXTURE.read_text(encoding="utf-8")
+        data = parse_season_data(html)
+        backend = ParquetBackend(tmp_path)
+
+        written = save_season_tables(
+            "England", 1, "2022-2023", data, backend, page_hash=source_hash(html)
+        )
+        assert written == list(TABLES)
+
+        data["standings_table"].loc[:, "Pts"] += 1
+        written = save_season_tables("England", 1, "2022-2023", data, backend)
+        assert written == ["standings_table"]
+        standings = backend.read("England", 1, "2022-2023", "standings_table")
+        pd.testing.assert_series_equal(standings["Pts"], data["standings_table"]["Pts"])
+
+        manifest = load_manifest(
+            season_manifest_path("England", 1, "2022-2023", backend)
+        )
+        assert manifest.source_hash == source_hash(html)
+        assert manifest.closed
+        assert set(manifest.tables) == set(TABLES)
+
+    def test_indexes_teams(self, tmp_path):
+        backend = ParquetBackend(tmp_path / "frames")
+        data = parse_season_data(
+            FIXTURE.read_text(encoding="utf-8"), registry=frames_registry(backend)
+        )
+        save_season_tables("England", 1, "2022-2023", data, backend)
+        relegated = data["standings_table"].tail(3)
+        save_season_tables(
+            "England", 2, "2023-2024", {"standings_table": relegated}, backend
+        )
+
+        index = TeamIndex(backend.root)
+        assert index.partitions("Arsenal") == [("England", 1, "2022-2023")]
+        assert list(index.history("Southampton")["Tier"]) == [1, 2]
+        assert len(index.teams("England", 1, "2022-2023")) == 20
+        index.close()
+
+
+class Test_season_is_stored:
+    def test_workbook(self, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        html = FIXTURE.read_text(encoding="utf-8")
+        tables = ["standings_table"]
+        assert not season_is_stored("England", 1, "2022-2023", tables=tables)
+
+        data_dict = parse_season_data(html, tables)
+        create_xlsx_from_dict("England", 1, "2022-2023", data_dict, workbook=True)
+        assert season_is_stored("England", 1, "2022-2023", tables=tables)
+        assert not season_is_stored("England", 1, "2022-2023")
+
+    def test_older_table_version(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(library, "season_is_closed", lambda season: True)
+        backend = ParquetBackend(tmp_path)
+        html = FIXTURE.read_text(encoding="utf-8")
+        tables = ["standard_data"]
+        data_dict = parse_season_data(html, tables)
+        save_season_tables(
+            "England", 1, "2022-2023", data_dict, backend, source_hash(html)
+        )
+        assert season_is_stored("England", 1, "2022-2023", backend, tables)
+        assert not source_changed("England", 1, "2022-2023", html, backend, tables)
+
+        # A manifest written before standard_data's *_Opp_Opp columns were fixed
+        path = season_manifest_path("England", 1, "2022-2023", backend)
+        manifest = load_manifest(path)
+        manifest.versions = {}
+        save_manifest(path, manifest)
+        assert not season_is_stored("England", 1, "2022-2023", backend, tables)
+        assert source_changed("England", 1, "2022-2023", html, backend, tables)
+
+        save_season_tables(
+            "England", 1, "2022-2023", data_dict, backend, source_hash(html)
+        )
+        assert load_manifest(path).versions == {"standard_data": 2}
+        assert season_is_stored("England", 1, "2022-2023", backend, tables)
+
+
+class Test_create_multiple_season_dfs:
+    def test_incremental(self, tmp_path, monkeypatch):
+        html = FIXTURE.read_text(encoding="utf-8")
+        fetched = []
+        parsed = []
+
+        def get_season_html(country, tier, year):
+            fetched.append(year)
+            return html
+
+        def parse(page, tables=None, registry=None):
+            parsed.append(page)
+            return parse_season_data(page, tables, registry)
+
+        monkeypatch.setattr(library, "get_season_html", get_season_html)
+        monkeypatch.setattr(library, "parse_season_data", parse)
+        monkeypatch.setattr(library, "season_is_closed", lambda season: False)
+        backend = ParquetBackend(tmp_path)
+
+        create_multiple_season_dfs("England", 1, "2022-2023", backend=backend)
+        assert (fetched, len(parsed)) == ([2022], 1)
+        # The teams are registered next to the frames
+        assert TeamRegistry(tmp_path / "teams.sqlite").id("Arsenal") is not None
+        assert not season_is_stored("England", 1, "2022-2023", backend)
+
+        # The season in progress is fetched again but its page hasn't changed
+        create_multiple_season_dfs("England", 1, "2022-2023", backend=backend)
+        assert (fetched, len(parsed)) == ([2022, 2022], 1)
+
+        # Once the season closes it's never fetched again
+        monkeypatch.setattr(library, "season_is_closed", lambda season: True)
+        create_multiple_season_dfs("England", 1, "2022-2023", backend=backend)
+        assert season_is_stored("England", 1, "2022-2023", backend)
+        create_multiple_season_dfs("England", 1, "2022-2023", backend=backend)
+        assert (fetched, len(parsed)) == ([2022, 2022, 2022], 1)
+
+    def test_tables(self, tmp_path, monkeypatch):
+        html = FIXTURE.read_text(encoding="utf-8")
+        monkeypatch.setattr(library, "get_season_html", lambda **kwargs: html)
+        backend = ParquetBackend(tmp_path)
+
+        create_multiple_season_dfs(
+            "England", 1, "2022-2023", backend=backend, tables=["standings_table"]
+        )
+        assert backend.exists("England", 1, "2022-2023", "standings_table")
+        assert not backend.exists("England", 1, "2022-2023", "passing")
+        assert season_is_stored(
+            "England", 1, "2022-2023", backend, tables=["standings_table"]
+        )
+        assert not season_is_stored("England", 1, "2022-2023", backend)
+
+        # The same page, the tables that weren't asked for before are added
+        create_multiple_season_dfs("England", 1, "2022-2023", backend=backend)
+        assert season_is_stored("England", 1, "2022-2023", backend)
@@ -0,0 +1,92 @@
+import pytest
+
+from footballdata.players import SHIPPED_PLAYERS_DB, PlayerRegistry, player_registry
+
+PLAYERS = {
+    "Tony-Adams": {
+        "id": "26b5e727",
+        "nationality": ["eng"],
+        "position": ["DF"],
+        "birth_year": 1966,
+    },
+    "Ade-Akinbiyi": {
+        "id": "6a723914",
+        "nationality": ["ng"],
+        "position": ["FW", "MF"],
+        "birth_year": 1974,
+    },
+    "Nobody-Known": {"id": "00000000"},
+}
+
+
+@pytest.fixture
+def registry(tmp_path):
+    registry = PlayerRegistry(tmp_path / "players.sqlite")
+    registry.update(PLAYERS)
+    yield registry
+    registry.close()
+
+
+class Test_PlayerRegistry:
+    def test_get(self, registry):
+        assert registry.get("Ade-Akinbiyi") == PLAYERS["Ade-Akinbiyi"]
+        assert registry.get("Nobody-Known") == {"id": "00000000"}
+        assert registry.get("Missing") is None
+        with pytest.raises(KeyError):
+            registry["Missing"]
+
+    def test_lookups(self, registry):
+        assert list(registry.by_id("26b5e727")) == ["Tony-Adams"]
+        assert list(registry.by_nationality("ng")) == ["Ade-Akinbiyi"]
+        assert list(registry.by_position("MF")) == ["Ade-Akinbiyi"]
+        assert list(registry.by_birth_year(1966)) == ["Tony-Adams"]
+
+    def test_add_replaces(self, registry):
+        registry.add("Tony-Adams", {"id": "26b5e727", "position": ["MF"]})
+
+        assert registry["Tony-Adams"] == {"id": "26b5e727", "position": ["MF"]}
+        assert list(registry.by_position("DF")) == []
+        assert len(registry) == 3
+
+    def test_to_dict(self, registry):
+        assert registry.to_dict() == PLAYERS
+        assert "Tony-Adams" in registry
+        assert sorted(registry) == sorted(PLAYERS)
+
+
+class Test_seed:
+    def test_copied_on_first_write(self, tmp_path):
+        seed = tmp_path / "shipped.sqlite"
+        shipped = PlayerRegistry(seed)
+        shipped.update(PLAYERS)
+        shipped.close()
+        seed_bytes = seed.read_bytes()
+        registry = PlayerRegistry(tmp_path / "crawled" / "players.sqlite", seed=seed)
+
+        assert registry["Tony-Adams"]["birth_year"] == 1966
+        assert not registry.path.exists()
+        registry.add("Bukayo-Saka", {"id": "bc7dc64d"})
+
+        assert registry.path.exists()
+        assert len(registry) == 4
+        assert seed.read_bytes() == seed_bytes
+        registry.close()
+
+
+def test_shipped_registry():
+    assert player_registry.seed == SHIPPED_PLAYERS_DB
+    assert SHIPPED_PLAYERS_DB not in (
+        player_registry.path,
+        player_registry.path.resolve(),
+    )
+
+    assert player_registry["Tony-Adams"]["birth_year"] == 1966
+    assert len(player_registry) > 6000
+
+
+def test_settings_players_is_lazy():
+    from footballdata import settings
+
+    assert "players" not in vars(settings)
+    assert settings.players["Tony-Adams"]["id"] == "26b5e727"
+    assert settings.players is settings.players
@@ -0,0 +1,111 @@
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+import requests
+
+from footballdata import library
+from footballdata.fetch import RequestScheduler, TooManyRequests, get_html, new_session
+from footballdata.library import get_season_html, read_season_tables, season_url
+from footballdata.replay import Archive, StandInServer, record
+
+FIXTURE = Path(__file__).parent / "fixtures" / "England-1-2022-2023.html"
+SEASON_PATH = "/en/comps/9/2022-2023/"
+
+
+@pytest.fixture
+def archive(tmp_path) -> Archive:
+    archive = Archive(tmp_path / "archive")
+    archive.store(
+        "https://fbref.com" + SEASON_PATH, FIXTURE.read_text(encoding="utf-8")
+    )
+    return archive
+
+
+def scheduler() -> RequestScheduler:
+    return RequestScheduler(min_interval=0, requests_per_minute=None)
+
+
+class Test_Archive:
+    def test_keyed_by_path(self, archive):
+        assert "http://127.0.0.1:8000" + SEASON_PATH in archive
+        assert archive.read(SEASON_PATH) == FIXTURE.read_text(encoding="utf-8")
+        assert len(archive) == 1
+
+    def test_outside_the_archive(self, archive):
+        with pytest.raises(KeyError):
+            archive.path("/en/../../secret/")
+
+    def test_record(self, archive, monkeypatch):
+        fetched = []
+
+        def get_html(url, **kwargs):
+            fetched.append(url)
+            return "<html></html>"
+
+        monkeypatch.setattr("footballdata.replay.get_html", get_html)
+        urls = ["https://fbref.com" + SEASON_PATH, "https://fbref.com/en/comps/9/"]
+
+        assert record(urls, archive) == []
+        assert fetched == ["https://fbref.com/en/comps/9/"]
+        assert archive.read("/en/comps/9/") == "<html></html>"
+
+
+class Test_StandInServer:
+    def test_serves_the_archive(self, archive, monkeypatch):
+        with StandInServer(archive) as server:
+            monkeypatch.setattr(library, "LEAGUE_URL", server.url + "/en/comps/{}/{}/")
+            assert season_url("England", 1, 2022) == server.url + SEASON_PATH
+            html = get_season_html(
+                "England", 1, 2022, scheduler=scheduler(), cache=None
+            )
+
+        assert len(read_season_tables(html)["standings"]) == 20
+        assert server.counts == {200: 1}
+
+    def test_gzip(self, archive):
+        with StandInServer(archive) as server:
+            response = new_session().get(server.url + SEASON_PATH)
+
+        assert response.headers["Content-Encoding"] == "gzip"
+        assert response.text == FIXTURE.read_text(encoding="utf-8")
+
+    def test_missing_page(self, archive):
+        with StandInServer(archive) as server:
+            with pytest.raises(requests.HTTPError):
+                get_html(server.url + "/en/comps/9/", scheduler=scheduler())
+
+    def test_429s(self, archive):
+        with StandInServer(archive, rate_429=1.0, retry_after=0) as server:
+            with pytest.raises(TooManyRequests):
+                get_html(server.url + SEASON_PATH, scheduler=scheduler())
+
+        assert server.counts == {429: 4}
+
+    def test_latency(self, archive):
+        with StandInServer(archive, latency=0.2, rate_429=0.5, seed=1) as server:
+            html = get_html(
+                server.url + SEASON_PATH, scheduler=scheduler(), max_retries=10
+            )
+
+        assert html == FIXTURE.read_text(encoding="utf-8")
+        assert server.counts[200] == 1
+
+
+def test_fbref_url_from_env():
+    env = {**os.environ, "FOOTBALLDATA_FBREF_URL": "http://127.0.0.1:8000/"}
+    output = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            "from footballdata import settings as s; print(s.LEAGUE_URL)",
+        ],
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout
+
+    assert output.strip() == "http://127.0.0.1:8000/en/comps/{}/{}/"
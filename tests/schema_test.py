@@ -0,0 +1,80 @@
+import numpy as np
+import pandas as pd
+
+from footballdata.schema import SCHEMAS, RATE, TableSchema, apply_schema
+from footballdata.storage import ParquetBackend
+
+
+def passing_df() -> pd.DataFrame:
+    columns = pd.MultiIndex.from_tuples(
+        [
+            ("Total", "Cmp"),
+            ("Total", "TotDist"),
+            ("Total", "Cmp%"),
+            ("Advanced_Passing", "KP"),
+            ("Advanced_Passing", "KP_Opp"),
+        ]
+    )
+    return pd.DataFrame(
+        [
+            [100, 60000, 80.5, 10, np.nan],
+            [200, 70000, 85.0, 20, 3.0],
+        ],
+        index=["Arsenal", "Chelsea"],
+        columns=columns,
+    )
+
+
+class Test_TableSchema:
+    def test_declared_kinds(self):
+        typed = apply_schema("passing", passing_df())
+
+        assert list(typed.dtypes.astype(str)) == [
+            "int32",
+            "int32",
+            "float32",
+            "int16",
+            "Int16",
+        ]
+        assert typed[("Advanced_Passing", "KP_Opp")].isna().tolist() == [True, False]
+        assert isinstance(typed.index, pd.CategoricalIndex)
+
+    def test_group_overrides_stat(self):
+        columns = pd.MultiIndex.from_tuples(
+            [("Performance", "Gls"), ("Per_90_Minutes", "Gls")]
+        )
+        df = pd.DataFrame([[10, 0.5], [20, 1.0]], columns=columns)
+        typed = apply_schema("standard_data", df)
+
+        assert list(typed.dtypes.astype(str)) == ["int16", "float32"]
+
+    def test_counts_from_text(self):
+        df = pd.DataFrame({"Squad": ["Arsenal", "Chelsea"], "M_G_Indv": [" 5", " 9"]})
+        typed = apply_schema("standings_table", df)
+
+        assert typed["Squad"].dtype == "category"
+        assert typed["M_G_Indv"].tolist() == [5, 9]
+
+    def test_wider_when_needed(self):
+        typed = TableSchema(counts=("Cmp",)).apply(pd.DataFrame({"Cmp": [1, 40000]}))
+
+        assert typed["Cmp"].dtype == "int32"
+
+    def test_not_a_count(self):
+        typed = TableSchema(counts=("Cmp",)).apply(pd.DataFrame({"Cmp": [1.5, 2.0]}))
+
+        assert typed["Cmp"].dtype == "float32"
+
+    def test_default(self):
+        typed = SCHEMAS["h_div_a"].apply(pd.DataFrame({"W": [1, 2]}))
+
+        assert typed["W"].dtype == "float32"
+        assert TableSchema(default=RATE).kind("W", np.dtype("int64")) == RATE
+
+    def test_parquet_round_trip(self, tmp_path):
+        typed = apply_schema("passing", passing_df())
+        backend = ParquetBackend(tmp_path)
+        backend.write("England", 1, "2022-2023", "passing", typed)
+
+        result = backend.read("England", 1, "2022-2023", "passing")
+        pd.testing.assert_frame_equal(result, typed)
@@ -0,0 +1,167 @@
+import asyncio
+
+import pytest
+
+from footballdata import scrap_fbref
+from footballdata.fetch import request_scheduler
+from footballdata.players import PlayerRegistry
+from footballdata.scrap_fbref import (
+    DONE,
+    FAILED,
+    MAX_ATTEMPTS,
+    PENDING,
+    Frontier,
+    TokenBucket,
+    crawl,
+    parse_players,
+    season_urls,
+)
+
+PAGE = """<html><body>
+<table id="stats_standard"><tbody><tr>
+<td data-append-csv="bc7dc64d" data-stat="player">
+<a href="/en/players/bc7dc64d/Bukayo-Saka">Bukayo Saka</a></td>
+<td data-stat="team"><a href="/en/squads/18bb7c10/Arsenal-Stats">Arsenal</a></td>
+</tr></tbody></table>
+<div><!--
+<table id="stats_keeper"><tbody><tr>
+<th data-append-csv="98ea5115" data-stat="player">
+<a href="/en/players/98ea5115/David-Raya">David Raya</a></th>
+</tr></tbody></table>
+--></div>
+</body></html>"""
+
+
+@pytest.fixture
+def registry(tmp_path):
+    registry = PlayerRegistry(tmp_path / "players.sqlite")
+    yield registry
+    registry.close()
+
+
+@pytest.fixture
+def frontier(tmp_path):
+    frontier = Frontier(tmp_path / "frontier.sqlite")
+    yield frontier
+    frontier.close()
+
+
+def run_crawl(frontier, registry) -> dict:
+    return asyncio.run(
+        crawl(frontier, registry=registry, bucket=TokenBucket(rate=1000), cache=None)
+    )
+
+
+class Test_parse_players:
+    def test_cells_and_comments(self):
+        assert parse_players(PAGE) == {
+            "Bukayo-Saka": {
+                "id": "bc7dc64d",
+                "url": "/en/players/bc7dc64d/Bukayo-Saka",
+            },
+            "David-Raya": {"id": "98ea5115", "url": "/en/players/98ea5115/David-Raya"},
+        }
+
+
+class Test_crawl:
+    def test_stores_players(self, frontier, registry, monkeypatch):
+        monkeypatch.setattr(scrap_fbref, "get_html", lambda url, **kwargs: PAGE)
+        frontier.add({"https://fbref.com/a/": 2021, "https://fbref.com/b/": 2022})
+
+        assert run_crawl(frontier, registry) == {DONE: 2}
+        assert sorted(registry) == ["Bukayo-Saka", "David-Raya"]
+
+    def test_shared_scheduler(self, frontier, registry, monkeypatch):
+        schedulers = []
+
+        def get_html(url, scheduler, **kwargs):
+            schedulers.append(scheduler)
+            return PAGE
+
+        monkeypatch.setattr(scrap_fbref, "get_html", get_html)
+        frontier.add({"https://fbref.com/a/": 2021})
+        run_crawl(frontier, registry)
+
+        assert schedulers == [request_scheduler]
+
+    def test_keeps_known_players(self, frontier, registry, monkeypatch):
+        monkeypatch.setattr(scrap_fbref, "get_html", lambda url, **kwargs: PAGE)
+        registry.add("Bukayo-Saka", {"id": "bc7dc64d", "birth_year": 2001})
+        frontier.add({"https://fbref.com/a/": 2021})
+        run_crawl(frontier, registry)
+
+        assert registry.get("Bukayo-Saka")["birth_year"] == 2001
+
+    def test_failures_are_retried(self, frontier, registry, monkeypatch):
+        def get_html(url, **kwargs):
+            raise ConnectionError("no network")
+
+        monkeypatch.setattr(scrap_fbref, "get_html", get_html)
+        frontier.add({"https://fbref.com/a/": 2021})
+
+        assert run_crawl(frontier, registry) == {FAILED: 1}
+
+    def test_resumes(self, tmp_path, registry, monkeypatch):
+        monkeypatch.setattr(scrap_fbref, "get_html", lambda url, **kwargs: PAGE)
+        frontier = Frontier(tmp_path / "frontier.sqlite")
+        frontier.add({"https://fbref.com/a/": 2021, "https://fbref.com/b/": 2022})
+        # A crawl that died after claiming the first url
+        assert frontier.claim() == ("https://fbref.com/a/", 2021)
+        frontier.close()
+
+        frontier = Frontier(tmp_path / "frontier.sqlite")
+        assert frontier.counts() == {PENDING: 2}
+        frontier.add({"https://fbref.com/a/": 2021})
+        assert run_crawl(frontier, registry) == {DONE: 2}
+        frontier.close()
+
+    def test_retried_after_new_urls(self, tmp_path):
+        frontier = Frontier(tmp_path / "frontier.sqlite")
+        frontier.add({"https://fbref.com/a/": 2021, "https://fbref.com/b/": 2022})
+        frontier.claim()
+        frontier.claim()
+        frontier.failed("https://fbref.com/b/", max_attempts=1)
+        frontier.done("https://fbref.com/a/", 10)
+        frontier.add({"https://fbref.com/c/": 2023})
+        frontier.close()
+
+        frontier = Frontier(tmp_path / "frontier.sqlite")
+        assert frontier.counts() == {DONE: 1, PENDING: 2}
+        assert frontier.claim() == ("https://fbref.com/c/", 2023)
+        assert frontier.claim() == ("https://fbref.com/b/", 2022)
+        frontier.close()
+
+    def test_max_attempts(self, tmp_path):
+        frontier = Frontier(tmp_path / "frontier.sqlite", max_attempts=5)
+        frontier.add({"https://fbref.com/a/": 2021})
+        for _ in range(4):
+            assert frontier.claim() == ("https://fbref.com/a/", 2021)
+            frontier.failed("https://fbref.com/a/")
+        assert frontier.counts() == {PENDING: 1}
+
+        frontier.claim()
+        frontier.failed("https://fbref.com/a/")
+        assert frontier.counts() == {FAILED: 1}
+        frontier.close()
+
+    def test_gives_up_after_max_attempts(self, tmp_path):
+        frontier = Frontier(tmp_path / "frontier.sqlite")
+        frontier.add({"https://fbref.com/a/": 2021})
+        for _ in range(MAX_ATTEMPTS):
+            frontier.close()
+            frontier = Frontier(tmp_path / "frontier.sqlite")
+            assert frontier.claim() == ("https://fbref.com/a/", 2021)
+            frontier.failed("https://fbref.com/a/", max_attempts=1)
+        frontier.close()
+
+        frontier = Frontier(tmp_path / "frontier.sqlite")
+        assert frontier.counts() == {FAILED: 1}
+        assert frontier.claim() is None
+        frontier.close()
+
+
+def test_season_urls():
+    urls = season_urls(2021, 2023)
+
+    assert urls["https://fbref.com/en/comps/9/2022-2023/stats/"] == 2022
+    assert set(urls.values()) == {2021, 2022}
@@ -0,0 +1,35 @@
+import pytest
+
+from footballdata.seasons import Season, season, season_range, season_years
+
+
+class Test_season:
+    def test_shared(self):
+        assert season(2010) == Season(2010, "2010-2011")
+        assert season("2010") is season(2010)
+        assert season(2010).end == 2011
+        assert str(season(2010)) == "2010-2011"
+
+    def test_invalid(self):
+        with pytest.raises(KeyError):
+            season(10)
+        with pytest.raises(TypeError):
+            season([2010])
+
+
+class Test_season_range:
+    def test_years(self):
+        assert season_years("2010-2013") == (2010, 2011, 2012)
+        assert season_years("2010-2013") is season_years("2010-2013")
+
+    def test_seasons(self):
+        assert [str(s) for s in season_range("2010-2012")] == [
+            "2010-2011",
+            "2011-2012",
+        ]
+
+    def test_invalid(self):
+        with pytest.raises(TypeError):
+            season_years(None)
+        with pytest.raises(KeyError):
+            season_years("2012-2010")
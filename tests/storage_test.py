@@ -0,0 +1,453 @@
+import json
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+import pytest
+
+from footballdata.library import (
+    frames_registry,
+    h_a_table,
+    parse_season_data,
+    save_season_tables,
+)
+from footballdata.storage import (
+    METADATA_KEY,
+    ExcelBackend,
+    ParquetBackend,
+    SeasonStore,
+    apply_filters,
+    get_backend,
+    legacy_column_name,
+    read_arrow_ipc,
+    read_ipc,
+    to_arrow,
+    write_ipc,
+    write_xlsx,
+)
+from footballdata.teams import TeamIndex, team_registry
+
+FIXTURE = Path(__file__).parent / "fixtures" / "England-1-2022-2023.html"
+# The frames committed with the package, written by df.to_excel
+COMMITTED_FRAMES = Path(__file__).parents[1] / "footballdata" / "frames"
+
+
+def merged_df() -> pd.DataFrame:
+    """A df shaped like the merge_dfs output"""
+    columns = pd.MultiIndex.from_tuples(
+        [
+            ("Total", "Cmp"),
+            ("Total", "Cmp%"),
+            ("Advanced_Passing", "KP"),
+            ("Total", "Cmp_Opp"),
+            ("Advanced_Passing", "KP_Opp"),
+        ]
+    )
+    return pd.DataFrame(
+        [
+            [100, 80.5, 10, 90, 7],
+            [200, 85.0, 20, 95, 3],
+            [150, 70.1, 15, 120, 11],
+        ],
+        index=["Arsenal", "Chelsea", "Everton"],
+        columns=columns,
+    )
+
+
+class Test_ParquetBackend:
+    def test_round_trip(self, tmp_path):
+        backend = ParquetBackend(tmp_path)
+        df = merged_df()
+        backend.write("England", 1, "2022-2023", "passing", df)
+        result = backend.read("England", 1, "2022-2023", "passing")
+
+        assert (tmp_path / "England/1/2022-2023/passing.parquet").exists()
+        pd.testing.assert_frame_equal(result, df)
+
+    def test_round_trip_single_level(self, tmp_path):
+        backend = ParquetBackend(tmp_path)
+        df = pd.DataFrame({"Rk": [1, 2], "Squad": ["Arsenal", "Chelsea"]})
+        backend.write("England", 1, "2022-2023", "standings_table", df)
+        result = backend.read("England", 1, "2022-2023", "standings_table")
+
+        pd.testing.assert_frame_equal(result, df)
+
+    def test_column_projection(self, tmp_path):
+        backend = ParquetBackend(tmp_path)
+        backend.write("England", 1, "2022-2023", "passing", merged_df())
+        result = backend.read(
+            "England", 1, "2022-2023", "passing", columns=[("Advanced_Passing", "KP")]
+        )
+
+        assert list(result.columns) == [("Advanced_Passing", "KP")]
+        assert list(result.index) == ["Arsenal", "Chelsea", "Everton"]
+
+    def test_filters(self, tmp_path):
+        backend = ParquetBackend(tmp_path)
+        backend.write("England", 1, "2022-2023", "passing", merged_df())
+        result = backend.read(
+            "England",
+            1,
+            "2022-2023",
+            "passing",
+            filters=[(("Total", "Cmp"), ">=", 150)],
+        )
+        assert list(result.index) == ["Chelsea", "Everton"]
+
+        result = backend.read(
+            "England", 1, "2022-2023", "passing", filters=[("Squad", "==", "Arsenal")]
+        )
+        assert list(result.index) == ["Arsenal"]
+
+    def test_canonical_keys(self, tmp_path):
+        backend = ParquetBackend(tmp_path)
+        path = backend.write("England", 1, "2022-2023", "passing", merged_df())
+
+        assert pq.read_schema(path).names[:2] == ["total.cmp", "total.cmp_pct"]
+        view = backend.read_view("England", 1, "2022-2023", "passing")
+        assert list(view["advanced_passing.kp_opp"]) == [7, 3, 11]
+
+    def test_legacy_names(self, tmp_path):
+        backend = ParquetBackend(tmp_path)
+        df = merged_df()
+        table = to_arrow(df)
+        metadata = json.loads(table.schema.metadata[METADATA_KEY])
+        del metadata["keys"]
+        legacy = table.rename_columns(
+            [legacy_column_name(col) for col in df.columns] + ["Squad"]
+        ).replace_schema_metadata(
+            {**table.schema.metadata, METADATA_KEY: json.dumps(metadata).encode()}
+        )
+        path = backend.path("England", 1, "2022-2023", "passing")
+        path.parent.mkdir(parents=True)
+        pq.write_table(legacy, path)
+
+        pd.testing.assert_frame_equal(
+            backend.read("England", 1, "2022-2023", "passing"), df
+        )
+        result = backend.read(
+            "England",
+            1,
+            "2022-2023",
+            "passing",
+            columns=[("Total", "Cmp")],
+            filters=[(("Advanced_Passing", "KP"), ">", 10)],
+        )
+        assert list(result[("Total", "Cmp")]) == [200, 150]
+
+    def test_no_overwrite(self, tmp_path):
+        backend = ParquetBackend(tmp_path)
+        df = merged_df()
+        backend.write("England", 1, "2022-2023", "passing", df)
+        backend.write("England", 1, "2022-2023", "passing", df.iloc[:1])
+
+        assert len(backend.read("England", 1, "2022-2023", "passing")) == 3
+
+    def test_missing_table(self, tmp_path):
+        with pytest.raises(FileNotFoundError):
+            ParquetBackend(tmp_path).read("England", 1, "2022-2023", "passing")
+
+
+def standings_df(points: list) -> pd.DataFrame:
+    return pd.DataFrame(
+        {
+            "Rk": range(1, len(points) + 1),
+            "Squad": ["Arsenal", "Chelsea", "Everton"][: len(points)],
+            "Pts": points,
+        }
+    )
+
+
+class Test_SeasonStore:
+    def test_select_concatenates_seasons(self, tmp_path):
+        backend = ParquetBackend(tmp_path)
+        backend.write(
+            "England", 1, "2021-2022", "standings_table", standings_df([90, 80, 70])
+        )
+        backend.write(
+            "England", 1, "2022-2023", "standings_table", standings_df([85, 75, 65])
+        )
+        backend.write(
+            "Spain", 1, "2022-2023", "standings_table", standings_df([88, 77])
+        )
+
+        result = SeasonStore(tmp_path).select(
+            "standings_table",
+            columns=["Squad", "Pts"],
+            where=[("Rk", "<=", 2)],
+            seasons="2021-2023",
+            leagues=[("England", 1)],
+        )
+
+        assert list(result.columns) == ["Squad", "Pts", "Country", "Tier", "Season"]
+        assert list(result["Pts"]) == [90, 80, 85, 75]
+        assert list(result["Season"].cat.categories) == ["2021-2022", "2022-2023"]
+        assert result["Squad"].dtype == "category"
+        assert result["Country"].dtype == "category"
+
+    def test_select_two_level_headers(self, tmp_path):
+        backend = ParquetBackend(tmp_path)
+        backend.write("England", 1, "2021-2022", "passing", merged_df())
+        backend.write("England", 1, "2022-2023", "passing", merged_df())
+
+        result = SeasonStore(tmp_path).select(
+            "passing",
+            columns=[("Advanced_Passing", "KP")],
+            where=[("Season", "==", "2022-2023"), (("Total", "Cmp"), ">", 100)],
+        )
+
+        assert list(result[("Squad", "")]) == ["Chelsea", "Everton"]
+        assert list(result[("Advanced_Passing", "KP")]) == [20, 15]
+
+    def test_select_teams(self, tmp_path):
+        backend = ParquetBackend(tmp_path)
+        seasons = {
+            ("England", 1, "2021-2022"): [1, 2, 3],
+            ("England", 1, "2022-2023"): [1, 2, 4],
+            ("Spain", 1, "2022-2023"): [5, 6],
+        }
+        index = TeamIndex(tmp_path)
+        for (country, tier, season), ids in seasons.items():
+            df = standings_df([90, 80, 70][: len(ids)])
+            df.insert(2, "team_id", np.array(ids, dtype="int32"))
+            backend.write(country, tier, season, "standings_table", df)
+            index.update(country, tier, season, ids)
+        index.close()
+        # Not in the index, never read
+        (tmp_path / "Spain/1/2022-2023/standings_table.parquet").write_bytes(b"")
+
+        result = SeasonStore(tmp_path).select(
+            "standings_table", columns=["Pts"], where=[("Rk", "<=", 2)], teams=[2, 3]
+        )
+
+        assert list(result["Pts"]) == [80, 80]
+        assert list(result["Season"]) == ["2021-2022", "2022-2023"]
+
+    def test_select_team_names(self, tmp_path):
+        backend = ParquetBackend(tmp_path / "frames")
+        html = FIXTURE.read_text(encoding="utf-8")
+        data = parse_season_data(html, ["standings_table"], frames_registry(backend))
+        save_season_tables("England", 1, "2022-2023", data, backend)
+
+        result = SeasonStore(backend.root).select(
+            "standings_table", columns=["Squad"], teams=["Arsenal"]
+        )
+
+        # Looked up in the registry of the store's root, not the default one
+        assert "Arsenal" not in team_registry
+        assert list(result["Squad"]) == ["Arsenal"]
+
+    def test_select_derived(self, tmp_path):
+        html = FIXTURE.read_text(encoding="utf-8")
+        home_away = parse_season_data(html, ["home_away"])["home_away"]
+        backend = ParquetBackend(tmp_path)
+        backend.write("England", 1, "2021-2022", "home_away", home_away)
+        backend.write("England", 1, "2022-2023", "home_away", home_away)
+        store = SeasonStore(tmp_path)
+
+        result = store.select(
+            "h-a",
+            columns=["Pts"],
+            where=[("Season", "==", "2022-2023"), ("Rk", "<=", 3)],
+        )
+
+        expected = h_a_table(home_away).iloc[:3]
+        assert list(result.columns) == [
+            "Rk",
+            "Squads",
+            "Pts",
+            "Country",
+            "Tier",
+            "Season",
+        ]
+        assert list(result["Squads"]) == list(expected.index.get_level_values("Squads"))
+        assert list(result["Pts"]) == list(expected["Pts"])
+        assert list(result["Season"]) == ["2022-2023"] * 3
+        assert len(store.view("h-a").df) == 2 * len(h_a_table(home_away))
+
+    def test_columns_and_view(self, tmp_path):
+        backend = ParquetBackend(tmp_path)
+        backend.write("England", 1, "2021-2022", "passing", merged_df())
+        store = SeasonStore(tmp_path)
+
+        metadata = store.columns("passing")
+        assert metadata.loc["advanced_passing.kp_opp"].tolist() == [
+            "passing",
+            "Advanced_Passing",
+            "KP_Opp",
+        ]
+
+        view = store.view("passing", where=[(("Total", "Cmp"), ">", 100)])
+        assert list(view["squad"]) == ["Chelsea", "Everton"]
+        assert view.group("Total").columns.tolist() == [
+            "total.cmp",
+            "total.cmp_pct",
+            "total.cmp_opp",
+        ]
+
+    def test_select_mixed_types(self, tmp_path):
+        backend = ParquetBackend(tmp_path)
+        backend.write("England", 1, "2021-2022", "standings_table", standings_df([90]))
+        typed = standings_df([85]).astype({"Pts": "int16", "Squad": "category"})
+        backend.write("England", 1, "2022-2023", "standings_table", typed)
+
+        result = SeasonStore(tmp_path).select("standings_table", columns=["Pts"])
+
+        assert list(result["Pts"]) == [90, 85]
+        assert result["Pts"].dtype == "int64"
+
+    def test_no_match(self, tmp_path):
+        ParquetBackend(tmp_path).write(
+            "England", 1, "2022-2023", "standings_table", standings_df([1])
+        )
+        with pytest.raises(FileNotFoundError):
+            SeasonStore(tmp_path).select("standings_table", leagues=["Spain"])
+
+
+class Test_ExcelBackend:
+    def test_round_trip_two_level(self, tmp_path):
+        backend = ExcelBackend(tmp_path)
+        df = merged_df()
+        df.insert(0, ("team_id", ""), [1, 2, 3])
+        backend.write("England", 1, "2022-2023", "passing", df)
+        result = backend.read("England", 1, "2022-2023", "passing")
+
+        pd.testing.assert_frame_equal(result, df)
+        kp = backend.read(
+            "England",
+            1,
+            "2022-2023",
+            "passing",
+            columns=[("Advanced_Passing", "KP")],
+            filters=[(("Total", "Cmp"), ">", 100)],
+        )
+        assert list(kp.index) == ["Chelsea", "Everton"]
+
+    def test_round_trip_single_level(self, tmp_path):
+        backend = ExcelBackend(tmp_path)
+        df = standings_df([90, 80, 70])
+        backend.write("England", 1, "2022-2023", "standings_table", df)
+
+        pd.testing.assert_frame_equal(
+            backend.read("England", 1, "2022-2023", "standings_table"), df
+        )
+
+    def test_committed_frames(self):
+        backend = ExcelBackend(COMMITTED_FRAMES)
+        season = Path(COMMITTED_FRAMES, "England", "1", "2017-2018")
+        tables = {
+            path.stem: backend.read("England", 1, "2017-2018", path.stem)
+            for path in season.glob("*.xlsx")
+        }
+
+        standings = tables["standings_table"]
+        assert list(standings.columns[:2]) == ["Rk", "Squad"]
+        assert len(standings) == 20
+        assert ("Total", "Cmp") in tables["passing"].columns
+        assert tables["passing"].index[0] == "Arsenal"
+        assert list(tables["home"].columns[:2]) == ["Rk", "Squads"]
+
+    def test_packed_season(self, tmp_path):
+        backend = ExcelBackend(tmp_path)
+        season = tmp_path / "England" / "1" / "2022-2023"
+        season.mkdir(parents=True)
+        passing, standings = merged_df(), standings_df([90, 80, 70])
+        write_xlsx(
+            season / "season.xlsx",
+            {"passing": passing, "standings_table": standings},
+        )
+
+        assert backend.stored_tables("England", 1, "2022-2023") == {
+            "passing",
+            "standings_table",
+        }
+        assert backend.exists("England", 1, "2022-2023", "passing")
+        pd.testing.assert_frame_equal(
+            backend.read("England", 1, "2022-2023", "passing"), passing
+        )
+
+        updated = standings_df([91, 80, 70])
+        backend.write(
+            "England", 1, "2022-2023", "standings_table", updated, overwrite=True
+        )
+
+        assert [path.name for path in season.iterdir()] == ["season.xlsx"]
+        pd.testing.assert_frame_equal(
+            backend.read("England", 1, "2022-2023", "standings_table"), updated
+        )
+        pd.testing.assert_frame_equal(
+            backend.read("England", 1, "2022-2023", "passing"), passing
+        )
+
+
+class Test_write_xlsx:
+    def test_same_as_to_excel(self, tmp_path):
+        df = merged_df()
+        df.iloc[1, 2] = np.nan
+        df.to_excel(tmp_path / "pandas.xlsx", header=df.columns, index=True)
+        write_xlsx(tmp_path / "streamed.xlsx", {"Sheet1": df})
+
+        for kwargs in ({}, {"header": [0, 1], "index_col": 0}):
+            pd.testing.assert_frame_equal(
+                pd.read_excel(tmp_path / "streamed.xlsx", **kwargs),
+                pd.read_excel(tmp_path / "pandas.xlsx", **kwargs),
+            )
+
+    def test_one_sheet_per_table(self, tmp_path):
+        standings = pd.DataFrame({"Rk": [1, 2], "Squad": ["Arsenal", "=Chelsea"]})
+        write_xlsx(
+            tmp_path / "season.xlsx", {"passing": merged_df(), "standings": standings}
+        )
+        sheets = pd.read_excel(tmp_path / "season.xlsx", sheet_name=None)
+
+        assert list(sheets) == ["passing", "standings"]
+        pd.testing.assert_frame_equal(sheets["standings"], standings)
+        assert not list(tmp_path.glob(".*.tmp"))
+
+    def test_atomic(self, tmp_path):
+        path = tmp_path / "season.xlsx"
+        write_xlsx(path, {"standings": pd.DataFrame({"Rk": [1]})})
+        with pytest.raises(Exception):
+            write_xlsx(path, {"bad/name": pd.DataFrame({"Rk": [2]})})
+
+        assert pd.read_excel(path)["Rk"].tolist() == [1]
+        assert not list(tmp_path.glob(".*.tmp"))
+
+
+class Test_write_ipc:
+    def test_round_trip(self, tmp_path):
+        df = merged_df()
+        path = write_ipc(tmp_path / "passing.arrow", df)
+
+        pd.testing.assert_frame_equal(read_ipc(path), df)
+        assert not list(tmp_path.glob(".*.tmp"))
+
+    def test_memory_mapped(self, tmp_path):
+        path = write_ipc(tmp_path / "passing.arrow", merged_df())
+        allocated = pa.total_allocated_bytes()
+        table = read_arrow_ipc(path)
+
+        # The columns are read in place from the mapped file
+        assert pa.total_allocated_bytes() == allocated
+        assert table.num_rows == 3
+
+
+class Test_apply_filters:
+    def test_or_of_ands(self):
+        df = pd.DataFrame({"Rk": [1, 2, 3, 4], "Pts": [90, 80, 70, 60]})
+        result = apply_filters(df, [[("Rk", "==", 1)], [("Pts", "<", 70)]])
+
+        assert list(result["Rk"]) == [1, 4]
+
+    def test_unknown_column(self):
+        df = pd.DataFrame({"Rk": [1, 2]})
+        with pytest.raises(KeyError):
+            apply_filters(df, [("Pts", ">", 1)])
+
+
+def test_get_backend(tmp_path):
+    assert isinstance(get_backend("xlsx", tmp_path), ExcelBackend)
+    with pytest.raises(KeyError):
+        get_backend("csv", tmp_path)
@@ -0,0 +1,119 @@
+import pickle
+from pathlib import Path
+
+import pytest
+
+from footballdata.teams import (
+    Partition,
+    Team,
+    TeamIndex,
+    TeamRegistry,
+    parse_squads,
+    registry_at,
+)
+
+FIXTURE = Path(__file__).parent / "fixtures" / "England-1-2022-2023.html"
+
+
+@pytest.fixture
+def registry(tmp_path):
+    registry = TeamRegistry(tmp_path / "teams.sqlite")
+    yield registry
+    registry.close()
+
+
+class Test_parse_squads:
+    def test_page_squads(self):
+        squads = parse_squads(FIXTURE.read_text())
+
+        assert len(squads) == 20
+        assert squads["Arsenal"] == "18bb7c10"
+        assert squads["Nott'ham Forest"] == "e4a775cb"
+
+
+class Test_TeamRegistry:
+    def test_register(self, registry):
+        ids = registry.register({"Arsenal": "18bb7c10", "Chelsea": "cff3d9bb"})
+
+        assert ids == {"Arsenal": 1, "Chelsea": 2}
+        assert registry["Chelsea"] == Team(2, "Chelsea", "cff3d9bb")
+        assert registry.by_fbref_id("18bb7c10").team_id == 1
+        assert registry.get(3) is None
+        with pytest.raises(KeyError):
+            registry["Fulham"]
+
+    def test_stable_ids(self, registry, tmp_path):
+        registry.register({"Arsenal": "18bb7c10", "Chelsea": "cff3d9bb"})
+        registry.close()
+        reopened = TeamRegistry(tmp_path / "teams.sqlite")
+
+        assert reopened.register({"Fulham": "fd962109", "Chelsea": "cff3d9bb"}) == {
+            "Fulham": 3,
+            "Chelsea": 2,
+        }
+        assert len(reopened) == 3
+        reopened.close()
+
+    def test_registry_at(self, tmp_path):
+        registry = registry_at(tmp_path / "frames")
+        registry.add("Arsenal", "18bb7c10")
+
+        assert registry_at(str(tmp_path / "frames")) is registry
+        assert registry.path == tmp_path / "frames" / "teams.sqlite"
+        # Pickled for the parse processes by path
+        assert pickle.loads(pickle.dumps(registry)).id("Arsenal") == 1
+        registry.close()
+
+    def test_aliases(self, registry):
+        registry.register({"Manchester United": "19538871"})
+        registry.register({"Manchester Utd": "19538871"})
+        registry.add_alias("Man Utd", 1)
+
+        assert registry.aliases(1) == ["Man Utd", "Manchester United", "Manchester Utd"]
+        assert registry.id("Manchester Utd") == registry.id("Man Utd") == 1
+        assert len(registry) == 1
+
+    def test_name_only_takes_the_fbref_id(self, registry):
+        assert registry.add("Arsenal") == 1
+        assert registry.add("Arsenal", "18bb7c10") == 1
+        assert registry.get(1).fbref_id == "18bb7c10"
+        # Same name, another squad e.g. the women's
+        assert registry.add("Arsenal", "411b1108") == 2
+        assert registry.id("Arsenal") == 1
+
+    def test_ids(self, registry):
+        registry.register({"Arsenal": "18bb7c10", "Chelsea": "cff3d9bb"})
+        ids = registry.ids(["Chelsea", "Arsenal", "Chelsea", "Fulham"])
+
+        assert ids.dtype == "int32"
+        assert ids.tolist() == [2, 1, 2, 3]
+        assert registry.ids(["Arsenal"], squads={"Arsenal": 7}).tolist() == [7]
+
+
+class Test_TeamIndex:
+    def test_partitions(self, registry, tmp_path):
+        ids = registry.register({"Arsenal": "18bb7c10", "Burnley": "943e8050"})
+        index = TeamIndex(tmp_path / "frames", registry)
+        index.update("England", 1, "2022-2023", [ids["Arsenal"]])
+        index.update("England", 2, "2022-2023", [ids["Burnley"]])
+        index.update("England", 1, "2023-2024", list(ids.values()))
+
+        assert index.partitions("Burnley") == [
+            Partition("England", 2, "2022-2023"),
+            Partition("England", 1, "2023-2024"),
+        ]
+        assert index.teams("England", 1, "2023-2024") == [1, 2]
+        assert list(index.history(ids["Burnley"])["Tier"]) == [2, 1]
+        assert len(index.partitions(["Arsenal", "Burnley"])) == 3
+        with pytest.raises(KeyError):
+            index.partitions("Fulham")
+        index.close()
+
+    def test_update_replaces(self, registry, tmp_path):
+        index = TeamIndex(tmp_path, registry)
+        index.update("England", 1, "2022-2023", [1, 2])
+        index.update("England", 1, "2022-2023", [2, 3])
+
+        assert index.teams("England", 1, "2022-2023") == [2, 3]
+        assert index.partitions(1) == []
+        index.close()